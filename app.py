@@ -1,8 +1,21 @@
-from flask import Flask, render_template, jsonify, request
+import os
+import threading
+import time
+from functools import wraps
+
+from flask import Flask, render_template, jsonify, request, url_for
 from config import Config
-import pandas as pd
+from services.compressao import comprimir, comprimir_fluxo, compressivel, negociar
+from services.columnar_store import pa
+from services.exportacao import (FORMATOS, FORMATOS_COLUNARES, CursorExportacao, CursorInvalido,
+                                  fluxo, fluxo_colunar)
+from services.json_provider import FastJSONProvider
+from services.response_cache import ResponseCache
+from services.singleflight import SingleFlight
 
 app = Flask(__name__)
+# Codificação única das respostas (gráficos são dicionários até aqui)
+app.json = FastJSONProvider(app)
 app.config.from_object(Config)
 
 # Imports lazy - carrega apenas quando necessário
@@ -10,6 +23,114 @@ api_service = None
 data_processor = None
 chart_gen = None
 
+# Requisições idênticas simultâneas aos endpoints de agregação compartilham um cálculo
+request_flight = SingleFlight()
+
+def coalescer(view):
+    """Coalesce requisições simultâneas com o mesmo caminho e parâmetros"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = (request.path, tuple(sorted(request.args.items(multi=True))))
+        
+        def calcular():
+            response = app.make_response(view(*args, **kwargs))
+            return response.get_data(), response.status_code, response.headers.get('Content-Type')
+        
+        # Cada requisição recebe sua própria Response com o corpo compartilhado
+        data, status, content_type = request_flight.do(key, calcular)
+        return app.response_class(data, status=status, content_type=content_type)
+    return wrapper
+
+# Respostas /api/* serializadas, por parâmetros normalizados; invalidadas por ano
+response_cache = ResponseCache(max_bytes=app.config['RESPONSE_CACHE_MAX_MB'] * 1024 * 1024)
+
+def cache_resposta(view):
+    """
+    Serve respostas 200 do cache com ETag forte, Last-Modified e Cache-Control;
+    revalidações (If-None-Match / If-Modified-Since) recebem 304 sem corpo.
+    Acima de COMPRESS_MIN_BYTES o corpo sai em gzip/br conforme Accept-Encoding,
+    comprimido uma vez e guardado na entrada do cache.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        api_service, _, _ = get_services()
+        # Stat dos datasets: se algum mudou, os anos afetados já saem do cache aqui
+        versao, modificado = api_service.dataset_version()
+        key = (request.path, tuple(sorted(request.args.items(multi=True))))
+        
+        entrada = response_cache.get(key)
+        if entrada is None:
+            response = app.make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+            body = response.get_data()
+            content_type = response.headers.get('Content-Type')
+            if api_service.registry.version != versao:
+                # Datasets mudaram durante o cálculo: responde sem guardar
+                return response
+            entrada = response_cache.put(key, body, response.status_code, content_type, modificado)
+        
+        codificacao = None
+        if (len(entrada.body) >= app.config['COMPRESS_MIN_BYTES']
+                and compressivel(entrada.content_type.split(';')[0])):
+            codificacao = negociar(request.accept_encodings)
+        
+        if codificacao is None:
+            response = app.response_class(entrada.body, status=entrada.status,
+                                          content_type=entrada.content_type)
+            response.set_etag(entrada.etag)
+        else:
+            corpo = response_cache.variant(key, entrada, codificacao,
+                                           lambda body: comprimir(body, codificacao))
+            response = app.response_class(corpo, status=entrada.status,
+                                          content_type=entrada.content_type)
+            response.headers['Content-Encoding'] = codificacao
+            # ETag forte é por representação: cada codificação tem o seu
+            response.set_etag(f'{entrada.etag}-{codificacao}')
+        response.vary.add('Accept-Encoding')
+        if entrada.last_modified is not None:
+            response.last_modified = entrada.last_modified
+        response.cache_control.public = True
+        response.cache_control.max_age = app.config['API_CACHE_MAX_AGE']
+        return response.make_conditional(request)
+    return wrapper
+
+@app.after_request
+def comprimir_resposta(response):
+    """Comprime respostas JSON grandes que não passam pelo cache de respostas"""
+    if (response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or response.status_code in (204, 206, 304)
+            or not compressivel(response.mimetype)):
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    codificacao = negociar(request.accept_encodings)
+    if codificacao is None or response.calculate_content_length() < app.config['COMPRESS_MIN_BYTES']:
+        return response
+    response.set_data(comprimir(response.get_data(), codificacao))
+    response.headers['Content-Encoding'] = codificacao
+    return response
+
+def anos_da_consulta(args) -> set:
+    """Anos cobertos pelos parâmetros de uma consulta (None = desconhecido/todos)"""
+    args = dict(args)
+    if 'year' in args:
+        return None if args['year'] == 'todos' else {args['year']}
+    if 'ano_inicio' in args and 'ano_fim' in args:
+        try:
+            return {str(ano) for ano in range(int(args['ano_inicio']), int(args['ano_fim']) + 1)}
+        except ValueError:
+            return None
+    return None
+
+def invalidar_respostas(anos: set):
+    """Remove do cache de respostas apenas as consultas que cobrem os anos alterados"""
+    def afetada(key):
+        cobertos = anos_da_consulta(key[1])
+        return cobertos is None or bool(cobertos & anos)
+    response_cache.invalidate(afetada)
+
 def get_services():
     global api_service, data_processor, chart_gen
     if api_service is None:
@@ -17,10 +138,68 @@ def get_services():
         from services.data_processor import DataProcessor
         from services.visualization import ChartGenerator
         api_service = ComexStatAPI()
+        api_service.registry.add_listener(invalidar_respostas)
+        api_service.load_cube()
         data_processor = DataProcessor()
         chart_gen = ChartGenerator()
     return api_service, data_processor, chart_gen
 
+# Aquecimento: estado exposto em /api/ready para o orquestrador
+aquecimento = {'status': 'pending' if app.config['WARMUP_ON_START'] else 'disabled',
+               'etapas': {}, 'anos': [], 'erro': None}
+_aquecimento_lock = threading.Lock()
+
+def _cronometrar(etapas: dict, nome: str, fn):
+    inicio = time.perf_counter()
+    resultado = fn()
+    etapas[nome] = round(time.perf_counter() - inicio, 3)
+    return resultado
+
+def carregar_dados(etapas: dict) -> list:
+    """
+    Serviços, tabelas de códigos e os WARMUP_YEARS anos mais recentes em memória.
+    Usado pelo aquecimento e, no gunicorn com preload_app, no master antes do fork.
+    """
+    api, _, _ = _cronometrar(etapas, 'servicos', get_services)
+    from services.codigos_comexstat import preparar_tabelas
+    _cronometrar(etapas, 'tabelas', preparar_tabelas)
+    
+    anos = sorted((csv.stem.split('_', 1)[1] for csv in api.datasets_dir.glob('EXP_*.csv')),
+                  reverse=True)[:app.config['WARMUP_YEARS']]
+    return _cronometrar(etapas, 'anos', lambda: api.preload_years(anos))
+
+def aquecer():
+    """
+    Carrega os dados (ver carregar_dados) e o payload padrão do dashboard
+    (2024/dezembro), que fica no cache de respostas
+    """
+    aquecimento['status'] = 'running'
+    try:
+        aquecimento['anos'] = carregar_dados(aquecimento['etapas'])
+        with app.test_client() as client:
+            response = _cronometrar(aquecimento['etapas'], 'dashboard',
+                                    lambda: client.get('/api/dashboard-data?year=2024&month=12'))
+        if response.status_code != 200:
+            raise RuntimeError(f"dashboard-data retornou {response.status_code}")
+        aquecimento['status'] = 'ready'
+        print(f"Aquecimento concluído: {aquecimento['etapas']}")
+    except Exception as e:
+        aquecimento['status'] = 'failed'
+        aquecimento['erro'] = str(e)
+        print(f"Erro no aquecimento: {e}")
+
+def iniciar_aquecimento():
+    """Dispara o aquecimento em segundo plano (uma vez por processo, se habilitado)"""
+    with _aquecimento_lock:
+        if aquecimento['status'] != 'pending':
+            return
+        aquecimento['status'] = 'starting'
+    threading.Thread(target=aquecer, name='aquecimento', daemon=True).start()
+
+def gerador_da_requisicao(chart_gen):
+    """Com ?bdata=1, gráficos com arrays numéricos binários ({dtype, bdata})"""
+    return chart_gen.with_typed_arrays() if request.args.get('bdata') == '1' else chart_gen
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -34,6 +213,8 @@ def series_temporais():
     return render_template('series_temporais.html')
 
 @app.route('/api/dashboard-data')
+@cache_resposta
+@coalescer
 def get_dashboard_data():
     """Retorna dados agregados para o dashboard principal"""
     try:
@@ -46,26 +227,39 @@ def get_dashboard_data():
         years = ['2020', '2021', '2022', '2023', '2024'] if year == 'todos' else [year]
         months = [f'{m:02d}' for m in range(1, 13)] if month == 'todos' else [month]
         
-        # Carrega e agrega dados
-        if year == 'todos' or month == 'todos':
-            all_data = []
-            for y in years:
-                for m in months:
-                    df = api_service.fetch_export_data(y, m)
-                    if not df.empty:
-                        all_data.append(df)
-            raw_data = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
+        # Dimensões do dashboard (NCM agrupado junto com a descrição)
+        dims = {'ncm': ['ncm', 'descricao_ncm'], 'pais': 'pais', 'uf': 'uf', 'via': 'via'}
+        top_n = {'ncm': 10, 'pais': 10}
+        
+        # Responde a partir do cubo pré-agregado; sem ele, agrega as linhas brutas
+        rollups = api_service.fetch_rollups(years, months, list(dims))
+        if rollups is not None:
+            if rollups['ncm'].empty:
+                return jsonify({'error': 'Nenhum dado encontrado'}), 404
+            # Cada roll-up já está no grão da sua dimensão
+            agregados = {'distintos': {}}
+            for nome, dim in dims.items():
+                parcial = data_processor.aggregate_many(rollups[nome], [dim], top_n=top_n)
+                agregados[nome] = parcial[nome]
+                agregados['totais'] = parcial['totais']
+                agregados['distintos'].update(parcial['distintos'])
         else:
-            # Busca dados de um único ano/mês
-            raw_data = api_service.fetch_export_data(year, month)
-        
-        if raw_data.empty:
-            return jsonify({'error': 'Nenhum dado encontrado'}), 404
+            if year == 'todos' or month == 'todos':
+                # Anos/meses carregados em paralelo, concatenados na ordem
+                raw_data = api_service.load_periods(years, months)
+            else:
+                # Busca dados de um único ano/mês
+                raw_data = api_service.fetch_export_data(year, month)
+            
+            if raw_data.empty:
+                return jsonify({'error': 'Nenhum dado encontrado'}), 404
+            
+            # Todas as dimensões, totais e contagens em uma única passada
+            agregados = data_processor.aggregate_many(raw_data, list(dims.values()), top_n=top_n)
         
-        # Processa dados
-        processed = data_processor.aggregate_by_ncm(raw_data)
-        by_country = data_processor.aggregate_by_country(raw_data)
-        by_state = data_processor.aggregate_by_state(raw_data)
+        processed = agregados['ncm']
+        by_country = agregados['pais']
+        by_state = agregados['uf']
         
         # Gera visualizações
         charts = {
@@ -88,13 +282,13 @@ def get_dashboard_data():
         }
         
         # Calcula KPIs
-        total_fob = raw_data['valor_fob'].sum()
-        total_weight = raw_data['peso_kg'].sum() if 'peso_kg' in raw_data.columns else 0
-        num_countries = raw_data['pais'].nunique() if 'pais' in raw_data.columns else 0
-        num_products = raw_data['ncm'].nunique() if 'ncm' in raw_data.columns else 0
+        total_fob = agregados['totais']['valor_fob']
+        total_weight = agregados['totais'].get('peso_kg', 0)
+        num_countries = agregados['distintos'].get('pais', 0)
+        num_products = agregados['distintos'].get('ncm', 0)
         
         # Dados de transporte para cards
-        transport_agg = data_processor.aggregate_by_transport(raw_data)
+        transport_agg = agregados['via']
         transport_data = []
         if not transport_agg.empty:
             total_transport = transport_agg['valor_fob'].sum()
@@ -123,6 +317,7 @@ def get_dashboard_data():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/export-data')
+@cache_resposta
 def get_export_data():
     """Endpoint para buscar dados brutos com filtros"""
     try:
@@ -150,6 +345,132 @@ def get_export_data():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+cursores_exportacao = CursorExportacao(app.config['SECRET_KEY'])
+
+def periodos_da_requisicao(api_service) -> tuple:
+    """Anos e meses de year/month (valor único, lista separada por vírgulas ou 'todos')"""
+    year = request.args.get('year', '2024')
+    month = request.args.get('month', 'todos')
+    if year == 'todos':
+        # Anos com CSV ou só com partições Parquet
+        years = sorted({csv.stem.split('_', 1)[1] for csv in api_service.datasets_dir.glob('EXP_*.csv')}
+                       | set(api_service.store.years()))
+    else:
+        years = [str(int(ano)) for ano in year.split(',')]
+    months = ([f'{m:02d}' for m in range(1, 13)] if month == 'todos'
+              else [f'{int(mes):02d}' for mes in month.split(',')])
+    return years, months
+
+def filtros_da_requisicao() -> dict:
+    """Filtros de linhas na query string, no vocabulário de DataProcessor.apply_filters"""
+    filtros = {col: request.args.getlist(col) for col in ('ncm', 'pais', 'uf', 'via')
+               if request.args.getlist(col)}
+    for limite in ('min_fob', 'max_fob'):
+        if limite in request.args:
+            filtros[limite] = float(request.args[limite])
+    return filtros
+
+@app.route('/api/export-stream')
+def get_export_stream():
+    """
+    Linhas brutas em fluxo (NDJSON ou CSV), filtradas já na leitura.
+    Sem limit, exporta tudo numa resposta; com limit, a página cheia traz o
+    cursor da seguinte em X-Next-Cursor e Link rel="next".
+    """
+    api_service, _, _ = get_services()
+    formato = request.args.get('format', 'ndjson')
+    if formato not in FORMATOS:
+        return jsonify({'error': f"Formato inválido: use {', '.join(FORMATOS)}"}), 400
+    try:
+        limite = int(request.args['limit']) if 'limit' in request.args else None
+        if limite is not None and not 0 < limite <= app.config['EXPORT_PAGE_MAX_ROWS']:
+            return jsonify({'error': f"limit deve estar entre 1 e {app.config['EXPORT_PAGE_MAX_ROWS']}"}), 400
+        if 'cursor' in request.args:
+            cursor = cursores_exportacao.ler(request.args['cursor'])
+            consulta, inicio = cursor['consulta'], cursor['inicio']
+            ano = inicio[0] // len(consulta['meses'])
+            if ano < len(consulta['anos']) and api_service.source_token(consulta['anos'][ano]) != cursor['versao']:
+                return jsonify({'error': 'Cursor expirado: os dados do período mudaram'}), 410
+        else:
+            years, months = periodos_da_requisicao(api_service)
+            consulta, inicio = {'anos': years, 'meses': months, 'filtros': filtros_da_requisicao()}, (0, 0)
+        criterios = api_service.export_criteria(consulta['filtros'])
+    except CursorInvalido:
+        return jsonify({'error': 'Cursor inválido'}), 400
+    except ValueError as e:
+        return jsonify({'error': f'Parâmetro inválido: {e}'}), 400
+    
+    blocos = api_service.iter_export(consulta['anos'], consulta['meses'], criterios, inicio)
+    proximo = None
+    if limite is None:
+        linhas = (bloco for _, _, _, bloco in blocos)
+    else:
+        # Página limitada a EXPORT_PAGE_MAX_ROWS: montada antes para o cursor ir no cabeçalho
+        linhas, total = [], 0
+        for periodo, posicoes, fim, bloco in blocos:
+            falta = limite - total
+            if len(bloco) >= falta:
+                linhas.append(bloco.iloc[:falta])
+                posicao = posicoes[falta] if len(bloco) > falta else fim
+                ano = consulta['anos'][periodo // len(consulta['meses'])]
+                proximo = cursores_exportacao.gerar(consulta, periodo, posicao, api_service.source_token(ano))
+                break
+            linhas.append(bloco)
+            total += len(bloco)
+        blocos.close()
+    
+    corpo = fluxo(linhas, formato)
+    codificacao = negociar(request.accept_encodings)
+    if codificacao is not None:
+        corpo = comprimir_fluxo(corpo, codificacao)
+    response = app.response_class(corpo, mimetype=FORMATOS[formato])
+    if codificacao is not None:
+        response.headers['Content-Encoding'] = codificacao
+    response.vary.add('Accept-Encoding')
+    response.headers['Content-Disposition'] = f'attachment; filename=exportacoes.{formato}'
+    if proximo is not None:
+        response.headers['X-Next-Cursor'] = proximo
+        link = url_for('get_export_stream', cursor=proximo, format=formato, limit=limite)
+        response.headers['Link'] = f'<{link}>; rel="next"'
+    return response
+
+@app.route('/api/export-bulk')
+def get_export_bulk():
+    """
+    Download em lote para análise (Arrow IPC stream ou Parquet), com os
+    mesmos períodos e filtros de /api/export-stream. As partições Parquet
+    são filtradas e repassadas em Arrow, sem conversão para pandas ou texto.
+    """
+    if pa is None:
+        return jsonify({'error': 'Download colunar indisponível: instale o pyarrow'}), 501
+    api_service, _, _ = get_services()
+    formato = request.args.get('format', 'arrow')
+    if formato not in FORMATOS_COLUNARES:
+        return jsonify({'error': f"Formato inválido: use {', '.join(FORMATOS_COLUNARES)}"}), 400
+    mimetype, extensao, compressoes = FORMATOS_COLUNARES[formato]
+    compressao = request.args.get('compression', 'zstd' if formato == 'parquet' else 'none')
+    if compressao not in compressoes:
+        return jsonify({'error': f"Compressão inválida para {formato}: use {', '.join(compressoes)}"}), 400
+    try:
+        years, months = periodos_da_requisicao(api_service)
+        criterios = api_service.export_criteria(filtros_da_requisicao())
+        expressao = api_service.arrow_filter(criterios)
+    except ValueError as e:
+        return jsonify({'error': f'Parâmetro inválido: {e}'}), 400
+    
+    lotes = api_service.iter_export_arrow(years, months, criterios, expressao)
+    corpo = fluxo_colunar(lotes, formato, compressao)
+    # Sem compressão no formato, vale a negociada com o cliente
+    codificacao = negociar(request.accept_encodings) if compressao == 'none' else None
+    if codificacao is not None:
+        corpo = comprimir_fluxo(corpo, codificacao)
+    response = app.response_class(corpo, mimetype=mimetype)
+    if codificacao is not None:
+        response.headers['Content-Encoding'] = codificacao
+    response.vary.add('Accept-Encoding')
+    response.headers['Content-Disposition'] = f'attachment; filename=exportacoes.{extensao}'
+    return response
+
 @app.route('/api/filters')
 def get_available_filters():
     """Retorna filtros disponíveis"""
@@ -172,6 +493,7 @@ def get_available_filters():
     })
 
 @app.route('/api/paises')
+@cache_resposta
 def get_paises():
     """Retorna lista de países disponíveis"""
     try:
@@ -179,7 +501,7 @@ def get_paises():
         year = request.args.get('year', '2024')
         month = request.args.get('month', '12')
         
-        raw_data = api_service.fetch_export_data(year, month)
+        raw_data = api_service.fetch_export_data(year, month, columns=['pais'])
         
         if 'pais' in raw_data.columns:
             paises = sorted(raw_data['pais'].unique().tolist())
@@ -190,6 +512,7 @@ def get_paises():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/produtos-pais')
+@cache_resposta
 def get_produtos_pais():
     """Retorna lista de produtos disponíveis para um país"""
     try:
@@ -201,7 +524,7 @@ def get_produtos_pais():
         if not pais:
             return jsonify({'produtos': []})
         
-        raw_data = api_service.fetch_export_data(year, month)
+        raw_data = api_service.fetch_export_data(year, month, columns=['pais', 'descricao_ncm'])
         dados_pais = raw_data[raw_data['pais'] == pais]
         
         if dados_pais.empty:
@@ -216,10 +539,13 @@ def get_produtos_pais():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/analise-pais-data')
+@cache_resposta
+@coalescer
 def get_analise_pais_data():
     """Retorna análise detalhada por país"""
     try:
         api_service, data_processor, chart_gen = get_services()
+        chart_gen = gerador_da_requisicao(chart_gen)
         
         year = request.args.get('year', '2024')
         month = request.args.get('month', '12')
@@ -229,15 +555,14 @@ def get_analise_pais_data():
         if not pais:
             return jsonify({'error': 'País não especificado'}), 400
         
-        # Busca dados - suporta ano inteiro
-        if month == 'todos':
-            all_data = []
-            for m in range(1, 13):
-                month_str = f'{m:02d}'
-                df = api_service.fetch_export_data(year, month_str)
-                if not df.empty:
-                    all_data.append(df)
-            raw_data = pd.concat(all_data, ignore_index=True) if all_data else pd.DataFrame()
+        # Busca dados - suporta ano inteiro. O roll-up país x NCM x via do cubo
+        # responde a todos os agrupamentos abaixo; linhas brutas só sem cubo
+        months = [f'{m:02d}' for m in range(1, 13)] if month == 'todos' else [month]
+        rollups = api_service.fetch_rollups([year], months, ['pais_ncm_via'])
+        if rollups is not None:
+            raw_data = rollups['pais_ncm_via']
+        elif month == 'todos':
+            raw_data = api_service.load_periods([year], months)
         else:
             raw_data = api_service.fetch_export_data(year, month)
         
@@ -259,7 +584,7 @@ def get_analise_pais_data():
                 return jsonify({'error': f'Nenhum produto encontrado com "{filtro_produto}" para {pais}'}), 404
         
         # Agrega por produto
-        produtos = dados_pais.groupby(['ncm', 'descricao_ncm'] if 'descricao_ncm' in dados_pais.columns else ['ncm']).agg({
+        produtos = dados_pais.groupby(['ncm', 'descricao_ncm'] if 'descricao_ncm' in dados_pais.columns else ['ncm'], observed=True).agg({
             'valor_fob': 'sum',
             'peso_kg': 'sum'
         }).reset_index()
@@ -270,8 +595,10 @@ def get_analise_pais_data():
         produtos['preco_medio_kg'] = produtos['valor_fob'] / produtos['peso_kg']
         produtos['participacao'] = (produtos['valor_fob'] / produtos['valor_fob'].sum() * 100)
         
-        # Top 20 produtos para não poluir o gráfico
-        top_produtos = produtos.head(20)
+        # Produtos no gráfico de bolhas (?top_bolhas=N, 0 = todos): um único traço
+        # comporta centenas de bolhas; a legenda lista só os 20 maiores
+        top_bolhas = int(request.args.get('top_bolhas', app.config['BUBBLE_TOP_N']))
+        top_produtos = produtos.head(top_bolhas) if top_bolhas > 0 else produtos
         
         # Título dos gráficos
         titulo_base = f'{pais}'
@@ -299,7 +626,7 @@ def get_analise_pais_data():
         # NOVO: Timeline mensal (se ano inteiro)
         timeline_chart = None
         if month == 'todos' and 'mes' in dados_pais.columns:
-            timeline_data = dados_pais.groupby('mes').agg({
+            timeline_data = dados_pais.groupby('mes', observed=True).agg({
                 'valor_fob': 'sum',
                 'peso_kg': 'sum'
             }).reset_index()
@@ -317,7 +644,7 @@ def get_analise_pais_data():
         # NOVO: Pizza de modais de transporte
         transport_chart = None
         if 'via' in dados_pais.columns:
-            transport_data = dados_pais.groupby('via').agg({
+            transport_data = dados_pais.groupby('via', observed=True).agg({
                 'valor_fob': 'sum'
             }).reset_index()
             transport_data = transport_data.sort_values('valor_fob', ascending=False)
@@ -356,32 +683,34 @@ def get_analise_pais_data():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/series-temporais')
+@cache_resposta
+@coalescer
 def get_series_temporais():
     """Retorna dados de séries temporais para análise temporal"""
     try:
         api_service, data_processor, chart_gen = get_services()
+        chart_gen = gerador_da_requisicao(chart_gen)
         
         ano_inicio = int(request.args.get('ano_inicio', '2020'))
         ano_fim = int(request.args.get('ano_fim', '2024'))
         agregacao = request.args.get('agregacao', 'mensal')
         ncm_selecionado = request.args.get('ncm', None)  # Filtro opcional por NCM específico
+        # Pontos por linha (LTTB); max_points=0 devolve a resolução completa
+        max_points = int(request.args.get('max_points', app.config['SERIES_MAX_POINTS']))
+        
+        # Período x país x NCM basta para as séries: roll-up do cubo (uma passada por
+        # ano, também no STREAMING_MODE); linhas brutas de todos os meses só sem cubo
+        years = [str(year) for year in range(ano_inicio, ano_fim + 1)]
+        months = [f'{month:02d}' for month in range(1, 13)]
+        rollups = api_service.fetch_rollups(years, months, ['pais_ncm_via'])
+        if rollups is not None:
+            combined_df = rollups['pais_ncm_via']
+        else:
+            combined_df = api_service.load_periods(years, months)
         
-        # Busca dados para todos os anos/meses
-        import pandas as pd
-        all_data = []
-        
-        for year in range(ano_inicio, ano_fim + 1):
-            for month in range(1, 13):
-                df = api_service.fetch_export_data(str(year), str(month).zfill(2))
-                if not df.empty:
-                    all_data.append(df)
-        
-        if not all_data:
+        if combined_df.empty:
             return jsonify({'error': 'Nenhum dado encontrado para o período'}), 404
         
-        # Combina todos os dados
-        combined_df = pd.concat(all_data, ignore_index=True)
-        
         # Filtra por NCM se especificado
         if ncm_selecionado:
             combined_df = combined_df[combined_df['ncm'] == ncm_selecionado]
@@ -395,17 +724,20 @@ def get_series_temporais():
                 'grafico_valor_total': chart_gen.create_time_series_chart(
                     series_data['total'],
                     'Valor Total Exportado (Agregado)',
-                    'Valor (US$ FOB)'
+                    'Valor (US$ FOB)',
+                    max_points=max_points
                 ),
                 'grafico_volume': chart_gen.create_time_series_chart(
                     series_data['volume'],
                     'Volume Total Exportado',
-                    'Peso (Kg)'
+                    'Peso (Kg)',
+                    max_points=max_points
                 ),
                 'grafico_paises_tempo': chart_gen.create_multi_line_chart(
                     series_data['top_paises'],
                     'Top 5 Países (Todos os Produtos)',
-                    'Valor (US$ FOB)'
+                    'Valor (US$ FOB)',
+                    max_points=max_points
                 ),
                 'top_ncms': series_data.get('top_ncms_info', []),
                 'ncm_individual': {}  # Gráficos individuais por NCM
@@ -424,12 +756,14 @@ def get_series_temporais():
                     'grafico_valor': chart_gen.create_time_series_chart(
                         ncm_data,
                         f'{ncm_desc} (NCM {ncm_code})',
-                        'Valor (US$ FOB)'
+                        'Valor (US$ FOB)',
+                        max_points=max_points
                     ),
                     'grafico_preco_medio': chart_gen.create_time_series_chart(
                         ncm_data[['periodo_str', 'preco_medio']].rename(columns={'preco_medio': 'valor_fob'}),
                         f'Preço Médio - {ncm_desc}',
-                        'Preço (US$/unidade)'
+                        'Preço (US$/unidade)',
+                        max_points=max_points
                     )
                 }
                 
@@ -439,7 +773,8 @@ def get_series_temporais():
                     charts['ncm_individual'][f'ncm_{ncm_code}']['grafico_paises'] = chart_gen.create_multi_line_chart(
                         pais_ncm_data,
                         f'Top 5 Países - {ncm_desc}',
-                        'Valor (US$ FOB)'
+                        'Valor (US$ FOB)',
+                        max_points=max_points
                     )
         else:
             # Análise focada em um NCM específico
@@ -447,12 +782,14 @@ def get_series_temporais():
                 'grafico_valor_total': chart_gen.create_time_series_chart(
                     series_data['total'],
                     f'Valor Exportado - NCM {ncm_selecionado}',
-                    'Valor (US$ FOB)'
+                    'Valor (US$ FOB)',
+                    max_points=max_points
                 ),
                 'grafico_paises_tempo': chart_gen.create_multi_line_chart(
                     series_data['top_paises'],
                     f'Top 5 Países - NCM {ncm_selecionado}',
-                    'Valor (US$ FOB)'
+                    'Valor (US$ FOB)',
+                    max_points=max_points
                 )
             }
         
@@ -463,10 +800,30 @@ def get_series_temporais():
         print(f"Erro na série temporal: {traceback.format_exc()}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/ready')
+def get_ready():
+    """Prontidão do worker: 503 até o aquecimento terminar (quando habilitado)"""
+    pronto = aquecimento['status'] in ('ready', 'disabled')
+    return jsonify({'ready': pronto, **aquecimento}), 200 if pronto else 503
+
+@app.route('/api/metrics')
+def get_metrics():
+    """Métricas de cache e de coalescência (líderes x requisições coalescidas)"""
+    api_service, data_processor, chart_gen = get_services()
+    return jsonify({
+        'requests': request_flight.stats(),
+        'responses': response_cache.stats(),
+        'datasets': api_service.registry.snapshot(),
+        'dataframes': api_service.metrics()
+    })
+
 if __name__ == '__main__':
     print("="*60)
     print("Servidor Flask - Dashboard de Exportacoes Brasileiras")
     print("Acesse: http://localhost:5000")
     print("Pressione CTRL+C para parar")
     print("="*60)
+    # Com o reloader do modo debug, aquece apenas o processo que atende
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        iniciar_aquecimento()
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -21,3 +21,22 @@ class Config:
     
     # Pagination
     ITEMS_PER_PAGE = 50
+    
+    # Cache HTTP das respostas /api/* (navegador: max-age; servidor: orçamento em MB)
+    API_CACHE_MAX_AGE = int(os.getenv('API_CACHE_MAX_AGE', '300'))
+    RESPONSE_CACHE_MAX_MB = int(os.getenv('RESPONSE_CACHE_MAX_MB', '256'))
+    # Respostas JSON a partir deste tamanho saem em gzip/br (Accept-Encoding)
+    COMPRESS_MIN_BYTES = int(os.getenv('COMPRESS_MIN_BYTES', '1024'))
+    
+    # Linhas por página da exportação em fluxo com ?limit (a página é montada em memória)
+    EXPORT_PAGE_MAX_ROWS = int(os.getenv('EXPORT_PAGE_MAX_ROWS', '100000'))
+    
+    # Produtos no gráfico de bolhas da análise por país (padrão de ?top_bolhas)
+    BUBBLE_TOP_N = int(os.getenv('BUBBLE_TOP_N', '20'))
+    
+    # Pontos por linha nos gráficos de séries temporais (LTTB; padrão de ?max_points, 0 = todos)
+    SERIES_MAX_POINTS = int(os.getenv('SERIES_MAX_POINTS', '2000'))
+    
+    # Aquecimento em segundo plano ao iniciar o servidor (anos mais recentes a carregar)
+    WARMUP_ON_START = os.getenv('WARMUP_ON_START', '0') == '1'
+    WARMUP_YEARS = int(os.getenv('WARMUP_YEARS', '2'))
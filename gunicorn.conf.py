@@ -0,0 +1,26 @@
+"""
+Configuração do gunicorn (Dockerfile): gunicorn -c gunicorn.conf.py wsgi:app
+Workers, threads e preload configuráveis por variáveis de ambiente.
+"""
+import gc
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+workers = int(os.getenv('GUNICORN_WORKERS', '2'))
+threads = int(os.getenv('GUNICORN_THREADS', '4'))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '120'))
+
+# Carrega wsgi.py (e os dados) no master antes do fork: páginas compartilhadas copy-on-write
+preload_app = os.getenv('GUNICORN_PRELOAD', '1') == '1'
+
+accesslog = '-'
+
+def when_ready(server):
+    # Objetos carregados no master saem do GC: varreduras nos workers não tocam
+    # (e não copiam) as páginas compartilhadas
+    if preload_app:
+        gc.freeze()
+
+def post_worker_init(worker):
+    from app import iniciar_aquecimento
+    iniciar_aquecimento()
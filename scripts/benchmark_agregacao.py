@@ -0,0 +1,62 @@
+"""
+Benchmark das agregações do dashboard sobre um ano completo:
+sequência atual (aggregate_by_* + nunique + sum) versus aggregate_many
+"""
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.api_service import ComexStatAPI
+from services.data_processor import DataProcessor
+
+DIMS = [['ncm', 'descricao_ncm'], 'pais', 'uf', 'via']
+
+def sequencia_atual(dp: DataProcessor, df: pd.DataFrame) -> dict:
+    return {
+        'ncm': dp.aggregate_by_ncm(df),
+        'pais': dp.aggregate_by_country(df),
+        'uf': dp.aggregate_by_state(df),
+        'via': dp.aggregate_by_transport(df),
+        'totais': {'valor_fob': df['valor_fob'].sum(), 'peso_kg': df['peso_kg'].sum()},
+        'distintos': {'pais': df['pais'].nunique(), 'ncm': df['ncm'].nunique()}
+    }
+
+def medir(func, repeticoes: int) -> float:
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+def benchmark_agregacao(ano: str = '2024', repeticoes: int = 5):
+    api = ComexStatAPI()
+    dp = DataProcessor()
+    df = api.concat_frames([api.fetch_export_data(ano, f'{m:02d}') for m in range(1, 13)])
+    print(f"\nAno {ano}: {len(df):,} linhas")
+
+    atual = sequencia_atual(dp, df)
+    novo = dp.aggregate_many(df, DIMS, top_n={'ncm': 10, 'pais': 10})
+
+    # Confere que os resultados são os mesmos
+    for nome in ['ncm', 'pais', 'uf', 'via']:
+        pd.testing.assert_frame_equal(atual[nome].reset_index(drop=True),
+                                      novo[nome].reset_index(drop=True))
+    assert atual['totais'] == novo['totais']
+    assert all(novo['distintos'][col] == n for col, n in atual['distintos'].items())
+
+    t_atual = medir(lambda: sequencia_atual(dp, df), repeticoes)
+    t_novo = medir(lambda: dp.aggregate_many(df, DIMS, top_n={'ncm': 10, 'pais': 10}), repeticoes)
+
+    print(f"\n{'Método':<40}{'tempo':>10}")
+    print("-" * 50)
+    print(f"{'aggregate_by_* + nunique + sum':<40}{t_atual * 1000:>8.1f}ms")
+    print(f"{'aggregate_many (passada única)':<40}{t_novo * 1000:>8.1f}ms")
+    print(f"\nGanho: {t_atual / t_novo:.1f}x")
+
+if __name__ == "__main__":
+    benchmark_agregacao(*sys.argv[1:2])
@@ -0,0 +1,92 @@
+"""
+Benchmark dos gráficos com arrays binários (?bdata=1) versus listas JSON:
+bytes do payload (sem e com gzip) e tempo de parse no cliente, medido no
+Node.js com JSON.parse seguido da decodificação base64 -> TypedArray, como
+o plotly.js faz. Confere também que os valores decodificados são iguais.
+"""
+import base64
+import gzip
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import app
+
+RAIZ = Path(__file__).parent.parent
+
+def endpoints() -> list:
+    # Só anos com CSV local: anos sem arquivo usariam dados de exemplo aleatórios
+    anos = sorted(int(p.stem.split('_')[1]) for p in (RAIZ / 'datasets').glob('EXP_*.csv')) or [2024]
+    return [f'/api/series-temporais?ano_inicio={anos[0]}&ano_fim={anos[-1]}&agregacao=mensal',
+            f'/api/analise-pais-data?year={anos[-1]}&month=todos&pais=China']
+
+PARSE_JS = r'''
+const fs = require('fs');
+const TIPOS = {f8: Float64Array, f4: Float32Array, i4: Int32Array, u4: Uint32Array,
+               i2: Int16Array, u2: Uint16Array, i1: Int8Array, u1: Uint8Array};
+function decodificar(obj) {
+    if (Array.isArray(obj)) { obj.forEach(decodificar); return; }
+    if (obj === null || typeof obj !== 'object') return;
+    for (const [k, v] of Object.entries(obj)) {
+        if (v && typeof v === 'object' && v.bdata !== undefined) {
+            const bytes = Buffer.from(v.bdata, 'base64');
+            obj[k] = new TIPOS[v.dtype](bytes.buffer, bytes.byteOffset, bytes.byteLength / TIPOS[v.dtype].BYTES_PER_ELEMENT);
+        } else {
+            decodificar(v);
+        }
+    }
+}
+const texto = fs.readFileSync(process.argv[2], 'utf8');
+let melhor = Infinity;
+for (let i = 0; i < 50; i++) {
+    const inicio = process.hrtime.bigint();
+    decodificar(JSON.parse(texto));
+    melhor = Math.min(melhor, Number(process.hrtime.bigint() - inicio) / 1e6);
+}
+console.log(melhor);
+'''
+
+def decodificar(obj):
+    if isinstance(obj, dict) and 'bdata' in obj and 'dtype' in obj:
+        return np.frombuffer(base64.b64decode(obj['bdata']), dtype=np.dtype(obj['dtype'])).tolist()
+    if isinstance(obj, dict):
+        return {k: decodificar(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [decodificar(v) for v in obj]
+    return obj
+
+def parse_cliente(corpo: bytes):
+    """Melhor tempo (ms) de JSON.parse + decodificação no Node.js, ou None sem node"""
+    node = shutil.which('node')
+    if node is None:
+        return None
+    with tempfile.TemporaryDirectory() as pasta:
+        script, dados = Path(pasta) / 'parse.js', Path(pasta) / 'dados.json'
+        script.write_text(PARSE_JS)
+        dados.write_bytes(corpo)
+        saida = subprocess.run([node, str(script), str(dados)], capture_output=True, text=True, check=True)
+    return float(saida.stdout.strip())
+
+def benchmark_arrays_binarios():
+    client = app.test_client()
+    print(f"\n{'Endpoint':<20}{'modo':<8}{'bytes':>11}{'gzip':>9}{'parse':>10}  iguais")
+    print("-" * 66)
+    for url in endpoints():
+        listas = client.get(url).get_data()
+        binario = client.get(url + '&bdata=1').get_data()
+        iguais = decodificar(json.loads(listas)) == decodificar(json.loads(binario))
+        nome = url.split('?')[0][5:]
+        for modo, corpo in [('listas', listas), ('bdata', binario)]:
+            parse = parse_cliente(corpo)
+            print(f"{nome:<20}{modo:<8}{len(corpo):>11,}{len(gzip.compress(corpo)):>9,}"
+                  f"{(f'{parse:.2f}ms' if parse is not None else 'sem node'):>10}  {'sim' if iguais else 'NÃO'}")
+
+if __name__ == "__main__":
+    benchmark_arrays_binarios()
@@ -0,0 +1,57 @@
+"""
+Benchmark do carregamento de vários anos: laço sequencial por ano/mês
+versus ComexStatAPI.load_periods (pool de processos para CSV, threads
+para Parquet). Cada modo roda em um processo novo, com cache vazio.
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).parent.parent
+
+EXECUTOR = r'''
+import json, sys, time
+sys.path.insert(0, {raiz!r})
+from services.api_service import ComexStatAPI
+
+api = ComexStatAPI()
+anos = {anos!r}
+meses = [f'{{m:02d}}' for m in range(1, 13)]
+inicio = time.perf_counter()
+if {modo!r} == 'sequencial':
+    df = api.concat_frames([api.fetch_export_data(a, m) for a in anos for m in meses])
+else:
+    df = api.load_periods(anos, meses, workers={workers})
+tempo = time.perf_counter() - inicio
+print(json.dumps({{'tempo': tempo, 'linhas': len(df), 'fob': float(df['valor_fob'].sum()),
+                  'ordem': df[['ano', 'mes']].drop_duplicates().astype(int).values.tolist()}}))
+'''
+
+def executar(modo: str, anos: list, workers: int) -> dict:
+    codigo = EXECUTOR.format(raiz=str(RAIZ), modo=modo, anos=anos, workers=workers)
+    saida = subprocess.run([sys.executable, '-c', codigo], capture_output=True, text=True, check=True)
+    return json.loads(saida.stdout.strip().splitlines()[-1])
+
+def benchmark_carregamento(anos: list, workers: int = 0):
+    from services.api_service import LOADER_WORKERS
+    workers = workers or LOADER_WORKERS
+    anos = [a for a in anos if (RAIZ / 'datasets' / f'EXP_{a}.csv').exists()]
+    if not anos:
+        print("Nenhum arquivo EXP_*.csv encontrado.")
+        return
+
+    sequencial = executar('sequencial', anos, workers)
+    paralelo = executar('paralelo', anos, workers)
+    iguais = all(sequencial[k] == paralelo[k] for k in ['linhas', 'fob', 'ordem'])
+
+    print(f"\nAnos {', '.join(anos)} ({sequencial['linhas']:,} linhas, {workers} workers)"
+          f" - resultados e ordem iguais: {'sim' if iguais else 'NÃO'}")
+    print(f"\n{'Modo':<28}{'tempo':>10}")
+    print("-" * 38)
+    print(f"{'sequencial (ano x mês)':<28}{sequencial['tempo']:>9.2f}s")
+    print(f"{'load_periods':<28}{paralelo['tempo']:>9.2f}s")
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(RAIZ))
+    benchmark_carregamento(sys.argv[1:] or ['2020', '2021', '2022', '2023', '2024'])
@@ -0,0 +1,44 @@
+"""
+Benchmark da compressão das respostas JSON: taxa e custo de CPU de gzip e
+brotli (níveis de services/compressao.py) por endpoint. Com o cache de
+respostas esse custo é pago uma vez por entrada e codificação.
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import app
+from services.compressao import CODIFICACOES, comprimir
+
+ENDPOINTS = [
+    '/api/dashboard-data?year=2024&month=12',
+    '/api/analise-pais-data?year=2024&month=todos&pais=China',
+    '/api/series-temporais?ano_inicio=2020&ano_fim=2024&agregacao=mensal',
+    '/api/export-data?year=2024&month=12&page=1'
+]
+
+def medir(func, repeticoes: int) -> float:
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.process_time()
+        func()
+        tempos.append(time.process_time() - inicio)
+    return min(tempos)
+
+def benchmark_compressao(repeticoes: int = 10):
+    client = app.test_client()
+    print(f"\n{'Endpoint':<22}{'original':>11}" + ''.join(f"{c:>10}{'taxa':>7}{'CPU':>9}" for c in CODIFICACOES))
+    print("-" * (33 + 26 * len(CODIFICACOES)))
+    for url in ENDPOINTS:
+        corpo = client.get(url).get_data()
+        linha = f"{url.split('?')[0][5:]:<22}{len(corpo):>11,}"
+        for codificacao in CODIFICACOES:
+            comprimido = comprimir(corpo, codificacao)
+            cpu = medir(lambda: comprimir(corpo, codificacao), repeticoes)
+            linha += f"{len(comprimido):>10,}{len(corpo) / len(comprimido):>6.1f}x{cpu * 1000:>7.1f}ms"
+        print(linha)
+
+if __name__ == "__main__":
+    benchmark_compressao()
@@ -0,0 +1,69 @@
+"""
+Benchmark do download em lote para análise: /api/export-bulk (Arrow IPC ou
+Parquet) versus /api/export-stream (NDJSON/CSV), com os mesmos filtros.
+Mede bytes, tempo e pico de memória no servidor e o tempo para o analista
+ter o DataFrame (parse no cliente).
+"""
+import io
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import app, get_services
+from scripts.benchmark_exportacao import consumir
+
+def medir(func, repeticoes: int) -> float:
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+def corpo(client, url: str) -> bytes:
+    return client.get(url).data
+
+def ler_cliente(formato: str, dados: bytes) -> pd.DataFrame:
+    """DataFrame do lado do analista a partir do corpo baixado"""
+    if formato == 'arrow':
+        return pa.ipc.open_stream(dados).read_all().to_pandas()
+    if formato == 'parquet':
+        return pq.read_table(io.BytesIO(dados)).to_pandas()
+    if formato == 'csv':
+        return pd.read_csv(io.BytesIO(dados))
+    return pd.read_json(io.BytesIO(dados), lines=True)
+
+def benchmark_download_colunar(ano: str = '2024', repeticoes: int = 3):
+    api_service, _, _ = get_services()
+    api_service.fetch_export_data(ano, '01')  # tabelas de rótulos carregadas
+    client = app.test_client()
+    consultas = [('ano inteiro', f'year={ano}&month=todos'),
+                 ('UF SP, 1 trimestre', f'year={ano}&month=01,02,03&uf=SP'),
+                 ('FOB >= 1 mi', f'year={ano}&month=todos&min_fob=1000000')]
+    modos = [('export-stream ndjson', 'export-stream', 'ndjson', ''),
+             ('export-stream csv', 'export-stream', 'csv', ''),
+             ('export-bulk arrow', 'export-bulk', 'arrow', ''),
+             ('export-bulk arrow zstd', 'export-bulk', 'arrow', '&compression=zstd'),
+             ('export-bulk parquet zstd', 'export-bulk', 'parquet', '')]
+
+    for nome, consulta in consultas:
+        print(f"\n{nome} ({consulta})")
+        print(f"{'Modo':<28}{'linhas':>9}{'bytes':>13}{'pico':>10}{'servidor':>11}{'cliente':>10}")
+        print("-" * 81)
+        for rotulo, rota, formato, extra in modos:
+            url = f'/api/{rota}?{consulta}&format={formato}{extra}'
+            _, total, pico, segundos = consumir(client, url)
+            dados = corpo(client, url)
+            linhas = len(ler_cliente(formato, dados))
+            cliente = medir(lambda: ler_cliente(formato, dados), repeticoes)
+            print(f"{rotulo:<28}{linhas:>9,}{total:>13,}{pico:>8.1f}MB{segundos:>10.2f}s{cliente:>9.2f}s")
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    benchmark_download_colunar(*args[:1])
@@ -0,0 +1,76 @@
+"""
+Benchmark da exportação de linhas brutas: /api/export-data (páginas de
+ITEMS_PER_PAGE registros em JSON) versus /api/export-stream (NDJSON/CSV em
+fluxo, inteiro ou em páginas com cursor). Mede tempo, bytes e o pico de
+memória alocada durante a resposta (tracemalloc), que no fluxo depende do
+bloco (EXPORT_BLOCK_ROWS) e não do total exportado.
+"""
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import app, get_services, response_cache
+
+def ler(client, url: str) -> tuple:
+    """(resposta, bytes do corpo), lendo a resposta em partes (sem o cache de respostas)"""
+    response_cache.invalidate()
+    response = client.get(url, buffered=False)
+    total = sum(len(parte) for parte in response.response)
+    response.close()
+    return response, total
+
+def consumir(client, url: str) -> tuple:
+    """(resposta, bytes, pico de memória em MB, segundos); o tempo vem de uma leitura sem tracemalloc"""
+    inicio = time.perf_counter()
+    ler(client, url)
+    segundos = time.perf_counter() - inicio
+    tracemalloc.start()
+    response, total = ler(client, url)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return response, total, pico / 1024 / 1024, segundos
+
+def paginas_cursor(client, url: str, limite: int) -> tuple:
+    paginas, total, pico, segundos, cursor = 0, 0, 0.0, 0.0, None
+    while True:
+        response, corpo, mb, s = consumir(client, url + f'&limit={limite}' + (f'&cursor={cursor}' if cursor else ''))
+        paginas, total, pico, segundos = paginas + 1, total + corpo, max(pico, mb), segundos + s
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            return paginas, total, pico, segundos
+
+def benchmark_exportacao(ano: str = '2024', mes: str = '03'):
+    api_service, _, _ = get_services()
+    api_service.fetch_export_data(ano, mes)  # mês em cache: compara só a montagem das respostas
+    client = app.test_client()
+    por_pagina = app.config['ITEMS_PER_PAGE']
+
+    print(f"\n{'Modo':<34}{'req.':>6}{'bytes':>13}{'pico':>10}{'tempo':>10}")
+    print("-" * 73)
+
+    # export-data: todas as páginas do mês (cada página recalcula o total e fatia o mês)
+    total_linhas = client.get(f'/api/export-data?year={ano}&month={mes}').get_json()['total']
+    paginas = -(-total_linhas // por_pagina)
+    total, pico, segundos = 0, 0.0, 0.0
+    for pagina in range(1, paginas + 1):
+        _, corpo, mb, s = consumir(client, f'/api/export-data?year={ano}&month={mes}&page={pagina}')
+        total, pico, segundos = total + corpo, max(pico, mb), segundos + s
+    print(f"{f'export-data ({por_pagina}/página)':<34}{paginas:>6}{total:>13,}{pico:>8.1f}MB{segundos:>9.2f}s")
+
+    for formato in ('ndjson', 'csv'):
+        url = f'/api/export-stream?year={ano}&month={mes}&format={formato}'
+        _, corpo, mb, s = consumir(client, url)
+        print(f"{f'export-stream {formato} (inteiro)':<34}{1:>6}{corpo:>13,}{mb:>8.1f}MB{s:>9.2f}s")
+        n, corpo, mb, s = paginas_cursor(client, url, 1000)
+        print(f"{f'export-stream {formato} (cursor, 1000)':<34}{n:>6}{corpo:>13,}{mb:>8.1f}MB{s:>9.2f}s")
+
+    # Ano inteiro em fluxo: o pico acompanha o bloco, não as linhas
+    _, corpo, mb, s = consumir(client, f'/api/export-stream?year={ano}&month=todos')
+    print(f"{'export-stream ndjson (ano inteiro)':<34}{1:>6}{corpo:>13,}{mb:>8.1f}MB{s:>9.2f}s")
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    benchmark_exportacao(*args[:2])
@@ -0,0 +1,83 @@
+"""
+Benchmark do ChartGenerator por tipo de gráfico: especificação JSON montada
+diretamente (padrão) versus construção de go.Figure (CHART_VALIDATE=1).
+Confere também que os dois caminhos geram o mesmo gráfico, template incluído.
+"""
+import base64
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.api_service import ComexStatAPI
+from services.data_processor import DataProcessor
+from services.visualization import ChartGenerator
+
+def normalizar(x):
+    """JSON -> estruturas Python, com arrays base64 ({dtype, bdata}) decodificados"""
+    if isinstance(x, str) and x[:1] == '{':
+        return normalizar(json.loads(x))
+    if isinstance(x, dict) and 'bdata' in x and 'dtype' in x:
+        return np.frombuffer(base64.b64decode(x['bdata']), dtype=np.dtype(x['dtype'])).tolist()
+    if isinstance(x, dict):
+        return {k: normalizar(v) for k, v in x.items()}
+    if isinstance(x, list):
+        return [normalizar(v) for v in x]
+    return x
+
+def medir(func, repeticoes: int) -> float:
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+def casos(ano: str, ano_inicio: int, ano_fim: int) -> dict:
+    """Entradas de cada tipo de gráfico, como nos endpoints"""
+    api, dp = ComexStatAPI(), DataProcessor()
+    meses = [f'{m:02d}' for m in range(1, 13)]
+    df = api.load_periods([ano], meses)
+    produtos = df.groupby(['ncm', 'descricao_ncm'], observed=True)[['valor_fob', 'peso_kg']].sum().reset_index()
+    produtos = produtos.nlargest(20, 'valor_fob')
+    produtos['preco_medio_kg'] = produtos['valor_fob'] / produtos['peso_kg'].where(produtos['peso_kg'] > 0)
+    meses_df = df.groupby('mes', observed=True)['valor_fob'].sum().reset_index()
+    anos = [str(a) for a in range(ano_inicio, ano_fim + 1) if (api.datasets_dir / f"EXP_{a}.csv").exists()]
+    series = dp.process_time_series(api.load_periods(anos or [ano], meses), 'mensal')
+    ncm, paises, estados = dp.aggregate_by_ncm(df, 10), dp.aggregate_by_country(df, 10), dp.aggregate_by_state(df)
+
+    # Entradas agregadas antes: só a montagem do gráfico é medida
+    return {
+        'treemap': lambda g: g.create_treemap(ncm, 'descricao_ncm', 'valor_fob', 'NCM'),
+        'barras': lambda g: g.create_bar_chart(paises, 'pais', 'valor_fob', 'Países'),
+        'pizza': lambda g: g.create_pie_chart(ncm, 'descricao_ncm', 'valor_fob', 'NCM'),
+        'linha': lambda g: g.create_line_chart(meses_df, 'mes', 'valor_fob', 'Mensal'),
+        'mapa': lambda g: g.create_brazil_map(estados, 'Estados'),
+        'bolhas': lambda g: g.create_bubble_chart(produtos, 'peso_kg', 'preco_medio_kg', 'valor_fob',
+                                                  'descricao_ncm', 'Produtos'),
+        'série temporal': lambda g: g.create_time_series_chart(series['total'], 'Total', 'Valor'),
+        'multilinhas': lambda g: g.create_multi_line_chart(series['top_paises'], 'Países', 'Valor'),
+        'vazio': lambda g: g._empty_chart('Vazio')
+    }
+
+def benchmark_graficos(ano: str = '2024', ano_inicio: int = 2020, ano_fim: int = 2024, repeticoes: int = 20):
+    leve, figura = ChartGenerator(validate=False), ChartGenerator(validate=True)
+    graficos = casos(ano, ano_inicio, ano_fim)
+
+    print(f"\n{'Gráfico':<16}{'go.Figure':>12}{'spec':>12}{'ganho':>8}  iguais")
+    print("-" * 56)
+    for nome, criar in graficos.items():
+        criar(leve), criar(figura)  # aquece templates/escalas
+        iguais = normalizar(criar(leve)) == normalizar(criar(figura))
+        t_figura = medir(lambda: criar(figura), repeticoes)
+        t_leve = medir(lambda: criar(leve), repeticoes)
+        print(f"{nome:<16}{t_figura * 1000:>10.2f}ms{t_leve * 1000:>10.2f}ms"
+              f"{t_figura / t_leve:>7.1f}x  {'sim' if iguais else 'NÃO'}")
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    benchmark_graficos(args[0] if args else '2024')
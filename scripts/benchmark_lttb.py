@@ -0,0 +1,77 @@
+"""
+Benchmark da redução LTTB (max_points) nos gráficos de séries temporais com
+séries longas (diárias, muitos anos): pontos desenhados, bytes do payload
+(sem e com gzip), tempo de montagem + codificação no servidor e tempo de
+parse no cliente (Node.js), com e sem redução. Mostra também quanto da
+amplitude (máximo - mínimo) de cada linha o gráfico reduzido preserva.
+
+O custo de desenho no navegador cresce com os pontos de cada traço (SVG);
+a coluna "pontos" é o indicador dele.
+"""
+import gzip
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import app
+from scripts.benchmark_arrays_binarios import parse_cliente
+from services.visualization import ChartGenerator
+
+def medir(func, repeticoes: int) -> float:
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+def series_diarias(pontos: int, linhas: int, seed: int = 42) -> pd.DataFrame:
+    """Séries diárias sintéticas (passeio aleatório com sazonalidade), uma por país"""
+    rng = np.random.default_rng(seed)
+    dias = pd.date_range('1990-01-01', periods=pontos, freq='D').strftime('%Y-%m-%d')
+    partes = []
+    for i in range(linhas):
+        tendencia = np.cumsum(rng.normal(0, 1e6, pontos))
+        sazonal = 5e6 * np.sin(np.arange(pontos) * 2 * np.pi / 365)
+        partes.append(pd.DataFrame({'periodo_str': dias, 'pais': f'País {i:02d}',
+                                    'valor_fob': 1e8 + tendencia + sazonal}))
+    return pd.concat(partes, ignore_index=True)
+
+def amplitude_preservada(completo: dict, reduzido: dict) -> float:
+    """Menor fração (%) da amplitude original mantida entre as linhas"""
+    return min(100 * (max(b['y']) - min(b['y'])) / (max(a['y']) - min(a['y']))
+               for a, b in zip(completo['data'], reduzido['data']))
+
+def benchmark_lttb(max_points: int = 2000, repeticoes: int = 5):
+    gerador = ChartGenerator()
+    print(f"\n{'Caso':<22}{'max_points':>11}{'pontos':>10}{'bytes':>13}{'gzip':>11}"
+          f"{'servidor':>11}{'parse':>10}{'amplitude':>11}")
+    print("-" * 100)
+    with app.app_context():
+        for pontos, linhas in [(10_000, 1), (50_000, 1), (100_000, 1), (10_000, 20)]:
+            df = series_diarias(pontos, linhas)
+            if linhas == 1:
+                nome = f'{pontos:,} pontos'
+                criar = lambda mp: gerador.create_time_series_chart(df, 'Série', 'Valor', max_points=mp)
+            else:
+                nome = f'{linhas} x {pontos:,} pontos'
+                criar = lambda mp: gerador.create_multi_line_chart(df, 'Países', 'Valor', max_points=mp)
+            completo, reduzido = criar(None), criar(max_points)
+            amplitude = amplitude_preservada(completo, reduzido)
+            for rotulo, mp, grafico in [('todos', None, completo), (str(max_points), max_points, reduzido)]:
+                corpo = app.json.dumps(grafico).encode()
+                t = medir(lambda: app.json.dumps(criar(mp)), repeticoes)
+                parse = parse_cliente(corpo)
+                total = sum(len(trace['x']) for trace in grafico['data'])
+                print(f"{nome:<22}{rotulo:>11}{total:>10,}{len(corpo):>13,}{len(gzip.compress(corpo)):>11,}"
+                      f"{t * 1000:>9.1f}ms{(f'{parse:.1f}ms' if parse is not None else 'sem node'):>10}"
+                      f"{(100.0 if mp is None else amplitude):>10.1f}%")
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    benchmark_lttb(int(args[0]) if args else 2000)
@@ -0,0 +1,80 @@
+"""
+Benchmark de memória do gunicorn: RSS e PSS por worker com e sem
+preload_app. O PSS divide as páginas compartilhadas entre os processos
+que as mapeiam, então mostra o custo real de cada worker; a soma de PSS
+de master + workers é a memória total do servidor.
+"""
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+RAIZ = Path(__file__).parent.parent
+
+def memoria_kb(pid: int) -> dict:
+    """RSS e PSS (kB) de /proc/<pid>/smaps_rollup (Linux)"""
+    valores = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for linha in f:
+            partes = linha.split()
+            if partes[0] in ('Rss:', 'Pss:'):
+                valores[partes[0][:-1].lower()] = int(partes[1])
+    return valores
+
+def filhos(pid: int) -> list:
+    with open(f'/proc/{pid}/task/{pid}/children') as f:
+        return [int(p) for p in f.read().split()]
+
+def esperar_workers(master: int, workers: int, porta: int, limite: float = 600):
+    """Aguarda todos os workers subirem e o servidor responder"""
+    inicio = time.time()
+    while time.time() - inicio < limite:
+        try:
+            if len(filhos(master)) >= workers:
+                urllib.request.urlopen(f'http://127.0.0.1:{porta}/api/ready', timeout=5)
+                return
+        except OSError:
+            pass
+        time.sleep(0.5)
+    raise TimeoutError("gunicorn não ficou pronto")
+
+def executar(preload: bool, workers: int, porta: int) -> dict:
+    env = dict(os.environ, GUNICORN_PRELOAD='1' if preload else '0',
+               GUNICORN_WORKERS=str(workers), PORT=str(porta), WARMUP_ON_START='0')
+    processo = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app'],
+        cwd=RAIZ, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        inicio = time.perf_counter()
+        esperar_workers(processo.pid, workers, porta)
+        tempo = time.perf_counter() - inicio
+        # Espera os workers terminarem de carregar (sem preload, cada um lê os dados)
+        time.sleep(2)
+        return {'tempo': tempo, 'master': memoria_kb(processo.pid),
+                'workers': [memoria_kb(pid) for pid in filhos(processo.pid)]}
+    finally:
+        processo.send_signal(signal.SIGTERM)
+        processo.wait(timeout=60)
+
+def benchmark_preload(workers: int = 4, porta: int = 5099):
+    if not Path('/proc/self/smaps_rollup').exists():
+        print("Requer Linux (/proc/<pid>/smaps_rollup).")
+        return
+
+    print(f"\n{workers} workers (dados: serviços, cubo, tabelas e anos mais recentes)")
+    print(f"\n{'Modo':<14}{'subida':>9}{'RSS/worker':>13}{'PSS/worker':>13}{'PSS total':>12}")
+    print("-" * 61)
+    for preload in (False, True):
+        r = executar(preload, workers, porta)
+        rss = sum(w['rss'] for w in r['workers']) / len(r['workers']) / 1024
+        pss = sum(w['pss'] for w in r['workers']) / len(r['workers']) / 1024
+        total = (r['master']['pss'] + sum(w['pss'] for w in r['workers'])) / 1024
+        nome = 'com preload' if preload else 'sem preload'
+        print(f"{nome:<14}{r['tempo']:>8.1f}s{rss:>11.0f}MB{pss:>11.0f}MB{total:>10.0f}MB")
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    benchmark_preload(int(args[0]) if args else 4)
@@ -0,0 +1,47 @@
+"""
+Benchmark da abreviação de rótulos dos gráficos: regras aplicadas a cada
+rótulo (como as funções shorten_name de cada gráfico faziam) versus consulta
+ao dicionário pré-calculado de services/rotulos.py, por perfil.
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.codigos_comexstat import CATEGORIAS_COMPARTILHADAS, preparar_tabelas
+from services.rotulos import AbreviadorRotulos, aplicar_regras
+
+def medir(func, repeticoes: int) -> float:
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+def benchmark_rotulos(repeticoes: int = 20):
+    inicio = time.perf_counter()
+    preparar_tabelas()
+    print(f"preparar_tabelas (com abreviação das descrições): {time.perf_counter() - inicio:.2f}s")
+
+    descricoes = list(CATEGORIAS_COMPARTILHADAS['descricao_ncm'].categories)
+    abreviador = AbreviadorRotulos()
+    inicio = time.perf_counter()
+    abreviador.precomputar(descricoes)
+    print(f"{len(descricoes)} descrições NCM x {len(abreviador.perfis)} perfis pré-calculadas "
+          f"em {(time.perf_counter() - inicio) * 1000:.0f}ms")
+
+    print(f"\n{'Perfil':<8}{'rótulos':>9}{'regras':>12}{'dicionário':>13}{'ganho':>8}  iguais")
+    print("-" * 58)
+    for perfil, regras in abreviador.perfis.items():
+        for n in (20, len(descricoes)):
+            nomes = descricoes[:n]
+            iguais = [aplicar_regras(nome, regras) for nome in nomes] == abreviador.rotulos(nomes, perfil)
+            t_regras = medir(lambda: [aplicar_regras(nome, regras) for nome in nomes], repeticoes)
+            t_dict = medir(lambda: abreviador.rotulos(nomes, perfil), repeticoes)
+            print(f"{perfil:<8}{n:>9}{t_regras * 1000:>10.3f}ms{t_dict * 1000:>11.3f}ms"
+                  f"{t_regras / t_dict:>7.1f}x  {'sim' if iguais else 'NÃO'}")
+
+if __name__ == "__main__":
+    benchmark_rotulos()
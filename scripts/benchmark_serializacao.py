@@ -0,0 +1,64 @@
+"""
+Benchmark da serialização das respostas com gráficos: contrato anterior
+(cada gráfico como string Figure.to_json() codificada de novo pelo jsonify)
+versus gráficos como dicionários e uma única codificação (FastJSONProvider).
+Mede bytes do payload e tempo de codificação por endpoint.
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+import plotly.io as pio
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import app
+
+ENDPOINTS = [
+    '/api/dashboard-data?year=2024&month=12',
+    '/api/analise-pais-data?year=2024&month=todos&pais=China',
+    '/api/series-temporais?ano_inicio=2020&ano_fim=2024&agregacao=mensal'
+]
+
+def graficos_como_string(obj):
+    """Reproduz o contrato anterior: gráficos {data, layout} viram strings JSON"""
+    if isinstance(obj, dict) and 'data' in obj and 'layout' in obj:
+        return pio.json.to_json_plotly(obj)
+    if isinstance(obj, dict):
+        return {k: graficos_como_string(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [graficos_como_string(v) for v in obj]
+    return obj
+
+def medir(func, repeticoes: int) -> float:
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+def benchmark_serializacao(repeticoes: int = 20):
+    client = app.test_client()
+    # Flask padrão: json.dumps com ensure_ascii e sort_keys
+    anterior = lambda obj: json.dumps(graficos_como_string(obj), ensure_ascii=True, sort_keys=True)
+    atual = app.json.dumps
+
+    print(f"\n{'Endpoint':<44}{'bytes antes':>13}{'depois':>10}{'antes':>10}{'depois':>10}")
+    print("-" * 87)
+    for url in ENDPOINTS:
+        response = client.get(url)
+        if response.status_code != 200:
+            print(f"{url[:42]:<44} HTTP {response.status_code}")
+            continue
+        obj = response.get_json()
+        bytes_antes = len(anterior(obj).encode())
+        bytes_depois = len(atual(obj).encode())
+        t_antes = medir(lambda: anterior(obj), repeticoes)
+        t_depois = medir(lambda: atual(obj), repeticoes)
+        print(f"{url.split('?')[0][5:] + '?' + url.split('?')[1][:20]:<44}{bytes_antes:>13,}{bytes_depois:>10,}"
+              f"{t_antes * 1000:>8.1f}ms{t_depois * 1000:>8.1f}ms")
+
+if __name__ == "__main__":
+    benchmark_serializacao()
@@ -0,0 +1,67 @@
+"""
+Benchmark de DataProcessor.process_time_series sobre 2020–2024:
+implementação anterior (pd.to_datetime + laço por NCM) versus chave inteira
+de período com agregações agrupadas
+"""
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.api_service import ComexStatAPI
+from services.data_processor import DataProcessor
+
+def series_legado(df: pd.DataFrame, agregacao: str) -> dict:
+    """Núcleo da implementação anterior (sem a conversão de tipos final)"""
+    df['data'] = pd.to_datetime(df['ano'].astype(str) + '-' + df['mes'].astype(str).str.zfill(2) + '-01')
+    freq = {'trimestral': 'Q', 'anual': 'Y'}.get(agregacao, 'M')
+    df['periodo'] = df['data'].dt.to_period(freq)
+    agg_dict = {'valor_fob': 'sum', 'peso_kg': 'sum', 'quantidade': 'sum'}
+
+    total = df.groupby('periodo').agg(agg_dict).reset_index()
+    top_ncms = df.groupby(['ncm', 'descricao_ncm'], observed=True)['valor_fob'].sum().nlargest(5).reset_index()
+    ncm_series, ncm_pais_series = [], []
+    for _, ncm_row in top_ncms.iterrows():
+        ncm_df = df[df['ncm'] == ncm_row['ncm']]
+        ncm_series.append(ncm_df.groupby('periodo').agg(agg_dict).reset_index())
+    for _, ncm_row in top_ncms.iterrows():
+        ncm_df = df[df['ncm'] == ncm_row['ncm']]
+        top_paises = ncm_df.groupby('pais', observed=True)['valor_fob'].sum().nlargest(5).index.tolist()
+        ncm_pais_series.append(ncm_df[ncm_df['pais'].isin(top_paises)]
+                               .groupby(['periodo', 'pais'], observed=True).agg(agg_dict).reset_index())
+    top_paises_geral = df.groupby('pais', observed=True)['valor_fob'].sum().nlargest(5).index.tolist()
+    paises = df[df['pais'].isin(top_paises_geral)].groupby(['periodo', 'pais'], observed=True).agg(agg_dict).reset_index()
+    return {'total': total, 'top_paises': paises, 'ncm_series': ncm_series, 'ncm_pais_series': ncm_pais_series}
+
+def medir(func, repeticoes: int) -> float:
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        func()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+def benchmark_series(ano_inicio: int = 2020, ano_fim: int = 2024, repeticoes: int = 3):
+    api = ComexStatAPI()
+    dp = DataProcessor()
+
+    anos = [str(a) for a in range(ano_inicio, ano_fim + 1)
+            if (api.datasets_dir / f"EXP_{a}.csv").exists()]
+    if not anos:
+        print("Nenhum arquivo EXP_*.csv encontrado no período.")
+        return
+    df = api.concat_frames([api.fetch_export_data(a, f'{m:02d}') for a in anos for m in range(1, 13)])
+    print(f"\nAnos {', '.join(anos)}: {len(df):,} linhas")
+
+    print(f"\n{'Agregação':<14}{'anterior':>12}{'vetorizado':>12}{'ganho':>8}")
+    print("-" * 46)
+    for agregacao in ['mensal', 'trimestral', 'anual']:
+        t_legado = medir(lambda: series_legado(df.copy(), agregacao), repeticoes)
+        t_novo = medir(lambda: dp.process_time_series(df, agregacao), repeticoes)
+        print(f"{agregacao:<14}{t_legado * 1000:>10.0f}ms{t_novo * 1000:>10.0f}ms{t_legado / t_novo:>7.1f}x")
+
+if __name__ == "__main__":
+    benchmark_series(*map(int, sys.argv[1:3]))
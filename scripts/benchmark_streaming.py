@@ -0,0 +1,62 @@
+"""
+Benchmark de memória: agregação de um ano inteiro carregado em memória
+versus leitura do CSV em blocos (ComexStatAPI.iter_csv_chunks +
+DataProcessor.aggregate_stream). Cada modo roda em um processo novo
+para que o pico de RSS (ru_maxrss) seja medido isoladamente.
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).parent.parent
+
+EXECUTOR = r'''
+import json, resource, sys, time
+sys.path.insert(0, {raiz!r})
+from services.api_service import ComexStatAPI
+from services.data_processor import DataProcessor
+
+api, dp = ComexStatAPI(), DataProcessor()
+dims = [['ncm', 'descricao_ncm'], 'pais', 'uf', 'via']
+antes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+inicio = time.perf_counter()
+if {modo!r} == 'memoria':
+    df = api._read_year_csv(api.datasets_dir / 'EXP_{ano}.csv')
+    resultado = dp.aggregate_many(df, dims)
+else:
+    resultado = dp.aggregate_stream(api.iter_csv_chunks('{ano}', chunksize={chunk}), dims)
+tempo = time.perf_counter() - inicio
+pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{
+    'tempo': tempo, 'antes_kb': antes, 'pico_kb': pico,
+    'totais': {{k: float(v) for k, v in resultado['totais'].items()}},
+    'pais': resultado['pais'].astype(str).values.tolist(),
+    'ncm': resultado['ncm'].head(20).astype(str).values.tolist()
+}}))
+'''
+
+def executar(modo: str, ano: str, chunk: int) -> dict:
+    codigo = EXECUTOR.format(raiz=str(RAIZ), modo=modo, ano=ano, chunk=chunk)
+    saida = subprocess.run([sys.executable, '-c', codigo], capture_output=True, text=True, check=True)
+    return json.loads(saida.stdout.strip().splitlines()[-1])
+
+def benchmark_streaming(ano: str = '2024', chunk: int = 250_000):
+    if not (RAIZ / 'datasets' / f'EXP_{ano}.csv').exists():
+        print(f"Arquivo EXP_{ano}.csv não encontrado.")
+        return
+
+    memoria = executar('memoria', ano, chunk)
+    streaming = executar('streaming', ano, chunk)
+
+    iguais = all(memoria[k] == streaming[k] for k in ['totais', 'pais', 'ncm'])
+    print(f"\nAno {ano} (blocos de {chunk:,} linhas) - resultados iguais: {'sim' if iguais else 'NÃO'}")
+    print(f"\n{'Modo':<14}{'tempo':>10}{'RSS pico':>12}{'acima da base':>16}")
+    print("-" * 52)
+    for nome, r in [('memória', memoria), ('streaming', streaming)]:
+        print(f"{nome:<14}{r['tempo']:>9.2f}s{r['pico_kb'] / 1024:>10.0f}MB"
+              f"{(r['pico_kb'] - r['antes_kb']) / 1024:>14.0f}MB")
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    benchmark_streaming(args[0] if args else '2024', int(args[1]) if len(args) > 1 else 250_000)
@@ -0,0 +1,71 @@
+"""
+Benchmark de carga das tabelas de códigos:
+módulo Python com dicionário literal (formato antigo do ncm_completo.py)
+versus tabela binária mapeada em memória (services/data/ncm.tbl)
+"""
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+RAIZ = Path(__file__).parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from services.codigos_comexstat import DATA_DIR
+from services.tabela_binaria import TabelaBinaria
+
+def _medir(codigo: str, cwd: Path) -> float:
+    """Executa o trecho em um interpretador novo e retorna o tempo impresso"""
+    saida = subprocess.run([sys.executable, '-c', codigo], cwd=cwd,
+                           capture_output=True, text=True, check=True)
+    return float(saida.stdout.strip())
+
+def benchmark_tabelas(repeticoes: int = 5):
+    tabela = TabelaBinaria(DATA_DIR / 'ncm.tbl')
+    print(f"Tabela NCM: {len(tabela)} códigos, {(DATA_DIR / 'ncm.tbl').stat().st_size / 1024:.0f} KB")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        # Recria o módulo no formato antigo para comparação
+        with open(tmp / 'ncm_dict.py', 'w', encoding='utf-8') as f:
+            f.write('NCM_COMPLETO = {\n')
+            for codigo, rotulo in zip(tabela.codigos, tabela.values()):
+                f.write(f"    '{int(codigo):08d}': {rotulo!r},\n")
+            f.write('}\n')
+
+        importar = ("import time; t = time.perf_counter(); "
+                    "from ncm_dict import NCM_COMPLETO; NCM_COMPLETO.get('12019000'); "
+                    "print(time.perf_counter() - t)")
+        # numpy já está carregado no app (pandas), então fica fora da medição
+        abrir = ("import time; from services.tabela_binaria import TabelaBinaria; "
+                 "t = time.perf_counter(); "
+                 "tb = TabelaBinaria('services/data/ncm.tbl'); tb.get(12019000); "
+                 "print(time.perf_counter() - t)")
+
+        sem_pyc = importar.replace('import time;', 'import sys, time; sys.dont_write_bytecode = True;')
+        com_pyc = importar.replace('import time;', 'import sys, time; sys.dont_write_bytecode = False;')
+        frio = _medir(sem_pyc, tmp)
+        _medir(com_pyc, tmp)  # gera o .pyc
+        quente = min(_medir(com_pyc, tmp) for _ in range(repeticoes))
+        binario = min(_medir(abrir, RAIZ) for _ in range(repeticoes))
+
+    print(f"\n{'Carga (interpretador novo)':<40}{'tempo':>10}")
+    print("-" * 50)
+    print(f"{'dict literal, sem .pyc':<40}{frio * 1000:>8.1f}ms")
+    print(f"{'dict literal, com .pyc':<40}{quente * 1000:>8.1f}ms")
+    print(f"{'tabela binária (mmap)':<40}{binario * 1000:>8.1f}ms")
+
+    # Busca vetorizada de 1 milhão de códigos (metade inexistente)
+    rng = np.random.default_rng(0)
+    codigos = np.concatenate([rng.choice(tabela.codigos, 500_000),
+                              rng.integers(0, 99_999_999, 500_000)])
+    inicio = time.perf_counter()
+    tabela.posicoes(codigos)
+    print(f"\nBusca de {len(codigos):,} códigos (searchsorted): "
+          f"{(time.perf_counter() - inicio) * 1000:.1f}ms")
+
+if __name__ == "__main__":
+    benchmark_tabelas()
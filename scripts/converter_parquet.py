@@ -0,0 +1,42 @@
+"""
+Converte os CSVs anuais (EXP_*.csv) para o armazenamento colunar Parquet
+particionado por ano e mês (datasets/parquet/ano=AAAA/mes=MM.parquet)
+e materializa o cubo pré-agregado (datasets/cubo/ano=AAAA/)
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.api_service import ComexStatAPI
+
+def converter_parquet(anos=None):
+    """Converte os anos informados (ou todos os CSVs encontrados)"""
+    api = ComexStatAPI()
+
+    if not api.store.available:
+        print("pyarrow não instalado. Instale com: pip install pyarrow")
+        return
+
+    if anos is None:
+        anos = sorted(f.stem.split('_')[1] for f in api.datasets_dir.glob('EXP_*.csv'))
+
+    if not anos:
+        print("Nenhum arquivo EXP_*.csv encontrado.")
+        return
+
+    for ano in anos:
+        csv_file = api.datasets_dir / f"EXP_{ano}.csv"
+        if api.store.is_current(ano, csv_file) and api.cube.is_current(ano, csv_file):
+            print(f"  ✓ {ano} já convertido")
+            continue
+
+        inicio = time.perf_counter()
+        particoes = api.build_columnar_store(ano)
+        tamanho = sum(p.stat().st_size for p in particoes) / 1024 / 1024
+        print(f"  ✓ {ano}: {len(particoes)} partições, {tamanho:.1f} MB "
+              f"em {time.perf_counter() - inicio:.1f}s")
+
+if __name__ == "__main__":
+    converter_parquet(sys.argv[1:] or None)
@@ -1,10 +1,17 @@
 """
-Baixa tabela NCM oficial e gera dicionário Python completo
+Baixa tabela NCM oficial e gera a tabela binária services/data/ncm.tbl
+(lida via mmap por services/codigos_comexstat.py) com as descrições completas
+de cada NCM, em vez das descrições SH6 de gerar_ncm_sh6.py
 """
+import sys
 import pandas as pd
-import requests
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.codigos_comexstat import DATA_DIR
+from services.tabela_binaria import escrever_tabela
+
 def baixar_tabela_ncm():
     """Baixa tabela NCM-SH do governo"""
     print("Baixando tabela NCM oficial do governo...")
@@ -26,55 +33,31 @@ def baixar_tabela_ncm():
         return None
 
 def gerar_dicionario_ncm(df_ncm):
-    """Gera arquivo Python com dicionário de NCMs"""
-    print("\nGerando dicionário Python...")
-    
-    # Lê NCMs únicos do nosso export
-    ncms_file = Path(__file__).parent / 'ncms_unicos.txt'
-    with open(ncms_file, 'r') as f:
-        ncms_usados = set(line.strip() for line in f)
-    
-    print(f"NCMs nos nossos dados: {len(ncms_usados)}")
-    print(f"NCMs na tabela oficial: {len(df_ncm)}")
-    
-    # Cria dicionário
-    ncm_dict = {}
+    """Gera a tabela binária de NCMs (só os NCMs de ncms_unicos.txt, quando existir)"""
+    print("\nGerando tabela binária...")
     
     # Remove aspas da coluna NCM se existir
-    df_ncm['CO_NCM'] = df_ncm['CO_NCM'].astype(str).str.replace('"', '').str.zfill(8)
-    df_ncm['NO_NCM_POR'] = df_ncm['NO_NCM_POR'].astype(str).str.replace('"', '')
+    codigos = df_ncm['CO_NCM'].astype(str).str.replace('"', '').str.zfill(8)
+    descricoes = df_ncm['NO_NCM_POR'].astype(str).str.replace('"', '')
+    # Remove quebras de linha e caracteres de controle das descrições
+    descricoes = descricoes.str.replace(r'[\x00-\x1f]', ' ', regex=True).str.strip()
+    ncm_dict = dict(zip(codigos, descricoes))
+    print(f"NCMs na tabela oficial: {len(ncm_dict)}")
     
-    for _, row in df_ncm.iterrows():
-        ncm = str(row['CO_NCM']).zfill(8)
-        descricao = row['NO_NCM_POR']
-        
-        # Só adiciona se estiver nos nossos dados
-        if ncm in ncms_usados:
-            # Limpa descrição
-            descricao = descricao.strip()
-            descricao = descricao.replace("'", "\\'")  # Escapa aspas simples
-            ncm_dict[ncm] = descricao
+    # Lê NCMs únicos do nosso export
+    ncms_file = Path(__file__).parent / 'ncms_unicos.txt'
+    if ncms_file.exists():
+        with open(ncms_file, 'r') as f:
+            ncms_usados = set(line.strip() for line in f)
+        print(f"NCMs nos nossos dados: {len(ncms_usados)}")
+        ncm_dict = {ncm: desc for ncm, desc in ncm_dict.items() if ncm in ncms_usados}
     
     print(f"NCMs mapeados: {len(ncm_dict)}")
     
-    # Gera arquivo Python
-    output_file = Path(__file__).parent / 'services' / 'ncm_completo.py'
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('"""\n')
-        f.write('Dicionário completo de NCMs gerado automaticamente\n')
-        f.write('Fonte: Tabela NCM-SH do Ministério da Economia\n')
-        f.write(f'Total de {len(ncm_dict)} NCMs\n')
-        f.write('"""\n\n')
-        f.write('NCM_COMPLETO = {\n')
-        
-        for ncm in sorted(ncm_dict.keys()):
-            desc = ncm_dict[ncm]
-            f.write(f"    '{ncm}': '{desc}',\n")
-        
-        f.write('}\n')
+    # Gera tabela binária (códigos ordenados + offsets + blob UTF-8)
+    output = escrever_tabela(DATA_DIR / 'ncm.tbl', ncm_dict)
     
-    print(f"\n✓ Dicionário salvo em: {output_file}")
+    print(f"\n✓ Tabela salva em: {output}")
     print(f"✓ Total de {len(ncm_dict)} NCMs mapeados")
     
     return ncm_dict
@@ -84,7 +67,7 @@ if __name__ == "__main__":
     df = baixar_tabela_ncm()
     
     if df is not None:
-        # Gera dicionário
+        # Gera tabela
         ncm_dict = gerar_dicionario_ncm(df)
         
         # Mostra alguns exemplos
@@ -94,4 +77,4 @@ if __name__ == "__main__":
         
         print("\n✓ Concluído!")
     else:
-        print("\n✗ Falha ao gerar dicionário")
+        print("\n✗ Falha ao gerar tabela")
@@ -2,10 +2,25 @@
 Extrai NCMs e descrições direto dos CSVs do ComexStat
 Os CSVs NÃO têm as descrições, apenas códigos
 Vou usar a tabela SH6 do governo como base
+
+Gera as tabelas binárias services/data/{ncm,paises,vias}.tbl
+(lidas via mmap por services/codigos_comexstat.py)
 """
+import sys
 import pandas as pd
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.codigos_comexstat import DATA_DIR, PAISES, VIAS_TRANSPORTE
+from services.tabela_binaria import escrever_tabela
+
+def gerar_tabelas_codigos():
+    """Gera as tabelas binárias de países e vias de transporte"""
+    for nome, mapping in (('paises', PAISES), ('vias', VIAS_TRANSPORTE)):
+        output = escrever_tabela(DATA_DIR / f'{nome}.tbl', mapping)
+        print(f"✓ {len(mapping)} códigos salvos em: {output}")
+
 def gerar_dicionario_sh6():
     """Gera dicionário usando tabela SH6"""
     print("Carregando tabela SH6...")
@@ -39,17 +54,13 @@ def gerar_dicionario_sh6():
     
     print(f"NCMs mapeados: {len(ncm_dict)}")
     
-    # Gera arquivo Python
-    output = Path('services') / 'ncm_completo.py'
-    with open(output, 'w', encoding='utf-8') as f:
-        f.write('"""\nDicionário de NCMs - Gerado automaticamente\n"""\n\n')
-        f.write('NCM_COMPLETO = {\n')
-        for ncm in sorted(ncm_dict.keys()):
-            desc = ncm_dict[ncm].replace("'", "\\'").replace('"', '\\"').replace('\n', ' ').replace('\\', ' ')
-            # Remove qualquer caracter de controle
-            desc = ''.join(char for char in desc if ord(char) >= 32 or char == ' ')
-            f.write(f"    '{ncm}': '{desc}',\n")
-        f.write('}\n')
+    # Remove quebras de linha e caracteres de controle das descrições
+    for ncm, desc in ncm_dict.items():
+        desc = desc.replace('\n', ' ')
+        ncm_dict[ncm] = ''.join(char for char in desc if ord(char) >= 32)
+    
+    # Gera tabela binária (códigos ordenados + offsets + blob UTF-8)
+    output = escrever_tabela(DATA_DIR / 'ncm.tbl', ncm_dict)
     
     print(f"✓ Salvo em: {output}")
     
@@ -60,3 +71,4 @@ def gerar_dicionario_sh6():
 
 if __name__ == "__main__":
     gerar_dicionario_sh6()
+    gerar_tabelas_codigos()
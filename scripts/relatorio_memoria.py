@@ -0,0 +1,55 @@
+"""
+Relatório de memória por ano: leitura antiga (tipos inferidos + remoção de
+aspas via astype(str)) versus leitura com o esquema declarado (EXPORT_SCHEMA)
+"""
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.api_service import ComexStatAPI
+
+def _mb(df):
+    return df.memory_usage(index=True, deep=True).sum() / 1024 / 1024
+
+def leitura_antiga(csv_file):
+    """Reproduz a leitura anterior de fetch_export_data"""
+    df = pd.read_csv(csv_file, sep=';', encoding='latin1', on_bad_lines='skip', low_memory=False)
+    df.columns = df.columns.str.replace('"', '')
+    for col in df.columns:
+        if df[col].dtype == 'object':
+            df[col] = df[col].astype(str).str.replace('"', '')
+    return df
+
+def relatorio_memoria():
+    api = ComexStatAPI()
+    csv_files = sorted(api.datasets_dir.glob('EXP_*.csv'))
+
+    if not csv_files:
+        print("Nenhum arquivo EXP_*.csv encontrado.")
+        return
+
+    print(f"{'Arquivo':<14}{'CSV (MB)':>10}{'Antes (MB)':>12}{'Depois (MB)':>13}{'Redução':>10}{'t antes':>10}{'t depois':>10}")
+    print("-" * 79)
+    for csv_file in csv_files:
+        inicio = time.perf_counter()
+        antes = leitura_antiga(csv_file)
+        t_antes = time.perf_counter() - inicio
+        mb_antes = _mb(antes)
+        del antes
+
+        inicio = time.perf_counter()
+        depois = api._read_csv(csv_file)
+        t_depois = time.perf_counter() - inicio
+        mb_depois = _mb(depois)
+        del depois
+
+        tamanho = csv_file.stat().st_size / 1024 / 1024
+        print(f"{csv_file.name:<14}{tamanho:>10.1f}{mb_antes:>12.1f}{mb_depois:>13.1f}"
+              f"{mb_antes / mb_depois:>9.1f}x{t_antes:>9.2f}s{t_depois:>9.2f}s")
+
+if __name__ == "__main__":
+    relatorio_memoria()
@@ -0,0 +1,96 @@
+"""
+Redução de séries longas para os gráficos com LTTB (Largest-Triangle-Three-
+Buckets, Steinarsson 2013): mantém o primeiro e o último ponto e, em cada
+balde intermediário, o ponto que forma o maior triângulo com o ponto já
+escolhido no balde anterior e a média do balde seguinte. Preserva picos e
+vales, ao contrário de médias ou amostragem a cada k pontos.
+"""
+import numpy as np
+
+# Baldes até esta largura: escolhas pré-calculadas para cada ponto possível do
+# balde anterior (custo n * largura); acima dela, um balde por vez
+_LARGURA_MATRIZ = 16
+
+# Elementos por bloco da matriz de escolhas (limita a memória temporária)
+_BLOCO_MATRIZ = 1 << 20
+
+
+def lttb_indices(y, n_pontos: int, x=None) -> np.ndarray:
+    """
+    Índices (crescentes) dos n_pontos escolhidos de y. Sem x, os pontos são
+    considerados igualmente espaçados (períodos consecutivos). Séries que já
+    cabem em n_pontos voltam inteiras. Trechos sem valor (NaN) ficam de fora
+    da redução, mas o início de cada um é mantido para a lacuna continuar
+    visível no gráfico.
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_pontos >= n or n_pontos < 3:
+        return np.arange(n)
+    x = np.arange(n, dtype=float) if x is None else np.asarray(x, dtype=float)
+
+    finitos = np.isfinite(y)
+    if finitos.all():
+        return _lttb(x, y, n_pontos)
+    posicoes = np.flatnonzero(finitos)
+    lacunas = np.flatnonzero(~finitos & np.append(True, finitos[:-1]))
+    if len(posicoes) <= n_pontos:
+        escolhidos = posicoes
+    else:
+        escolhidos = posicoes[_lttb(x[posicoes], y[posicoes], n_pontos)]
+    return np.union1d(escolhidos, lacunas)
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, n_pontos: int) -> np.ndarray:
+    n = len(y)
+    # n_pontos - 2 baldes entre o primeiro e o último ponto, em matriz com
+    # preenchimento (baldes de tamanhos que diferem em no máximo 1)
+    limites = np.linspace(1, n - 1, n_pontos - 1).astype(np.int64)
+    inicio, fim = limites[:-1], limites[1:]
+    largura = int((fim - inicio).max())
+    indices = inicio[:, None] + np.arange(largura)
+    validos = indices < fim[:, None]
+    indices = np.minimum(indices, n - 1)
+    bx, by = x[indices], y[indices]
+
+    # Média do balde seguinte (o último usa o ponto final)
+    contagem = validos.sum(axis=1)
+    cx = np.append(np.where(validos, bx, 0).sum(axis=1)[1:] / contagem[1:], x[-1])
+    cy = np.append(np.where(validos, by, 0).sum(axis=1)[1:] / contagem[1:], y[-1])
+
+    # Área (dobrada) do triângulo A-B-C como função linear de A:
+    # |ax * (by - cy) + ay * (cx - bx) + (bx * cy - cx * by)|
+    coef_x = np.where(validos, by - cy[:, None], 0.0)
+    coef_y = np.where(validos, cx[:, None] - bx, 0.0)
+    termo = np.where(validos, bx * cy[:, None] - cx[:, None] * by, 0.0)
+    penalidade = np.where(validos, 0.0, np.inf)
+
+    escolhidos = np.empty(n_pontos, dtype=np.int64)
+    escolhidos[0], escolhidos[-1] = 0, n - 1
+    if largura <= _LARGURA_MATRIZ:
+        # Candidatos a A de cada balde: os pontos do balde anterior (o primeiro
+        # balde só tem o ponto inicial, na coluna 0)
+        ax = np.vstack([np.full(largura, x[0]), bx[:-1]])
+        ay = np.vstack([np.full(largura, y[0]), by[:-1]])
+        escolha = np.empty((len(inicio), largura), dtype=np.int64)
+        passo = max(1, _BLOCO_MATRIZ // (largura * largura))
+        for b in range(0, len(inicio), passo):
+            s = slice(b, b + passo)
+            area = np.abs(coef_x[s, None, :] * ax[s, :, None] + coef_y[s, None, :] * ay[s, :, None]
+                          + termo[s, None, :]) - penalidade[s, None, :]
+            escolha[s] = area.argmax(axis=2)
+        # Só resta seguir as escolhas a partir do ponto inicial
+        caminho, j = [], 0
+        for linha in escolha.tolist():
+            j = linha[j]
+            caminho.append(j)
+        escolhidos[1:-1] = indices[np.arange(len(inicio)), caminho]
+        return escolhidos
+
+    # Baldes largos: só a escolha de A é sequencial, a área do balde sai numa operação
+    ax, ay = x[0], y[0]
+    for b in range(len(inicio)):
+        j = int((np.abs(coef_x[b] * ax + coef_y[b] * ay + termo[b]) - penalidade[b]).argmax())
+        escolhidos[b + 1] = indices[b, j]
+        ax, ay = bx[b, j], by[b, j]
+    return escolhidos
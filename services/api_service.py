@@ -1,9 +1,119 @@
+import os
+import multiprocessing
 import requests
+import numpy as np
 import pandas as pd
-from typing import Optional
+from typing import Dict, Iterator, List, Optional
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+from .cache import DataFrameCache
+from .columnar_store import ColumnarStore, MANIFEST, ds, pa, pc
+from .cubo import ExportCube
+from .dataset_registry import DatasetRegistry
+
+# Cache de anos completos e partições mensais compartilhado por todas as instâncias do processo;
+# no STREAMING_MODE (workers com pouca memória) o orçamento é limitado a STREAMING_CACHE_MAX_MB
+_CACHE_MAX_MB = int(os.getenv('DATAFRAME_CACHE_MAX_MB', '2048'))
+if os.getenv('STREAMING_MODE', '0') == '1':
+    _CACHE_MAX_MB = min(_CACHE_MAX_MB, int(os.getenv('STREAMING_CACHE_MAX_MB', '256')))
+_FRAME_CACHE = DataFrameCache(max_bytes=_CACHE_MAX_MB * 1024 * 1024)
+
+# Linhas por bloco na leitura em streaming (STREAMING_MODE=1)
+CSV_CHUNK_ROWS = int(os.getenv('CSV_CHUNK_ROWS', '250000'))
+
+# Linhas de origem por bloco na exportação em fluxo (/api/export-stream)
+EXPORT_BLOCK_ROWS = int(os.getenv('EXPORT_BLOCK_ROWS', '50000'))
+
+# Workers do carregamento paralelo de vários anos/meses
+LOADER_WORKERS = int(os.getenv('LOADER_WORKERS', str(min(os.cpu_count() or 1, 8))))
+
+# Pool de processos para o parse dos CSVs, criado sob demanda e reaproveitado
+_PROCESS_POOL = None
+
+# Layout dos arquivos EXP_*.csv do ComexStat com tipos compactos
+EXPORT_SCHEMA = {
+    'CO_ANO': 'uint16',
+    'CO_MES': 'uint8',
+    'CO_NCM': 'uint32',
+    'CO_UNID': 'uint8',
+    'CO_PAIS': 'uint16',
+    'SG_UF_NCM': 'category',
+    'CO_VIA': 'uint8',
+    'CO_URF': 'uint32',
+    'QT_ESTAT': 'int64',
+    'KG_LIQUIDO': 'int64',
+    'VL_FOB': 'int64'
+}
+
+# Padronização dos nomes de colunas
+COLUMN_MAPPING = {
+    'CO_ANO': 'ano',
+    'CO_MES': 'mes',
+    'CO_NCM': 'ncm',
+    'NO_NCM_POR': 'descricao_ncm',
+    'CO_PAIS': 'cod_pais',
+    'NO_PAIS': 'pais',
+    'CO_VIA': 'cod_via',
+    'NO_VIA': 'via',
+    'SG_UF_NCM': 'uf',
+    'VL_FOB': 'valor_fob',
+    'KG_LIQUIDO': 'peso_kg',
+    'QT_ESTAT': 'quantidade'
+}
+
+# Colunas de nomes legíveis e o código de onde são derivadas
+LABEL_SOURCES = {
+    'pais': 'cod_pais',
+    'via': 'cod_via',
+    'descricao_ncm': 'ncm'
+}
+
+# Tipos compactos das colunas de código após a normalização
+CODE_DTYPES = {
+    'ano': 'uint16',
+    'mes': 'uint8',
+    'ncm': 'uint32',
+    'CO_UNID': 'uint8',
+    'cod_pais': 'uint16',
+    'cod_via': 'uint8',
+    'CO_URF': 'uint32',
+    'uf': 'category'
+}
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _PROCESS_POOL
+    if _PROCESS_POOL is None:
+        # spawn: processos limpos, seguros mesmo com o servidor rodando threads
+        _PROCESS_POOL = ProcessPoolExecutor(max_workers=LOADER_WORKERS,
+                                            mp_context=multiprocessing.get_context('spawn'))
+    return _PROCESS_POOL
+
+def shutdown_process_pool():
+    """Encerra o pool de processos (ex.: no master do gunicorn, após o preload)"""
+    global _PROCESS_POOL
+    if _PROCESS_POOL is not None:
+        _PROCESS_POOL.shutdown()
+        _PROCESS_POOL = None
+
+def _reset_process_pool():
+    # Filho de fork (ex.: worker do gunicorn com preload_app) não herda o pool do pai
+    global _PROCESS_POOL
+    _PROCESS_POOL = None
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_process_pool)
+
+def _read_year_codes(local_file: Path, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+    """Lê e normaliza o CSV anual, ordenado por mês, sem rótulos (roda também no pool de processos)"""
+    api = ComexStatAPI()
+    df = api._normalize_raw_data(api._read_csv(local_file, usecols))
+    if 'mes' in df.columns:
+        # Ordenação estável mantém a ordem original dentro de cada mês
+        df = df.sort_values('mes', kind='stable')
+    return df
+
 class ComexStatAPI:
     """
     Serviço para integração com a API do ComexStat do MDIC.
@@ -13,38 +123,58 @@ class ComexStatAPI:
     def __init__(self):
         self.base_url = "https://balanca.economia.gov.br/balanca/bd/comexstat-bd"
         self.datasets_dir = Path(__file__).parent.parent / 'datasets'
+        self.store = ColumnarStore(os.getenv('COLUMNAR_DIR', self.datasets_dir / 'parquet'))
+        self.cube = ExportCube(os.getenv('CUBE_DIR', self.datasets_dir / 'cubo'), rotular=self._add_labels)
+        # Modo streaming: o CSV anual nunca é carregado inteiro (workers com pouca memória)
+        self.streaming = os.getenv('STREAMING_MODE', '0') == '1'
+        # Versão dos datasets: mudanças em um EXP_*.csv ou numa conversão Parquet
+        # (manifesto, base de source_token nos anos sem CSV) invalidam só os anos afetados
+        self.registry = DatasetRegistry(self.datasets_dir, outros=[(self.store.root, f'ano=*/{MANIFEST}')])
+        self.registry.add_listener(self.invalidate_years)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
     
-    def fetch_export_data(self, year: str, month: str) -> pd.DataFrame:
+    def fetch_export_data(self, year: str, month: str,
+                          columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Busca dados de exportação para um período específico.
-        Lê dos arquivos CSV ANUAIS baixados e filtra por mês.
+        Usa a partição Parquet do mês quando o ano já foi convertido;
+        caso contrário lê o CSV ANUAL (em cache) e filtra por mês.
+        No modo streaming o CSV é lido em blocos e só o mês fica em memória.
+        
+        Args:
+            columns: colunas normalizadas desejadas (ex.: ['pais']); quando
+                informado, apenas as colunas de origem necessárias são lidas
         """
-        # Verifica se existe arquivo ANUAL local
+        year = str(year)
+        month_int = int(month)
         local_file = self.datasets_dir / f"EXP_{year}.csv"
         
+        if self.store.has_partition(year, month_int, local_file):
+            try:
+                return self._project(self._load_partition(year, month_int, columns), columns)
+            except Exception as e:
+                print(f"Erro ao ler Parquet, usando CSV: {e}")
+        
+        if self.streaming and local_file.exists():
+            try:
+                return self._project(self._load_month_stream(year, month_int, local_file), columns)
+            except Exception as e:
+                print(f"Erro na leitura em blocos: {e}")
+        
+        # Verifica se existe arquivo ANUAL local
         if local_file.exists():
-            print(f"Lendo arquivo anual: {local_file.name}")
             try:
-                # Lê CSV com separador ponto e vírgula
-                df = pd.read_csv(local_file, sep=';', encoding='latin1', on_bad_lines='skip', low_memory=False)
-                
-                # Remove aspas dos valores se existirem
-                df.columns = df.columns.str.replace('"', '')
-                for col in df.columns:
-                    if df[col].dtype == 'object':
-                        df[col] = df[col].astype(str).str.replace('"', '')
+                df = self._load_year(year, local_file, columns)
                 
                 # Filtra pelo mês solicitado
-                if 'CO_MES' in df.columns:
-                    month_int = int(month)
-                    df = df[df['CO_MES'].astype(int) == month_int]
+                if 'mes' in df.columns:
+                    df = self._slice_month(df, month_int)
                     print(f"  Filtrado para mês {month}: {len(df)} registros")
                 
-                return self._process_raw_data(df)
+                return self._project(df, columns)
             except Exception as e:
                 print(f"Erro ao ler CSV: {e}")
                 import traceback
@@ -54,37 +184,508 @@ class ComexStatAPI:
         print(f"Arquivo {local_file.name} não encontrado. Usando dados de exemplo...")
         return self._generate_sample_data()
     
-    def _process_raw_data(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Processa dados brutos da API"""
-        from .codigos_comexstat import get_pais_nome, get_via_transporte, get_ncm_descricao
+    def build_columnar_store(self, year: str) -> list:
+        """Converte EXP_{year}.csv em partições Parquet tipadas (uma por mês)"""
+        year = str(year)
+        local_file = self.datasets_dir / f"EXP_{year}.csv"
+        df = self._normalize_raw_data(self._read_csv(local_file))
+        written = self.store.write_year(year, df, local_file)
+        # Materializa o cubo na mesma passada de ingestão
+        rollups = self.cube.build(df)
+        if rollups is not None:
+            self.cube.write_rollups(year, rollups, local_file)
+        return written
+    
+    def dataset_version(self) -> tuple:
+        """
+        Versão atual dos datasets (verificada por stat) e data da última
+        modificação; anos alterados já foram invalidados quando retorna.
+        """
+        return self.registry.check(), self.registry.last_modified
+    
+    def invalidate_years(self, years):
+        """Descarta anos/meses em cache e cubos em memória dos anos informados"""
+        _FRAME_CACHE.invalidate(lambda key: len(key) > 1 and key[1] in years)
+        self.cube.invalidate(years)
+    
+    @staticmethod
+    def metrics() -> dict:
+        """Estatísticas do cache de DataFrames e da coalescência de cargas"""
+        return _FRAME_CACHE.stats()
+    
+    def iter_csv_chunks(self, year: str, months: Optional[List[str]] = None,
+                        filters: Optional[Dict] = None,
+                        chunksize: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Lê o CSV anual em blocos de `chunksize` linhas, já normalizados e filtrados
+        por mês e pelos predicados (mesmas chaves de DataProcessor.apply_filters:
+        ncm, pais, uf, via), de modo que o pico de memória não depende do arquivo.
+        """
+        local_file = self.datasets_dir / f"EXP_{year}.csv"
+        chunksize = chunksize or CSV_CHUNK_ROWS
+        meses = None if months is None else [int(m) for m in months]
         
-        # Padroniza nomes de colunas
-        column_mapping = {
-            'CO_ANO': 'ano',
-            'CO_MES': 'mes',
-            'CO_NCM': 'ncm',
-            'NO_NCM_POR': 'descricao_ncm',
-            'CO_PAIS': 'cod_pais',
-            'NO_PAIS': 'pais',
-            'CO_VIA': 'cod_via',
-            'NO_VIA': 'via',
-            'SG_UF_NCM': 'uf',
-            'VL_FOB': 'valor_fob',
-            'KG_LIQUIDO': 'peso_kg',
-            'QT_ESTAT': 'quantidade'
-        }
+        for chunk in self._csv_reader(local_file, chunksize):
+            # Filtra o mês ainda nos códigos brutos, antes de qualquer conversão
+            if meses is not None and 'CO_MES' in chunk.columns:
+                chunk = chunk[pd.to_numeric(chunk['CO_MES'], errors='coerce').isin(meses)]
+            if chunk.empty:
+                continue
+            chunk = self._filter_chunk(self._process_raw_data(chunk), filters)
+            if not chunk.empty:
+                yield chunk
+    
+    def _csv_reader(self, local_file: Path, chunksize: int):
+        """Blocos brutos do CSV anual com EXPORT_SCHEMA"""
+        print(f"Lendo em blocos: {local_file.name} ({chunksize:,} linhas)")
+        try:
+            return pd.read_csv(local_file, sep=';', encoding='latin1', quotechar='"',
+                               on_bad_lines='skip', usecols=list(EXPORT_SCHEMA),
+                               dtype=EXPORT_SCHEMA, chunksize=chunksize)
+        except ValueError as e:
+            # Layout diferente do esperado: leitura tolerante, sem blocos
+            print(f"  Layout inesperado ({e}); lendo sem blocos")
+            return [self._read_csv(local_file)]
+    
+    def source_token(self, year: str) -> Optional[tuple]:
+        """
+        Versão (mtime, tamanho) do CSV do ano, base de partições, cache e
+        cursores; anos só com partições Parquet usam o manifesto da conversão
+        """
+        for arquivo in (self.datasets_dir / f"EXP_{year}.csv", self.store.year_dir(year) / MANIFEST):
+            try:
+                stat = arquivo.stat()
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            return (stat.st_mtime_ns, stat.st_size)
+        return None
+    
+    def iter_export(self, years: List[str], months: List[str], criterios: Optional[Dict] = None,
+                    start: tuple = (0, 0), chunksize: Optional[int] = None) -> Iterator[tuple]:
+        """
+        Linhas brutas dos períodos (ano, mês), na ordem, lidas em blocos de até
+        `chunksize` linhas de origem e filtradas pelos códigos antes de ganharem
+        rótulos. `criterios` vem de export_criteria (mesmas chaves de
+        DataProcessor.apply_filters), montado antes para que filtros inválidos
+        falhem antes da resposta. A memória depende do bloco, não do total.
         
-        df = df.rename(columns=column_mapping)
+        Cada item é (índice do período, posições de origem das linhas, posição
+        de origem após o bloco, bloco filtrado); as posições são estáveis para a
+        mesma versão do CSV e servem de cursor (`start` = (período, posição)).
+        Anos sem CSV local nem partições Parquet não têm linhas (sem dados de exemplo).
+        """
+        chunksize = chunksize or EXPORT_BLOCK_ROWS
+        criterios = criterios or self.export_criteria(None)
+        periodos = [(str(year), int(month)) for year in years for month in months]
+        primeiro, posicao = start
+        for indice in range(primeiro, len(periodos)):
+            year, month = periodos[indice]
+            inicio_mes = posicao if indice == primeiro else 0
+            for inicio, bloco in self._export_blocks(year, month, inicio_mes, chunksize):
+                fim = inicio + len(bloco)
+                mascara = self._export_mask(bloco, criterios)
+                if mascara.any():
+                    posicoes = np.arange(inicio, fim)[mascara]
+                    yield indice, posicoes, fim, self._add_labels(bloco[mascara].reset_index(drop=True))
+    
+    def _export_blocks(self, year: str, month: int, start: int, chunksize: int) -> Iterator[tuple]:
+        """(posição, bloco normalizado) do mês: partição Parquet, CSV em blocos ou ano em cache"""
+        local_file = self.datasets_dir / f"EXP_{year}.csv"
+        # Partição atual vale mesmo sem o CSV de origem, como em fetch_export_data
+        if self.store.has_partition(year, month, local_file):
+            yield from self.store.iter_month(year, month, start, chunksize)
+        elif not local_file.exists():
+            return
+        elif self.streaming:
+            # Mesma ordem do ano em cache: linhas do mês na ordem do arquivo
+            posicao = 0
+            for chunk in self._csv_reader(local_file, chunksize):
+                if 'CO_MES' in chunk.columns:
+                    chunk = chunk[pd.to_numeric(chunk['CO_MES'], errors='coerce') == month]
+                chunk = self._normalize_raw_data(chunk)
+                fim = posicao + len(chunk)
+                if fim > start:
+                    yield max(posicao, start), chunk.iloc[max(0, start - posicao):]
+                posicao = fim
+        else:
+            df = self._slice_month(self._load_year(year, local_file), month)
+            for inicio in range(start, len(df), chunksize):
+                yield inicio, df.iloc[inicio:inicio + chunksize]
+    
+    @staticmethod
+    def export_criteria(filters: Optional[Dict]) -> Dict:
+        """
+        Filtros por nome traduzidos para os códigos das colunas brutas.
+        NCM que não é código numérico levanta ValueError.
+        """
+        from .codigos_comexstat import get_paises_codigos, get_vias_codigos
         
-        # Mapeia códigos para nomes legíveis
-        if 'cod_pais' in df.columns and 'pais' not in df.columns:
-            df['pais'] = df['cod_pais'].apply(lambda x: get_pais_nome(str(x)))
+        filters = filters or {}
+        valores = {}
+        if filters.get('ncm'):
+            valores['ncm'] = [int(v) for v in filters['ncm']]
+            if any(v < 0 for v in valores['ncm']):
+                raise ValueError('ncm deve ser um código numérico')
+        if filters.get('pais'):
+            valores['cod_pais'] = get_paises_codigos(filters['pais'])
+        if filters.get('uf'):
+            valores['uf'] = list(filters['uf'])
+        if filters.get('via'):
+            valores['cod_via'] = get_vias_codigos(filters['via'])
+        return {'valores': valores, 'min_fob': filters.get('min_fob'), 'max_fob': filters.get('max_fob')}
+    
+    @staticmethod
+    def _export_mask(df: pd.DataFrame, criterios: Dict) -> np.ndarray:
+        mascara = np.ones(len(df), dtype=bool)
+        for col, valores in criterios['valores'].items():
+            mascara &= df[col].isin(valores).to_numpy()
+        if criterios['min_fob'] is not None:
+            mascara &= df['valor_fob'].to_numpy() >= criterios['min_fob']
+        if criterios['max_fob'] is not None:
+            mascara &= df['valor_fob'].to_numpy() <= criterios['max_fob']
+        return mascara
+    
+    def iter_export_arrow(self, years: List[str], months: List[str], criterios: Optional[Dict] = None,
+                          expressao=None, chunksize: Optional[int] = None) -> Iterator:
+        """
+        As linhas de iter_export em lotes Arrow (RecordBatch), para downloads
+        em Arrow IPC ou Parquet. Partições Parquet são lidas direto em Arrow,
+        com o filtro `expressao` (de arrow_filter) avaliado pelo pyarrow.dataset,
+        sem passar por pandas; os demais períodos usam os blocos e a máscara de
+        iter_export com os mesmos `criterios`. Os rótulos saem como colunas de
+        dicionário (um nome por código distinto do lote).
+        """
+        chunksize = chunksize or EXPORT_BLOCK_ROWS
+        criterios = criterios or self.export_criteria(None)
+        for year in years:
+            year = str(year)
+            local_file = self.datasets_dir / f"EXP_{year}.csv"
+            for month in months:
+                month = int(month)
+                if self.store.has_partition(year, month, local_file):
+                    lotes = self.store.scan_month(year, month, expressao, batch_size=chunksize)
+                else:
+                    lotes = self._arrow_blocks(year, month, criterios, chunksize)
+                for lote in lotes:
+                    if lote.num_rows:
+                        yield self._add_labels_arrow(lote)
+    
+    def _arrow_blocks(self, year: str, month: int, criterios: Dict, chunksize: int) -> Iterator:
+        """Blocos filtrados de _export_blocks convertidos para Arrow (só colunas de código)"""
+        for _, bloco in self._export_blocks(year, month, 0, chunksize):
+            mascara = self._export_mask(bloco, criterios)
+            if mascara.any():
+                colunas = [col for col in bloco.columns if col not in LABEL_SOURCES]
+                yield pa.RecordBatch.from_pandas(bloco.loc[mascara, colunas], preserve_index=False)
+    
+    @staticmethod
+    def arrow_filter(criterios: Dict):
+        """Critérios de export_criteria como expressão do pyarrow.dataset (None = sem filtro)"""
+        termos = [ds.field(col).isin(valores) for col, valores in criterios['valores'].items()]
+        if criterios['min_fob'] is not None:
+            termos.append(ds.field('valor_fob') >= criterios['min_fob'])
+        if criterios['max_fob'] is not None:
+            termos.append(ds.field('valor_fob') <= criterios['max_fob'])
+        expressao = None
+        for termo in termos:
+            expressao = termo if expressao is None else expressao & termo
+        return expressao
+    
+    @staticmethod
+    def _add_labels_arrow(lote):
+        """Versão de _add_labels para RecordBatch: rótulos como DictionaryArray"""
+        from .codigos_comexstat import traduzir_codigos
         
-        if 'cod_via' in df.columns and 'via' not in df.columns:
-            df['via'] = df['cod_via'].apply(lambda x: get_via_transporte(str(x)))
+        for rotulo, origem in LABEL_SOURCES.items():
+            if origem in lote.schema.names and rotulo not in lote.schema.names:
+                codigos = lote.column(origem)
+                unicos = pc.unique(codigos)
+                # Códigos distintos podem ter o mesmo nome: o dicionário guarda cada nome uma vez
+                posicoes, nomes = pd.factorize(np.array(traduzir_codigos(rotulo, unicos.to_pylist()), dtype=object))
+                indices = pc.take(pa.array(posicoes, pa.int32()), pc.index_in(codigos, value_set=unicos))
+                lote = lote.append_column(rotulo, pa.DictionaryArray.from_arrays(indices, pa.array(nomes, pa.string())))
+        return lote
+    
+    @staticmethod
+    def _filter_chunk(df: pd.DataFrame, filters: Optional[Dict]) -> pd.DataFrame:
+        """Predicados empurrados para a leitura (valores aceitos por coluna)"""
+        for col in ['ncm', 'pais', 'uf', 'via']:
+            valores = (filters or {}).get(col)
+            if not valores or col not in df.columns:
+                continue
+            if col == 'ncm':
+                valores = [int(v) for v in valores]
+            df = df[df[col].isin(valores)]
+        return df
+    
+    def _load_month_stream(self, year: str, month: int, local_file: Path) -> pd.DataFrame:
+        """Mês montado a partir dos blocos do CSV, com cache apenas do mês"""
+        return self._load_months_stream(year, [month], local_file)[month]
+    
+    def _load_months_stream(self, year: str, months: List[int], local_file: Path) -> Dict[int, pd.DataFrame]:
+        """
+        Meses do ano montados numa única passada pelos blocos do CSV (cache por
+        mês): pedir vários meses não relê o arquivo uma vez para cada um
+        """
+        stat = local_file.stat()
+        token = (stat.st_mtime_ns, stat.st_size)
+        meses = {}
+        for month in months:
+            df = _FRAME_CACHE.get(('mes', year, month, 'csv'), token)
+            if df is not None:
+                meses[month] = df
+        faltando = [month for month in months if month not in meses]
+        if not faltando:
+            return meses
         
-        if 'ncm' in df.columns and 'descricao_ncm' not in df.columns:
-            df['descricao_ncm'] = df['ncm'].apply(lambda x: get_ncm_descricao(str(x)))
+        def carregar():
+            partes = {month: [] for month in faltando}
+            for chunk in self.iter_csv_chunks(year, faltando):
+                if 'mes' not in chunk.columns:
+                    # Layout sem mês: o bloco vale para todos os meses pedidos
+                    for month in faltando:
+                        partes[month].append(chunk)
+                    continue
+                for month, parte in chunk.groupby('mes', sort=False):
+                    partes[int(month)].append(parte)
+            return {month: _FRAME_CACHE.put(('mes', year, month, 'csv'), self.concat_frames(partes[month]), token)
+                    for month in faltando}
+        
+        meses.update(_FRAME_CACHE.flight.do(('meses', year, tuple(faltando), token), carregar))
+        return meses
+    
+    def fetch_rollups(self, years: List[str], months: List[str],
+                      nomes: List[str]) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Roll-ups pré-agregados do cubo para os períodos pedidos.
+        Retorna None quando algum ano não tem CSV local (o chamador usa as linhas brutas).
+        """
+        months_int = [int(m) for m in months]
+        frames = {nome: [] for nome in nomes}
+        
+        # Anos sem cubo atualizado: lê os CSVs em paralelo antes de materializar
+        if not self.streaming:
+            sem_cubo = [str(y) for y in years
+                        if (self.datasets_dir / f"EXP_{y}.csv").exists()
+                        and not self.cube.is_current(str(y), self.datasets_dir / f"EXP_{y}.csv")]
+            if len(sem_cubo) > 1:
+                self._parse_years(sem_cubo)
+
+        for year in years:
+            rollups = self._cube_year(str(year))
+            if rollups is None:
+                return None
+            for nome in nomes:
+                df = rollups[nome]
+                frames[nome].append(df[df['mes'].isin(months_int)])
+        return {nome: self.concat_frames(dfs) for nome, dfs in frames.items()}
+    
+    def load_cube(self):
+        """Carrega em memória os cubos já materializados (chamado na inicialização)"""
+        for csv_file in sorted(self.datasets_dir.glob('EXP_*.csv')):
+            year = csv_file.stem.split('_')[1]
+            if self.cube.is_current(year, csv_file):
+                self._cube_year(year)
+    
+    def _cube_year(self, year: str) -> Optional[Dict[str, pd.DataFrame]]:
+        local_file = self.datasets_dir / f"EXP_{year}.csv"
+        if not local_file.exists():
+            return None
+        try:
+            if self.streaming:
+                builder = lambda: self.cube.build_chunks(self.iter_csv_chunks(year))
+            else:
+                builder = lambda: self.cube.build(self._load_year(year, local_file))
+            return self.cube.get_year(year, local_file, builder)
+        except Exception as e:
+            print(f"Erro no cubo de {year}, usando dados brutos: {e}")
+            return None
+    
+    def _load_partition(self, year: str, month: int,
+                        columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Lê somente a partição Parquet do mês, com cache em memória"""
+        token = self.store.partition_token(year, month)
+        key = ('mes', year, month)
+        read_columns = None
+        if columns is not None and not _FRAME_CACHE.contains(key, token):
+            # Projeção: lê da partição apenas as colunas de origem necessárias
+            read_columns = sorted(self._source_columns(columns))
+            key = key + (tuple(read_columns),)
+        
+        def loader():
+            print(f"Lendo partição: ano={year} mes={month:02d}")
+            return self._add_labels(self.store.read_month(year, month, columns=read_columns))
+        
+        return _FRAME_CACHE.get_or_load(key, loader, token)
+    
+    def _load_year(self, year: str, local_file: Path,
+                   columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Retorna o ano processado, lendo o CSV apenas se não estiver em cache"""
+        key, usecols, token = self._year_key(year, local_file, columns)
+        return _FRAME_CACHE.get_or_load(key, lambda: self._read_year_csv(local_file, usecols), token)
+    
+    def _year_key(self, year: str, local_file: Path, columns: Optional[List[str]] = None) -> tuple:
+        """Chave de cache, colunas do CSV a ler e token de validação de um ano"""
+        stat = local_file.stat()
+        token = (stat.st_mtime_ns, stat.st_size)
+        key = ('ano', year)
+        usecols = None
+        if columns is not None and not _FRAME_CACHE.contains(key, token):
+            # Projeção: lê do CSV apenas as colunas de origem necessárias
+            needed = self._source_columns(columns)
+            usecols = [raw for raw, name in COLUMN_MAPPING.items() if name in needed]
+            key = key + (tuple(sorted(needed)),)
+        return key, usecols, token
+    
+    def load_periods(self, years: List[str], months: List[str],
+                     columns: Optional[List[str]] = None,
+                     workers: Optional[int] = None) -> pd.DataFrame:
+        """
+        Carrega vários anos/meses em paralelo e concatena na ordem (ano, mês) pedida.
+        
+        Anos com CSV ainda não lido são processados em um pool de processos
+        (o parse do CSV é limitado pelo GIL); depois os meses são montados em
+        um pool de threads, que basta para as partições Parquet (o pyarrow
+        libera o GIL) e para fatias do cache.
+        
+        Args:
+            workers: quantidade de workers (padrão: LOADER_WORKERS)
+        """
+        workers = workers or LOADER_WORKERS
+        years = [str(y) for y in years]
+        # Em streaming, sem pools (não multiplica o pico): uma leitura em blocos por ano
+        if self.streaming:
+            return self.concat_frames([df for year in years for df in self._stream_periods(year, months, columns)])
+        self._parse_years(years, columns, workers)
+        
+        # Meses: cache, partições Parquet ou dados de exemplo, em ordem determinística
+        periodos = [(year, month) for year in years for month in months]
+        buscar = lambda periodo: self.fetch_export_data(periodo[0], periodo[1], columns)
+        if workers > 1 and len(periodos) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                frames = list(executor.map(buscar, periodos))
+        else:
+            frames = [buscar(periodo) for periodo in periodos]
+        return self.concat_frames(frames)
+    
+    def _stream_periods(self, year: str, months: List[str], columns: Optional[List[str]] = None) -> List[pd.DataFrame]:
+        """Meses do ano no STREAMING_MODE: os que vêm do CSV saem de uma só leitura em blocos"""
+        local_file = self.datasets_dir / f"EXP_{year}.csv"
+        do_csv = [int(m) for m in months
+                  if local_file.exists() and not self.store.has_partition(year, int(m), local_file)]
+        carregados = {}
+        if do_csv:
+            try:
+                carregados = self._load_months_stream(year, do_csv, local_file)
+            except Exception as e:
+                print(f"Erro na leitura em blocos: {e}")
+        return [self._project(carregados[int(month)], columns) if int(month) in carregados
+                else self.fetch_export_data(year, month, columns) for month in months]
+    
+    def preload_years(self, years: List[str]) -> List[str]:
+        """
+        Coloca em cache os anos informados (CSV anual ou partições Parquet)
+        sem montar DataFrames de resultado; retorna os anos com arquivo local.
+        No modo streaming nada é carregado: anos inteiros não ficam em memória.
+        """
+        years = [str(y) for y in years if (self.datasets_dir / f"EXP_{y}.csv").exists()]
+        if self.streaming:
+            return years
+        self._parse_years(years)
+        for year in years:
+            local_file = self.datasets_dir / f"EXP_{year}.csv"
+            for month in range(1, 13):
+                if self.store.has_partition(year, month, local_file):
+                    self._load_partition(year, month)
+        return years
+    
+    def _parse_years(self, years: List[str], columns: Optional[List[str]] = None,
+                     workers: Optional[int] = None):
+        """Coloca em cache os CSVs anuais ainda não lidos (nem convertidos para Parquet)"""
+        workers = workers or LOADER_WORKERS
+        pendentes = {}
+        for year in dict.fromkeys(years):
+            local_file = self.datasets_dir / f"EXP_{year}.csv"
+            if not local_file.exists() or self.store.is_current(year, local_file):
+                continue
+            key, usecols, token = self._year_key(year, local_file, columns)
+            if not _FRAME_CACHE.contains(key, token):
+                pendentes[year] = (local_file, key, usecols, token)
+        
+        if workers > 1 and len(pendentes) > 1:
+            pool = _get_process_pool()
+            futuros = {year: pool.submit(_read_year_codes, local_file, usecols)
+                       for year, (local_file, _, usecols, _) in pendentes.items()}
+            for year, futuro in futuros.items():
+                _, key, _, token = pendentes[year]
+                # Rótulos no processo principal: dicionários de categorias compartilhados
+                _FRAME_CACHE.put(key, self._add_labels(futuro.result()), token)
+        else:
+            # Um ano só (ou sem paralelismo): lê antes, para os meses não lerem o mesmo CSV em paralelo
+            for year, (local_file, _, _, _) in pendentes.items():
+                self._load_year(year, local_file, columns)
+    
+    @staticmethod
+    def _source_columns(columns: List[str]) -> set:
+        """Colunas normalizadas de origem necessárias para produzir as colunas pedidas"""
+        # mes e valor_fob são sempre necessários (fatia por mês e descarte de linhas inválidas)
+        needed = {'mes', 'valor_fob'}
+        for col in columns:
+            needed.add(LABEL_SOURCES.get(col, col))
+        return needed
+    
+    @staticmethod
+    def _project(df: pd.DataFrame, columns: Optional[List[str]]) -> pd.DataFrame:
+        if columns is None:
+            return df
+        return df[[col for col in columns if col in df.columns]]
+    
+    def _read_year_csv(self, local_file: Path, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+        """Lê o CSV anual e o ordena por mês para permitir fatias baratas"""
+        return self._add_labels(_read_year_codes(local_file, usecols))
+    
+    def _read_csv(self, local_file: Path, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Lê o CSV anual bruto do ComexStat usando EXPORT_SCHEMA.
+        As aspas são tratadas pelo parser (quotechar), sem cópias em texto.
+        """
+        print(f"Lendo arquivo anual: {local_file.name}")
+        schema = {col: dtype for col, dtype in EXPORT_SCHEMA.items()
+                  if usecols is None or col in usecols}
+        try:
+            # Lê CSV com separador ponto e vírgula
+            return pd.read_csv(local_file, sep=';', encoding='latin1', quotechar='"',
+                               on_bad_lines='skip', usecols=list(schema), dtype=schema)
+        except ValueError as e:
+            # Layout diferente do esperado: leitura tolerante sem esquema
+            print(f"  Layout inesperado ({e}); lendo sem esquema")
+        
+        df = pd.read_csv(local_file, sep=';', encoding='latin1', on_bad_lines='skip', low_memory=False)
+        
+        # Remove aspas dos valores se existirem
+        df.columns = df.columns.str.replace('"', '')
+        for col in df.columns:
+            if df[col].dtype == 'object':
+                df[col] = df[col].astype(str).str.replace('"', '')
+        if usecols is not None:
+            df = df[[col for col in usecols if col in df.columns]]
+        return df
+    
+    @staticmethod
+    def _slice_month(df: pd.DataFrame, month: int) -> pd.DataFrame:
+        """Fatia um ano ordenado por mês sem copiar os dados"""
+        meses = df['mes'].to_numpy()
+        start, end = np.searchsorted(meses, [month, month + 1])
+        return df.iloc[start:end]
+    
+    def _process_raw_data(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Processa dados brutos da API"""
+        return self._add_labels(self._normalize_raw_data(df))
+    
+    def _normalize_raw_data(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Padroniza nomes de colunas e tipos, sem traduzir códigos"""
+        # Padroniza nomes de colunas
+        df = df.rename(columns=COLUMN_MAPPING)
         
         # Converte tipos
         numeric_cols = ['valor_fob', 'peso_kg', 'quantidade']
@@ -95,8 +696,55 @@ class ComexStatAPI:
         # Remove linhas com valores inválidos
         df = df.dropna(subset=['valor_fob'])
         
+        # Códigos em inteiros pequenos / categóricos
+        for col, dtype in CODE_DTYPES.items():
+            if col not in df.columns or str(df[col].dtype) == dtype:
+                continue
+            if dtype == 'category':
+                df[col] = df[col].astype('category')
+            else:
+                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(dtype)
+        
         return df
     
+    def _add_labels(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Mapeia códigos para nomes legíveis"""
+        from .codigos_comexstat import get_paises_nomes, get_vias_transporte, get_ncm_descricoes
+        
+        # Traduz apenas os códigos distintos; os rótulos ficam como Categorical
+        if 'cod_pais' in df.columns and 'pais' not in df.columns:
+            df['pais'] = get_paises_nomes(df['cod_pais'])
+        
+        if 'cod_via' in df.columns and 'via' not in df.columns:
+            df['via'] = get_vias_transporte(df['cod_via'])
+        
+        if 'ncm' in df.columns and 'descricao_ncm' not in df.columns:
+            df['descricao_ncm'] = get_ncm_descricoes(df['ncm'])
+        
+        return df
+    
+    @staticmethod
+    def concat_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """Concatena períodos preservando as colunas de rótulos categóricas"""
+        from .codigos_comexstat import alinhar_categorias
+        
+        frames = [alinhar_categorias(df) for df in frames if not df.empty]
+        if not frames:
+            return pd.DataFrame()
+        
+        # Demais categóricas (ex.: uf) variam por ano: unifica as categorias antes de concatenar
+        for col in frames[0].columns:
+            if not isinstance(frames[0][col].dtype, pd.CategoricalDtype):
+                continue
+            categorias = frames[0][col].cat.categories
+            for df in frames[1:]:
+                if not categorias.equals(df[col].cat.categories):
+                    categorias = categorias.union(df[col].cat.categories)
+            frames = [df if df[col].cat.categories.equals(categorias)
+                      else df.assign(**{col: df[col].cat.set_categories(categorias)})
+                      for df in frames]
+        return pd.concat(frames, ignore_index=True)
+    
     def _generate_sample_data(self) -> pd.DataFrame:
         """Gera dados de exemplo para testes"""
         import numpy as np
@@ -0,0 +1,106 @@
+"""
+Cache em memória de DataFrames compartilhado pelo processo
+"""
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple
+
+import pandas as pd
+
+from .singleflight import SingleFlight
+
+
+class DataFrameCache:
+    """
+    Cache LRU thread-safe de DataFrames limitado por orçamento de bytes.
+
+    Cada entrada guarda um token de validação (ex.: mtime e tamanho do
+    arquivo de origem); se o token mudar a entrada é descartada e recarregada.
+    Cargas simultâneas da mesma chave são coalescidas (single-flight).
+    """
+
+    def __init__(self, max_bytes: int, flight: Optional[SingleFlight] = None):
+        self.max_bytes = max_bytes
+        self.flight = flight or SingleFlight()
+        self._entries: 'OrderedDict[Hashable, Tuple[object, pd.DataFrame, int]]' = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, token: object = None) -> Optional[pd.DataFrame]:
+        """Retorna o DataFrame em cache ou None se ausente/desatualizado"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != token:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def contains(self, key: Hashable, token: object = None) -> bool:
+        """Indica se há entrada válida para a chave (sem afetar estatísticas/LRU)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[0] == token
+
+    def put(self, key: Hashable, df: pd.DataFrame, token: object = None) -> pd.DataFrame:
+        """Armazena o DataFrame e aplica a política de descarte LRU"""
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                # Maior que o orçamento inteiro: não vale a pena manter
+                return df
+            self._entries[key] = (token, df, size)
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+        return df
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], pd.DataFrame],
+                    token: object = None) -> pd.DataFrame:
+        """
+        Retorna do cache ou executa o loader e armazena o resultado.
+        Requisições simultâneas pela mesma chave esperam uma única carga.
+        """
+        df = self.get(key, token)
+        if df is not None:
+            return df
+
+        def carregar():
+            # Outra requisição pode ter concluído a carga enquanto esta esperava o lock
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] == token:
+                    return entry[1]
+            return self.put(key, loader(), token)
+
+        return self.flight.do((key, token), carregar)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool] = None):
+        """Remove entradas (todas, ou as que satisfazem o predicado)"""
+        with self._lock:
+            for key in list(self._entries):
+                if predicate is None or predicate(key):
+                    self._remove(key)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'singleflight': self.flight.stats()
+            }
+
+    def _remove(self, key: Hashable):
+        _, _, size = self._entries.pop(key)
+        self._total_bytes -= size
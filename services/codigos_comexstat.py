@@ -2,25 +2,81 @@
 Mapeamento dos códigos utilizados nos dados do ComexStat
 Baseado nas tabelas auxiliares do MDIC
 """
+import os
+import threading
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+from .rotulos import get_abreviador
+from .tabela_binaria import TabelaBinaria
+
+# Tabelas binárias geradas por scripts/gerar_ncm_sh6.py (ncm, paises, vias)
+DATA_DIR = Path(__file__).parent / 'data'
+_TABELAS = {}
+
+NCM_TABLE_URL = "https://balanca.economia.gov.br/balanca/bd/tabelas/NCM_SH.csv"
+
+# Tabela oficial local (opcional); o download remoto só ocorre com NCM_ONLINE=1
+NCM_TABLE_PATH = Path(os.getenv('NCM_TABLE_PATH', Path(__file__).parent.parent / 'datasets' / 'NCM.csv'))
+
 # Cache para tabela NCM
 _NCM_TABLE = None
+_NCM_TABLE_FALHOU = False
+_NCM_OFICIAL = None
+_NCM_LOCK = threading.Lock()
+
+def _tabela(nome: str):
+    """Abre (uma vez, via mmap) a tabela binária services/data/<nome>.tbl"""
+    if nome not in _TABELAS:
+        path = DATA_DIR / f'{nome}.tbl'
+        try:
+            _TABELAS[nome] = TabelaBinaria(path) if path.exists() else None
+        except (OSError, ValueError) as e:
+            print(f"Tabela {path.name} inválida: {e}")
+            _TABELAS[nome] = None
+    return _TABELAS[nome]
 
 def _load_ncm_table():
-    """Carrega tabela NCM do governo (se disponível)"""
-    global _NCM_TABLE
-    if _NCM_TABLE is not None:
+    """
+    Carrega tabela NCM do governo (se disponível).
+    Tenta o arquivo local e, apenas se habilitado, o download. Uma falha
+    fica registrada e não é repetida a cada código desconhecido.
+    """
+    global _NCM_TABLE, _NCM_TABLE_FALHOU
+    if _NCM_TABLE is not None or _NCM_TABLE_FALHOU:
         return _NCM_TABLE
     
-    try:
-        # Tenta baixar tabela NCM-SH do governo
-        url = "https://balanca.economia.gov.br/balanca/bd/tabelas/NCM_SH.csv"
-        _NCM_TABLE = pd.read_csv(url, sep=';', encoding='latin1')
-        return _NCM_TABLE
-    except:
-        return None
+    fontes = [NCM_TABLE_PATH] if NCM_TABLE_PATH.exists() else []
+    if os.getenv('NCM_ONLINE') == '1':
+        fontes.append(NCM_TABLE_URL)
+    
+    for fonte in fontes:
+        try:
+            _NCM_TABLE = pd.read_csv(fonte, sep=';', encoding='latin1',
+                                     usecols=['CO_NCM', 'NO_NCM_POR'], dtype={'CO_NCM': str})
+            return _NCM_TABLE
+        except Exception as e:
+            print(f"Tabela NCM indisponível em {fonte}: {e}")
+    
+    _NCM_TABLE_FALHOU = True
+    return None
+
+def _ncm_oficial() -> dict:
+    """Tabela oficial do governo como dicionário código -> descrição (montado uma única vez)"""
+    global _NCM_OFICIAL
+    if _NCM_OFICIAL is not None:
+        return _NCM_OFICIAL
+    
+    with _NCM_LOCK:
+        if _NCM_OFICIAL is None:
+            oficial = {}
+            ncm_table = _load_ncm_table()
+            if ncm_table is not None:
+                codigos = ncm_table['CO_NCM'].str.strip().str.zfill(8)
+                oficial.update(zip(codigos, ncm_table['NO_NCM_POR'].astype(str)))
+            _NCM_OFICIAL = oficial
+    return _NCM_OFICIAL
 
 # Códigos de países (conforme tabela oficial ComexStat do MDIC)
 # Fonte: https://balanca.economia.gov.br/balanca/bd/tabelas/PAIS.csv
@@ -172,43 +228,178 @@ NCM_DESCRICOES = {
     '02013000': 'Carne bovina fresca',
 }
 
+def _buscar(nome_tabela: str, codigo_str: str):
+    tabela = _tabela(nome_tabela)
+    if tabela is None or not codigo_str.isdigit():
+        return None
+    return tabela.get(int(codigo_str))
+
 def get_pais_nome(codigo: str) -> str:
     """Retorna o nome do país dado o código"""
     codigo_str = str(codigo).zfill(3)
-    return PAISES.get(codigo_str, f'País {codigo_str}')
+    nome = _buscar('paises', codigo_str) or PAISES.get(codigo_str)
+    return nome or f'País {codigo_str}'
 
 def get_via_transporte(codigo: str) -> str:
     """Retorna o nome da via de transporte dado o código"""
     codigo_str = str(codigo).zfill(2)
-    return VIAS_TRANSPORTE.get(codigo_str, f'Via {codigo_str}')
+    nome = _buscar('vias', codigo_str) or VIAS_TRANSPORTE.get(codigo_str)
+    return nome or f'Via {codigo_str}'
+
+_CODIGOS_POR_NOME = {}
+
+def _codigos_por_nome(tabela: str, traduzir, quantidade: int) -> dict:
+    """Índice inverso nome -> códigos (montado uma vez por tabela)"""
+    if tabela not in _CODIGOS_POR_NOME:
+        inverso = {}
+        for codigo in range(quantidade):
+            inverso.setdefault(traduzir(str(codigo)), []).append(codigo)
+        _CODIGOS_POR_NOME[tabela] = inverso
+    return _CODIGOS_POR_NOME[tabela]
+
+def get_paises_codigos(nomes) -> list:
+    """Códigos de país com os nomes informados (inverso de get_pais_nome)"""
+    inverso = _codigos_por_nome('paises', get_pais_nome, 1000)
+    return sorted({codigo for nome in nomes for codigo in inverso.get(nome, [])})
+
+def get_vias_codigos(nomes) -> list:
+    """Códigos de via com os nomes informados (inverso de get_via_transporte)"""
+    inverso = _codigos_por_nome('vias', get_via_transporte, 100)
+    return sorted({codigo for nome in nomes for codigo in inverso.get(nome, [])})
 
 def get_ncm_descricao(codigo: str) -> str:
     """Retorna a descrição do NCM dado o código"""
     codigo_str = str(codigo).zfill(8)
     
-    # Primeiro tenta buscar no dicionário manual
-    if codigo_str in NCM_DESCRICOES:
-        return NCM_DESCRICOES[codigo_str]
-    
-    # Busca no dicionário completo gerado automaticamente
-    try:
-        from .ncm_completo import NCM_COMPLETO
-        if codigo_str in NCM_COMPLETO:
-            return NCM_COMPLETO[codigo_str]
-    except ImportError:
-        pass
-    
-    # Tenta buscar na tabela do governo
-    ncm_table = _load_ncm_table()
-    if ncm_table is not None:
-        try:
-            match = ncm_table[ncm_table['CO_NCM'] == int(codigo)]
-            if not match.empty:
-                return match.iloc[0]['NO_NCM_POR']
-        except:
-            pass
+    # Prioridade: dicionário manual > tabela binária > tabela oficial do governo
+    descricao = (NCM_DESCRICOES.get(codigo_str)
+                 or _buscar('ncm', codigo_str)
+                 or _ncm_oficial().get(codigo_str))
+    if descricao is not None:
+        return descricao
     
     # Se não encontrar, retorna código com formatação melhor
     # NCM tem 8 dígitos: XX.XX.XX.XX (capítulo.posição.subposição.item)
     formatted = f"{codigo_str[:2]}.{codigo_str[2:4]}.{codigo_str[4:6]}.{codigo_str[6:]}"
     return f"NCM {formatted}"
+
+
+class SharedCategories:
+    """
+    Dicionário de rótulos compartilhado por todos os meses/anos carregados.
+
+    É semeado (ordenado) com todos os rótulos conhecidos e só cresce por
+    anexação, de modo que DataFrames criados em momentos diferentes têm
+    categorias compatíveis e pd.concat preserva o dtype categórico.
+    """
+    
+    def __init__(self, seed):
+        self._seed = seed
+        self._labels = None
+        self._index = None
+        self._categories = None
+        self._lock = threading.Lock()
+    
+    def encode(self, labels) -> tuple:
+        """Retorna os códigos dos rótulos (registrando novos) e as categorias atuais"""
+        with self._lock:
+            if self._labels is None:
+                self._labels = sorted(set(self._seed()))
+                self._index = {label: i for i, label in enumerate(self._labels)}
+            codes = np.empty(len(labels), dtype=np.int32)
+            for i, label in enumerate(labels):
+                code = self._index.get(label)
+                if code is None:
+                    code = len(self._labels)
+                    self._labels.append(label)
+                    self._index[label] = code
+                    self._categories = None
+                codes[i] = code
+            if self._categories is None:
+                self._categories = pd.Index(self._labels)
+            return codes, self._categories
+    
+    @property
+    def categories(self) -> pd.Index:
+        return self.encode([])[1]
+
+def _seed_ncm():
+    tabela = _tabela('ncm')
+    return (list(NCM_DESCRICOES.values())
+            + (tabela.values() if tabela is not None else [])
+            + list(_ncm_oficial().values()))
+
+_PAISES_CATEGORIAS = SharedCategories(lambda: [get_pais_nome(str(c)) for c in range(1000)])
+_VIAS_CATEGORIAS = SharedCategories(lambda: [get_via_transporte(str(c)) for c in range(100)])
+_NCM_CATEGORIAS = SharedCategories(_seed_ncm)
+
+# Colunas de rótulos e seus dicionários compartilhados
+CATEGORIAS_COMPARTILHADAS = {
+    'pais': _PAISES_CATEGORIAS,
+    'via': _VIAS_CATEGORIAS,
+    'descricao_ncm': _NCM_CATEGORIAS
+}
+
+def preparar_tabelas() -> dict:
+    """
+    Abre as tabelas binárias, carrega a tabela NCM oficial, semeia os
+    dicionários de rótulos compartilhados e abrevia de antemão as descrições
+    NCM e os países para os gráficos (aquecimento/preload do servidor)
+    """
+    for nome in ('ncm', 'paises', 'vias'):
+        _tabela(nome)
+    _ncm_oficial()
+    abreviador = get_abreviador()
+    for coluna in ('descricao_ncm', 'pais'):
+        abreviador.precomputar(CATEGORIAS_COMPARTILHADAS[coluna].categories)
+    return {coluna: len(categorias.categories) for coluna, categorias in CATEGORIAS_COMPARTILHADAS.items()}
+
+def _categorizar(codigos: pd.Series, traduzir_lote, categorias: SharedCategories) -> pd.Series:
+    """Traduz apenas os códigos distintos e replica o resultado como Categorical"""
+    posicoes, unicos = pd.factorize(codigos)
+    rotulos, cats = categorias.encode(traduzir_lote(unicos))
+    # Posição -1 (valor ausente) aponta para o -1 anexado ao final
+    rotulos = np.append(rotulos, -1)
+    valores = pd.Categorical.from_codes(rotulos[posicoes], categories=cats)
+    return pd.Series(valores, index=codigos.index)
+
+def _descricoes_ncm(unicos) -> list:
+    """Resolve um lote de NCMs com uma única busca binária na tabela"""
+    codigos = [str(c).zfill(8) for c in unicos]
+    tabela = _tabela('ncm')
+    if tabela is not None:
+        da_tabela = tabela.get_many([int(c) if c.isdigit() else -1 for c in codigos])
+    else:
+        da_tabela = [None] * len(codigos)
+    return [NCM_DESCRICOES.get(c) or t or get_ncm_descricao(c)
+            for c, t in zip(codigos, da_tabela)]
+
+def traduzir_codigos(coluna: str, unicos) -> list:
+    """Rótulos de um lote de códigos distintos para a coluna pais, via ou descricao_ncm"""
+    if coluna == 'descricao_ncm':
+        return _descricoes_ncm(unicos)
+    traduzir = get_pais_nome if coluna == 'pais' else get_via_transporte
+    return [traduzir(str(c)) for c in unicos]
+
+def get_paises_nomes(codigos: pd.Series) -> pd.Series:
+    """Versão vetorizada de get_pais_nome para uma coluna inteira"""
+    return _categorizar(codigos, lambda unicos: [get_pais_nome(str(c)) for c in unicos],
+                        _PAISES_CATEGORIAS)
+
+def get_vias_transporte(codigos: pd.Series) -> pd.Series:
+    """Versão vetorizada de get_via_transporte para uma coluna inteira"""
+    return _categorizar(codigos, lambda unicos: [get_via_transporte(str(c)) for c in unicos],
+                        _VIAS_CATEGORIAS)
+
+def get_ncm_descricoes(codigos: pd.Series) -> pd.Series:
+    """Versão vetorizada de get_ncm_descricao para uma coluna inteira"""
+    return _categorizar(codigos, _descricoes_ncm, _NCM_CATEGORIAS)
+
+def alinhar_categorias(df: pd.DataFrame) -> pd.DataFrame:
+    """Atualiza as colunas de rótulos para o dicionário compartilhado mais recente"""
+    for col, categorias in CATEGORIAS_COMPARTILHADAS.items():
+        if col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype):
+            atuais = categorias.categories
+            if len(df[col].cat.categories) != len(atuais):
+                df = df.assign(**{col: df[col].cat.set_categories(atuais)})
+    return df
@@ -0,0 +1,136 @@
+"""
+Armazenamento colunar (Parquet) dos arquivos EXP_*.csv
+Cada ano é gravado uma vez, particionado por mês:
+    datasets/parquet/ano=2024/mes=01.parquet
+"""
+import json
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow é opcional: sem ele o app continua lendo os CSVs
+    pa = None
+    pc = None
+    ds = None
+    pq = None
+
+MANIFEST = '_origem.json'
+
+
+class ColumnarStore:
+    """Leitura e escrita das partições Parquet por ano/mês"""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    @property
+    def available(self) -> bool:
+        return pq is not None
+
+    def year_dir(self, year: str) -> Path:
+        return self.root / f'ano={year}'
+
+    def partition_path(self, year: str, month: int) -> Path:
+        return self.year_dir(year) / f'mes={int(month):02d}.parquet'
+
+    def is_current(self, year: str, source: Optional[Path] = None) -> bool:
+        """
+        Indica se o ano foi convertido e, quando o CSV de origem existe,
+        se a conversão corresponde à versão atual do arquivo (mtime/tamanho).
+        """
+        if not self.available:
+            return False
+        manifest = self.year_dir(year) / MANIFEST
+        if not manifest.exists():
+            return False
+        if source is None or not source.exists():
+            return True
+        with open(manifest, 'r', encoding='utf-8') as f:
+            origem = json.load(f)
+        stat = source.stat()
+        return origem.get('mtime_ns') == stat.st_mtime_ns and origem.get('size') == stat.st_size
+
+    def years(self) -> List[str]:
+        """Anos com conversão concluída (manifesto gravado)"""
+        return sorted(manifest.parent.name.split('=', 1)[1] for manifest in self.root.glob(f'ano=*/{MANIFEST}'))
+
+    def has_partition(self, year: str, month: int, source: Optional[Path] = None) -> bool:
+        return self.is_current(year, source) and self.partition_path(year, month).exists()
+
+    def write_year(self, year: str, df: pd.DataFrame, source: Optional[Path] = None) -> List[Path]:
+        """Grava um ano já normalizado, uma partição por mês"""
+        if not self.available:
+            raise RuntimeError('pyarrow não está instalado')
+        year_dir = self.year_dir(year)
+        year_dir.mkdir(parents=True, exist_ok=True)
+        # Remove o manifesto primeiro: uma conversão interrompida nunca parece completa
+        (year_dir / MANIFEST).unlink(missing_ok=True)
+        for old in year_dir.glob('mes=*.parquet'):
+            old.unlink()
+
+        written = []
+        for month, part in df.groupby('mes', sort=True, observed=True):
+            path = self.partition_path(year, month)
+            table = pa.Table.from_pandas(part, preserve_index=False)
+            pq.write_table(table, path, compression='zstd')
+            written.append(path)
+
+        self._write_manifest(year, len(df), source)
+        return written
+
+    def _write_manifest(self, year: str, rows: int, source: Optional[Path] = None):
+        """Registra a versão do CSV de origem; gravado por último, ao fim da conversão"""
+        origem = {'rows': int(rows)}
+        if source is not None and source.exists():
+            stat = source.stat()
+            origem.update({'source': source.name, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size})
+        with open(self.year_dir(year) / MANIFEST, 'w', encoding='utf-8') as f:
+            json.dump(origem, f)
+
+    def read_month(self, year: str, month: int, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Lê apenas a partição do mês solicitado"""
+        return pq.read_table(self.partition_path(year, month), columns=columns).to_pandas()
+
+    def iter_month(self, year: str, month: int, start: int = 0, batch_size: int = 65536,
+                   columns: Optional[List[str]] = None) -> Iterator[tuple]:
+        """
+        Lê a partição do mês em lotes a partir da linha `start`, sem carregá-la
+        inteira: (posição da primeira linha do lote, DataFrame). Row groups
+        anteriores a `start` são pulados pelos metadados, sem leitura.
+        """
+        arquivo = pq.ParquetFile(self.partition_path(year, month))
+        grupos, posicao = [], 0
+        for i in range(arquivo.num_row_groups):
+            linhas = arquivo.metadata.row_group(i).num_rows
+            if grupos or posicao + linhas > start:
+                grupos.append(i)
+            else:
+                posicao += linhas
+        if not grupos:
+            return
+        for lote in arquivo.iter_batches(batch_size=batch_size, row_groups=grupos, columns=columns):
+            fim = posicao + lote.num_rows
+            if fim > start:
+                df = lote.to_pandas()
+                yield max(posicao, start), df.iloc[max(0, start - posicao):]
+            posicao = fim
+
+    def scan_month(self, year: str, month: int, filter=None, columns: Optional[List[str]] = None,
+                   batch_size: int = 65536) -> Iterator:
+        """
+        Lotes Arrow da partição do mês, sem passar por pandas; o filtro (expressão
+        pyarrow.dataset) é avaliado na leitura, com descarte de row groups pelas estatísticas
+        """
+        dataset = ds.dataset(self.partition_path(year, month), format='parquet')
+        yield from dataset.to_batches(columns=columns, filter=filter, batch_size=batch_size)
+
+    def partition_token(self, year: str, month: int) -> tuple:
+        """Token de validação para caches em memória"""
+        stat = self.partition_path(year, month).stat()
+        return (stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,58 @@
+"""
+Compressão negociada (Accept-Encoding) das respostas JSON: brotli quando
+o cliente aceita e o pacote está instalado, senão gzip. Respostas menores
+que o limiar saem sem compressão (o ganho não paga o custo); respostas em
+fluxo são comprimidas parte a parte.
+"""
+import gzip
+import zlib
+from typing import Iterable, Iterator, Optional
+
+try:
+    import brotli
+except ImportError:  # brotli é opcional: sem ele só gzip é oferecido
+    brotli = None
+
+# Preferência do servidor em caso de empate na qualidade pedida pelo cliente
+CODIFICACOES = ['br', 'gzip'] if brotli is not None else ['gzip']
+
+# Níveis: a variante fica no cache de respostas, então cada corpo é comprimido uma vez
+NIVEL_GZIP = 6
+QUALIDADE_BROTLI = 5
+
+COMPRESSIVEIS = ('application/json', 'text/csv', 'application/x-ndjson')
+
+
+def negociar(accept_encodings) -> Optional[str]:
+    """Melhor codificação aceita pelo cliente (werkzeug Accept), ou None"""
+    melhor, qualidade = None, 0
+    for codificacao in CODIFICACOES:
+        q = accept_encodings.quality(codificacao)
+        if q > qualidade:
+            melhor, qualidade = codificacao, q
+    return melhor
+
+
+def comprimir(corpo: bytes, codificacao: str) -> bytes:
+    if codificacao == 'br':
+        return brotli.compress(corpo, quality=QUALIDADE_BROTLI)
+    return gzip.compress(corpo, compresslevel=NIVEL_GZIP, mtime=0)
+
+
+def compressivel(mimetype: Optional[str]) -> bool:
+    return mimetype in COMPRESSIVEIS
+
+
+def comprimir_fluxo(partes: Iterable[bytes], codificacao: str) -> Iterator[bytes]:
+    """Compressão incremental de uma resposta em fluxo, sem juntar o corpo"""
+    if codificacao == 'br':
+        compressor = brotli.Compressor(quality=QUALIDADE_BROTLI)
+        processar, finalizar = compressor.process, compressor.finish
+    else:
+        compressor = zlib.compressobj(NIVEL_GZIP, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        processar, finalizar = compressor.compress, compressor.flush
+    for parte in partes:
+        saida = processar(parte)
+        if saida:
+            yield saida
+    yield finalizar()
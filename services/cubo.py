@@ -0,0 +1,136 @@
+"""
+Cubo OLAP pré-agregado das exportações
+Materializado na ingestão a partir do ano normalizado e gravado ao lado dos datasets:
+    datasets/cubo/ano=2024/base.parquet, ncm.parquet, pais.parquet, ...
+"""
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional
+
+import pandas as pd
+
+from .columnar_store import ColumnarStore, MANIFEST, pq
+from .singleflight import SingleFlight
+
+# Granularidade do cubo e roll-ups comuns (mês x dimensão)
+CUBE_DIMENSIONS = ['ano', 'mes', 'ncm', 'cod_pais', 'uf', 'cod_via']
+ROLLUPS = {
+    'base': CUBE_DIMENSIONS,
+    'ncm': ['ano', 'mes', 'ncm'],
+    'pais': ['ano', 'mes', 'cod_pais'],
+    'uf': ['ano', 'mes', 'uf'],
+    'via': ['ano', 'mes', 'cod_via'],
+    'pais_ncm_via': ['ano', 'mes', 'cod_pais', 'ncm', 'cod_via']
+}
+MEASURES = ['valor_fob', 'peso_kg', 'quantidade']
+
+
+def _somar(frame: pd.DataFrame, dims) -> pd.DataFrame:
+    measures = [col for col in MEASURES if col in frame.columns]
+    # dropna=False: linhas sem UF continuam contando nos totais das outras dimensões
+    return frame.groupby(dims, observed=True, dropna=False, sort=True)[measures].sum().reset_index()
+
+
+class ExportCube(ColumnarStore):
+    """
+    Somas de valor_fob, peso_kg e quantidade por (ano, mes, ncm, pais, uf, via)
+    e roll-ups por mês. Os anos carregados ficam em memória, validados pelo
+    mtime/tamanho do CSV de origem.
+    """
+
+    def __init__(self, root: Path, rotular: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None):
+        super().__init__(root)
+        self.rotular = rotular
+        self._anos: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        # Uma materialização por ano e versão; anos diferentes não esperam uns pelos outros
+        self._flight = SingleFlight()
+
+    def rollup_path(self, year: str, nome: str) -> Path:
+        return self.year_dir(year) / f'{nome}.parquet'
+
+    @staticmethod
+    def build(df: pd.DataFrame) -> Optional[Dict[str, pd.DataFrame]]:
+        """Calcula o cubo de um ano normalizado (None se faltar alguma dimensão)"""
+        if any(col not in df.columns for col in CUBE_DIMENSIONS):
+            return None
+        return ExportCube._rollups(_somar(df, CUBE_DIMENSIONS))
+
+    @staticmethod
+    def build_chunks(chunks: Iterable[pd.DataFrame], max_parciais: int = 8) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Calcula o cubo a partir de blocos do ano (modo streaming): cada bloco
+        vira somas parciais, recombinadas periodicamente, sem materializar o ano.
+        """
+        parciais = []
+        for chunk in chunks:
+            if any(col not in chunk.columns for col in CUBE_DIMENSIONS):
+                return None
+            parciais.append(_somar(chunk, CUBE_DIMENSIONS))
+            if len(parciais) >= max_parciais:
+                parciais = [_somar(pd.concat(parciais, ignore_index=True), CUBE_DIMENSIONS)]
+        if not parciais:
+            return None
+        return ExportCube._rollups(_somar(pd.concat(parciais, ignore_index=True), CUBE_DIMENSIONS))
+
+    @staticmethod
+    def _rollups(base: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        # Roll-ups partem do cubo base, bem menor que as linhas brutas
+        return {nome: base if nome == 'base' else _somar(base, dims)
+                for nome, dims in ROLLUPS.items()}
+
+    def write_rollups(self, year: str, rollups: Dict[str, pd.DataFrame], source: Optional[Path] = None):
+        """Grava os roll-ups de um ano e, por último, o manifesto de origem"""
+        year_dir = self.year_dir(year)
+        year_dir.mkdir(parents=True, exist_ok=True)
+        (year_dir / MANIFEST).unlink(missing_ok=True)
+        for nome, df in rollups.items():
+            df.to_parquet(self.rollup_path(year, nome), index=False, compression='zstd')
+        self._write_manifest(year, len(rollups['base']), source)
+
+    def read_rollups(self, year: str) -> Dict[str, pd.DataFrame]:
+        return {nome: pq.read_table(self.rollup_path(year, nome)).to_pandas() for nome in ROLLUPS}
+
+    def invalidate(self, years):
+        """Descarta da memória os cubos dos anos informados"""
+        with self._lock:
+            for year in years:
+                self._anos.pop(year, None)
+
+    def get_year(self, year: str, source: Path,
+                 builder: Callable[[], Optional[Dict[str, pd.DataFrame]]]) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Roll-ups do ano: da memória, do disco ou materializados pelo builder
+        (build/build_chunks), chamado só quando o cubo está desatualizado.
+        """
+        stat = source.stat()
+        token = (stat.st_mtime_ns, stat.st_size)
+        entry = self._anos.get(year)
+        if entry is not None and entry[0] == token:
+            return entry[1]
+        return self._flight.do((year, token), lambda: self._load_year(year, source, token, builder))
+
+    def _load_year(self, year: str, source: Path, token: tuple,
+                   builder: Callable[[], Optional[Dict[str, pd.DataFrame]]]) -> Optional[Dict[str, pd.DataFrame]]:
+        entry = self._anos.get(year)
+        if entry is not None and entry[0] == token:
+            return entry[1]
+
+        if self.is_current(year, source):
+            rollups = self.read_rollups(year)
+        else:
+            rollups = builder()
+            if rollups is None:
+                return None
+            if self.available:
+                try:
+                    self.write_rollups(year, rollups, source)
+                except Exception as e:
+                    # Ex.: datasets montado só para leitura; o cubo continua valendo em memória
+                    print(f"Erro ao gravar o cubo de {year}, mantido só em memória: {e}")
+
+        if self.rotular is not None:
+            rollups = {nome: self.rotular(df) for nome, df in rollups.items()}
+        with self._lock:
+            self._anos[year] = (token, rollups)
+        return rollups
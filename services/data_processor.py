@@ -1,5 +1,51 @@
+import numpy as np
 import pandas as pd
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Union
+
+# Abaixo deste total, somas inteiras via np.bincount (float64) são exatas
+_LIMITE_SOMA_EXATA = 2 ** 53
+
+
+def _somador(valores: np.ndarray):
+    """
+    Prepara uma medida, uma única vez, para somas por código de grupo.
+    NaN conta como zero (como no groupby); inteiros mantêm o tipo inteiro.
+    """
+    if valores.dtype.kind in 'iu':
+        tipo = np.uint64 if valores.dtype.kind == 'u' else np.int64
+        if np.abs(valores).sum(dtype=np.float64) >= _LIMITE_SOMA_EXATA:
+            def somar(grupos, n):
+                somas = np.zeros(n, dtype=tipo)
+                np.add.at(somas, grupos, valores.astype(tipo))
+                return somas
+            return somar
+        pesos = valores.astype(np.float64)
+        return lambda grupos, n: np.bincount(grupos, weights=pesos, minlength=n).astype(tipo)
+    pesos = np.nan_to_num(valores.astype(np.float64), nan=0.0)
+    return lambda grupos, n: np.bincount(grupos, weights=pesos, minlength=n)
+
+
+def _fatorar(serie: pd.Series):
+    """Códigos inteiros ordenados (-1 para NaN), quantidade de códigos e decodificador"""
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        # Categóricas já têm códigos na ordem das categorias (a mesma do groupby)
+        dtype = serie.dtype
+        return (serie.cat.codes.to_numpy(), len(dtype.categories),
+                lambda idx: pd.Categorical.from_codes(idx, dtype=dtype))
+    codes, uniques = pd.factorize(serie, sort=True)
+    return codes, len(uniques), uniques.take
+
+def _chave_periodo(df: pd.DataFrame, agregacao: str):
+    """Chave inteira do período por linha e formatador equivalente ao str(pd.Period)"""
+    ano = pd.to_numeric(df['ano']).to_numpy().astype(np.int64)
+    mes = pd.to_numeric(df['mes']).to_numpy().astype(np.int64)
+    if agregacao == 'trimestral':
+        chave, formatar = ano * 4 + (mes - 1) // 3, lambda k: f'{k // 4}Q{k % 4 + 1}'
+    elif agregacao == 'anual':
+        chave, formatar = ano, str
+    else:  # mensal
+        chave, formatar = ano * 12 + mes - 1, lambda k: f'{k // 12}-{k % 12 + 1:02d}'
+    return pd.Series(chave, index=df.index, name='periodo'), formatar
 
 class DataProcessor:
     """Processamento e agregação de dados de exportação"""
@@ -11,11 +57,11 @@ class DataProcessor:
         
         # Garante que descricao_ncm existe
         if 'descricao_ncm' not in df.columns:
-            from .codigos_comexstat import get_ncm_descricao
-            df['descricao_ncm'] = df['ncm'].apply(lambda x: get_ncm_descricao(str(x)))
+            from .codigos_comexstat import get_ncm_descricoes
+            df['descricao_ncm'] = get_ncm_descricoes(df['ncm'])
         
         # Agrega por NCM e descrição
-        agg = df.groupby(['ncm', 'descricao_ncm']).agg({
+        agg = df.groupby(['ncm', 'descricao_ncm'], observed=True).agg({
             'valor_fob': 'sum',
             'peso_kg': 'sum'
         }).reset_index()
@@ -28,7 +74,7 @@ class DataProcessor:
         if df.empty or 'pais' not in df.columns:
             return pd.DataFrame()
         
-        agg = df.groupby('pais').agg({
+        agg = df.groupby('pais', observed=True).agg({
             'valor_fob': 'sum',
             'peso_kg': 'sum'
         }).reset_index()
@@ -41,7 +87,7 @@ class DataProcessor:
         if df.empty or 'via' not in df.columns:
             return pd.DataFrame()
         
-        agg = df.groupby('via').agg({
+        agg = df.groupby('via', observed=True).agg({
             'valor_fob': 'sum',
             'peso_kg': 'sum'
         }).reset_index()
@@ -54,7 +100,7 @@ class DataProcessor:
         if df.empty or 'uf' not in df.columns:
             return pd.DataFrame()
         
-        agg = df.groupby('uf').agg({
+        agg = df.groupby('uf', observed=True).agg({
             'valor_fob': 'sum',
             'peso_kg': 'sum'
         }).reset_index()
@@ -62,14 +108,132 @@ class DataProcessor:
         agg = agg.sort_values('valor_fob', ascending=False)
         return agg
     
+    def aggregate_many(self, df: pd.DataFrame, dims: List[Union[str, List[str]]],
+                       measures: Optional[List[str]] = None,
+                       top_n: Union[int, Dict[str, int], None] = None) -> Dict:
+        """
+        Agrega várias dimensões de uma só vez: cada coluna é fatorada uma única
+        vez e as somas por grupo saem de np.bincount sobre os códigos inteiros.
+        
+        Args:
+            dims: colunas a agrupar; uma lista de colunas forma uma dimensão
+                composta (ex.: ['ncm', 'descricao_ncm']), nomeada pela primeira
+            measures: medidas somadas (padrão: valor_fob e peso_kg)
+            top_n: limite de linhas por dimensão (int, ou dict dimensão -> int)
+        
+        Returns:
+            Dict com um DataFrame por dimensão (mesmo formato de aggregate_by_*,
+            ordenado por valor_fob), 'totais' das medidas e 'distintos'
+            (valores distintos de cada coluna agrupada, como nunique)
+        """
+        measures = [col for col in (measures or ['valor_fob', 'peso_kg']) if col in df.columns]
+        somadores = {col: _somador(df[col].to_numpy()) for col in measures}
+        resultado = {'totais': {col: df[col].sum() for col in measures}}
+        
+        fatores = {}
+        for dim in dims:
+            cols = [dim] if isinstance(dim, str) else list(dim)
+            nome = cols[0]
+            if df.empty or any(col not in df.columns for col in cols):
+                resultado[nome] = pd.DataFrame()
+                continue
+            
+            # Código combinado em base mista; linhas com NaN vão para o código
+            # "base" (um após o último) e são descartadas, como no groupby
+            codigo = np.zeros(len(df), dtype=np.int64)
+            invalidos = np.zeros(len(df), dtype=bool)
+            base = 1
+            for col in cols:
+                if col not in fatores:
+                    fatores[col] = _fatorar(df[col])
+                codes, n, _ = fatores[col]
+                codigo = codigo * n + codes
+                invalidos |= codes < 0
+                base *= n
+            codigo[invalidos] = base
+            
+            if base <= max(4 * len(df), 1 << 16):
+                # Espaço de chaves pequeno: contagem direta, sem hash
+                grupos, tamanho = codigo, base + 1
+                selecao = np.flatnonzero(np.bincount(grupos, minlength=tamanho)[:base])
+                chaves = selecao
+            else:
+                grupos, uniques = pd.factorize(codigo, sort=True)
+                tamanho = len(uniques)
+                selecao = np.flatnonzero(uniques < base)
+                chaves = uniques[selecao]
+            
+            # Decodifica as chaves de volta para os valores de cada coluna
+            colunas = {}
+            resto = chaves
+            for col in reversed(cols):
+                _, n, decodificar = fatores[col]
+                colunas[col] = decodificar(resto % n)
+                resto = resto // n
+            
+            agg = pd.DataFrame({col: colunas[col] for col in cols})
+            for col in measures:
+                agg[col] = somadores[col](grupos, tamanho)[selecao]
+            
+            if 'valor_fob' in agg.columns:
+                agg = agg.sort_values('valor_fob', ascending=False)
+            limite = top_n.get(nome) if isinstance(top_n, dict) else top_n
+            resultado[nome] = agg.head(limite) if limite else agg
+        
+        resultado['distintos'] = {
+            col: int(np.count_nonzero(np.bincount(codes.astype(np.int64) + 1, minlength=n + 1)[1:]))
+            for col, (codes, n, _) in fatores.items()
+        }
+        return resultado
+    
+    def aggregate_stream(self, chunks: Iterable[pd.DataFrame], dims: List[Union[str, List[str]]],
+                         measures: Optional[List[str]] = None,
+                         top_n: Union[int, Dict[str, int], None] = None,
+                         max_parciais: int = 16) -> Dict:
+        """
+        Mesmo resultado de aggregate_many, consumindo os dados em blocos
+        (ex.: ComexStatAPI.iter_csv_chunks): cada bloco vira agregados parciais
+        por dimensão, recombinados ao final. A memória fica limitada a um bloco
+        mais os parciais, independente do tamanho do arquivo.
+        """
+        nomes = [dim if isinstance(dim, str) else dim[0] for dim in dims]
+        parciais = {nome: [] for nome in nomes}
+        totais = {}
+        
+        def combinar(frames, dim):
+            return self.aggregate_many(pd.concat(frames, ignore_index=True), [dim], measures)
+        
+        for chunk in chunks:
+            parcial = self.aggregate_many(chunk, dims, measures)
+            for col, valor in parcial['totais'].items():
+                totais[col] = totais.get(col, 0) + valor
+            for nome, dim in zip(nomes, dims):
+                if parcial[nome].empty:
+                    continue
+                parciais[nome].append(parcial[nome])
+                if len(parciais[nome]) >= max_parciais:
+                    parciais[nome] = [combinar(parciais[nome], dim)[nome]]
+        
+        resultado = {'totais': totais, 'distintos': {}}
+        for nome, dim in zip(nomes, dims):
+            if not parciais[nome]:
+                resultado[nome] = pd.DataFrame()
+                continue
+            final = combinar(parciais[nome], dim)
+            limite = top_n.get(nome) if isinstance(top_n, dict) else top_n
+            resultado[nome] = final[nome].head(limite) if limite else final[nome]
+            # Cada grupo final é uma combinação distinta: conta os valores de cada coluna
+            resultado['distintos'].update({col: final[nome][col].nunique() for col in final['distintos']})
+        return resultado
+    
     def calculate_growth(self, current: pd.DataFrame, previous: pd.DataFrame, 
                         group_by: str, value_col: str = 'valor_fob') -> pd.DataFrame:
         """Calcula crescimento entre dois períodos"""
         if current.empty or previous.empty:
             return pd.DataFrame()
         
-        current_agg = current.groupby(group_by)[value_col].sum()
-        previous_agg = previous.groupby(group_by)[value_col].sum()
+        current_agg = current.groupby(group_by, observed=True)[value_col].sum()
+        previous_agg = previous.groupby(group_by, observed=True)[value_col].sum()
         
         growth = pd.DataFrame({
             'current': current_agg,
@@ -123,13 +287,20 @@ class DataProcessor:
         elif value >= 1_000:
             return f"{value/1_000:.2f} ton"
         return f"{value:.2f} kg"    
-    def process_time_series(self, df: pd.DataFrame, agregacao: str = 'mensal') -> Dict:
+    def process_time_series(self, df: pd.DataFrame, agregacao: str = 'mensal',
+                            top_n: int = 5, top_paises: int = 5) -> Dict:
         """
         Processa dados para análise de séries temporais com desagregação por NCM
         
+        O período é uma chave inteira (ano*12+mes-1, ano*4+trimestre ou ano) e
+        cada recorte (total, país, NCM, NCM x país) sai de uma única operação
+        agrupada, sem varrer o dataframe de novo para cada NCM.
+        
         Args:
             df: DataFrame com dados de exportação (com colunas ano, mes)
             agregacao: 'mensal', 'trimestral' ou 'anual'
+            top_n: quantidade de NCMs desagregados
+            top_paises: quantidade de países por série
         
         Returns:
             Dict com séries temporais desagregadas por NCM e país
@@ -139,53 +310,45 @@ class DataProcessor:
         
         # Garante descrição NCM
         if 'descricao_ncm' not in df.columns:
-            from .codigos_comexstat import get_ncm_descricao
-            df['descricao_ncm'] = df['ncm'].apply(lambda x: get_ncm_descricao(str(x)))
+            from .codigos_comexstat import get_ncm_descricoes
+            df['descricao_ncm'] = get_ncm_descricoes(df['ncm'])
         
-        # Cria coluna de data
-        df['data'] = pd.to_datetime(df['ano'].astype(str) + '-' + df['mes'].astype(str).str.zfill(2) + '-01')
+        measures = [col for col in ['valor_fob', 'peso_kg', 'quantidade'] if col in df.columns]
+        periodo, formatar = _chave_periodo(df, agregacao)
         
-        # Agregação conforme solicitado
-        if agregacao == 'trimestral':
-            df['periodo'] = df['data'].dt.to_period('Q')
-        elif agregacao == 'anual':
-            df['periodo'] = df['data'].dt.to_period('Y')
-        else:  # mensal
-            df['periodo'] = df['data'].dt.to_period('M')
+        def com_rotulo(agg: pd.DataFrame) -> pd.DataFrame:
+            # Rótulos no formato de pd.Period ('2024-01', '2024Q1', '2024'), só para os períodos distintos
+            chaves = agg['periodo'].to_numpy()
+            unicos, inversos = np.unique(chaves, return_inverse=True)
+            agg['periodo_str'] = np.array([formatar(int(k)) for k in unicos], dtype=object)[inversos]
+            return agg
         
         # Série temporal total (agregado geral)
-        total_series = df.groupby('periodo').agg({
-            'valor_fob': 'sum',
-            'peso_kg': 'sum',
-            'quantidade': 'sum' if 'quantidade' in df.columns else lambda x: 0
-        }).reset_index()
-        total_series['periodo_str'] = total_series['periodo'].astype(str)
-        
-        # Garante que quantidade existe
+        total_series = com_rotulo(df.groupby(periodo)[measures].sum().reset_index())
         if 'quantidade' not in total_series.columns:
             total_series['quantidade'] = 0
         
-        # Identifica top 5 NCMs por valor total
-        top_ncms = df.groupby(['ncm', 'descricao_ncm'])['valor_fob'].sum().nlargest(5).reset_index()
+        # Top países geral: período x país em uma passada
+        por_pais = df.groupby([periodo, 'pais'], observed=True)[['valor_fob', 'peso_kg']].sum()
+        top_paises_geral = por_pais['valor_fob'].groupby(level='pais', observed=True).sum().nlargest(top_paises).index
+        paises_series = com_rotulo(
+            por_pais[por_pais.index.get_level_values('pais').isin(top_paises_geral)].reset_index()
+        )
+        
+        # NCM x período em uma passada; o ranking dos NCMs sai do mesmo agregado
+        por_ncm = df.groupby(['ncm', 'descricao_ncm', periodo], observed=True)[measures].sum()
+        top_ncms = por_ncm['valor_fob'].groupby(level=['ncm', 'descricao_ncm'], observed=True).sum().nlargest(top_n).reset_index()
+        
+        # NCM x período x país apenas para as linhas dos top NCMs
+        mask = df['ncm'].isin(top_ncms['ncm'].unique()).to_numpy()
+        por_ncm_pais = df[mask].groupby(['ncm', periodo[mask], 'pais'], observed=True)[measures].sum()
+        ranking_pais = por_ncm_pais['valor_fob'].groupby(level=['ncm', 'pais'], observed=True).sum()
         
-        # Séries individuais por NCM (desagregadas)
         ncm_series_list = []
-        for _, ncm_row in top_ncms.iterrows():
-            ncm_code = ncm_row['ncm']
-            ncm_desc = ncm_row['descricao_ncm']
-            
-            ncm_df_filtered = df[df['ncm'] == ncm_code]
-            
-            agg_dict = {
-                'valor_fob': 'sum',
-                'peso_kg': 'sum'
-            }
-            if 'quantidade' in ncm_df_filtered.columns:
-                agg_dict['quantidade'] = 'sum'
-            
-            ncm_data = ncm_df_filtered.groupby('periodo').agg(agg_dict).reset_index()
-            
-            ncm_data['periodo_str'] = ncm_data['periodo'].astype(str)
+        ncm_pais_series_list = []
+        for ncm_code, ncm_desc in zip(top_ncms['ncm'], top_ncms['descricao_ncm']):
+            # Séries individuais por NCM (desagregadas)
+            ncm_data = com_rotulo(por_ncm.loc[(ncm_code, ncm_desc)].reset_index())
             ncm_data['ncm'] = ncm_code
             ncm_data['descricao_ncm'] = ncm_desc
             
@@ -195,65 +358,22 @@ class DataProcessor:
                 ncm_data['preco_medio'] = ncm_data['preco_medio'].replace([float('inf'), float('-inf')], 0).fillna(0)
             else:
                 ncm_data['preco_medio'] = 0
-            
             ncm_series_list.append(ncm_data)
-        
-        # Top 5 países por NCM (desagregado)
-        ncm_pais_series_list = []
-        for _, ncm_row in top_ncms.iterrows():
-            ncm_code = ncm_row['ncm']
-            ncm_desc = ncm_row['descricao_ncm']
-            
-            # Filtra dados deste NCM
-            ncm_df = df[df['ncm'] == ncm_code]
-            
-            # Identifica top 5 países para este NCM
-            top_paises_ncm = ncm_df.groupby('pais')['valor_fob'].sum().nlargest(5).index.tolist()
-            
-            # Séries temporais por país para este NCM
-            agg_dict = {
-                'valor_fob': 'sum',
-                'peso_kg': 'sum'
-            }
-            if 'quantidade' in ncm_df.columns:
-                agg_dict['quantidade'] = 'sum'
-            
-            paises_ncm_data = ncm_df[ncm_df['pais'].isin(top_paises_ncm)].groupby(['periodo', 'pais']).agg(agg_dict).reset_index()
             
-            paises_ncm_data['periodo_str'] = paises_ncm_data['periodo'].astype(str)
+            # Top países deste NCM e suas séries
+            top_paises_ncm = ranking_pais.loc[ncm_code].nlargest(top_paises).index
+            paises_ncm = por_ncm_pais.loc[ncm_code]
+            paises_ncm_data = com_rotulo(
+                paises_ncm[paises_ncm.index.get_level_values('pais').isin(top_paises_ncm)].reset_index()
+            )
             paises_ncm_data['ncm'] = ncm_code
             paises_ncm_data['descricao_ncm'] = ncm_desc
             
             # Calcula share percentual de cada país no período
             total_por_periodo = paises_ncm_data.groupby('periodo')['valor_fob'].transform('sum')
             paises_ncm_data['share_pct'] = (paises_ncm_data['valor_fob'] / total_por_periodo * 100).round(2)
-            
             ncm_pais_series_list.append(paises_ncm_data)
         
-        # Agrupa top 5 países geral (todos os NCMs)
-        top_paises_geral = df.groupby('pais')['valor_fob'].sum().nlargest(5).index.tolist()
-        paises_series = df[df['pais'].isin(top_paises_geral)].groupby(['periodo', 'pais']).agg({
-            'valor_fob': 'sum',
-            'peso_kg': 'sum'
-        }).reset_index()
-        paises_series['periodo_str'] = paises_series['periodo'].astype(str)
-        
-        # Converte tipos numpy para Python nativos para serialização JSON
-        def convert_to_native_types(df_list):
-            result = []
-            for item in df_list:
-                if isinstance(item, pd.DataFrame):
-                    # Converte int64, float64 para int, float
-                    for col in item.select_dtypes(include=['int64', 'int32']).columns:
-                        item[col] = item[col].astype(int)
-                    for col in item.select_dtypes(include=['float64', 'float32']).columns:
-                        item[col] = item[col].astype(float)
-                result.append(item)
-            return result
-        
-        ncm_series_list = convert_to_native_types(ncm_series_list)
-        ncm_pais_series_list = convert_to_native_types(ncm_pais_series_list)
-        
         # Converte top_ncms para tipos nativos
         top_ncms_native = []
         for record in top_ncms.to_dict('records'):
@@ -274,4 +394,4 @@ class DataProcessor:
             'ncm_series': ncm_series_list,  # Lista de séries individuais por NCM
             'ncm_pais_series': ncm_pais_series_list,  # Lista de séries país x NCM
             'top_ncms_info': top_ncms_native  # Info dos top NCMs (tipos nativos)
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,182 @@
+"""
+Registro dos arquivos de dados (datasets/EXP_*.csv e manifestos das partições
+Parquet, parquet/ano=AAAA/_origem.json)
+Detecta trocas de arquivo com stat (barato o bastante para cada requisição),
+calcula o hash do conteúdo apenas de arquivos cujo stat mudou e avisa os
+caches registrados sobre os anos afetados. Os hashes são calculados fora do
+lock: as demais requisições seguem com a versão atual enquanto isso.
+"""
+import hashlib
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+
+def _hash_arquivo(path: Path, bloco: int = 1024 * 1024) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for parte in iter(lambda: f.read(bloco), b''):
+            h.update(parte)
+    return h.hexdigest()
+
+
+def _ano(nome: str) -> str:
+    """EXP_2024.csv -> '2024'; parquet/ano=2024/_origem.json -> '2024'"""
+    for parte in Path(nome).parts:
+        if parte.startswith('ano='):
+            return parte.split('=', 1)[1]
+    return Path(nome).stem.split('_', 1)[-1]
+
+
+# Arquivo modificado há menos que isto (ex.: cópia em andamento) só é avaliado depois
+SETTLE_SECONDS = float(os.getenv('DATASET_SETTLE_SECONDS', '2'))
+
+
+class DatasetRegistry:
+    """
+    Tamanho, mtime e hash de cada arquivo, mais uma versão que só cresce:
+    ela sobe a cada arquivo novo, removido ou com conteúdo diferente.
+    Um simples touch, com o mesmo conteúdo, não muda a versão; a exceção é o
+    touch logo após a inicialização, antes de o hash inicial do arquivo
+    (calculado em segundo plano) ficar pronto, que conta como alteração.
+    """
+
+    def __init__(self, datasets_dir: Path, pattern: str = 'EXP_*.csv',
+                 settle_seconds: float = SETTLE_SECONDS,
+                 outros: Optional[List[Tuple[Path, str]]] = None):
+        """
+        Args:
+            outros: (diretório, padrão) de outros arquivos por ano, ex.: os
+                manifestos do ColumnarStore, para anos que só existem em Parquet
+        """
+        self.datasets_dir = Path(datasets_dir)
+        self.pattern = pattern
+        self.fontes = [(self.datasets_dir, pattern)] + [(Path(raiz), padrao) for raiz, padrao in outros or []]
+        self.settle_ns = int(settle_seconds * 1e9)
+        self.version = 0
+        self._arquivos: Dict[str, dict] = {}
+        self._listeners: List[Callable[[Set[str]], None]] = []
+        self._lock = threading.Lock()
+        # Arquivos com hash em andamento (single-flight sem espera: quem chega depois segue)
+        self._calculando: Set[str] = set()
+        self._semeador_pid = None
+        for nome, stat in self._varrer().items():
+            self._arquivos[nome] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'hash': None}
+        self.version = 1
+        self._semear()
+
+    def add_listener(self, listener: Callable[[Set[str]], None]):
+        """Registra um callback chamado com os anos afetados por uma mudança"""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def _varrer(self) -> dict:
+        """{nome: stat}; o nome é relativo a datasets_dir (absoluto fora dele)"""
+        atual = {}
+        for raiz, padrao in self.fontes:
+            for path in raiz.glob(padrao):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:  # removido durante a varredura
+                    continue
+                try:
+                    nome = path.relative_to(self.datasets_dir).as_posix()
+                except ValueError:
+                    nome = str(path)
+                atual[nome] = stat
+        return atual
+
+    def _semear(self):
+        """Hash inicial dos arquivos em segundo plano (de novo no filho após um fork)"""
+        self._semeador_pid = os.getpid()
+        threading.Thread(target=self._hash_inicial, daemon=True, name='dataset-registry').start()
+
+    def _hash_inicial(self):
+        with self._lock:
+            pendentes = [(nome, dict(info)) for nome, info in self._arquivos.items()
+                         if info['hash'] is None and nome not in self._calculando]
+            self._calculando.update(nome for nome, _ in pendentes)
+        for nome, info in pendentes:
+            try:
+                valor = _hash_arquivo(self.datasets_dir / nome)
+            except OSError:
+                valor = None
+            with self._lock:
+                self._calculando.discard(nome)
+                registrado = self._arquivos.get(nome)
+                # Só vale se o arquivo não mudou desde a varredura inicial
+                if (registrado is not None and registrado['mtime_ns'] == info['mtime_ns']
+                        and registrado['size'] == info['size']):
+                    registrado['hash'] = valor
+
+    def check(self) -> int:
+        """Varre o diretório (só stat) e retorna a versão atual dos datasets"""
+        if self._semeador_pid != os.getpid():
+            self._semear()
+        atual = self._varrer()
+        agora = time.time_ns()
+
+        # Diferença de stat sob o lock; cada arquivo alterado e já assentado
+        # fica com um único cálculo de hash em andamento
+        with self._lock:
+            mudados = {}
+            for nome, stat in atual.items():
+                anterior = self._arquivos.get(nome)
+                if (anterior is not None and anterior['mtime_ns'] == stat.st_mtime_ns
+                        and anterior['size'] == stat.st_size):
+                    continue
+                if nome in self._calculando or agora - stat.st_mtime_ns < self.settle_ns:
+                    continue
+                self._calculando.add(nome)
+                mudados[nome] = stat
+            removidos = set(self._arquivos) - set(atual)
+            if not mudados and not removidos:
+                return self.version
+
+        # Hash fora do lock: as outras requisições seguem com a versão atual
+        hashes = {}
+        try:
+            for nome in mudados:
+                try:
+                    hashes[nome] = _hash_arquivo(self.datasets_dir / nome)
+                except OSError:  # removido ou ilegível: reavaliado na próxima varredura
+                    continue
+        finally:
+            with self._lock:
+                self._calculando.difference_update(mudados)
+                afetados = set()
+                for nome, valor in hashes.items():
+                    stat = mudados[nome]
+                    anterior = self._arquivos.get(nome)
+                    # Sem hash anterior (novo, ou inicial ainda pendente), conta como alteração
+                    if anterior is None or anterior['hash'] is None or anterior['hash'] != valor:
+                        afetados.add(_ano(nome))
+                    self._arquivos[nome] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'hash': valor}
+
+                for nome in removidos & set(self._arquivos):
+                    del self._arquivos[nome]
+                    afetados.add(_ano(nome))
+
+                if afetados:
+                    self.version += 1
+                listeners = list(self._listeners) if afetados else []
+
+        if afetados:
+            print(f"Datasets alterados ({', '.join(sorted(afetados))}): versão {self.version}")
+        for listener in listeners:
+            listener(afetados)
+        return self.version
+
+    @property
+    def last_modified(self) -> Optional[datetime]:
+        with self._lock:
+            ultima = max((info['mtime_ns'] for info in self._arquivos.values()), default=None)
+        return datetime.fromtimestamp(ultima / 1e9, tz=timezone.utc) if ultima else None
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {'version': self.version,
+                    'files': {nome: dict(info) for nome, info in sorted(self._arquivos.items())}}
@@ -0,0 +1,157 @@
+"""
+Exportação em fluxo das linhas brutas (NDJSON ou CSV)
+Os blocos de ComexStatAPI.iter_export são codificados um a um, de modo que
+a memória não cresce com o total exportado. A continuação usa cursores
+opacos e assinados: a consulta (períodos e filtros), a posição de origem e
+a versão do CSV do ano em que a página parou.
+
+Para análise, os lotes Arrow de ComexStatAPI.iter_export_arrow saem em
+Arrow IPC (stream) ou Parquet, tipados e sem conversão para texto.
+"""
+import os
+from typing import Dict, Iterable, Iterator, Optional
+
+import pandas as pd
+from itsdangerous import BadSignature, URLSafeSerializer
+
+from .columnar_store import pa, pq
+
+FORMATOS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+# Formatos colunares do download em lote: (mimetype, extensão, compressões aceitas)
+FORMATOS_COLUNARES = {
+    'arrow': ('application/vnd.apache.arrow.stream', 'arrows', ('none', 'zstd', 'lz4')),
+    'parquet': ('application/vnd.apache.parquet', 'parquet', ('none', 'zstd', 'snappy', 'gzip'))
+}
+
+# Linhas acumuladas antes de cada escrita (um row group no Parquet)
+BULK_GROUP_ROWS = int(os.getenv('BULK_GROUP_ROWS', '131072'))
+
+# Colunas exportadas, nesta ordem (as ausentes na origem são omitidas)
+COLUNAS_EXPORTACAO = ['ano', 'mes', 'ncm', 'descricao_ncm', 'cod_pais', 'pais', 'uf',
+                      'cod_via', 'via', 'CO_URF', 'CO_UNID', 'quantidade', 'peso_kg', 'valor_fob']
+
+
+class CursorInvalido(ValueError):
+    """Cursor adulterado, de outra chave ou malformado"""
+
+
+class CursorExportacao:
+    """Cursores opacos (assinados com a SECRET_KEY) da exportação em fluxo"""
+
+    def __init__(self, secret_key: str):
+        self._serializer = URLSafeSerializer(secret_key, salt='exportacao')
+
+    def gerar(self, consulta: Dict, periodo: int, posicao: int, versao: Optional[tuple]) -> str:
+        return self._serializer.dumps({'c': consulta, 'p': int(periodo), 'o': int(posicao),
+                                       'v': list(versao) if versao else None})
+
+    def ler(self, cursor: str) -> Dict:
+        """{'consulta', 'inicio': (período, posição), 'versao'}"""
+        try:
+            dados = self._serializer.loads(cursor)
+            return {'consulta': dados['c'], 'inicio': (int(dados['p']), int(dados['o'])),
+                    'versao': tuple(dados['v']) if dados['v'] else None}
+        except (BadSignature, KeyError, TypeError, ValueError) as e:
+            raise CursorInvalido(str(e)) from None
+
+
+def codificar(df: pd.DataFrame, formato: str, cabecalho: bool = False) -> bytes:
+    """Um bloco de linhas em NDJSON (uma linha JSON por registro) ou CSV"""
+    df = df[[col for col in COLUNAS_EXPORTACAO if col in df.columns]]
+    if formato == 'csv':
+        return df.to_csv(index=False, header=cabecalho).encode('utf-8')
+    return df.to_json(orient='records', lines=True, force_ascii=False).encode('utf-8')
+
+
+def fluxo(blocos: Iterable[pd.DataFrame], formato: str) -> Iterator[bytes]:
+    """Blocos codificados à medida que são lidos; o CSV leva cabeçalho só no primeiro"""
+    cabecalho = formato == 'csv'
+    for df in blocos:
+        if df.empty:
+            continue
+        yield codificar(df, formato, cabecalho)
+        cabecalho = False
+
+
+def esquema_arrow():
+    """Esquema fixo do download colunar: códigos com os tipos compactos, rótulos e UF como dicionário"""
+    rotulo = pa.dictionary(pa.int32(), pa.string())
+    tipos = {'ano': pa.uint16(), 'mes': pa.uint8(), 'ncm': pa.uint32(), 'descricao_ncm': rotulo,
+             'cod_pais': pa.uint16(), 'pais': rotulo, 'uf': rotulo, 'cod_via': pa.uint8(), 'via': rotulo,
+             'CO_URF': pa.uint32(), 'CO_UNID': pa.uint8(), 'quantidade': pa.int64(),
+             'peso_kg': pa.int64(), 'valor_fob': pa.int64()}
+    return pa.schema([(col, tipos[col]) for col in COLUNAS_EXPORTACAO])
+
+
+def conformar(lote, esquema):
+    """Lote na ordem e nos tipos do esquema (colunas ausentes na origem ficam nulas)"""
+    nomes = lote.schema.names
+    colunas = [lote.column(campo.name).cast(campo.type) if campo.name in nomes
+               else pa.nulls(lote.num_rows, campo.type) for campo in esquema]
+    return pa.RecordBatch.from_arrays(colunas, schema=esquema)
+
+
+class _Saida:
+    """Destino de escrita do pyarrow que guarda os bytes até o fluxo entregá-los"""
+
+    def __init__(self):
+        self.partes = []
+        self.closed = False
+        self._posicao = 0
+
+    def write(self, dados) -> int:
+        dados = bytes(dados)
+        self.partes.append(dados)
+        self._posicao += len(dados)
+        return len(dados)
+
+    def tell(self) -> int:
+        return self._posicao
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def esvaziar(self) -> bytes:
+        dados, self.partes = b''.join(self.partes), []
+        return dados
+
+
+def fluxo_colunar(lotes: Iterable, formato: str, compressao: Optional[str] = None) -> Iterator[bytes]:
+    """
+    Lotes Arrow em Arrow IPC stream ou Parquet, entregues à medida que são
+    escritos. Lotes pequenos (filtros seletivos) são agrupados até
+    BULK_GROUP_ROWS linhas, de modo que a memória depende do grupo, não do total.
+    """
+    esquema = esquema_arrow()
+    saida = _Saida()
+    compressao = None if compressao in (None, 'none') else compressao
+    if formato == 'parquet':
+        escritor = pq.ParquetWriter(saida, esquema, compression=compressao or 'none')
+    else:
+        escritor = pa.ipc.new_stream(saida, esquema, options=pa.ipc.IpcWriteOptions(compression=compressao))
+
+    def escrever(grupo):
+        # Um só dicionário por coluna no grupo: sem substituições no IPC e com dicionário no Parquet
+        escritor.write_table(pa.Table.from_batches(grupo, esquema).unify_dictionaries())
+
+    grupo, linhas = [], 0
+    for lote in lotes:
+        grupo.append(conformar(lote, esquema))
+        linhas += lote.num_rows
+        if linhas >= BULK_GROUP_ROWS:
+            escrever(grupo)
+            grupo, linhas = [], 0
+            dados = saida.esvaziar()
+            if dados:
+                yield dados
+    if grupo:
+        escrever(grupo)
+    escritor.close()
+    yield saida.esvaziar()
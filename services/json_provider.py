@@ -0,0 +1,51 @@
+"""
+Provedor JSON do Flask: uma única codificação de cada resposta com orjson,
+que serializa arrays e escalares NumPy nativamente (gráficos ficam como
+dicionários até o jsonify final). Sem orjson, usa o encoder do Plotly.
+"""
+import json
+from datetime import date
+
+import numpy as np
+import pandas as pd
+from flask.json.provider import DefaultJSONProvider
+from plotly.utils import PlotlyJSONEncoder
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional: sem ele as respostas saem pelo json da stdlib
+    orjson = None
+
+_OPCOES = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+
+def _padrao(obj):
+    """Tipos que o orjson não serializa sozinho (pandas, arrays não contíguos, datas)"""
+    if isinstance(obj, (pd.Series, pd.Index, pd.Categorical)):
+        return obj.tolist()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if obj is pd.NaT or obj is pd.NA:
+        return None
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Tipo não serializável em JSON: {type(obj).__name__}")
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """NaN/Infinity viram null (JSON válido), como no to_json do Plotly"""
+
+    def dumps(self, obj, **kwargs) -> str:
+        if orjson is not None:
+            return orjson.dumps(obj, default=_padrao, option=_OPCOES).decode()
+        return json.dumps(obj, cls=PlotlyJSONEncoder)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        if orjson is not None:
+            corpo = orjson.dumps(obj, default=_padrao, option=_OPCOES)
+        else:
+            corpo = json.dumps(obj, cls=PlotlyJSONEncoder)
+        return self._app.response_class(corpo, mimetype=self.mimetype)
@@ -1,9307 +0,0 @@
-"""
-Dicionário de NCMs - Gerado automaticamente
-"""
-
-NCM_COMPLETO = {
-    '01012100': 'Cavalos reprodutores de raça pura',
-    '01012900': 'Cavalos vivos, exceto reprodutores de raça pura',
-    '01013000': 'Animais da espécie asinina/muar, reprodutores de raça pura',
-    '01019000': 'Animais vivos das espécies cavalar, asinina e muar, exceto reprodutores raça pura',
-    '01022110': 'Bovinos domésticos reprodutores de raça pura',
-    '01022190': 'Bovinos domésticos reprodutores de raça pura',
-    '01022911': 'Outros bovinos domésticos',
-    '01022919': 'Outros bovinos domésticos',
-    '01022990': 'Outros bovinos domésticos',
-    '01023110': 'Búfalos reprodutores de raça pura',
-    '01023919': 'Outros búfalos',
-    '01023990': 'Outros búfalos',
-    '01029000': 'Outros bovinos vivos',
-    '01031000': 'Suínos reprodutores de raça pura',
-    '01039100': 'Outros suínos vivos de peso inferior a 50 kg',
-    '01039200': 'Outros suínos vivos de peso igual ou superior a 50 kg',
-    '01041011': 'Ovinos vivos',
-    '01041019': 'Ovinos vivos',
-    '01041090': 'Ovinos vivos',
-    '01042090': 'Caprinos vivos',
-    '01051110': 'Galos e galinhas vivos, das espécies domésticas, de peso não superior a 185 g',
-    '01051190': 'Galos e galinhas vivos, das espécies domésticas, de peso não superior a 185 g',
-    '01051200': 'Peruas e perus vivos, da espécie doméstica, de peso não superior a 185 g',
-    '01051300': 'Patos',
-    '01051400': 'Gansos',
-    '01059900': 'Patos, gansos, perus, galinhas d\'angola e outras aves vivas, das espécies domésticas, de peso superior a 185 g',
-    '01061200': 'Baleias, golfinhos e marsuínos; peixes-boi e dugongos, vivos',
-    '01061300': 'Camelos e outros camelídeos (camelidae)',
-    '01061900': 'Outros mamíferos vivos',
-    '01062000': 'Répteis vivos (incluídos as serpentes e tartarugas marinhas)',
-    '01063100': 'Aves de rapina vivas',
-    '01063200': 'Psitaciformes vivos (incluídos os papagaios, os periquitos, as araras e as cacatuas)',
-    '01063310': 'Avestruzes; emus (Dromaius novaehollandiae)',
-    '01063390': 'Avestruzes; emus (Dromaius novaehollandiae)',
-    '01063900': 'Outras aves vivas',
-    '01064100': 'Abelhas',
-    '01064900': 'Outros insetos',
-    '01069000': 'Outros animais vivos',
-    '02011000': 'Carcaças e meias carcaças de bovino, frescas ou refrigeradas',
-    '02012010': 'Outras peças de bovino, não desossadas, frescas ou refrigeradas',
-    '02012020': 'Outras peças de bovino, não desossadas, frescas ou refrigeradas',
-    '02012090': 'Outras peças de bovino, não desossadas, frescas ou refrigeradas',
-    '02013000': 'Carnes de bovino, desossadas, frescas ou refrigeradas',
-    '02021000': 'Carcaças e meias-carcaças de bovino, congeladas',
-    '02022010': 'Outras peças de bovino, não desossadas, congeladas',
-    '02022020': 'Outras peças de bovino, não desossadas, congeladas',
-    '02022090': 'Outras peças de bovino, não desossadas, congeladas',
-    '02023000': 'Carnes de bovino, desossadas, congeladas',
-    '02031100': 'Carcaças e meias-carcaças de suíno, frescas ou refrigeradas',
-    '02031200': 'Pernas, pás e pedaços de suíno, não desossados, frescos ou refrigerados',
-    '02031900': 'Outras carnes de suíno, frescas ou refrigeradas',
-    '02032100': 'Carcaças e meias-carcaças de suíno, congeladas',
-    '02032200': 'Pernas, pás e pedaços de suínos, não desossados, congelados',
-    '02032900': 'Outras carnes de suíno, congeladas',
-    '02041000': 'Carcaças e meias-carcaças de cordeiro, frescas ou refrigeradas',
-    '02042100': 'Carcaças e meias-carcaças de ovino, frescas ou refrigeradas',
-    '02042200': 'Outras carnes de ovino, não desossadas, frescas ou refrigeradas',
-    '02042300': 'Carnes de ovino, desossadas, frescas ou refrigeradas',
-    '02043000': 'Carcaças e meias-carcaças de cordeiro, congeladas',
-    '02044100': 'Carcaças e meias-carcaças, de ovino, congeladas',
-    '02044200': 'Outras carnes de ovino, não desossadas, congeladas',
-    '02044300': 'Carnes de ovino, desossadas, congeladas',
-    '02045000': 'Carnes de caprino, frescas, refrigeradas ou congeladas',
-    '02050000': 'Carnes de cavalo, asinino e muar, frescas, refrigeradas ou congeladas',
-    '02061000': 'Miudezas comestíveis de bovino, frescas ou refrigeradas',
-    '02062100': 'Línguas de bovino, congeladas',
-    '02062200': 'Fígados de bovino, congelados',
-    '02062910': 'Outras miudezas comestíveis de bovino, congeladas',
-    '02062990': 'Outras miudezas comestíveis de bovino, congeladas',
-    '02063000': 'Miudezas comestíveis de suíno, frescas ou refrigeradas',
-    '02064100': 'Fígados de suíno, congelados',
-    '02064900': 'Outras miudezas comestíveis de suíno, congeladas',
-    '02068000': 'Miudezas comestíveis das espécies ovino, caprino, cavalar, asinino e muar, frescas ou refrigeradas',
-    '02069000': 'Miudezas comestíveis das espécies ovino, caprino, cavalar, asinino e muar, congeladas',
-    '02071100': 'Carnes de galos e galinhas da espécie doméstica, não cortadas em pedaços, frescas ou refrigeradas',
-    '02071200': 'Carnes de galos e galinhas da espécie doméstica não cortadas em pedaços, congeladas',
-    '02071210': 'Carnes de galos e galinhas da espécie doméstica não cortadas em pedaços, congeladas',
-    '02071220': 'Carnes de galos e galinhas da espécie doméstica não cortadas em pedaços, congeladas',
-    '02071300': 'Pedaços e miudezas comestíveis, de galos e galinhas da espécie doméstica, frescos ou refrigerados',
-    '02071400': 'Pedaços e miudezas comestíveis de galos e galinhas da espécie doméstica, congelados',
-    '02071411': 'Pedaços e miudezas comestíveis de galos e galinhas da espécie doméstica, congelados',
-    '02071412': 'Pedaços e miudezas comestíveis de galos e galinhas da espécie doméstica, congelados',
-    '02071413': 'Pedaços e miudezas comestíveis de galos e galinhas da espécie doméstica, congelados',
-    '02071419': 'Pedaços e miudezas comestíveis de galos e galinhas da espécie doméstica, congelados',
-    '02071421': 'Pedaços e miudezas comestíveis de galos e galinhas da espécie doméstica, congelados',
-    '02071422': 'Pedaços e miudezas comestíveis de galos e galinhas da espécie doméstica, congelados',
-    '02071423': 'Pedaços e miudezas comestíveis de galos e galinhas da espécie doméstica, congelados',
-    '02071424': 'Pedaços e miudezas comestíveis de galos e galinhas da espécie doméstica, congelados',
-    '02071429': 'Pedaços e miudezas comestíveis de galos e galinhas da espécie doméstica, congelados',
-    '02071431': 'Pedaços e miudezas comestíveis de galos e galinhas da espécie doméstica, congelados',
-    '02071432': 'Pedaços e miudezas comestíveis de galos e galinhas da espécie doméstica, congelados',
-    '02071433': 'Pedaços e miudezas comestíveis de galos e galinhas da espécie doméstica, congelados',
-    '02071434': 'Pedaços e miudezas comestíveis de galos e galinhas da espécie doméstica, congelados',
-    '02071439': 'Pedaços e miudezas comestíveis de galos e galinhas da espécie doméstica, congelados',
-    '02072400': 'Carnes de peruas e de perus, da espécie doméstica, não cortadas em pedaços, frescas ou refrigeradas',
-    '02072500': 'Carnes de peruas e de perus, da espécie doméstica, não cortadas em pedaços, congeladas',
-    '02072600': 'Carnes de peruas e de perus, da espécie doméstica, em pedaços e miudezas comestíveis, frescas ou refrigeradas',
-    '02072700': 'Carnes de peruas e de perus, da espécie doméstica, em pedaços e miudezas comestíveis, congeladas',
-    '02074100': 'Carnes de patos, não cortadas em pedaços, frescas ou refrigeradas',
-    '02074200': 'Carnes de patos, não cortadas em pedaços, congeladas',
-    '02074400': 'Outras carnes de patos, frescas ou refrigeradas',
-    '02074500': 'Outras carnes de patos, congeladas',
-    '02075200': 'Carnes de gansos, não cortadas em pedaços, congeladas',
-    '02075500': 'Outras carnes de gansos, congeladas',
-    '02076000': 'Carnes de galinhas dangola (pintadas)',
-    '02081000': 'Carnes e miudezas comestíveis de coelhos ou de lebres, frescas, refrigeradas ou congeladas',
-    '02084000': 'Carnes e miudezas comestíveis de baleias, golfinhos, marsuínos, peixes-boi e dugongos, frescas, refrigeradas ou congeladas',
-    '02085000': 'Carnes e miudezas comestíveis de répteis (incluídas as serpentes e as tartarugas marinhas), frescas, refrigeradas ou congeladas',
-    '02089000': 'Carnes e miudezas comestíveis de outros animais, frescas, refrigeradas ou congeladas',
-    '02091011': 'Toucinhos ou gorduras, de porco',
-    '02091019': 'Toucinhos ou gorduras, de porco',
-    '02091021': 'Toucinhos ou gorduras, de porco',
-    '02091029': 'Toucinhos ou gorduras, de porco',
-    '02099000': 'Outros toucinhos e gorduras',
-    '02101100': 'Pernas, pás e pedaços de suíno, não desossados, salgados ou em salmoura, secos ou defumados',
-    '02101200': 'Barrigas e peitos, entremeados, e seus pedaços, de suíno, salgados ou em salmoura, secos ou defumados',
-    '02101900': 'Outras carnes de suíno, salgadas ou em salmoura, secas, defumadas',
-    '02102000': 'Carnes de bovinos, salgadas ou em salmoura, secas ou defumadas',
-    '02109100': 'Carnes de primatas, comestíveis, salgadas, secas ou defumadas; miudezas, farinhas e pós',
-    '02109300': 'Carnes de répteis (incluídas as serpentes e as tartarugas marinhas), comestíveis, salgadas, secas ou defumadas; miudezas, farinhas e pós',
-    '02109911': 'Carnes de outros animais, comestíveis, salgadas, secas ou defumadas; miudezas, farinhas e pós',
-    '02109919': 'Carnes de outros animais, comestíveis, salgadas, secas ou defumadas; miudezas, farinhas e pós',
-    '02109920': 'Carnes de outros animais, comestíveis, salgadas, secas ou defumadas; miudezas, farinhas e pós',
-    '02109940': 'Carnes de outros animais, comestíveis, salgadas, secas ou defumadas; miudezas, farinhas e pós',
-    '02109990': 'Carnes de outros animais, comestíveis, salgadas, secas ou defumadas; miudezas, farinhas e pós',
-    '03011110': 'Peixes ornamentais de água doce',
-    '03011190': 'Peixes ornamentais de água doce',
-    '03011900': 'Outros peixes ornamentais vivos',
-    '03019190': 'Trutas vivas',
-    '03019510': 'Atuns-do-sul (Thunnus maccoyii) vivos',
-    '03019911': 'Outros peixes vivos',
-    '03019991': 'Outros peixes vivos',
-    '03019999': 'Outros peixes vivos',
-    '03021100': 'Trutas frescas ou refrigeradas, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03021300': 'Salmões-do-pacífico (Oncorhynchus nerka, etc), fresco ou refrigerado',
-    '03021400': 'Salmão-do-atlântico e salmão-do-danúbio, fresco ou refrigerado',
-    '03021900': 'Outros salmonídeos frescos ou refrigerados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03022100': 'Linguados-gigantes, frescos ou refrigerados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03022300': 'Linguados frescos ou refrigerados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03022400': 'Pregado (Psetta maxima), fresco ou refrigerado',
-    '03022900': 'Outros peixes chatos, frescos ou refrigerados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03023100': 'Atuns-brancos ou germões, frescos ou refrigerados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03023200': 'Albacoras ou atuns-de-barbatanas-amarelas, frescos ou refrigerados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03023300': 'Bonitos, frescos ou refrigerados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03023400': 'Albacoras-bandolim (patudos), frescos ou refrigerados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03023500': 'Albacoras-azuis (atuns-azuis), frescos ou refrigerados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03023600': 'Atuns do sul, frescos ou refrigerados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03023900': 'Outros atuns frescos ou refrigerados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03024100': 'Arenques (Clupea harengus, Clupea pallasii), fresco ou refrigerado',
-    '03024210': 'Anchovas (Engraulis spp.)',
-    '03024290': 'Anchovas (Engraulis spp.)',
-    '03024300': 'Sardinhas (Sardina pilchardus,etc), anchoveta, frescos ou refrigerado',
-    '03024400': 'Cavalinhas, frescas ou refrigeradas',
-    '03024500': 'Chicharros (trachurus spp.), frescos ou refrigerados',
-    '03024600': 'Bijupira (Rachycentron canadum), frescas ou refrigeradas',
-    '03024700': 'Espadarte (Xiphias gladius), frescos ou refrigerados',
-    '03024910': 'Outros peixes frescos ou refrigerados, exceto os filés de peixes e outra carne de peixes da posição 03.04',
-    '03024990': 'Outros peixes frescos ou refrigerados, exceto os filés de peixes e outra carne de peixes da posição 03.04',
-    '03025100': 'Bacalhau-do-atlântico,da-groelândia.e do-pacífico, frescos ou refrigerados',
-    '03025400': 'Merluzas e abroteas (merluccius spp., urophycis spp.), fresco ou refrigerado',
-    '03025500': 'Merluza-do-alasca (Theragra chalcogramma), fresca ou refrigerada',
-    '03025900': 'Outros peixes das famílias bregmacerotidae, gadidae, etc.',
-    '03027100': 'Tilápias (oreochromis spp.), frescas ou refrigeradas',
-    '03027210': 'Bagres (Pangasius spp., Silurus spp., Clarias spp., Ictalurus spp.)',
-    '03027290': 'Bagres (Pangasius spp., Silurus spp., Clarias spp., Ictalurus spp.)',
-    '03027300': 'Carpas (cyprinus carpio, carassius carassius, etc.)',
-    '03027400': 'Enguias (anguilla spp.), frescas ou refrigeradas',
-    '03027900': 'Perca-do-nilo, peixe cabeça-de-serpente, fresco ou refrigerado',
-    '03028100': 'Cação e outros tubarões, frescos ou refrigerados',
-    '03028400': 'Robalos (Dicentrarchus spp.), frescos ou refrigerados',
-    '03028500': 'Pargos ou sargos (Sparidae), frescos ou refrigerados',
-    '03028910': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03028921': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03028922': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03028924': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03028931': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03028932': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03028933': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03028935': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03028936': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03028937': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03028938': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03028942': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03028943': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03028944': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03028990': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03029190': 'Fígados, ovas e gônadas masculinas, frescos ou refrigerados',
-    '03029900': 'Cabeças, caudas, bexigas-natatórias e outros subprodutos comestíveis de peixes',
-    '03031100': 'Salmões vermelhos, congelados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03031200': 'Outros salmões-do-pacífico, congelados',
-    '03031300': 'Salmão-do-atlântico e salmão-do-danúbio, congelados',
-    '03031400': 'Trutas (Salmo trutta, Oncorhynchus mykiss, etc.), congeladas',
-    '03031900': 'Outros tipos de salmões, congelados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03032300': 'Tilápias (oreochromis spp.), congeladas',
-    '03032410': 'Bagres (Pangasius spp., Silurus spp., Clarias spp., Ictalurus spp.)',
-    '03032490': 'Bagres (Pangasius spp., Silurus spp., Clarias spp., Ictalurus spp.)',
-    '03032600': 'Enguias congeladas (anguilla spp.), congeladas',
-    '03032900': 'Outros salmonídeos, congelados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03033100': 'Linguados-gigantes, congelados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03033300': 'Linguados, congelados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03033900': 'Outros peixes chatos, congelados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03034100': 'Atuns-brancos ou germões, congelados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03034200': 'Albacoras e atuns-de-barbatana-amarela, congelados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03034300': 'Bonitos-listrados ou do-ventre-raiado, congelados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03034400': 'Albacoras-bandolim (patudos), congelados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03034500': 'Albacoras-azuis (atuns-azuis), congelados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03034600': 'Atuns do sul, congelados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03034900': 'Outros atuns, congelados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03035100': 'Arenques (Clupea arengus, Clupea pallasii) congelados, exceto fígado, ovas, sêmen, ou filés e outras carnes da posição 0304',
-    '03035300': 'Sardinhas, congeladas',
-    '03035400': 'Cavalinhas, congeladas',
-    '03035500': 'Chicharros (trachurus spp.), congelados',
-    '03035700': 'Espadarte (Xiphias gladius), congelado',
-    '03035910': 'Outros peixes congelados, exceto os filés de peixes e outra carne de peixes da posição 03.04',
-    '03035920': 'Outros peixes congelados, exceto os filés de peixes e outra carne de peixes da posição 03.04',
-    '03035990': 'Outros peixes congelados, exceto os filés de peixes e outra carne de peixes da posição 03.04',
-    '03036300': 'Bacalhau-do-atlântico e bacalhau-do-pacífico, congelado',
-    '03036400': 'Haddock ou lubina (melanogrammus aeglefinus), congelado',
-    '03036500': 'Saithe (Pollachius virens), congelado',
-    '03036600': 'Merluzas e abroteas (Merluccius, Urophycis), congeladas',
-    '03036700': 'Merluza-do-alasca (Theragra chalcogramma)',
-    '03036910': 'Outros peixes de famílias específicas, exceto fígados, ovos e sêmen',
-    '03036990': 'Outros peixes de famílias específicas, exceto fígados, ovos e sêmen',
-    '03038111': 'Cação e outros tubarões',
-    '03038112': 'Cação e outros tubarões',
-    '03038113': 'Cação e outros tubarões',
-    '03038114': 'Cação e outros tubarões',
-    '03038119': 'Cação e outros tubarões',
-    '03038190': 'Cação e outros tubarões',
-    '03038200': 'Raias (rajidae), congeladas',
-    '03038329': 'Merluza negra e merluza antártica (Dissostichus spp.)',
-    '03038400': 'Robalos (dicentrarchus spp.), congelados',
-    '03038910': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03038920': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03038932': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03038933': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03038941': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03038942': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03038943': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03038945': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03038951': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03038952': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03038953': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03038954': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03038955': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03038956': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03038961': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03038962': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03038963': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03038964': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03038965': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03038990': 'Outros peixes, exceto fígados, ovas e sêmen',
-    '03039100': 'Fígados, ovas e gônadas masculinas, congelado',
-    '03039110': 'Fígados, ovas e gônadas masculinas, congelado',
-    '03039190': 'Fígados, ovas e gônadas masculinas, congelado',
-    '03039920': 'Outros subprodutos comestíveis de peixes, congelado',
-    '03039990': 'Outros subprodutos comestíveis de peixes, congelado',
-    '03043100': 'Filés de tilápias (frescos, refrigerados ou congelados)',
-    '03043210': 'Filés de bagres (Pangasius spp., Silurus spp., Clarias spp., Ictalurus spp.), frescos ou refrigerados',
-    '03043290': 'Filés de bagres (Pangasius spp., Silurus spp., Clarias spp., Ictalurus spp.), frescos ou refrigerados',
-    '03043900': 'Filés/outras carnes de outros peixes, frescos, refrigerados ou congelados',
-    '03044100': 'Filés de salmões-do-pacifico e salmão-do-danúbio',
-    '03044200': 'Filés de truta (Almo trutta, Oncorhynchus mykiss, etc)',
-    '03044300': 'Filés de peixes chatos (pleuronectidae, soleidae, etc)',
-    '03044400': 'Filés de peixes das famílias bregmacerotidae, etc',
-    '03044500': 'Filés e outras carnes de espadarte (Xyphias gladius)',
-    '03044600': 'Filés de merluza negra e merluza antártica',
-    '03044700': 'Filés de cação e outros tubarões, frescos ou refrigerados',
-    '03044800': 'Filés de raias (Rajidae), frescos ou refrigerados',
-    '03044910': 'Filés de outros peixes, frescos ou refrigerados',
-    '03044920': 'Filés de outros peixes, frescos ou refrigerados',
-    '03044990': 'Filés de outros peixes, frescos ou refrigerados',
-    '03045100': 'Filés de tilápia, bagre, carpa, enguias, fresco ou refrigerado',
-    '03045200': 'Filé e outras carnes de salmonídeos, fresco ou refrigerado',
-    '03045500': 'Filés de merluza negra e merluza antártica, fresco ou refrigerado',
-    '03045900': 'Outros filés de peixes, frescos ou refrigerados',
-    '03046100': 'Filés de tilápias (Oreochromis spp.), congelados',
-    '03046210': 'Filés de bagres (Pangasius spp., Silurus spp., Clarias spp., Ictalurus spp.), congelado',
-    '03046290': 'Filés de bagres (Pangasius spp., Silurus spp., Clarias spp., Ictalurus spp.), congelado',
-    '03046900': 'Filé de peixe cabeça-de-serpente, congelado',
-    '03047100': 'Filé de bacalhau-do-atlântico, da-groenlândia, do-pacífico, congelado',
-    '03047300': 'Filé de saithe (Pollachius virens), congelado',
-    '03047400': 'Filés de merluzas e abroteas, congelados',
-    '03047500': 'Filé de merluza-do-alasca (Theragra chalcogramma), congelados',
-    '03047900': 'Outros filés de peixes, congelados',
-    '03048100': 'Filé de salmão-do-pacífico, do-danúbio, do-atlântico, congelados',
-    '03048200': 'Filés de trutas, congelados',
-    '03048300': 'Filés de peixes chatos, congelados',
-    '03048600': 'Filés de arenques (Clupea harengus, Clupea pallasii), congelados',
-    '03048700': 'Filés de atuns e bonito-listrado, congelados',
-    '03048810': 'Filés de cação e outros tubarões, e filés de rais (Rajidae), congelado',
-    '03048890': 'Filés de cação e outros tubarões, e filés de rais (Rajidae), congelado',
-    '03048910': 'Filés de outros peixes, congelados',
-    '03048920': 'Filés de outros peixes, congelados',
-    '03048930': 'Filés de outros peixes, congelados',
-    '03048990': 'Filés de outros peixes, congelados',
-    '03049100': 'Outras carnes de espadartes (Xiphias gladius) exceto filés, mesmo picadas, frescas, refrigeradas ou congeladas',
-    '03049219': 'Outras carnes de marlongas (Dissostichus spp.) exceto filés, mesmo picadas, frescas, refrigeradas ou congeladas',
-    '03049221': 'Outras carnes de marlongas (Dissostichus spp.) exceto filés, mesmo picadas, frescas, refrigeradas ou congeladas',
-    '03049222': 'Outras carnes de marlongas (Dissostichus spp.) exceto filés, mesmo picadas, frescas, refrigeradas ou congeladas',
-    '03049229': 'Outras carnes de marlongas (Dissostichus spp.) exceto filés, mesmo picadas, frescas, refrigeradas ou congeladas',
-    '03049300': 'Outras carnes de tilápias, bagres, carpas, enguias (congeladas)',
-    '03049400': 'Outras carnes de merluza-do-alasca, congeladas',
-    '03049500': 'Peixes de famílias diversas, exceto a merluza-do-alasca',
-    '03049600': 'Filés de cação e outros tubarões, frescos, refrigerados ou congelados',
-    '03049900': 'Carnes de outros peixes, exceto filés, mesmo picadas, congeladas',
-    '03051000': 'Farinhas, pós e pellets de peixes, para alimentação humana',
-    '03052000': 'Fígados, ovas e sêmen de peixes, secos, defumados, salgados ou em salmoura',
-    '03052010': 'Fígados, ovas e sêmen de peixes, secos, defumados, salgados ou em salmoura',
-    '03052090': 'Fígados, ovas e sêmen de peixes, secos, defumados, salgados ou em salmoura',
-    '03053210': 'Filés de peixes de famílias específicas, não defumado',
-    '03053220': 'Filés de peixes de famílias específicas, não defumado',
-    '03053290': 'Filés de peixes de famílias específicas, não defumado',
-    '03053900': 'Filés de outros peixes, não defumado',
-    '03054100': 'Salmões-do-pacífico, do-atlântico e do-danúbio, defumados, mesmo em filés',
-    '03054300': 'Truta defumada, mesmo em filés',
-    '03054910': 'Outros peixes, defumados, mesmo em filés',
-    '03054920': 'Outros peixes, defumados, mesmo em filés',
-    '03054990': 'Outros peixes, defumados, mesmo em filés',
-    '03055100': 'Bacalhaus secos, mesmo salgados, mas não defumados',
-    '03055310': 'Peixes das famílias Bregmacerotidae, Euclichthyidae, Gadidae, Macrouridae, Melanonidae, Merlucciidae, Moridae e Muraenolepididae, exceto bacalhau (Gadus morhua, Gadus ogac, Gadus macrocephalus), secos, mesmo salgados, mas não defumados',
-    '03055390': 'Peixes das famílias Bregmacerotidae, Euclichthyidae, Gadidae, Macrouridae, Melanonidae, Merlucciidae, Moridae e Muraenolepididae, exceto bacalhau (Gadus morhua, Gadus ogac, Gadus macrocephalus), secos, mesmo salgados, mas não defumados',
-    '03055400': 'Peixes secos, exceto subprodutos comestíveis de peixes, mesmo salgados, mas não defumados: arenques, sardinhas e sardinelas, anchoveta, cavalinhas, cavalas-do-índico, serras, carapaus, xaréus, bijupirá, pampos-prateado, agulhão-do-japão, charros, etc.',
-    '03055900': 'Outros peixes secos, mesmo salgados, mas não defumados',
-    '03056100': 'Arenques salgados e em salmoura, não secos nem defumados',
-    '03056200': 'Bacalhaus salgados e em salmoura, não secos nem defumados',
-    '03056300': 'Anchovas salgadas e em salmoura, não secas nem defumadas',
-    '03056910': 'Outros peixes salgados e em salmoura, não secos nem defumados',
-    '03056990': 'Outros peixes salgados e em salmoura, não secos nem defumados',
-    '03057100': 'Barbatanas de tubarão',
-    '03057200': 'Cabeças, caudas e bexigas natatórias, de peixes',
-    '03057900': 'Outros desperdicios comestíveis, de peixes',
-    '03061110': 'Lagostas congeladas',
-    '03061190': 'Lagostas congeladas',
-    '03061200': 'Lavagantes (homards) congelados',
-    '03061400': 'Caranguejos congelados',
-    '03061500': 'Lagosta norueguesa (nephrops norvegicus)',
-    '03061610': 'Camarões de água fria (Pandalus spp., Crangon crangon),congelados',
-    '03061690': 'Camarões de água fria (Pandalus spp., Crangon crangon),congelados',
-    '03061710': 'Outros camarões, congelados',
-    '03061790': 'Outros camarões, congelados',
-    '03061990': 'Outros crustáceos congelados, incluídos as farinhas, pós e pellets próprios para alimentação humana',
-    '03063100': 'Lagostas (Palinurus spp., Panulirus spp., Jasus spp.), vivas, frescos ou refrigerados',
-    '03063300': 'Caranguejos vivos, frescos ou refrigerados',
-    '03063400': 'Lagosta norueguesa (Lagostim) (Nephrops norvegicus), viva, frescos ou refrigerados',
-    '03063500': 'Camarões de água fria (Pandalus spp., Crangon crangon), vivos, frescos ou refrigerados',
-    '03063600': 'Outros camarões, vivos, frescos ou refrigerados',
-    '03063910': 'Outros crustáceos, incluindo as farinhas, pós e pellets de crustáceos, próprios para alimentação humana',
-    '03063990': 'Outros crustáceos, incluindo as farinhas, pós e pellets de crustáceos, próprios para alimentação humana',
-    '03069100': 'Lagostas (Palinurus spp., Panulirus spp., Jasus spp.)',
-    '03069300': 'Caranguejos',
-    '03069400': 'Lagosta norueguesa (Lagostim) (Nephrops norvegicus)',
-    '03069500': 'Camarões',
-    '03069910': 'Outros crustáceos, incluindo as farinhas, pós e pellets de crustáceos, próprios para alimentação humana',
-    '03069990': 'Outros crustáceos, incluindo as farinhas, pós e pellets de crustáceos, próprios para alimentação humana',
-    '03071100': 'Ostras vivas, frescas ou refrigeradas',
-    '03071200': 'Ostras, congeladas',
-    '03072100': 'Vieiras e outros mariscos (gêneros pecten, chlamys ou placopecten) vivos, frescos ou refrigerados',
-    '03072200': 'Vieiras, incluindo a americana, e outros moluscos dos gêneros Pecten, Chlamys ou Placopecten, congeladas',
-    '03072900': 'Vieiras e outros mariscos (gêneros pecten, chlamys ou placopecten) congelados, secos, salgados ou em salmoura',
-    '03073100': 'Mexilhões (Mytilus spp., Perna spp.) vivos, frescos ou refrigerados',
-    '03073200': 'Mexilhões (Mytilus spp., Perna spp.), congelados',
-    '03073900': 'Mexilhões (Mytilus spp., Perna spp.) congelados, secos, salgados ou em salmoura',
-    '03074200': 'Sépias (Chocos) (Chocos e chopos); lulas (potas e lulas), vivas, frescas ou refrigeradas',
-    '03074310': 'Lulas e sépias, congeladas',
-    '03074320': 'Lulas e sépias, congeladas',
-    '03074900': 'Sibas, sepiolas, potas e lulas, congelados, secos, salgados ou em salmoura',
-    '03075100': 'Polvos (Octopus spp.) vivos, frescos ou refrigerados',
-    '03075200': 'Polvos (Octopus spp.), congelados',
-    '03075900': 'Polvos (Octopus spp.) congelados, secos, salgados ou em salmoura',
-    '03076000': 'Caracóis, exceto os do mar, vivos, frescos, refrigerados, congelados, secos, salgados ou em salmoura',
-    '03077100': 'Ameijoas, berbigões e arcas, vivos, frescos ou refrigerados',
-    '03077200': 'Amêijoas, berbigões e arcas (famílias Arcidae, Arcticidae, Cardiidae, Donacidae, Hiatellidae, Mactridae, Mesodesmatidae, Myidae, Semelidae, Solecurtidae, Solenidae, Tridacnidae e Veneridae), congelados',
-    '03077900': 'Ameijoas, berbigões e arcas, em outras formas',
-    '03079100': 'Outros moluscos, invertebrados aquáticos, exceto os crustáceos, vivos, frescos ou refrigerados, incluídos as farinhas, pós e pellets próprios para alimentação humana',
-    '03079200': 'Outros moluscos, incluindo as farinhas, pós e pellets, próprios para alimentação humana, congelados',
-    '03079900': 'Outros moluscos, invertebrados aquáticos, exceto os crustáceos, congelados, secos, salgados ou em salmoura, incluídos as farinhas, pós e pellets próprios para alimentação humana',
-    '03081200': 'Pepinos-do-mar (Stichopus japonicus, Holothuroidea), congelados',
-    '03081900': 'Pepinos-do-mar, em outras formas',
-    '03091000': 'Farinhas, pós e  "pellets " de peixes, para alimentação humana',
-    '03099000': 'Farinhas, refeições e pellets de crustáceos, moluscos e outros invertebrados aquáticos, próprios para consumo humano',
-    '04011010': 'Leite e creme de leite não concentrados, não adocicados, com um teor, em peso, de matérias gordas <= 1%',
-    '04011090': 'Leite e creme de leite não concentrados, não adocicados, com um teor, em peso, de matérias gordas <= 1%',
-    '04012010': 'Leite e creme de leite, não concentrados, não adocicados, com um teor, em peso, de matérias gordas superior a 1% e <= 6%',
-    '04012090': 'Leite e creme de leite, não concentrados, não adocicados, com um teor, em peso, de matérias gordas superior a 1% e <= 6%',
-    '04014010': 'Leite e creme de leite, com teor em peso, de matérias gordas, superior a 6 %, mas não superior a 10 %',
-    '04014021': 'Leite e creme de leite, com teor em peso, de matérias gordas, superior a 6 %, mas não superior a 10 %',
-    '04014029': 'Leite e creme de leite, com teor em peso, de matérias gordas, superior a 6 %, mas não superior a 10 %',
-    '04015010': 'Leite e creme de leite, com teor em peso, de matérias gordas, superior a 10 %',
-    '04015021': 'Leite e creme de leite, com teor em peso, de matérias gordas, superior a 10 %',
-    '04015029': 'Leite e creme de leite, com teor em peso, de matérias gordas, superior a 10 %',
-    '04021010': 'Leite em pó, grânulos ou outras formas sólidas, concentrados ou adocicados, com um teor, em peso, de matérias gordas <= 1,5%',
-    '04021090': 'Leite em pó, grânulos ou outras formas sólidas, concentrados ou adocicados, com um teor, em peso, de matérias gordas <= 1,5%',
-    '04022110': 'Leite em pó, grânulos ou outras formas sólidas, com um teor, em peso, de matérias gordas superior a 1,5%, concentrados, não adocicados',
-    '04022120': 'Leite em pó, grânulos ou outras formas sólidas, com um teor, em peso, de matérias gordas superior a 1,5%, concentrados, não adocicados',
-    '04022130': 'Leite em pó, grânulos ou outras formas sólidas, com um teor, em peso, de matérias gordas superior a 1,5%, concentrados, não adocicados',
-    '04022910': 'Leite em pó, grânulos ou outras formas sólidas, com um teor, em peso, de matérias gordas superior a 1,5%, adocicados',
-    '04022920': 'Leite em pó, grânulos ou outras formas sólidas, com um teor, em peso, de matérias gordas superior a 1,5%, adocicados',
-    '04022930': 'Leite em pó, grânulos ou outras formas sólidas, com um teor, em peso, de matérias gordas superior a 1,5%, adocicados',
-    '04029100': 'Outros leites, cremes de leite, concentrados, não adocicados',
-    '04029900': 'Outros leites, cremes de leite, concentrados, adocicados',
-    '04031000': 'Iogurte, mesmo aromatizado ou adicionado de açúcar ou de outros edulcorantes, de frutas ou de cacau',
-    '04032000': 'Iogurte',
-    '04039000': 'Leitelho, leite, creme de leite, coalhados, quefir e outros leites e cremes de leite, fermentados ou acidificados, mesmo concentrados, adocicados ou aromatizados',
-    '04041000': 'Soro de leite, modificado ou não, mesmo concentrado ou adocicado',
-    '04049000': 'Outros produtos constituídos do leite, mesmo concentrados ou adocicados',
-    '04051000': 'Manteiga',
-    '04052000': 'Pastas de espalhar (barrar) de produtos provenientes do leite',
-    '04059010': 'Óleo butírico de manteiga (butter oil) e outras matérias gordas provenientes do leite',
-    '04059090': 'Óleo butírico de manteiga (butter oil) e outras matérias gordas provenientes do leite',
-    '04061010': 'Queijos frescos (não curados), incluído o queijo do soro de leite e o requeijão',
-    '04061090': 'Queijos frescos (não curados), incluído o queijo do soro de leite e o requeijão',
-    '04062000': 'Queijos ralados ou em pó, de qualquer tipo',
-    '04063000': 'Queijos fundidos, exceto ralados ou em pó',
-    '04064000': 'Queijos de pasta mofada (azul)',
-    '04069010': 'Outros queijos',
-    '04069020': 'Outros queijos',
-    '04069030': 'Outros queijos',
-    '04069090': 'Outros queijos',
-    '04071100': 'Ovos de aves da espécie Gallus domesticus, para incubação',
-    '04071900': 'Ovos de outras aves, destinados para incubação',
-    '04072100': 'Ovos frescos de aves da espécie Gallus domesticus',
-    '04072900': 'Ovos frescos de outras aves',
-    '04079000': 'Ovos de outras aves, não para incubação ou não frescos',
-    '04081100': 'Gemas de ovos, secas, mesmo adicionadas de açúcar',
-    '04081900': 'Gemas de ovos, frescas, cozidas em água ou vapor, congeladas ou preservadas de outro modo, mesmo adicionadas de açúcar',
-    '04089100': 'Ovos de aves, sem casca, secos, mesmo adicionados de açúcar',
-    '04089900': 'Outros ovos de aves, sem casca, frescos, cozidos em água ou vapor, congelados ou preservados de outro modo, mesmo adicionados de açúcar',
-    '04090000': 'Mel natural',
-    '04100000': 'Outros produtos comestíveis de origem animal',
-    '04101000': 'Insetos',
-    '04109000': 'Outros produtos comestíveis de origem animal, não especificados ou incluídos em outros lugares',
-    '05010000': 'Cabelos em bruto, mesmo lavados e desengordurados; desperdícios de cabelo',
-    '05021011': 'Cerdas de porco ou de javali e seus desperdícios',
-    '05021019': 'Cerdas de porco ou de javali e seus desperdícios',
-    '05021090': 'Cerdas de porco ou de javali e seus desperdícios',
-    '05029010': 'Pêlos de texugo, outros pelos e desperdícios de pêlos para escovas, pincéis e artigos semelhantes',
-    '05040011': 'Tripas, bexigas e estômagos de animais, exceto peixes, inteiros ou em pedaços, frescos, refrigerados, congelados, salgados, secos ou defumados',
-    '05040012': 'Tripas, bexigas e estômagos de animais, exceto peixes, inteiros ou em pedaços, frescos, refrigerados, congelados, salgados, secos ou defumados',
-    '05040013': 'Tripas, bexigas e estômagos de animais, exceto peixes, inteiros ou em pedaços, frescos, refrigerados, congelados, salgados, secos ou defumados',
-    '05040019': 'Tripas, bexigas e estômagos de animais, exceto peixes, inteiros ou em pedaços, frescos, refrigerados, congelados, salgados, secos ou defumados',
-    '05040090': 'Tripas, bexigas e estômagos de animais, exceto peixes, inteiros ou em pedaços, frescos, refrigerados, congelados, salgados, secos ou defumados',
-    '05051000': 'Penas para enchimento ou estofamento; penugem; em bruto ou simplesmente limpas, desinfetadas ou preparadas para conservação',
-    '05059000': 'Peles e outras partes de aves, com suas penas ou penugem',
-    '05061000': 'Osseína e ossos acidulados',
-    '05069000': 'Ossos e núcleos córneos, em bruto, desengordurados, degelatinados ou simplesmente preparados; pós e desperdícios destas matérias',
-    '05071000': 'Marfim, em bruto ou simplesmente preparado; seus pós e desperdícios',
-    '05079000': 'Carapaças de tartarugas, barbas, chifres, galhadas, cascos, em bruto ou simplesmente preparados; seus pós e desperdícios',
-    '05080000': 'Coral, conchas, carapaças de moluscos, em bruto ou preparadas; seus pós e desperdícios',
-    '05100010': 'Âmbar-cinzento, castóreo, algália e almíscar; bílis, mesmo seca; glândulas e outras substâncias de origem animal utilizadas na preparação de produtos farmacêuticos, frescas, refrigeradas, congeladas ou provisoriamente conservadas de outro modo',
-    '05100090': 'Âmbar-cinzento, castóreo, algália e almíscar; bílis, mesmo seca; glândulas e outras substâncias de origem animal utilizadas na preparação de produtos farmacêuticos, frescas, refrigeradas, congeladas ou provisoriamente conservadas de outro modo',
-    '05111000': 'Sêmen de bovino',
-    '05119190': 'Produtos de peixes ou crustáceos, moluscos ou de outros invertebrados aquáticos, animais mortos do capítulo 3, impróprios para alimentação humana',
-    '05119910': 'Outros produtos de origem animal, impróprios para alimentação humana; animais mortos',
-    '05119920': 'Outros produtos de origem animal, impróprios para alimentação humana; animais mortos',
-    '05119930': 'Outros produtos de origem animal, impróprios para alimentação humana; animais mortos',
-    '05119991': 'Outros produtos de origem animal, impróprios para alimentação humana; animais mortos',
-    '05119999': 'Outros produtos de origem animal, impróprios para alimentação humana; animais mortos',
-    '06011000': 'Bulbos, tubérculos, raízes tuberosas, rebentos e rizomas, em repouso vegetativo',
-    '06012000': 'Bulbos, tubérculos, raízes tuberosas, rebentos e rizomas, em vegetação ou em flor; mudas, plantas e raízes de chicória',
-    '06021000': 'Estacas não enraizadas e enxertos',
-    '06022000': 'Árvores, arbustos e silvados, de frutos comestíveis, enxertados ou não',
-    '06023000': 'Rododendros e azaléias, enxertados ou não',
-    '06024000': 'Roseiras, enxertadas ou não',
-    '06029010': 'Outras plantas vivas, mudas de plantas, e micélios de cogumelos',
-    '06029021': 'Outras plantas vivas, mudas de plantas, e micélios de cogumelos',
-    '06029029': 'Outras plantas vivas, mudas de plantas, e micélios de cogumelos',
-    '06029081': 'Outras plantas vivas, mudas de plantas, e micélios de cogumelos',
-    '06029082': 'Outras plantas vivas, mudas de plantas, e micélios de cogumelos',
-    '06029083': 'Outras plantas vivas, mudas de plantas, e micélios de cogumelos',
-    '06029089': 'Outras plantas vivas, mudas de plantas, e micélios de cogumelos',
-    '06029090': 'Outras plantas vivas, mudas de plantas, e micélios de cogumelos',
-    '06031100': 'Rosas frescas e seus botões, cortadas para buquês ou para ornamentação',
-    '06031200': 'Cravos frescos e seus botões, cortados para buquês ou para ornamentação',
-    '06031300': 'Orquídeas frescas e seus botões, cortadas para buquês ou para ornamentação',
-    '06031400': 'Crisântemos frescos e seus botões, cortados para buquês ou para ornamentação',
-    '06031500': 'Lírios (lilium spp.)',
-    '06031900': 'Outras flores frescas e seus botões, cortadas para buquês ou para ornamentação',
-    '06039000': 'Flores e seus botões, secos, branqueados, tingidos ou preparados de outro modo, cortados para buquês ou para ornamentação',
-    '06042000': 'Folhagem, folhas, ramos de plantas, frescos, para buquês, etc.',
-    '06049000': 'Folhagem, folhas, ramos de plantas, secos, etc., para buquês, etc',
-    '07011000': 'Batatas para semeadura (batata semente)',
-    '07019000': 'Batatas, frescas ou refrigeradas',
-    '07020000': 'Tomates, frescos ou refrigerados',
-    '07031011': 'Cebolas e echalotes, frescas ou refrigeradas',
-    '07031019': 'Cebolas e echalotes, frescas ou refrigeradas',
-    '07031021': 'Cebolas e echalotes, frescas ou refrigeradas',
-    '07031029': 'Cebolas e echalotes, frescas ou refrigeradas',
-    '07032010': 'Alhos, frescos ou refrigerados',
-    '07032090': 'Alhos, frescos ou refrigerados',
-    '07039010': 'Alhos-porros e outros produtos hortícolas aliáceos, frescos ou refrigerados',
-    '07039090': 'Alhos-porros e outros produtos hortícolas aliáceos, frescos ou refrigerados',
-    '07041000': 'Couve-flor e brócolos, frescos ou refrigerados',
-    '07042000': 'Couve-de-bruxelas, fresca ou refrigerada',
-    '07049000': 'Couves, repolhos e produtos comestíveis semelhantes do gênero brassica, frescos ou refrigerados',
-    '07051100': 'Alfaces repolhudas, frescas ou refrigeradas',
-    '07051900': 'Outras alfaces frescas ou refrigeradas',
-    '07052100': 'Chicórias (witloof), frescas ou refrigeradas',
-    '07052900': 'Outras chicórias, frescas ou refrigeradas',
-    '07061000': 'Cenouras e nabos, frescos ou refrigerados',
-    '07069000': 'Beterrabas, rabanetes e outras raízes, frescas ou refrigeradas',
-    '07070000': 'Pepinos e pepininhos cornichons, frescos ou refrigerados',
-    '07081000': 'Ervilhas (pisum sativum), frescas ou refrigeradas, com ou sem vagem',
-    '07082000': 'Feijões (Vigna spp., Phaseolus spp.) frescos ou refrigerados, com ou sem vagem',
-    '07089000': 'Outros legumes de vagem, frescas ou refrigeradas, com ou sem vagem',
-    '07092000': 'Aspargos frescos ou refrigerados',
-    '07093000': 'Berinjelas, frescas ou refrigeradas',
-    '07094000': 'Aipo fresco ou refrigerado, exceto aipo-rábano',
-    '07095100': 'Cogumelos do gênero agaricus, frescos ou refrigerados',
-    '07095200': 'Trufas frescas ou refrigeradas',
-    '07095300': 'Cogumelos do gênero Cantharellus',
-    '07095400': 'Shiitake (Lentinus edodes), fresco ou refrigerado',
-    '07095900': 'Outros cogumelos e trufas, frescos ou refrigerados',
-    '07096000': 'Pimentões e pimentas dos gêneros capsicum ou pimenta, frescos ou refrigerados',
-    '07097000': 'Espinafres, espinafres-da-nova zelândia e espinafres gigantes, frescos ou refrigerados',
-    '07099100': 'Alcachofras, frescas ou refrigeradas',
-    '07099200': 'Azeitonas, frescas ou refrigeradas',
-    '07099300': 'Abóboras, abobrinhas e cabaças, frescas ou refrigerada',
-    '07099911': 'Outros produtos hortícolas, frescos ou refrigerados',
-    '07099919': 'Outros produtos hortícolas, frescos ou refrigerados',
-    '07099990': 'Outros produtos hortícolas, frescos ou refrigerados',
-    '07101000': 'Batatas congeladas, não cozidas ou cozidas em água ou vapor',
-    '07102100': 'Ervilhas congeladas, com ou sem vagem, não cozidas ou cozidas em água ou vapor',
-    '07102200': 'Feijões congelados, com ou sem vagem, não cozidos ou cozidos em água ou vapor',
-    '07102900': 'Outras legumes de vagem congeladas, com ou sem vagem, não cozidas ou cozidas em água ou vapor',
-    '07103000': 'Espinafres, espinafres-da-nova zelândia e espinafres gigantes, congelados, não cozidos ou cozidos em água ou vapor',
-    '07104000': 'Milho doce congelado, não cozido ou cozido em água ou vapor',
-    '07108000': 'Outros produtos hortícolas congelados, não cozidos ou cozidos em água ou vapor',
-    '07109000': 'Misturas de produtos hortícolas congelados, não cozidos ou cozidos em água ou vapor',
-    '07112010': 'Azeitonas conservadas transitoriamente, mas impróprias para alimentação neste estado',
-    '07112090': 'Azeitonas conservadas transitoriamente, mas impróprias para alimentação neste estado',
-    '07114000': 'Pepinos e pepininhos conservados transitoriamente, mas impróprios para alimentação neste estado',
-    '07115100': 'Cogumelos do gênero agaricus conservados transitoriamente, mas impróprios para alimentação nesse estado',
-    '07115900': 'Outros cogumelos e trufas conservados transitoriamente, mas impróprios para alimentação nesse estado',
-    '07119000': 'Outros produtos e misturas hortícolas conservadas transitoriamente, mas impróprios para alimentação neste estado',
-    '07122000': 'Cebolas secas, inclusive em pedaços ou fatias, trituradas ou em pó, sem qualquer outro preparo',
-    '07123100': 'Cogumelos do gênero agaricus, secos, mesmo cortados em pedaços, triturados ou em pó, mas sem qualquer outro preparo',
-    '07123400': 'Shiitake (Lentinus edodes), seco, inteiro, cortado, fatiado, partido ou em pó, mas não preparado de outro modo',
-    '07123900': 'Outros cogumelos e trufas, secos, mesmo cortados em pedaços, triturados ou em pó, mas sem qualquer outro preparo',
-    '07129010': 'Outros produtos e misturas hortícolas, secos, inclusive em pedaços ou fatias, trituradas ou em pó, sem qualquer outro preparo',
-    '07129090': 'Outros produtos e misturas hortícolas, secos, inclusive em pedaços ou fatias, trituradas ou em pó, sem qualquer outro preparo',
-    '07131010': 'Ervilhas (pisum sativum), secas, em grão, mesmo peladas ou partidas',
-    '07131090': 'Ervilhas (pisum sativum), secas, em grão, mesmo peladas ou partidas',
-    '07132010': 'Grão-de-bico, seco, em grão, mesmo pelado ou partido',
-    '07132090': 'Grão-de-bico, seco, em grão, mesmo pelado ou partido',
-    '07133110': 'Feijões das espécies Vigna mungo (l.) Hepper ou Vigna radiata (l.) Wilczek, secos, em grão, mesmo pelados ou partidos',
-    '07133190': 'Feijões das espécies Vigna mungo (l.) Hepper ou Vigna radiata (l.) Wilczek, secos, em grão, mesmo pelados ou partidos',
-    '07133210': 'Feijão adzuki (Phaseolus ou Vigna angularis), seco, em grão, mesmo pelado ou partido',
-    '07133290': 'Feijão adzuki (Phaseolus ou Vigna angularis), seco, em grão, mesmo pelado ou partido',
-    '07133311': 'Feijão comum, seco, em grão, mesmo pelado ou partido',
-    '07133319': 'Feijão comum, seco, em grão, mesmo pelado ou partido',
-    '07133321': 'Feijão comum, seco, em grão, mesmo pelado ou partido',
-    '07133329': 'Feijão comum, seco, em grão, mesmo pelado ou partido',
-    '07133391': 'Feijão comum, seco, em grão, mesmo pelado ou partido',
-    '07133399': 'Feijão comum, seco, em grão, mesmo pelado ou partido',
-    '07133410': 'Feijão-bambara (Vigna subterranea ou Voandzeia subterranea)',
-    '07133490': 'Feijão-bambara (Vigna subterranea ou Voandzeia subterranea)',
-    '07133510': 'Feijão-fradinho (Vigna unguiculata)',
-    '07133590': 'Feijão-fradinho (Vigna unguiculata)',
-    '07133910': 'Outros feijões (Vigna spp. ou Phaseolus spp.), secos, em grão, mesmo pelados ou partidos',
-    '07133990': 'Outros feijões (Vigna spp. ou Phaseolus spp.), secos, em grão, mesmo pelados ou partidos',
-    '07134010': 'Lentilhas secas, em grãos, mesmo peladas ou partidas',
-    '07134090': 'Lentilhas secas, em grãos, mesmo peladas ou partidas',
-    '07135010': 'Favas e fava forrageira, secas, em grãos, mesmo peladas ou partidas',
-    '07135090': 'Favas e fava forrageira, secas, em grãos, mesmo peladas ou partidas',
-    '07136010': 'Feijão-guando (Cajanus cajan)',
-    '07136090': 'Feijão-guando (Cajanus cajan)',
-    '07139010': 'Outros legumes de vagem, secos, em grãos, mesmo pelados ou partidos',
-    '07139090': 'Outros legumes de vagem, secos, em grãos, mesmo pelados ou partidos',
-    '07141000': 'Raízes de mandioca cassava, frescas ou secas, mesmo cortadas em pedaços ou em pellets',
-    '07142000': 'Batatas-doces, frescas ou secas, mesmo cortadas em pedaços ou em pellets',
-    '07143000': 'Inhames (dioscorea spp.)',
-    '07144000': 'Taros (colocasia spp.)',
-    '07145000': 'Mangaritos (Xanthosomo spp.)',
-    '07149000': 'Outras raízes ou tubérculos com elevado teor de fécula ou de inulina, frescos ou secos, mesmo em pedaços ou em pellets; medula de sagueiro',
-    '08011100': 'Cocos secos, mesmo sem casca ou ralados',
-    '08011200': 'Cocos na casca interna (endocarpo)',
-    '08011900': 'Cocos frescos, mesmo sem casca ou pelados',
-    '08012100': 'Castanha-do-pará, fresca ou seca, com casca',
-    '08012200': 'Castanha-do-pará, fresca ou seca, sem casca',
-    '08013100': 'Castanha de caju, fresca ou seca, com casca',
-    '08013200': 'Castanha de caju, fresca ou seca, sem casca',
-    '08021100': 'Amêndoas frescas ou secas, com casca',
-    '08021200': 'Amêndoas frescas ou secas, sem casca',
-    '08022100': 'Avelãs (Corylus spp.) frescas ou secas, com casca',
-    '08022200': 'Avelãs (Corylus spp.) frescas ou secas, sem casca',
-    '08023100': 'Nozes frescas ou secas, com casca',
-    '08023200': 'Nozes frescas ou secas, sem casca',
-    '08024100': 'Castanhas (castaneas spp.) com casca, frescas ou secas',
-    '08024200': 'Castanhas (castaneas spp.), sem casca, frescas ou secas',
-    '08025100': 'Pistácios, com casca, frescos ou secos',
-    '08025200': 'Pistácios, sem casca, frescos ou secos',
-    '08026100': 'Nozes de macadâmia, com casca, frescas ou secas',
-    '08026200': 'Nozes de macadâmia, sem casca, frescas ou secas',
-    '08027000': 'Nozes de cola (cola spp.), frescas ou secas',
-    '08028000': 'Nozes de areca (nozes de betele), frescas ou secas',
-    '08029000': 'Outras frutas de casca rija, frescas ou secas, mesmo sem casca ou peladas',
-    '08029100': 'Pinhões, com casca',
-    '08029200': 'Pinhões, descascados',
-    '08029900': 'Outras castanhas, frescas ou secas, descascadas ou não descascadas, não classificadas nos códigos anteriores',
-    '08031000': 'Bananas-da-terra, frescas ou secas',
-    '08039000': 'Bananas frescas ou secas, exceto bananas-da-terra',
-    '08041010': 'Tâmaras frescas ou secas',
-    '08041020': 'Tâmaras frescas ou secas',
-    '08042010': 'Figos frescos ou secos',
-    '08042020': 'Figos frescos ou secos',
-    '08043000': 'Abacaxis frescos ou secos',
-    '08044000': 'Abacates frescos ou secos',
-    '08045010': 'Goiabas, mangas e mangostões, frescos ou secos',
-    '08045020': 'Goiabas, mangas e mangostões, frescos ou secos',
-    '08045030': 'Goiabas, mangas e mangostões, frescos ou secos',
-    '08051000': 'Laranjas frescas ou secas',
-    '08052100': 'Mandarinas (incluindo as tangerinas e as satsumas)',
-    '08052200': 'Clementinas',
-    '08052900': 'Outros citros híbridos',
-    '08054000': 'Pomelos (grapefruit), frescos ou secos',
-    '08055000': 'Limões e limas, frescos ou secos',
-    '08059000': 'Outros cítricos frescos ou secos',
-    '08061000': 'Uvas frescas',
-    '08062000': 'Uvas secas',
-    '08071100': 'Melancias frescas',
-    '08071900': 'Melões frescos',
-    '08072000': 'Mamões (papaias) frescos',
-    '08081000': 'Maçãs frescas',
-    '08083000': 'Pêras, frescas',
-    '08084000': 'Marmelos, frescos',
-    '08091000': 'Damascos frescos',
-    '08092100': 'Cerejas-ácidas (prunus cerasus), frescas',
-    '08092900': 'Outras cerejas, frescas',
-    '08093010': 'Pêssegos, incluídos os brugnons e as nectarinas, frescos',
-    '08093020': 'Pêssegos, incluídos os brugnons e as nectarinas, frescos',
-    '08094000': 'Ameixas e abrunhos, frescos',
-    '08101000': 'Morangos frescos',
-    '08102000': 'Framboesas, amoras e amoras-framboesas, frescas',
-    '08103000': 'Groselhas frescas, inclusive o  "cassis "',
-    '08104000': 'Airelas, mirtilos e outras frutas do gênero vaccinium, frescos',
-    '08105000': 'Quivis (kiwis), frescos',
-    '08107000': 'Caquis (diospiros), frescos',
-    '08109011': 'Outras frutas frescas',
-    '08109012': 'Outras frutas frescas',
-    '08109013': 'Outras frutas frescas',
-    '08109014': 'Outras frutas frescas',
-    '08109015': 'Outras frutas frescas',
-    '08109016': 'Outras frutas frescas',
-    '08109017': 'Outras frutas frescas',
-    '08109090': 'Outras frutas frescas',
-    '08111000': 'Morangos congelados, não cozidos ou cozidos em água ou vapor, mesmo adicionados de açúcar ou de outros edulcorantes',
-    '08112000': 'Framboesas, amoras, groselhas, congeladas, não cozidas ou cozidas em água ou vapor, mesmo adicionadas de açúcar ou de outros edulcorantes',
-    '08119000': 'Outras frutas congeladas, não cozidas ou cozidas em água ou vapor, mesmo adicionadas de açúcar ou de outros edulcorantes',
-    '08121000': 'Cerejas conservadas transitoriamente, mas impróprias para alimentação neste estado',
-    '08129000': 'Outras frutas conservadas transitoriamente, mas impróprias para alimentação neste estado',
-    '08131000': 'Damascos secos',
-    '08132010': 'Ameixas secas',
-    '08132020': 'Ameixas secas',
-    '08133000': 'Maçãs secas',
-    '08134010': 'Pêras e outras frutas secas',
-    '08134090': 'Pêras e outras frutas secas',
-    '08135000': 'Misturas de frutas secas ou de frutas de casca rija',
-    '08140000': 'Cascas de cítricos, de melões ou de melancias, frescas, secas, congeladas ou conservadas temporariamente',
-    '09011110': 'Café não torrado, não descafeinado',
-    '09011190': 'Café não torrado, não descafeinado',
-    '09011200': 'Café não torrado, descafeinado',
-    '09012100': 'Café torrado, não descafeinado',
-    '09012200': 'Café torrado, descafeinado',
-    '09019000': 'Cascas, películas de café e sucedâneos do café',
-    '09021000': 'Chá verde (não fermentado), em embalagens imediatas <= 3 kg',
-    '09022000': 'Chá verde (não fermentado), apresentado em qualquer outra forma',
-    '09023000': 'Chá preto (fermentado ou parcialmente fermentado), em embalagens imediatas <= 3 kg',
-    '09024000': 'Chá preto (fermentado ou parcialmente fermentado) apresentado em qualquer outra forma',
-    '09030010': 'Mate',
-    '09030090': 'Mate',
-    '09041100': 'Pimenta (do gênero piper), seca, não triturada nem em pó',
-    '09041200': 'Pimenta (do gênero piper), triturada ou em pó',
-    '09042100': 'Pimentões e pimentas, secos, não triturados nem em pó',
-    '09042200': 'Pimentões e pimentas, triturados ou em pó',
-    '09051000': 'Baunilha, não triturada nem em pó',
-    '09052000': 'Baunilha, triturada ou em pó',
-    '09061100': 'Canela (Cinnamomum zeylanicum blume), não triturada nem em pó',
-    '09061900': 'Outras canelas e flores de caneleira, não trituradas nem em pó',
-    '09062000': 'Canela e flores de caneleira, trituradas ou em pó',
-    '09071000': 'Cravo-da-índia (frutos, flores e pedúnculo) não triturados nem em pó',
-    '09072000': 'Cravo-da-índia (frutos, flores e pedúnculo), triturado ou em pó',
-    '09081100': 'Noz-moscada, não triturada nem em pó',
-    '09081200': 'Noz-moscada, triturada ou em pó',
-    '09082100': 'Macis, não triturado nem em pó',
-    '09082200': 'Macis, triturado ou em pó',
-    '09083100': 'Amomos e cardamomos, não triturado nem em pó',
-    '09083200': 'Amomos e cardamomos, triturados ou em pó',
-    '09092100': 'Sementes de coentro, não trituradas nem em pó',
-    '09092200': 'Sementes de coentro, trituradas ou em pó',
-    '09093100': 'Sementes de cominho, não trituradas nem em pó',
-    '09093200': 'Sementes de cominho, trituradas ou em pó',
-    '09096110': 'Sementes de anis, badiana, funcho ou alcaravia; bagas de zimbro: não triturado nem em pó',
-    '09096120': 'Sementes de anis, badiana, funcho ou alcaravia; bagas de zimbro: não triturado nem em pó',
-    '09096190': 'Sementes de anis, badiana, funcho ou alcaravia; bagas de zimbro: não triturado nem em pó',
-    '09096210': 'Sementes de anis, badiana, funcho ou alcaravia; bagas de zimbro: triturado ou em pó',
-    '09096220': 'Sementes de anis, badiana, funcho ou alcaravia; bagas de zimbro: triturado ou em pó',
-    '09096290': 'Sementes de anis, badiana, funcho ou alcaravia; bagas de zimbro: triturado ou em pó',
-    '09101100': 'Gengibre, não triturado nem em pó',
-    '09101200': 'Gengibre, triturado ou em pó',
-    '09102000': 'Açafrão',
-    '09103000': 'Açafrão-da-terra (curcuma)',
-    '09109100': 'Misturas de especiarias',
-    '09109900': 'Outras especiarias',
-    '10011100': 'Trigo duro, para semeadura',
-    '10011900': 'Trigo duro, exceto para semeadura',
-    '10019100': 'Outros  trigos e misturas de trigo com centeio, para semeadura',
-    '10019900': 'Outros  trigos e misturas de trigo com centeio, exceto para semeadura',
-    '10021000': 'Centeio, para semeadura',
-    '10029000': 'Centeio, exceto para semeadura',
-    '10031000': 'Cevada, para semeadura',
-    '10039010': 'Cevada, exceto para semeadura',
-    '10039080': 'Cevada, exceto para semeadura',
-    '10039090': 'Cevada, exceto para semeadura',
-    '10041000': 'Aveia, para semeadura',
-    '10049000': 'Aveia, exceto para semeadura',
-    '10051000': 'Milho para semeadura',
-    '10059010': 'Milho, exceto para semeadura',
-    '10059090': 'Milho, exceto para semeadura',
-    '10061010': 'Arroz (paddy) com casca',
-    '10061091': 'Arroz (paddy) com casca',
-    '10061092': 'Arroz (paddy) com casca',
-    '10062010': 'Arroz (cargo ou castanho), descascado',
-    '10062020': 'Arroz (cargo ou castanho), descascado',
-    '10063011': 'Arroz semibranqueado ou branqueado, mesmo polido ou brunido (glaceado)',
-    '10063019': 'Arroz semibranqueado ou branqueado, mesmo polido ou brunido (glaceado)',
-    '10063021': 'Arroz semibranqueado ou branqueado, mesmo polido ou brunido (glaceado)',
-    '10063029': 'Arroz semibranqueado ou branqueado, mesmo polido ou brunido (glaceado)',
-    '10064000': 'Arroz quebrado (trinca de arroz)',
-    '10071000': 'Sorgo de grão, para semeadura',
-    '10079000': 'Sorgo de grão, exceto para semeadura',
-    '10081010': 'Trigo mourisco',
-    '10081090': 'Trigo mourisco',
-    '10082110': 'Painço, para semeadura',
-    '10082910': 'Painço, exceto para semeadura',
-    '10082990': 'Painço, exceto para semeadura',
-    '10083090': 'Alpiste',
-    '10085010': 'Quinoa (Chenopodium quinoa)',
-    '10085090': 'Quinoa (Chenopodium quinoa)',
-    '10089010': 'Outros cereais',
-    '10089090': 'Outros cereais',
-    '11010010': 'Farinhas de trigo ou de mistura de trigo com centeio',
-    '11010020': 'Farinhas de trigo ou de mistura de trigo com centeio',
-    '11022000': 'Farinha de milho',
-    '11029000': 'Farinha de outros cereais',
-    '11031100': 'Grumos e sêmolas, de trigo',
-    '11031300': 'Grumos e sêmolas, de milho',
-    '11031900': 'Grumos e sêmolas, de outros cereais',
-    '11032000': 'Pellets de cereais',
-    '11041200': 'Grãos de aveia, esmagados ou em flocos',
-    '11041900': 'Grãos de outros cereais, esmagados ou em flocos',
-    '11042200': 'Grãos de aveia trabalhados (descascados, em pérolas, cortados ou partidos)',
-    '11042300': 'Grãos de milho trabalhados (descascados, em pérolas, cortados ou partidos)',
-    '11042900': 'Grãos de outros cereais trabalhados (descascados, em pérolas, cortados ou partidos)',
-    '11043000': 'Germes de cereais, inteiros, esmagados, em flocos ou moídos',
-    '11051000': 'Farinha, sêmola e pó, de batata',
-    '11052000': 'Flocos, grânulos e pellets, de batata',
-    '11061000': 'Farinhas, sêmolas e pós, dos legumes de vagem, secos, da posição 0713',
-    '11062000': 'Farinhas, sêmolas e pós, de sagu ou de raízes e tubérculos da posição 0714',
-    '11063000': 'Farinhas, sêmolas e pós de frutas (dos produtos do capítulo 8)',
-    '11071010': 'Malte não torrado',
-    '11072010': 'Malte torrado',
-    '11072020': 'Malte torrado',
-    '11081100': 'Amido de trigo',
-    '11081200': 'Amido de milho',
-    '11081300': 'Fécula de batata',
-    '11081400': 'Fécula de mandioca',
-    '11081900': 'Outros amidos e féculas',
-    '11082000': 'Inulina',
-    '11090000': 'Glúten de trigo, mesmo seco',
-    '12011000': 'Soja, mesmo triturada, para semeadura',
-    '12019000': 'Soja, mesmo triturada, exceto para semeadura',
-    '12023000': 'Amendoins, não torrados nem cozidos, para semeadura',
-    '12024100': 'Amendoins com casca, não torrados nem cozidos',
-    '12024200': 'Amendoins descascados, mesmo triturados',
-    '12040010': 'Sementes de linho (linhaça), mesmo trituradas',
-    '12040090': 'Sementes de linho (linhaça), mesmo trituradas',
-    '12051010': 'Sementes de nabo silvestre ou de colza, com baixo teor de ácido erúcico, mesmo trituradas',
-    '12051090': 'Sementes de nabo silvestre ou de colza, com baixo teor de ácido erúcico, mesmo trituradas',
-    '12059010': 'Outras sementes de nabo silvestre ou de colza, mesmo trituradas',
-    '12059090': 'Outras sementes de nabo silvestre ou de colza, mesmo trituradas',
-    '12060010': 'Sementes de girassol, mesmo trituradas',
-    '12060090': 'Sementes de girassol, mesmo trituradas',
-    '12071010': 'Nozes e amêndoas de palma (palmiste)',
-    '12071090': 'Nozes e amêndoas de palma (palmiste)',
-    '12072100': 'Sementes de algodão, para semeadura',
-    '12072900': 'Sementes de algodão, exceto para semeadura',
-    '12073010': 'Sementes de rícino',
-    '12073090': 'Sementes de rícino',
-    '12074010': 'Sementes de gergelim, mesmo trituradas',
-    '12074090': 'Sementes de gergelim, mesmo trituradas',
-    '12075010': 'Sementes de mostarda, mesmo trituradas',
-    '12075090': 'Sementes de mostarda, mesmo trituradas',
-    '12076090': 'Sementes de cártamo (Carthamus tinctorius)',
-    '12077010': 'Sementes de melão',
-    '12077090': 'Sementes de melão',
-    '12079190': 'Sementes de dormideira ou papoula, mesmo trituradas',
-    '12079910': 'Outras sementes e frutos oleaginosos, mesmo triturados',
-    '12079990': 'Outras sementes e frutos oleaginosos, mesmo triturados',
-    '12081000': 'Farinha de soja',
-    '12089000': 'Farinhas de outras sementes ou de frutos oleaginosos',
-    '12092100': 'Sementes de alfafa (luzerna), para semeadura',
-    '12092200': 'Sementes de trevo (Trifolium spp.), para semeadura',
-    '12092300': 'Sementes de festuca, para semeadura',
-    '12092400': 'Sementes de pasto dos prados de Kentucky, para semeadura',
-    '12092500': 'Sementes de azevém, para semeadura',
-    '12092900': 'Outras sementes forrageiras, para semeadura',
-    '12093000': 'Sementes de plantas herbáceas, cultivadas especialmente pelas suas flores, para semeadura',
-    '12099100': 'Sementes de produtos hortícolas, para semeadura',
-    '12099900': 'Outras sementes, frutos e esporos, para semeadura',
-    '12101000': 'Cones de lúpulo, frescos ou secos, não triturados, nem moídos, nem em pellets',
-    '12102010': 'Cones de lúpulo, triturados, moídos ou em pellets, lupulina',
-    '12102020': 'Cones de lúpulo, triturados, moídos ou em pellets, lupulina',
-    '12112000': 'Raízes de ginseng, frescas ou secas, mesmo cortadas, trituradas ou em pó',
-    '12116000': 'Casca de cereja africana (Prunus africana)',
-    '12119010': 'Outras plantas, partes de plantas, sementes e frutos, frescos ou secos, mesmo cortados, triturados ou em pó, para uso em perfumaria, medicina ou como inseticidas, parasiticidas ou semelhantes',
-    '12119090': 'Outras plantas, partes de plantas, sementes e frutos, frescos ou secos, mesmo cortados, triturados ou em pó, para uso em perfumaria, medicina ou como inseticidas, parasiticidas ou semelhantes',
-    '12122100': 'Algas próprias para a alimentação humana',
-    '12122900': 'Outras algas, frescas, refrigeradas, congeladas ou secas',
-    '12129100': 'Beterraba sacarina, fresca, refrigerada, congelada ou seca, mesmo em pó',
-    '12129200': 'Cana-de-açúcar fresca, refrigerada, congelada, seca, em pó',
-    '12129300': 'Cana-de-açúcar, fresca, regrigerada, congelada ou seca',
-    '12129400': 'Raízes de chicória, fresca, refrigerada, congelada ou seca',
-    '12129910': 'Outros produtos vegetais utilizados principalmente na alimentação humana',
-    '12129990': 'Outros produtos vegetais utilizados principalmente na alimentação humana',
-    '12130000': 'Palhas e cascas de cereais, em bruto, mesmo picadas, moídas, prensadas ou em pellets',
-    '12141000': 'Farinhas e pellets, de alfafa (luzerna)',
-    '12149000': 'Rutabagas, raízes forrageiras e outros produtos forrageiros, mesmo em pellets',
-    '13012000': 'Goma-arábica',
-    '13019010': 'Outras gomas, resinas, gomas-resinas, oleorresinas, naturais',
-    '13019090': 'Outras gomas, resinas, gomas-resinas, oleorresinas, naturais',
-    '13021190': 'Ópio',
-    '13021200': 'Sucos e extratos, de alcaçuz',
-    '13021300': 'Sucos e extratos, de lúpulo',
-    '13021400': 'Sucos e extratos, de piretro ou de raízes com rotenona',
-    '13021910': 'Sucos e extratos de outros vegetais (mamão seco, semente de pomelo, ginkgo biloba seco)',
-    '13021920': 'Sucos e extratos de outros vegetais (mamão seco, semente de pomelo, ginkgo biloba seco)',
-    '13021930': 'Sucos e extratos de outros vegetais (mamão seco, semente de pomelo, ginkgo biloba seco)',
-    '13021940': 'Sucos e extratos de outros vegetais (mamão seco, semente de pomelo, ginkgo biloba seco)',
-    '13021950': 'Sucos e extratos de outros vegetais (mamão seco, semente de pomelo, ginkgo biloba seco)',
-    '13021960': 'Sucos e extratos de outros vegetais (mamão seco, semente de pomelo, ginkgo biloba seco)',
-    '13021991': 'Sucos e extratos de outros vegetais (mamão seco, semente de pomelo, ginkgo biloba seco)',
-    '13021999': 'Sucos e extratos de outros vegetais (mamão seco, semente de pomelo, ginkgo biloba seco)',
-    '13022010': 'Matérias pécticas, pectinatos e pectatos',
-    '13022090': 'Matérias pécticas, pectinatos e pectatos',
-    '13023100': 'Ágar-ágar, mesmo modificado',
-    '13023211': 'Produtos mucilaginosos e espessantes, de alfarroba, de sementes de alfarroba ou de guaré, mesmo modificados',
-    '13023219': 'Produtos mucilaginosos e espessantes, de alfarroba, de sementes de alfarroba ou de guaré, mesmo modificados',
-    '13023220': 'Produtos mucilaginosos e espessantes, de alfarroba, de sementes de alfarroba ou de guaré, mesmo modificados',
-    '13023910': 'Produtos mucilaginosos e espessantes, derivados de outros vegetais, mesmo modificados',
-    '13023990': 'Produtos mucilaginosos e espessantes, derivados de outros vegetais, mesmo modificados',
-    '14011000': 'Bambus para cestaria ou espartaria',
-    '14012000': 'Rotins para cestaria ou espartaria',
-    '14019000': 'Outras matérias vegetais para cestaria ou espartaria',
-    '14042010': 'Línteres de algodão',
-    '14042090': 'Línteres de algodão',
-    '14049010': 'Outros produtos de origem vegetal não especificados nem compreendidos em outras posições',
-    '14049090': 'Outros produtos de origem vegetal não especificados nem compreendidos em outras posições',
-    '15011000': 'Banha de porco',
-    '15012000': 'Outras gorduras de porco',
-    '15019000': 'Gordura de aves',
-    '15021011': 'Sebo de bovinos, ovinos ou caprinos',
-    '15021012': 'Sebo de bovinos, ovinos ou caprinos',
-    '15021019': 'Sebo de bovinos, ovinos ou caprinos',
-    '15021090': 'Sebo de bovinos, ovinos ou caprinos',
-    '15029000': 'Gorduras ovinas ou caprinas',
-    '15030000': 'Estearina solar, óleo de banha de porco, óleo estearina, óleo margarina e óleo de sebo, não emulsionados nem misturados, nem preparados de outro modo',
-    '15041011': 'Óleos de fígados de peixes e respectivas frações, mesmo refinados, mas não modificados quimicamente',
-    '15041019': 'Óleos de fígados de peixes e respectivas frações, mesmo refinados, mas não modificados quimicamente',
-    '15041090': 'Óleos de fígados de peixes e respectivas frações, mesmo refinados, mas não modificados quimicamente',
-    '15042000': 'Gorduras e óleos de peixe e respectivas frações, exceto óleos de fígados, mesmo refinados, mas não modificados quimicamente',
-    '15043000': 'Gorduras e óleos de mamíferos marinhos e respectivas frações, mesmo refinados, mas não modificados quimicamente',
-    '15050010': 'Suarda e substâncias gordas dela derivadas, incluída a lanolina',
-    '15050090': 'Suarda e substâncias gordas dela derivadas, incluída a lanolina',
-    '15060000': 'Outras gorduras e óleos de animais, mesmo refinados, mas não quimicamente modificados',
-    '15071000': 'Óleo de soja, em bruto, mesmo degomado',
-    '15079011': 'Óleo de soja e respectivas frações, mesmo refinados, mas não quimicamente modificados',
-    '15079019': 'Óleo de soja e respectivas frações, mesmo refinados, mas não quimicamente modificados',
-    '15079090': 'Óleo de soja e respectivas frações, mesmo refinados, mas não quimicamente modificados',
-    '15081000': 'Óleo de amendoim, em bruto',
-    '15089000': 'Outros óleos de amendoim e respectivas frações, mesmo refinados, mas não quimicamente modificados',
-    '15091000': 'Azeite de oliva e respectivas frações, virgem',
-    '15092000': 'Azeite de oliva extra-virgem',
-    '15093000': 'Azeite de oliva virgem',
-    '15094000': 'Outros azeites virgens',
-    '15099010': 'Azeite de oliva refinado e outros azeites de oliva, não quimicamente modificados',
-    '15099090': 'Azeite de oliva refinado e outros azeites de oliva, não quimicamente modificados',
-    '15100000': 'Outros óleos e respectivas frações, obtidos de azeitonas, mesmo refinados, mas não quimicamente modificados, e misturas desses óleos com óleos da posição 1509',
-    '15101000': 'Óleo de bagaço de azeitona bruto',
-    '15109000': 'Outros óleos e suas frações, obtidos exclusivamente a partir de azeitonas, refinados ou não, mas não quimicamente modificados, incluindo as misturas destes óleos ou frações com óleos ou frações da posição 15.09, não classificados nos códigos anteriores',
-    '15111000': 'Óleos de dendê, em bruto',
-    '15119000': 'Outros óleos de dendê, mesmo refinados, mas não quimicamente modificados',
-    '15121110': 'Óleo de girassol ou de cártamo, e respectivas frações, em bruto',
-    '15121120': 'Óleo de girassol ou de cártamo, e respectivas frações, em bruto',
-    '15121911': 'Óleos de girassol ou de cártamo, e respectivas frações, mesmo refinados, mas não quimicamente modificados',
-    '15121919': 'Óleos de girassol ou de cártamo, e respectivas frações, mesmo refinados, mas não quimicamente modificados',
-    '15122100': 'Óleo de algodão, em bruto, mesmo desprovido de gossypol',
-    '15122910': 'Óleo de algodão e respectivas frações, mesmo refinados, mas não quimicamente modificados',
-    '15122990': 'Óleo de algodão e respectivas frações, mesmo refinados, mas não quimicamente modificados',
-    '15131100': 'Óleo de coco (óleo de copra), em bruto',
-    '15131900': 'Outros óleos de coco (óleos de copra) e suas frações, mesmo refinados, mas não quimicamente modificados',
-    '15132110': 'Óleo de palmiste ou de babaçu, em bruto',
-    '15132111': 'Óleo de palmiste ou de babaçu, em bruto',
-    '15132119': 'Óleo de palmiste ou de babaçu, em bruto',
-    '15132120': 'Óleo de palmiste ou de babaçu, em bruto',
-    '15132910': 'Outros óleos de palmiste ou de babaçu e suas frações, mesmo refinados, mas não quimicamente modificados',
-    '15132911': 'Outros óleos de palmiste ou de babaçu e suas frações, mesmo refinados, mas não quimicamente modificados',
-    '15132919': 'Outros óleos de palmiste ou de babaçu e suas frações, mesmo refinados, mas não quimicamente modificados',
-    '15132920': 'Outros óleos de palmiste ou de babaçu e suas frações, mesmo refinados, mas não quimicamente modificados',
-    '15141100': 'Óleos de nabo silvestre ou de colza, com baixo teor de ácido erúcico, em bruto',
-    '15141910': 'Óleos de nabo silvestre ou de colza, com baixo teor de ácido erúcico, refinados e outros',
-    '15141990': 'Óleos de nabo silvestre ou de colza, com baixo teor de ácido erúcico, refinados e outros',
-    '15149990': 'Outros óleos de nabo silvestre, de colza ou de mostarda, refinados e outros',
-    '15151100': 'Óleo de linhaça, em bruto',
-    '15151900': 'Outros óleos de linhaça e respectivas frações, mesmo refinados, mas não quimicamente modificados',
-    '15152100': 'Óleo de milho, em bruto',
-    '15152910': 'Outros óleos de milho e respectivas frações, mesmo refinados, mas não quimicamente modificados',
-    '15152990': 'Outros óleos de milho e respectivas frações, mesmo refinados, mas não quimicamente modificados',
-    '15153000': 'Óleo de rícino e respectivas frações, mesmo refinados, mas não quimicamente modificados',
-    '15155000': 'Óleo de gergelim e respectivas frações, mesmo refinados, mas não quimicamente modificados',
-    '15156000': 'Óleo de jojoba',
-    '15159010': 'Outras gorduras e óleos vegetais fixos e respectivas frações, mesmo refinados, mas não quimicamente modificados',
-    '15159021': 'Outras gorduras e óleos vegetais fixos e respectivas frações, mesmo refinados, mas não quimicamente modificados',
-    '15159022': 'Outras gorduras e óleos vegetais fixos e respectivas frações, mesmo refinados, mas não quimicamente modificados',
-    '15159090': 'Outras gorduras e óleos vegetais fixos e respectivas frações, mesmo refinados, mas não quimicamente modificados',
-    '15161000': 'Gorduras e óleos animais e respectivas frações, parcial ou totalmente hidrogenados, interesterificados, reesterificados ou elaidinizados, mesmo refinados, mas não preparados de outro modo',
-    '15162000': 'Gorduras e óleos vegetais e respectivas frações, parcial ou totalmente hidrogenados, interesterificados, reesterificados ou elaidinizados, mesmo refinados, mas não preparados de outro modo',
-    '15163000': 'Gorduras e óleos microbianos e suas frações, parcial ou totalmente hidrogenados, interesterificados, reesterificados ou elaidinizados, refinados ou não, mas não preparados de outro modo',
-    '15171000': 'Margarina, exceto a margarina líquida',
-    '15179010': 'Misturas ou preparações alimentícias de gorduras ou de óleos animais ou vegetais',
-    '15179090': 'Misturas ou preparações alimentícias de gorduras ou de óleos animais ou vegetais',
-    '15180010': 'Gorduras e óleos animais ou vegetais, cozidos, oxidados, desidratados ou modificados quimicamente por qualquer outro processo',
-    '15180090': 'Gorduras e óleos animais ou vegetais, cozidos, oxidados, desidratados ou modificados quimicamente por qualquer outro processo',
-    '15200010': 'Glicerol em bruto; águas e lixívias, glicéricas',
-    '15200020': 'Glicerol em bruto; águas e lixívias, glicéricas',
-    '15211000': 'Ceras vegetais, mesmo refinadas ou coradas (exceto triglicerídeos)',
-    '15219011': 'Ceras de abelhas ou de outros insetos e espermacete, mesmo refinados ou corados',
-    '15219019': 'Ceras de abelhas ou de outros insetos e espermacete, mesmo refinados ou corados',
-    '15219090': 'Ceras de abelhas ou de outros insetos e espermacete, mesmo refinados ou corados',
-    '15220000': 'Dégras e resíduos do tratamento das matérias graxas ou das ceras',
-    '16010000': 'Enchidos e produtos semelhantes de carne, miudezas ou sangue; preparações alimentícias à base de tais produtos',
-    '16021000': 'Preparações alimentícias homogeneizadas de carnes, miudezas ou sangue',
-    '16022000': 'Preparações alimentícias e conservas de fígados de quaisquer animais',
-    '16023100': 'Preparações alimentícias e conservas de peru',
-    '16023210': 'Preparações alimentícias e conservas de galos e de galinhas',
-    '16023220': 'Preparações alimentícias e conservas de galos e de galinhas',
-    '16023230': 'Preparações alimentícias e conservas de galos e de galinhas',
-    '16023290': 'Preparações alimentícias e conservas de galos e de galinhas',
-    '16023900': 'Preparações alimentícias e conservas de patos, gansos e galinhas d\'angola',
-    '16024100': 'Preparações alimentícias e conservas de pernas e respectivos pedaços, de suínos',
-    '16024200': 'Preparações alimentícias e conservas de pás e respectivos pedaços, de suínos',
-    '16024900': 'Outras preparações alimentícias e conservas de suínos, incluídas as misturas',
-    '16025000': 'Preparações alimentícias e conservas, de bovinos',
-    '16029000': 'Outras preparações alimentícias e conservas de carnes, miudezas ou sangue de animais',
-    '16030000': 'Extratos e sucos de carnes, de peixes ou de crustáceos ou de outros invertebrados aquáticos',
-    '16041100': 'Preparações e conservas de salmões inteiros ou em pedaços, exceto peixes picados',
-    '16041200': 'Preparações e conservas de arenques inteiros ou em pedaços, exceto peixes picados',
-    '16041310': 'Preparações e conservas de sardinhas, sardinelas e espadilhas, inteiras ou em pedaços, exceto peixes picados',
-    '16041390': 'Preparações e conservas de sardinhas, sardinelas e espadilhas, inteiras ou em pedaços, exceto peixes picados',
-    '16041410': 'Preparações e conservas de atuns, bonitos-listrados e bonitos-cachorros, inteiros ou em pedaços, exceto peixes picados',
-    '16041430': 'Preparações e conservas de atuns, bonitos-listrados e bonitos-cachorros, inteiros ou em pedaços, exceto peixes picados',
-    '16041500': 'Preparações e conservas de cavalas, cavalinhas e sardas, inteiras ou em pedaços, exceto peixes picados',
-    '16041600': 'Preparações e conservas de anchovas, inteiras ou em pedaços, exceto peixes picados',
-    '16041900': 'Preparações e conservas de outros peixes, inteiros ou em pedaços, exceto peixes picados',
-    '16042010': 'Outras preparações e conservas de peixes',
-    '16042020': 'Outras preparações e conservas de peixes',
-    '16042030': 'Outras preparações e conservas de peixes',
-    '16042090': 'Outras preparações e conservas de peixes',
-    '16043100': 'Caviar',
-    '16043200': 'Sucedâneos de caviar',
-    '16051000': 'Preparações e conservas de caranguejos',
-    '16052100': 'Preparações e conservas de camarões, não acondicionados em recipientes hermeticamente fechados',
-    '16052900': 'Preparações e conservas de camarões, exceto não acondicionados em recipientes hermeticamente fechados',
-    '16054000': 'Preparações e conservas de outros crustáceos',
-    '16055100': 'Preparações e conservas, de ostras',
-    '16055200': 'Preparações e conservas, de vieiras e outros mariscos',
-    '16055300': 'Preparações e conservas, de mexilhões',
-    '16055400': 'Preparações e conservas, sépias e lulas',
-    '16055500': 'Preparações e conservas, de polvos',
-    '16055600': 'Preparações e conservas, de ameijoas, berbigões e arcas',
-    '16055900': 'Preparações e conservas, de outros moluscos',
-    '16056100': 'Preparações e conservas, de pepinos-do-mar',
-    '16056900': 'Preparações e conservas, de outros invertebrados aquáticos',
-    '17011200': 'Açúcar de beterraba, em bruto, sem adição de aromatizantes ou de corantes',
-    '17011300': 'Açúcar de cana mencionado na nota 2 da subposiçao 1701',
-    '17011400': 'Outros açúcares de cana',
-    '17019100': 'Outros açúcares de cana ou de beterraba, adicionados de aromatizantes ou de corantes, no estado sólido',
-    '17019900': 'Outros açúcares de cana, de beterraba e sacarose quimicamente pura, no estado sólido',
-    '17021100': 'Lactose, no estado sólido, e xarope de lactose contendo, em peso, => 99% de lactose, expressos em lactose anidra, calculado sobre a matéria seca',
-    '17021900': 'Outras lactoses, no estado sólido, e xaropes de lactose',
-    '17022000': 'Açúcar de bordo (ácer), no estado sólido, e xarope de bordo (ácer), sem adição de aromatizantes ou de corantes',
-    '17023011': 'Glicose, no estado sólido, e xarope de glicose, contendo, em peso, no estado seco, menos de 20% de frutose',
-    '17023019': 'Glicose, no estado sólido, e xarope de glicose, contendo, em peso, no estado seco, menos de 20% de frutose',
-    '17023020': 'Glicose, no estado sólido, e xarope de glicose, contendo, em peso, no estado seco, menos de 20% de frutose',
-    '17024010': 'Glicose, no estado sólido, e xarope de glicose, contendo, em peso, no estado seco, 20% até < 50% de frutose',
-    '17024020': 'Glicose, no estado sólido, e xarope de glicose, contendo, em peso, no estado seco, 20% até < 50% de frutose',
-    '17025000': 'Frutose quimicamente pura, no estado sólido',
-    '17026020': 'Frutose, no estado sólido, e xarope de frutose, contendo, em peso, no estado seco, mais de 50% de frutose',
-    '17029000': 'Outros açúcares no estado sólido, xaropes de açúcares, incluído o açúcar invertido, sucedâneos do mel, sem adição de aromatizantes ou de corantes',
-    '17031000': 'Melaços de cana',
-    '17039000': 'Outros melaços da extração ou refinação do açúcar',
-    '17041000': 'Gomas de mascar, sem cacau, mesmo revestidas de açúcar',
-    '17049010': 'Outros produtos de confeitaria, sem cacau',
-    '17049020': 'Outros produtos de confeitaria, sem cacau',
-    '17049090': 'Outros produtos de confeitaria, sem cacau',
-    '18010000': 'Cacau inteiro ou partido, em bruto ou torrado',
-    '18020000': 'Cascas, películas e outros desperdícios de cacau',
-    '18031000': 'Pasta de cacau, não desengordurada',
-    '18032000': 'Pasta de cacau, total ou parcialmente desengordurada',
-    '18040000': 'Manteiga, gordura e óleo de cacau',
-    '18050000': 'Cacau em pó, sem adição de açúcar ou outros edulcorantes',
-    '18061000': 'Cacau em pó, com adição de açúcar ou outros edulcorantes',
-    '18062000': 'Outras preparações alimentícias com cacau, em blocos ou barras, com peso > 2 kg',
-    '18063110': 'Chocolate e outras preparações alimentícias com cacau, recheadas, em tabletes, barras e paus',
-    '18063120': 'Chocolate e outras preparações alimentícias com cacau, recheadas, em tabletes, barras e paus',
-    '18063210': 'Chocolate e outras preparações alimentícias com cacau, não recheadas, em tabletes, barras e paus',
-    '18063220': 'Chocolate e outras preparações alimentícias com cacau, não recheadas, em tabletes, barras e paus',
-    '18069000': 'Outros chocolates e preparações alimentícias contendo cacau',
-    '19011010': 'Preparações para alimentação de crianças acondicionadas para venda a retalho',
-    '19011020': 'Preparações para alimentação de crianças acondicionadas para venda a retalho',
-    '19011030': 'Preparações para alimentação de crianças acondicionadas para venda a retalho',
-    '19011090': 'Preparações para alimentação de crianças acondicionadas para venda a retalho',
-    '19012000': 'Misturas e pastas, para preparação de produtos de padaria, pastelaria',
-    '19012010': 'Misturas e pastas, para preparação de produtos de padaria, pastelaria',
-    '19012020': 'Misturas e pastas, para preparação de produtos de padaria, pastelaria',
-    '19012090': 'Misturas e pastas, para preparação de produtos de padaria, pastelaria',
-    '19019010': 'Outras preparações alimentícias de farinhas, sêmolas, amidos, féculas ou de extratos de malte sem cacau ou contendo menos de 40% de cacau em peso',
-    '19019020': 'Outras preparações alimentícias de farinhas, sêmolas, amidos, féculas ou de extratos de malte sem cacau ou contendo menos de 40% de cacau em peso',
-    '19019090': 'Outras preparações alimentícias de farinhas, sêmolas, amidos, féculas ou de extratos de malte sem cacau ou contendo menos de 40% de cacau em peso',
-    '19021100': 'Massas alimentícias, não cozidas nem recheadas, contendo ovos',
-    '19021900': 'Outras massas alimentícias, não cozidas, nem recheadas, nem preparadas de outro modo',
-    '19022000': 'Massas alimentícias recheadas, mesmo cozidas ou preparadas de outro modo',
-    '19023000': 'Outras massas alimentícias',
-    '19024000': 'Couscous',
-    '19030000': 'Tapioca e seus sucedâneos preparados a partir de féculas, em flocos, grumos, grãos, pérolas ou formas semelhantes',
-    '19041000': 'Produtos à base de cereais, obtidos por expansão ou por torrefação (por exemplo: flocos de milho)',
-    '19042000': 'Preparações alimentícias obtidas de flocos de cereais e misturas',
-    '19043000': 'Trigo burgol (bulgur)',
-    '19049000': 'Outros cereais em grãos, pré-cozidos ou preparados de outro modo',
-    '19051000': 'Pão denominado knackebrot',
-    '19052010': 'Pão de especiarias',
-    '19052090': 'Pão de especiarias',
-    '19053100': 'Bolachas e biscoitos adicionados de edulcorantes',
-    '19053200': 'Waffles e wafers',
-    '19054000': 'Torradas, pão torrado e produtos semelhantes torrados',
-    '19059010': 'Outros produtos de padaria, pastelaria ou da indústria de biscoitos, mesmo com adição de cacau',
-    '19059020': 'Outros produtos de padaria, pastelaria ou da indústria de biscoitos, mesmo com adição de cacau',
-    '19059090': 'Outros produtos de padaria, pastelaria ou da indústria de biscoitos, mesmo com adição de cacau',
-    '20011000': 'Pepinos e pepininhos, preparados ou conservados em vinagre ou em ácido acético',
-    '20019000': 'Outros produtos hortícolas, frutas e outras partes comestíveis de plantas, preparados ou conservados em vinagre ou em ácido acético',
-    '20021000': 'Tomates inteiros ou em pedaços, preparados ou conservados em vinagre ou em ácido acético',
-    '20029000': 'Sucos de tomates e outros tomates preparados ou conservados, exceto em vinagre ou em ácido acético',
-    '20029010': 'Sucos de tomates e outros tomates preparados ou conservados, exceto em vinagre ou em ácido acético',
-    '20029090': 'Sucos de tomates e outros tomates preparados ou conservados, exceto em vinagre ou em ácido acético',
-    '20031000': 'Cogumelos do gênero agaricus preparados ou conservados, exceto em vinagre ou em ácido acético',
-    '20039000': 'Outros cogumelos, preparados ou conservados, exceto em vinagre ou ácido acético',
-    '20041000': 'Batatas preparadas ou conservadas, congeladas, exceto em vinagre ou ácido acético',
-    '20049000': 'Outros produtos hortícolas preparados ou conservados, exceto em vinagre ou em ácido acético, congelados',
-    '20051000': 'Produtos hortícolas homogeneizados, preparados ou conservados, não congelados',
-    '20052000': 'Batatas preparadas ou conservadas, exceto em vinagre ou ácido acético, não congeladas',
-    '20054000': 'Ervilhas preparadas ou conservadas, exceto em vinagre ou ácido acético, não congeladas',
-    '20055100': 'Feijão em grão, preparado ou conservado, exceto em vinagre ou ácido acético, não congelado',
-    '20055900': 'Outros feijões preparados ou conservados, exceto em vinagre ou em ácido acético, não congelados',
-    '20056000': 'Aspargos preparados ou conservados, exceto em vinagre ou ácido acético, não congelados',
-    '20057000': 'Azeitonas preparadas ou conservadas, exceto em vinagre ou ácido acético, não congeladas',
-    '20058000': 'Milho doce, preparado ou conservado, exceto em vinagre ou ácido acético, não congelado',
-    '20059100': 'Brotos de bambu preparados ou conservados, exceto em vinagre ou em ácido acético, não congelados',
-    '20059900': 'Outros produtos hortícolas preparados ou conservados, exceto em vinagre ou em ácido acético, não congelados',
-    '20060000': 'Produtos hortícolas, frutas e cascas, conservados em açúcar',
-    '20071000': 'Preparações homogeneizadas de frutas, obtidas por cozimento',
-    '20079100': 'Doces, geléias, marmelades, purês e pastas de cítricos',
-    '20079910': 'Geleias, doces, purês e marmelades, de outras frutas',
-    '20079921': 'Geleias, doces, purês e marmelades, de outras frutas',
-    '20079922': 'Geleias, doces, purês e marmelades, de outras frutas',
-    '20079923': 'Geleias, doces, purês e marmelades, de outras frutas',
-    '20079924': 'Geleias, doces, purês e marmelades, de outras frutas',
-    '20079925': 'Geleias, doces, purês e marmelades, de outras frutas',
-    '20079926': 'Geleias, doces, purês e marmelades, de outras frutas',
-    '20079927': 'Geleias, doces, purês e marmelades, de outras frutas',
-    '20079929': 'Geleias, doces, purês e marmelades, de outras frutas',
-    '20079990': 'Geleias, doces, purês e marmelades, de outras frutas',
-    '20081100': 'Amendoins preparados ou conservados',
-    '20081900': 'Outras frutas de casca rija e outras sementes, preparadas ou conservadas',
-    '20082010': 'Abacaxis preparados ou conservados',
-    '20082090': 'Abacaxis preparados ou conservados',
-    '20083000': 'Cítricos preparados ou conservados',
-    '20084010': 'Pêras preparadas ou conservadas',
-    '20084090': 'Pêras preparadas ou conservadas',
-    '20085000': 'Damascos preparados ou conservados',
-    '20086010': 'Cerejas preparadas ou conservadas',
-    '20086090': 'Cerejas preparadas ou conservadas',
-    '20087010': 'Pêssegos preparados ou conservados',
-    '20087020': 'Pêssegos preparados ou conservados',
-    '20087090': 'Pêssegos preparados ou conservados',
-    '20088000': 'Morangos preparados ou conservados',
-    '20089100': 'Palmitos preparados ou conservados',
-    '20089300': 'Airelas vermelhas, preparadas ou conservadas de outro modo',
-    '20089710': 'Misturas de outras frutas',
-    '20089790': 'Misturas de outras frutas',
-    '20089900': 'Outras frutas e partes de plantas, preparadas ou conservadas',
-    '20091100': 'Sucos de laranjas, congelados, não fermentados',
-    '20091200': 'Sucos de laranja não congelados, não fermentados, com valor Brix <= 20',
-    '20091900': 'Outros sucos de laranjas, não fermentados',
-    '20092100': 'Suco de pomelo (grapefruit) não fermentado, com valor Brix <= 20',
-    '20092900': 'Outros sucos de pomelo (grapefruit), não fermentados',
-    '20093100': 'Suco de outros cítricos, não fermentado, com valor Brix <= 20',
-    '20093900': 'Outros sucos de outros cítricos, não fermentados',
-    '20094100': 'Suco de abacaxi (ananás), não fermentado, com valor Brix <= 20',
-    '20094900': 'Outros sucos de abacaxi, não fermentados',
-    '20095000': 'Sucos de tomates, não fermentados',
-    '20096100': 'Suco de uvas (inclusive os mostos de uvas), não fermentado, com valor Brix <= 30',
-    '20096900': 'Outros sucos de uvas (inclusive os mostos de uvas), não fermentados',
-    '20097100': 'Suco de maçã, não fermentado, com valor Brix <= 20',
-    '20097900': 'Outros sucos de maçã, não fermentados',
-    '20098100': 'Suco (sumo) de airela vermelha',
-    '20098911': 'Suco (sumo) de qualquer outra fruta ou produto hortícola',
-    '20098912': 'Suco (sumo) de qualquer outra fruta ou produto hortícola',
-    '20098913': 'Suco (sumo) de qualquer outra fruta ou produto hortícola',
-    '20098919': 'Suco (sumo) de qualquer outra fruta ou produto hortícola',
-    '20098921': 'Suco (sumo) de qualquer outra fruta ou produto hortícola',
-    '20098922': 'Suco (sumo) de qualquer outra fruta ou produto hortícola',
-    '20098990': 'Suco (sumo) de qualquer outra fruta ou produto hortícola',
-    '20099000': 'Misturas de sucos, não fermentados',
-    '21011110': 'Extratos, essências e concentrados de café',
-    '21011190': 'Extratos, essências e concentrados de café',
-    '21011200': 'Preparações à base de extratos, essências e concentrados de café',
-    '21012010': 'Extratos, essências, concentrados de chá ou mate e preparações à base destes produtos',
-    '21012020': 'Extratos, essências, concentrados de chá ou mate e preparações à base destes produtos',
-    '21013000': 'Chicória torrada e outros sucedâneos torrados do café e respectivos extratos, essências e concentrados',
-    '21021010': 'Leveduras vivas',
-    '21021090': 'Leveduras vivas',
-    '21022000': 'Leveduras mortas e outros microorganismos monocelulares mortos',
-    '21023000': 'Pós para levedar, preparados',
-    '21031010': 'Molho de soja',
-    '21031090': 'Molho de soja',
-    '21032010': 'Ketchup e outros molhos de tomate',
-    '21032090': 'Ketchup e outros molhos de tomate',
-    '21033010': 'Farinha de mostarda e mostarda preparada',
-    '21033021': 'Farinha de mostarda e mostarda preparada',
-    '21033029': 'Farinha de mostarda e mostarda preparada',
-    '21039011': 'Maionese e outros condimentos e temperos compostos',
-    '21039019': 'Maionese e outros condimentos e temperos compostos',
-    '21039021': 'Maionese e outros condimentos e temperos compostos',
-    '21039029': 'Maionese e outros condimentos e temperos compostos',
-    '21039091': 'Maionese e outros condimentos e temperos compostos',
-    '21039099': 'Maionese e outros condimentos e temperos compostos',
-    '21041011': 'Preparações para caldos e sopas; caldos e sopas preparados',
-    '21041019': 'Preparações para caldos e sopas; caldos e sopas preparados',
-    '21041021': 'Preparações para caldos e sopas; caldos e sopas preparados',
-    '21041029': 'Preparações para caldos e sopas; caldos e sopas preparados',
-    '21042000': 'Preparações alimentícias compostas, homogeneizadas',
-    '21050010': 'Sorvetes, mesmo contendo cacau',
-    '21050090': 'Sorvetes, mesmo contendo cacau',
-    '21061000': 'Concentrados de proteínas e substâncias protéicas texturizadas',
-    '21069010': 'Outras preparações alimentícias',
-    '21069021': 'Outras preparações alimentícias',
-    '21069029': 'Outras preparações alimentícias',
-    '21069030': 'Outras preparações alimentícias',
-    '21069040': 'Outras preparações alimentícias',
-    '21069050': 'Outras preparações alimentícias',
-    '21069060': 'Outras preparações alimentícias',
-    '21069090': 'Outras preparações alimentícias',
-    '22011000': 'Águas minerais e águas gaseificadas',
-    '22019000': 'Outras águas, não adicionadas de açúcar nem aromatizadas; gelo e neve',
-    '22021000': 'Águas, incluídas as águas minerais e as águas gaseificadas, adicionadas de açúcar ou aromatizadas',
-    '22029100': 'Cerveja sem álcool',
-    '22029900': 'Outras bebidas não-alcoólicas (exceto água, cerveja sem álcool e itens da posição 20.09)',
-    '22030000': 'Cervejas de malte',
-    '22041010': 'Vinhos espumantes e espumosos',
-    '22041090': 'Vinhos espumantes e espumosos',
-    '22042100': 'Outros vinhos; mostos de uvas, cuja fermentação tenha sido impedida por adição de álcool, em recipientes com capacidade <= 2 litros',
-    '22042211': 'Outros vinhos; mostos de uvas cuja fermentação tenha sido impedida ou interrompida por adição de álcool, em recipientes de capacidade superior a 2 litros, mas não superior a 10 litros',
-    '22042219': 'Outros vinhos; mostos de uvas cuja fermentação tenha sido impedida ou interrompida por adição de álcool, em recipientes de capacidade superior a 2 litros, mas não superior a 10 litros',
-    '22042220': 'Outros vinhos; mostos de uvas cuja fermentação tenha sido impedida ou interrompida por adição de álcool, em recipientes de capacidade superior a 2 litros, mas não superior a 10 litros',
-    '22042910': 'Outros vinhos; mostos de uvas, cuja fermentação tenha sido impedida por adição de álcool, em recipientes com capacidade > 2 litros',
-    '22042920': 'Outros vinhos; mostos de uvas, cuja fermentação tenha sido impedida por adição de álcool, em recipientes com capacidade > 2 litros',
-    '22043000': 'Outros mostos de uvas parcialmente fermentados',
-    '22051000': 'Vermutes e outros vinhos de uvas frescas, aromatizados, em recipientes com capacidade <= 2 litros',
-    '22059000': 'Outros vermutes e vinhos de uvas frescas, aromatizados',
-    '22060010': 'Sidra e outras bebidas fermentadas e misturas de bebidas fermentadas',
-    '22060090': 'Sidra e outras bebidas fermentadas e misturas de bebidas fermentadas',
-    '22071010': 'Álcool etílico não desnaturado com volume de teor alcoólico => 80%',
-    '22071090': 'Álcool etílico não desnaturado com volume de teor alcoólico => 80%',
-    '22072011': 'Álcool etílico e aguardentes desnaturados com qualquer teor alcoólico',
-    '22072019': 'Álcool etílico e aguardentes desnaturados com qualquer teor alcoólico',
-    '22072020': 'Álcool etílico e aguardentes desnaturados com qualquer teor alcoólico',
-    '22082000': 'Aguardentes de vinho ou de bagaço de uvas',
-    '22083010': 'Uísques',
-    '22083020': 'Uísques',
-    '22083090': 'Uísques',
-    '22084000': 'Cachaça e caninha (rum e tafiá)',
-    '22085000': 'Gim e genebra',
-    '22086000': 'Vodca',
-    '22087000': 'Licores',
-    '22089000': 'Outras bebidas alcoólicas',
-    '22090000': 'Vinagres e sucedâneos obtidos a partir do ácido acético, para uso alimentar',
-    '23011010': 'Farinhas, pós e pellets de carnes ou de miudezas, impróprios para alimentação humana; torresmos',
-    '23011090': 'Farinhas, pós e pellets de carnes ou de miudezas, impróprios para alimentação humana; torresmos',
-    '23012010': 'Farinhas, pós e pellets de peixes ou crustáceos, impróprios para alimentação humana',
-    '23021000': 'Sêmeas, farelos e outros resíduos de milho',
-    '23023010': 'Sêmeas, farelos e outros resíduos de trigo',
-    '23023090': 'Sêmeas, farelos e outros resíduos de trigo',
-    '23024000': 'Sêmeas, farelos e outros resíduos de outros cereais',
-    '23025000': 'Sêmeas, farelos e outros resíduos de leguminosas',
-    '23031000': 'Resíduos da fabricação do amido e resíduos semelhantes',
-    '23032000': 'Polpas de beterraba, bagaços de cana-de-açúcar e outros desperdícios da indústria do açúcar',
-    '23033000': 'Borras e desperdícios da indústria da cerveja e das destilarias',
-    '23040010': 'Tortas e outros resíduos sólidos da extração do óleo de soja',
-    '23040090': 'Tortas e outros resíduos sólidos da extração do óleo de soja',
-    '23050000': 'Tortas e outros resíduos sólidos da extração de óleo de amendoim',
-    '23061000': 'Tortas e outros resíduos sólidos da extração de óleo de algodão',
-    '23062000': 'Tortas e outros resíduos sólidos da extração de óleo de linhaça',
-    '23063010': 'Tortas e outros resíduos sólidos da extração de óleo de girassol',
-    '23063090': 'Tortas e outros resíduos sólidos da extração de óleo de girassol',
-    '23064100': 'Torta de sementes de nabo silvestre ou de colza, de baixo teor de ácido erúcico',
-    '23064900': 'Outras tortas de nabo silvestre ou colza',
-    '23065000': 'Tortas e outros resíduos sólidos da extração do óleo de coco ou de copra',
-    '23066000': 'Tortas e outros resíduos sólidos da extração do óleo de nozes ou de palmiste',
-    '23069010': 'Tortas e outros resíduos sólidos da extração de outros óleos ou gorduras vegetais',
-    '23069090': 'Tortas e outros resíduos sólidos da extração de outros óleos ou gorduras vegetais',
-    '23070000': 'Borras de vinho; tártaro em bruto',
-    '23080000': 'Matérias vegetais, subprodutos, resíduos e desperdícios vegetais, utilizados na alimentação de animais',
-    '23091000': 'Alimentos para cães e gatos, acondicionados para venda a retalho',
-    '23099010': 'Outras preparações para alimentação de animais',
-    '23099020': 'Outras preparações para alimentação de animais',
-    '23099030': 'Outras preparações para alimentação de animais',
-    '23099040': 'Outras preparações para alimentação de animais',
-    '23099050': 'Outras preparações para alimentação de animais',
-    '23099060': 'Outras preparações para alimentação de animais',
-    '23099090': 'Outras preparações para alimentação de animais',
-    '24011010': 'Fumo não manufaturado, não destalado',
-    '24011020': 'Fumo não manufaturado, não destalado',
-    '24011030': 'Fumo não manufaturado, não destalado',
-    '24011040': 'Fumo não manufaturado, não destalado',
-    '24011090': 'Fumo não manufaturado, não destalado',
-    '24012010': 'Fumo não manufaturado, total ou parcialmente destalado',
-    '24012020': 'Fumo não manufaturado, total ou parcialmente destalado',
-    '24012030': 'Fumo não manufaturado, total ou parcialmente destalado',
-    '24012040': 'Fumo não manufaturado, total ou parcialmente destalado',
-    '24012090': 'Fumo não manufaturado, total ou parcialmente destalado',
-    '24013000': 'Desperdícios de fumo',
-    '24021000': 'Charutos e cigarrilhas, de fumo',
-    '24022000': 'Cigarros contendo fumo',
-    '24029000': 'Charutos, cigarrilhas e cigarros de sucedâneos de fumo (tabaco)',
-    '24031100': 'Tabaco para narguile, mencionado na nota 1 da subposição 2403',
-    '24031900': 'Outros tabacos para fumar',
-    '24039100': 'Fumo manufaturado, homogeneizado ou reconstituído',
-    '24039910': 'Extratos, molhos e outros produtos do fumo e seus sucedâneos, manufaturados',
-    '24039990': 'Extratos, molhos e outros produtos do fumo e seus sucedâneos, manufaturados',
-    '24041100': 'Produtos destinados à inalação sem combustão, contendo tabaco ou tabaco reconstituído',
-    '24041200': 'Outros produtos destinados à inalação sem combustão, contendo nicotina',
-    '24049100': 'Outros produtos contendo nicotina destinados à ingestão de nicotina no corpo humano para aplicação oral',
-    '24049900': 'Outros produtos que contenham tabaco, tabaco reconstituído, nicotina ou tabaco ou sucedâneos da nicotina, destinados à inalação sem combustão; outros produtos contendo nicotina destinados à ingestão de nicotina no corpo humano; não classificado nos códigos anteriores',
-    '25010011': 'Sal (incluídos o sal de mesa e o sal desnaturado) e cloreto de sódio puro, mesmo em solução aquosa ou adicionados de agentes antiaglomerantes',
-    '25010019': 'Sal (incluídos o sal de mesa e o sal desnaturado) e cloreto de sódio puro, mesmo em solução aquosa ou adicionados de agentes antiaglomerantes',
-    '25010020': 'Sal (incluídos o sal de mesa e o sal desnaturado) e cloreto de sódio puro, mesmo em solução aquosa ou adicionados de agentes antiaglomerantes',
-    '25010090': 'Sal (incluídos o sal de mesa e o sal desnaturado) e cloreto de sódio puro, mesmo em solução aquosa ou adicionados de agentes antiaglomerantes',
-    '25020000': 'Piritas de ferro não ustuladas',
-    '25030010': 'Enxofre de qualquer espécie, exceto sublimado, precipitado ou coloidal',
-    '25030090': 'Enxofre de qualquer espécie, exceto sublimado, precipitado ou coloidal',
-    '25041000': 'Grafita natural, em pó ou em escamas',
-    '25049000': 'Outras formas de grafita natural',
-    '25051000': 'Areias siliciosas e areias quartzosas',
-    '25059000': 'Outras areias naturais, mesmo coradas',
-    '25061000': 'Quartzo',
-    '25062000': 'Quartzitos, mesmo desbastados ou cortados, em blocos ou placas de forma quadrada ou retangular',
-    '25070010': 'Caulim e outras argilas caulínicas, mesmo calcinadas',
-    '25070090': 'Caulim e outras argilas caulínicas, mesmo calcinadas',
-    '25081000': 'Bentonita',
-    '25083000': 'Argilas refratárias',
-    '25084010': 'Outras argilas',
-    '25084090': 'Outras argilas',
-    '25085000': 'Andaluzita, cianita e silimanita',
-    '25086000': 'Mulita',
-    '25087000': 'Barro cozido em pó (terra chamotte) e terra de dinas',
-    '25090000': 'Cré',
-    '25101010': 'Fosfatos de cálcio naturais, fosfatos aluminocálcicos naturais, cré-fosfatado, não moídos',
-    '25101090': 'Fosfatos de cálcio naturais, fosfatos aluminocálcicos naturais, cré-fosfatado, não moídos',
-    '25102010': 'Fosfatos de cálcio naturais, fosfatos aluminocálcicos naturais, cré-fosfatado, moídos',
-    '25102090': 'Fosfatos de cálcio naturais, fosfatos aluminocálcicos naturais, cré-fosfatado, moídos',
-    '25111000': 'Sulfato de bário natural (baritina)',
-    '25112000': 'Carbonato de bário natural (witherita)',
-    '25120000': 'Farinhas siliciosas fósseis e outras terras siliciosas, de densidade aparente <= 1',
-    '25131000': 'Pedra-pomes',
-    '25132000': 'Esmeril, corindo natural, granada natural e outros abrasivos naturais, mesmo tratados termicamente',
-    '25140000': 'Ardósia, inclusive desbastada ou cortada em blocos ou placas',
-    '25151100': 'Mármores e travertinos, em bruto ou desbastados',
-    '25151210': 'Mármores e travertinos, cortados em blocos ou placas de forma quadrada ou retangular',
-    '25151220': 'Mármores e travertinos, cortados em blocos ou placas de forma quadrada ou retangular',
-    '25152000': 'Granitos belgas, outras pedras calcárias de cantaria ou de construção; alabastro',
-    '25161100': 'Granito em bruto ou desbastado',
-    '25161200': 'Granito, cortado em blocos ou placas de forma quadrada ou retangular',
-    '25162000': 'Arenito, mesmo desbastado ou cortado em blocos ou placas de forma quadrada ou retangular',
-    '25169000': 'Outras pedras de cantaria ou de construção em formatos quadrados ou retangulares',
-    '25171000': 'Calhaus, cascalhos e pedras britadas, para uso em concreto ou para empedramento de estradas ou de vias férreas',
-    '25172000': 'Macadame de escórias de altos-fornos ou de outras escórias ou resíduos',
-    '25173000': 'Tarmacadame',
-    '25174100': 'Grânulos, lascas e pós, de mármore',
-    '25174900': 'Grânulos, lascas e pós, de granito e de outras pedras de cantaria',
-    '25181000': 'Dolomita não calcinada nem sinterizada (crua), cortada em blocos ou placas de forma quadrada ou retangular',
-    '25182000': 'Dolomita calcinada ou sinterizada, em blocos e placas em formatos quadrados ou retangulares',
-    '25183000': 'Aglomerados de dolomita',
-    '25191000': 'Carbonato de magnésio natural (magnesita)',
-    '25199010': 'Magnésia eletrofundida, magnésia calcinada a fundo e outros óxidos de magnésio',
-    '25199090': 'Magnésia eletrofundida, magnésia calcinada a fundo e outros óxidos de magnésio',
-    '25201011': 'Gipsita; anidrita',
-    '25201019': 'Gipsita; anidrita',
-    '25202010': 'Gesso',
-    '25202090': 'Gesso',
-    '25210000': 'Castinas; pedras calcárias para fabricação de cal ou de cimento',
-    '25221000': 'Cal viva',
-    '25222000': 'Cal apagada',
-    '25223000': 'Cal hidráulica',
-    '25231000': 'Cimentos não pulverizados (clinkers)',
-    '25232100': 'Cimentos portland brancos, mesmo corados artificialmente',
-    '25232910': 'Outros tipos de cimento portland',
-    '25232990': 'Outros tipos de cimento portland',
-    '25233000': 'Cimentos aluminosos',
-    '25239000': 'Outros cimentos hidráulicos, coloridos ou não',
-    '25249000': 'Outras formas de amianto (asbesto)',
-    '25251000': 'Mica em bruto ou clivada em folhas ou lamelas irregulares',
-    '25252000': 'Mica em pó',
-    '25253000': 'Desperdícios de mica',
-    '25261000': 'Esteatita natural, não triturada nem em pó',
-    '25262000': 'Esteatita natural, triturada ou em pó e talco',
-    '25280000': 'Boratos naturais e seus concentrados (calcinados ou não)',
-    '25291000': 'Feldspato',
-    '25292100': 'Espatoflúor, contendo peso <= 97% de fluoreto de cálcio',
-    '25293000': 'Leucita, nefelina e nefelina-sienito',
-    '25301010': 'Vermiculita, perlita e cloritas, não expandidas',
-    '25301090': 'Vermiculita, perlita e cloritas, não expandidas',
-    '25302000': 'Kieserita, epsomita (sulfatos de magnésio naturais)',
-    '25309010': 'Outras matérias minerais (espodumênio, areias de zircônio, terras corantes)',
-    '25309020': 'Outras matérias minerais (espodumênio, areias de zircônio, terras corantes)',
-    '25309030': 'Outras matérias minerais (espodumênio, areias de zircônio, terras corantes)',
-    '25309040': 'Outras matérias minerais (espodumênio, areias de zircônio, terras corantes)',
-    '25309090': 'Outras matérias minerais (espodumênio, areias de zircônio, terras corantes)',
-    '26011100': 'Minérios de ferro não aglomerados e seus concentrados',
-    '26011210': 'Minérios de ferro aglomerados e seus concentrados',
-    '26011290': 'Minérios de ferro aglomerados e seus concentrados',
-    '26012000': 'Piritas de ferro ustuladas (cinzas de piritas)',
-    '26020010': 'Minérios de manganês e seus concentrados, incluídos os minérios de manganês ferruginosos e seus concentrados, de teor de manganês de => 20%, em peso, sobre o produto seco',
-    '26020090': 'Minérios de manganês e seus concentrados, incluídos os minérios de manganês ferruginosos e seus concentrados, de teor de manganês de => 20%, em peso, sobre o produto seco',
-    '26030010': 'Minérios de cobre e seus concentrados',
-    '26030090': 'Minérios de cobre e seus concentrados',
-    '26040000': 'Minérios de níquel e seus concentrados',
-    '26060011': 'Minérios de alumínio e seus concentrados',
-    '26060012': 'Minérios de alumínio e seus concentrados',
-    '26060090': 'Minérios de alumínio e seus concentrados',
-    '26070000': 'Minérios de chumbo e seus concentrados',
-    '26080010': 'Minérios de zinco e seus concentrados',
-    '26080090': 'Minérios de zinco e seus concentrados',
-    '26090000': 'Minérios de estanho e seus concentrados',
-    '26100010': 'Minérios de cromo e seus concentrados',
-    '26100090': 'Minérios de cromo e seus concentrados',
-    '26110000': 'Minérios de tungstênio e seus concentrados',
-    '26131010': 'Minérios de molibdênio ustulados e seus concentrados',
-    '26131090': 'Minérios de molibdênio ustulados e seus concentrados',
-    '26139010': 'Minérios de molibdênio não ustulados e concentrados',
-    '26139090': 'Minérios de molibdênio não ustulados e concentrados',
-    '26140010': 'Minérios de titânio e seus concentrados',
-    '26140090': 'Minérios de titânio e seus concentrados',
-    '26151020': 'Minérios de zircônio e seus concentrados',
-    '26151090': 'Minérios de zircônio e seus concentrados',
-    '26159000': 'Minérios de nióbio, tântalo ou vanádio, e seus concentrados',
-    '26161000': 'Minérios de prata e seus concentrados',
-    '26169000': 'Minérios de outros metais preciosos e seus concentrados',
-    '26179000': 'Outros minérios e seus concentrados',
-    '26180000': 'Escória de altos-fornos granulada, proveniente da fabricação do ferro e aço',
-    '26190000': 'Outras escórias e desperdícios da fabricação do ferro e aço',
-    '26201100': 'Mates de galvanização (contendo zinco)',
-    '26201900': 'Outras cinzas e resíduos contendo zinco',
-    '26202900': 'Outras cinzas e resíduos, contendo principalmente chumbo',
-    '26203000': 'Cinzas e resíduos contendo cobre',
-    '26204000': 'Cinzas e resíduos contendo alumínio',
-    '26209990': 'Cinzas e resíduos, contendo outros metais ou compostos de metais',
-    '26219010': 'Outras escórias e cinzas, incluídas as cinzas de algas',
-    '26219090': 'Outras escórias e cinzas, incluídas as cinzas de algas',
-    '27011100': 'Hulha antracita, não aglomerada',
-    '27011200': 'Hulha betuminosa, não aglomerada',
-    '27011900': 'Outras hulhas, mesmo em pó, mas não aglomeradas',
-    '27012000': 'Briquetes, bolas em aglomerados e combustíveis sólidos obtidos da hulha',
-    '27021000': 'Linhitas, mesmo em pó, mas não aglomeradas',
-    '27022000': 'Linhitas aglomeradas',
-    '27030000': 'Turfa (incluída a turfa para cama de animais), mesmo aglomerada',
-    '27040011': 'Coques e semicoques de hulha, de linhita ou de turfa, mesmo aglomerados; carvão de retorta',
-    '27040012': 'Coques e semicoques de hulha, de linhita ou de turfa, mesmo aglomerados; carvão de retorta',
-    '27040090': 'Coques e semicoques de hulha, de linhita ou de turfa, mesmo aglomerados; carvão de retorta',
-    '27050000': 'Gás de hulha, gás de água, gás pobre e gases semelhantes, exceto de gases de petróleo e outros hidrocarbonetos gasosos',
-    '27060000': 'Alcatrões de hulha, de linhita, de turfa e outros alcatrões minerais',
-    '27071000': 'Benzol (benzeno), produto da destilação dos alcatrões de hulha a alta temperatura',
-    '27072000': 'Toluol (tolueno), produto da destilação dos alcatrões de hulha a alta temperatura',
-    '27073000': 'Xilol (xilenos), produto da destilação dos alcatrões de hulha a altas temperatura',
-    '27075000': 'Outras misturas de hidrocarbonetos aromáticos',
-    '27075010': 'Outras misturas de hidrocarbonetos aromáticos',
-    '27075090': 'Outras misturas de hidrocarbonetos aromáticos',
-    '27079100': 'Óleos de creosoto',
-    '27079910': 'Óleos e outros produtos da destilação dos alcatrões da hulha a alta temperatura',
-    '27079990': 'Óleos e outros produtos da destilação dos alcatrões da hulha a alta temperatura',
-    '27081000': 'Breu obtido a partir do alcatrão de hulha ou de outros alcatrões minerais',
-    '27082000': 'Coque de breu obtido de alcatrões minerais',
-    '27090010': 'Óleos brutos de petróleo ou de minerais betuminosos',
-    '27090090': 'Óleos brutos de petróleo ou de minerais betuminosos',
-    '27101210': 'Óleos leves e preparações',
-    '27101221': 'Óleos leves e preparações',
-    '27101229': 'Óleos leves e preparações',
-    '27101230': 'Óleos leves e preparações',
-    '27101241': 'Óleos leves e preparações',
-    '27101249': 'Óleos leves e preparações',
-    '27101251': 'Óleos leves e preparações',
-    '27101259': 'Óleos leves e preparações',
-    '27101260': 'Óleos leves e preparações',
-    '27101290': 'Óleos leves e preparações',
-    '27101911': 'Outros óleos de petróleo ou de minerais betuminosos e preparações, exceto desperdícios',
-    '27101919': 'Outros óleos de petróleo ou de minerais betuminosos e preparações, exceto desperdícios',
-    '27101921': 'Outros óleos de petróleo ou de minerais betuminosos e preparações, exceto desperdícios',
-    '27101922': 'Outros óleos de petróleo ou de minerais betuminosos e preparações, exceto desperdícios',
-    '27101929': 'Outros óleos de petróleo ou de minerais betuminosos e preparações, exceto desperdícios',
-    '27101931': 'Outros óleos de petróleo ou de minerais betuminosos e preparações, exceto desperdícios',
-    '27101932': 'Outros óleos de petróleo ou de minerais betuminosos e preparações, exceto desperdícios',
-    '27101991': 'Outros óleos de petróleo ou de minerais betuminosos e preparações, exceto desperdícios',
-    '27101992': 'Outros óleos de petróleo ou de minerais betuminosos e preparações, exceto desperdícios',
-    '27101993': 'Outros óleos de petróleo ou de minerais betuminosos e preparações, exceto desperdícios',
-    '27101994': 'Outros óleos de petróleo ou de minerais betuminosos e preparações, exceto desperdícios',
-    '27101999': 'Outros óleos de petróleo ou de minerais betuminosos e preparações, exceto desperdícios',
-    '27102000': 'Óleos de petróleo ou minerais betuminosos (exceto óleo bruto)',
-    '27109100': 'Desperdícios de óleos, contendo difenilas policloradas ou polibromadas, ou terfenilas policloradas',
-    '27109120': 'Desperdícios de óleos, contendo difenilas policloradas ou polibromadas, ou terfenilas policloradas',
-    '27109900': 'Outros desperdícios de óleos',
-    '27111100': 'Gás natural, liquefeito',
-    '27111210': 'Propano, liquefeito',
-    '27111290': 'Propano, liquefeito',
-    '27111300': 'Butanos, liquefeitos',
-    '27111400': 'Etileno, propileno, butileno e butadieno, liquefeitos',
-    '27111910': 'Outros gases liquefeitos de hidrocarbonetos gasosos',
-    '27111990': 'Outros gases liquefeitos de hidrocarbonetos gasosos',
-    '27112100': 'Gás natural no estado gasoso',
-    '27112910': 'Butanos, outros hidrocarbonetos e gás petróleo, no estado gasoso',
-    '27112990': 'Butanos, outros hidrocarbonetos e gás petróleo, no estado gasoso',
-    '27121000': 'Vaselina',
-    '27122000': 'Parafina contendo, em peso, < 0,75% de óleo',
-    '27129000': 'Cera de petróleo microcristalina, slack wax, ozocerite, outras ceras minerais e produtos semelhantes',
-    '27131100': 'Coque de petróleo não calcinado',
-    '27131200': 'Coque de petróleo calcinado',
-    '27132000': 'Betume de petróleo',
-    '27139000': 'Outros resíduos dos óleos de petróleo ou de minerais betuminosos',
-    '27141000': 'Xistos e areias betuminosos',
-    '27149000': 'Betumes e asfaltos naturais, asfaltitas e rochas asfálticas',
-    '27150000': 'Misturas betuminosas à base de asfalto, de betumes, de alcatrão ou de breu de alcatrão mineral',
-    '27160000': 'Energia elétrica',
-    '28011000': 'Cloro',
-    '28012010': 'Iodo',
-    '28012090': 'Iodo',
-    '28020000': 'Enxofre sublimado ou precipitado; enxofre coloidal',
-    '28030011': 'Carbono (negros-de-carbono e outras formas não compreendidas em outras posições)',
-    '28030019': 'Carbono (negros-de-carbono e outras formas não compreendidas em outras posições)',
-    '28030090': 'Carbono (negros-de-carbono e outras formas não compreendidas em outras posições)',
-    '28041000': 'Hidrogênio',
-    '28042100': 'Argônio (gases raros)',
-    '28042910': 'Outros gases raros',
-    '28042990': 'Outros gases raros',
-    '28043000': 'Nitrogênio',
-    '28044000': 'Oxigênio',
-    '28045000': 'Boro; telúrio',
-    '28046100': 'Silício, contendo, em peso, => 99,99% de silício',
-    '28046900': 'Outros silícios',
-    '28047020': 'Fósforo',
-    '28047030': 'Fósforo',
-    '28048000': 'Arsênio',
-    '28049000': 'Selênio',
-    '28051100': 'Sódio (metal alcalino)',
-    '28051200': 'Cálcio',
-    '28051990': 'Outros metais alcalinos ou alcalinoterrosos',
-    '28053010': 'Metais de terras raras, escândio e ítrio, mesmo misturados ou ligados entre si',
-    '28061010': 'Cloreto de hidrogênio (ácido clorídrico)',
-    '28061020': 'Cloreto de hidrogênio (ácido clorídrico)',
-    '28070010': 'Ácido sulfúrico e ácido sulfúrico fumante (oleum)',
-    '28070020': 'Ácido sulfúrico e ácido sulfúrico fumante (oleum)',
-    '28080010': 'Ácido nítrico; ácidos sulfonítricos',
-    '28080020': 'Ácido nítrico; ácidos sulfonítricos',
-    '28092011': 'Ácido fosfórico e ácidos polifosfóricos',
-    '28092019': 'Ácido fosfórico e ácidos polifosfóricos',
-    '28092020': 'Ácido fosfórico e ácidos polifosfóricos',
-    '28092090': 'Ácido fosfórico e ácidos polifosfóricos',
-    '28100010': 'Óxidos de boro; ácidos bóricos',
-    '28100090': 'Óxidos de boro; ácidos bóricos',
-    '28111910': 'Outros ácidos inorgânicos',
-    '28111920': 'Outros ácidos inorgânicos',
-    '28111940': 'Outros ácidos inorgânicos',
-    '28111990': 'Outros ácidos inorgânicos',
-    '28112100': 'Dióxido de carbono',
-    '28112210': 'Dióxido de silício',
-    '28112220': 'Dióxido de silício',
-    '28112230': 'Dióxido de silício',
-    '28112290': 'Dióxido de silício',
-    '28112990': 'Outros compostos oxigenados inorgânicos dos elementos não metálicos',
-    '28121919': 'Outros halogenetos e oxialogenetos dos elementos não-metálicos',
-    '28129000': 'Outros halogenetos e oxialogenetos dos elementos não metálicos',
-    '28139010': 'Outros sulfetos dos elementos não metálicos e trissulfeto de fósforo comercial',
-    '28139090': 'Outros sulfetos dos elementos não metálicos e trissulfeto de fósforo comercial',
-    '28141000': 'Amoníaco anidro',
-    '28142000': 'Amoníaco em solução aquosa (amônia)',
-    '28151100': 'Hidróxido de sódio (soda cáustica) sólido',
-    '28151200': 'Hidróxido de sódio (soda cáustica) em solução aquosa',
-    '28152000': 'Hidróxido de potássio (potassa cáustica)',
-    '28161010': 'Hidróxido e peróxido de magnésio',
-    '28164010': 'Óxidos, hidróxidos, peróxidos, de estrôncio ou de bário',
-    '28164090': 'Óxidos, hidróxidos, peróxidos, de estrôncio ou de bário',
-    '28170010': 'Óxido de zinco; peróxido de zinco',
-    '28170020': 'Óxido de zinco; peróxido de zinco',
-    '28181010': 'Corindo artificial, quimicamente definido ou não',
-    '28181090': 'Corindo artificial, quimicamente definido ou não',
-    '28182010': 'Óxidos de alumínio, exceto corindo artificial',
-    '28182090': 'Óxidos de alumínio, exceto corindo artificial',
-    '28183000': 'Hidróxido de alumínio',
-    '28191000': 'Trióxido de cromo',
-    '28199010': 'Óxidos e hidróxidos de cromo',
-    '28199020': 'Óxidos e hidróxidos de cromo',
-    '28201000': 'Dióxido de manganês',
-    '28201010': 'Dióxido de manganês',
-    '28201090': 'Dióxido de manganês',
-    '28209010': 'Outros óxidos de manganês',
-    '28209030': 'Outros óxidos de manganês',
-    '28211011': 'Óxidos e hidróxidos de ferro',
-    '28211019': 'Óxidos e hidróxidos de ferro',
-    '28211020': 'Óxidos e hidróxidos de ferro',
-    '28211030': 'Óxidos e hidróxidos de ferro',
-    '28211090': 'Óxidos e hidróxidos de ferro',
-    '28212000': 'Terras corantes contendo, em peso, => 70% de ferro combinado, expresso em FE2O3',
-    '28220010': 'Óxidos e hidróxidos de cobalto, inclusive os comerciais',
-    '28220090': 'Óxidos e hidróxidos de cobalto, inclusive os comerciais',
-    '28230010': 'Óxidos de titânio',
-    '28230090': 'Óxidos de titânio',
-    '28241000': 'Monóxido de chumbo (litargírio, massicote)',
-    '28249010': 'Outros óxidos de chumbo (minio e minio-laranja)',
-    '28251010': 'Hidrazina e hidroxilamina e seus sais inorgânicos',
-    '28251020': 'Hidrazina e hidroxilamina e seus sais inorgânicos',
-    '28252010': 'Óxido e hidróxido de lítio',
-    '28252020': 'Óxido e hidróxido de lítio',
-    '28253010': 'Óxidos e hidróxidos de vanádio',
-    '28253090': 'Óxidos e hidróxidos de vanádio',
-    '28254010': 'Óxidos e hidróxidos de níquel',
-    '28254090': 'Óxidos e hidróxidos de níquel',
-    '28255010': 'Óxidos e hidróxidos de cobre',
-    '28255090': 'Óxidos e hidróxidos de cobre',
-    '28256010': 'Óxidos de germânio e dióxido de zircônio',
-    '28258010': 'Óxidos de antimônio',
-    '28259020': 'Outras bases inorgânicas; óxidos, hidróxidos e peróxidos de outros metais',
-    '28259090': 'Outras bases inorgânicas; óxidos, hidróxidos e peróxidos de outros metais',
-    '28261200': 'Fluoretos de alumínio',
-    '28261920': 'Outros fluoretos',
-    '28261990': 'Outros fluoretos',
-    '28263000': 'Hexafluoraluminato de sódio (criolita sintética)',
-    '28269010': 'Outros fluossilicatos, fluoraluminatos e sais complexos de flúor',
-    '28269020': 'Outros fluossilicatos, fluoraluminatos e sais complexos de flúor',
-    '28269090': 'Outros fluossilicatos, fluoraluminatos e sais complexos de flúor',
-    '28271000': 'Cloreto de amônio',
-    '28272010': 'Cloreto de cálcio',
-    '28272090': 'Cloreto de cálcio',
-    '28273110': 'Cloreto de magnésio',
-    '28273190': 'Cloreto de magnésio',
-    '28273200': 'Cloreto de alumínio',
-    '28273500': 'Cloreto de níquel',
-    '28273910': 'Outros cloretos',
-    '28273939': 'Outros cloretos',
-    '28273993': 'Outros cloretos',
-    '28273994': 'Outros cloretos',
-    '28273995': 'Outros cloretos',
-    '28273996': 'Outros cloretos',
-    '28273997': 'Outros cloretos',
-    '28273998': 'Outros cloretos',
-    '28273999': 'Outros cloretos',
-    '28274110': 'Oxicloretos e hidroxicloretos de cobre',
-    '28274911': 'Outros oxicloretos e hidroxicloretos',
-    '28274912': 'Outros oxicloretos e hidroxicloretos',
-    '28274919': 'Outros oxicloretos e hidroxicloretos',
-    '28274921': 'Outros oxicloretos e hidroxicloretos',
-    '28274929': 'Outros oxicloretos e hidroxicloretos',
-    '28275100': 'Brometos de sódio ou de potássio',
-    '28275900': 'Outros brometos e oxibrometos',
-    '28276011': 'Iodetos e oxiiodetos',
-    '28276012': 'Iodetos e oxiiodetos',
-    '28276019': 'Iodetos e oxiiodetos',
-    '28281000': 'Hipocloritos de cálcio, inclusive o comercial',
-    '28289011': 'Outros hipocloritos, cloritos e hipobromitos',
-    '28289019': 'Outros hipocloritos, cloritos e hipobromitos',
-    '28289020': 'Outros hipocloritos, cloritos e hipobromitos',
-    '28289090': 'Outros hipocloritos, cloritos e hipobromitos',
-    '28291100': 'Cloratos de sódio',
-    '28291920': 'Outros cloratos',
-    '28299019': 'Bromatos e perbromatos, iodatos e periodatos; percloratos',
-    '28299031': 'Bromatos e perbromatos, iodatos e periodatos; percloratos',
-    '28299032': 'Bromatos e perbromatos, iodatos e periodatos; percloratos',
-    '28299040': 'Bromatos e perbromatos, iodatos e periodatos; percloratos',
-    '28299050': 'Bromatos e perbromatos, iodatos e periodatos; percloratos',
-    '28301010': 'Sulfeto de sódio',
-    '28301020': 'Sulfeto de sódio',
-    '28309011': 'Outros sulfetos e polissulfetos',
-    '28309013': 'Outros sulfetos e polissulfetos',
-    '28309016': 'Outros sulfetos e polissulfetos',
-    '28309019': 'Outros sulfetos e polissulfetos',
-    '28309020': 'Outros sulfetos e polissulfetos',
-    '28311011': 'Ditionitos e sulfoxilatos de sódio',
-    '28311019': 'Ditionitos e sulfoxilatos de sódio',
-    '28311021': 'Ditionitos e sulfoxilatos de sódio',
-    '28311029': 'Ditionitos e sulfoxilatos de sódio',
-    '28319090': 'Outros ditionitos e sulfoxilatos',
-    '28321010': 'Sulfitos de sódio',
-    '28321090': 'Sulfitos de sódio',
-    '28322000': 'Outros sulfitos',
-    '28323010': 'Tiossulfatos',
-    '28323020': 'Tiossulfatos',
-    '28323090': 'Tiossulfatos',
-    '28331110': 'Sulfato dissódico',
-    '28331190': 'Sulfato dissódico',
-    '28331900': 'Outros sulfatos de sódio',
-    '28332100': 'Sulfato de magnésio',
-    '28332200': 'Sulfato de alumínio',
-    '28332400': 'Sulfato de níquel',
-    '28332510': 'Sulfato de cobre',
-    '28332520': 'Sulfato de cobre',
-    '28332710': 'Sulfato de bário',
-    '28332790': 'Sulfato de bário',
-    '28332930': 'Outros sulfatos',
-    '28332940': 'Outros sulfatos',
-    '28332950': 'Outros sulfatos',
-    '28332960': 'Outros sulfatos',
-    '28332970': 'Outros sulfatos',
-    '28332990': 'Outros sulfatos',
-    '28333000': 'Alumes',
-    '28334010': 'Peroxossulfatos (persulfatos)',
-    '28334020': 'Peroxossulfatos (persulfatos)',
-    '28334090': 'Peroxossulfatos (persulfatos)',
-    '28341010': 'Nitritos',
-    '28341090': 'Nitritos',
-    '28342190': 'Nitratos de potássio',
-    '28342910': 'Outros nitratos',
-    '28342940': 'Outros nitratos',
-    '28342990': 'Outros nitratos',
-    '28351011': 'Fosfinatos (hipofosfito) e fosfonatos (fosfitos)',
-    '28351019': 'Fosfinatos (hipofosfito) e fosfonatos (fosfitos)',
-    '28351029': 'Fosfinatos (hipofosfito) e fosfonatos (fosfitos)',
-    '28352200': 'Fosfatos mono ou dissódico',
-    '28352400': 'Fosfatos de potássio',
-    '28352500': 'Fosfato hidrogeno-ortofosfato de cálcio (dicálcico)',
-    '28352600': 'Outros fosfatos de cálcio',
-    '28352930': 'Outros fosfatos',
-    '28352940': 'Outros fosfatos',
-    '28352980': 'Outros fosfatos',
-    '28352990': 'Outros fosfatos',
-    '28353110': 'Trifosfato de sódio (tripolifosfato de sódio)',
-    '28353190': 'Trifosfato de sódio (tripolifosfato de sódio)',
-    '28353910': 'Outros polifosfatos',
-    '28353920': 'Outros polifosfatos',
-    '28353990': 'Outros polifosfatos',
-    '28362010': 'Carbonato dissódico',
-    '28362090': 'Carbonato dissódico',
-    '28363000': 'Hidrogenocarbonato (bicarbonato) de sódio',
-    '28364000': 'Carbonatos de potássio',
-    '28365000': 'Carbonato de cálcio',
-    '28366010': 'Carbonato de bário',
-    '28366090': 'Carbonato de bário',
-    '28369100': 'Carbonatos de lítio',
-    '28369200': 'Carbonato de estrôncio',
-    '28369911': 'Outros carbonatos e peroxocarbonatos (percarbonatos)',
-    '28369913': 'Outros carbonatos e peroxocarbonatos (percarbonatos)',
-    '28369919': 'Outros carbonatos e peroxocarbonatos (percarbonatos)',
-    '28369920': 'Outros carbonatos e peroxocarbonatos (percarbonatos)',
-    '28371100': 'Cianeto e oxicianeto de sódio',
-    '28371911': 'Outros cianetos e oxicianetos',
-    '28371912': 'Outros cianetos e oxicianetos',
-    '28371914': 'Outros cianetos e oxicianetos',
-    '28371915': 'Outros cianetos e oxicianetos',
-    '28371919': 'Outros cianetos e oxicianetos',
-    '28372011': 'Cianetos complexos',
-    '28372019': 'Cianetos complexos',
-    '28372021': 'Cianetos complexos',
-    '28372090': 'Cianetos complexos',
-    '28391100': 'Metassilicatos de sódio',
-    '28391900': 'Outros silicatos de sódio',
-    '28399010': 'Outros silicatos dos metais alcalinos comerciais',
-    '28399020': 'Outros silicatos dos metais alcalinos comerciais',
-    '28399050': 'Outros silicatos dos metais alcalinos comerciais',
-    '28399090': 'Outros silicatos dos metais alcalinos comerciais',
-    '28401100': 'Tetraborato dissódico (bórax refinado) anidro',
-    '28401900': 'Outros tetraboratos dissódicos (bórax refinado)',
-    '28402000': 'Outros boratos',
-    '28403000': 'Peroxoboratos (perboratos)',
-    '28413000': 'Dicromato de sódio',
-    '28415011': 'Outros cromatos e dicromatos; peroxocromatos',
-    '28415012': 'Outros cromatos e dicromatos; peroxocromatos',
-    '28415014': 'Outros cromatos e dicromatos; peroxocromatos',
-    '28415019': 'Outros cromatos e dicromatos; peroxocromatos',
-    '28416100': 'Permanganato de potássio',
-    '28416930': 'Manganitos, manganatos e outros permanganatos',
-    '28417010': 'Molibdatos',
-    '28417020': 'Molibdatos',
-    '28417090': 'Molibdatos',
-    '28418090': 'Tungstatos (volframatos)',
-    '28419012': 'Outros sais dos ácidos oxometálicos ou peroxometálicos',
-    '28419019': 'Outros sais dos ácidos oxometálicos ou peroxometálicos',
-    '28419021': 'Outros sais dos ácidos oxometálicos ou peroxometálicos',
-    '28419022': 'Outros sais dos ácidos oxometálicos ou peroxometálicos',
-    '28419029': 'Outros sais dos ácidos oxometálicos ou peroxometálicos',
-    '28419030': 'Outros sais dos ácidos oxometálicos ou peroxometálicos',
-    '28419081': 'Outros sais dos ácidos oxometálicos ou peroxometálicos',
-    '28419082': 'Outros sais dos ácidos oxometálicos ou peroxometálicos',
-    '28419089': 'Outros sais dos ácidos oxometálicos ou peroxometálicos',
-    '28419090': 'Outros sais dos ácidos oxometálicos ou peroxometálicos',
-    '28421010': 'Silicatos duplos ou complexos, incluídos os aluminossilicatos de constituição definida ou não',
-    '28421090': 'Silicatos duplos ou complexos, incluídos os aluminossilicatos de constituição definida ou não',
-    '28429000': 'Outros sais dos ácidos ou peroxoácidos inorgânicos, exceto azidas',
-    '28431000': 'Metais preciosos no estado coloidal',
-    '28432100': 'Nitrato de prata',
-    '28432990': 'Outros compostos de prata',
-    '28433010': 'Compostos de ouro',
-    '28433090': 'Compostos de ouro',
-    '28439020': 'Outros compostos inorgânicos ou orgânicos de metais preciosos; amálgamas de metais preciosos',
-    '28439090': 'Outros compostos inorgânicos ou orgânicos de metais preciosos; amálgamas de metais preciosos',
-    '28441000': 'Urânio natural e seus compostos; ligas, dispersões e misturas contendo urânio natural',
-    '28442000': 'Urânio enriquecido em U235 e seus compostos; plutônio e seus compostos; ligas, dispersões e misturas ou compostos destes produtos',
-    '28444020': 'Elementos, isótopos e compostos, radioativos; ligas, dispersões e misturas destes produtos; resíduos radiativos',
-    '28444090': 'Elementos, isótopos e compostos, radioativos; ligas, dispersões e misturas destes produtos; resíduos radiativos',
-    '28444320': 'Outros elementos radioativos e isótopos e compostos; outras ligas, dispersões (incluindo ceramais (cermets)), produtos cerâmicos e misturas que contenham esses elementos, isótopos ou compostos',
-    '28444390': 'Outros elementos radioativos e isótopos e compostos; outras ligas, dispersões (incluindo ceramais (cermets)), produtos cerâmicos e misturas que contenham esses elementos, isótopos ou compostos',
-    '28444400': 'Resíduos radioativos',
-    '28451000': 'Água pesada (óxido de deutério)',
-    '28459000': 'Isótopos (não radioativos) e seus compostos inorgânicos ou orgânicos',
-    '28461010': 'Compostos de cério',
-    '28461090': 'Compostos de cério',
-    '28469020': 'Outros compostos dos metais das terras raras, de ítrio ou de escândio ou da mistura desses metais',
-    '28469090': 'Outros compostos dos metais das terras raras, de ítrio ou de escândio ou da mistura desses metais',
-    '28470000': 'Peróxido de hidrogênio (água oxigenada), mesmo solidificado com uréia',
-    '28491000': 'Carboneto de cálcio, quimicamente definido ou não',
-    '28492000': 'Carboneto de silício, quimicamente definido ou não',
-    '28499010': 'Outros carbonetos de constituição química definida ou não',
-    '28499030': 'Outros carbonetos de constituição química definida ou não',
-    '28499090': 'Outros carbonetos de constituição química definida ou não',
-    '28500010': 'Hidretos, nitretos, azidas, silicietos e boretos, quimicamente definidos ou não',
-    '28500090': 'Hidretos, nitretos, azidas, silicietos e boretos, quimicamente definidos ou não',
-    '28521014': 'Compostos inorgânicos ou orgânicos de mercúrio, de constituição química definida',
-    '28521019': 'Compostos inorgânicos ou orgânicos de mercúrio, de constituição química definida',
-    '28539013': 'Fosfeto; cianamida; sulfocloretos de fósforo; outros compostos inorgânicos (incluindo as águas destiladas ou de condutibilidade e águas de igual grau de pureza)',
-    '28539019': 'Fosfeto; cianamida; sulfocloretos de fósforo; outros compostos inorgânicos (incluindo as águas destiladas ou de condutibilidade e águas de igual grau de pureza)',
-    '28539090': 'Fosfeto; cianamida; sulfocloretos de fósforo; outros compostos inorgânicos (incluindo as águas destiladas ou de condutibilidade e águas de igual grau de pureza)',
-    '29011000': 'Hidrocarbonetos acíclicos saturados',
-    '29012100': 'Etileno não saturado',
-    '29012200': 'Propeno (propileno) não saturado',
-    '29012300': 'Buteno (butileno) não saturado e seus isômeros',
-    '29012410': 'Buta-1, 3-dieno e isopreno não saturados',
-    '29012420': 'Buta-1, 3-dieno e isopreno não saturados',
-    '29012900': 'Outros hidrocarbonetos acíclicos não saturados',
-    '29021100': 'Cicloexano',
-    '29021910': 'Outros hidrocarbonetos ciclânicos, ciclênicos, cicloterpênicos',
-    '29021990': 'Outros hidrocarbonetos ciclânicos, ciclênicos, cicloterpênicos',
-    '29022000': 'Benzeno',
-    '29023000': 'Tolueno',
-    '29024100': 'o-Xileno',
-    '29024300': 'p-Xileno',
-    '29024400': 'Mistura de isômeros do xileno',
-    '29025000': 'Estireno',
-    '29027000': 'Cumeno',
-    '29029010': 'Outros hidrocarbonetos cíclicos',
-    '29029020': 'Outros hidrocarbonetos cíclicos',
-    '29029040': 'Outros hidrocarbonetos cíclicos',
-    '29029090': 'Outros hidrocarbonetos cíclicos',
-    '29031200': 'Diclorometano (cloreto de metileno)',
-    '29031300': 'Clorofórmio (triclorometano)',
-    '29031500': '1, 2-Dicloroetano (cloreto de etileno)',
-    '29031990': 'Outros derivados clorados saturados dos hidrocarbonetos acíclicos',
-    '29032200': 'Tricloroetileno',
-    '29032300': 'Tetracloroetileno (percloroetileno)',
-    '29032900': 'Outros derivados clorados não saturados dos hidrocarbonetos acíclicos',
-    '29032990': 'Outros derivados clorados não saturados dos hidrocarbonetos acíclicos',
-    '29033911': 'Outros derivados fluorados, bromados e iodados dos hidrocarbonetos acíclicos',
-    '29033919': 'Outros derivados fluorados, bromados e iodados dos hidrocarbonetos acíclicos',
-    '29033921': 'Outros derivados fluorados, bromados e iodados dos hidrocarbonetos acíclicos',
-    '29033929': 'Outros derivados fluorados, bromados e iodados dos hidrocarbonetos acíclicos',
-    '29033932': 'Outros derivados fluorados, bromados e iodados dos hidrocarbonetos acíclicos',
-    '29034100': 'Triclorofluormetano',
-    '29034200': 'Diclorodifluormetano',
-    '29034510': 'Outros derivados peralogenados dos hidrocarbonetos acíclicos com flúor e cloro',
-    '29034900': 'Outros derivados halogenados dos hidrocarbonetos acíclicos com dois halogenados diferentes',
-    '29035100': '1,2,3,4,5,6-Hexaclorocicloexano',
-    '29035910': 'Outros derivados halogenados dos hidrocarbonetos ciclânicos, ciclênicos e cicloterpênicos',
-    '29035990': 'Outros derivados halogenados dos hidrocarbonetos ciclânicos, ciclênicos e cicloterpênicos',
-    '29036920': 'Outros derivados halogenados dos hidrocarbonetos aromáticos',
-    '29036990': 'Outros derivados halogenados dos hidrocarbonetos aromáticos',
-    '29037100': 'Clorodifluorometanos',
-    '29037200': 'Diclorotrifluoroetanos',
-    '29037300': 'Diclorofluoroetanos',
-    '29037600': 'Bromoclorodifluorometano, Bromotrifluorometano, etc',
-    '29037712': 'Outros derivados halogenados dos hidrocarbonetos acíclicos, peralogenados unicamente com flúor e cloro',
-    '29037790': 'Outros derivados halogenados dos hidrocarbonetos acíclicos, peralogenados unicamente com flúor e cloro',
-    '29037800': 'Outros derivados peralogenados',
-    '29037919': 'Outros derivados halogenados dos hidrocarbonetos acíclicos que contenham pelo menos dois halogênios diferentes',
-    '29037990': 'Outros derivados halogenados dos hidrocarbonetos acíclicos que contenham pelo menos dois halogênios diferentes',
-    '29038300': 'Mirex (ISO)',
-    '29039130': 'Clorobenzeno, o-diclorobenzeno e p-diclorobenzeno',
-    '29039916': 'Outros halogenados derivados de hidrocarbonetos aromáticos',
-    '29039919': 'Outros halogenados derivados de hidrocarbonetos aromáticos',
-    '29039931': 'Outros halogenados derivados de hidrocarbonetos aromáticos',
-    '29039990': 'Outros halogenados derivados de hidrocarbonetos aromáticos',
-    '29041011': 'Derivados sulfonados dos hidrocarbonetos, seus sais e seus ésteres etílicos',
-    '29041013': 'Derivados sulfonados dos hidrocarbonetos, seus sais e seus ésteres etílicos',
-    '29041019': 'Derivados sulfonados dos hidrocarbonetos, seus sais e seus ésteres etílicos',
-    '29041020': 'Derivados sulfonados dos hidrocarbonetos, seus sais e seus ésteres etílicos',
-    '29041030': 'Derivados sulfonados dos hidrocarbonetos, seus sais e seus ésteres etílicos',
-    '29041051': 'Derivados sulfonados dos hidrocarbonetos, seus sais e seus ésteres etílicos',
-    '29041053': 'Derivados sulfonados dos hidrocarbonetos, seus sais e seus ésteres etílicos',
-    '29041059': 'Derivados sulfonados dos hidrocarbonetos, seus sais e seus ésteres etílicos',
-    '29041060': 'Derivados sulfonados dos hidrocarbonetos, seus sais e seus ésteres etílicos',
-    '29041090': 'Derivados sulfonados dos hidrocarbonetos, seus sais e seus ésteres etílicos',
-    '29042041': 'Derivados apenas nitrados ou apenas nitrosados',
-    '29042049': 'Derivados apenas nitrados ou apenas nitrosados',
-    '29042051': 'Derivados apenas nitrados ou apenas nitrosados',
-    '29042059': 'Derivados apenas nitrados ou apenas nitrosados',
-    '29042070': 'Derivados apenas nitrados ou apenas nitrosados',
-    '29042090': 'Derivados apenas nitrados ou apenas nitrosados',
-    '29049919': 'Outros derivados sulfonados, nitrados ou nitrosados dos hidrocarbonetos, mesmo halogenados',
-    '29049921': 'Outros derivados sulfonados, nitrados ou nitrosados dos hidrocarbonetos, mesmo halogenados',
-    '29049929': 'Outros derivados sulfonados, nitrados ou nitrosados dos hidrocarbonetos, mesmo halogenados',
-    '29049990': 'Outros derivados sulfonados, nitrados ou nitrosados dos hidrocarbonetos, mesmo halogenados',
-    '29051100': 'Metanol (álcool metílico)',
-    '29051210': 'Álcool propílico (propan-1-ol) e álcool isopropílico (propan-2-ol)',
-    '29051220': 'Álcool propílico (propan-1-ol) e álcool isopropílico (propan-2-ol)',
-    '29051300': 'Butan-1-ol (álcool n-butílico)',
-    '29051410': 'Outros butanóis',
-    '29051420': 'Outros butanóis',
-    '29051430': 'Outros butanóis',
-    '29051600': 'Octanol (álcool octílico) e seus isômeros',
-    '29051710': 'Álcool laurílico, álcool cetílico e álcool esteárico',
-    '29051720': 'Álcool laurílico, álcool cetílico e álcool esteárico',
-    '29051730': 'Álcool laurílico, álcool cetílico e álcool esteárico',
-    '29051911': 'Outros monoálcoois saturados',
-    '29051919': 'Outros monoálcoois saturados',
-    '29051922': 'Outros monoálcoois saturados',
-    '29051929': 'Outros monoálcoois saturados',
-    '29051991': 'Outros monoálcoois saturados',
-    '29051994': 'Outros monoálcoois saturados',
-    '29051996': 'Outros monoálcoois saturados',
-    '29051999': 'Outros monoálcoois saturados',
-    '29052210': 'Álcoois terpênicos acíclicos, não saturados',
-    '29052220': 'Álcoois terpênicos acíclicos, não saturados',
-    '29052230': 'Álcoois terpênicos acíclicos, não saturados',
-    '29052290': 'Álcoois terpênicos acíclicos, não saturados',
-    '29052910': 'Outros monoálcoois acíclicos não saturados',
-    '29052990': 'Outros monoálcoois acíclicos não saturados',
-    '29053100': 'Etilenoglicol (etanodiol)',
-    '29053200': 'Propilenoglicol (propano-1, 2-diol)',
-    '29053910': 'Outros álcoois dióis, não saturados',
-    '29053920': 'Outros álcoois dióis, não saturados',
-    '29053930': 'Outros álcoois dióis, não saturados',
-    '29053990': 'Outros álcoois dióis, não saturados',
-    '29054100': '2-Etil-2- (hidroximetil) propano-1, 3-diol (trimetiolpropano)',
-    '29054200': 'Pentaeritritol (pentaeritrita)',
-    '29054300': 'Manitol',
-    '29054400': 'd-Glucitol (sorbitol) (poliálcool)',
-    '29054500': 'Glicerol',
-    '29054900': 'Outros poliálcoois, não saturados',
-    '29055990': 'Outros derivados halogenados, sulfonados, nitrados ou nitrosados dos álcoois acíclicos',
-    '29061100': 'Mentol',
-    '29061300': 'Esteróis e inositóis',
-    '29061910': 'Outros álcoois ciclânicos, ciclênicos e cicloterpênicos e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29061920': 'Outros álcoois ciclânicos, ciclênicos e cicloterpênicos e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29061930': 'Outros álcoois ciclânicos, ciclênicos e cicloterpênicos e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29061940': 'Outros álcoois ciclânicos, ciclênicos e cicloterpênicos e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29061950': 'Outros álcoois ciclânicos, ciclênicos e cicloterpênicos e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29061990': 'Outros álcoois ciclânicos, ciclênicos e cicloterpênicos e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29062100': 'Álcool benzílico',
-    '29062910': 'Outros álcoois cíclicos aromáticos e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29062990': 'Outros álcoois cíclicos aromáticos e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29071100': 'Fenol (hidroxibenzeno) e seus sais',
-    '29071200': 'Cresóis e seus sais',
-    '29071300': 'Octilfenol, nonilfenol e seus isômeros; sais destes produtos',
-    '29071510': 'Naftóis e seus sais',
-    '29071590': 'Naftóis e seus sais',
-    '29071910': 'Outros monofenóis',
-    '29071920': 'Outros monofenóis',
-    '29071930': 'Outros monofenóis',
-    '29071940': 'Outros monofenóis',
-    '29071990': 'Outros monofenóis',
-    '29072100': 'Resorcinol e seus sais',
-    '29072200': 'Hidroquinona e seus sais',
-    '29072300': '4,4-Isopropilidenodifenol e seus sais',
-    '29072900': 'Outros polifenóis ou fenóis-álcoois',
-    '29081911': 'Outros derivados apenas halogenados e seus sais',
-    '29081913': 'Outros derivados apenas halogenados e seus sais',
-    '29081919': 'Outros derivados apenas halogenados e seus sais',
-    '29081921': 'Outros derivados apenas halogenados e seus sais',
-    '29081929': 'Outros derivados apenas halogenados e seus sais',
-    '29081990': 'Outros derivados apenas halogenados e seus sais',
-    '29089912': 'Outros derivados halogenados, sulfonados, nitrados ou nitrosados dos fenóis ou fenóis-álcoois',
-    '29089919': 'Outros derivados halogenados, sulfonados, nitrados ou nitrosados dos fenóis ou fenóis-álcoois',
-    '29089930': 'Outros derivados halogenados, sulfonados, nitrados ou nitrosados dos fenóis ou fenóis-álcoois',
-    '29091100': 'Éter dietílico (óxido de dietila)',
-    '29091910': 'Outros éteres acíclicos e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29091990': 'Outros éteres acíclicos e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29092000': 'Éteres ciclânicos, ciclênicos, cicloterpênicos e derivados halogenados, sufonados, nitrados ou nitrosados',
-    '29093011': 'Éteres aromáticos e seus derivados halogenados, sufonados, nitrados ou nitrosados',
-    '29093012': 'Éteres aromáticos e seus derivados halogenados, sufonados, nitrados ou nitrosados',
-    '29093014': 'Éteres aromáticos e seus derivados halogenados, sufonados, nitrados ou nitrosados',
-    '29093019': 'Éteres aromáticos e seus derivados halogenados, sufonados, nitrados ou nitrosados',
-    '29093029': 'Éteres aromáticos e seus derivados halogenados, sufonados, nitrados ou nitrosados',
-    '29094100': '2,2-Oxidietanol (dietilenoglicol)',
-    '29094310': 'Éteres monobutilicos do etilenoglicol ou do dietilenoglicol',
-    '29094320': 'Éteres monobutilicos do etilenoglicol ou do dietilenoglicol',
-    '29094411': 'Outros éteres monoalquílicos do etilenoglicol ou do dietilenoglicol',
-    '29094413': 'Outros éteres monoalquílicos do etilenoglicol ou do dietilenoglicol',
-    '29094419': 'Outros éteres monoalquílicos do etilenoglicol ou do dietilenoglicol',
-    '29094421': 'Outros éteres monoalquílicos do etilenoglicol ou do dietilenoglicol',
-    '29094429': 'Outros éteres monoalquílicos do etilenoglicol ou do dietilenoglicol',
-    '29094921': 'Outros éteres-álcoois e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29094924': 'Outros éteres-álcoois e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29094929': 'Outros éteres-álcoois e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29094931': 'Outros éteres-álcoois e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29094932': 'Outros éteres-álcoois e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29094939': 'Outros éteres-álcoois e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29094949': 'Outros éteres-álcoois e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29094990': 'Outros éteres-álcoois e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29095011': 'Éteres-fenóis, éteres-álcoois-fenóis e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29095012': 'Éteres-fenóis, éteres-álcoois-fenóis e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29095013': 'Éteres-fenóis, éteres-álcoois-fenóis e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29095019': 'Éteres-fenóis, éteres-álcoois-fenóis e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29095090': 'Éteres-fenóis, éteres-álcoois-fenóis e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29096011': 'Peróxidos de álcoois, peróxidos de éteres, peróxidos de cetonas e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29096012': 'Peróxidos de álcoois, peróxidos de éteres, peróxidos de cetonas e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29096013': 'Peróxidos de álcoois, peróxidos de éteres, peróxidos de cetonas e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29096019': 'Peróxidos de álcoois, peróxidos de éteres, peróxidos de cetonas e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29096020': 'Peróxidos de álcoois, peróxidos de éteres, peróxidos de cetonas e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29096090': 'Peróxidos de álcoois, peróxidos de éteres, peróxidos de cetonas e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29101000': 'Oxirano (óxido de etileno)',
-    '29102000': 'Metiloxirano (óxido de propileno)',
-    '29103000': '1-Cloro-2,3-epoxipropano (epicloridrina)',
-    '29109090': 'Outros epóxidos, epoxálcoois, epoxifenóis e epoxiéteres com 3 (três) átomos no ciclo e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29110010': 'Acetais, semi-acetais, mesmo contendo outras funções oxigenadas, e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29110090': 'Acetais, semi-acetais, mesmo contendo outras funções oxigenadas, e seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29121100': 'Metanal (formaldeído)',
-    '29121200': 'Etanal (acetaldeído)',
-    '29121911': 'Outros aldeídos acíclicos não contendo outras funções oxigenadas',
-    '29121912': 'Outros aldeídos acíclicos não contendo outras funções oxigenadas',
-    '29121919': 'Outros aldeídos acíclicos não contendo outras funções oxigenadas',
-    '29121921': 'Outros aldeídos acíclicos não contendo outras funções oxigenadas',
-    '29121922': 'Outros aldeídos acíclicos não contendo outras funções oxigenadas',
-    '29121929': 'Outros aldeídos acíclicos não contendo outras funções oxigenadas',
-    '29121991': 'Outros aldeídos acíclicos não contendo outras funções oxigenadas',
-    '29121999': 'Outros aldeídos acíclicos não contendo outras funções oxigenadas',
-    '29122100': 'Benzaldeído (aldeído benzóico)',
-    '29122910': 'Outros aldeídos cíclicos não contendo outras funções oxigenadas',
-    '29122920': 'Outros aldeídos cíclicos não contendo outras funções oxigenadas',
-    '29122990': 'Outros aldeídos cíclicos não contendo outras funções oxigenadas',
-    '29124100': 'Vanilina (aldeído metilprotocatéquico)',
-    '29124200': 'Etilvanilina (aldeído etilprotocatéquico)',
-    '29124941': 'Outros aldeídos-éteres, aldeídos-fenóis e aldeídos contendo funções oxigenadas',
-    '29124949': 'Outros aldeídos-éteres, aldeídos-fenóis e aldeídos contendo funções oxigenadas',
-    '29124990': 'Outros aldeídos-éteres, aldeídos-fenóis e aldeídos contendo funções oxigenadas',
-    '29125000': 'Polímeros cíclicos dos aldeídos',
-    '29126000': 'Paraformaldeído',
-    '29130090': 'Derivados halogenados, sulfonados, nitrados ou nitrosados dos produtos da posição 2912',
-    '29141100': 'Acetona não contendo outras funções oxigenadas',
-    '29141200': 'Butanona (metiletilcetona)',
-    '29141300': '4-Metilpentan-2-ona (metilisobutilcetona)',
-    '29141910': 'Outras cetonas acíclicas não contendo outras funções oxigenadas',
-    '29141921': 'Outras cetonas acíclicas não contendo outras funções oxigenadas',
-    '29141923': 'Outras cetonas acíclicas não contendo outras funções oxigenadas',
-    '29141929': 'Outras cetonas acíclicas não contendo outras funções oxigenadas',
-    '29141930': 'Outras cetonas acíclicas não contendo outras funções oxigenadas',
-    '29141990': 'Outras cetonas acíclicas não contendo outras funções oxigenadas',
-    '29142210': 'Cicloexanona e metilcicloexanonas',
-    '29142310': 'Iononas e metiliononas',
-    '29142320': 'Iononas e metiliononas',
-    '29142910': 'Outras cetonas ciclânicas, ciclênicas e cicloterpênicas não contendo outras funções oxigenadas',
-    '29142920': 'Outras cetonas ciclânicas, ciclênicas e cicloterpênicas não contendo outras funções oxigenadas',
-    '29142990': 'Outras cetonas ciclânicas, ciclênicas e cicloterpênicas não contendo outras funções oxigenadas',
-    '29143910': 'Outras cetonas aromáticas não contendo outras funções oxigenadas',
-    '29143990': 'Outras cetonas aromáticas não contendo outras funções oxigenadas',
-    '29144010': 'Cetonas-álcoois e cetonas-aldeídos',
-    '29144091': 'Cetonas-álcoois e cetonas-aldeídos',
-    '29144099': 'Cetonas-álcoois e cetonas-aldeídos',
-    '29145090': 'Cetonas-fenóis e cetonas contendo outras funções oxigenadas',
-    '29146100': 'Antraquinona',
-    '29146200': 'Coenzima Q10 (ubidecarenona (DCI))',
-    '29146990': 'Outras quinonas',
-    '29147919': 'Outros derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29147921': 'Outros derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29147922': 'Outros derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29147929': 'Outros derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29147990': 'Outros derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29151100': 'Ácido fórmico',
-    '29151210': 'Sais do ácido fórmico',
-    '29151290': 'Sais do ácido fórmico',
-    '29151310': 'Ésteres do ácido fórmico',
-    '29151390': 'Ésteres do ácido fórmico',
-    '29152100': 'Ácido acético',
-    '29152400': 'Anidrido acético',
-    '29152910': 'Outros sais do ácido acético',
-    '29152990': 'Outros sais do ácido acético',
-    '29153100': 'Acetato de etila',
-    '29153200': 'Acetato de vinila',
-    '29153300': 'Acetato de n-butila',
-    '29153910': 'Outros ésteres do ácido acético',
-    '29153921': 'Outros ésteres do ácido acético',
-    '29153929': 'Outros ésteres do ácido acético',
-    '29153931': 'Outros ésteres do ácido acético',
-    '29153932': 'Outros ésteres do ácido acético',
-    '29153939': 'Outros ésteres do ácido acético',
-    '29153941': 'Outros ésteres do ácido acético',
-    '29153942': 'Outros ésteres do ácido acético',
-    '29153951': 'Outros ésteres do ácido acético',
-    '29153961': 'Outros ésteres do ácido acético',
-    '29153962': 'Outros ésteres do ácido acético',
-    '29153991': 'Outros ésteres do ácido acético',
-    '29153992': 'Outros ésteres do ácido acético',
-    '29153993': 'Outros ésteres do ácido acético',
-    '29153999': 'Outros ésteres do ácido acético',
-    '29154020': 'Ácidos mono-, di- ou tricloroacéticos, seus sais e ésteres',
-    '29154090': 'Ácidos mono-, di- ou tricloroacéticos, seus sais e ésteres',
-    '29155010': 'Ácido propiónico, seus sais e ésteres',
-    '29155020': 'Ácido propiónico, seus sais e ésteres',
-    '29155030': 'Ácido propiónico, seus sais e ésteres',
-    '29156011': 'Ácidos butíricos, ácidos valéricos, seus sais e ésteres',
-    '29156012': 'Ácidos butíricos, ácidos valéricos, seus sais e ésteres',
-    '29156019': 'Ácidos butíricos, ácidos valéricos, seus sais e ésteres',
-    '29156029': 'Ácidos butíricos, ácidos valéricos, seus sais e ésteres',
-    '29157011': 'Ácidos palmítico, ácido esteárico, seus sais e ésteres',
-    '29157019': 'Ácidos palmítico, ácido esteárico, seus sais e ésteres',
-    '29157020': 'Ácidos palmítico, ácido esteárico, seus sais e ésteres',
-    '29157031': 'Ácidos palmítico, ácido esteárico, seus sais e ésteres',
-    '29157039': 'Ácidos palmítico, ácido esteárico, seus sais e ésteres',
-    '29157040': 'Ácidos palmítico, ácido esteárico, seus sais e ésteres',
-    '29159021': 'Outros ácidos monocarboxílicos acíclicos saturados, seus anidridos, peróxidos e perácidos e seus derivados',
-    '29159022': 'Outros ácidos monocarboxílicos acíclicos saturados, seus anidridos, peróxidos e perácidos e seus derivados',
-    '29159029': 'Outros ácidos monocarboxílicos acíclicos saturados, seus anidridos, peróxidos e perácidos e seus derivados',
-    '29159031': 'Outros ácidos monocarboxílicos acíclicos saturados, seus anidridos, peróxidos e perácidos e seus derivados',
-    '29159032': 'Outros ácidos monocarboxílicos acíclicos saturados, seus anidridos, peróxidos e perácidos e seus derivados',
-    '29159033': 'Outros ácidos monocarboxílicos acíclicos saturados, seus anidridos, peróxidos e perácidos e seus derivados',
-    '29159039': 'Outros ácidos monocarboxílicos acíclicos saturados, seus anidridos, peróxidos e perácidos e seus derivados',
-    '29159041': 'Outros ácidos monocarboxílicos acíclicos saturados, seus anidridos, peróxidos e perácidos e seus derivados',
-    '29159042': 'Outros ácidos monocarboxílicos acíclicos saturados, seus anidridos, peróxidos e perácidos e seus derivados',
-    '29159049': 'Outros ácidos monocarboxílicos acíclicos saturados, seus anidridos, peróxidos e perácidos e seus derivados',
-    '29159050': 'Outros ácidos monocarboxílicos acíclicos saturados, seus anidridos, peróxidos e perácidos e seus derivados',
-    '29159060': 'Outros ácidos monocarboxílicos acíclicos saturados, seus anidridos, peróxidos e perácidos e seus derivados',
-    '29159090': 'Outros ácidos monocarboxílicos acíclicos saturados, seus anidridos, peróxidos e perácidos e seus derivados',
-    '29161110': 'Ácido acrílico e seus sais',
-    '29161120': 'Ácido acrílico e seus sais',
-    '29161210': 'Ésteres do ácido acrílico',
-    '29161220': 'Ésteres do ácido acrílico',
-    '29161230': 'Ésteres do ácido acrílico',
-    '29161240': 'Ésteres do ácido acrílico',
-    '29161290': 'Ésteres do ácido acrílico',
-    '29161310': 'Ácido metacrílico e seus sais',
-    '29161320': 'Ácido metacrílico e seus sais',
-    '29161410': 'Ésteres do ácido metacrílico',
-    '29161420': 'Ésteres do ácido metacrílico',
-    '29161430': 'Ésteres do ácido metacrílico',
-    '29161490': 'Ésteres do ácido metacrílico',
-    '29161511': 'Ácidos oléico, linoléico e ácido linonênico, seus sais e ésteres',
-    '29161519': 'Ácidos oléico, linoléico e ácido linonênico, seus sais e ésteres',
-    '29161520': 'Ácidos oléico, linoléico e ácido linonênico, seus sais e ésteres',
-    '29161911': 'Outros ácidos monocarboxílicos acíclicos não saturados; seus anidridos, halogenetos, peróxidos e perácidos, e seus derivados',
-    '29161919': 'Outros ácidos monocarboxílicos acíclicos não saturados; seus anidridos, halogenetos, peróxidos e perácidos, e seus derivados',
-    '29161921': 'Outros ácidos monocarboxílicos acíclicos não saturados; seus anidridos, halogenetos, peróxidos e perácidos, e seus derivados',
-    '29161922': 'Outros ácidos monocarboxílicos acíclicos não saturados; seus anidridos, halogenetos, peróxidos e perácidos, e seus derivados',
-    '29161929': 'Outros ácidos monocarboxílicos acíclicos não saturados; seus anidridos, halogenetos, peróxidos e perácidos, e seus derivados',
-    '29161990': 'Outros ácidos monocarboxílicos acíclicos não saturados; seus anidridos, halogenetos, peróxidos e perácidos, e seus derivados',
-    '29162014': 'Ácidos monocarboxílicos ciclânicos, ciclênicos ou cicloterpêncicos, seus anidridos, peróxidos, perácidos e seus derivados',
-    '29162015': 'Ácidos monocarboxílicos ciclânicos, ciclênicos ou cicloterpêncicos, seus anidridos, peróxidos, perácidos e seus derivados',
-    '29162019': 'Ácidos monocarboxílicos ciclânicos, ciclênicos ou cicloterpêncicos, seus anidridos, peróxidos, perácidos e seus derivados',
-    '29162090': 'Ácidos monocarboxílicos ciclânicos, ciclênicos ou cicloterpêncicos, seus anidridos, peróxidos, perácidos e seus derivados',
-    '29163110': 'Ácido benzóico, seus sais e ésteres',
-    '29163121': 'Ácido benzóico, seus sais e ésteres',
-    '29163129': 'Ácido benzóico, seus sais e ésteres',
-    '29163131': 'Ácido benzóico, seus sais e ésteres',
-    '29163132': 'Ácido benzóico, seus sais e ésteres',
-    '29163139': 'Ácido benzóico, seus sais e ésteres',
-    '29163210': 'Peróxido de benzoíla e cloreto de benzoíla',
-    '29163220': 'Peróxido de benzoíla e cloreto de benzoíla',
-    '29163910': 'Outros ácidos monocarboxílicos aromáticos, seus anidridos, halogenetos, peróxidos, perácidos e derivados',
-    '29163920': 'Outros ácidos monocarboxílicos aromáticos, seus anidridos, halogenetos, peróxidos, perácidos e derivados',
-    '29163940': 'Outros ácidos monocarboxílicos aromáticos, seus anidridos, halogenetos, peróxidos, perácidos e derivados',
-    '29163990': 'Outros ácidos monocarboxílicos aromáticos, seus anidridos, halogenetos, peróxidos, perácidos e derivados',
-    '29171110': 'Ácido oxálico, seus sais e ésteres',
-    '29171120': 'Ácido oxálico, seus sais e ésteres',
-    '29171210': 'Ácido adípico, seus sais e ésteres',
-    '29171220': 'Ácido adípico, seus sais e ésteres',
-    '29171310': 'Ácido azeláico, ácido sebácico, seus sais e ésteres',
-    '29171321': 'Ácido azeláico, ácido sebácico, seus sais e ésteres',
-    '29171322': 'Ácido azeláico, ácido sebácico, seus sais e ésteres',
-    '29171323': 'Ácido azeláico, ácido sebácico, seus sais e ésteres',
-    '29171329': 'Ácido azeláico, ácido sebácico, seus sais e ésteres',
-    '29171400': 'Anidrido maléico',
-    '29171910': 'Outros ácidos policarboxílicos acíclicos, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29171922': 'Outros ácidos policarboxílicos acíclicos, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29171930': 'Outros ácidos policarboxílicos acíclicos, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29171990': 'Outros ácidos policarboxílicos acíclicos, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29172000': 'Ácidos policarboxílicos ciclânicos, ciclênicos ou cicloterpênicos, seus anidridos, halogenetos, peróxidos, perácidos e derivados',
-    '29173200': 'Ortoftalatos de dioctila',
-    '29173300': 'Ortoftalatos de dinonila ou de didecila',
-    '29173400': 'Outros ésteres do ácido ortoftálico',
-    '29173500': 'Anidrido ftálico',
-    '29173600': 'Ácido tereftálico e seus sais',
-    '29173919': 'Outros ácidos policarboxílicos aromáticos, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29173920': 'Outros ácidos policarboxílicos aromáticos, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29173931': 'Outros ácidos policarboxílicos aromáticos, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29173939': 'Outros ácidos policarboxílicos aromáticos, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29173940': 'Outros ácidos policarboxílicos aromáticos, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29173990': 'Outros ácidos policarboxílicos aromáticos, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29181100': 'Ácido láctico, seus sais e ésteres',
-    '29181200': 'Ácido tartárico',
-    '29181310': 'Sais e ésteres do ácido tartárico',
-    '29181320': 'Sais e ésteres do ácido tartárico',
-    '29181400': 'Ácido cítrico',
-    '29181500': 'Sais e ésteres do ácido cítrico',
-    '29181610': 'Ácido glucônico, seus sais e ésteres',
-    '29181690': 'Ácido glucônico, seus sais e ésteres',
-    '29181921': 'Outros ácidos carboxílicos de função álcool, mas sem outra função oxigenada, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29181922': 'Outros ácidos carboxílicos de função álcool, mas sem outra função oxigenada, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29181929': 'Outros ácidos carboxílicos de função álcool, mas sem outra função oxigenada, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29181930': 'Outros ácidos carboxílicos de função álcool, mas sem outra função oxigenada, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29181990': 'Outros ácidos carboxílicos de função álcool, mas sem outra função oxigenada, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29182110': 'Ácido salicílico e seus sais',
-    '29182120': 'Ácido salicílico e seus sais',
-    '29182211': 'Ácido o-acetilsalicílico, seus sais e ésteres',
-    '29182219': 'Ácido o-acetilsalicílico, seus sais e ésteres',
-    '29182300': 'Outros ésteres do ácido salicílico e seus sais',
-    '29182922': 'Outros ácidos carboxílicos de função fenol, mas sem outra função oxigenada, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29182923': 'Outros ácidos carboxílicos de função fenol, mas sem outra função oxigenada, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29182929': 'Outros ácidos carboxílicos de função fenol, mas sem outra função oxigenada, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29182930': 'Outros ácidos carboxílicos de função fenol, mas sem outra função oxigenada, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29182940': 'Outros ácidos carboxílicos de função fenol, mas sem outra função oxigenada, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29182950': 'Outros ácidos carboxílicos de função fenol, mas sem outra função oxigenada, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29182990': 'Outros ácidos carboxílicos de função fenol, mas sem outra função oxigenada, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29183010': 'Ácidos carboxílicos de função aldeído ou cetona, mas sem outra função oxigenada, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29183039': 'Ácidos carboxílicos de função aldeído ou cetona, mas sem outra função oxigenada, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29183090': 'Ácidos carboxílicos de função aldeído ou cetona, mas sem outra função oxigenada, seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29189911': 'Outros ácidos carboxílicos contendo funções oxigenadas suplementares e seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29189912': 'Outros ácidos carboxílicos contendo funções oxigenadas suplementares e seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29189919': 'Outros ácidos carboxílicos contendo funções oxigenadas suplementares e seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29189940': 'Outros ácidos carboxílicos contendo funções oxigenadas suplementares e seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29189991': 'Outros ácidos carboxílicos contendo funções oxigenadas suplementares e seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29189999': 'Outros ácidos carboxílicos contendo funções oxigenadas suplementares e seus anidridos, halogenetos, peróxidos, perácidos e seus derivados',
-    '29191000': 'Fosfato de tris (2,3-dibromopropila)',
-    '29199010': 'Outros ésteres fosfóricos e seus sais, incluídos os lactofosfatos; seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29199050': 'Outros ésteres fosfóricos e seus sais, incluídos os lactofosfatos; seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29199090': 'Outros ésteres fosfóricos e seus sais, incluídos os lactofosfatos; seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29201990': 'Ésteres tiofosfóricos (fosforotioatos) e seus sais',
-    '29202910': 'Outros ésteres de fosfitos e seus sais; seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29202950': 'Outros ésteres de fosfitos e seus sais; seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29202990': 'Outros ésteres de fosfitos e seus sais; seus derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29209033': 'Outros ésteres dos ácidos inorgânicos, seus sais e derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29209039': 'Outros ésteres dos ácidos inorgânicos, seus sais e derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29209041': 'Outros ésteres dos ácidos inorgânicos, seus sais e derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29209049': 'Outros ésteres dos ácidos inorgânicos, seus sais e derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29209051': 'Outros ésteres dos ácidos inorgânicos, seus sais e derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29209059': 'Outros ésteres dos ácidos inorgânicos, seus sais e derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29209090': 'Outros ésteres dos ácidos inorgânicos, seus sais e derivados halogenados, sulfonados, nitrados ou nitrosados',
-    '29211111': 'Mono-, di- ou trimetilamina e seus sais',
-    '29211121': 'Mono-, di- ou trimetilamina e seus sais',
-    '29211129': 'Mono-, di- ou trimetilamina e seus sais',
-    '29211131': 'Mono-, di- ou trimetilamina e seus sais',
-    '29211139': 'Mono-, di- ou trimetilamina e seus sais',
-    '29211912': 'Outras monoaminas acíclicas, seus derivados e seus sais',
-    '29211915': 'Outras monoaminas acíclicas, seus derivados e seus sais',
-    '29211919': 'Outras monoaminas acíclicas, seus derivados e seus sais',
-    '29211922': 'Outras monoaminas acíclicas, seus derivados e seus sais',
-    '29211929': 'Outras monoaminas acíclicas, seus derivados e seus sais',
-    '29211939': 'Outras monoaminas acíclicas, seus derivados e seus sais',
-    '29211949': 'Outras monoaminas acíclicas, seus derivados e seus sais',
-    '29211993': 'Outras monoaminas acíclicas, seus derivados e seus sais',
-    '29211999': 'Outras monoaminas acíclicas, seus derivados e seus sais',
-    '29212100': 'Etilenodiamina e seus sais',
-    '29212200': 'Hexametilenodiamina e seus sais',
-    '29212910': 'Outras poliaminas acíclicas, seus derivados e seus sais',
-    '29212920': 'Outras poliaminas acíclicas, seus derivados e seus sais',
-    '29212990': 'Outras poliaminas acíclicas, seus derivados e seus sais',
-    '29213011': 'Monoaminas e poliaminas ciclânicas, ciclênicas ou cicloterpênicas, seus derivados e sais',
-    '29213012': 'Monoaminas e poliaminas ciclânicas, ciclênicas ou cicloterpênicas, seus derivados e sais',
-    '29213019': 'Monoaminas e poliaminas ciclânicas, ciclênicas ou cicloterpênicas, seus derivados e sais',
-    '29213090': 'Monoaminas e poliaminas ciclânicas, ciclênicas ou cicloterpênicas, seus derivados e sais',
-    '29214100': 'Anilina e seus sais',
-    '29214211': 'Derivados da anilina e seus sais',
-    '29214219': 'Derivados da anilina e seus sais',
-    '29214229': 'Derivados da anilina e seus sais',
-    '29214231': 'Derivados da anilina e seus sais',
-    '29214290': 'Derivados da anilina e seus sais',
-    '29214311': 'Toluidinas e seus derivados e sais',
-    '29214319': 'Toluidinas e seus derivados e sais',
-    '29214322': 'Toluidinas e seus derivados e sais',
-    '29214329': 'Toluidinas e seus derivados e sais',
-    '29214410': 'Difenilamina, seus derivados e seus sais',
-    '29214421': 'Difenilamina, seus derivados e seus sais',
-    '29214429': 'Difenilamina, seus derivados e seus sais',
-    '29214500': '1-Naftilamina (alfa), 2-naftilamina (beta), seus derivados e sais',
-    '29214922': 'Outras monoaminas aromáticas, seus derivados e seus sais',
-    '29214990': 'Outras monoaminas aromáticas, seus derivados e seus sais',
-    '29215111': 'o-, m-, p-Fenilenodiamina, diamanotoluenos e seus derivados e sais',
-    '29215112': 'o-, m-, p-Fenilenodiamina, diamanotoluenos e seus derivados e sais',
-    '29215119': 'o-, m-, p-Fenilenodiamina, diamanotoluenos e seus derivados e sais',
-    '29215132': 'o-, m-, p-Fenilenodiamina, diamanotoluenos e seus derivados e sais',
-    '29215133': 'o-, m-, p-Fenilenodiamina, diamanotoluenos e seus derivados e sais',
-    '29215139': 'o-, m-, p-Fenilenodiamina, diamanotoluenos e seus derivados e sais',
-    '29215190': 'o-, m-, p-Fenilenodiamina, diamanotoluenos e seus derivados e sais',
-    '29215911': 'Outras poliaminas aromáticas, seus derivados e seus sais',
-    '29215990': 'Outras poliaminas aromáticas, seus derivados e seus sais',
-    '29221100': 'Monoetanolamina e seus sais',
-    '29221200': 'Dietanolamina e seus sais',
-    '29221400': 'Dextropropoxifeno e seus sais',
-    '29221500': 'Trietanolamina',
-    '29221700': 'Metildietanolamina e etildietanolamina',
-    '29221911': 'Outros aminoálcoois, seus éteres, ésteres e sais',
-    '29221919': 'Outros aminoálcoois, seus éteres, ésteres e sais',
-    '29221921': 'Outros aminoálcoois, seus éteres, ésteres e sais',
-    '29221929': 'Outros aminoálcoois, seus éteres, ésteres e sais',
-    '29221931': 'Outros aminoálcoois, seus éteres, ésteres e sais',
-    '29221939': 'Outros aminoálcoois, seus éteres, ésteres e sais',
-    '29221941': 'Outros aminoálcoois, seus éteres, ésteres e sais',
-    '29221951': 'Outros aminoálcoois, seus éteres, ésteres e sais',
-    '29221952': 'Outros aminoálcoois, seus éteres, ésteres e sais',
-    '29221989': 'Outros aminoálcoois, seus éteres, ésteres e sais',
-    '29221995': 'Outros aminoálcoois, seus éteres, ésteres e sais',
-    '29221996': 'Outros aminoálcoois, seus éteres, ésteres e sais',
-    '29221999': 'Outros aminoálcoois, seus éteres, ésteres e sais',
-    '29222100': 'Ácido aminonaftolsulfônicos e seus sais',
-    '29222911': 'Outros aminonaftóis, aminofenóis, seus éteres, ésteres e sais',
-    '29222920': 'Outros aminonaftóis, aminofenóis, seus éteres, ésteres e sais',
-    '29222990': 'Outros aminonaftóis, aminofenóis, seus éteres, ésteres e sais',
-    '29223120': 'Anfepramona, metadona e normetadona; sais destes produtos',
-    '29223921': 'Outros aminoaldeídos, aminocetonas e aminoquinonas, exceto os de funções oxigenadas diferentes; sais destes produtos',
-    '29223929': 'Outros aminoaldeídos, aminocetonas e aminoquinonas, exceto os de funções oxigenadas diferentes; sais destes produtos',
-    '29223990': 'Outros aminoaldeídos, aminocetonas e aminoquinonas, exceto os de funções oxigenadas diferentes; sais destes produtos',
-    '29224110': 'Lisina e seus ésteres e sais',
-    '29224190': 'Lisina e seus ésteres e sais',
-    '29224210': 'Ácido glutâmico e seus sais',
-    '29224220': 'Ácido glutâmico e seus sais',
-    '29224910': 'Outros aminoácidos, exceto que contenham mais de um tipo de função oxigenada, seus ésteres e sais',
-    '29224920': 'Outros aminoácidos, exceto que contenham mais de um tipo de função oxigenada, seus ésteres e sais',
-    '29224931': 'Outros aminoácidos, exceto que contenham mais de um tipo de função oxigenada, seus ésteres e sais',
-    '29224940': 'Outros aminoácidos, exceto que contenham mais de um tipo de função oxigenada, seus ésteres e sais',
-    '29224959': 'Outros aminoácidos, exceto que contenham mais de um tipo de função oxigenada, seus ésteres e sais',
-    '29224961': 'Outros aminoácidos, exceto que contenham mais de um tipo de função oxigenada, seus ésteres e sais',
-    '29224963': 'Outros aminoácidos, exceto que contenham mais de um tipo de função oxigenada, seus ésteres e sais',
-    '29224969': 'Outros aminoácidos, exceto que contenham mais de um tipo de função oxigenada, seus ésteres e sais',
-    '29224990': 'Outros aminoácidos, exceto que contenham mais de um tipo de função oxigenada, seus ésteres e sais',
-    '29225011': 'Aminoálcooisfenóis, aminoácidosfenóis e outros compostos aminados de funções oxigenadas',
-    '29225032': 'Aminoálcooisfenóis, aminoácidosfenóis e outros compostos aminados de funções oxigenadas',
-    '29225039': 'Aminoálcooisfenóis, aminoácidosfenóis e outros compostos aminados de funções oxigenadas',
-    '29225099': 'Aminoálcooisfenóis, aminoácidosfenóis e outros compostos aminados de funções oxigenadas',
-    '29231000': 'Colina e seus sais',
-    '29232000': 'Lecitinas e outros fosfoaminolipídios',
-    '29233000': 'Perfluoroctanossulfonato de tetraetilamônio',
-    '29239010': 'Outros sais e hidróxidos de amônio quaternários',
-    '29239030': 'Outros sais e hidróxidos de amônio quaternários',
-    '29239040': 'Outros sais e hidróxidos de amônio quaternários',
-    '29239050': 'Outros sais e hidróxidos de amônio quaternários',
-    '29239060': 'Outros sais e hidróxidos de amônio quaternários',
-    '29239090': 'Outros sais e hidróxidos de amônio quaternários',
-    '29241100': 'Meprobamato',
-    '29241911': 'Outras amidas acíclicas (incluídos os carbomatos) e seus derivados; sais destes produtos',
-    '29241919': 'Outras amidas acíclicas (incluídos os carbomatos) e seus derivados; sais destes produtos',
-    '29241922': 'Outras amidas acíclicas (incluídos os carbomatos) e seus derivados; sais destes produtos',
-    '29241929': 'Outras amidas acíclicas (incluídos os carbomatos) e seus derivados; sais destes produtos',
-    '29241931': 'Outras amidas acíclicas (incluídos os carbomatos) e seus derivados; sais destes produtos',
-    '29241932': 'Outras amidas acíclicas (incluídos os carbomatos) e seus derivados; sais destes produtos',
-    '29241939': 'Outras amidas acíclicas (incluídos os carbomatos) e seus derivados; sais destes produtos',
-    '29241992': 'Outras amidas acíclicas (incluídos os carbomatos) e seus derivados; sais destes produtos',
-    '29241993': 'Outras amidas acíclicas (incluídos os carbomatos) e seus derivados; sais destes produtos',
-    '29241994': 'Outras amidas acíclicas (incluídos os carbomatos) e seus derivados; sais destes produtos',
-    '29241999': 'Outras amidas acíclicas (incluídos os carbomatos) e seus derivados; sais destes produtos',
-    '29242119': 'Ureínas, seus derivados e sais',
-    '29242120': 'Ureínas, seus derivados e sais',
-    '29242190': 'Ureínas, seus derivados e sais',
-    '29242500': 'Alaclor (ISO)',
-    '29242913': 'Outras amidas cíclicas, seus derivados e sais',
-    '29242914': 'Outras amidas cíclicas, seus derivados e sais',
-    '29242919': 'Outras amidas cíclicas, seus derivados e sais',
-    '29242920': 'Outras amidas cíclicas, seus derivados e sais',
-    '29242931': 'Outras amidas cíclicas, seus derivados e sais',
-    '29242939': 'Outras amidas cíclicas, seus derivados e sais',
-    '29242943': 'Outras amidas cíclicas, seus derivados e sais',
-    '29242949': 'Outras amidas cíclicas, seus derivados e sais',
-    '29242951': 'Outras amidas cíclicas, seus derivados e sais',
-    '29242952': 'Outras amidas cíclicas, seus derivados e sais',
-    '29242962': 'Outras amidas cíclicas, seus derivados e sais',
-    '29242963': 'Outras amidas cíclicas, seus derivados e sais',
-    '29242969': 'Outras amidas cíclicas, seus derivados e sais',
-    '29242991': 'Outras amidas cíclicas, seus derivados e sais',
-    '29242992': 'Outras amidas cíclicas, seus derivados e sais',
-    '29242996': 'Outras amidas cíclicas, seus derivados e sais',
-    '29242999': 'Outras amidas cíclicas, seus derivados e sais',
-    '29251100': 'Sacarina e seus sais',
-    '29251910': 'Outros imidas, seus derivados e sais',
-    '29251990': 'Outros imidas, seus derivados e sais',
-    '29252911': 'Outros iminas, seus derivados e sais',
-    '29252919': 'Outros iminas, seus derivados e sais',
-    '29252922': 'Outros iminas, seus derivados e sais',
-    '29252923': 'Outros iminas, seus derivados e sais',
-    '29252929': 'Outros iminas, seus derivados e sais',
-    '29252930': 'Outros iminas, seus derivados e sais',
-    '29252990': 'Outros iminas, seus derivados e sais',
-    '29261000': 'Acrilonitrila',
-    '29262000': '1-Cianoguanidina (diciandiamida)',
-    '29263012': 'Fenproporex e seus sais; intermediário da metadona (4-ciano-2-dimetilamino-4,4-difenilbutano)',
-    '29269011': 'Outros compostos de função nitrila',
-    '29269019': 'Outros compostos de função nitrila',
-    '29269021': 'Outros compostos de função nitrila',
-    '29269022': 'Outros compostos de função nitrila',
-    '29269023': 'Outros compostos de função nitrila',
-    '29269024': 'Outros compostos de função nitrila',
-    '29269026': 'Outros compostos de função nitrila',
-    '29269029': 'Outros compostos de função nitrila',
-    '29269092': 'Outros compostos de função nitrila',
-    '29269095': 'Outros compostos de função nitrila',
-    '29269099': 'Outros compostos de função nitrila',
-    '29270010': 'Compostos diazóicos, azóicos e azóxicos',
-    '29270021': 'Compostos diazóicos, azóicos e azóxicos',
-    '29270029': 'Compostos diazóicos, azóicos e azóxicos',
-    '29270030': 'Compostos diazóicos, azóicos e azóxicos',
-    '29280011': 'Derivados orgânicos da hidrazina e hidroxilamina',
-    '29280019': 'Derivados orgânicos da hidrazina e hidroxilamina',
-    '29280090': 'Derivados orgânicos da hidrazina e hidroxilamina',
-    '29291010': 'Isocianatos',
-    '29291021': 'Isocianatos',
-    '29291029': 'Isocianatos',
-    '29291030': 'Isocianatos',
-    '29291090': 'Isocianatos',
-    '29299011': 'Outros compostos de funções nitrogenadas',
-    '29299090': 'Outros compostos de funções nitrogenadas',
-    '29302019': 'Tiocarbamatos e ditiocarbamatos',
-    '29302021': 'Tiocarbamatos e ditiocarbamatos',
-    '29302022': 'Tiocarbamatos e ditiocarbamatos',
-    '29302023': 'Tiocarbamatos e ditiocarbamatos',
-    '29302029': 'Tiocarbamatos e ditiocarbamatos',
-    '29303012': 'Mono-, di- ou tetrassulfetos de tiourama',
-    '29303021': 'Mono-, di- ou tetrassulfetos de tiourama',
-    '29303022': 'Mono-, di- ou tetrassulfetos de tiourama',
-    '29303029': 'Mono-, di- ou tetrassulfetos de tiourama',
-    '29303090': 'Mono-, di- ou tetrassulfetos de tiourama',
-    '29304010': 'Metionina',
-    '29304090': 'Metionina',
-    '29309011': 'Outros tiocompostos orgânicos',
-    '29309012': 'Outros tiocompostos orgânicos',
-    '29309019': 'Outros tiocompostos orgânicos',
-    '29309021': 'Outros tiocompostos orgânicos',
-    '29309022': 'Outros tiocompostos orgânicos',
-    '29309029': 'Outros tiocompostos orgânicos',
-    '29309031': 'Outros tiocompostos orgânicos',
-    '29309032': 'Outros tiocompostos orgânicos',
-    '29309034': 'Outros tiocompostos orgânicos',
-    '29309039': 'Outros tiocompostos orgânicos',
-    '29309059': 'Outros tiocompostos orgânicos',
-    '29309061': 'Outros tiocompostos orgânicos',
-    '29309072': 'Outros tiocompostos orgânicos',
-    '29309079': 'Outros tiocompostos orgânicos',
-    '29309091': 'Outros tiocompostos orgânicos',
-    '29309098': 'Outros tiocompostos orgânicos',
-    '29309099': 'Outros tiocompostos orgânicos',
-    '29311000': 'Chumbo tetrametila e chumbo tetraetileno',
-    '29312000': 'Compostos de tributilestanho',
-    '29313913': 'Outros compostos organo-inorgânicos',
-    '29313915': 'Outros compostos organo-inorgânicos',
-    '29313917': 'Outros compostos organo-inorgânicos',
-    '29313999': 'Outros compostos organo-inorgânicos',
-    '29314500': 'Sal de ácido metilfosfônico e (aminoiminometil)uréia (1 : 1)',
-    '29314800': '3,9-Dimetil-2,4,8,10-tetraoxa-3,9-difosfaspiro[5.5] undecano 3,9-dióxido',
-    '29314911': 'Outros derivados organofosforados não halogenados',
-    '29314913': 'Outros derivados organofosforados não halogenados',
-    '29314914': 'Outros derivados organofosforados não halogenados',
-    '29314915': 'Outros derivados organofosforados não halogenados',
-    '29314990': 'Outros derivados organofosforados não halogenados',
-    '29315999': 'Outros derivados halogenados organofosforados',
-    '29319029': 'Outros compostos organo-inorgânicos',
-    '29319044': 'Outros compostos organo-inorgânicos',
-    '29319046': 'Outros compostos organo-inorgânicos',
-    '29319049': 'Outros compostos organo-inorgânicos',
-    '29319069': 'Outros compostos organo-inorgânicos',
-    '29319090': 'Outros compostos organo-inorgânicos',
-    '29321100': 'Tetraidrofurano',
-    '29321200': '2-Furaldeído (furfural)',
-    '29321310': 'Álcool furfurílico e álcool tetraidrofurfurílico',
-    '29321400': 'Sucralose',
-    '29321910': 'Outros compostos heterocíclicos com 1 (hum) ciclo furano não condensado',
-    '29321920': 'Outros compostos heterocíclicos com 1 (hum) ciclo furano não condensado',
-    '29321990': 'Outros compostos heterocíclicos com 1 (hum) ciclo furano não condensado',
-    '29322000': 'Lactonas',
-    '29329200': '1-(1,3-Benzodioxol-5-il) propan-2-ona',
-    '29329911': 'Outros compostos heterocíclicos exclusivamente de heteroátomos de oxigênio',
-    '29329912': 'Outros compostos heterocíclicos exclusivamente de heteroátomos de oxigênio',
-    '29329991': 'Outros compostos heterocíclicos exclusivamente de heteroátomos de oxigênio',
-    '29329992': 'Outros compostos heterocíclicos exclusivamente de heteroátomos de oxigênio',
-    '29329999': 'Outros compostos heterocíclicos exclusivamente de heteroátomos de oxigênio',
-    '29331111': 'Fenazona (antipirina) e seus derivados',
-    '29331119': 'Fenazona (antipirina) e seus derivados',
-    '29331190': 'Fenazona (antipirina) e seus derivados',
-    '29331990': 'Outros compostos heterocíclicos com 1 (hum) ciclo pirazol não condensado',
-    '29332110': 'Hidantoína e seus derivados',
-    '29332121': 'Hidantoína e seus derivados',
-    '29332129': 'Hidantoína e seus derivados',
-    '29332190': 'Hidantoína e seus derivados',
-    '29332912': 'Outros compostos heterocíclicos com 1 (hum) ciclo imidazol não condensado',
-    '29332913': 'Outros compostos heterocíclicos com 1 (hum) ciclo imidazol não condensado',
-    '29332919': 'Outros compostos heterocíclicos com 1 (hum) ciclo imidazol não condensado',
-    '29332921': 'Outros compostos heterocíclicos com 1 (hum) ciclo imidazol não condensado',
-    '29332922': 'Outros compostos heterocíclicos com 1 (hum) ciclo imidazol não condensado',
-    '29332924': 'Outros compostos heterocíclicos com 1 (hum) ciclo imidazol não condensado',
-    '29332925': 'Outros compostos heterocíclicos com 1 (hum) ciclo imidazol não condensado',
-    '29332929': 'Outros compostos heterocíclicos com 1 (hum) ciclo imidazol não condensado',
-    '29332930': 'Outros compostos heterocíclicos com 1 (hum) ciclo imidazol não condensado',
-    '29332991': 'Outros compostos heterocíclicos com 1 (hum) ciclo imidazol não condensado',
-    '29332992': 'Outros compostos heterocíclicos com 1 (hum) ciclo imidazol não condensado',
-    '29332993': 'Outros compostos heterocíclicos com 1 (hum) ciclo imidazol não condensado',
-    '29332999': 'Outros compostos heterocíclicos com 1 (hum) ciclo imidazol não condensado',
-    '29333110': 'Piridina e seus sais',
-    '29333120': 'Piridina e seus sais',
-    '29333311': 'Alfentanil, anileridina, bezitramida, bromazepam, cetobermidona, difenoxilato, difenoxina, dipipanona, fenciclidina, fenoperidina, fentanil, metilfenidato, pentazocina, petidina, intermediário A da petidina, pipradrol, pritramida, propiram e trimeperidina',
-    '29333322': 'Alfentanil, anileridina, bezitramida, bromazepam, cetobermidona, difenoxilato, difenoxina, dipipanona, fenciclidina, fenoperidina, fentanil, metilfenidato, pentazocina, petidina, intermediário A da petidina, pipradrol, pritramida, propiram e trimeperidina',
-    '29333369': 'Alfentanil, anileridina, bezitramida, bromazepam, cetobermidona, difenoxilato, difenoxina, dipipanona, fenciclidina, fenoperidina, fentanil, metilfenidato, pentazocina, petidina, intermediário A da petidina, pipradrol, pritramida, propiram e trimeperidina',
-    '29333400': 'Outros fentanilhos e seus derivados de compostos heterocíclicos com hetero-átomo(s) de nitrogênio somente, contendo um anel de piridina não utilizado (hidrogenado ou não) na estrutura',
-    '29333915': 'Outros compostos heterocíclicos 1 (hum) ciclo piridina não condensado',
-    '29333919': 'Outros compostos heterocíclicos 1 (hum) ciclo piridina não condensado',
-    '29333921': 'Outros compostos heterocíclicos 1 (hum) ciclo piridina não condensado',
-    '29333922': 'Outros compostos heterocíclicos 1 (hum) ciclo piridina não condensado',
-    '29333924': 'Outros compostos heterocíclicos 1 (hum) ciclo piridina não condensado',
-    '29333929': 'Outros compostos heterocíclicos 1 (hum) ciclo piridina não condensado',
-    '29333932': 'Outros compostos heterocíclicos 1 (hum) ciclo piridina não condensado',
-    '29333935': 'Outros compostos heterocíclicos 1 (hum) ciclo piridina não condensado',
-    '29333939': 'Outros compostos heterocíclicos 1 (hum) ciclo piridina não condensado',
-    '29333943': 'Outros compostos heterocíclicos 1 (hum) ciclo piridina não condensado',
-    '29333946': 'Outros compostos heterocíclicos 1 (hum) ciclo piridina não condensado',
-    '29333948': 'Outros compostos heterocíclicos 1 (hum) ciclo piridina não condensado',
-    '29333949': 'Outros compostos heterocíclicos 1 (hum) ciclo piridina não condensado',
-    '29333981': 'Outros compostos heterocíclicos 1 (hum) ciclo piridina não condensado',
-    '29333982': 'Outros compostos heterocíclicos 1 (hum) ciclo piridina não condensado',
-    '29333983': 'Outros compostos heterocíclicos 1 (hum) ciclo piridina não condensado',
-    '29333989': 'Outros compostos heterocíclicos 1 (hum) ciclo piridina não condensado',
-    '29333992': 'Outros compostos heterocíclicos 1 (hum) ciclo piridina não condensado',
-    '29333999': 'Outros compostos heterocíclicos 1 (hum) ciclo piridina não condensado',
-    '29334919': 'Outros compostos heterocíclicos, contendo ciclos de quinoleína ou de isoquinoleína sem outras condensações',
-    '29334990': 'Outros compostos heterocíclicos, contendo ciclos de quinoleína ou de isoquinoleína sem outras condensações',
-    '29335200': 'Maloniluréia (ácido barbitúrico) e seus sais',
-    '29335322': 'Alobarbital, amobarbital, barbital, butalbital, butobarbital, ciclobarbital, fenobarbital, metilfenobarbital, pentobarbital, secbutabarbital, secobarbital, e venilbital; sais destes produtos',
-    '29335400': 'Outros derivados da manolinuréia (ácido barbitúrico); sais destes produtos',
-    '29335912': 'Outros compostos heterocíclicos com 1 (hum) ciclo pirimidina ou piperazina',
-    '29335915': 'Outros compostos heterocíclicos com 1 (hum) ciclo pirimidina ou piperazina',
-    '29335916': 'Outros compostos heterocíclicos com 1 (hum) ciclo pirimidina ou piperazina',
-    '29335919': 'Outros compostos heterocíclicos com 1 (hum) ciclo pirimidina ou piperazina',
-    '29335923': 'Outros compostos heterocíclicos com 1 (hum) ciclo pirimidina ou piperazina',
-    '29335929': 'Outros compostos heterocíclicos com 1 (hum) ciclo pirimidina ou piperazina',
-    '29335932': 'Outros compostos heterocíclicos com 1 (hum) ciclo pirimidina ou piperazina',
-    '29335934': 'Outros compostos heterocíclicos com 1 (hum) ciclo pirimidina ou piperazina',
-    '29335935': 'Outros compostos heterocíclicos com 1 (hum) ciclo pirimidina ou piperazina',
-    '29335939': 'Outros compostos heterocíclicos com 1 (hum) ciclo pirimidina ou piperazina',
-    '29335941': 'Outros compostos heterocíclicos com 1 (hum) ciclo pirimidina ou piperazina',
-    '29335942': 'Outros compostos heterocíclicos com 1 (hum) ciclo pirimidina ou piperazina',
-    '29335944': 'Outros compostos heterocíclicos com 1 (hum) ciclo pirimidina ou piperazina',
-    '29335949': 'Outros compostos heterocíclicos com 1 (hum) ciclo pirimidina ou piperazina',
-    '29335991': 'Outros compostos heterocíclicos com 1 (hum) ciclo pirimidina ou piperazina',
-    '29335999': 'Outros compostos heterocíclicos com 1 (hum) ciclo pirimidina ou piperazina',
-    '29336100': 'Melamina',
-    '29336911': 'Outros compostos heterocíclicos com 1 (hum) ciclo triazina não condensado',
-    '29336912': 'Outros compostos heterocíclicos com 1 (hum) ciclo triazina não condensado',
-    '29336914': 'Outros compostos heterocíclicos com 1 (hum) ciclo triazina não condensado',
-    '29336919': 'Outros compostos heterocíclicos com 1 (hum) ciclo triazina não condensado',
-    '29336921': 'Outros compostos heterocíclicos com 1 (hum) ciclo triazina não condensado',
-    '29336922': 'Outros compostos heterocíclicos com 1 (hum) ciclo triazina não condensado',
-    '29336929': 'Outros compostos heterocíclicos com 1 (hum) ciclo triazina não condensado',
-    '29336991': 'Outros compostos heterocíclicos com 1 (hum) ciclo triazina não condensado',
-    '29336992': 'Outros compostos heterocíclicos com 1 (hum) ciclo triazina não condensado',
-    '29336999': 'Outros compostos heterocíclicos com 1 (hum) ciclo triazina não condensado',
-    '29337100': '6-Hexanolactama (epsilon-caprolactama)',
-    '29337910': 'Outras lactamas',
-    '29337990': 'Outras lactamas',
-    '29339111': 'Alprazolam, camazepam, clonazepam, clorazepato, clorodiazepóoxido, delorazepam, diazepam, estazolam, fludiazepam, flunitrazepam, flurazepam, halazepam, loflazepato de etila, lorazepam, lormetazepam, mazindol, medazepam, midazolam, nimetazepam, nitrazepam,',
-    '29339113': 'Alprazolam, camazepam, clonazepam, clorazepato, clorodiazepóoxido, delorazepam, diazepam, estazolam, fludiazepam, flunitrazepam, flurazepam, halazepam, loflazepato de etila, lorazepam, lormetazepam, mazindol, medazepam, midazolam, nimetazepam, nitrazepam,',
-    '29339115': 'Alprazolam, camazepam, clonazepam, clorazepato, clorodiazepóoxido, delorazepam, diazepam, estazolam, fludiazepam, flunitrazepam, flurazepam, halazepam, loflazepato de etila, lorazepam, lormetazepam, mazindol, medazepam, midazolam, nimetazepam, nitrazepam,',
-    '29339122': 'Alprazolam, camazepam, clonazepam, clorazepato, clorodiazepóoxido, delorazepam, diazepam, estazolam, fludiazepam, flunitrazepam, flurazepam, halazepam, loflazepato de etila, lorazepam, lormetazepam, mazindol, medazepam, midazolam, nimetazepam, nitrazepam,',
-    '29339132': 'Alprazolam, camazepam, clonazepam, clorazepato, clorodiazepóoxido, delorazepam, diazepam, estazolam, fludiazepam, flunitrazepam, flurazepam, halazepam, loflazepato de etila, lorazepam, lormetazepam, mazindol, medazepam, midazolam, nimetazepam, nitrazepam,',
-    '29339142': 'Alprazolam, camazepam, clonazepam, clorazepato, clorodiazepóoxido, delorazepam, diazepam, estazolam, fludiazepam, flunitrazepam, flurazepam, halazepam, loflazepato de etila, lorazepam, lormetazepam, mazindol, medazepam, midazolam, nimetazepam, nitrazepam,',
-    '29339153': 'Alprazolam, camazepam, clonazepam, clorazepato, clorodiazepóoxido, delorazepam, diazepam, estazolam, fludiazepam, flunitrazepam, flurazepam, halazepam, loflazepato de etila, lorazepam, lormetazepam, mazindol, medazepam, midazolam, nimetazepam, nitrazepam,',
-    '29339159': 'Alprazolam, camazepam, clonazepam, clorazepato, clorodiazepóoxido, delorazepam, diazepam, estazolam, fludiazepam, flunitrazepam, flurazepam, halazepam, loflazepato de etila, lorazepam, lormetazepam, mazindol, medazepam, midazolam, nimetazepam, nitrazepam,',
-    '29339912': 'Outros compostos heterocíclicos exclusivamente de heteroátomo(s) de nitrogênio',
-    '29339919': 'Outros compostos heterocíclicos exclusivamente de heteroátomo(s) de nitrogênio',
-    '29339920': 'Outros compostos heterocíclicos exclusivamente de heteroátomo(s) de nitrogênio',
-    '29339931': 'Outros compostos heterocíclicos exclusivamente de heteroátomo(s) de nitrogênio',
-    '29339932': 'Outros compostos heterocíclicos exclusivamente de heteroátomo(s) de nitrogênio',
-    '29339933': 'Outros compostos heterocíclicos exclusivamente de heteroátomo(s) de nitrogênio',
-    '29339939': 'Outros compostos heterocíclicos exclusivamente de heteroátomo(s) de nitrogênio',
-    '29339946': 'Outros compostos heterocíclicos exclusivamente de heteroátomo(s) de nitrogênio',
-    '29339949': 'Outros compostos heterocíclicos exclusivamente de heteroátomo(s) de nitrogênio',
-    '29339953': 'Outros compostos heterocíclicos exclusivamente de heteroátomo(s) de nitrogênio',
-    '29339954': 'Outros compostos heterocíclicos exclusivamente de heteroátomo(s) de nitrogênio',
-    '29339956': 'Outros compostos heterocíclicos exclusivamente de heteroátomo(s) de nitrogênio',
-    '29339959': 'Outros compostos heterocíclicos exclusivamente de heteroátomo(s) de nitrogênio',
-    '29339969': 'Outros compostos heterocíclicos exclusivamente de heteroátomo(s) de nitrogênio',
-    '29339999': 'Outros compostos heterocíclicos exclusivamente de heteroátomo(s) de nitrogênio',
-    '29341030': 'Compostos heterocíclicos com 1 (hum) ciclo tiazol não condensado',
-    '29341090': 'Compostos heterocíclicos com 1 (hum) ciclo tiazol não condensado',
-    '29342010': 'Compostos heterocíclicos com ciclos de benzotiazol sem outras condensações',
-    '29342020': 'Compostos heterocíclicos com ciclos de benzotiazol sem outras condensações',
-    '29342031': 'Compostos heterocíclicos com ciclos de benzotiazol sem outras condensações',
-    '29342032': 'Compostos heterocíclicos com ciclos de benzotiazol sem outras condensações',
-    '29342033': 'Compostos heterocíclicos com ciclos de benzotiazol sem outras condensações',
-    '29342039': 'Compostos heterocíclicos com ciclos de benzotiazol sem outras condensações',
-    '29342040': 'Compostos heterocíclicos com ciclos de benzotiazol sem outras condensações',
-    '29342090': 'Compostos heterocíclicos com ciclos de benzotiazol sem outras condensações',
-    '29343030': 'Compostos heterocíclicos com ciclos fenotiazina sem outras condensações',
-    '29343090': 'Compostos heterocíclicos com ciclos fenotiazina sem outras condensações',
-    '29349129': 'Aminorex, brotizolan, clotiazepam, cloxazolam, dextromoramida, fendimetrazina, fenmetrazina, haloxazolam, ketazolam, mesocarb, oxazolam, permolina, sufentanila; sais destes produtos',
-    '29349170': 'Aminorex, brotizolan, clotiazepam, cloxazolam, dextromoramida, fendimetrazina, fenmetrazina, haloxazolam, ketazolam, mesocarb, oxazolam, permolina, sufentanila; sais destes produtos',
-    '29349911': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29349915': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29349919': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29349924': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29349926': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29349929': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29349931': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29349932': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29349934': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29349939': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29349949': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29349951': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29349953': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29349954': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29349959': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29349969': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29349991': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29349992': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29349993': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29349999': 'Outros ácidos nucleicos e seus sais e outros compostos heterocíclicos',
-    '29351000': 'N-Metilperfluoroctano sulfonamida',
-    '29353000': 'N-Etil-N-(2-hidroxietil)perfluoroctano sulfonamida',
-    '29359011': 'Outras sulfonamidas',
-    '29359012': 'Outras sulfonamidas',
-    '29359013': 'Outras sulfonamidas',
-    '29359019': 'Outras sulfonamidas',
-    '29359021': 'Outras sulfonamidas',
-    '29359023': 'Outras sulfonamidas',
-    '29359024': 'Outras sulfonamidas',
-    '29359025': 'Outras sulfonamidas',
-    '29359029': 'Outras sulfonamidas',
-    '29359091': 'Outras sulfonamidas',
-    '29359093': 'Outras sulfonamidas',
-    '29359094': 'Outras sulfonamidas',
-    '29359097': 'Outras sulfonamidas',
-    '29359099': 'Outras sulfonamidas',
-    '29362111': 'Vitamina A e seus derivados',
-    '29362112': 'Vitamina A e seus derivados',
-    '29362113': 'Vitamina A e seus derivados',
-    '29362119': 'Vitamina A e seus derivados',
-    '29362190': 'Vitamina A e seus derivados',
-    '29362210': 'Vitamina B1 e seus derivados',
-    '29362220': 'Vitamina B1 e seus derivados',
-    '29362290': 'Vitamina B1 e seus derivados',
-    '29362310': 'Vitamina B2 (ribofiavina)',
-    '29362320': 'Vitamina B2 (ribofiavina)',
-    '29362410': 'Ácido D- ou DL-pantoténico (vitamina B3 ou B5) e seus derivados',
-    '29362490': 'Ácido D- ou DL-pantoténico (vitamina B3 ou B5) e seus derivados',
-    '29362510': 'Vitamina B6 e seus derivados',
-    '29362520': 'Vitamina B6 e seus derivados',
-    '29362590': 'Vitamina B6 e seus derivados',
-    '29362610': 'Vitamina B12 e seus derivados',
-    '29362690': 'Vitamina B12 e seus derivados',
-    '29362710': 'Vitamina C e seus derivados',
-    '29362720': 'Vitamina C e seus derivados',
-    '29362790': 'Vitamina C e seus derivados',
-    '29362811': 'Vitamina E e seus derivados',
-    '29362812': 'Vitamina E e seus derivados',
-    '29362819': 'Vitamina E e seus derivados',
-    '29362890': 'Vitamina E e seus derivados',
-    '29362911': 'Outras vitaminas e seus derivados',
-    '29362919': 'Outras vitaminas e seus derivados',
-    '29362921': 'Outras vitaminas e seus derivados',
-    '29362929': 'Outras vitaminas e seus derivados',
-    '29362931': 'Outras vitaminas e seus derivados',
-    '29362940': 'Outras vitaminas e seus derivados',
-    '29362951': 'Outras vitaminas e seus derivados',
-    '29362952': 'Outras vitaminas e seus derivados',
-    '29362959': 'Outras vitaminas e seus derivados',
-    '29362990': 'Outras vitaminas e seus derivados',
-    '29369000': 'Concentrados naturais de vitaminas e misturas de vitaminas e provitaminas',
-    '29371200': 'Insulina e seus sais',
-    '29371930': 'Outros hormônios polipeptídeos, protéicos e glicoprotéicos, seus derivados e análogos estruturais',
-    '29371950': 'Outros hormônios polipeptídeos, protéicos e glicoprotéicos, seus derivados e análogos estruturais',
-    '29371990': 'Outros hormônios polipeptídeos, protéicos e glicoprotéicos, seus derivados e análogos estruturais',
-    '29372120': 'Cortisona, hidrocortisona, prednisona (deidrocortisona) e prednisolona (deidroidrocortisona)',
-    '29372130': 'Cortisona, hidrocortisona, prednisona (deidrocortisona) e prednisolona (deidroidrocortisona)',
-    '29372140': 'Cortisona, hidrocortisona, prednisona (deidrocortisona) e prednisolona (deidroidrocortisona)',
-    '29372210': 'Derivados halogenados dos hormônios corticossuprarenais',
-    '29372221': 'Derivados halogenados dos hormônios corticossuprarenais',
-    '29372229': 'Derivados halogenados dos hormônios corticossuprarenais',
-    '29372290': 'Derivados halogenados dos hormônios corticossuprarenais',
-    '29372310': 'Estrogênios e progestogênios',
-    '29372321': 'Estrogênios e progestogênios',
-    '29372329': 'Estrogênios e progestogênios',
-    '29372331': 'Estrogênios e progestogênios',
-    '29372349': 'Estrogênios e progestogênios',
-    '29372392': 'Estrogênios e progestogênios',
-    '29372399': 'Estrogênios e progestogênios',
-    '29372910': 'Outros hormônios esteróides, seus derivados e análogos estruturais',
-    '29372920': 'Outros hormônios esteróides, seus derivados e análogos estruturais',
-    '29372931': 'Outros hormônios esteróides, seus derivados e análogos estruturais',
-    '29372940': 'Outros hormônios esteróides, seus derivados e análogos estruturais',
-    '29372950': 'Outros hormônios esteróides, seus derivados e análogos estruturais',
-    '29372960': 'Outros hormônios esteróides, seus derivados e análogos estruturais',
-    '29372990': 'Outros hormônios esteróides, seus derivados e análogos estruturais',
-    '29375000': 'Prostaglandinas, tromboxanas e leucotrienos; seus derivados e análogos estruturais',
-    '29379030': 'Outros hormônios naturais ou reproduzidos por síntese, seus derivados e análogos estruturais',
-    '29379040': 'Outros hormônios naturais ou reproduzidos por síntese, seus derivados e análogos estruturais',
-    '29379090': 'Outros hormônios naturais ou reproduzidos por síntese, seus derivados e análogos estruturais',
-    '29381000': 'Rutosídeo (rutina) e seus derivados',
-    '29389020': 'Outros heterosídeos, seus sais, éteres, ésteres e derivados',
-    '29389090': 'Outros heterosídeos, seus sais, éteres, ésteres e derivados',
-    '29391162': 'Concentrados de palha de papoula, buprenorfina, codeína, diidrocodeína, etilmorfina, etorfina, folcodina, heroína, hidrocodona, hidromorfona, morfina, nicomorfina, oxicodona, oximorfona, tebacona e tebaína; sais destes produtos',
-    '29391169': 'Concentrados de palha de papoula, buprenorfina, codeína, diidrocodeína, etilmorfina, etorfina, folcodina, heroína, hidrocodona, hidromorfona, morfina, nicomorfina, oxicodona, oximorfona, tebacona e tebaína; sais destes produtos',
-    '29391900': 'Outros alcalóides do ópio, seus derivados e sais',
-    '29392000': 'Alcalóides da quina, seus derivados e sais',
-    '29393010': 'Cafeína e seus sais',
-    '29394100': 'Efedrina e seus sais',
-    '29394200': 'Pseudoefedrina e seus sais',
-    '29394900': 'Outros derivados da efedrina e seus sais',
-    '29395990': 'Teofilina e aminofilina (teofilina-etilenodiamina), seus derivados e sais',
-    '29396911': 'Outros alcalóides da cravagem do centeio, seus derivados e sais',
-    '29396990': 'Outros alcalóides da cravagem do centeio, seus derivados e sais',
-    '29397920': 'Outros alcaloides, naturais ou reproduzidos por síntese, seus sais, éteres, ésteres e outros derivados, de origem vegetal',
-    '29397931': 'Outros alcaloides, naturais ou reproduzidos por síntese, seus sais, éteres, ésteres e outros derivados, de origem vegetal',
-    '29397990': 'Outros alcaloides, naturais ou reproduzidos por síntese, seus sais, éteres, ésteres e outros derivados, de origem vegetal',
-    '29398000': 'Outros alcalóides, naturais ou reproduzidos por síntese, seus sais, éteres, ésteres e outros derivados',
-    '29400013': 'Açúcares quimicamente puros, exceto sacarose, lactose, maltose, glicose e frutose; seus éteres e ésteres e seus sais',
-    '29400019': 'Açúcares quimicamente puros, exceto sacarose, lactose, maltose, glicose e frutose; seus éteres e ésteres e seus sais',
-    '29400021': 'Açúcares quimicamente puros, exceto sacarose, lactose, maltose, glicose e frutose; seus éteres e ésteres e seus sais',
-    '29400093': 'Açúcares quimicamente puros, exceto sacarose, lactose, maltose, glicose e frutose; seus éteres e ésteres e seus sais',
-    '29400099': 'Açúcares quimicamente puros, exceto sacarose, lactose, maltose, glicose e frutose; seus éteres e ésteres e seus sais',
-    '29411010': 'Penicilinas e seus derivados com estrutura de ácido penicilânico; sais destes produtos',
-    '29411020': 'Penicilinas e seus derivados com estrutura de ácido penicilânico; sais destes produtos',
-    '29411031': 'Penicilinas e seus derivados com estrutura de ácido penicilânico; sais destes produtos',
-    '29411041': 'Penicilinas e seus derivados com estrutura de ácido penicilânico; sais destes produtos',
-    '29411042': 'Penicilinas e seus derivados com estrutura de ácido penicilânico; sais destes produtos',
-    '29411049': 'Penicilinas e seus derivados com estrutura de ácido penicilânico; sais destes produtos',
-    '29411090': 'Penicilinas e seus derivados com estrutura de ácido penicilânico; sais destes produtos',
-    '29412010': 'Estreptomicinas e derivados; sais destes produtos',
-    '29412090': 'Estreptomicinas e derivados; sais destes produtos',
-    '29413010': 'Tetraciclina e derivados; sais destes produtos',
-    '29413020': 'Tetraciclina e derivados; sais destes produtos',
-    '29413032': 'Tetraciclina e derivados; sais destes produtos',
-    '29413090': 'Tetraciclina e derivados; sais destes produtos',
-    '29414011': 'Cloranfenicol e derivados; sais destes produtos',
-    '29414019': 'Cloranfenicol e derivados; sais destes produtos',
-    '29414090': 'Cloranfenicol e derivados; sais destes produtos',
-    '29415010': 'Eritromicina e derivados; sais destes produtos',
-    '29415020': 'Eritromicina e derivados; sais destes produtos',
-    '29419012': 'Outros antibióticos',
-    '29419021': 'Outros antibióticos',
-    '29419022': 'Outros antibióticos',
-    '29419029': 'Outros antibióticos',
-    '29419031': 'Outros antibióticos',
-    '29419032': 'Outros antibióticos',
-    '29419033': 'Outros antibióticos',
-    '29419039': 'Outros antibióticos',
-    '29419041': 'Outros antibióticos',
-    '29419043': 'Outros antibióticos',
-    '29419049': 'Outros antibióticos',
-    '29419059': 'Outros antibióticos',
-    '29419061': 'Outros antibióticos',
-    '29419062': 'Outros antibióticos',
-    '29419071': 'Outros antibióticos',
-    '29419079': 'Outros antibióticos',
-    '29419081': 'Outros antibióticos',
-    '29419083': 'Outros antibióticos',
-    '29419089': 'Outros antibióticos',
-    '29419091': 'Outros antibióticos',
-    '29419099': 'Outros antibióticos',
-    '29420000': 'Outros compostos orgânicos',
-    '30012010': 'Extratos de glândulas ou de outros órgãos ou das suas secreções, para usos opoterápicos',
-    '30012090': 'Extratos de glândulas ou de outros órgãos ou das suas secreções, para usos opoterápicos',
-    '30019010': 'Outras substâncias humanas ou animais, para fins terapêuticos ou profiláticos',
-    '30019020': 'Outras substâncias humanas ou animais, para fins terapêuticos ou profiláticos',
-    '30019031': 'Outras substâncias humanas ou animais, para fins terapêuticos ou profiláticos',
-    '30019039': 'Outras substâncias humanas ou animais, para fins terapêuticos ou profiláticos',
-    '30019090': 'Outras substâncias humanas ou animais, para fins terapêuticos ou profiláticos',
-    '30021100': 'Estojos de diagnóstico da malária (paludismo)',
-    '30021211': 'Antissoros e outras frações do sangue',
-    '30021212': 'Antissoros e outras frações do sangue',
-    '30021215': 'Antissoros e outras frações do sangue',
-    '30021216': 'Antissoros e outras frações do sangue',
-    '30021219': 'Antissoros e outras frações do sangue',
-    '30021222': 'Antissoros e outras frações do sangue',
-    '30021229': 'Antissoros e outras frações do sangue',
-    '30021235': 'Antissoros e outras frações do sangue',
-    '30021236': 'Antissoros e outras frações do sangue',
-    '30021239': 'Antissoros e outras frações do sangue',
-    '30021300': 'Produtos imunológicos, não misturados, não apresentados em doses nem acondicionados para venda a retalho',
-    '30021400': 'Produtos imunológicos, misturados, não apresentados em doses nem acondicionados para venda a retalho',
-    '30021410': 'Produtos imunológicos, misturados, não apresentados em doses nem acondicionados para venda a retalho',
-    '30021490': 'Produtos imunológicos, misturados, não apresentados em doses nem acondicionados para venda a retalho',
-    '30021520': 'Produtos imunológicos, apresentados em doses ou acondicionados para venda a retalho',
-    '30021590': 'Produtos imunológicos, apresentados em doses ou acondicionados para venda a retalho',
-    '30021900': 'Outros antissoros, outras frações do sangue e produtos imunológicos, mesmo modificados ou obtidos por via biotecnológica',
-    '30022011': 'Vacinas para medicina humana',
-    '30022019': 'Vacinas para medicina humana',
-    '30022021': 'Vacinas para medicina humana',
-    '30022023': 'Vacinas para medicina humana',
-    '30022025': 'Vacinas para medicina humana',
-    '30022026': 'Vacinas para medicina humana',
-    '30022027': 'Vacinas para medicina humana',
-    '30022029': 'Vacinas para medicina humana',
-    '30023010': 'Vacinas para medicina veterinária',
-    '30023020': 'Vacinas para medicina veterinária',
-    '30023030': 'Vacinas para medicina veterinária',
-    '30023040': 'Vacinas para medicina veterinária',
-    '30023050': 'Vacinas para medicina veterinária',
-    '30023060': 'Vacinas para medicina veterinária',
-    '30023070': 'Vacinas para medicina veterinária',
-    '30023080': 'Vacinas para medicina veterinária',
-    '30023090': 'Vacinas para medicina veterinária',
-    '30024111': 'Vacinas para a medicina humana',
-    '30024119': 'Vacinas para a medicina humana',
-    '30024121': 'Vacinas para a medicina humana',
-    '30024123': 'Vacinas para a medicina humana',
-    '30024125': 'Vacinas para a medicina humana',
-    '30024127': 'Vacinas para a medicina humana',
-    '30024129': 'Vacinas para a medicina humana',
-    '30024210': 'Vacinas para medicina veterinária',
-    '30024220': 'Vacinas para medicina veterinária',
-    '30024230': 'Vacinas para medicina veterinária',
-    '30024240': 'Vacinas para medicina veterinária',
-    '30024250': 'Vacinas para medicina veterinária',
-    '30024260': 'Vacinas para medicina veterinária',
-    '30024270': 'Vacinas para medicina veterinária',
-    '30024280': 'Vacinas para medicina veterinária',
-    '30024290': 'Vacinas para medicina veterinária',
-    '30024910': 'Outras vacinas, toxinas, culturas de microorganismos (excluindo leveduras) e produtos similares, não classificados nos códigos anteriores',
-    '30024920': 'Outras vacinas, toxinas, culturas de microorganismos (excluindo leveduras) e produtos similares, não classificados nos códigos anteriores',
-    '30024991': 'Outras vacinas, toxinas, culturas de microorganismos (excluindo leveduras) e produtos similares, não classificados nos códigos anteriores',
-    '30024992': 'Outras vacinas, toxinas, culturas de microorganismos (excluindo leveduras) e produtos similares, não classificados nos códigos anteriores',
-    '30024999': 'Outras vacinas, toxinas, culturas de microorganismos (excluindo leveduras) e produtos similares, não classificados nos códigos anteriores',
-    '30025100': 'Produtos de terapia celular',
-    '30025900': 'Outras culturas celulares, modificadas ou não, não classificadas nos códigos anteriores',
-    '30029000': 'Outras toxinas, culturas de microorganismos e produtos semelhantes',
-    '30029010': 'Outras toxinas, culturas de microorganismos e produtos semelhantes',
-    '30029020': 'Outras toxinas, culturas de microorganismos e produtos semelhantes',
-    '30029030': 'Outras toxinas, culturas de microorganismos e produtos semelhantes',
-    '30029091': 'Outras toxinas, culturas de microorganismos e produtos semelhantes',
-    '30029092': 'Outras toxinas, culturas de microorganismos e produtos semelhantes',
-    '30029099': 'Outras toxinas, culturas de microorganismos e produtos semelhantes',
-    '30031011': 'Medicamentos contendo penicilinas ou seus derivados, com estrutura de ácido penicilânico, ou estreptomicinas ou seus derivados, mas não para venda a retalho',
-    '30031012': 'Medicamentos contendo penicilinas ou seus derivados, com estrutura de ácido penicilânico, ou estreptomicinas ou seus derivados, mas não para venda a retalho',
-    '30031013': 'Medicamentos contendo penicilinas ou seus derivados, com estrutura de ácido penicilânico, ou estreptomicinas ou seus derivados, mas não para venda a retalho',
-    '30031014': 'Medicamentos contendo penicilinas ou seus derivados, com estrutura de ácido penicilânico, ou estreptomicinas ou seus derivados, mas não para venda a retalho',
-    '30031019': 'Medicamentos contendo penicilinas ou seus derivados, com estrutura de ácido penicilânico, ou estreptomicinas ou seus derivados, mas não para venda a retalho',
-    '30031020': 'Medicamentos contendo penicilinas ou seus derivados, com estrutura de ácido penicilânico, ou estreptomicinas ou seus derivados, mas não para venda a retalho',
-    '30032019': 'Medicamento contendo outros antibióticos, mas não para venda a retalho',
-    '30032029': 'Medicamento contendo outros antibióticos, mas não para venda a retalho',
-    '30032031': 'Medicamento contendo outros antibióticos, mas não para venda a retalho',
-    '30032039': 'Medicamento contendo outros antibióticos, mas não para venda a retalho',
-    '30032041': 'Medicamento contendo outros antibióticos, mas não para venda a retalho',
-    '30032049': 'Medicamento contendo outros antibióticos, mas não para venda a retalho',
-    '30032051': 'Medicamento contendo outros antibióticos, mas não para venda a retalho',
-    '30032052': 'Medicamento contendo outros antibióticos, mas não para venda a retalho',
-    '30032059': 'Medicamento contendo outros antibióticos, mas não para venda a retalho',
-    '30032061': 'Medicamento contendo outros antibióticos, mas não para venda a retalho',
-    '30032069': 'Medicamento contendo outros antibióticos, mas não para venda a retalho',
-    '30032079': 'Medicamento contendo outros antibióticos, mas não para venda a retalho',
-    '30032092': 'Medicamento contendo outros antibióticos, mas não para venda a retalho',
-    '30032099': 'Medicamento contendo outros antibióticos, mas não para venda a retalho',
-    '30033919': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos e não para venda a retalho',
-    '30033922': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos e não para venda a retalho',
-    '30033923': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos e não para venda a retalho',
-    '30033929': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos e não para venda a retalho',
-    '30033937': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos e não para venda a retalho',
-    '30033939': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos e não para venda a retalho',
-    '30033999': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos e não para venda a retalho',
-    '30034990': 'Outros medicamentos (exceto os produtos das posições 30.02, 30.05 ou 30.06) que contenham alcaloides ou seus derivados, preparados para fins terapêuticos ou profiláticos, mas não apresentados em doses nem acondicionados para venda a retalho',
-    '30039012': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039013': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039014': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039017': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039019': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039029': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039031': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039032': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039033': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039034': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039036': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039039': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039045': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039047': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039049': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039051': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039052': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039053': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039055': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039057': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039059': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039061': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039067': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039069': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039071': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039072': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039073': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039074': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039076': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039077': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039078': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039079': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039083': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039085': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039086': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039087': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039089': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039091': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039094': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039095': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039096': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30039099': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, mas não para venda a retalho',
-    '30041011': 'Medicamentos contendo penicilinas ou seus derivados, com estrutura de ácido penicilânico, ou estreptomicinas ou seus derivados, em doses, para venda a retalho',
-    '30041012': 'Medicamentos contendo penicilinas ou seus derivados, com estrutura de ácido penicilânico, ou estreptomicinas ou seus derivados, em doses, para venda a retalho',
-    '30041013': 'Medicamentos contendo penicilinas ou seus derivados, com estrutura de ácido penicilânico, ou estreptomicinas ou seus derivados, em doses, para venda a retalho',
-    '30041014': 'Medicamentos contendo penicilinas ou seus derivados, com estrutura de ácido penicilânico, ou estreptomicinas ou seus derivados, em doses, para venda a retalho',
-    '30041015': 'Medicamentos contendo penicilinas ou seus derivados, com estrutura de ácido penicilânico, ou estreptomicinas ou seus derivados, em doses, para venda a retalho',
-    '30041019': 'Medicamentos contendo penicilinas ou seus derivados, com estrutura de ácido penicilânico, ou estreptomicinas ou seus derivados, em doses, para venda a retalho',
-    '30041020': 'Medicamentos contendo penicilinas ou seus derivados, com estrutura de ácido penicilânico, ou estreptomicinas ou seus derivados, em doses, para venda a retalho',
-    '30042011': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042019': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042021': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042029': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042031': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042032': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042039': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042041': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042049': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042051': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042052': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042059': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042061': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042062': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042063': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042069': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042071': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042073': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042079': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042092': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042093': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042094': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042095': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30042099': 'Medicamento contendo outros antibióticos, em doses, para venda a retalho',
-    '30043100': 'Medicamentos contendo insulina, mas não antibióticos, em doses, para venda a retalho',
-    '30043210': 'Medicamentos contendo hormônios corticosteróides, mas não antibióticos, seus derivados e análogos estruturais, em doses, para venda a retalho',
-    '30043220': 'Medicamentos contendo hormônios corticosteróides, mas não antibióticos, seus derivados e análogos estruturais, em doses, para venda a retalho',
-    '30043290': 'Medicamentos contendo hormônios corticosteróides, mas não antibióticos, seus derivados e análogos estruturais, em doses, para venda a retalho',
-    '30043911': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos, em doses, para venda a retalho',
-    '30043912': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos, em doses, para venda a retalho',
-    '30043915': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos, em doses, para venda a retalho',
-    '30043917': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos, em doses, para venda a retalho',
-    '30043919': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos, em doses, para venda a retalho',
-    '30043921': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos, em doses, para venda a retalho',
-    '30043922': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos, em doses, para venda a retalho',
-    '30043927': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos, em doses, para venda a retalho',
-    '30043928': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos, em doses, para venda a retalho',
-    '30043929': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos, em doses, para venda a retalho',
-    '30043933': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos, em doses, para venda a retalho',
-    '30043936': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos, em doses, para venda a retalho',
-    '30043937': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos, em doses, para venda a retalho',
-    '30043939': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos, em doses, para venda a retalho',
-    '30043981': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos, em doses, para venda a retalho',
-    '30043982': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos, em doses, para venda a retalho',
-    '30043991': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos, em doses, para venda a retalho',
-    '30043994': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos, em doses, para venda a retalho',
-    '30043999': 'Outros medicamentos contendo hormônios ou outros produtos da posição 2937, mas não antibióticos, em doses, para venda a retalho',
-    '30044100': 'Medicamentos que contenham efedrina ou seus sais, apresentados em doses (incluindo os destinados a serem administrados por via percutânea) ou acondicionados para venda a retalho',
-    '30044200': 'Medicamentos que contenham pseudoefedrina (DCI) ou seus sais, apresentados em doses (incluindo os destinados a serem administrados por via percutânea) ou acondicionados para venda a retalho',
-    '30044910': 'Outros medicamentos que contenham alcaloides ou seus derivados, apresentados em doses (incluindo os destinados a serem administrados por via percutânea) ou acondicionados para venda a retalho',
-    '30044920': 'Outros medicamentos que contenham alcaloides ou seus derivados, apresentados em doses (incluindo os destinados a serem administrados por via percutânea) ou acondicionados para venda a retalho',
-    '30044940': 'Outros medicamentos que contenham alcaloides ou seus derivados, apresentados em doses (incluindo os destinados a serem administrados por via percutânea) ou acondicionados para venda a retalho',
-    '30044950': 'Outros medicamentos que contenham alcaloides ou seus derivados, apresentados em doses (incluindo os destinados a serem administrados por via percutânea) ou acondicionados para venda a retalho',
-    '30044990': 'Outros medicamentos que contenham alcaloides ou seus derivados, apresentados em doses (incluindo os destinados a serem administrados por via percutânea) ou acondicionados para venda a retalho',
-    '30045010': 'Outros medicamentos contendo vitaminas ou provitaminas, em doses, para venda a retalho',
-    '30045020': 'Outros medicamentos contendo vitaminas ou provitaminas, em doses, para venda a retalho',
-    '30045030': 'Outros medicamentos contendo vitaminas ou provitaminas, em doses, para venda a retalho',
-    '30045040': 'Outros medicamentos contendo vitaminas ou provitaminas, em doses, para venda a retalho',
-    '30045050': 'Outros medicamentos contendo vitaminas ou provitaminas, em doses, para venda a retalho',
-    '30045060': 'Outros medicamentos contendo vitaminas ou provitaminas, em doses, para venda a retalho',
-    '30045090': 'Outros medicamentos contendo vitaminas ou provitaminas, em doses, para venda a retalho',
-    '30046000': 'Outros medicamentos, que contenham princípios ativos antimaláricos (antipalúdicos) descritos na Nota de subposições 2 do presente Capítulo',
-    '30049011': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049012': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049019': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049021': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049023': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049024': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049026': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049029': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049032': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049033': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049034': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049035': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049036': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049037': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049038': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049039': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049041': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049042': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049043': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049045': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049046': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049047': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049048': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049049': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049051': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049053': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049054': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049055': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049057': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049058': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049059': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049061': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049062': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049063': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049064': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049065': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049066': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049067': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049068': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049069': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049071': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049072': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049073': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049074': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049075': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049076': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049077': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049078': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049079': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049091': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049092': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049093': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049094': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049095': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049096': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049097': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30049099': 'Outros medicamentos contendo produtos misturados, para fins terapêuticos ou profiláticos, em doses, para venda a retalho',
-    '30051010': 'Pensos adesivos e outros artigos com uma camada adesiva, impregnados ou recobertos de substâncias farmacêuticas ou acondicionados para venda a retalho, para usos medicinais, cirúrgicos dentários ou veterinários,',
-    '30051020': 'Pensos adesivos e outros artigos com uma camada adesiva, impregnados ou recobertos de substâncias farmacêuticas ou acondicionados para venda a retalho, para usos medicinais, cirúrgicos dentários ou veterinários,',
-    '30051030': 'Pensos adesivos e outros artigos com uma camada adesiva, impregnados ou recobertos de substâncias farmacêuticas ou acondicionados para venda a retalho, para usos medicinais, cirúrgicos dentários ou veterinários,',
-    '30051050': 'Pensos adesivos e outros artigos com uma camada adesiva, impregnados ou recobertos de substâncias farmacêuticas ou acondicionados para venda a retalho, para usos medicinais, cirúrgicos dentários ou veterinários,',
-    '30051090': 'Pensos adesivos e outros artigos com uma camada adesiva, impregnados ou recobertos de substâncias farmacêuticas ou acondicionados para venda a retalho, para usos medicinais, cirúrgicos dentários ou veterinários,',
-    '30059012': 'Pastas, gazes, ataduras e artigos análogos, impregnados ou recobertos de substâncias farmacêuticas ou acondicionados para venda a retalho, para usos medicinais, cirúrgicos dentários ou veterinários',
-    '30059019': 'Pastas, gazes, ataduras e artigos análogos, impregnados ou recobertos de substâncias farmacêuticas ou acondicionados para venda a retalho, para usos medicinais, cirúrgicos dentários ou veterinários',
-    '30059020': 'Pastas, gazes, ataduras e artigos análogos, impregnados ou recobertos de substâncias farmacêuticas ou acondicionados para venda a retalho, para usos medicinais, cirúrgicos dentários ou veterinários',
-    '30059090': 'Pastas, gazes, ataduras e artigos análogos, impregnados ou recobertos de substâncias farmacêuticas ou acondicionados para venda a retalho, para usos medicinais, cirúrgicos dentários ou veterinários',
-    '30061010': 'Categutes esterilizados e materiais esterilizados semelhantes para suturas cirúrgicas; laminárias esterilizadas, hemostáticos absorvíveis esterilizados, barreiras antiaderentes esterilizadas, para cirugia ou odontologia.',
-    '30061020': 'Categutes esterilizados e materiais esterilizados semelhantes para suturas cirúrgicas; laminárias esterilizadas, hemostáticos absorvíveis esterilizados, barreiras antiaderentes esterilizadas, para cirugia ou odontologia.',
-    '30061090': 'Categutes esterilizados e materiais esterilizados semelhantes para suturas cirúrgicas; laminárias esterilizadas, hemostáticos absorvíveis esterilizados, barreiras antiaderentes esterilizadas, para cirugia ou odontologia.',
-    '30062000': 'Reagentes para a determinação dos grupos ou fatores sangüíneos',
-    '30063011': 'Preparações opacificantes para exames radiográficos; reagentes de diagnóstico para serem administrados a pacientes',
-    '30063012': 'Preparações opacificantes para exames radiográficos; reagentes de diagnóstico para serem administrados a pacientes',
-    '30063013': 'Preparações opacificantes para exames radiográficos; reagentes de diagnóstico para serem administrados a pacientes',
-    '30063017': 'Preparações opacificantes para exames radiográficos; reagentes de diagnóstico para serem administrados a pacientes',
-    '30063019': 'Preparações opacificantes para exames radiográficos; reagentes de diagnóstico para serem administrados a pacientes',
-    '30063021': 'Preparações opacificantes para exames radiográficos; reagentes de diagnóstico para serem administrados a pacientes',
-    '30063029': 'Preparações opacificantes para exames radiográficos; reagentes de diagnóstico para serem administrados a pacientes',
-    '30064011': 'Cimentos e outros produtos para obturação dentária e para reconstituição óssea',
-    '30064012': 'Cimentos e outros produtos para obturação dentária e para reconstituição óssea',
-    '30064020': 'Cimentos e outros produtos para obturação dentária e para reconstituição óssea',
-    '30065000': 'Estojos e caixas de primeiros-socorros, guarnecidos',
-    '30066000': 'Preparações químicas contraceptivas à base de hormônios, de outros produtos da posição 2937 ou de espermicidas',
-    '30067000': 'Preparações na forma de gel para uso como lubrificante em medicina ou veterinária',
-    '30069110': 'Equipamentos identificáveis para uso em ostomia',
-    '30069190': 'Equipamentos identificáveis para uso em ostomia',
-    '30069200': 'Desperdícios farmacêuticos',
-    '30069300': 'Placebos e kits de ensaio clínico cegos (ou duplo-cegos) para um ensaio clínico reconhecido, colocados em doses medidas',
-    '31010000': 'Adubos ou fertilizantes de origem animal ou vegetal, mesmo misturados entre si ou tratados quimicamente',
-    '31021010': 'Ureia, mesmo em solução aquosa',
-    '31021090': 'Ureia, mesmo em solução aquosa',
-    '31022100': 'Sulfato de amônio',
-    '31022990': 'Outros sais duplos e misturas de sulfato e nitrato de amônio',
-    '31023000': 'Nitrato de amônio, mesmo em solução aquosa',
-    '31024000': 'Misturas de nitrato de amônio com carbonato de cálcio ou com matérias inorgânicas desprovidas de poder fertilizante',
-    '31025011': 'Nitrato de sódio',
-    '31025019': 'Nitrato de sódio',
-    '31025090': 'Nitrato de sódio',
-    '31026000': 'Sais duplos e misturas de nitratos de cálcio e amônio',
-    '31028000': 'Misturas de ureia com nitrato de amônio, em solução aquosa ou amoniacal',
-    '31029000': 'Outros adubos ou fertilizantes minerais ou químicos nitrogenados, incluídas as misturas',
-    '31031100': 'Superfosfatos, que contenham, em peso, 35 % ou mais de pentóxido de difósforo (P2O5)',
-    '31031900': 'Outros superfosfatos',
-    '31039011': 'Outros adubos ou fertilizantes minerais ou químicos fosfatados',
-    '31039019': 'Outros adubos ou fertilizantes minerais ou químicos fosfatados',
-    '31039090': 'Outros adubos ou fertilizantes minerais ou químicos fosfatados',
-    '31042010': 'Cloreto de potássio para uso como fertilizante',
-    '31042090': 'Cloreto de potássio para uso como fertilizante',
-    '31043010': 'Sulfato de potássio',
-    '31043090': 'Sulfato de potássio',
-    '31049090': 'Outros adubos ou fertilizantes minerais ou químicos potássicos',
-    '31051000': 'Adubos ou fertilizantes em tabletes ou em embalagens com peso <= 10 kg',
-    '31052000': 'Adubos ou fertilizantes contendo nitrogênio, fósforo e potássio',
-    '31053000': 'Hidrogeno-ortofosfato de diamônio',
-    '31054000': 'Diidrogeno-ortofosfato de amônio, inclusive misturas com hidrogeno-ortofosfato de diamônio',
-    '31055100': 'Adubos ou fertilizantes contendo nitrato e fosfato',
-    '31055900': 'Outros adubos ou fertilizantes minerais ou químicos contendo nitrogênio e fósforo',
-    '31056000': 'Adubos ou fertilizantes contendo fósforo e potássio',
-    '31059011': 'Outros adubos ou fertilizantes minerais ou químicos',
-    '31059019': 'Outros adubos ou fertilizantes minerais ou químicos',
-    '31059090': 'Outros adubos ou fertilizantes minerais ou químicos',
-    '32011000': 'Extrato tanante de quebracho',
-    '32012000': 'Extrato tanante de mimosa',
-    '32019012': 'Outros extratos tanantes de origem vegetal; taninos, sais, éteres, ésteres e outros derivados dos taninos',
-    '32019019': 'Outros extratos tanantes de origem vegetal; taninos, sais, éteres, ésteres e outros derivados dos taninos',
-    '32019020': 'Outros extratos tanantes de origem vegetal; taninos, sais, éteres, ésteres e outros derivados dos taninos',
-    '32019090': 'Outros extratos tanantes de origem vegetal; taninos, sais, éteres, ésteres e outros derivados dos taninos',
-    '32021000': 'Produtos tanantes orgânicos sintéticos',
-    '32029011': 'Produtos tanantes inorgânicos; preparações tanantes; preparações enzimáticas para a pré-curtimenta',
-    '32029019': 'Produtos tanantes inorgânicos; preparações tanantes; preparações enzimáticas para a pré-curtimenta',
-    '32029021': 'Produtos tanantes inorgânicos; preparações tanantes; preparações enzimáticas para a pré-curtimenta',
-    '32029029': 'Produtos tanantes inorgânicos; preparações tanantes; preparações enzimáticas para a pré-curtimenta',
-    '32029030': 'Produtos tanantes inorgânicos; preparações tanantes; preparações enzimáticas para a pré-curtimenta',
-    '32030011': 'Matérias corantes de origem vegetal ou animal e preparações à base dessas matérias',
-    '32030019': 'Matérias corantes de origem vegetal ou animal e preparações à base dessas matérias',
-    '32030021': 'Matérias corantes de origem vegetal ou animal e preparações à base dessas matérias',
-    '32030029': 'Matérias corantes de origem vegetal ou animal e preparações à base dessas matérias',
-    '32030030': 'Matérias corantes de origem vegetal ou animal e preparações à base dessas matérias',
-    '32041100': 'Corantes orgânico-sintéticos dispersos e suas preparações',
-    '32041210': 'Corantes ácidos, mesmo metalizados e suas preparações',
-    '32041220': 'Corantes ácidos, mesmo metalizados e suas preparações',
-    '32041300': 'Corantes básicos e suas preparações',
-    '32041400': 'Corantes diretos e suas preparações',
-    '32041510': 'Corantes à cuba e suas preparações',
-    '32041590': 'Corantes à cuba e suas preparações',
-    '32041600': 'Corantes reagentes e suas preparações',
-    '32041700': 'Pigmentos e suas preparações',
-    '32041810': 'Assuntos de coloração de carotenóides e preparativos baseados neles',
-    '32041820': 'Assuntos de coloração de carotenóides e preparativos baseados neles',
-    '32041830': 'Assuntos de coloração de carotenóides e preparativos baseados neles',
-    '32041890': 'Assuntos de coloração de carotenóides e preparativos baseados neles',
-    '32041911': 'Outras matérias corantes orgânicas sintéticas e suas preparações',
-    '32041912': 'Outras matérias corantes orgânicas sintéticas e suas preparações',
-    '32041913': 'Outras matérias corantes orgânicas sintéticas e suas preparações',
-    '32041919': 'Outras matérias corantes orgânicas sintéticas e suas preparações',
-    '32041920': 'Outras matérias corantes orgânicas sintéticas e suas preparações',
-    '32041930': 'Outras matérias corantes orgânicas sintéticas e suas preparações',
-    '32041990': 'Outras matérias corantes orgânicas sintéticas e suas preparações',
-    '32042011': 'Produtos orgânicos sintéticos utilizados como agentes de avivamento fluorescentes',
-    '32042019': 'Produtos orgânicos sintéticos utilizados como agentes de avivamento fluorescentes',
-    '32042090': 'Produtos orgânicos sintéticos utilizados como agentes de avivamento fluorescentes',
-    '32049000': 'Outros produtos corantes orgânicos sintéticos',
-    '32050000': 'Lacas corantes e suas preparações',
-    '32061110': 'Pigmentos contendo, em peso, calculado sobre matéria seca, => 80% de dióxido de titânio',
-    '32061120': 'Pigmentos contendo, em peso, calculado sobre matéria seca, => 80% de dióxido de titânio',
-    '32061130': 'Pigmentos contendo, em peso, calculado sobre matéria seca, => 80% de dióxido de titânio',
-    '32061910': 'Outros pigmentos e preparações à base de dióxido de titânio',
-    '32061990': 'Outros pigmentos e preparações à base de dióxido de titânio',
-    '32062000': 'Pigmentos e preparações à base de compostos de cromo',
-    '32064100': 'Ultramar e suas preparações',
-    '32064210': 'Litopônio e outros pigmentos e preparações à base de sulfeto de zinco',
-    '32064290': 'Litopônio e outros pigmentos e preparações à base de sulfeto de zinco',
-    '32064910': 'Outras matérias corantes e preparações',
-    '32064920': 'Outras matérias corantes e preparações',
-    '32064990': 'Outras matérias corantes e preparações',
-    '32065029': 'Produtos inorgânicos utilizados como luminóforos',
-    '32071010': 'Pigmentos opacificantes e cores preparados e preparações semelhantes',
-    '32071020': 'Pigmentos opacificantes e cores preparados e preparações semelhantes',
-    '32071090': 'Pigmentos opacificantes e cores preparados e preparações semelhantes',
-    '32072010': 'Composições vitrificáveis, engobos e preparações semelhantes',
-    '32072091': 'Composições vitrificáveis, engobos e preparações semelhantes',
-    '32072099': 'Composições vitrificáveis, engobos e preparações semelhantes',
-    '32073000': 'Polimentos líquidos e preparações semelhantes',
-    '32074010': 'Fritas e outros vidros, em pó, em grânulos, em lamelas ou flocos',
-    '32074090': 'Fritas e outros vidros, em pó, em grânulos, em lamelas ou flocos',
-    '32081010': 'Tintas, vernizes e soluções à base de poliésteres, dispersos ou dissolvidos em meio não aquoso',
-    '32081020': 'Tintas, vernizes e soluções à base de poliésteres, dispersos ou dissolvidos em meio não aquoso',
-    '32081030': 'Tintas, vernizes e soluções à base de poliésteres, dispersos ou dissolvidos em meio não aquoso',
-    '32082011': 'Tintas, vernizes e soluções à base de polímeros acrílicos ou vinílicos, dispersos ou dissolvidos em meio não aquoso',
-    '32082019': 'Tintas, vernizes e soluções à base de polímeros acrílicos ou vinílicos, dispersos ou dissolvidos em meio não aquoso',
-    '32082020': 'Tintas, vernizes e soluções à base de polímeros acrílicos ou vinílicos, dispersos ou dissolvidos em meio não aquoso',
-    '32082030': 'Tintas, vernizes e soluções à base de polímeros acrílicos ou vinílicos, dispersos ou dissolvidos em meio não aquoso',
-    '32089010': 'Tintas, vernizes e soluções de outros polímeros sintéticos, dispersos ou dissolvidos em meio não aquoso',
-    '32089021': 'Tintas, vernizes e soluções de outros polímeros sintéticos, dispersos ou dissolvidos em meio não aquoso',
-    '32089029': 'Tintas, vernizes e soluções de outros polímeros sintéticos, dispersos ou dissolvidos em meio não aquoso',
-    '32089031': 'Tintas, vernizes e soluções de outros polímeros sintéticos, dispersos ou dissolvidos em meio não aquoso',
-    '32089039': 'Tintas, vernizes e soluções de outros polímeros sintéticos, dispersos ou dissolvidos em meio não aquoso',
-    '32091010': 'Tintas e vernizes à base de polímeros acrílicos ou vinílicos dispersos ou dissolvidos em meio aquoso',
-    '32091020': 'Tintas e vernizes à base de polímeros acrílicos ou vinílicos dispersos ou dissolvidos em meio aquoso',
-    '32099011': 'Tintas e vernizes de outros polímeros sintéticos, dispersos ou dissolvidos em meio aquoso',
-    '32099019': 'Tintas e vernizes de outros polímeros sintéticos, dispersos ou dissolvidos em meio aquoso',
-    '32099020': 'Tintas e vernizes de outros polímeros sintéticos, dispersos ou dissolvidos em meio aquoso',
-    '32100010': 'Outras tintas e vernizes; pigmentos a água preparados, utilizados para acabamento de couros',
-    '32100020': 'Outras tintas e vernizes; pigmentos a água preparados, utilizados para acabamento de couros',
-    '32100030': 'Outras tintas e vernizes; pigmentos a água preparados, utilizados para acabamento de couros',
-    '32110000': 'Secantes preparados',
-    '32121000': 'Folhas para marcar a ferro',
-    '32129010': 'Outros pigmentos dispersos em meios não aquosos, no estado líquido ou pastoso',
-    '32129090': 'Outros pigmentos dispersos em meios não aquosos, no estado líquido ou pastoso',
-    '32131000': 'Cores em sortidos para pintura artística, atividades educativas e similares',
-    '32139000': 'Outras cores para pintura artística e atividades educativas',
-    '32141010': 'Mástique de vidraceiro, cimentos de resinas, outros mástiques; indutos utilizados em pintura',
-    '32141020': 'Mástique de vidraceiro, cimentos de resinas, outros mástiques; indutos utilizados em pintura',
-    '32149000': 'Indutos não refratários do tipo utilizado em alvenaria',
-    '32151100': 'Tintas de impressão pretas',
-    '32151900': 'Outras tintas de impressão',
-    '32159000': 'Tintas de escrever ou de desenhar e outras tintas',
-    '33011210': 'Óleo essencial de laranja',
-    '33011290': 'Óleo essencial de laranja',
-    '33011300': 'Óleo essencial de limão',
-    '33011910': 'Óleo essencial de outros cítricos',
-    '33011990': 'Óleo essencial de outros cítricos',
-    '33012400': 'Óleo essencial de hortelã-pimenta (mentha piperita)',
-    '33012510': 'Óleo essencial de outras mentas',
-    '33012520': 'Óleo essencial de outras mentas',
-    '33012590': 'Óleo essencial de outras mentas',
-    '33012911': 'Outros óleos essenciais',
-    '33012912': 'Outros óleos essenciais',
-    '33012913': 'Outros óleos essenciais',
-    '33012914': 'Outros óleos essenciais',
-    '33012915': 'Outros óleos essenciais',
-    '33012916': 'Outros óleos essenciais',
-    '33012917': 'Outros óleos essenciais',
-    '33012918': 'Outros óleos essenciais',
-    '33012919': 'Outros óleos essenciais',
-    '33012921': 'Outros óleos essenciais',
-    '33012922': 'Outros óleos essenciais',
-    '33012990': 'Outros óleos essenciais',
-    '33013000': 'Resinóides',
-    '33019010': 'Soluções concentradas, subprodutos terpênicos e soluções aquosas de óleos essenciais; óleoressinas de extração',
-    '33019020': 'Soluções concentradas, subprodutos terpênicos e soluções aquosas de óleos essenciais; óleoressinas de extração',
-    '33019030': 'Soluções concentradas, subprodutos terpênicos e soluções aquosas de óleos essenciais; óleoressinas de extração',
-    '33019040': 'Soluções concentradas, subprodutos terpênicos e soluções aquosas de óleos essenciais; óleoressinas de extração',
-    '33021000': 'Misturas de substâncias odoríferas utilizadas como matéria básica para indústrias alimentares ou de bebida',
-    '33029011': 'Outras misturas de substâncias odoríferas utilizadas como matéria básica para a indústria',
-    '33029019': 'Outras misturas de substâncias odoríferas utilizadas como matéria básica para a indústria',
-    '33029090': 'Outras misturas de substâncias odoríferas utilizadas como matéria básica para a indústria',
-    '33029091': 'Outras misturas de substâncias odoríferas utilizadas como matéria básica para a indústria',
-    '33029099': 'Outras misturas de substâncias odoríferas utilizadas como matéria básica para a indústria',
-    '33030010': 'Perfumes (extratos) e águas-de-colônia',
-    '33030020': 'Perfumes (extratos) e águas-de-colônia',
-    '33041000': 'Produtos de maquilagem para os lábios',
-    '33042010': 'Produtos de maquilagem para os olhos',
-    '33042090': 'Produtos de maquilagem para os olhos',
-    '33043000': 'Preparações para manicuros e pedicuros',
-    '33049100': 'Pós, incluídos os compactos, para maquilagem',
-    '33049910': 'Outros produtos de beleza ou de maquilagem preparados',
-    '33049990': 'Outros produtos de beleza ou de maquilagem preparados',
-    '33051000': 'Xampus para os cabelos',
-    '33052000': 'Preparações para ondulação ou alisamento permanentes dos cabelos',
-    '33053000': 'Laquês para o cabelo',
-    '33059000': 'Outras preparações capilares',
-    '33061000': 'Dentifrícios',
-    '33062000': 'Fios utilizados para limpar espaços interdentais (fio dental)',
-    '33069000': 'Outras preparações para higiene bucal ou dentária',
-    '33071000': 'Preparações para barbear (antes, durante ou após)',
-    '33072010': 'Desodorantes corporais e antiperspirantes',
-    '33072090': 'Desodorantes corporais e antiperspirantes',
-    '33073000': 'Sais perfumados e outras preparações para banhos',
-    '33074100': 'Agarbate e outras preparações odoríferas que atuem por combustão',
-    '33074900': 'Outros preparações para perfumar ou desodorizar ambientes',
-    '33079000': 'Outros produtos ou preparados de perfumaria, toucador ou cosmética',
-    '34011110': 'Sabões, produtos ou preparações tensoativos de toucador, incluídos os de uso medicinal',
-    '34011190': 'Sabões, produtos ou preparações tensoativos de toucador, incluídos os de uso medicinal',
-    '34011900': 'Outros sabões, produtos ou preparações tensoativas, em barras, pedaços',
-    '34012010': 'Sabões sob outras formas',
-    '34012090': 'Sabões sob outras formas',
-    '34013000': 'Produtos e preparações orgânicos tensoativos destinados à lavagem de pele, acondicionados para venda a retalho',
-    '34021110': 'Agentes orgânicos de superfície, aniônicos, mesmo acondicionados para venda a retalho',
-    '34021120': 'Agentes orgânicos de superfície, aniônicos, mesmo acondicionados para venda a retalho',
-    '34021130': 'Agentes orgânicos de superfície, aniônicos, mesmo acondicionados para venda a retalho',
-    '34021140': 'Agentes orgânicos de superfície, aniônicos, mesmo acondicionados para venda a retalho',
-    '34021190': 'Agentes orgânicos de superfície, aniônicos, mesmo acondicionados para venda a retalho',
-    '34021210': 'Agentes orgânicos de superfície, catiônicos, mesmo acondicionados para venda a retalho',
-    '34021290': 'Agentes orgânicos de superfície, catiônicos, mesmo acondicionados para venda a retalho',
-    '34021300': 'Agentes orgânicos de superfície, não iônicos, mesmo acondicionados para venda a retalho',
-    '34021900': 'Outros agentes orgânicos de superfície, mesmo acondicionados para venda a retalho',
-    '34022000': 'Preparações tensoativas, preparações para lavagem e preparações para limpeza, acondicionadas para venda a retalho',
-    '34023100': 'Ácidos alquilbenzeno sulfônicos lineares e seus sais',
-    '34023910': 'Outros agentes orgânicos de superfície aniônicos, colocados ou não para venda a varejo, não classificados nos códigos anteriores',
-    '34023920': 'Outros agentes orgânicos de superfície aniônicos, colocados ou não para venda a varejo, não classificados nos códigos anteriores',
-    '34023930': 'Outros agentes orgânicos de superfície aniônicos, colocados ou não para venda a varejo, não classificados nos códigos anteriores',
-    '34023990': 'Outros agentes orgânicos de superfície aniônicos, colocados ou não para venda a varejo, não classificados nos códigos anteriores',
-    '34024110': 'Outros agentes orgânicos tenso-ativos, com ou sem venda a varejo, catiônicos',
-    '34024190': 'Outros agentes orgânicos tenso-ativos, com ou sem venda a varejo, catiônicos',
-    '34024200': 'Outros agentes orgânicos tenso-ativos, com ou sem venda a varejo, não iônicos',
-    '34024900': 'Outros agentes orgânicos tenso-ativos, acondicionados ou não para venda a varejo, não classificados nos códigos anteriores',
-    '34025000': 'Preparações tensoativas, preparações para lavagem (incluídas as preparações auxiliares de lavagem) e preparações para limpeza, mesmo que contenham sabão, exceto as da posição 34.01, acondicionadas para venda a retalho',
-    '34029011': 'Outras preparações tensoativas e preparações para lavagem e limpeza',
-    '34029019': 'Outras preparações tensoativas e preparações para lavagem e limpeza',
-    '34029021': 'Outras preparações tensoativas e preparações para lavagem e limpeza',
-    '34029029': 'Outras preparações tensoativas e preparações para lavagem e limpeza',
-    '34029031': 'Outras preparações tensoativas e preparações para lavagem e limpeza',
-    '34029039': 'Outras preparações tensoativas e preparações para lavagem e limpeza',
-    '34029090': 'Outras preparações tensoativas e preparações para lavagem e limpeza',
-    '34031110': 'Preparações contendo óleos de petróleo ou de minerais betuminosos para tratamento de matérias têxteis, couro, peleteria ou de outras matérias',
-    '34031120': 'Preparações contendo óleos de petróleo ou de minerais betuminosos para tratamento de matérias têxteis, couro, peleteria ou de outras matérias',
-    '34031190': 'Preparações contendo óleos de petróleo ou de minerais betuminosos para tratamento de matérias têxteis, couro, peleteria ou de outras matérias',
-    '34031900': 'Outras preparações contendo óleos de petróleo ou de minerais betuminosos',
-    '34039110': 'Outras preparações para tratamento de matéria têxtil, couros, peleteria ou de outras matérias',
-    '34039120': 'Outras preparações para tratamento de matéria têxtil, couros, peleteria ou de outras matérias',
-    '34039190': 'Outras preparações para tratamento de matéria têxtil, couros, peleteria ou de outras matérias',
-    '34039900': 'Outras preparações lubrificantes, antiaderentes ou antiferruginosas',
-    '34042010': 'Ceras artificiais e ceras preparadas de polietileno-glicóis',
-    '34042020': 'Ceras artificiais e ceras preparadas de polietileno-glicóis',
-    '34049011': 'Outras ceras artificiais ou preparadas',
-    '34049012': 'Outras ceras artificiais ou preparadas',
-    '34049013': 'Outras ceras artificiais ou preparadas',
-    '34049014': 'Outras ceras artificiais ou preparadas',
-    '34049019': 'Outras ceras artificiais ou preparadas',
-    '34049021': 'Outras ceras artificiais ou preparadas',
-    '34049029': 'Outras ceras artificiais ou preparadas',
-    '34051000': 'Pomadas, cremes e preparações semelhantes para calçados ou para couros',
-    '34052000': 'Encáusticas e preparações semelhantes para conservação e limpeza de móveis, soalhos e artigos de madeira',
-    '34053000': 'Preparações para dar brilho a pintura de carroçarias e produtos semelhantes, exceto para dar brilho a metais',
-    '34054000': 'Pastas, pós e outros preparações para arear',
-    '34059000': 'Outras preparações para dar brilho em vidros ou metais',
-    '34060000': 'Velas, pavios, círios e artigos semelhantes',
-    '34070010': 'Pastas para modelar, ceras para dentistas e outras composições para dentistas à base de gesso',
-    '34070020': 'Pastas para modelar, ceras para dentistas e outras composições para dentistas à base de gesso',
-    '34070090': 'Pastas para modelar, ceras para dentistas e outras composições para dentistas à base de gesso',
-    '35011000': 'Caseínas',
-    '35019011': 'Caseinatos, outros derivados das caseínas, colas de caseína',
-    '35019019': 'Caseinatos, outros derivados das caseínas, colas de caseína',
-    '35019020': 'Caseinatos, outros derivados das caseínas, colas de caseína',
-    '35021100': 'Ovalbumina seca',
-    '35021900': 'Ovalbumina (exceto seca)',
-    '35022000': 'Lactalbumina, incluídos os concentrados de duas ou mais proteínas de soro de leite, contendo, em peso, calculado sobre matéria seca, mais de 80% de proteínas de soro de leite',
-    '35029010': 'Outros albuminas, albuminatos e derivados das albuminas',
-    '35029090': 'Outros albuminas, albuminatos e derivados das albuminas',
-    '35030011': 'Gelatinas e seus derivados; ictiocola e outras colas de origem animal, exceto cola de caseína',
-    '35030012': 'Gelatinas e seus derivados; ictiocola e outras colas de origem animal, exceto cola de caseína',
-    '35030019': 'Gelatinas e seus derivados; ictiocola e outras colas de origem animal, exceto cola de caseína',
-    '35030090': 'Gelatinas e seus derivados; ictiocola e outras colas de origem animal, exceto cola de caseína',
-    '35040011': 'Peptonas e seus derivados; outras matérias protéicas e seus derivados; pó de peles',
-    '35040019': 'Peptonas e seus derivados; outras matérias protéicas e seus derivados; pó de peles',
-    '35040020': 'Peptonas e seus derivados; outras matérias protéicas e seus derivados; pó de peles',
-    '35040030': 'Peptonas e seus derivados; outras matérias protéicas e seus derivados; pó de peles',
-    '35040090': 'Peptonas e seus derivados; outras matérias protéicas e seus derivados; pó de peles',
-    '35051000': 'Dextrina e outros amidos e féculas modificados',
-    '35052000': 'Colas à base de amidos ou de féculas, de dextrina ou de outros amidos ou féculas modificados',
-    '35061010': 'Produtos utilizados como colas ou adesivos, acondicionados para venda a retalho, com peso líquido <= 1 kg',
-    '35061090': 'Produtos utilizados como colas ou adesivos, acondicionados para venda a retalho, com peso líquido <= 1 kg',
-    '35069110': 'Adesivos à base de polímeros das posições 3901 a 3913 ou de borracha',
-    '35069120': 'Adesivos à base de polímeros das posições 3901 a 3913 ou de borracha',
-    '35069190': 'Adesivos à base de polímeros das posições 3901 a 3913 ou de borracha',
-    '35069900': 'Outras colas e adesivos preparados',
-    '35071000': 'Coalho e seus concentrados',
-    '35079011': 'Outras enzimas preparadas',
-    '35079019': 'Outras enzimas preparadas',
-    '35079022': 'Outras enzimas preparadas',
-    '35079026': 'Outras enzimas preparadas',
-    '35079029': 'Outras enzimas preparadas',
-    '35079031': 'Outras enzimas preparadas',
-    '35079039': 'Outras enzimas preparadas',
-    '35079041': 'Outras enzimas preparadas',
-    '35079042': 'Outras enzimas preparadas',
-    '35079049': 'Outras enzimas preparadas',
-    '36010000': 'Pólvoras propulsivas',
-    '36020000': 'Explosivos preparados, exceto pólvoras propulsivas',
-    '36030010': 'Estopins ou rastilhos de segurança; cordéis detonantes; fulminantes e cápsulas fulminantes; detonadores elétricos',
-    '36030020': 'Estopins ou rastilhos de segurança; cordéis detonantes; fulminantes e cápsulas fulminantes; detonadores elétricos',
-    '36030030': 'Estopins ou rastilhos de segurança; cordéis detonantes; fulminantes e cápsulas fulminantes; detonadores elétricos',
-    '36030040': 'Estopins ou rastilhos de segurança; cordéis detonantes; fulminantes e cápsulas fulminantes; detonadores elétricos',
-    '36030050': 'Estopins ou rastilhos de segurança; cordéis detonantes; fulminantes e cápsulas fulminantes; detonadores elétricos',
-    '36030060': 'Estopins ou rastilhos de segurança; cordéis detonantes; fulminantes e cápsulas fulminantes; detonadores elétricos',
-    '36031000': 'Fusíveis de segurança',
-    '36032000': 'Cordas detonantes',
-    '36033000': 'Tampas de percussão',
-    '36034000': 'Tampas detonantes',
-    '36035000': 'Ignitores',
-    '36036000': 'Detonadores elétricos',
-    '36041000': 'Fogos de artifício',
-    '36049010': 'Foguetes de sinalização ou contra o granizo, bombas, petardos e outros artigos de pirotecnia',
-    '36049090': 'Foguetes de sinalização ou contra o granizo, bombas, petardos e outros artigos de pirotecnia',
-    '36050000': 'Fósforos, exceto os artigos de pirotecnia',
-    '36061000': 'Combustíveis líquidos ou gasosos liquefeitos, utilizados para carregar isqueiros, com capacidade <= 300 cm3',
-    '36069000': 'Ferrocério e outros ligas pirofosfóricas; artigos de matérias inflamáveis',
-    '37011010': 'Chapas e filmes planos, para raios x, sensibilizados, não impressionados',
-    '37011021': 'Chapas e filmes planos, para raios x, sensibilizados, não impressionados',
-    '37011029': 'Chapas e filmes planos, para raios x, sensibilizados, não impressionados',
-    '37012010': 'Filmes planos de revelação e copiagem instantâneas, sensibilizados, não impressionados',
-    '37013021': 'Outras chapas e filmes planos, sensibilizados, não impressionados, com um dos lados > 255 mm',
-    '37013022': 'Outras chapas e filmes planos, sensibilizados, não impressionados, com um dos lados > 255 mm',
-    '37013029': 'Outras chapas e filmes planos, sensibilizados, não impressionados, com um dos lados > 255 mm',
-    '37013031': 'Outras chapas e filmes planos, sensibilizados, não impressionados, com um dos lados > 255 mm',
-    '37013040': 'Outras chapas e filmes planos, sensibilizados, não impressionados, com um dos lados > 255 mm',
-    '37013050': 'Outras chapas e filmes planos, sensibilizados, não impressionados, com um dos lados > 255 mm',
-    '37013090': 'Outras chapas e filmes planos, sensibilizados, não impressionados, com um dos lados > 255 mm',
-    '37019100': 'Outras chapas e filmes, planos, sensibilizados, não impressionados, para foto a cores',
-    '37019900': 'Outras chapas e filmes, planos, sensibilizados, não impressionados, para fotografia monocromática',
-    '37021020': 'Filmes para raios X, sensibilizados, não impressionados, em rolos',
-    '37023100': 'Outros filmes para foto a cores, sensibilizados, não impressionados, não perfurados, de largura <= 105 mm, em rolos',
-    '37023900': 'Outros filmes para fotografia monocromática, sensibilizados, não impressionados, não perfurados, de largura <= 105 mm, em rolos',
-    '37024210': 'Filmes, sensibilizados, não impressionados, não perfurados, exceto para fotografia a cores, de largura > 610 mm e comprimento > 200 m, em rolos',
-    '37024310': 'Filmes sensibilizados, não impressionados, não perfurados, de largura > 610 mm e comprimento <= 200 m, em rolos',
-    '37024390': 'Filmes sensibilizados, não impressionados, não perfurados, de largura > 610 mm e comprimento <= 200 m, em rolos',
-    '37024421': 'Filmes, sensibilizados, não impressionados, não perfurados, de largura > 105 mm, mas <= 610 mm, em rolos',
-    '37024422': 'Filmes, sensibilizados, não impressionados, não perfurados, de largura > 105 mm, mas <= 610 mm, em rolos',
-    '37024429': 'Filmes, sensibilizados, não impressionados, não perfurados, de largura > 105 mm, mas <= 610 mm, em rolos',
-    '37025200': 'Filmes para fotografia a cores, sensibilizados, não impressionados, de largura <= 16 mm e comprimento > 14 m, rolos',
-    '37025419': 'Filmes para fotografia a cores, exceto diapositivos, sensibilizados, não impressionados, de largura > 16 mm, mas <= 35 mm, e comprimento <= 30 m, em rolos',
-    '37025590': 'Filmes para fotografia a cores, sensibilizados, não impressionados, de largura > 16 mm, mas <= 35 mm, e comprimento > 30 m, em rolos',
-    '37029700': 'Outros filmes sensibilizados, não impressionados, de largura não superior a 35 mm e comprimento superior a 30 m',
-    '37029800': 'Outros filmes sensibilizados, não impressionados, de largura superior a 35 mm',
-    '37031010': 'Papel, cartões, têxteis, sensibilizados, não impressionados, em rolos de largura > 610 mm',
-    '37031021': 'Papel, cartões, têxteis, sensibilizados, não impressionados, em rolos de largura > 610 mm',
-    '37031029': 'Papel, cartões, têxteis, sensibilizados, não impressionados, em rolos de largura > 610 mm',
-    '37032000': 'Outros papéis, cartões, têxteis, para fotografia a cores, sensibilizados, não impressionados',
-    '37039010': 'Outros papeis, cartões e têxteis fotográficos, sensibilizados, não impressionados',
-    '37039090': 'Outros papeis, cartões e têxteis fotográficos, sensibilizados, não impressionados',
-    '37040000': 'Chapas, filmes, papéis, cartões e têxteis fotográficos, impressionados, mas não revelados',
-    '37050090': 'Chapas e filmes, fotográficos, impressionados e revelados, exceto os filmes cinematográficos',
-    '37069000': 'Outros filmes cinematográficos impressionados e revelados, contendo ou não gravação de som ou contendo apenas gravação de som',
-    '37071000': 'Emulsões para sensibilização de superfícies para uso fotográfico',
-    '37079010': 'Outras preparações químicas (fixadores, reveladores) para usos fotográficos, exceto vernizes, colas ou adesivos, dosados ou acondicionados para venda a retalho',
-    '37079021': 'Outras preparações químicas (fixadores, reveladores) para usos fotográficos, exceto vernizes, colas ou adesivos, dosados ou acondicionados para venda a retalho',
-    '37079029': 'Outras preparações químicas (fixadores, reveladores) para usos fotográficos, exceto vernizes, colas ou adesivos, dosados ou acondicionados para venda a retalho',
-    '37079030': 'Outras preparações químicas (fixadores, reveladores) para usos fotográficos, exceto vernizes, colas ou adesivos, dosados ou acondicionados para venda a retalho',
-    '37079090': 'Outras preparações químicas (fixadores, reveladores) para usos fotográficos, exceto vernizes, colas ou adesivos, dosados ou acondicionados para venda a retalho',
-    '38011000': 'Grafita artificial',
-    '38012010': 'Grafita coloidal ou semicoloidal',
-    '38012090': 'Grafita coloidal ou semicoloidal',
-    '38013010': 'Pastas carbonadas para eletrodos e pastas semelhantes para revestimento interior de fornos',
-    '38013090': 'Pastas carbonadas para eletrodos e pastas semelhantes para revestimento interior de fornos',
-    '38019000': 'Outras preparações à base de grafita ou de outros carbonos, em pasta, blocos, lamelas ou outros produtos intermediários',
-    '38021000': 'Carvões ativados',
-    '38029010': 'Outras matérias minerais naturais ativadas; negros de origem animal',
-    '38029020': 'Outras matérias minerais naturais ativadas; negros de origem animal',
-    '38029030': 'Outras matérias minerais naturais ativadas; negros de origem animal',
-    '38029040': 'Outras matérias minerais naturais ativadas; negros de origem animal',
-    '38029050': 'Outras matérias minerais naturais ativadas; negros de origem animal',
-    '38029090': 'Outras matérias minerais naturais ativadas; negros de origem animal',
-    '38030010': 'Tall-oil mesmo refinado',
-    '38030090': 'Tall-oil mesmo refinado',
-    '38040012': 'Lixívias residuais da fabricação de pasta de celulose, incluídos os lignossulfonatos',
-    '38040020': 'Lixívias residuais da fabricação de pasta de celulose, incluídos os lignossulfonatos',
-    '38051000': 'Essências de terebintina, de pinheiro ou da pasta de papel ao sulfato',
-    '38059010': 'Outras essências terpênicas da destilação ou do tratamento de madeiras',
-    '38059090': 'Outras essências terpênicas da destilação ou do tratamento de madeiras',
-    '38061000': 'Colofônias e ácidos resínicos',
-    '38062000': 'Sais de colofônias, de ácidos resínicos ou de seus derivados',
-    '38063000': 'Gomas ésteres (gomas fundidas)',
-    '38069011': 'Outras essências e derivados de colofônias ou de ácidos resínicos e óleos de colofônia',
-    '38069012': 'Outras essências e derivados de colofônias ou de ácidos resínicos e óleos de colofônia',
-    '38069019': 'Outras essências e derivados de colofônias ou de ácidos resínicos e óleos de colofônia',
-    '38069090': 'Outras essências e derivados de colofônias ou de ácidos resínicos e óleos de colofônia',
-    '38070000': 'Alcatrões de madeira; óleos de alcatrão de madeira; creosoto de madeira; metileno; breu vegetal',
-    '38085200': 'DDT (ISO) (clofenotano (DCI)), acondicionado em embalagens com um conteúdo de peso líquido não superior a 300 gramas',
-    '38085910': 'Outras mercadorias mencionadas na Nota de subposições 1 do presente Capítulo',
-    '38085926': 'Outras mercadorias mencionadas na Nota de subposições 1 do presente Capítulo',
-    '38085929': 'Outras mercadorias mencionadas na Nota de subposições 1 do presente Capítulo',
-    '38086100': 'Mercadorias mencionadas na Nota de subposições 2 do presente Capítulo, acondicionadas em embalagens com um conteúdo de peso líquido não superior a 300 g',
-    '38086210': 'Mercadorias mencionadas na Nota de subposições 2 do presente Capítulo, acondicionadas em embalagens com um conteúdo de peso líquido superior a 300 g, mas não superior a 7,5 kg',
-    '38086290': 'Mercadorias mencionadas na Nota de subposições 2 do presente Capítulo, acondicionadas em embalagens com um conteúdo de peso líquido superior a 300 g, mas não superior a 7,5 kg',
-    '38086910': 'Outras mercadorias mencionadas na Nota de subposições 2 do presente Capítulo',
-    '38086990': 'Outras mercadorias mencionadas na Nota de subposições 2 do presente Capítulo',
-    '38089111': 'Inseticidas',
-    '38089119': 'Inseticidas',
-    '38089120': 'Inseticidas',
-    '38089191': 'Inseticidas',
-    '38089192': 'Inseticidas',
-    '38089194': 'Inseticidas',
-    '38089195': 'Inseticidas',
-    '38089196': 'Inseticidas',
-    '38089197': 'Inseticidas',
-    '38089198': 'Inseticidas',
-    '38089199': 'Inseticidas',
-    '38089219': 'Fungicidas',
-    '38089291': 'Fungicidas',
-    '38089292': 'Fungicidas',
-    '38089293': 'Fungicidas',
-    '38089295': 'Fungicidas',
-    '38089296': 'Fungicidas',
-    '38089297': 'Fungicidas',
-    '38089299': 'Fungicidas',
-    '38089319': 'Herbicidas, inibidores de germinação e reguladores de crescimento para plantas',
-    '38089321': 'Herbicidas, inibidores de germinação e reguladores de crescimento para plantas',
-    '38089322': 'Herbicidas, inibidores de germinação e reguladores de crescimento para plantas',
-    '38089323': 'Herbicidas, inibidores de germinação e reguladores de crescimento para plantas',
-    '38089324': 'Herbicidas, inibidores de germinação e reguladores de crescimento para plantas',
-    '38089325': 'Herbicidas, inibidores de germinação e reguladores de crescimento para plantas',
-    '38089326': 'Herbicidas, inibidores de germinação e reguladores de crescimento para plantas',
-    '38089327': 'Herbicidas, inibidores de germinação e reguladores de crescimento para plantas',
-    '38089328': 'Herbicidas, inibidores de germinação e reguladores de crescimento para plantas',
-    '38089329': 'Herbicidas, inibidores de germinação e reguladores de crescimento para plantas',
-    '38089331': 'Herbicidas, inibidores de germinação e reguladores de crescimento para plantas',
-    '38089349': 'Herbicidas, inibidores de germinação e reguladores de crescimento para plantas',
-    '38089359': 'Herbicidas, inibidores de germinação e reguladores de crescimento para plantas',
-    '38089411': 'Desinfetantes',
-    '38089419': 'Desinfetantes',
-    '38089421': 'Desinfetantes',
-    '38089422': 'Desinfetantes',
-    '38089429': 'Desinfetantes',
-    '38089911': 'Rodenticidas, acaricidas, nematicidas, raticidas e produtos semelhantes',
-    '38089919': 'Rodenticidas, acaricidas, nematicidas, raticidas e produtos semelhantes',
-    '38089991': 'Rodenticidas, acaricidas, nematicidas, raticidas e produtos semelhantes',
-    '38089993': 'Rodenticidas, acaricidas, nematicidas, raticidas e produtos semelhantes',
-    '38089994': 'Rodenticidas, acaricidas, nematicidas, raticidas e produtos semelhantes',
-    '38089995': 'Rodenticidas, acaricidas, nematicidas, raticidas e produtos semelhantes',
-    '38089996': 'Rodenticidas, acaricidas, nematicidas, raticidas e produtos semelhantes',
-    '38089999': 'Rodenticidas, acaricidas, nematicidas, raticidas e produtos semelhantes',
-    '38091010': 'Preparações à base de matérias amiláceas',
-    '38091090': 'Preparações à base de matérias amiláceas',
-    '38099110': 'Outros agentes de apresto ou acabamento, aceleradores de tingimento ou de fixação e outros produtos para a indústria têxtil ou indústrias similares',
-    '38099120': 'Outros agentes de apresto ou acabamento, aceleradores de tingimento ou de fixação e outros produtos para a indústria têxtil ou indústrias similares',
-    '38099130': 'Outros agentes de apresto ou acabamento, aceleradores de tingimento ou de fixação e outros produtos para a indústria têxtil ou indústrias similares',
-    '38099141': 'Outros agentes de apresto ou acabamento, aceleradores de tingimento ou de fixação e outros produtos para a indústria têxtil ou indústrias similares',
-    '38099149': 'Outros agentes de apresto ou acabamento, aceleradores de tingimento ou de fixação e outros produtos para a indústria têxtil ou indústrias similares',
-    '38099190': 'Outros agentes de apresto ou acabamento, aceleradores de tingimento ou de fixação e outros produtos para a indústria têxtil ou indústrias similares',
-    '38099211': 'Outros agentes de apresto ou acabamento para a indústria do papel',
-    '38099219': 'Outros agentes de apresto ou acabamento para a indústria do papel',
-    '38099290': 'Outros agentes de apresto ou acabamento para a indústria do papel',
-    '38099311': 'Outros agentes de apresto ou acabamento para a indústria do couro',
-    '38099319': 'Outros agentes de apresto ou acabamento para a indústria do couro',
-    '38099390': 'Outros agentes de apresto ou acabamento para a indústria do couro',
-    '38101010': 'Preparações para decapagem de metais; pastas e pós para soldar, constituídos por metal e outras matérias',
-    '38101020': 'Preparações para decapagem de metais; pastas e pós para soldar, constituídos por metal e outras matérias',
-    '38109000': 'Outros fluxos e preparações auxiliares para enchimento ou revestimento de eletrodos ou varetas, para soldar',
-    '38111900': 'Outras preparações antidetonantes para combustíveis',
-    '38112110': 'Aditivos contendo óleo de petróleo ou de minerais betuminosos, para óleos lubrificantes',
-    '38112120': 'Aditivos contendo óleo de petróleo ou de minerais betuminosos, para óleos lubrificantes',
-    '38112130': 'Aditivos contendo óleo de petróleo ou de minerais betuminosos, para óleos lubrificantes',
-    '38112140': 'Aditivos contendo óleo de petróleo ou de minerais betuminosos, para óleos lubrificantes',
-    '38112150': 'Aditivos contendo óleo de petróleo ou de minerais betuminosos, para óleos lubrificantes',
-    '38112190': 'Aditivos contendo óleo de petróleo ou de minerais betuminosos, para óleos lubrificantes',
-    '38112920': 'Outros aditivos para óleos lubrificantes',
-    '38112990': 'Outros aditivos para óleos lubrificantes',
-    '38119010': 'Outros aditivos preparados, para óleos minerais ou para outros líquidos com fins semelhantes',
-    '38119090': 'Outros aditivos preparados, para óleos minerais ou para outros líquidos com fins semelhantes',
-    '38121000': 'Preparações denominadas aceleradores de vulcanização',
-    '38122000': 'Plastificantes compostos para borracha ou plástico',
-    '38123100': 'Misturas de oligômeros de 2,2,4-trimetil-1,2-diidroquinolina (TMQ)',
-    '38123911': 'Outras preparações antioxidantes e outros estabilizadores compostos, para borracha ou plástico',
-    '38123919': 'Outras preparações antioxidantes e outros estabilizadores compostos, para borracha ou plástico',
-    '38123929': 'Outras preparações antioxidantes e outros estabilizadores compostos, para borracha ou plástico',
-    '38130010': 'Composições e cargas para aparelhos extintores; granadas e bombas extintoras',
-    '38130090': 'Composições e cargas para aparelhos extintores; granadas e bombas extintoras',
-    '38140010': 'Solventes e diluentes orgânicos compostos; preparações para remover tintas ou vernizes',
-    '38140020': 'Solventes e diluentes orgânicos compostos; preparações para remover tintas ou vernizes',
-    '38140090': 'Solventes e diluentes orgânicos compostos; preparações para remover tintas ou vernizes',
-    '38151100': 'Catalisador em suporte, tendo como substância ativa o níquel ou um composto de níquel',
-    '38151210': 'Catalisador em suporte, tendo como substância ativa um metal precioso ou um composto de metal precioso',
-    '38151220': 'Catalisador em suporte, tendo como substância ativa um metal precioso ou um composto de metal precioso',
-    '38151290': 'Catalisador em suporte, tendo como substância ativa um metal precioso ou um composto de metal precioso',
-    '38151900': 'Outros catalisadores em suporte',
-    '38159010': 'Outras preparações catalíticas',
-    '38159092': 'Outras preparações catalíticas',
-    '38159099': 'Outras preparações catalíticas',
-    '38160011': 'Cimentos, argamassas, concretos e composições semelhantes, refratários',
-    '38160012': 'Cimentos, argamassas, concretos e composições semelhantes, refratários',
-    '38160019': 'Cimentos, argamassas, concretos e composições semelhantes, refratários',
-    '38160021': 'Cimentos, argamassas, concretos e composições semelhantes, refratários',
-    '38160029': 'Cimentos, argamassas, concretos e composições semelhantes, refratários',
-    '38160090': 'Cimentos, argamassas, concretos e composições semelhantes, refratários',
-    '38170010': 'Misturas de alquilbenzenos ou alquilnaftalenos, exceto as das posições 2707 ou 2902',
-    '38180010': 'Elementos químicos impurificados, para utilização eletrônica',
-    '38180090': 'Elementos químicos impurificados, para utilização eletrônica',
-    '38190000': 'Líquidos para freios hidráulicos ou líquidos para transmissões hidráulicas, contendo óleos petróleo em proporção <= 70%, em peso',
-    '38200000': 'Preparações anticongelantes e líquidos preparados para descongelação',
-    '38210000': 'Meios de cultura preparados para o desenvolvimento de microrganismos ou de células vegetais, humanas ou animais',
-    '38220010': 'Reagentes de diagnóstico ou de laboratório, em qualquer suporte ou preparados, exceto os das posições 3002 ou 3006; materiais de referência certificados',
-    '38220090': 'Reagentes de diagnóstico ou de laboratório, em qualquer suporte ou preparados, exceto os das posições 3002 ou 3006; materiais de referência certificados',
-    '38221100': 'Reagentes de diagnóstico ou de laboratório em um suporte, reagentes de diagnóstico ou de laboratório preparados ou não em um suporte, colocados ou não sob a forma de kits, para a malária',
-    '38221200': 'Reagentes de diagnóstico ou de laboratório em um suporte, reagentes de diagnóstico ou de laboratório preparados, com ou sem suporte, colocados ou não em forma de kits, para Zika e outras doenças transmitidas por mosquitos do gênero Aedes',
-    '38221300': 'Reagentes de diagnóstico ou de laboratório em um suporte, reagentes de diagnóstico ou de laboratório preparados ou não em um suporte, colocados ou não sob a forma de kits, para a determinação do grupo sanguíneo',
-    '38221910': 'Outros reagentes de diagnóstico ou de laboratório em um suporte, reagentes de diagnóstico ou de laboratório preparados, com ou sem suporte, colocados ou não sob a forma de kits, não classificados nos códigos anteriores',
-    '38221920': 'Outros reagentes de diagnóstico ou de laboratório em um suporte, reagentes de diagnóstico ou de laboratório preparados, com ou sem suporte, colocados ou não sob a forma de kits, não classificados nos códigos anteriores',
-    '38221930': 'Outros reagentes de diagnóstico ou de laboratório em um suporte, reagentes de diagnóstico ou de laboratório preparados, com ou sem suporte, colocados ou não sob a forma de kits, não classificados nos códigos anteriores',
-    '38221940': 'Outros reagentes de diagnóstico ou de laboratório em um suporte, reagentes de diagnóstico ou de laboratório preparados, com ou sem suporte, colocados ou não sob a forma de kits, não classificados nos códigos anteriores',
-    '38221990': 'Outros reagentes de diagnóstico ou de laboratório em um suporte, reagentes de diagnóstico ou de laboratório preparados, com ou sem suporte, colocados ou não sob a forma de kits, não classificados nos códigos anteriores',
-    '38229000': 'Outros reagentes de diagnóstico ou de laboratório sobre um suporte, reagentes de diagnóstico ou de laboratório preparados, com ou sem suporte, apresentados ou não sob a forma de kits, exceto os da posição 30.06; materiais de referência certificados, não classificados nos códigos anteriores',
-    '38231100': 'Ácido esteárico (ácido graxo monocarboxílico industrial)',
-    '38231200': 'Ácido oléico (ácido graxo monocarboxílico industrial)',
-    '38231300': 'Ácido graxo (gordo) do tall oil',
-    '38231990': 'Outros ácidos graxos monocarboxílicos industriais e óleos ácidos de refinação',
-    '38237010': 'Outros álcoois graxos (gordos) industriais',
-    '38237020': 'Outros álcoois graxos (gordos) industriais',
-    '38237040': 'Outros álcoois graxos (gordos) industriais',
-    '38237090': 'Outros álcoois graxos (gordos) industriais',
-    '38241000': 'Aglutinantes preparados para moldes ou núcleos de fundição',
-    '38243000': 'Carbonetos metálicos não aglomerados misturados entre si ou com aglutinantes metálicos',
-    '38244000': 'Aditivos preparados para cimentos, argamassas ou concretos',
-    '38245000': 'Argamassas e concretos, não refratários',
-    '38246000': 'Sorbitol, exceto o poliálcool D-glucitol',
-    '38247190': 'Misturas contendo clorofluorcarbonetos (CFC), mesmo que contenham hidroclorofluorcarbonetos (HCFC), perfluorcarbonetos (PFC) ou hidrofluorcarbonetos (HFC)',
-    '38247420': 'Misturas contendo hidroclorofluorcarbonetos (HCFC), mesmo que contenham perfluorcarbonetos (PFC) ou hidrofluorcarbonetos (HFC), mas que não contenham clorofluorcarbonetos (CFC)',
-    '38247810': 'Misturas contendo perfluorcarbonetos (PFC) ou hidrofluorcarbonetos (HFC), mas que não contenham clorofluorcarbonetos (CFC) ou hidroclorofluorcarbonetos (HCFC)',
-    '38247890': 'Misturas contendo perfluorcarbonetos (PFC) ou hidrofluorcarbonetos (HFC), mas que não contenham clorofluorcarbonetos (CFC) ou hidroclorofluorcarbonetos (HCFC)',
-    '38248190': 'Misturas e preparações contendo oxirano (óxido de etileno)',
-    '38248290': 'Misturas contendo polibromobifenilas (PBB), policloroterfenilas (PCT) ou policlorobifenilas (PCB)',
-    '38248300': 'Misturas contendo fosfato de tris (2, 3-dibromopropila)',
-    '38248400': 'Mercadorias mencionadas na Nota de subposições 3 do presente Capítulo, que contenham aldrin, canfecloro, clordano, clordecona , DDT, 1,1,1-tricloro-2,2-bis(p-clorofenil)etano), dieldrin, endossulfan, endrin, heptacloro ou mirex',
-    '38248900': 'Mercadorias especificadas na Nota de Subposição 3 deste Capítulo, contendo parafinas cloradas de cadeia curta',
-    '38249100': 'Misturas e preparações constituídas principalmente por metilfosfonato de (5-etil-2-metil-2-óxido-1,3,2-dioxafosfinan-5-il)metil metila e metilfosfonato de bis[(5-etil-2-metil-2-óxido-1,3,2-dioxafosfinan-5-il)metila]',
-    '38249200': 'Ésteres poliglicólicos de ácido metilfosfônico',
-    '38249911': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249912': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249914': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249919': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249921': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249922': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249923': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249924': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249925': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249929': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249931': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249932': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249933': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249934': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249935': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249936': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249939': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249941': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249942': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249949': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249951': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249952': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249953': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249954': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249959': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249961': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249969': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249971': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249972': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249975': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249977': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249978': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249979': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249981': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249983': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249984': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249985': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249986': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249987': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249988': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38249989': 'Outros aglutinantes preparados para moldes ou para núcleos de fundição; produtos químicos e preparações das indústrias químicas ou das indústrias conexas (incluindo os constituídos por misturas de produtos naturais)',
-    '38253000': 'Lixos clínicos',
-    '38254900': 'Outros resíduos de solventes orgânicos',
-    '38255000': 'Resíduos de soluções desoxidantes para metais, de fluidos hidráulicos, de fluidos para freios e de líquidos anticongelantes',
-    '38256100': 'Outros resíduos das indústrias químicas ou das indústrias conexas, contendo principalmente constituintes orgânicos',
-    '38256900': 'Outros resíduos das industrias químicas ou das indústrias conexas',
-    '38259000': 'Outros produtos residuais das indústrias químicas ou das indústrias conexas não especificados',
-    '38260000': 'Biodiesel e suas misturas, com > 70% peso de petróleo ou mineral betuminoso',
-    '38275100': 'Misturas contendo derivados halogenados de metano, etano ou propano, não especificados nem incluídos em outras partes, contendo trifluorometano (HFC-23) mas não contendo clorofluorocarbonos (CFC) ou hidroclorofluorocarbonos (HCFC)',
-    '38276100': 'Misturas que contenham derivados halogenados de metano, etano ou propano, não especificados nem incluídos em outras posições, que contenham outros hidrofluorocarbonos (HFC) mas que não contenham clorofluorocarbonos (CFC) ou hidroclorofluorocarbonos (HCFC), que contenham 15% ou mais em massa de 1,1,1-trifluoroetano (HFC-143a)',
-    '38276200': 'Misturas que contenham derivados halogenados de metano, etano ou propano, não especificados nem compreendidos em outras posições, que contenham outros hidrofluorocarbonos (HFC) mas que não contenham clorofluorocarbonos (CFC) ou hidroclorofluorocarbonos (HCFC), não incluídos na subposição acima, que contenham 55 % ou mais em massa de pentafluoroetano (HFC- 125) mas que não contenham derivados fluorados insaturados de hidrocarbonetos acíclicos (HFOs)',
-    '38276300': 'Misturas que contenham derivados halogenados de metano, etano ou propano, não especificados nem compreendidos em outras posições, que contenham outros hidrofluorocarbonos (HFC) mas que não contenham clorofluorocarbonos (CFC) ou hidroclorofluorocarbonos (HCFC), não incluídos nas subposições acima, que contenham 40% ou mais em massa de pentafluoroetano (HFC-125)',
-    '38276400': 'Misturas que contenham derivados halogenados de metano, etano ou propano, não especificados nem compreendidos em outras posições, que contenham outros hidrofluorocarbonetos (HFC) mas que não contenham clorofluorocarbonetos (CFC) ou hidroclorofluorocarbonetos (HCFC), não compreendidos nas subposições acima, que contenham 30% ou mais, em massa, de 1,1,1,2-tetrafluoroetano (HFC-134a) mas que não contenham derivados fluorados insaturados de hidrocarbonetos acíclicos (HFOs)',
-    '38276500': 'Misturas que contenham derivados halogenados de metano, etano ou propano, não especificados nem compreendidos em outras posições, que contenham outros hidrofluorocarbonos (HFC) mas que não contenham clorofluorocarbonos (CFC) ou hidroclorofluorocarbonos (HCFC), não incluídos nas subposições acima, que contenham 20% ou mais em massa de difluorometano (HFC-32) e 20% ou mais em massa de pentafluoroetano (HFC-125)',
-    '38276800': 'Misturas que contenham derivados halogenados de metano, etano ou propano, não especificados nem compreendidos em outras posições, que contenham outros hidrofluorocarbonos (HFC) mas que não contenham clorofluorocarbonos (CFC) ou hidroclorofluorocarbonos (HCFC), não compreendidos nas subposições anteriores, que contenham substâncias das subposições 2903.41 a 2903.48',
-    '38279000': 'Outras misturas contendo derivados halogenados de metano, etano ou propano, não especificados ou incluídos em outros códigos, não classificados nos códigos anteriores',
-    '39011010': 'Polietileno de densidade < 0,94, em forma primária',
-    '39011020': 'Polietileno de densidade < 0,94, em forma primária',
-    '39011030': 'Polietileno de densidade < 0,94, em forma primária',
-    '39011091': 'Polietileno de densidade < 0,94, em forma primária',
-    '39011092': 'Polietileno de densidade < 0,94, em forma primária',
-    '39012011': 'Polietileno de densidade => 0,94, em forma primária',
-    '39012019': 'Polietileno de densidade => 0,94, em forma primária',
-    '39012021': 'Polietileno de densidade => 0,94, em forma primária',
-    '39012029': 'Polietileno de densidade => 0,94, em forma primária',
-    '39013010': 'Copolímeros de etileno e acetato vinila, em formas primárias',
-    '39013090': 'Copolímeros de etileno e acetato vinila, em formas primárias',
-    '39014000': 'Copolímeros de etileno e alfa-olefina, de densidade inferior a 0,94',
-    '39019010': 'Outros polímeros de etileno, em formas primárias',
-    '39019020': 'Outros polímeros de etileno, em formas primárias',
-    '39019030': 'Outros polímeros de etileno, em formas primárias',
-    '39019040': 'Outros polímeros de etileno, em formas primárias',
-    '39019050': 'Outros polímeros de etileno, em formas primárias',
-    '39019090': 'Outros polímeros de etileno, em formas primárias',
-    '39021010': 'Polipropileno, em forma primária',
-    '39021020': 'Polipropileno, em forma primária',
-    '39022000': 'Polisobutileno, em forma primária',
-    '39023000': 'Copolímeros de propileno, em formas primárias',
-    '39029000': 'Outros polímeros de propileno ou de outras olefinas, em formas primárias',
-    '39031110': 'Poliestireno expansível, em forma primária',
-    '39031120': 'Poliestireno expansível, em forma primária',
-    '39031900': 'Outros poliestirenos, em formas primárias',
-    '39032000': 'Copolímeros de estireno-acrilonitrila, em formas primárias',
-    '39033010': 'Copolímeros de acrilonitrila-butadieno-estireno',
-    '39033020': 'Copolímeros de acrilonitrila-butadieno-estireno',
-    '39039010': 'Outros polímeros de estireno, em formas primárias',
-    '39039020': 'Outros polímeros de estireno, em formas primárias',
-    '39039090': 'Outros polímeros de estireno, em formas primárias',
-    '39041010': 'Policloreto de vinila, não misturado com outras substâncias, forma primária',
-    '39041020': 'Policloreto de vinila, não misturado com outras substâncias, forma primária',
-    '39041090': 'Policloreto de vinila, não misturado com outras substâncias, forma primária',
-    '39042100': 'Policloreto de vinila, não plastificado, em forma primária',
-    '39042200': 'Policloreto de vinila, plastificado, em forma primária',
-    '39043000': 'Copolímeros de cloreto de vinila e acetato de vinila, formas primárias',
-    '39044090': 'Outros copolímeros de cloreto de vinila, formas primárias',
-    '39045090': 'Polímeros de cloreto vinilideno, formas primárias',
-    '39046110': 'Politetrafluoretileno, em forma primária',
-    '39046190': 'Politetrafluoretileno, em forma primária',
-    '39046910': 'Outros polímeros fluorados, em formas primárias',
-    '39046990': 'Outros polímeros fluorados, em formas primárias',
-    '39049010': 'Outros polímeros de cloreto vinila ou olefinas halogenadas, formas primárias',
-    '39049090': 'Outros polímeros de cloreto vinila ou olefinas halogenadas, formas primárias',
-    '39051200': 'Acetato de polivinila, em dispersão aquosa, em forma primária',
-    '39051910': 'Outros polímeros de acetato de polivinila, formas primárias',
-    '39051990': 'Outros polímeros de acetato de polivinila, formas primárias',
-    '39052100': 'Copolímeros de acetato de vinila, em dispersão aquosa',
-    '39052900': 'Outros copolímeros de acetato de vinila, formas primárias',
-    '39053000': 'Álcool polivinílico, mesmo contendo grupos acetato não hidrolisados, em forma primária',
-    '39059130': 'Outros copolímeros de vinila, em formas primárias',
-    '39059190': 'Outros copolímeros de vinila, em formas primárias',
-    '39059910': 'Outros polímeros de ésteres de vinila e outros polímeros de vinila, em formas primárias',
-    '39059920': 'Outros polímeros de ésteres de vinila e outros polímeros de vinila, em formas primárias',
-    '39059930': 'Outros polímeros de ésteres de vinila e outros polímeros de vinila, em formas primárias',
-    '39059990': 'Outros polímeros de ésteres de vinila e outros polímeros de vinila, em formas primárias',
-    '39061000': 'Polimetacrilato de metila, em forma primária',
-    '39069011': 'Outros polímeros acrílicos, em formas primárias',
-    '39069012': 'Outros polímeros acrílicos, em formas primárias',
-    '39069019': 'Outros polímeros acrílicos, em formas primárias',
-    '39069021': 'Outros polímeros acrílicos, em formas primárias',
-    '39069022': 'Outros polímeros acrílicos, em formas primárias',
-    '39069029': 'Outros polímeros acrílicos, em formas primárias',
-    '39069031': 'Outros polímeros acrílicos, em formas primárias',
-    '39069032': 'Outros polímeros acrílicos, em formas primárias',
-    '39069039': 'Outros polímeros acrílicos, em formas primárias',
-    '39069041': 'Outros polímeros acrílicos, em formas primárias',
-    '39069042': 'Outros polímeros acrílicos, em formas primárias',
-    '39069043': 'Outros polímeros acrílicos, em formas primárias',
-    '39069044': 'Outros polímeros acrílicos, em formas primárias',
-    '39069045': 'Outros polímeros acrílicos, em formas primárias',
-    '39069046': 'Outros polímeros acrílicos, em formas primárias',
-    '39069047': 'Outros polímeros acrílicos, em formas primárias',
-    '39069048': 'Outros polímeros acrílicos, em formas primárias',
-    '39069049': 'Outros polímeros acrílicos, em formas primárias',
-    '39069053': 'Outros polímeros acrílicos, em formas primárias',
-    '39069054': 'Outros polímeros acrílicos, em formas primárias',
-    '39069059': 'Outros polímeros acrílicos, em formas primárias',
-    '39069063': 'Outros polímeros acrílicos, em formas primárias',
-    '39069065': 'Outros polímeros acrílicos, em formas primárias',
-    '39069069': 'Outros polímeros acrílicos, em formas primárias',
-    '39071010': 'Poliacetais, em formas primárias',
-    '39071020': 'Poliacetais, em formas primárias',
-    '39071031': 'Poliacetais, em formas primárias',
-    '39071039': 'Poliacetais, em formas primárias',
-    '39071041': 'Poliacetais, em formas primárias',
-    '39071049': 'Poliacetais, em formas primárias',
-    '39071091': 'Poliacetais, em formas primárias',
-    '39071099': 'Poliacetais, em formas primárias',
-    '39072011': 'Outros poliéteres, em formas primárias',
-    '39072012': 'Outros poliéteres, em formas primárias',
-    '39072020': 'Outros poliéteres, em formas primárias',
-    '39072031': 'Outros poliéteres, em formas primárias',
-    '39072039': 'Outros poliéteres, em formas primárias',
-    '39072042': 'Outros poliéteres, em formas primárias',
-    '39072090': 'Outros poliéteres, em formas primárias',
-    '39072100': 'Metilfosfonato de bis(polioxietileno)',
-    '39072911': 'Outros poliéteres, em formas primárias, não classificados nos códigos anteriores',
-    '39072912': 'Outros poliéteres, em formas primárias, não classificados nos códigos anteriores',
-    '39072920': 'Outros poliéteres, em formas primárias, não classificados nos códigos anteriores',
-    '39072931': 'Outros poliéteres, em formas primárias, não classificados nos códigos anteriores',
-    '39072939': 'Outros poliéteres, em formas primárias, não classificados nos códigos anteriores',
-    '39072942': 'Outros poliéteres, em formas primárias, não classificados nos códigos anteriores',
-    '39072990': 'Outros poliéteres, em formas primárias, não classificados nos códigos anteriores',
-    '39072999': 'Outros poliéteres, em formas primárias, não classificados nos códigos anteriores',
-    '39073011': 'Resinas epóxidas, em formas primárias',
-    '39073019': 'Resinas epóxidas, em formas primárias',
-    '39073021': 'Resinas epóxidas, em formas primárias',
-    '39073022': 'Resinas epóxidas, em formas primárias',
-    '39073029': 'Resinas epóxidas, em formas primárias',
-    '39074010': 'Policarbonatos, em formas primárias',
-    '39074020': 'Policarbonatos, em formas primárias',
-    '39074090': 'Policarbonatos, em formas primárias',
-    '39075010': 'Resinas alquídicas, em formas primárias',
-    '39075090': 'Resinas alquídicas, em formas primárias',
-    '39076100': 'Poli(tereftalato de etileno), de um índice de viscosidade de 78 ml/g ou mais',
-    '39076900': 'Outros poli(tereftalato de etileno)',
-    '39077000': 'Poli (ácido láctico)',
-    '39079100': 'Outros poliésteres, não saturados, em formas primárias',
-    '39079911': 'Outros poliésteres, em formas primárias',
-    '39079912': 'Outros poliésteres, em formas primárias',
-    '39079919': 'Outros poliésteres, em formas primárias',
-    '39079991': 'Outros poliésteres, em formas primárias',
-    '39079992': 'Outros poliésteres, em formas primárias',
-    '39079993': 'Outros poliésteres, em formas primárias',
-    '39079994': 'Outros poliésteres, em formas primárias',
-    '39079995': 'Outros poliésteres, em formas primárias',
-    '39079999': 'Outros poliésteres, em formas primárias',
-    '39081011': 'Poliamidas -6, -11, -12, -6,6, -6,9, -6,10, ou -6,12, em forma primária',
-    '39081013': 'Poliamidas -6, -11, -12, -6,6, -6,9, -6,10, ou -6,12, em forma primária',
-    '39081014': 'Poliamidas -6, -11, -12, -6,6, -6,9, -6,10, ou -6,12, em forma primária',
-    '39081019': 'Poliamidas -6, -11, -12, -6,6, -6,9, -6,10, ou -6,12, em forma primária',
-    '39081021': 'Poliamidas -6, -11, -12, -6,6, -6,9, -6,10, ou -6,12, em forma primária',
-    '39081022': 'Poliamidas -6, -11, -12, -6,6, -6,9, -6,10, ou -6,12, em forma primária',
-    '39081023': 'Poliamidas -6, -11, -12, -6,6, -6,9, -6,10, ou -6,12, em forma primária',
-    '39081024': 'Poliamidas -6, -11, -12, -6,6, -6,9, -6,10, ou -6,12, em forma primária',
-    '39081025': 'Poliamidas -6, -11, -12, -6,6, -6,9, -6,10, ou -6,12, em forma primária',
-    '39081026': 'Poliamidas -6, -11, -12, -6,6, -6,9, -6,10, ou -6,12, em forma primária',
-    '39081029': 'Poliamidas -6, -11, -12, -6,6, -6,9, -6,10, ou -6,12, em forma primária',
-    '39089010': 'Outras poliamidas, em formas primárias',
-    '39089020': 'Outras poliamidas, em formas primárias',
-    '39089090': 'Outras poliamidas, em formas primárias',
-    '39091000': 'Resinas uréicas; resinas de tiouréia, em formas primárias',
-    '39092011': 'Resinas melamínicas, em formas primárias',
-    '39092019': 'Resinas melamínicas, em formas primárias',
-    '39092021': 'Resinas melamínicas, em formas primárias',
-    '39092029': 'Resinas melamínicas, em formas primárias',
-    '39093100': 'Poli(isocianato de fenil metileno) (MDI bruto, MDI polimérico)',
-    '39093900': 'Outras resinas amínicas',
-    '39094011': 'Resinas fenólicas, em formas primárias',
-    '39094019': 'Resinas fenólicas, em formas primárias',
-    '39094091': 'Resinas fenólicas, em formas primárias',
-    '39094099': 'Resinas fenólicas, em formas primárias',
-    '39095011': 'Poliuretanos, em formas primárias',
-    '39095012': 'Poliuretanos, em formas primárias',
-    '39095019': 'Poliuretanos, em formas primárias',
-    '39095021': 'Poliuretanos, em formas primárias',
-    '39095029': 'Poliuretanos, em formas primárias',
-    '39100011': 'Silicones, em formas primárias',
-    '39100012': 'Silicones, em formas primárias',
-    '39100013': 'Silicones, em formas primárias',
-    '39100019': 'Silicones, em formas primárias',
-    '39100021': 'Silicones, em formas primárias',
-    '39100029': 'Silicones, em formas primárias',
-    '39100030': 'Silicones, em formas primárias',
-    '39100090': 'Silicones, em formas primárias',
-    '39111010': 'Resinas de petróleo, de cumarona, de indeno, de cumarona-indeno e politerpenos, em formas primárias',
-    '39111021': 'Resinas de petróleo, de cumarona, de indeno, de cumarona-indeno e politerpenos, em formas primárias',
-    '39111029': 'Resinas de petróleo, de cumarona, de indeno, de cumarona-indeno e politerpenos, em formas primárias',
-    '39112000': 'Poli(1,3-fenilenometilfosfonato)',
-    '39119011': 'Outros politerpenos, polissulfetos, polissulfonas, em formas primárias',
-    '39119014': 'Outros politerpenos, polissulfetos, polissulfonas, em formas primárias',
-    '39119019': 'Outros politerpenos, polissulfetos, polissulfonas, em formas primárias',
-    '39119022': 'Outros politerpenos, polissulfetos, polissulfonas, em formas primárias',
-    '39119023': 'Outros politerpenos, polissulfetos, polissulfonas, em formas primárias',
-    '39119024': 'Outros politerpenos, polissulfetos, polissulfonas, em formas primárias',
-    '39119025': 'Outros politerpenos, polissulfetos, polissulfonas, em formas primárias',
-    '39119026': 'Outros politerpenos, polissulfetos, polissulfonas, em formas primárias',
-    '39119029': 'Outros politerpenos, polissulfetos, polissulfonas, em formas primárias',
-    '39121110': 'Acetato de celulose, não plastificado, forma primária',
-    '39121120': 'Acetato de celulose, não plastificado, forma primária',
-    '39121200': 'Acetato de celulose, plastificado, em forma primária',
-    '39122021': 'Nitrato de celulose, em forma primária',
-    '39122029': 'Nitrato de celulose, em forma primária',
-    '39123111': 'Carboximetilcelulose e seus sais, em formas primárias',
-    '39123119': 'Carboximetilcelulose e seus sais, em formas primárias',
-    '39123121': 'Carboximetilcelulose e seus sais, em formas primárias',
-    '39123129': 'Carboximetilcelulose e seus sais, em formas primárias',
-    '39123910': 'Outros éteres de celulose, em formas primárias',
-    '39123920': 'Outros éteres de celulose, em formas primárias',
-    '39123930': 'Outros éteres de celulose, em formas primárias',
-    '39123990': 'Outros éteres de celulose, em formas primárias',
-    '39129020': 'Outros celuloses e seus derivados químicos, em formas primárias',
-    '39129031': 'Outros celuloses e seus derivados químicos, em formas primárias',
-    '39129039': 'Outros celuloses e seus derivados químicos, em formas primárias',
-    '39129040': 'Outros celuloses e seus derivados químicos, em formas primárias',
-    '39129090': 'Outros celuloses e seus derivados químicos, em formas primárias',
-    '39131000': 'Ácido algínico, seus sais e ésteres, em forma primária',
-    '39139011': 'Outros polímeros naturais, inclusive modificados, em formas primárias',
-    '39139012': 'Outros polímeros naturais, inclusive modificados, em formas primárias',
-    '39139019': 'Outros polímeros naturais, inclusive modificados, em formas primárias',
-    '39139020': 'Outros polímeros naturais, inclusive modificados, em formas primárias',
-    '39139030': 'Outros polímeros naturais, inclusive modificados, em formas primárias',
-    '39139050': 'Outros polímeros naturais, inclusive modificados, em formas primárias',
-    '39139060': 'Outros polímeros naturais, inclusive modificados, em formas primárias',
-    '39139090': 'Outros polímeros naturais, inclusive modificados, em formas primárias',
-    '39140011': 'Permutadores de íons à base de polímeros, em formas primárias',
-    '39140019': 'Permutadores de íons à base de polímeros, em formas primárias',
-    '39140090': 'Permutadores de íons à base de polímeros, em formas primárias',
-    '39151000': 'Desperdícios, resíduos e aparas, de polímeros de etileno',
-    '39152000': 'Desperdícios, resíduos e aparas, de polímeros de estireno',
-    '39153000': 'Desperdícios, resíduos, e aparas de polímeros de cloreto de vinila',
-    '39159000': 'Desperdícios, resíduos e aparas, de outros plásticos',
-    '39161000': 'Monofilamentos cuja maior dimensão do corte transversal seja > 1 mm, varas, bastões e perfis de polímeros de etileno, mesmo trabalhados à superfície',
-    '39162000': 'Monofilamentos cuja maior dimensão do corte transversal seja > 1 mm, varas, bastões e perfis de polímeros de cloreto de vinila, mesmo trabalhados à superfície',
-    '39169010': 'Monofilamentos cuja maior dimensão do corte transversal seja > 1 mm, varas, bastões e perfis de polímeros de outros plásticos, mesmo trabalhados à superfície',
-    '39169090': 'Monofilamentos cuja maior dimensão do corte transversal seja > 1 mm, varas, bastões e perfis de polímeros de outros plásticos, mesmo trabalhados à superfície',
-    '39171010': 'Tripas artificiais de proteínas endurecidas ou de plásticos celulósicos',
-    '39171021': 'Tripas artificiais de proteínas endurecidas ou de plásticos celulósicos',
-    '39171029': 'Tripas artificiais de proteínas endurecidas ou de plásticos celulósicos',
-    '39172100': 'Tubos rígidos, de polímeros de etileno, inclusive com acessórios',
-    '39172200': 'Tubos rígidos, de polímeros de propileno, inclusive com acessórios',
-    '39172210': 'Tubos rígidos, de polímeros de propileno, inclusive com acessórios',
-    '39172290': 'Tubos rígidos, de polímeros de propileno, inclusive com acessórios',
-    '39172300': 'Tubos rígidos, de polímeros de cloreto de vinila, inclusive com acessórios',
-    '39172900': 'Tubos rígidos, de outros plásticos, inclusive com acessórios',
-    '39173100': 'Tubos flexíveis, de plásticos, para suportar pressão => 27,6 MPa, inclusive com acessórios',
-    '39173210': 'Outros tubos flexíveis de plástico, não reforçados, sem acessórios',
-    '39173221': 'Outros tubos flexíveis de plástico, não reforçados, sem acessórios',
-    '39173229': 'Outros tubos flexíveis de plástico, não reforçados, sem acessórios',
-    '39173230': 'Outros tubos flexíveis de plástico, não reforçados, sem acessórios',
-    '39173240': 'Outros tubos flexíveis de plástico, não reforçados, sem acessórios',
-    '39173251': 'Outros tubos flexíveis de plástico, não reforçados, sem acessórios',
-    '39173259': 'Outros tubos flexíveis de plástico, não reforçados, sem acessórios',
-    '39173290': 'Outros tubos flexíveis de plástico, não reforçados, sem acessórios',
-    '39173300': 'Tubos flexíveis de plásticos, não reforçados, com acessórios',
-    '39173900': 'Outros tubos flexíveis de plástico, inclusive com acessórios',
-    '39174010': 'Acessórios para tubos de plástico',
-    '39174090': 'Acessórios para tubos de plástico',
-    '39181000': 'Revestimentos de pavimentos, paredes ou tetos, de polímeros de cloreto vinila',
-    '39189000': 'Revestimentos de pavimentos, paredes ou tetos, de outros plásticos',
-    '39191010': 'Chapas, folhas, tiras, fitas e outras formas planas, de plásticos, auto-adesivas, em rolos de largura <= 20 cm',
-    '39191020': 'Chapas, folhas, tiras, fitas e outras formas planas, de plásticos, auto-adesivas, em rolos de largura <= 20 cm',
-    '39191090': 'Chapas, folhas, tiras, fitas e outras formas planas, de plásticos, auto-adesivas, em rolos de largura <= 20 cm',
-    '39199010': 'Chapas, folhas, tiras, fitas, películas e outras formas planas, de plásticos, auto-adesivas',
-    '39199020': 'Chapas, folhas, tiras, fitas, películas e outras formas planas, de plásticos, auto-adesivas',
-    '39199090': 'Chapas, folhas, tiras, fitas, películas e outras formas planas, de plásticos, auto-adesivas',
-    '39201010': 'Chapas, folhas, tiras, fitas, películas, de polímeros de etileno, sem suporte, não reforçadas',
-    '39201091': 'Chapas, folhas, tiras, fitas, películas, de polímeros de etileno, sem suporte, não reforçadas',
-    '39201099': 'Chapas, folhas, tiras, fitas, películas, de polímeros de etileno, sem suporte, não reforçadas',
-    '39202011': 'Chapas, folhas, tiras, fitas, películas, de polímeros de propileno, sem suporte, não reforçadas',
-    '39202012': 'Chapas, folhas, tiras, fitas, películas, de polímeros de propileno, sem suporte, não reforçadas',
-    '39202019': 'Chapas, folhas, tiras, fitas, películas, de polímeros de propileno, sem suporte, não reforçadas',
-    '39202090': 'Chapas, folhas, tiras, fitas, películas, de polímeros de propileno, sem suporte, não reforçadas',
-    '39203000': 'Chapas, folhas, tiras, fitas, películas, de polímeros de estireno, sem suporte, não reforçadas',
-    '39204310': 'Chapas, folhas, tiras, fitas, películas, de polímeros de cloreto de vinila, com conteúdo de plastificante => 6% em peso, sem suporte, não reforçadas',
-    '39204390': 'Chapas, folhas, tiras, fitas, películas, de polímeros de cloreto de vinila, com conteúdo de plastificante => 6% em peso, sem suporte, não reforçadas',
-    '39204900': 'Outras chapas, folhas, tiras, fitas, películas, de polímeros de cloreto de vinila, sem suporte, não reforçadas',
-    '39205100': 'Chapas, folhas, tiras, fitas, películas, de polimetacrilato de metila, sem suporte, não reforçadas',
-    '39205900': 'Chapas, folhas, tiras, fitas, películas de outros polímeros acrílicos, sem suporte, não reforçadas',
-    '39206100': 'Chapas, folhas, tiras, fitas, películas, de policarbonatos, sem suporte, não reforçadas',
-    '39206211': 'Chapas, folhas, tiras, fitas, películas, de poli(tereftalato de etileno), sem suporte, não reforçadas',
-    '39206219': 'Chapas, folhas, tiras, fitas, películas, de poli(tereftalato de etileno), sem suporte, não reforçadas',
-    '39206291': 'Chapas, folhas, tiras, fitas, películas, de poli(tereftalato de etileno), sem suporte, não reforçadas',
-    '39206299': 'Chapas, folhas, tiras, fitas, películas, de poli(tereftalato de etileno), sem suporte, não reforçadas',
-    '39206300': 'Chapas, folhas, tiras, fitas, películas de poliésteres não saturados, sem suporte, não reforçadas',
-    '39206900': 'Chapas, folhas, tiras, fitas, películas, de outros poliésteres, sem suporte, não reforçadas',
-    '39207100': 'Chapas, folhas, tiras, fitas, películas, de celulose regenerada, sem suporte, não reforçadas',
-    '39207310': 'Chapas, folhas, tiras, fitas, películas, de acetatos de celulose, sem suporte, não reforçadas',
-    '39207390': 'Chapas, folhas, tiras, fitas, películas, de acetatos de celulose, sem suporte, não reforçadas',
-    '39207910': 'Chapas, folhas, tiras, fitas, películas, de outros derivados de celulose, sem suporte, não reforçadas',
-    '39207990': 'Chapas, folhas, tiras, fitas, películas, de outros derivados de celulose, sem suporte, não reforçadas',
-    '39209100': 'Chapas, folhas, tiras, fitas, películas, de poli(butiral de vinila), sem suporte, não reforçadas',
-    '39209200': 'Chapas, folhas, tiras, fitas, películas, de poliamidas, sem suporte, não reforçadas',
-    '39209300': 'Chapas, folhas, tiras, fitas, películas, de resinas amínicas, sem suporte, não reforçadas',
-    '39209400': 'Chapas, folhas, tiras, fitas, películas, de resinas fenólicas, sem suporte, não reforçadas',
-    '39209910': 'Chapas, folhas, tiras, fitas, películas, de outros plásticos, sem suporte, não reforçadas',
-    '39209920': 'Chapas, folhas, tiras, fitas, películas, de outros plásticos, sem suporte, não reforçadas',
-    '39209930': 'Chapas, folhas, tiras, fitas, películas, de outros plásticos, sem suporte, não reforçadas',
-    '39209940': 'Chapas, folhas, tiras, fitas, películas, de outros plásticos, sem suporte, não reforçadas',
-    '39209950': 'Chapas, folhas, tiras, fitas, películas, de outros plásticos, sem suporte, não reforçadas',
-    '39209990': 'Chapas, folhas, tiras, fitas, películas, de outros plásticos, sem suporte, não reforçadas',
-    '39211100': 'Chapas, folhas, tiras, fitas, películas, de polímeros de estireno, alveolares',
-    '39211200': 'Chapas, folhas, tiras, fitas, películas, de polímeros de cloreto vinila, alveolares',
-    '39211310': 'Chapas, folhas, tiras, fitas, películas, de poliuretanos, alveolares',
-    '39211390': 'Chapas, folhas, tiras, fitas, películas, de poliuretanos, alveolares',
-    '39211400': 'Chapas, folhas, tiras, fitas, películas, de celulose regenerada, alveolares',
-    '39211900': 'Chapas, folhas, tiras, fitas, películas, de outros plásticos, alveolares',
-    '39219011': 'Outras chapas, folhas, películas, tiras, lâminas, de plásticos',
-    '39219012': 'Outras chapas, folhas, películas, tiras, lâminas, de plásticos',
-    '39219013': 'Outras chapas, folhas, películas, tiras, lâminas, de plásticos',
-    '39219019': 'Outras chapas, folhas, películas, tiras, lâminas, de plásticos',
-    '39219020': 'Outras chapas, folhas, películas, tiras, lâminas, de plásticos',
-    '39219090': 'Outras chapas, folhas, películas, tiras, lâminas, de plásticos',
-    '39221000': 'Banheiras, banheiras para duchas, pias e lavatórios, de plásticos',
-    '39222000': 'Assentos e tampas de sanitários, de plásticos',
-    '39229000': 'Outros artigos para usos sanitários ou higiênicos, de plásticos',
-    '39231010': 'Caixas, caixotes, engradados, artigos semelhantes, de plásticos',
-    '39231090': 'Caixas, caixotes, engradados, artigos semelhantes, de plásticos',
-    '39232110': 'Sacos, bolsas, cartuchos, de polímeros de etileno',
-    '39232190': 'Sacos, bolsas, cartuchos, de polímeros de etileno',
-    '39232910': 'Sacos, bolsas e cartuchos, de outros plásticos',
-    '39232990': 'Sacos, bolsas e cartuchos, de outros plásticos',
-    '39233000': 'Garrafões, garrafas, frascos, artigos semelhantes, de plásticos',
-    '39233010': 'Garrafões, garrafas, frascos, artigos semelhantes, de plásticos',
-    '39233090': 'Garrafões, garrafas, frascos, artigos semelhantes, de plásticos',
-    '39234000': 'Bobinas, carretéis e suportes semelhantes, de plásticos',
-    '39235000': 'Rolhas, tampas, cápsulas e outros dispositivos para fechar recipientes, de plástico',
-    '39239000': 'Outros artigos de transporte ou de embalagem, de plásticos',
-    '39239010': 'Outros artigos de transporte ou de embalagem, de plásticos',
-    '39239090': 'Outros artigos de transporte ou de embalagem, de plásticos',
-    '39241000': 'Serviços de mesa e outros artigos de mesa ou cozinha, de plásticos',
-    '39249000': 'Outros artigos de higiene ou de toucador, de plásticos',
-    '39251000': 'Reservatórios, cisternas, cubas e recipientes análogos, de plásticos, com capacidade > 300 litros',
-    '39252000': 'Portas, janelas, seus caixilhos, alizares e soleiras, de plásticos',
-    '39253000': 'Postigos, estores e artefatos semelhantes e suas partes, de plásticos',
-    '39259010': 'Outros artefatos para apetrechamento de construções, de plásticos',
-    '39259090': 'Outros artefatos para apetrechamento de construções, de plásticos',
-    '39261000': 'Artigos de escritório e artigos escolares, de plásticos',
-    '39262000': 'Vestuário e seus acessórios, inclusive luvas, mitenes e semelhantes, de plásticos',
-    '39263000': 'Guarnições para móveis, carroçarias ou semelhantes, de plásticos',
-    '39264000': 'Estatuetas e outros objetos de ornamentação, de plásticos',
-    '39269010': 'Outras obras de plásticos e obras de outras matérias das posições 3901 a 3904',
-    '39269021': 'Outras obras de plásticos e obras de outras matérias das posições 3901 a 3904',
-    '39269022': 'Outras obras de plásticos e obras de outras matérias das posições 3901 a 3904',
-    '39269030': 'Outras obras de plásticos e obras de outras matérias das posições 3901 a 3904',
-    '39269040': 'Outras obras de plásticos e obras de outras matérias das posições 3901 a 3904',
-    '39269050': 'Outras obras de plásticos e obras de outras matérias das posições 3901 a 3904',
-    '39269061': 'Outras obras de plásticos e obras de outras matérias das posições 3901 a 3904',
-    '39269069': 'Outras obras de plásticos e obras de outras matérias das posições 3901 a 3904',
-    '39269090': 'Outras obras de plásticos e obras de outras matérias das posições 3901 a 3904',
-    '40011000': 'Látex de borracha natural, mesmo pré-vulcanizado',
-    '40012100': 'Borracha natural em folhas fumadas',
-    '40012200': 'Borracha natural tecnicamente especificada (TSNR)',
-    '40012910': 'Borracha natural, em formas primárias ou em chapas, folhas ou tiras',
-    '40012920': 'Borracha natural, em formas primárias ou em chapas, folhas ou tiras',
-    '40012990': 'Borracha natural, em formas primárias ou em chapas, folhas ou tiras',
-    '40013000': 'Balata, guta-percha, guaiúle, chicle e gomas naturais análogas',
-    '40021110': 'Látex de borracha sintética ou artificial',
-    '40021120': 'Látex de borracha sintética ou artificial',
-    '40021911': 'Outras borrachas de estireno-butadieno ou de estireno-butadieno-carboxiladas, em formas primárias ou em chapas, folhas ou tiras',
-    '40021912': 'Outras borrachas de estireno-butadieno ou de estireno-butadieno-carboxiladas, em formas primárias ou em chapas, folhas ou tiras',
-    '40021919': 'Outras borrachas de estireno-butadieno ou de estireno-butadieno-carboxiladas, em formas primárias ou em chapas, folhas ou tiras',
-    '40021920': 'Outras borrachas de estireno-butadieno ou de estireno-butadieno-carboxiladas, em formas primárias ou em chapas, folhas ou tiras',
-    '40022090': 'Borracha de butadieno (BR), em formas primárias ou em chapas, folhas ou tiras',
-    '40022091': 'Borracha de butadieno (BR), em formas primárias ou em chapas, folhas ou tiras',
-    '40022099': 'Borracha de butadieno (BR), em formas primárias ou em chapas, folhas ou tiras',
-    '40023100': 'Borracha de isobuteno-isopreno (butila) (IIR),em formas primárias ou em chapas, folhas ou tiras',
-    '40023900': 'Borracha de isobuteno-isopreno halogenada (CIIR ou BIIR), em formas primárias ou em chapas, folhas ou tiras',
-    '40024100': 'Látex de borracha de cloropreno (clorobutadieno) (CR)',
-    '40024900': 'Borracha de cloropreno (clorobutadieno), em formas primárias ou em chapas, folhas ou tiras',
-    '40025100': 'Látex de borracha de acrilonitrila-butadieno (NBR)',
-    '40025900': 'Borracha de acrilonitrila-butadieno (NBR), em formas primárias ou em chapas, folhas ou tiras',
-    '40026000': 'Borracha de isopreno (IR) em formas primárias ou em chapas, folhas ou tiras',
-    '40027000': 'Borracha de etileno-propileno-dieno (EPDM) não conjugada, em formas primárias ou em chapas, folhas ou tiras',
-    '40028000': 'Misturas de borracha natural com borracha sintética ou artificial, em formas primárias ou em chapas, folhas ou tiras',
-    '40029100': 'Látex de outras borrachas sintéticas ou artificiais',
-    '40029910': 'Outras borrachas sintéticas e artificiais, em formas primárias ou em chapas, folhas ou tiras',
-    '40029920': 'Outras borrachas sintéticas e artificiais, em formas primárias ou em chapas, folhas ou tiras',
-    '40029930': 'Outras borrachas sintéticas e artificiais, em formas primárias ou em chapas, folhas ou tiras',
-    '40029990': 'Outras borrachas sintéticas e artificiais, em formas primárias ou em chapas, folhas ou tiras',
-    '40030000': 'Borracha regenerada, em formas primárias ou em chapas, folhas ou tiras',
-    '40040000': 'Desperdícios, resíduos e aparas, de borracha não endurecida',
-    '40051010': 'Borracha, não vulcanizada, adicionada de negro de fumo ou de sílica, em formas primárias ou em chapas, folhas ou tiras',
-    '40051090': 'Borracha, não vulcanizada, adicionada de negro de fumo ou de sílica, em formas primárias ou em chapas, folhas ou tiras',
-    '40052000': 'Borracha misturada, não vulcanizada, em soluções ou dispersões',
-    '40059110': 'Outras borrachas misturadas, não vulcanizadas, em chapas, folhas ou tiras',
-    '40059190': 'Outras borrachas misturadas, não vulcanizadas, em chapas, folhas ou tiras',
-    '40059910': 'Outras borrachas misturadas, não vulcanizadas, em formas primárias',
-    '40059990': 'Outras borrachas misturadas, não vulcanizadas, em formas primárias',
-    '40061000': 'Perfis para recauchutagem, de borracha não vulcanizada',
-    '40069000': 'Outras formas e artigos, de borracha não vulcanizada',
-    '40070011': 'Fios e cordas, de borracha vulcanizada',
-    '40070019': 'Fios e cordas, de borracha vulcanizada',
-    '40070020': 'Fios e cordas, de borracha vulcanizada',
-    '40081100': 'Chapas, folhas e tiras, de borracha vulcanizada alveolar não endurecida',
-    '40081900': 'Varetas e perfis, de borracha vulcanizada alveolar não endurecida',
-    '40082100': 'Chapas, folhas e tiras de borracha vulcanizada não alveolar, não endurecida',
-    '40082900': 'Varetas e perfis de borracha vulcanizada não alveolar, não endurecida',
-    '40091100': 'Tubos de borracha vulcanizada não endurecida, não reforçados com outras matérias, sem acessórios',
-    '40091210': 'Tubos de borracha vulcanizada não endurecida, não reforçados com outras matérias, com acessórios',
-    '40091290': 'Tubos de borracha vulcanizada não endurecida, não reforçados com outras matérias, com acessórios',
-    '40092110': 'Tubos de borracha vulcanizada não endurecida, reforçados ou associados apenas com metal, sem acessórios',
-    '40092190': 'Tubos de borracha vulcanizada não endurecida, reforçados ou associados apenas com metal, sem acessórios',
-    '40092210': 'Tubos de borracha vulcanizada não endurecida, reforçados ou associados apenas com metal, com acessórios',
-    '40092290': 'Tubos de borracha vulcanizada não endurecida, reforçados ou associados apenas com metal, com acessórios',
-    '40093100': 'Tubos de borracha vulcanizada não endurecida, reforçados ou associados apenas com matérias têxteis, sem acessórios',
-    '40093210': 'Tubos de borracha vulcanizada não endurecida, reforçados ou associados apenas com matérias têxteis, com acessórios',
-    '40093290': 'Tubos de borracha vulcanizada não endurecida, reforçados ou associados apenas com matérias têxteis, com acessórios',
-    '40094100': 'Tubos de borracha vulcanizada não endurecida, reforçados ou associados apenas com outras matérias, sem acessórios',
-    '40094210': 'Tubos de borracha vulcanizada não endurecida, reforçados ou associados apenas com outras matérias, com acessórios',
-    '40094290': 'Tubos de borracha vulcanizada não endurecida, reforçados ou associados apenas com outras matérias, com acessórios',
-    '40101100': 'Correia transportadora de borracha vulcanizada reforçada apenas com metal',
-    '40101200': 'Correia transportadora de borracha vulcanizada reforçada apenas com matérias têxteis',
-    '40101900': 'Outras correias transportadoras, de borracha vulcanizada',
-    '40103100': 'Correias de transmissão sem fim, de borracha vulcanizada, de seção trapezoidal, estriadas, com uma circunferência externa > 60 cm e <= 180 cm',
-    '40103200': 'Correias de transmissão sem fim, de borracha vulcanizada, de seção trapezoidal, não estriadas, com uma circunferência externa > 60 cm e <= 180 cm',
-    '40103300': 'Correias de transmissão sem fim, de borracha vulcanizada, de seção trapezoidal, estriadas, com uma circunferência externa > 180 cm e <= 240 cm',
-    '40103400': 'Correias de transmissão sem fim, de borracha vulcanizada, de seção trapezoidal, não estriadas, com uma circunferência externa > 180 cm e <= 240 cm',
-    '40103500': 'Correias de transmissão sem fim, de borracha vulcanizada, síncronas, com uma circunferência externa > 60 cm e <= 150 cm',
-    '40103600': 'Correias de transmissão sem fim, de borracha vulcanizada, síncronas, com uma circunferência externa > 150 cm e <= 198 cm',
-    '40103900': 'Outras correias de transmissão, de borracha vulcanizada',
-    '40111000': 'Pneus novos de borracha dos tipos utilizados em automóveis de passageiros',
-    '40112010': 'Pneus novos de borracha dos tipos utilizados em ônibus ou caminhões',
-    '40112090': 'Pneus novos de borracha dos tipos utilizados em ônibus ou caminhões',
-    '40113000': 'Pneus novos de borracha dos tipos utilizados em aviões',
-    '40114000': 'Pneus novos de borracha dos tipos utilizados em motocicletas',
-    '40115000': 'Pneus novos de borracha dos tipos utilizados em bicicletas',
-    '40117010': 'Pneumáticos novos, de borracha, do tipo utilizado em veículos e máquinas agrícolas ou florestais',
-    '40117090': 'Pneumáticos novos, de borracha, do tipo utilizado em veículos e máquinas agrícolas ou florestais',
-    '40118010': 'Pneumáticos novos, de borracha, do tipo utilizado em veículos e máquinas para a construção civil, de mineração e de manutenção industrial',
-    '40118020': 'Pneumáticos novos, de borracha, do tipo utilizado em veículos e máquinas para a construção civil, de mineração e de manutenção industrial',
-    '40118090': 'Pneumáticos novos, de borracha, do tipo utilizado em veículos e máquinas para a construção civil, de mineração e de manutenção industrial',
-    '40119010': 'Outros pneumáticos novos, de borracha',
-    '40119090': 'Outros pneumáticos novos, de borracha',
-    '40121100': 'Pneus recauchutados, dos tipos utilizados em automóveis de passageiros (incluídos os veículos de uso misto e automóveis de corrida)',
-    '40121200': 'Pneus recauchutados, dos tipos utilizados em ônibus e caminhões',
-    '40121300': 'Pneus recauchutados, dos tipos utilizados em veículos aéreos',
-    '40121900': 'Outros pneus recauchutados',
-    '40122000': 'Pneus usados de borracha',
-    '40129010': 'Flaps, protetores, bandas de rodagem, para pneus de borracha',
-    '40129090': 'Flaps, protetores, bandas de rodagem, para pneus de borracha',
-    '40131010': 'Câmaras-de-ar de borracha, dos tipos utilizados em automóveis de passageiros, ônibus ou caminhões',
-    '40131090': 'Câmaras-de-ar de borracha, dos tipos utilizados em automóveis de passageiros, ônibus ou caminhões',
-    '40132000': 'Câmaras-de-ar de borracha, dos tipos utilizados em pneus de bicicletas',
-    '40139000': 'Outras câmaras-de-ar de borracha',
-    '40141000': 'Preservativos de borracha vulcanizada, não endurecida',
-    '40149010': 'Outros artigos de higiene ou de farmácia, de borracha vulcanizada não endurecida, mesmo com partes de borracha endurecida',
-    '40149090': 'Outros artigos de higiene ou de farmácia, de borracha vulcanizada não endurecida, mesmo com partes de borracha endurecida',
-    '40151100': 'Luvas para cirurgia, de borracha vulcanizada, não endurecida',
-    '40151200': 'Artigos de vestuário e acessórios de vestuário (incluindo luvas, mitenes), para todos os fins, de borracha vulcanizada que não seja de borracha dura, do tipo utilizado para fins médicos, cirúrgicos, odontológicos ou veterinários',
-    '40151900': 'Outras luvas de borracha vulcanizada, não endurecida',
-    '40159000': 'Outros vestuários e acessórios, de borracha vulcanizada não endurecida',
-    '40161010': 'Obras de borracha vulcanizada alveolar não endurecida',
-    '40161090': 'Obras de borracha vulcanizada alveolar não endurecida',
-    '40169100': 'Revestimentos para pavimentos e capachos, de borracha vulcanizada não endurecida',
-    '40169200': 'Borrachas de apagar, de borracha vulcanizada não endurecida',
-    '40169300': 'Juntas, gaxetas e semelhantes de borracha vulcanizada não endurecida',
-    '40169400': 'Defensas, mesmo infláveis, para atracação de embarcações, de borracha vulcanizada não endurecida',
-    '40169510': 'Artigos infláveis de salvamento e outros artigos infláveis, de borracha vulcanizada não endurecida',
-    '40169590': 'Artigos infláveis de salvamento e outros artigos infláveis, de borracha vulcanizada não endurecida',
-    '40169910': 'Outras obras de borracha vulcanizada, não endurecida',
-    '40169990': 'Outras obras de borracha vulcanizada, não endurecida',
-    '40170000': 'Borracha endurecida; obras de borracha endurecida',
-    '41012000': 'Couros e peles de bovinos ou de eqüídeos, inteiros, de peso <= 8 kg quando secas, <= 10 kg quando salgadas-secas e <= 16 kg quando frescas, salgadas-úmidas ou conservadas de outro modo',
-    '41015010': 'Couros e peles de bovinos ou de eqüídeos, inteiros, de peso unitário > 16 kg',
-    '41015020': 'Couros e peles de bovinos ou de eqüídeos, inteiros, de peso unitário > 16 kg',
-    '41015030': 'Couros e peles de bovinos ou de eqüídeos, inteiros, de peso unitário > 16 kg',
-    '41019010': 'Outros couros e peles de bovinos ou de eqüídeos, incluídos os dorsos, meios-dorsos e flancos',
-    '41019020': 'Outros couros e peles de bovinos ou de eqüídeos, incluídos os dorsos, meios-dorsos e flancos',
-    '41019030': 'Outros couros e peles de bovinos ou de eqüídeos, incluídos os dorsos, meios-dorsos e flancos',
-    '41022900': 'Outras peles em bruto, de ovinos, depiladas ou sem lã',
-    '41032000': 'Peles em bruto, de répteis',
-    '41033000': 'Couros e peles de suínos, em bruto, mesmo depilados ou divididos',
-    '41039000': 'Couros e peles em bruto, de outros animais, mesmo depilados ou divididos',
-    '41041111': 'Couros e peles curtidos, de bovinos ou de eqüídeos, depilados, no estado úmido (incluindo wet blue), plena flor, não divididos; divididos, com a flor',
-    '41041113': 'Couros e peles curtidos, de bovinos ou de eqüídeos, depilados, no estado úmido (incluindo wet blue), plena flor, não divididos; divididos, com a flor',
-    '41041114': 'Couros e peles curtidos, de bovinos ou de eqüídeos, depilados, no estado úmido (incluindo wet blue), plena flor, não divididos; divididos, com a flor',
-    '41041119': 'Couros e peles curtidos, de bovinos ou de eqüídeos, depilados, no estado úmido (incluindo wet blue), plena flor, não divididos; divididos, com a flor',
-    '41041121': 'Couros e peles curtidos, de bovinos ou de eqüídeos, depilados, no estado úmido (incluindo wet blue), plena flor, não divididos; divididos, com a flor',
-    '41041122': 'Couros e peles curtidos, de bovinos ou de eqüídeos, depilados, no estado úmido (incluindo wet blue), plena flor, não divididos; divididos, com a flor',
-    '41041123': 'Couros e peles curtidos, de bovinos ou de eqüídeos, depilados, no estado úmido (incluindo wet blue), plena flor, não divididos; divididos, com a flor',
-    '41041124': 'Couros e peles curtidos, de bovinos ou de eqüídeos, depilados, no estado úmido (incluindo wet blue), plena flor, não divididos; divididos, com a flor',
-    '41041129': 'Couros e peles curtidos, de bovinos ou de eqüídeos, depilados, no estado úmido (incluindo wet blue), plena flor, não divididos; divididos, com a flor',
-    '41041910': 'Outros couros e peles curtidos, de bovinos ou de equídeos, depilados, no estado úmido (incluindo wet blue)',
-    '41041920': 'Outros couros e peles curtidos, de bovinos ou de equídeos, depilados, no estado úmido (incluindo wet blue)',
-    '41041930': 'Outros couros e peles curtidos, de bovinos ou de equídeos, depilados, no estado úmido (incluindo wet blue)',
-    '41041940': 'Outros couros e peles curtidos, de bovinos ou de equídeos, depilados, no estado úmido (incluindo wet blue)',
-    '41041990': 'Outros couros e peles curtidos, de bovinos ou de equídeos, depilados, no estado úmido (incluindo wet blue)',
-    '41044110': 'Couros e peles curtidos, de bovinos ou de eqüídeos, depilados, no estado seco (crust), plena flor; não divididos; divididos, com a flor',
-    '41044120': 'Couros e peles curtidos, de bovinos ou de eqüídeos, depilados, no estado seco (crust), plena flor; não divididos; divididos, com a flor',
-    '41044130': 'Couros e peles curtidos, de bovinos ou de eqüídeos, depilados, no estado seco (crust), plena flor; não divididos; divididos, com a flor',
-    '41044190': 'Couros e peles curtidos, de bovinos ou de eqüídeos, depilados, no estado seco (crust), plena flor; não divididos; divididos, com a flor',
-    '41044910': 'Outros couros e peles curtidos, de bovinos ou de equídeos, depilados, no estado seco (crust)',
-    '41044920': 'Outros couros e peles curtidos, de bovinos ou de equídeos, depilados, no estado seco (crust)',
-    '41044990': 'Outros couros e peles curtidos, de bovinos ou de equídeos, depilados, no estado seco (crust)',
-    '41051010': 'Peles de ovinos, depiladas, mesmo divididas, no estado úmido (incluindo wet blue)',
-    '41051021': 'Peles de ovinos, depiladas, mesmo divididas, no estado úmido (incluindo wet blue)',
-    '41051029': 'Peles de ovinos, depiladas, mesmo divididas, no estado úmido (incluindo wet blue)',
-    '41053000': 'Peles depiladas de ovinos, mesmo divididas, no estado seco (crust)',
-    '41062110': 'Couros e peles depilados de caprinos, mesmo divididos, no estado úmido (incluindo wet blue)',
-    '41062121': 'Couros e peles depilados de caprinos, mesmo divididos, no estado úmido (incluindo wet blue)',
-    '41062190': 'Couros e peles depilados de caprinos, mesmo divididos, no estado úmido (incluindo wet blue)',
-    '41062200': 'Couros e peles depilados de caprinos, mesmo divididos, no estado seco (crust)',
-    '41063190': 'Couros e peles depilados de suínos, mesmo divididos, curtidos, no estado úmido (incluindo wet blue)',
-    '41063200': 'Couros e peles depilados de suínos, mesmo divididos, curtidos, no estado seco (crust)',
-    '41064000': 'Couros e peles de répteis, mesmo divididos, curtidos ou crust',
-    '41069200': 'Couros e peles depilados de outros animais, mesmo divididos, curtidos, no estado seco (crust)',
-    '41071110': 'Couros e peles inteiros, de bovinos ou de eqüídeos, preparados após curtimenta ou secagem e couros e peles apergaminhados, depilados, plena flor, não divididos',
-    '41071120': 'Couros e peles inteiros, de bovinos ou de eqüídeos, preparados após curtimenta ou secagem e couros e peles apergaminhados, depilados, plena flor, não divididos',
-    '41071190': 'Couros e peles inteiros, de bovinos ou de eqüídeos, preparados após curtimenta ou secagem e couros e peles apergaminhados, depilados, plena flor, não divididos',
-    '41071210': 'Couros e peles inteiros, de bovinos ou de eqüídeos, preparados após curtimenta ou secagem e couros e peles apergaminhados, depilados, divididos, com a flor',
-    '41071220': 'Couros e peles inteiros, de bovinos ou de eqüídeos, preparados após curtimenta ou secagem e couros e peles apergaminhados, depilados, divididos, com a flor',
-    '41071290': 'Couros e peles inteiros, de bovinos ou de eqüídeos, preparados após curtimenta ou secagem e couros e peles apergaminhados, depilados, divididos, com a flor',
-    '41071910': 'Outros couros e peles inteiros, de bovinos ou de eqüídeos, preparados após curtimenta ou secagem e couros e peles apergaminhados, depilados',
-    '41071920': 'Outros couros e peles inteiros, de bovinos ou de eqüídeos, preparados após curtimenta ou secagem e couros e peles apergaminhados, depilados',
-    '41071990': 'Outros couros e peles inteiros, de bovinos ou de eqüídeos, preparados após curtimenta ou secagem e couros e peles apergaminhados, depilados',
-    '41079110': 'Couros e peles, incluídas as ilhargas, de bovinos ou de eqüídeos, preparados após curtimenta ou secagem e couros e peles apergaminhados, depilados, plena flor, não divididos',
-    '41079190': 'Couros e peles, incluídas as ilhargas, de bovinos ou de eqüídeos, preparados após curtimenta ou secagem e couros e peles apergaminhados, depilados, plena flor, não divididos',
-    '41079210': 'Couros e peles, incluídas as ilhargas, de bovinos ou de eqüídeos, preparados após curtimenta ou secagem, divididos, com a flor',
-    '41079290': 'Couros e peles, incluídas as ilhargas, de bovinos ou de eqüídeos, preparados após curtimenta ou secagem, divididos, com a flor',
-    '41079910': 'Outros couros e peles, incluídas as ilhargas, de bovinos ou de eqüídeos, preparados após curtimenta ou secagem',
-    '41079990': 'Outros couros e peles, incluídas as ilhargas, de bovinos ou de eqüídeos, preparados após curtimenta ou secagem',
-    '41120000': 'Couros de ovinos, preparados após curtimenta ou após secagem e couros e peles apergaminhados, depilados, mesmo divididos',
-    '41131010': 'Couros de caprinos, preparados após curtimenta ou após secagem e couros e peles apergaminhados, depilados, mesmo divididos',
-    '41131090': 'Couros de caprinos, preparados após curtimenta ou após secagem e couros e peles apergaminhados, depilados, mesmo divididos',
-    '41132000': 'Couros de suínos, preparados após curtimenta ou após secagem e couros e peles apergaminhados, depilados, mesmo divididos',
-    '41133000': 'Couros de répteis, preparados após curtimenta ou após secagem e couros e peles apergaminhados, depilados, mesmo divididos',
-    '41139000': 'Couros de outros animais, preparados após curtimenta ou após secagem e couros e peles apergaminhados, depilados, mesmo divididos',
-    '41141000': 'Couros e peles acamurçados (incluída a camurça combinada)',
-    '41142010': 'Couros e peles envernizados ou revestidos; couros e peles metalizados',
-    '41142020': 'Couros e peles envernizados ou revestidos; couros e peles metalizados',
-    '41151000': 'Couro reconstituído, à base de couro ou de fibras de couro, em placas, folhas ou tiras, mesmo enroladas',
-    '41152000': 'Aparas e outros desperdícios de couros ou de peles preparados ou reconstituídos; serragem, pó e farinha de couro',
-    '42010010': 'Artigos de seleiro ou de correeiro para animais, de quaisquer matérias',
-    '42010090': 'Artigos de seleiro ou de correeiro para animais, de quaisquer matérias',
-    '42021100': 'Malas, maletas, pastas e artefatos semelhantes, com a superfície exterior de couro natural ou reconstituído ou de couro envernizado',
-    '42021210': 'Malas, maletas, pastas e artefatos semelhantes, com a superfície exterior de plástico ou de matérias têxteis',
-    '42021220': 'Malas, maletas, pastas e artefatos semelhantes, com a superfície exterior de plástico ou de matérias têxteis',
-    '42021900': 'Malas, maletas, pastas e artefatos semelhantes, de outras matérias',
-    '42022100': 'Bolsas, mesmo com tiracolo ou sem alças, com a superfície exterior de couro natural, reconstituído ou envernizado',
-    '42022210': 'Bolsas, mesmo com tiracolo ou sem alças, com a superfície exterior de plástico ou de matérias têxteis',
-    '42022220': 'Bolsas, mesmo com tiracolo ou sem alças, com a superfície exterior de plástico ou de matérias têxteis',
-    '42022900': 'Bolsas, mesmo com tiracolo ou sem alças, com a superfície exterior de outras matérias',
-    '42023100': 'Artigos do tipo dos normalmente levados nos bolsos ou bolsas, com a superfície exterior de couro natural, reconstituído ou envernizado',
-    '42023200': 'Artigos do tipo dos normalmente levados nos bolsos ou bolsas, com a superfície exterior de folhas de plástico ou de matérias têxteis',
-    '42023900': 'Artigos do tipo dos normalmente levados nos bolsos ou bolsas, com a superfície exterior de outras matérias',
-    '42029100': 'Outros artefatos com a superfície exterior de couro natural, reconstituído ou envernizado',
-    '42029200': 'Outros artefatos com a superfície exterior de folhas de plástico ou matérias têxteis',
-    '42029900': 'Outros artefatos com a superfície exterior de outras matérias',
-    '42031000': 'Vestuário de couro natural ou reconstituído',
-    '42032100': 'Luvas, mitenes e semelhantes, concebidas para a prática de esportes, de couro natural ou reconstituído',
-    '42032900': 'Outras luvas, mitenes ou semelhantes, para outros usos, de couro natural ou reconstituído',
-    '42033000': 'Cintos, cinturões, bandoleiras ou talabartes de couro natural ou reconstituído',
-    '42034000': 'Outros acessórios de vestuário, de couro natural ou reconstituído',
-    '42050000': 'Outras obras de couro natural ou reconstituído',
-    '42060000': 'Obras de tripa, de baudruches, de bexiga ou de tendões',
-    '43013000': 'Peleteria em bruto, de cordeiros astracã, breitschwanz, caracul, persianer ou semelhantes, de cordeiros da Índia, da China, da Mongólia ou do Tíbete, inteira, mesmo sem cabeça, cauda ou patas',
-    '43018000': 'Peleteria em bruto, de outros animais, inteira, mesmo sem cabeça, cauda ou patas',
-    '43019000': 'Cabeças, caudas, patas e outras partes utilizáveis na indústria de peles',
-    '43021910': 'Peleteria (peles com pêlo) curtida ou acabada de outros animais, inteira, não reunida',
-    '43021990': 'Peleteria (peles com pêlo) curtida ou acabada de outros animais, inteira, não reunida',
-    '43022000': 'Cabeças, caudas, patas, desperdícios e aparas, curtidas ou acabadas, não reunidas',
-    '43023000': 'Peleteria (peles com pêlo) curtida ou acabada, inteira e respectivos pedaços, reunidos (montados)',
-    '43031000': 'Vestuário e seus acessórios, de peleteria',
-    '43039000': 'Outros artefatos de peleteria',
-    '43040000': 'Peleteria artificial e suas obras',
-    '44011100': 'Lenha em qualquer forma, de coníferas',
-    '44011200': 'Lenha em qualquer forma, de não coníferas',
-    '44012100': 'Madeira de coníferas, em estilhas ou em partículas',
-    '44012200': 'Madeira de não coníferas, em estilhas ou em partículas',
-    '44013100': 'Pellets de madeira',
-    '44013200': 'Briquetes de madeira',
-    '44013900': 'Outras serragens, desperdícios e resíduos, de madeira',
-    '44014000': 'Serragem (serradura), desperdícios e resíduos, de madeira, não aglomerados',
-    '44014100': 'Serradura, não aglomerada',
-    '44014900': 'Outros resíduos e aparas de serradura e madeira, não aglomerados, não classificados nos códigos anteriores',
-    '44021000': 'Carvão vegetal de bambu, mesmo aglomerado',
-    '44022000': 'Carvão vegetal (incluindo carvão vegetal de casca ou castanha), aglomerado ou não, de casca ou castanha',
-    '44029000': 'Outros carvões vegetais, mesmo aglomerados',
-    '44031100': 'Madeira em bruto, mesmo descascada, desalburnada ou esquadriada, tratada com tinta, creosoto ou outros agentes de conservação, de coníferas',
-    '44031200': 'Madeira em bruto, mesmo descascada, desalburnada ou esquadriada, tratada com tinta, creosoto ou outros agentes de conservação, de não coníferas',
-    '44032100': 'Madeira em bruto, mesmo descascada, desalburnada ou esquadriada, de pinheiro (Pinus spp.), cuja maior dimensão da seção transversal é igual ou superior a 15 cm',
-    '44032200': 'Madeira em bruto, mesmo descascada, desalburnada ou esquadriada, de pinheiro (Pinus spp.)',
-    '44034200': 'Madeira em bruto, descascada ou não, descascada ou esquadriada, de teca',
-    '44034900': 'Outras madeiras tropicais, em bruto',
-    '44039500': 'Madeira em bruto, mesmo descascada, desalburnada ou esquadriada, de bétula (vidoeiro) (Betula spp.), cuja maior dimensão da seção transversal é igual ou superior a 15 cm',
-    '44039800': 'Madeira em bruto, mesmo descascada, desalburnada ou esquadriada, de eucalipto (Eucalyptus spp.)',
-    '44039900': 'Outras madeiras em bruto',
-    '44041000': 'Arcos de madeira, estacas fendidas, estacas aguçadas; madeira simplesmente desbastada ou arredondada para fabricação de bengalas, cabos de ferramenta e semelhantes; de coníferas',
-    '44042000': 'Arcos de madeira, estacas fendidas, estacas aguçadas; madeira simplesmente desbastada ou arredondada para fabricação de bengalas, cabos de ferramenta e semelhantes; madeira em fasquias, lâminas, fitas e semelhantes; de não coníferas',
-    '44050000': 'Lã de madeira e farinha de madeira',
-    '44061200': 'Dormentes de madeira para vias férreas ou semelhantes, não impregnados, de não coníferas',
-    '44069200': 'Dormentes de madeira para vias férreas ou semelhantes, de não coníferas',
-    '44071100': 'Madeira serrada ou fendida longitudinalmente, cortada transversalmente ou desenrolada, mesmo aplainada, lixada ou unida pelas extremidades, de espessura superior a 6 mm, de pinheiro (Pinus spp.)',
-    '44071300': 'Madeira serrada ou fendida longitudinalmente, cortada ou descascada, mesmo aplainada, lixada ou unida pelas extremidades, de espessura superior a 6 mm de S-P-F (Picea spp.), pinus (Pinus spp.) e abeto (Abies spp.)',
-    '44071900': 'Madeira serrada ou fendida longitudinalmente, cortada transversalmente ou desenrolada, mesmo aplainada, lixada ou unida pelas extremidades, de espessura superior a 6 mm, de outras coníferas',
-    '44072100': 'Madeira de mogno (Swietenia spp), serrada, cortada em folhas ou desenrolada, de espessura > 6mm',
-    '44072200': 'Madeira de virola, imbuia e balsa, serrada ou fendida longitudinalmente, cortada transversalmente ou desenrolada, mesmo aplainada, lixada ou unida pelas extremidades, de espessura superior a 6 mm',
-    '44072300': 'Madeira serrada ou lascada longitudinalmente, cortada ou descascada, mesmo aplainada, lixada ou unida pelas extremidades, de espessura superior a 6 mm, de teca',
-    '44072500': 'Madeira de Dark Red Meranti, Light Red Meranti e Meranti Bakau, serrada, cortada em folhas ou desenrolada, de espessura > 6 mm',
-    '44072910': 'Outras madeiras tropicais (cedro, ipê, pau-marfim, louro, etc), serradas, cortadas em folhas ou desenroladas, de espessura > 6 mm',
-    '44072920': 'Outras madeiras tropicais (cedro, ipê, pau-marfim, louro, etc), serradas, cortadas em folhas ou desenroladas, de espessura > 6 mm',
-    '44072940': 'Outras madeiras tropicais (cedro, ipê, pau-marfim, louro, etc), serradas, cortadas em folhas ou desenroladas, de espessura > 6 mm',
-    '44072990': 'Outras madeiras tropicais (cedro, ipê, pau-marfim, louro, etc), serradas, cortadas em folhas ou desenroladas, de espessura > 6 mm',
-    '44079100': 'Madeira de carvalho (Quercus spp.), serrada, cortada em folhas ou desenrolada, de espessura > 6 mm',
-    '44079400': 'Madeira de cerejeira (Prunus spp.), serrada, cortada em folhas ou desenrolada, de espessura > 6mm',
-    '44079920': 'Outras madeiras, serradas, cortadas em folhas ou desenroladas, de espessura > 6 mm',
-    '44079960': 'Outras madeiras, serradas, cortadas em folhas ou desenroladas, de espessura > 6 mm',
-    '44079990': 'Outras madeiras, serradas, cortadas em folhas ou desenroladas, de espessura > 6 mm',
-    '44081010': 'Folhas de madeira para folheados e para compensados, de coníferas, de espessura <= 6 mm',
-    '44081091': 'Folhas de madeira para folheados e para compensados, de coníferas, de espessura <= 6 mm',
-    '44081099': 'Folhas de madeira para folheados e para compensados, de coníferas, de espessura <= 6 mm',
-    '44083190': 'Folhas de madeira para folheados e para compensados, de dark ou light red meranti ou meranti bakau, de espessura <= 6 mm',
-    '44083910': 'Folhas para folheados (incluindo as obtidas por corte de madeira estratificada),folhas para compensados ou para madeiras estratificadas semelhantes e outras madeiras, etc..., espessura <= 6 mm,obtidas por corte de madeira estratificada, madeiras tropicais',
-    '44083991': 'Folhas para folheados (incluindo as obtidas por corte de madeira estratificada),folhas para compensados ou para madeiras estratificadas semelhantes e outras madeiras, etc..., espessura <= 6 mm,obtidas por corte de madeira estratificada, madeiras tropicais',
-    '44083992': 'Folhas para folheados (incluindo as obtidas por corte de madeira estratificada),folhas para compensados ou para madeiras estratificadas semelhantes e outras madeiras, etc..., espessura <= 6 mm,obtidas por corte de madeira estratificada, madeiras tropicais',
-    '44083999': 'Folhas para folheados (incluindo as obtidas por corte de madeira estratificada),folhas para compensados ou para madeiras estratificadas semelhantes e outras madeiras, etc..., espessura <= 6 mm,obtidas por corte de madeira estratificada, madeiras tropicais',
-    '44089010': 'Folhas para folheados e para compensados, de outras madeiras, de espessura <= 6 mm',
-    '44089090': 'Folhas para folheados e para compensados, de outras madeiras, de espessura <= 6 mm',
-    '44091000': 'Madeira de coníferas, perfilada',
-    '44092100': 'Madeira de bambu, perfilada',
-    '44092200': 'Madeiras tropicais perfilada (com espigas, ranhuras, filetes, entalhes, chanfrada, com juntas em V, com cercadura, boleada ou semelhantes) ao longo de uma ou mais bordas, faces ou extremidades, mesmo aplainada, lixada ou unida pelas extremidades',
-    '44092900': 'Outras madeiras perfiladas de não coníferas',
-    '44101110': 'Painéis de partículas, de madeira',
-    '44101121': 'Painéis de partículas, de madeira',
-    '44101129': 'Painéis de partículas, de madeira',
-    '44101190': 'Painéis de partículas, de madeira',
-    '44101210': 'Painéis denominados oriented strand board " (OSB) "',
-    '44101290': 'Painéis denominados oriented strand board " (OSB) "',
-    '44101919': 'Outros painéis de madeira (waferboard e outros)',
-    '44101991': 'Outros painéis de madeira (waferboard e outros)',
-    '44101992': 'Outros painéis de madeira (waferboard e outros)',
-    '44101999': 'Outros painéis de madeira (waferboard e outros)',
-    '44109000': 'Outros painéis de matérias lenhosas, mesmo aglomeradas com resinas ou aglutinantes',
-    '44111210': 'Painéis de média densidade (MDF), de espessura não superior a 5mm',
-    '44111290': 'Painéis de média densidade (MDF), de espessura não superior a 5mm',
-    '44111310': 'Painéis de média densidade (MDF) de espessura superior a 5mm, mas não superior a 9mm',
-    '44111391': 'Painéis de média densidade (MDF) de espessura superior a 5mm, mas não superior a 9mm',
-    '44111399': 'Painéis de média densidade (MDF) de espessura superior a 5mm, mas não superior a 9mm',
-    '44111410': 'Painéis de média densidade (MDF), de espessura superior a 9 mm',
-    '44111490': 'Painéis de média densidade (MDF), de espessura superior a 9 mm',
-    '44119210': 'Painéis de fibra de madeira ou de outras matérias lenhosas, mesmo aglomeradas com resinas ou outros algutinantes orgânicos, com densidade superior a 0,8g/cm3',
-    '44119290': 'Painéis de fibra de madeira ou de outras matérias lenhosas, mesmo aglomeradas com resinas ou outros algutinantes orgânicos, com densidade superior a 0,8g/cm3',
-    '44119310': 'Painéis de fibra de madeira ou de outras matérias lenhosas, mesmo aglomeradas com resinas ou outros algutinantes orgânicos, com densidade superior a 0,5g/cm3 mas não superior a 0,8g/cm3',
-    '44119390': 'Painéis de fibra de madeira ou de outras matérias lenhosas, mesmo aglomeradas com resinas ou outros algutinantes orgânicos, com densidade superior a 0,5g/cm3 mas não superior a 0,8g/cm3',
-    '44119410': 'Painéis de fibra de madeira ou de outras matérias lenhosas, mesmo aglomeradas com resinas ou outros algutinantes orgânicos, com densidade não superior a 0,5g/cm3',
-    '44119490': 'Painéis de fibra de madeira ou de outras matérias lenhosas, mesmo aglomeradas com resinas ou outros algutinantes orgânicos, com densidade não superior a 0,5g/cm3',
-    '44121000': 'Madeira compensada ou folheada, e madeiras estratificadas semelhantes, de bambu',
-    '44123100': 'Madeira compensada, constituída por folhas de madeira (exceto bambu), cada uma das quais de espessura não superior a 6 mm, com pelo menos uma face de madeira tropicais',
-    '44123300': 'Outras, com, pelo menos, uma camada exterior de madeira não conífera, das espécies amieiro freixo, faia, bétula, prunóidea, castanheiro, olmo eucalipto, nogueira, castanheiro-da-índia, tília, bordo, carvalho, plátano, choupo,robínia,tulipeiro  ou nogueira',
-    '44123400': 'Outras madeiras compensadas com, pelo menos, uma camada exterior de madeira não conífera, não especificadas na subposição 4412.33',
-    '44123900': 'Outras madeiras compensadas constituídas por folhas de madeira, cada uma das quais de espessura não superior a 6 mm',
-    '44124100': 'Madeira folheada laminada (LVL), com pelo menos uma camada externa de madeira tropical',
-    '44124200': 'Outras madeiras folheadas laminadas (LVL), com pelo menos uma camada externa de madeira não conífera',
-    '44124900': 'Outras madeiras folheadas laminadas (LVL), com ambas as camadas externas de madeira de coníferas',
-    '44125100': 'Placas, laminas e ripas, com pelo menos uma lona externa de madeira tropical',
-    '44125200': 'Outros blockboard, laminboard e battenboard, com pelo menos uma camada externa de madeira não conífera',
-    '44125900': 'Outras placas, lâminas e ripas, com ambas as camadas externas de madeira de coníferas',
-    '44129100': 'Outros compensados, painéis folheados e madeira laminada similar, com pelo menos uma folha exterior de madeira tropical, não classificados nos códigos anteriores',
-    '44129200': 'Outs.madeiras compensadas, c/camada de madeira tropical',
-    '44129400': 'Outras madeiras compensadas com alma aglomerada, alveolada ou lamelada',
-    '44129900': 'Outras madeiras compensadas, folheadas ou estratificadas',
-    '44130000': 'Madeira densificada, em blocos, pranchas, lâminas ou perfis',
-    '44140000': 'Molduras de madeira, para quadros, fotografias, espelho ou objetos semelhantes',
-    '44141000': 'Molduras de madeira para pinturas, fotografias, espelhos ou objetos similares, de madeira tropical',
-    '44149000': 'Outras molduras de madeira para quadros, fotografias, espelhos ou objetos similares, não classificados nos códigos anteriores',
-    '44151000': 'Caixotes, caixas, engradados, barricas e embalagens semelhantes, de madeira; carretéis para cabos, de madeira',
-    '44152000': 'Paletes simples, paletes-caixas e estrados para carga, de madeira; taipais de paletes',
-    '44160010': 'Barris, cubas, balsas, dornas e outras obras de tanueiro, de madeira',
-    '44160090': 'Barris, cubas, balsas, dornas e outras obras de tanueiro, de madeira',
-    '44170010': 'Ferramentas, armações e cabos de ferramentas, de escovas e de vassouras, de madeira; formas, alargadeiras e esticadores, de madeira, para calçados',
-    '44170020': 'Ferramentas, armações e cabos de ferramentas, de escovas e de vassouras, de madeira; formas, alargadeiras e esticadores, de madeira, para calçados',
-    '44170090': 'Ferramentas, armações e cabos de ferramentas, de escovas e de vassouras, de madeira; formas, alargadeiras e esticadores, de madeira, para calçados',
-    '44181000': 'Janelas, janelas de sacada e respectivos caixilhos e alizares, de madeira',
-    '44181100': 'Janelas, janelas francesas e seus caixilhos, de madeira tropical',
-    '44181900': 'Outras janelas, janelas francesas e seus caixilhos, não classificados nos códigos anteriores',
-    '44182000': 'Portas e respectivos caixilhos, alizares e soleiras, de madeira',
-    '44182100': 'Portas e seus caixilhos e soleiras, de madeira tropical',
-    '44182900': 'Outras portas e seus caixilhos e soleiras, não classificados nos códigos anteriores',
-    '44183000': 'painéis de madeira, para soalhos',
-    '44184000': 'Armações de madeira, para concreto',
-    '44185000': 'Fasquias de madeira, para telhados (shingles e shakes)',
-    '44186000': 'Postes e vigas de madeira',
-    '44187300': 'Painéis montados para revestimento de pisos (pavimentos), de bambu ou com, pelo menos, a camada superior de bambu',
-    '44187400': 'Outros painéis montados para revestimento de pisos (pavimentos), para pisos (pavimentos) em mosaico',
-    '44187500': 'Outros painéis montados para revestimento de pisos (pavimentos), de camadas múltiplas',
-    '44187900': 'Outros painéis montados para soalhos',
-    '44188100': 'Madeira laminada com cola (glulam)',
-    '44188900': 'Outros produtos de engenharia estrutural de madeira, não classificados nos códigos anteriores',
-    '44189100': 'Outras obras de marcenaria e peças de carpintaria para construções, incluindo os painéis celulares, os painéis montados para revestimento de pisos (pavimentos) e as fasquias para telhados (shingles e shakes), de bambu',
-    '44189200': 'Painéis celulares de madeira',
-    '44189900': 'Outras obras de marcenaria e peças de carpintaria para construções, incluindo os painéis celulares, os painéis montados para revestimento de pisos (pavimentos) e as fasquias para telhados (shingles e shakes)',
-    '44191100': 'Tábuas para cortar pão, outras tábuas para cortar e artigos semelhantes, de bambu',
-    '44191200': 'Pauzinhos (hashi ou fachi), de bambu',
-    '44191900': 'Outros artigos de madeira para mesa ou cozinha, de bambu',
-    '44192000': 'Artigos de mesa e de cozinha, de madeira tropical',
-    '44199000': 'Outros artigos de madeira para mesa ou cozinha',
-    '44201000': 'Estatuetas e outros objetos, de madeira, para ornamentação',
-    '44201100': 'Estatuetas e outros ornamentos, de madeira tropical',
-    '44201900': 'Outras estatuetas e outros ornamentos, de madeira tropical, não classificados nos códigos anteriores',
-    '44209000': 'Madeira marchetada e madeira incrustada; cofres e estojos para joalharia, de madeira',
-    '44211000': 'Cabides de madeira, para vestuário',
-    '44212000': 'Caixões de madeira',
-    '44219100': 'Outras obras em bambu',
-    '44219900': 'Outras obras em madeira',
-    '45011000': 'Cortiça natural, em bruto ou simplesmente preparada',
-    '45019000': 'Desperdícios de cortiça, cortiça triturada, granulada ou pulverizada',
-    '45020000': 'Cortiça natural, sem a crosta ou esquadriada, ou em cubos, chapas, folhas ou tiras de forma quadrada ou retangular',
-    '45031000': 'Rolhas de cortiça natural',
-    '45039000': 'Outras obras de cortiça natural',
-    '45041000': 'Cortiça aglomerada, em cubos, blocos, chapas, folhas e tiras; cilindros maciços, incluídos os discos',
-    '45049000': 'Outras obras de cortiça aglomerada',
-    '46012100': 'Esteiras, capachos, divisórias, de bambu',
-    '46012200': 'Esteiras, capachos, divisórias, de ratã',
-    '46012900': 'Esteiras, capachos, divisórias de outras matérias vegetais',
-    '46019200': 'Tranças e artigos semelhantes de bambu, mesmo reunidos em tiras',
-    '46019300': 'Tranças e artigos semelhantes de ratã, mesmo reunidos em tiras',
-    '46019400': 'Tranças e artigos semelhantes de outras matérias vegetais, mesmo reunidas em tiras',
-    '46019900': 'Tranças e matérias semelhantes de outras matérias, tecidas ou paralelizadas',
-    '46021100': 'Obras de cestaria de bambu',
-    '46021200': 'Obras de cestaria de ratã',
-    '46021900': 'Obras de cestaria de outras matérias vegetais',
-    '46029000': 'Obras de cestaria, de outras matérias para entrançar, etc.',
-    '47010000': 'Pastas mecânicas de madeira',
-    '47020000': 'Pasta química de madeira, para dissolução',
-    '47031100': 'Pasta química de madeira de conífera, à soda ou sulfato, crua',
-    '47031900': 'Pasta química de madeira de não conífera, à soda ou sulfato, crua',
-    '47032100': 'Pasta química de madeira de conífera, à soda ou ao sulfato, semibranqueada ou branqueada',
-    '47032110': 'Pasta química de madeira de conífera, à soda ou ao sulfato, semibranqueada ou branqueada',
-    '47032190': 'Pasta química de madeira de conífera, à soda ou ao sulfato, semibranqueada ou branqueada',
-    '47032900': 'Pasta química de madeira de não conífera, à soda ou sulfato, semibranqueada ou branqueada',
-    '47042100': 'Pasta química de madeira de conífera, ao bissulfito, semibranqueada ou branqueada',
-    '47042900': 'Pasta química de madeira de não conífera, ao bissulfito, semibranqueada ou branqueada',
-    '47050000': 'Pastas de madeira obtidas pela combinação de um tratamento mecânico e de um tratamento químico',
-    '47061000': 'Pastas de línteres de algodão',
-    '47062000': 'Pastas de fibras obtidas do papel ou cartão reciclados (desperdícios e aparas)',
-    '47063000': 'Pastas de fibras celulósicas obtidas de bambu',
-    '47069100': 'Pastas mecânicas de outras matérias fibrosas celulósicas',
-    '47069200': 'Pastas químicas de outras matérias fibrosas celulósicas',
-    '47069300': 'Pastas semiquímicas de outras matérias fibrosas celulósicas',
-    '47071000': 'Desperdícios de papel ou cartões, kraft, crus ou papéis ou cartões ondulados, de reciclar',
-    '47072000': 'Outros papéis e cartões obtidos da pasta química branqueada, de reciclar',
-    '47073000': 'Desperdícios de papel e cartão obtidos da pasta mecânica, de reciclar',
-    '47079000': 'Desperdícios de outros papéis ou cartões, de reciclar, inclusive não selecionados',
-    '48010020': 'Papel jornal, em rolos ou em folhas',
-    '48010030': 'Papel jornal, em rolos ou em folhas',
-    '48010090': 'Papel jornal, em rolos ou em folhas',
-    '48021000': 'Papel e cartão feitos à mão (folha a folha)',
-    '48022010': 'Papel e cartão próprios para fabricação de papéis ou cartões fotossensíveis, termossensíveis ou eletrossensíveis, em rolos ou folhas',
-    '48022090': 'Papel e cartão próprios para fabricação de papéis ou cartões fotossensíveis, termossensíveis ou eletrossensíveis, em rolos ou folhas',
-    '48024010': 'Papel próprio para fabricação de papéis de parede, em rolos ou folhas',
-    '48024090': 'Papel próprio para fabricação de papéis de parede, em rolos ou folhas',
-    '48025410': 'Papéis e cartões, não revestidos, contendo <= 10%, em peso, de fibras obtidas por processo mecânico ou químico-mecânico, de peso < a 40 g/m2, em rolos',
-    '48025491': 'Papéis e cartões, não revestidos, contendo <= 10%, em peso, de fibras obtidas por processo mecânico ou químico-mecânico, de peso < a 40 g/m2, em rolos',
-    '48025499': 'Papéis e cartões, não revestidos, contendo <= 10%, em peso, de fibras obtidas por processo mecânico ou químico-mecânico, de peso < a 40 g/m2, em rolos',
-    '48025510': 'Papéis e cartões, não revestidos, contendo <= 10% de fibras obtidas por processo mecânico ou químico-mecânico, de peso => 40 g/m2 mas não > 150 g/m2, em rolos',
-    '48025591': 'Papéis e cartões, não revestidos, contendo <= 10% de fibras obtidas por processo mecânico ou químico-mecânico, de peso => 40 g/m2 mas não > 150 g/m2, em rolos',
-    '48025592': 'Papéis e cartões, não revestidos, contendo <= 10% de fibras obtidas por processo mecânico ou químico-mecânico, de peso => 40 g/m2 mas não > 150 g/m2, em rolos',
-    '48025599': 'Papéis e cartões, não revestidos, contendo <= 10% de fibras obtidas por processo mecânico ou químico-mecânico, de peso => 40 g/m2 mas não > 150 g/m2, em rolos',
-    '48025610': 'Papéis e cartões, não revestidos, contendo <= 10% de fibras obtidas por processo mecânico ou químico -mecânico, de peso => 40 g/m2 mas não > 150 g/m2, em folhas nas quais um lado <= 435 mm e o outro <= 297 mm, quando não dobradas',
-    '48025691': 'Papéis e cartões, não revestidos, contendo <= 10% de fibras obtidas por processo mecânico ou químico -mecânico, de peso => 40 g/m2 mas não > 150 g/m2, em folhas nas quais um lado <= 435 mm e o outro <= 297 mm, quando não dobradas',
-    '48025692': 'Papéis e cartões, não revestidos, contendo <= 10% de fibras obtidas por processo mecânico ou químico -mecânico, de peso => 40 g/m2 mas não > 150 g/m2, em folhas nas quais um lado <= 435 mm e o outro <= 297 mm, quando não dobradas',
-    '48025693': 'Papéis e cartões, não revestidos, contendo <= 10% de fibras obtidas por processo mecânico ou químico -mecânico, de peso => 40 g/m2 mas não > 150 g/m2, em folhas nas quais um lado <= 435 mm e o outro <= 297 mm, quando não dobradas',
-    '48025699': 'Papéis e cartões, não revestidos, contendo <= 10% de fibras obtidas por processo mecânico ou químico -mecânico, de peso => 40 g/m2 mas não > 150 g/m2, em folhas nas quais um lado <= 435 mm e o outro <= 297 mm, quando não dobradas',
-    '48025710': 'Outros papéis e cartões não revestidos, contendo <= 10% de fibras obtidas por processo mecânico ou químico-mecânico, de peso => 40 g/m2 mas não > 150 g/m2, em rolos ou folhas',
-    '48025791': 'Outros papéis e cartões não revestidos, contendo <= 10% de fibras obtidas por processo mecânico ou químico-mecânico, de peso => 40 g/m2 mas não > 150 g/m2, em rolos ou folhas',
-    '48025792': 'Outros papéis e cartões não revestidos, contendo <= 10% de fibras obtidas por processo mecânico ou químico-mecânico, de peso => 40 g/m2 mas não > 150 g/m2, em rolos ou folhas',
-    '48025793': 'Outros papéis e cartões não revestidos, contendo <= 10% de fibras obtidas por processo mecânico ou químico-mecânico, de peso => 40 g/m2 mas não > 150 g/m2, em rolos ou folhas',
-    '48025799': 'Outros papéis e cartões não revestidos, contendo <= 10% de fibras obtidas por processo mecânico ou químico-mecânico, de peso => 40 g/m2 mas não > 150 g/m2, em rolos ou folhas',
-    '48025810': 'Papéis e cartões, não revestidos, contendo <= 10% de fibras obtidas por processo mecânico ou químico-mecânico, de peso > 150 g/m2, em rolos ou folhas',
-    '48025891': 'Papéis e cartões, não revestidos, contendo <= 10% de fibras obtidas por processo mecânico ou químico-mecânico, de peso > 150 g/m2, em rolos ou folhas',
-    '48025892': 'Papéis e cartões, não revestidos, contendo <= 10% de fibras obtidas por processo mecânico ou químico-mecânico, de peso > 150 g/m2, em rolos ou folhas',
-    '48025899': 'Papéis e cartões, não revestidos, contendo <= 10% de fibras obtidas por processo mecânico ou químico-mecânico, de peso > 150 g/m2, em rolos ou folhas',
-    '48026191': 'Papéis e cartões, não revestidos, contendo > 10% de fibras obtidas por processo mecânico ou químico-mecânico, em rolos',
-    '48026199': 'Papéis e cartões, não revestidos, contendo > 10% de fibras obtidas por processo mecânico ou químico-mecânico, em rolos',
-    '48026210': 'Papéis e cartões, não revestidos, contendo > 10% de fibras obtidas por processo mecânico ou químico-mecânico, em folhas nas quais um lado <= 435 mm e o outro <= 297 mm, quando não dobradas',
-    '48026910': 'Outros papéis e cartões não revestidos, contendo > 10% de fibras obtidas por processo mecânico ou químico-mecânico',
-    '48026992': 'Outros papéis e cartões não revestidos, contendo > 10% de fibras obtidas por processo mecânico ou químico-mecânico',
-    '48026999': 'Outros papéis e cartões não revestidos, contendo > 10% de fibras obtidas por processo mecânico ou químico-mecânico',
-    '48030010': 'Papel para fabricação de papel higiênico ou de toucador e artigos semelhantes; pasta de celulose e mantas de fibras de celulose',
-    '48030090': 'Papel para fabricação de papel higiênico ou de toucador e artigos semelhantes; pasta de celulose e mantas de fibras de celulose',
-    '48041100': 'Papel e cartão kraftliner, não revestidos, para cobertura, crus, em rolos ou folhas',
-    '48041900': 'Outros papéis e cartões kraftliner, não revestidos, para cobertura, em rolos ou folhas',
-    '48042100': 'Papel kraft para sacos de grande capacidade, não revestido, cru, em rolos ou folhas',
-    '48042900': 'Outros papéis kraft para sacos de grande capacidade, não revestidos, em rolos ou folhas',
-    '48043110': 'Papel e cartão kraft, crus, não revestidos, de peso <= 150 g/m2, em rolos ou folhas',
-    '48043190': 'Papel e cartão kraft, crus, não revestidos, de peso <= 150 g/m2, em rolos ou folhas',
-    '48043910': 'Outros papéis e cartões kraft, não revestidos, de peso <= 150 g/m2, em rolos ou folhas',
-    '48043990': 'Outros papéis e cartões kraft, não revestidos, de peso <= 150 g/m2, em rolos ou folhas',
-    '48044100': 'Papel e cartão kraft, crus, não revestidos, de peso > 150 g/m2 e < 225 g/m2, em rolos ou folhas',
-    '48044200': 'Papel e cartão kraft, branqueados, não revestidos, de peso > 150 g/m2 e < 225 g/m2, contendo mais de 95% em peso das fibras de madeira obtidas por processo químico, em rolos ou em folhas',
-    '48044900': 'Outros papéis e cartões kraft, não revestidos, de peso > 150 g/m2 e < 225 g/m2, em rolos ou folhas',
-    '48045100': 'Papel e cartão kraft, crus, não revestidos, de peso => 225 g/m2, em rolos ou folhas',
-    '48045200': 'Papel e cartão kraft, branqueados, não revestidos, de peso => 225 g/m2, contendo em peso mais de 95% das fibras de madeira obtidas por processo químico, em rolos ou em folhas',
-    '48045990': 'Outros papéis e cartões kraft, não revestidos, de peso => 225 g/m2, em rolos ou folhas',
-    '48051100': 'Papel semiquímico para ondular, não revestido, em rolos ou em folhas',
-    '48051900': 'Outros papéis para ondular, não revestidos, em rolos ou em folhas',
-    '48052400': 'Papel testliner (fibras recicladas), não revestido, em rolos ou em folhas, de peso <= 150 g/m2',
-    '48052500': 'Papel testliner (fibras recicladas), não revestido, em rolos ou em folhas, de peso > 150 g/m2',
-    '48053000': 'Papel sulfito para embalagem, não revestido, em rolos ou folhas',
-    '48054010': 'Papel-filtro e cartão-filtro, não revestidos, em rolos ou folhas',
-    '48054090': 'Papel-filtro e cartão-filtro, não revestidos, em rolos ou folhas',
-    '48059100': 'Outros papéis e cartões, não revestidos, em rolos ou em folhas, de peso <= 150 g/m2',
-    '48059210': 'Outros papéis e cartões, não revestidos, em rolos ou em folhas, de peso > 150 g/m2 e < 225 g/m2',
-    '48059290': 'Outros papéis e cartões, não revestidos, em rolos ou em folhas, de peso > 150 g/m2 e < 225 g/m2',
-    '48059300': 'Outros papéis e cartões, não revestidos, em rolos ou em folhas, de peso => 225 g/m2',
-    '48061000': 'Papel-pergaminho e cartão-pergaminho (sulfurizados), em rolos ou folhas',
-    '48062000': 'Papel impermeável a gorduras, em rolos ou folhas',
-    '48063000': 'Papel vegetal, em rolos ou folhas',
-    '48064000': 'Papel cristal e outros papéis calandrados transparentes ou translúcidos, em rolos ou folhas',
-    '48070000': 'Papel e cartão obtidos por colagem de folhas sobrepostas, não revestidos na superfície nem impregnados, mesmo reforçados interiormente, em rolos ou em folhas',
-    '48081000': 'Papel e cartão ondulados, mesmo perfurados, em rolos ou folhas',
-    '48084000': 'Papéis Kraft, encrespados ou plissados, mesmo gofrados, estampados ou perfurados',
-    '48089000': 'Outros papéis e cartões ondulados, encrespados, em rolos ou folhas',
-    '48092000': 'Papel autocopiativo, em rolos ou em folhas',
-    '48099000': 'Outros papéis para cópia ou duplicação, em rolos ou folhas',
-    '48101310': 'Papel e cartão para escrita, impressão e outras finalidades gráficas, contendo <= 10% em peso de fibras obtidas por processo mecânico ou químico-mecânico, revestidos, em rolos',
-    '48101381': 'Papel e cartão para escrita, impressão e outras finalidades gráficas, contendo <= 10% em peso de fibras obtidas por processo mecânico ou químico-mecânico, revestidos, em rolos',
-    '48101389': 'Papel e cartão para escrita, impressão e outras finalidades gráficas, contendo <= 10% em peso de fibras obtidas por processo mecânico ou químico-mecânico, revestidos, em rolos',
-    '48101390': 'Papel e cartão para escrita, impressão e outras finalidades gráficas, contendo <= 10% em peso de fibras obtidas por processo mecânico ou químico-mecânico, revestidos, em rolos',
-    '48101391': 'Papel e cartão para escrita, impressão e outras finalidades gráficas, contendo <= 10% em peso de fibras obtidas por processo mecânico ou químico-mecânico, revestidos, em rolos',
-    '48101399': 'Papel e cartão para escrita, impressão e outras finalidades gráficas, contendo <= 10% em peso de fibras obtidas por processo mecânico ou químico-mecânico, revestidos, em rolos',
-    '48101410': 'Papel e cartão para escrita, impressão e outras finalidades gráficas, contendo <= 10% em peso de fibras obtidas por processo mecânico ou químico-mecânico, revestidos, em folhas nas quais um dos lados <= 435 mm e o outro <= 297 mm, quando não dobradas',
-    '48101489': 'Papel e cartão para escrita, impressão e outras finalidades gráficas, contendo <= 10% em peso de fibras obtidas por processo mecânico ou químico-mecânico, revestidos, em folhas nas quais um dos lados <= 435 mm e o outro <= 297 mm, quando não dobradas',
-    '48101490': 'Papel e cartão para escrita, impressão e outras finalidades gráficas, contendo <= 10% em peso de fibras obtidas por processo mecânico ou químico-mecânico, revestidos, em folhas nas quais um dos lados <= 435 mm e o outro <= 297 mm, quando não dobradas',
-    '48101981': 'Outros papéis e cartões para escrita, impressão e outras finalidades gráficas, contendo <= 10% em peso de fibras obtidas por processo mecânico ou químico-mecânico, revestidos, em folhas',
-    '48101989': 'Outros papéis e cartões para escrita, impressão e outras finalidades gráficas, contendo <= 10% em peso de fibras obtidas por processo mecânico ou químico-mecânico, revestidos, em folhas',
-    '48101990': 'Outros papéis e cartões para escrita, impressão e outras finalidades gráficas, contendo <= 10% em peso de fibras obtidas por processo mecânico ou químico-mecânico, revestidos, em folhas',
-    '48101991': 'Outros papéis e cartões para escrita, impressão e outras finalidades gráficas, contendo <= 10% em peso de fibras obtidas por processo mecânico ou químico-mecânico, revestidos, em folhas',
-    '48101999': 'Outros papéis e cartões para escrita, impressão e outras finalidades gráficas, contendo <= 10% em peso de fibras obtidas por processo mecânico ou químico-mecânico, revestidos, em folhas',
-    '48102210': 'Papel cuché leve (LWC -light weight coated), contendo > 10% de fibras obtidas por processo mecânico',
-    '48102290': 'Papel cuché leve (LWC -light weight coated), contendo > 10% de fibras obtidas por processo mecânico',
-    '48102910': 'Outros papéis e cartões, para escrita ou impressão, revestidos de caulim, contendo mais de 10% das fibras obtidas por processo mecânico, em rolos ou folhas',
-    '48102990': 'Outros papéis e cartões, para escrita ou impressão, revestidos de caulim, contendo mais de 10% das fibras obtidas por processo mecânico, em rolos ou folhas',
-    '48103110': 'Papel e cartão kraft, exceto dos tipos utilizados para escrita ou finalidades gráficas, revestidos de caulim, branqueados, de peso <= 150 g/m2, contendo mais de 95% em peso das fibras obtidas por processo químico, em rolos ou folhas',
-    '48103190': 'Papel e cartão kraft, exceto dos tipos utilizados para escrita ou finalidades gráficas, revestidos de caulim, branqueados, de peso <= 150 g/m2, contendo mais de 95% em peso das fibras obtidas por processo químico, em rolos ou folhas',
-    '48103290': 'Papel e cartão kraft, exceto dos tipos utilizados para escrita ou finalidades gráficas, branqueados, revestidos de caulim, de peso > 150 g/m2, contendo mais de 95% das fibras obtidas por processo químico, em rolos ou folhas',
-    '48103910': 'Outros papéis e cartões kraft, exceto dos tipos utilizados para escrita ou finalidades gráficas, revestidos de caulim ou de outras substâncias inorgânicas, em rolos ou folhas',
-    '48103990': 'Outros papéis e cartões kraft, exceto dos tipos utilizados para escrita ou finalidades gráficas, revestidos de caulim ou de outras substâncias inorgânicas, em rolos ou folhas',
-    '48109210': 'Outros papéis e cartões de camadas múltiplas, exceto dos tipos utilizados para escrita ou finalidades gráficas, revestidos de caulim, em rolos ou em folhas',
-    '48109290': 'Outros papéis e cartões de camadas múltiplas, exceto dos tipos utilizados para escrita ou finalidades gráficas, revestidos de caulim, em rolos ou em folhas',
-    '48109910': 'Outros papéis e cartões, exceto dos tipos utilizados para escrita ou finalidades gráficas, revestidos de caulim ou de outras substâncias inorgânicas, em rolos ou folhas',
-    '48109990': 'Outros papéis e cartões, exceto dos tipos utilizados para escrita ou finalidades gráficas, revestidos de caulim ou de outras substâncias inorgânicas, em rolos ou folhas',
-    '48111010': 'Papel e cartão alcatroados, betuminados, ou asfaltados, em rolos ou folhas',
-    '48111090': 'Papel e cartão alcatroados, betuminados, ou asfaltados, em rolos ou folhas',
-    '48114110': 'Papel e cartão auto-adesivos, coloridos ou decorados à superfície ou impressos, em rolos ou folhas',
-    '48114190': 'Papel e cartão auto-adesivos, coloridos ou decorados à superfície ou impressos, em rolos ou folhas',
-    '48114910': 'Outros papéis e cartões gomados ou adesivos, coloridos ou decorados à superfície ou impressos, em rolos ou folhas',
-    '48114990': 'Outros papéis e cartões gomados ou adesivos, coloridos ou decorados à superfície ou impressos, em rolos ou folhas',
-    '48115110': 'Papel e cartão, coloridos ou decorados à superfície ou impressos, branqueados, revestidos, impregnados ou recobertos de plástico, de peso > 150 g/m2, em rolos ou folhas',
-    '48115121': 'Papel e cartão, coloridos ou decorados à superfície ou impressos, branqueados, revestidos, impregnados ou recobertos de plástico, de peso > 150 g/m2, em rolos ou folhas',
-    '48115122': 'Papel e cartão, coloridos ou decorados à superfície ou impressos, branqueados, revestidos, impregnados ou recobertos de plástico, de peso > 150 g/m2, em rolos ou folhas',
-    '48115123': 'Papel e cartão, coloridos ou decorados à superfície ou impressos, branqueados, revestidos, impregnados ou recobertos de plástico, de peso > 150 g/m2, em rolos ou folhas',
-    '48115128': 'Papel e cartão, coloridos ou decorados à superfície ou impressos, branqueados, revestidos, impregnados ou recobertos de plástico, de peso > 150 g/m2, em rolos ou folhas',
-    '48115129': 'Papel e cartão, coloridos ou decorados à superfície ou impressos, branqueados, revestidos, impregnados ou recobertos de plástico, de peso > 150 g/m2, em rolos ou folhas',
-    '48115130': 'Papel e cartão, coloridos ou decorados à superfície ou impressos, branqueados, revestidos, impregnados ou recobertos de plástico, de peso > 150 g/m2, em rolos ou folhas',
-    '48115910': 'Outros papéis e cartões coloridos ou decorados à superfície ou impressos, revestidos, impregnados ou recobertos de plástico, em rolos ou folhas',
-    '48115921': 'Outros papéis e cartões coloridos ou decorados à superfície ou impressos, revestidos, impregnados ou recobertos de plástico, em rolos ou folhas',
-    '48115922': 'Outros papéis e cartões coloridos ou decorados à superfície ou impressos, revestidos, impregnados ou recobertos de plástico, em rolos ou folhas',
-    '48115923': 'Outros papéis e cartões coloridos ou decorados à superfície ou impressos, revestidos, impregnados ou recobertos de plástico, em rolos ou folhas',
-    '48115929': 'Outros papéis e cartões coloridos ou decorados à superfície ou impressos, revestidos, impregnados ou recobertos de plástico, em rolos ou folhas',
-    '48115930': 'Outros papéis e cartões coloridos ou decorados à superfície ou impressos, revestidos, impregnados ou recobertos de plástico, em rolos ou folhas',
-    '48116010': 'Papel e cartão revestidos impregnados ou recobertos de cera, parafina, estearina, óleo ou glicerol, em rolos ou folhas',
-    '48116090': 'Papel e cartão revestidos impregnados ou recobertos de cera, parafina, estearina, óleo ou glicerol, em rolos ou folhas',
-    '48119010': 'Outros papéis, cartões, pasta de celulose e mantas de fibras de celulose, em rolos ou folhas',
-    '48119019': 'Outros papéis, cartões, pasta de celulose e mantas de fibras de celulose, em rolos ou folhas',
-    '48119020': 'Outros papéis, cartões, pasta de celulose e mantas de fibras de celulose, em rolos ou folhas',
-    '48119090': 'Outros papéis, cartões, pasta de celulose e mantas de fibras de celulose, em rolos ou folhas',
-    '48120000': 'Blocos e chapas, filtrantes, de pasta de papel',
-    '48131000': 'Papel para cigarros, em cadernos ou em tubos',
-    '48132000': 'Papel para cigarros, em rolos de largura <= 5 cm',
-    '48139000': 'Outros papéis para cigarros',
-    '48142000': 'Papel de parede, revestido do lado direito por uma camada de plástico granida, colorida ou decorada',
-    '48149000': 'Outros papéis de parede e revestimentos de paredes; papel para vitrais',
-    '48162000': 'Papel autocopiativo, mesmo em caixas',
-    '48169010': 'Outros papéis para cópia ou duplicação, mesmo em caixas',
-    '48169090': 'Outros papéis para cópia ou duplicação, mesmo em caixas',
-    '48171000': 'Envelopes de papel ou cartão',
-    '48172000': 'Aerogramas, bilhetes-postais não ilustrados, cartões para correspondência',
-    '48173000': 'Caixas, sacos e semelhantes, de papel ou cartão, contendo um sortido de artigos para correspondência',
-    '48181000': 'Papel higiênico',
-    '48182000': 'Lenços e toalhas de mão, de papel',
-    '48183000': 'Toalhas e guardanapos, de papel, de mesa',
-    '48185000': 'Vestuário e seus acessórios, de pasta de papel, papel, pasta (ouate) de celulose ou de mantas de fibras de celulose',
-    '48189010': 'Outros artigos de papel, para uso sanitário, da espécie doméstica ou hospitalar',
-    '48189090': 'Outros artigos de papel, para uso sanitário, da espécie doméstica ou hospitalar',
-    '48191000': 'Caixas de papel ou cartão, ondulados (canelados)',
-    '48192000': 'Caixas e cartonagens, dobráveis, de papel ou cartão, não ondulados',
-    '48193000': 'Sacos de papel ou cartão, cuja base tenha largura => 40 cm',
-    '48194000': 'Outros sacos, bolsas e cartuchos, de papel ou cartão',
-    '48195000': 'Outros embalagens de papel ou cartão, incluídas as capas para discos',
-    '48196000': 'Cartonagens para escritórios, lojas e estabelecimentos semelhantes',
-    '48201000': 'Livros de registro, de contabilidade, blocos de notas, agendas e artigos semelhantes',
-    '48202000': 'Cadernos',
-    '48203000': 'Classificadores, capas para encadernação, de papel ou cartão',
-    '48204000': 'Formulários em blocos tipo manifold, mesmo com papel-carbono',
-    '48205000': 'Álbuns para amostras ou coleções, de papel ou cartão',
-    '48209000': 'Outros artigos de papel ou cartão, para escritório ou papelaria',
-    '48211000': 'Etiquetas de papel ou cartão, impressas',
-    '48219000': 'Outros etiquetas de papel ou cartão',
-    '48221000': 'Carretéis, bobinas, canelas e suportes semelhantes, de papel ou cartão, para enrolamento de fios têxteis',
-    '48229000': 'Carreteis, bobinas, canelas e suportes semelhantes, de pasta de papel, papel ou cartão, mesmo perfurados ou endurecidos, para outros usos',
-    '48232010': 'Papel-filtro e cartão-filtro, cortados em forma própria',
-    '48232091': 'Papel-filtro e cartão-filtro, cortados em forma própria',
-    '48232099': 'Papel-filtro e cartão-filtro, cortados em forma própria',
-    '48234000': 'Papel-diagrama para aparelhos registradores, em bobinas, folhas ou discos',
-    '48236100': 'Bandejas, travessas, pratos, xícaras ou chávenas, taças, copos e artigos semelhantes, de bambu',
-    '48236900': 'Bandejas, travessas, pratos, xícaras ou chávenas, taças, copos e artigos semelhantes, de papel ou cartão',
-    '48237000': 'Artigos moldados ou prensados, de pasta de papel',
-    '48239010': 'Outros papéis, cartões, pasta de celulose e mantas de fibras de celulose, cortados em forma própria, e suas obras',
-    '48239020': 'Outros papéis, cartões, pasta de celulose e mantas de fibras de celulose, cortados em forma própria, e suas obras',
-    '48239091': 'Outros papéis, cartões, pasta de celulose e mantas de fibras de celulose, cortados em forma própria, e suas obras',
-    '48239099': 'Outros papéis, cartões, pasta de celulose e mantas de fibras de celulose, cortados em forma própria, e suas obras',
-    '49011000': 'Livros, brochuras, impressos semelhantes, em folhas soltas, mesmo dobradas',
-    '49019100': 'Dicionários e enciclopédias, mesmo em fascículos',
-    '49019900': 'Outros livros, brochuras e impressos semelhantes',
-    '49021000': 'Jornais e publicações periódicas, impressos, mesmo ilustrados, com freqüência => 4 vezes/semana',
-    '49029000': 'Outros jornais e publicações periódicas ou impressos, mesmo ilustrados',
-    '49030000': 'Álbuns ou livros de ilustrações e álbuns para desenhar ou colorir, para crianças',
-    '49040000': 'Música manuscrita ou impressa, ilustrada ou não, mesmo encadernada',
-    '49051000': 'Globos (obra cartográfica, impressa)',
-    '49052000': 'Mapas e cartas hidrográficas ou similares de todos os tipos, incluindo atlas, mapas de parede, plantas topográficas e globos, impressos, em forma de livro',
-    '49059000': 'Outros mapas e cartas hidrográficas ou similares de todos os tipos, incluindo atlas, mapas de parede, plantas topográficas e globos, não classificados nos códigos anteriores',
-    '49059100': 'Obras cartográficas, impressas sob a forma de livros ou brochuras',
-    '49059900': 'Outros obras cartográficas, impressas',
-    '49060000': 'Planos, plantas e desenhos de arquitetura ou de engenharia e desenhos industriais ou semelhantes, feitos a mão; textos manuscritos; reproduções ou cópias do material acima referido',
-    '49070010': 'Selos postais ou fiscais, não obliterados; papel selado, papel-moeda, cheques, certificados de ações ou de obrigações e títulos semelhantes',
-    '49070090': 'Selos postais ou fiscais, não obliterados; papel selado, papel-moeda, cheques, certificados de ações ou de obrigações e títulos semelhantes',
-    '49081000': 'Decalcomanias vitrificáveis',
-    '49089000': 'Outras decalcomanias de qualquer espécie',
-    '49090000': 'Cartões-postais, impressos ou ilustrados; cartões impressos, mesmo ilustrados, com ou sem envelopes',
-    '49100000': 'Calendários impressos, inclusive blocos-calendário para desfolhar',
-    '49111010': 'Impressos publicitários, catálogos comerciais e semelhantes',
-    '49111090': 'Impressos publicitários, catálogos comerciais e semelhantes',
-    '49119100': 'Estampas, gravuras e fotografias',
-    '49119900': 'Outros impressos',
-    '50010000': 'Casulos de bicho-da-seda próprios para dobar',
-    '50020000': 'Seda crua (não fiada)',
-    '50030010': 'Desperdícios de seda (incluídos os casulos de bicho-da-seda impróprios para dobar, os desperdícios de fios e os fiapos)',
-    '50030090': 'Desperdícios de seda (incluídos os casulos de bicho-da-seda impróprios para dobar, os desperdícios de fios e os fiapos)',
-    '50040000': 'Fios de seda, não acondicionados para venda a retalho',
-    '50050000': 'Fios de desperdícios de seda, não acondicionados para venda a retalho',
-    '50060000': 'Fios de seda ou de desperdícios de seda, para venda a retalho; pêlo de Messina (crina de Florença)',
-    '50071010': 'Tecidos de bourrette, de seda',
-    '50071090': 'Tecidos de bourrette, de seda',
-    '50072010': 'Outros tecidos de seda e seus desperdícios, exceto bourrette, contendo => 85%, em peso de seda',
-    '50072090': 'Outros tecidos de seda e seus desperdícios, exceto bourrette, contendo => 85%, em peso de seda',
-    '50079000': 'Outros tecidos de seda e seus desperdícios',
-    '51011110': 'Lã de tosquia suja, incluída a lã lavada a dorso, não cardada nem penteada',
-    '51011190': 'Lã de tosquia suja, incluída a lã lavada a dorso, não cardada nem penteada',
-    '51011900': 'Outras lãs sujas, incluída a lã lavada a dorso, não cardadas nem penteadas',
-    '51012100': 'Lã de tosquia, desengordurada, não carbonizada, não cardada nem penteada',
-    '51031000': 'Desperdícios da penteação de lã ou de pêlos finos',
-    '51051000': 'Lã cardada',
-    '51052910': 'Outra lã penteada',
-    '51053900': 'Outros pêlos finos, cardados ou penteados',
-    '51054000': 'Pêlos grosseiros, cardados ou penteados',
-    '51061000': 'Fios de lã cardada, contendo => 85%, em peso, de lã',
-    '51062000': 'Fios de lã cardada, contendo < 85%, em peso, de lã',
-    '51071011': 'Fios de lã penteada, contendo => 85%, em peso, de lã',
-    '51071019': 'Fios de lã penteada, contendo => 85%, em peso, de lã',
-    '51071090': 'Fios de lã penteada, contendo => 85%, em peso, de lã',
-    '51072000': 'Fios de lã penteada, contendo < 85%, em peso, de lã',
-    '51091000': 'Fios de lã ou de pêlos finos, contendo => 85%, em peso de lã ou de pêlos finos, para venda a retalho',
-    '51099000': 'Outros fios de lã ou de pêlos finos, para venda a retalho',
-    '51111110': 'Tecidos contendo => 85% em peso de lã cardada ou de pêlos finos cardados, de peso <= 300 g/m2',
-    '51111900': 'Outros tecidos contendo => 85% em peso de lã cardada ou de pêlos finos cardados',
-    '51112000': 'Tecidos de lã cardada ou de pêlos finos cardados, combinados com filamentos sintéticos ou artificiais',
-    '51113090': 'Tecidos de lã cardada ou de pêlos finos cardados, combinados com fibras sintéticas ou artificiais descontínuas',
-    '51119000': 'Outros tecidos de lã cardada ou de pêlos finos cardados',
-    '51121100': 'Tecidos contendo => 85% em peso de lã penteada ou de pêlos finos penteados, de peso <= 200 g/m2',
-    '51121910': 'Outros tecidos contendo => 85% em peso de lã penteada ou de pêlos finos penteados',
-    '51122010': 'Tecidos de lã penteada ou de pêlos finos penteados, combinados com filamentos sintéticos ou artificiais',
-    '51123010': 'Tecidos de lã penteada ou de pêlos finos penteados, combinados com fibras sintéticas ou artificiais descontínuas',
-    '51129000': 'Outros tecidos de lã penteada ou de pêlos finos penteados',
-    '51130012': 'Tecidos de pêlos grosseiros ou de crina',
-    '51130020': 'Tecidos de pêlos grosseiros ou de crina',
-    '52010020': 'Algodão, não cardado nem penteado',
-    '52010090': 'Algodão, não cardado nem penteado',
-    '52021000': 'Desperdícios de fios de algodão',
-    '52029100': 'Desperdícios de fiapos de algodão',
-    '52029900': 'Outros desperdícios de algodão',
-    '52030000': 'Algodão cardado ou penteado',
-    '52041111': 'Linhas para costurar, contendo => 85% em peso de algodão, não acondicionadas para venda a retalho',
-    '52041112': 'Linhas para costurar, contendo => 85% em peso de algodão, não acondicionadas para venda a retalho',
-    '52041120': 'Linhas para costurar, contendo => 85% em peso de algodão, não acondicionadas para venda a retalho',
-    '52041131': 'Linhas para costurar, contendo => 85% em peso de algodão, não acondicionadas para venda a retalho',
-    '52041132': 'Linhas para costurar, contendo => 85% em peso de algodão, não acondicionadas para venda a retalho',
-    '52041140': 'Linhas para costurar, contendo => 85% em peso de algodão, não acondicionadas para venda a retalho',
-    '52041912': 'Outras linhas para costurar, de algodão, não acondicionadas para venda a retalho',
-    '52041920': 'Outras linhas para costurar, de algodão, não acondicionadas para venda a retalho',
-    '52041931': 'Outras linhas para costurar, de algodão, não acondicionadas para venda a retalho',
-    '52041932': 'Outras linhas para costurar, de algodão, não acondicionadas para venda a retalho',
-    '52041940': 'Outras linhas para costurar, de algodão, não acondicionadas para venda a retalho',
-    '52042000': 'Linhas para costurar, de algodão, para venda a retalho',
-    '52051100': 'Fios de algodão simples, de fibras não penteadas, contendo => 85% em peso de algodão, título => 714,29 decitex, não acondicionadas para venda a retalho',
-    '52051200': 'Fios de algodão simples, de fibras não penteadas, contendo => 85% em peso de algodão, título => 232,56 decitex, mas < 714,29 decitex, não acondicionados para venda a retalho',
-    '52051310': 'Fios de algodão simples, de fibras não penteadas, contendo => 85% em peso de algodão, título => 192,31 decitex, mas < 232,56 decitex, não acondicionados para venda a retalho',
-    '52051390': 'Fios de algodão simples, de fibras não penteadas, contendo => 85% em peso de algodão, título => 192,31 decitex, mas < 232,56 decitex, não acondicionados para venda a retalho',
-    '52051400': 'Fios de algodão simples, de fibras não penteadas, contendo => 85% em peso de algodão, título => 125 decitex, mas < 192,31 decitex, não acondicionados para venda a retalho',
-    '52052200': 'Fios de algodão simples, de fibras penteadas, contendo => 85% em peso de algodão, título => 232,56 decitex, mas < 714,29 decitex, não acondicionados para venda a retalho',
-    '52052310': 'Fios de algodão simples, de fibras penteadas, contendo => 85% em peso de algodão, título => 192,31 decitex, mas < 232,56 decitex, não acondicionados para venda a retalho',
-    '52052390': 'Fios de algodão simples, de fibras penteadas, contendo => 85% em peso de algodão, título => 192,31 decitex, mas < 232,56 decitex, não acondicionados para venda a retalho',
-    '52052400': 'Fios de algodão simples, de fibras penteadas, contendo => 85% em peso de algodão, título => 125 decitex, mas < 192,31 decitex, não acondicionados para venda a retalho',
-    '52052600': 'Fios de algodão simples, de fibras penteadas, contendo => 85% em peso de algodão, título => 106,38 decitex, mas < 125 decitex, não acondicionados para venda a retalho',
-    '52053100': 'Fios de algodão retorcidos ou retorcidos múltiplos, de fibras não penteadas, contendo => 85% em peso de algodão, título => 714,29 decitex, não acondicionados para venda a retalho',
-    '52053200': 'Fios de algodão retorcidos ou retorcidos múltiplos, de fibras não penteadas, contendo => 85% em peso de algodão, título => 232,56 decitex, mas < 714,29 decitex, não acondicionados para venda a retalho',
-    '52053300': 'Fios de algodão retorcidos ou retorcidos múltiplos, de fibras não penteadas, contendo => 85% em peso de algodão, título => 192,31 decitex, mas < 232,56 decitex, não acondicionados para venda a retalho',
-    '52053400': 'Fios de algodão retorcidos ou retorcidos múltiplos, de fibras não penteadas, contendo => 85% em peso de algodão, título => 125 decitex, mas < 192,31 decitex por fio simples, não acondicionados para venda a retalho',
-    '52054100': 'Fios de algodão retorcidos ou retorcidos múltiplos, de fibras penteadas, contendo => 85% em peso de algodão, título => 714,29 decitex por fio simples, não acondicionados para venda a retalho',
-    '52054300': 'Fios de algodão retorcidos ou retorcidos múltiplos, de fibras penteadas, contendo => 85% em peso de algodão, título => 192,31 decitex, mas < 232,56 decitex, não acondicionados para venda a retalho',
-    '52054700': 'Fios de algodão retorcidos ou retorcidos múltiplos, de fibras penteadas, contendo => 85% em peso de algodão, título => 83,33 decitex, mas < 106,38 decitex, não acondicionados para venda a retalho',
-    '52061100': 'Fios de algodão simples, de fibras não penteadas, contendo < 85% em peso de algodão, título => 714,29 decitex, não acondicionados para venda a retalho',
-    '52061200': 'Fios de algodão simples, de fibras não penteadas, contendo < 85% em peso de algodão, título => 232,56 decitex, mas < 714,29 decitex, não acondicionados para venda a retalho',
-    '52061300': 'Fios de algodão simples, de fibras não penteadas, contendo < 85% em peso de algodão, título => 192,31 decitex, mas < 232,56 decitex, não acondicionados para venda a retalho',
-    '52062100': 'Fios de algodão simples, de fibras penteadas, contendo < 85% em peso de algodão, título => 714,29 decitex, não acondicionados para venda a retalho',
-    '52062200': 'Fios de algodão simples, de fibras penteadas, contendo < 85% em peso de algodão, título => 232,56 decitex, mas < 714,29 decitex, não acondicionados para venda a retalho',
-    '52062300': 'Fios de algodão simples, de fibras penteadas, contendo < 85% em peso de algodão, título => 192,31 decitex, mas < 232,56 decitex, não acondicionados para venda a retalho',
-    '52063100': 'Fios de algodão retorcidos ou retorcidos múltiplos, de fibras não penteadas, contendo < 85% em peso de algodão, título => 714,29 decitex por fio simples, não acondicionados para venda a retalho',
-    '52063200': 'Fios de algodão retorcidos ou retorcidos múltiplos, de fibras não penteadas, contendo < 85% em peso de algodão, título => 232,56 decitex, mas < 714,29 decitex por fio simples, não acondicionados para venda a retalho',
-    '52063500': 'Fios de algodão retorcidos ou retorcidos múltiplos, de fibras não penteadas, contendo < 85% em peso de algodão, título < 125 decitex por fio simples, não acondicionados para venda a retalho',
-    '52064100': 'Fios de algodão retorcidos ou retorcidos múltiplos, de fibras penteadas, contendo < 85% em peso de algodão, título => 714,29 decitex por fio simples, não acondicionados para venda a retalho',
-    '52064200': 'Fios de algodão retorcidos ou retorcidos múltiplos, de fibras penteadas, contendo < 85% em peso de algodão, título => 232,56 decitex, mas < 714,29 decitex por fio simples, não acondicionados para venda a retalho',
-    '52071000': 'Fios de algodão, para venda a retalho, contendo => 85% em peso de algodão',
-    '52079000': 'Outros fios de algodão, para venda a retalho',
-    '52081100': 'Tecido de algodão cru, em ponto de tafetá, contendo => 85% em peso de algodão, com peso <= 100 g/m2',
-    '52081200': 'Tecido de algodão cru, em ponto de tafetá, contendo = > 85% em peso de algodão, com peso > 100 g/m2 e <= 200 g/m2',
-    '52081300': 'Tecido de algodão cru, em ponto sarjado, contendo => 85% em peso de algodão, com peso <= 200 g/m2',
-    '52081900': 'Outros tecidos de algodão cru, contendo => 85% em peso de algodão, com peso <= 200 g/m2',
-    '52082100': 'Tecido de algodão branqueado, em ponto de tafetá, contendo => 85% em peso de algodão,com peso <= 100 g/m2',
-    '52082200': 'Tecido de algodão branqueado, em ponto de tafetá, contendo => 85% em peso de algodão, com peso > 100 g/m2 e <= 200 g/m2',
-    '52082300': 'Tecido de algodão branqueado, em ponto sarjado, contendo => 85% em peso de algodão, com peso <= 200 g/m2',
-    '52082900': 'Outros tecidos de algodão branqueado, contendo => 85% em peso de algodão, com peso <= 200 g/m2',
-    '52083100': 'Tecido de algodão tinto, em ponto de tafetá, contendo => 85% em peso de algodão, com peso <= 100 g/m2',
-    '52083200': 'Tecido de algodão tinto, em ponto de tafetá, contendo => 85% em peso de algodão, com peso > 100 g/m2 e <= 200 g/m2',
-    '52083300': 'Tecido de algodão tinto, em ponto sarjado, contendo => 85% em peso de algodão, com peso <= 200 g/m2',
-    '52083900': 'Outros tecidos de algodão tinto, contendo => 85% em peso de algodão, com peso <= 200 g/m2',
-    '52084100': 'Tecido de algodão, fios de diversas cores, em ponto de tafetá, contendo => 85% em peso de algodão, com peso <= 100 g/m2',
-    '52084200': 'Tecido de algodão, fios de diversas cores, em ponto de tafetá, contendo => 85% em peso de algodão, com peso => 100 g/m2 e <= 200 g/m2',
-    '52084300': 'Tecido de algodão, fios de diversas cores, em ponto sarjado, contendo => 85% em peso de algodão, com peso <= 200 g/m2',
-    '52084900': 'Outros tecidos de algodão, fios de diversas cores, contendo => 85% em peso de algodão, com peso <= 200 g/m2',
-    '52085100': 'Tecido de algodão estampado, em ponto de tafetá, contendo => 85% em peso de algodão, com peso <= 100 g/m2',
-    '52085200': 'Tecido algodão estampado, em ponto de tafetá, contendo => 85% em peso de algodão, com peso > 100 g/m2 e <= 200 g/m2',
-    '52085910': 'Outros tecidos de algodão estampado, contendo => 85% em peso de algodão, com peso <= 200 g/m2',
-    '52085990': 'Outros tecidos de algodão estampado, contendo => 85% em peso de algodão, com peso <= 200 g/m2',
-    '52091100': 'Tecido de algodão cru, em ponto de tafetá, contendo => 85% em peso de algodão, com peso > 200 g/m2',
-    '52091200': 'Tecido de algodão cru, em ponto sarjado, contendo => 85% em peso de algodão, com peso > 200 g/m2',
-    '52091900': 'Outros tecidos de algodão cru, contendo => 85% em peso de algodão, com peso > 200 g/m2',
-    '52092100': 'Tecido de algodão branqueado, em ponto de tafetá, contendo => 85% em peso de algodão, com peso > 200 g/m2',
-    '52092200': 'Tecido de algodão branqueado, em ponto sarjado, contendo => 85% em peso de algodão, com peso > 200 g/m2',
-    '52092900': 'Outros tecidos de algodão branqueado, contendo => 85% em peso de algodão, com peso > 200 g/m2',
-    '52093100': 'Tecido de algodão tinto, em ponto de tafetá, contendo => 85% em peso de algodão, com peso > 200 g/m2',
-    '52093200': 'Tecido de algodão tinto, em ponto sarjado, contendo => 85% em peso de algodão, com peso > 200 g/m2',
-    '52093900': 'Outros tecidos de algodão tinto, contendo => 85% em peso de algodão, com peso > 200 g/m2',
-    '52094100': 'Tecido de algodão, fios de diversas cores, em ponto tafetá, contendo => 85% em peso de algodão, com peso > 200 g/m2',
-    '52094210': 'Tecidos de algodão, fios de diversas cores, denim, contendo => 85% em peso de algodão, com peso > 200 g/m2',
-    '52094290': 'Tecidos de algodão, fios de diversas cores, denim, contendo => 85% em peso de algodão, com peso > 200 g/m2',
-    '52094300': 'Tecido de algodão, fios de diversas cores, em ponto sarjado, contendo => 85% em peso de algodão, com peso > 200 g/m2',
-    '52094900': 'Outros tecidos de algodão, fios de diversas cores, contendo => 85% em peso de algodão, com peso > 200 g/m2',
-    '52095100': 'Tecido de algodão estampado, em ponto de tafetá, contendo => 85% em peso de algodão, com peso > 200 g/m2',
-    '52095200': 'Tecido de algodão estampado, em ponto sarjado, contendo => 85% em peso de algodão, com peso > 200 g/m2',
-    '52095900': 'Outros tecidos de algodão estampado, contendo => 85% em peso de algodão, com peso > 200 g/m2',
-    '52101100': 'Tecido de algodão cru, com fibras sintéticas ou artificiais, em ponto de tafetá, contendo < 85% em peso de algodão, com peso <= 200 g/m2',
-    '52101910': 'Outros tecidos de algodão cru, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso <= 200 g/m2',
-    '52101990': 'Outros tecidos de algodão cru, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso <= 200 g/m2',
-    '52102100': 'Tecido de algodão branqueado, em ponto de tafetá, com fibras sintéticas ou artificiais, contendo < 85%em peso de algodão, com peso <= 200 g/m2',
-    '52102910': 'Outros tecidos de algodão branqueados, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso <= 200 g/m2',
-    '52102990': 'Outros tecidos de algodão branqueados, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso <= 200 g/m2',
-    '52103100': 'Tecido de algodão tinto, em ponto de tafetá, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso <= 200 g/m2',
-    '52103200': 'Tecido de algodão tinto, em ponto sarjado, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso <= 200 g/m2',
-    '52103900': 'Outros tecidos de algodão tinto, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso <= 200 g/m2',
-    '52104100': 'Tecido de algodão, fios de diversas cores, em ponto de tafetá, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso <= 200 g/m2',
-    '52104910': 'Outros tecidos de algodão, de fios de diversas cores, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso <= 200 g/m2',
-    '52104990': 'Outros tecidos de algodão, de fios de diversas cores, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso <= 200 g/m2',
-    '52105100': 'Tecido de algodão estampado, em ponto de tafetá, com fibras sintéticas ou artificiais, contendo < 85%em peso de algodão, com peso <= 200 g/m2',
-    '52105910': 'Outros tecidos de algodão estampados, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso <= 200 g/m2',
-    '52105990': 'Outros tecidos de algodão estampados, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso <= 200 g/m2',
-    '52111100': 'Tecido de algodão cru, em ponto de tafetá, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso > 200 g/m2',
-    '52111200': 'Tecido de algodão cru, em ponto sarjado, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso > 200 g/m2',
-    '52111900': 'Outros tecidos de algodão cru, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso > 200 g/m2',
-    '52112020': 'Tecidos de algodão, branqueados, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso > 200 g/m2',
-    '52112090': 'Tecidos de algodão, branqueados, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso > 200 g/m2',
-    '52113100': 'Tecido de algodão tinto, em ponto de tafetá, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso > 200 g/m2',
-    '52113200': 'Tecido de algodão tinto, em ponto sarjado, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso > 200 g/m2',
-    '52113900': 'Outros tecidos de algodão tinto, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso > 200 g/m2',
-    '52114100': 'Tecido de algodão, de fios de diversas cores, em ponto de tafetá, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso > 200 g/m2',
-    '52114210': 'Tecidos de algodão, de fios de diversas cores, denim, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso > 200 g/m2',
-    '52114290': 'Tecidos de algodão, de fios de diversas cores, denim, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso > 200 g/m2',
-    '52114300': 'Tecido de algodão, de fios de diversas cores, em ponto sarjado, contendo < 85% em peso de algodão, com peso > 200 g/m2',
-    '52114900': 'Outros tecidos de algodão, de fios de diversas cores, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso > 200 g/m2',
-    '52115100': 'Tecido de algodão estampado, em ponto de tafetá, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso > 200 g/m2',
-    '52115200': 'Tecido de algodão estampado, em ponto sarjado, com fibras sintéticas ou artificiais, contendo < 85%em peso de algodão, com peso > 200 g/m2',
-    '52115900': 'Outros tecidos de algodão estampados, com fibras sintéticas ou artificiais, contendo < 85% em peso de algodão, com peso > 200 g/m2',
-    '52121100': 'Outros tecidos de algodão crus, com peso <= 200 g/m2',
-    '52121200': 'Outros tecidos de algodão branqueados, com peso <= 200 g/m2',
-    '52121300': 'Outros tecidos de algodão tintos, com peso <= 200 g/m2',
-    '52121400': 'Outros tecidos de algodão, de fios de diversas cores, com peso <= 200 g/m2',
-    '52121500': 'Outros tecidos de algodão estampados, com peso <= 200 g/m2',
-    '52122100': 'Outros tecidos de algodão crus, com peso > 200 g/m2',
-    '52122200': 'Outros tecidos de algodão branqueados, com peso > 200 g/m2',
-    '52122300': 'Outros tecidos de algodão tintos, com peso > 200 g/m2',
-    '52122400': 'Outros tecidos de algodão, de fios de diversas cores, com peso > 200 g/m2',
-    '52122500': 'Outros tecidos de algodão estampados, com peso > 200 g/m2',
-    '53011000': 'Linho em bruto ou macerado',
-    '53012990': 'Linho penteado ou trabalhado de outra forma, mas não fiado',
-    '53013000': 'Estopas e desperdícios de linho',
-    '53029000': 'Cânhamo trabalhado, mas não fiado; estopas e desperdícios',
-    '53031010': 'Juta e outras fibras têxteis liberianas, em bruto ou maceradas',
-    '53031090': 'Juta e outras fibras têxteis liberianas, em bruto ou maceradas',
-    '53039010': 'Juta e outras fibras têxteis liberianas trabalhadas, mas não fiadas; estopas e desperdícios',
-    '53039090': 'Juta e outras fibras têxteis liberianas trabalhadas, mas não fiadas; estopas e desperdícios',
-    '53050010': 'Cairo (fibras de coco), abacá (cânhamo-de-manilha ou Musa textilis Nee), rami e outras fibras têxteis vegetais não especificadas nem compreendidas noutras posições, em bruto ou trabalhados, mas não fiados; estopas e desperdícios destas fibras (incluídos o',
-    '53050090': 'Cairo (fibras de coco), abacá (cânhamo-de-manilha ou Musa textilis Nee), rami e outras fibras têxteis vegetais não especificadas nem compreendidas noutras posições, em bruto ou trabalhados, mas não fiados; estopas e desperdícios destas fibras (incluídos o',
-    '53062000': 'Fios de linho, retorcidos ou retorcidos múltiplos',
-    '53071010': 'Fios simples de juta ou de outras fibras liberianas da posição 5303',
-    '53071090': 'Fios simples de juta ou de outras fibras liberianas da posição 5303',
-    '53072010': 'Fios múltiplos de juta ou de outras fibras liberianas da posição 5303, retorcidos ou retorcidos',
-    '53081000': 'Fios de cairo (fios de fibras de coco)',
-    '53089000': 'Fios de outras fibras têxteis vegetais',
-    '53091100': 'Tecidos de linho crus ou branqueados, contendo => 85% em peso de linho',
-    '53091900': 'Outros tecidos de linho, contendo => 85% em peso de linho',
-    '53092100': 'Tecidos de linho crus ou branqueados, contendo < 85% em peso de linho',
-    '53092900': 'Outros tecidos de linho, contendo < 85% em peso de linho',
-    '53101010': 'Tecidos de juta crus ou de outras fibras têxteis liberianas da posição 5303',
-    '53101090': 'Tecidos de juta crus ou de outras fibras têxteis liberianas da posição 5303',
-    '53109000': 'Outros tecidos de juta ou outras fibras têxteis liberianas da posição 5303',
-    '53110000': 'Tecidos de outras fibras têxteis vegetais ou de fios de papel',
-    '54011011': 'Linhas para costurar, de filamentos sintéticos, mesmo acondicionados para venda a retalho',
-    '54011012': 'Linhas para costurar, de filamentos sintéticos, mesmo acondicionados para venda a retalho',
-    '54011090': 'Linhas para costurar, de filamentos sintéticos, mesmo acondicionados para venda a retalho',
-    '54012012': 'Linhas para costurar, de filamentos artificiais, mesmo acondicionados para venda a retalho',
-    '54012090': 'Linhas para costurar, de filamentos artificiais, mesmo acondicionados para venda a retalho',
-    '54021100': 'Fios de alta tenacidade de aramidas',
-    '54021910': 'Outros fios de alta tenacidade, de náilon ou de outras poliamidas',
-    '54021990': 'Outros fios de alta tenacidade, de náilon ou de outras poliamidas',
-    '54022000': 'Fios de alta tenacidade, de poliésteres',
-    '54022090': 'Fios de alta tenacidade, de poliésteres',
-    '54023111': 'Fios texturizados, de náilon ou de outras poliamidas, título <= 50 tex por fio simples',
-    '54023119': 'Fios texturizados, de náilon ou de outras poliamidas, título <= 50 tex por fio simples',
-    '54023190': 'Fios texturizados, de náilon ou de outras poliamidas, título <= 50 tex por fio simples',
-    '54023211': 'Fios texturizados, de náilon de outras poliamidas, título > 50 tex por fio simples',
-    '54023219': 'Fios texturizados, de náilon de outras poliamidas, título > 50 tex por fio simples',
-    '54023290': 'Fios texturizados, de náilon de outras poliamidas, título > 50 tex por fio simples',
-    '54023310': 'Fios texturizados de poliésteres',
-    '54023320': 'Fios texturizados de poliésteres',
-    '54023390': 'Fios texturizados de poliésteres',
-    '54023400': 'Fios texturizados de polipropileno',
-    '54023900': 'Outros fios texturizados de filamentos sintéticos',
-    '54024400': 'Outros fios simples de elastômeros, sem torção ou  com torção <= 50 voltas por metro',
-    '54024510': 'Outros fios simples de náilon ou de outras poliamidas, sem torção ou com torção <= 50 voltas por metro',
-    '54024520': 'Outros fios simples de náilon ou de outras poliamidas, sem torção ou com torção <= 50 voltas por metro',
-    '54024590': 'Outros fios simples de náilon ou de outras poliamidas, sem torção ou com torção <= 50 voltas por metro',
-    '54024600': 'Outros fios simples de poliésteres parcialmente orientados, sem torção ou com torção <= 50 voltas por metro',
-    '54024710': 'Outros fios simples de poliésteres, sem torção ou com torção <= 50 voltas por metro',
-    '54024720': 'Outros fios simples de poliésteres, sem torção ou com torção <= 50 voltas por metro',
-    '54024790': 'Outros fios simples de poliésteres, sem torção ou com torção <= 50 voltas por metro',
-    '54024800': 'Outros fios simples de polipropileno, sem torção ou com torção <= 50 voltas por metro',
-    '54024910': 'Outros fios simples de filamentos sintéticos, sem torção ou com torção <= 50 voltas por metro',
-    '54024990': 'Outros fios simples de filamentos sintéticos, sem torção ou com torção <= 50 voltas por metro',
-    '54025110': 'Fios simples, de náilon ou de outras poliamidas, com torção > 50 voltas por metro',
-    '54025190': 'Fios simples, de náilon ou de outras poliamidas, com torção > 50 voltas por metro',
-    '54025200': 'Fios simples, de poliésteres, com torção > 50 voltas por metro',
-    '54025300': 'Outros fios, simples, com torção superior a 50 voltas por metro, de polipropileno',
-    '54025900': 'Outros fios simples, de filamentos sintéticos, com torção > 50 voltas por metro',
-    '54026110': 'Fios de náilon ou de outras poliamidas, retorcidos ou retorcidos múltiplos',
-    '54026190': 'Fios de náilon ou de outras poliamidas, retorcidos ou retorcidos múltiplos',
-    '54026200': 'Fios de poliésteres, retorcidos ou retorcidos múltiplos',
-    '54026300': 'Outros fios, retorcidos ou retorcidos múltiplos, de polipropileno',
-    '54026900': 'Outros fios de filamentos sintéticos, retorcidos ou retorcidos múltiplos',
-    '54033110': 'Fios simples, de raiom viscose, sem torção ou com torção <= 120 voltas por metro',
-    '54033190': 'Fios simples, de raiom viscose, sem torção ou com torção <= 120 voltas por metro',
-    '54033300': 'Fios simples, de filamentos de acetato de celulose',
-    '54034100': 'Fios de raiom de viscose, retorcidos ou retorcidos múltiplos',
-    '54034900': 'Outros fios de filamentos artificiais, retorcidos ou retorcidos múltiplos',
-    '54041100': 'Monofilamentos de elastômeros, título => 67 decitex e seção transversal <= 1 mm, com largura <= 5mm',
-    '54041200': 'Outros monofilamentos de polipropileno, título => 67 decitex e seção transversal <= 1 mm, com largura <= 5mm',
-    '54041919': 'Outros monofilamentos sintéticos, título => 67 decitex e seção transversal <= 1 mm, com largura <= 5mm',
-    '54041990': 'Outros monofilamentos sintéticos, título => 67 decitex e seção transversal <= 1 mm, com largura <= 5mm',
-    '54049000': 'Outras lâminas e formas semelhantes, de matérias têxteis sintéticas, largura <= 5 mm',
-    '54050000': 'Monofilamentos artificiais, título => 67 decitex e seção transversal <= 1 mm; lâminas e formas semelhantes de matérias têxteis artificiais, com largura < = 5mm',
-    '54060010': 'Fios de filamentos sintéticos ou artificiais (exceto linhas para costurar), acondicionados para venda a retalho',
-    '54060020': 'Fios de filamentos sintéticos ou artificiais (exceto linhas para costurar), acondicionados para venda a retalho',
-    '54071011': 'Tecidos obtidos a partir de fios de alta tenacidade, de náilon ou de outras poliamidas ou de poliésteres',
-    '54071019': 'Tecidos obtidos a partir de fios de alta tenacidade, de náilon ou de outras poliamidas ou de poliésteres',
-    '54071021': 'Tecidos obtidos a partir de fios de alta tenacidade, de náilon ou de outras poliamidas ou de poliésteres',
-    '54071029': 'Tecidos obtidos a partir de fios de alta tenacidade, de náilon ou de outras poliamidas ou de poliésteres',
-    '54072000': 'Tecidos de filamentos sintéticos obtidos a partir de lâminas ou de formas semelhantes',
-    '54073000': 'Tecidos (mantas) de fios de filamento sintético',
-    '54074100': 'Outros tecidos, crus ou branqueados, contendo => 85%, em peso, de filamentos de náilon ou de outras poliamidas',
-    '54074200': 'Outros tecidos tintos, contendo => 85%, em peso, de filamentos de náilon ou de outras poliamidas',
-    '54074300': 'Outros tecidos, de fios de diversas cores, contendo => 85% em peso de filamentos de náilon ou de outras poliamidas',
-    '54074400': 'Outros tecidos estampados, contendo => 85% em peso de filamentos de náilon ou de outras poliamidas',
-    '54075100': 'Outros tecidos crus ou branqueados, contendo => 85% em peso de filamentos de poliéster texturizados',
-    '54075210': 'Outros tecidos tintos, contendo => 85% em peso de filamentos de poliéster texturizados',
-    '54075220': 'Outros tecidos tintos, contendo => 85% em peso de filamentos de poliéster texturizados',
-    '54075300': 'Outros tecidos, de fios de diversas cores, contendo => 85% em peso de filamentos de poliéster texturizados',
-    '54075400': 'Outros tecidos estampados, contendo => 85%, de filamentos de poliéster texturizados',
-    '54076100': 'Outros tecidos, contendo => 85% em peso, de filamentos de poliéster não texturizados',
-    '54076900': 'Outros tecidos, contendo => 85% em peso de outros filamentos de poliéster',
-    '54077100': 'Outros tecidos crus ou branqueados, contendo => 85% em peso de filamentos sintéticos',
-    '54077200': 'Outros tecidos tintos, contendo => 85% em peso de filamentos sintéticos',
-    '54077300': 'Outros tecidos, de fios de diversas cores, contendo => 85% em peso de filamentos sintéticos',
-    '54077400': 'Outros tecidos estampados, contendo => 85% em peso de filamentos sintéticos',
-    '54078100': 'Outros tecidos crus ou branqueados, contendo < 85% em peso de filamentos sintéticos, combinados com algodão',
-    '54078200': 'Outros tecidos tintos, contendo < 85% em peso de filamentos sintéticos, combinados com algodão',
-    '54078300': 'Outros tecidos, de fios de diversas cores, contendo < 85% em peso de filamentos sintéticos, combinados com algodão',
-    '54078400': 'Outros tecidos estampados, contendo < 85% em peso de filamentos sintéticos, combinados com algodão',
-    '54079100': 'Outros tecidos de filamentos sintéticos, crus ou branqueados',
-    '54079200': 'Outros tecidos de filamentos sintéticos, tintos',
-    '54079300': 'Outros tecidos de filamentos sintéticos, de fios de diversas cores',
-    '54079400': 'Outros tecidos estampados, contendo < 85% em peso de filamentos sintéticos',
-    '54081000': 'Tecidos de fios de alta tenacidade, de raiom viscose',
-    '54082100': 'Tecidos crus ou branqueados, contendo => 85% em peso de filamentos artificiais',
-    '54082200': 'Tecidos tintos, contendo => 85% em peso de filamentos artificiais',
-    '54082300': 'Tecidos, de fios de diversas cores, contendo => 85% em peso de filamentos artificiais',
-    '54082400': 'Tecidos estampados, contendo => 85% em peso de filamentos artificiais',
-    '54083100': 'Outros tecidos de filamentos artificiais, crus ou branqueados',
-    '54083200': 'Outros tecidos de filamentos artificiais, tintos',
-    '54083300': 'Outros tecidos de filamentos artificiais, de fios de diversas cores',
-    '54083400': 'Outros tecidos de filamentos artificiais, estampados',
-    '55011000': 'Cabos de náilon ou de outras poliamidas',
-    '55011100': 'Cabo de filamento sintético, de aramidas',
-    '55011900': 'Outros cabos de filamentos sintéticos, de nylon ou outras poliamidas, não classificados nos códigos anteriores',
-    '55012000': 'Cabos de poliésteres',
-    '55013000': 'Cabos acrílicos ou modacrílicos',
-    '55014000': 'Cabos de filamentos sintéticos de polipropileno',
-    '55019000': 'Cabos de outros filamentos sintéticos',
-    '55021000': 'Cabos de filamentos artificiais, de acetato de celulose',
-    '55031100': 'Fibras de aramida, não cardadas, não penteadas, para fiação',
-    '55031910': 'Outras fibras de náilon ou de outras poliamidas, não cardadas, não penteadas, para fiação',
-    '55031990': 'Outras fibras de náilon ou de outras poliamidas, não cardadas, não penteadas, para fiação',
-    '55032010': 'Fibras descontínuas de poliésteres, não cardadas, não penteadas, para fiação',
-    '55032090': 'Fibras descontínuas de poliésteres, não cardadas, não penteadas, para fiação',
-    '55033000': 'Fibras descontínuas acrílicas ou modacrílicas, não cardadas, não penteadas, para fiação',
-    '55034000': 'Fibras descontínuas de polipropileno, não cardadas, não penteadas, para fiação',
-    '55039010': 'Outras fibras sintéticas descontínuas, não cardadas, não penteadas, para fiação',
-    '55039020': 'Outras fibras sintéticas descontínuas, não cardadas, não penteadas, para fiação',
-    '55039090': 'Outras fibras sintéticas descontínuas, não cardadas, não penteadas, para fiação',
-    '55041000': 'Fibras descontínuas de raiom viscose, não cardadas, não penteadas, para fiação',
-    '55049010': 'Outras fibras artificiais descontínuas, não cardadas, não penteadas',
-    '55049090': 'Outras fibras artificiais descontínuas, não cardadas, não penteadas',
-    '55051000': 'Desperdícios de fibras sintéticas',
-    '55052000': 'Desperdícios de fibras artificiais',
-    '55061000': 'Fibras de náilon ou de outras poliamidas, cardadas, penteadas, para fiação',
-    '55062000': 'Fibras de poliésteres, cardadas, penteadas, para fiação',
-    '55064000': 'Fibras sintéticas descontínuas, cardadas, penteadas ou transformadas de outro modo para fiação, de polipropileno',
-    '55069000': 'Outras fibras sintéticas descontínuas, cardadas, penteadas',
-    '55070000': 'Fibras artificiais descontínuas, cardadas, penteadas, para fiação',
-    '55081000': 'Linhas para costurar, de fibras sintéticas descontínuas, mesmo para venda a retalho',
-    '55082000': 'Linhas para costurar, de fibras artificiais descontínuas, mesmo para venda a retalho',
-    '55091210': 'Fios retorcidos ou retorcidos múltiplos, de fibras descontínuas de náilon ou de outras poliamidas, contendo => 85% em peso destas fibras, não para venda a retalho',
-    '55091290': 'Fios retorcidos ou retorcidos múltiplos, de fibras descontínuas de náilon ou de outras poliamidas, contendo => 85% em peso destas fibras, não para venda a retalho',
-    '55092100': 'Fios simples, de fibras descontínuas de poliéster, contendo => 85% em peso destas fibras, não para venda a retalho',
-    '55092200': 'Fios retorcidos ou retorcidos múltiplos, de fibras descontínuas de poliéster, contendo => 85% em peso destas fibras, não para venda a retalho',
-    '55093100': 'Fios simples, de fibras descontínuas acrílicas ou modacrílicas, contendo => 85% em peso destas fibras, não para venda a retalho',
-    '55093200': 'Fios retorcidos ou retorcidos múltiplos, de fibras descontínuas acrílicas ou modacrílicas, contendo => 85% em peso destas fibras, não para venda a retalho',
-    '55094100': 'Outros fios simples, de fibras sintéticas descontínuas, contendo => 85% em peso destas fibras, não para venda a retalho',
-    '55094200': 'Outros fios retorcidos ou retorcidos múltiplos, de fibras sintéticas descontínuas, contendo => 85% em peso destas fibras, não para venda a retalho',
-    '55095100': 'Fios de fibras descontínuas de poliéster combinadas com fibras artificiais descontínuas, não para venda a retalho',
-    '55095300': 'Fios de fibras descontínuas de poliéster combinadas com algodão, não para venda a retalho',
-    '55095900': 'Outros fios de fibras descontínuas de poliéster, não para venda a retalho',
-    '55096100': 'Fios de fibras descontínuas acrílicas ou modacrílicas combinadas com lã ou pêlos finos, não para venda a retalho',
-    '55096200': 'Fios de fibras descontínuas acrílicas ou modacrílicas combinadas com algodão, não para venda a retalho',
-    '55096900': 'Outros fios de fibras descontínuas acrílicas ou modacrílicas, não para venda a retalho',
-    '55099900': 'Outros fios de fibras sintéticas descontínuas, não para venda a retalho',
-    '55101111': 'Fios simples de fibras artificiais descontínuas, contendo => 85% em peso destas fibras, não para venda a retalho',
-    '55101112': 'Fios simples de fibras artificiais descontínuas, contendo => 85% em peso destas fibras, não para venda a retalho',
-    '55101113': 'Fios simples de fibras artificiais descontínuas, contendo => 85% em peso destas fibras, não para venda a retalho',
-    '55101190': 'Fios simples de fibras artificiais descontínuas, contendo => 85% em peso destas fibras, não para venda a retalho',
-    '55101211': 'Fios retorcidos ou retorcidos múltiplos, de fibras artificiais descontínuas, contendo => 85% em peso destas fibras, não para venda a retalho',
-    '55102013': 'Fios de fibras artificiais descontínuas combinados com lã ou pêlos finos, não para venda a retalho',
-    '55103090': 'Fio de fibras artificiais descontínuas combinados com algodão, não para venda a retalho',
-    '55109011': 'Outros fios de fibras artificiais descontínuas, não para venda a retalho',
-    '55109019': 'Outros fios de fibras artificiais descontínuas, não para venda a retalho',
-    '55109090': 'Outros fios de fibras artificiais descontínuas, não para venda a retalho',
-    '55111000': 'Fios de fibras sintéticas descontínuas, contendo => 85% em peso destas fibras, para venda a retalho',
-    '55112000': 'Fios de fibras sintéticas descontínuas, contendo < 85% em peso destas fibras, para venda a retalho',
-    '55113000': 'Fios de fibras artificiais descontínuas, para venda a retalho',
-    '55121100': 'Tecidos crus ou branqueados de fibras descontínuas de poliéster, contendo => 85% em peso destas fibras',
-    '55121900': 'Outros tecidos de fibras descontínuas de poliéster, contendo => 85% em peso destas fibras',
-    '55122100': 'Tecidos crus ou branqueados de fibras descontínuas acrílicas ou modacrílicas, contendo => 85% em peso destas fibras',
-    '55122900': 'Outros tecidos de fibras descontínuas acrílicas ou modacrílicas, contendo => 85% em peso destas fibras',
-    '55129110': 'Outros tecidos crus ou branqueados de fibras sintéticas descontínuas, contendo => 85% em peso destas fibras',
-    '55129190': 'Outros tecidos crus ou branqueados de fibras sintéticas descontínuas, contendo => 85% em peso destas fibras',
-    '55129910': 'Outros tecidos de fibras sintéticas descontínuas, contendo => 85% em peso destas fibras',
-    '55131100': 'Tecido cru ou branqueado de fibras descontínuas de poliéster, contendo < 85% em peso destas fibras, combinadas com algodão, de peso <= 170 g/m2, em ponto de tafetá',
-    '55131200': 'Tecido cru ou branqueado de fibras descontínuas de poliéster, contendo < 85% em peso destas fibras, combinadas com algodão, de peso <= 170 g/m2, em ponto sarjado',
-    '55131300': 'Outros tecidos crus ou branqueados de fibras descontínuas de poliéster, contendo < 85% em peso destas fibras, combinadas com algodão, de peso <= 170 g/m2',
-    '55131900': 'Outros tecidos crus ou branqueados de fibras sintéticas descontínuas, contendo < 85% em peso destas fibras, combinadas com algodão, de peso <= 170 g/m2',
-    '55132100': 'Tecido tinto de fibras descontínuas de poliéster, contendo < 85% em peso destas fibras, combinadas com algodão, de peso <= 170 g/m2, em ponto de tafetá',
-    '55132390': 'Outros tecidos tintos de fibras descontínuas de poliéster, contendo < 85% em peso destas fibras, combinadas com algodão, de peso <= 170 g/m2',
-    '55132900': 'Outros tecidos tintos de fibras sintéticas descontínuas, contendo < 85% em peso destas fibras, combinadas com algodão, de peso <= 170 g/m2',
-    '55133100': 'Tecido de fios de diversas cores de fibras descontínuas de poliéster, contendo < 85% em peso destas fibras, combinadas com algodão, de peso <= 170 g/m2, em ponto de tafetá',
-    '55133919': 'Outros tecidos de fios de diversas cores de fibras sintéticas descontínuas, contendo < 85% em peso destas fibras, combinadas com algodão, de peso <= 170 g/m2',
-    '55133990': 'Outros tecidos de fios de diversas cores de fibras sintéticas descontínuas, contendo < 85% em peso destas fibras, combinadas com algodão, de peso <= 170 g/m2',
-    '55134100': 'Tecido estampado de fibras descontínuas de poliéster, contendo < 85% em peso destas fibras, combinadas com algodão, de peso <= 170 g/m2, em ponto de tafetá',
-    '55134990': 'Outros tecidos estampados de fibras sintéticas descontínuas, contendo < 85% em peso destas fibras, combinadas com algodão, de peso <= 170 g/m2',
-    '55141100': 'Tecido cru o branqueado de fibras descontínuas de poliéster, contendo < 85% em peso destas fibras, combinadas com algodão, de peso > 170 g/m2, em ponto de tafetá',
-    '55141200': 'Tecido cru ou branqueado de fibras descontínuas de poliéster, contendo < 85% em peso destas fibras, combinadas com algodão, de peso > 170 g/m2, em ponto sarjado',
-    '55141990': 'Outros tecidos crus ou branqueados de fibras sintéticas descontínuas, contendo < 85% em peso destas fibras, combinadas com algodão, de peso > 170 g/m2',
-    '55142100': 'Tecido tinto de fibras descontínuas de poliéster, contendo < 85% em peso destas fibras, combinadas com algodão, de peso > 170 g/m2, em ponto de tafetá',
-    '55142200': 'Tecido tinto de fibras descontínuas de poliéster, contendo < 85% em peso destas fibras, combinadas com algodão, de peso > 170 g/m2, em ponto sarjado',
-    '55142300': 'Outros tecidos tintos de fibras descontínuas de poliéster, contendo < 85% em peso destas fibras, combinadas com algodão, de peso > 170 g/m2',
-    '55142900': 'Outros tecidos tintos de fibras sintéticas descontínuas, contendo < 85% em peso destas fibras, combinadas com algodão, de peso > 170 g/m2',
-    '55143011': 'Tecido de fios de diversas cores, de fibras sintéticas descontínuas, contendo < 85% em peso destas fibras, combinadas com algodão, de peso > 170 g/m2',
-    '55143012': 'Tecido de fios de diversas cores, de fibras sintéticas descontínuas, contendo < 85% em peso destas fibras, combinadas com algodão, de peso > 170 g/m2',
-    '55143019': 'Tecido de fios de diversas cores, de fibras sintéticas descontínuas, contendo < 85% em peso destas fibras, combinadas com algodão, de peso > 170 g/m2',
-    '55143090': 'Tecido de fios de diversas cores, de fibras sintéticas descontínuas, contendo < 85% em peso destas fibras, combinadas com algodão, de peso > 170 g/m2',
-    '55144100': 'Tecido estampado de fibras descontínuas de poliéster, contendo < 85% em peso destas fibras, combinadas com algodão, de peso > 170 g/m2, em ponto de tafetá',
-    '55144300': 'Outros tecidos estampados de fibras descontínuas de poliéster, contendo < 85% em peso destas fibras, combinadas com algodão, de peso > 170 g/m2',
-    '55144900': 'Outros tecidos estampados de fibras sintéticas descontínuas, contendo < 85% em peso destas fibras, combinadas com algodão, de peso > 170 g/m2',
-    '55151100': 'Tecido de fibras descontínuas de poliéster combinadas com fibras descontínuas de raiom viscose',
-    '55151200': 'Tecido de fibras descontínuas de poliéster combinadas com filamentos sintéticos ou artificiais',
-    '55151300': 'Tecido de fibras descontínuas de poliéster combinadas com lã ou pêlos finos',
-    '55151900': 'Outros tecidos de fibras descontínuas de poliéster',
-    '55152100': 'Tecido de fibras descontínuas acrílicas ou modacrílicas combinadas com filamentos sintéticos ou artificiais',
-    '55152200': 'Tecido de fibras descontínuas acrílicas ou modacrílicas combinadas com lã ou pêlos finos',
-    '55152900': 'Outros tecidos de fibras descontínuas acrílicas ou modacrílicas',
-    '55159100': 'Outros tecidos de fibras sintéticas descontínuas com filamentos sintéticos ou artificiais',
-    '55159910': 'Outros tecidos de fibras sintéticas descontínuas',
-    '55159990': 'Outros tecidos de fibras sintéticas descontínuas',
-    '55161100': 'Tecido cru ou branqueado, contendo => 85% em peso de fibras artificiais descontínuas',
-    '55161200': 'Tecido tinto, contendo => 85% em peso de fibras artificiais descontínuas',
-    '55161300': 'Tecido de fios de diversas cores, contendo => 85% em peso de fibras artificiais descontínuas',
-    '55161400': 'Tecido estampado, contendo => 85% em peso de fibras artificiais descontínuas',
-    '55162100': 'Tecido cru o branqueado, contendo < 85% em peso de fibras artificiais descontínuas, combinadas com filamentos sintéticos ou artificiais',
-    '55162200': 'Tecido tinto, contendo < 85% em peso de fibras artificiais descontínuas, combinadas com filamentos sintéticos ou artificiais',
-    '55162300': 'Tecido de fios de diversas cores, contendo < 85% em peso de fibras artificiais descontínuas, combinadas com filamentos sintéticos ou artificiais',
-    '55162400': 'Tecido estampado, contendo < 85% em peso de fibras artificiais descontínuas, combinadas com filamentos sintéticos ou artificiais',
-    '55163200': 'Tecido tinto, contendo < 85% em peso de fibras artificiais descontínuas, combinadas com lã ou pêlos finos',
-    '55163300': 'Tecido de fios de diversas cores, contendo < 85% em peso de fibras artificiais descontínuas, combinadas com lã ou pêlos finos',
-    '55164100': 'Tecido cru ou branqueado, contendo < 85% em peso de fibras artificiais descontínuas, combinadas com algodão',
-    '55164200': 'Tecido tinto, contendo < 85% em peso de fibras artificiais descontínuas, combinadas com algodão',
-    '55164300': 'Tecido de fios de diversas cores, contendo < 85% em peso de fibras artificiais descontínuas, combinadas com algodão',
-    '55164400': 'Tecido estampado, contendo < 85% em peso de fibras artificiais descontínuas, combinadas com algodão',
-    '55169100': 'Outros tecidos crus ou branqueados de fibras artificiais descontínuas',
-    '55169200': 'Outros tecidos tintos de fibras artificiais descontínuas',
-    '55169300': 'Outros tecidos de fios de diversas cores, de fibras artificiais descontínuas',
-    '55169400': 'Outros tecidos estampados de fibras artificiais descontínuas',
-    '56012110': 'Pastas (ouates); outros artigos de pastas (ouates), de algodão',
-    '56012190': 'Pastas (ouates); outros artigos de pastas (ouates), de algodão',
-    '56012211': 'Pastas (ouates); outros artigos de pastas (ouates), de fibras sintéticas ou artificiais',
-    '56012219': 'Pastas (ouates); outros artigos de pastas (ouates), de fibras sintéticas ou artificiais',
-    '56012291': 'Pastas (ouates); outros artigos de pastas (ouates), de fibras sintéticas ou artificiais',
-    '56012299': 'Pastas (ouates); outros artigos de pastas (ouates), de fibras sintéticas ou artificiais',
-    '56012900': 'Pastas (ouates) e outros artigos, de matérias têxteis',
-    '56013010': 'Tontisses, nós e bolotas, de matérias têxteis',
-    '56013090': 'Tontisses, nós e bolotas, de matérias têxteis',
-    '56021000': 'Feltros agulhados e artefatos de costura por entrelaçamento',
-    '56022100': 'Feltros de lã ou de pêlos finos, não impregnados, não revestidos, não recobertos nem estratificados',
-    '56022900': 'Feltros de outras matérias têxteis, não impregnados, não revestidos, não recobertos nem estratificados',
-    '56029000': 'Outros feltros, impregnados, revestidos, recobertos ou estratificados',
-    '56031110': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso <= 25 g/m2',
-    '56031120': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso <= 25 g/m2',
-    '56031130': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso <= 25 g/m2',
-    '56031190': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso <= 25 g/m2',
-    '56031210': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso > 25 g/m2 e <= 70 g/m2',
-    '56031220': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso > 25 g/m2 e <= 70 g/m2',
-    '56031230': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso > 25 g/m2 e <= 70 g/m2',
-    '56031240': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso > 25 g/m2 e <= 70 g/m2',
-    '56031250': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso > 25 g/m2 e <= 70 g/m2',
-    '56031290': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso > 25 g/m2 e <= 70 g/m2',
-    '56031310': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso > 70 g/m2 e <= 150 g/m2',
-    '56031320': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso > 70 g/m2 e <= 150 g/m2',
-    '56031330': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso > 70 g/m2 e <= 150 g/m2',
-    '56031340': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso > 70 g/m2 e <= 150 g/m2',
-    '56031350': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso > 70 g/m2 e <= 150 g/m2',
-    '56031390': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso > 70 g/m2 e <= 150 g/m2',
-    '56031410': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso > 150 g/m2',
-    '56031420': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso > 150 g/m2',
-    '56031430': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso > 150 g/m2',
-    '56031490': 'Falsos tecidos de filamentos sintéticos ou artificiais, de peso > 150 g/m2',
-    '56039110': 'Outros falsos tecidos, de peso <= 25 g/m2',
-    '56039120': 'Outros falsos tecidos, de peso <= 25 g/m2',
-    '56039190': 'Outros falsos tecidos, de peso <= 25 g/m2',
-    '56039210': 'Outros falsos tecidos, de peso > 25 g/m2 e <= 70 g/m2',
-    '56039220': 'Outros falsos tecidos, de peso > 25 g/m2 e <= 70 g/m2',
-    '56039230': 'Outros falsos tecidos, de peso > 25 g/m2 e <= 70 g/m2',
-    '56039240': 'Outros falsos tecidos, de peso > 25 g/m2 e <= 70 g/m2',
-    '56039290': 'Outros falsos tecidos, de peso > 25 g/m2 e <= 70 g/m2',
-    '56039310': 'Outros falsos tecidos, de peso > 70 g/m2 e <= 150 g/m2',
-    '56039320': 'Outros falsos tecidos, de peso > 70 g/m2 e <= 150 g/m2',
-    '56039330': 'Outros falsos tecidos, de peso > 70 g/m2 e <= 150 g/m2',
-    '56039340': 'Outros falsos tecidos, de peso > 70 g/m2 e <= 150 g/m2',
-    '56039390': 'Outros falsos tecidos, de peso > 70 g/m2 e <= 150 g/m2',
-    '56039410': 'Outros falsos tecidos, de peso > 150 g/m2',
-    '56039420': 'Outros falsos tecidos, de peso > 150 g/m2',
-    '56039430': 'Outros falsos tecidos, de peso > 150 g/m2',
-    '56039490': 'Outros falsos tecidos, de peso > 150 g/m2',
-    '56041000': 'Fios e cordas, de borracha, recobertos de têxteis',
-    '56049010': 'Outros fios têxteis, lâminas e formas semelhantes, impregnados, revestidos, recobertos ou embainhados de borracha ou plástico',
-    '56049021': 'Outros fios têxteis, lâminas e formas semelhantes, impregnados, revestidos, recobertos ou embainhados de borracha ou plástico',
-    '56049022': 'Outros fios têxteis, lâminas e formas semelhantes, impregnados, revestidos, recobertos ou embainhados de borracha ou plástico',
-    '56049090': 'Outros fios têxteis, lâminas e formas semelhantes, impregnados, revestidos, recobertos ou embainhados de borracha ou plástico',
-    '56050020': 'Fios metálicos constituídos por fios têxteis, lâminas ou formas semelhantes, combinados com metal',
-    '56050090': 'Fios metálicos constituídos por fios têxteis, lâminas ou formas semelhantes, combinados com metal',
-    '56060000': 'Fios revestidos por enrolamento, lâminas e formas semelhantes das posições 5404 ou 5405, revestidas por enrolamento; fios de froco (chenille) e de cadeia (chainette)',
-    '56072100': 'Cordéis de sisal ou de outras fibras têxteis do gênero agave, para atadeiras ou enfardadeiras',
-    '56072900': 'Outros cordéis, cordas e cabos, de sisal ou de outras fibras têxteis agave',
-    '56074100': 'Cordéis de polietileno ou polipropileno, para atadeiras ou enfardadeiras',
-    '56074900': 'Outros cordéis, cordas e cabos, de polietileno ou polipropileno',
-    '56075011': 'Cordéis, cordas e cabos, de outras fibras sintéticas',
-    '56075019': 'Cordéis, cordas e cabos, de outras fibras sintéticas',
-    '56075090': 'Cordéis, cordas e cabos, de outras fibras sintéticas',
-    '56079010': 'Outros cordéis, cordas e cabos, de outras matérias têxteis',
-    '56079020': 'Outros cordéis, cordas e cabos, de outras matérias têxteis',
-    '56079090': 'Outros cordéis, cordas e cabos, de outras matérias têxteis',
-    '56081100': 'Redes confeccionadas de matérias têxteis sintéticas ou artificiais, para a pesca',
-    '56081900': 'Outras redes confeccionadas de matérias têxteis sintéticas ou artificiais',
-    '56089000': 'Redes de malhas com nós, etc, de outras matérias têxteis',
-    '56090010': 'Artigos de fios, lâminas ou formas semelhantes das posições 5404 ou 5405; outros cordéis, cordas e cabos',
-    '56090090': 'Artigos de fios, lâminas ou formas semelhantes das posições 5404 ou 5405; outros cordéis, cordas e cabos',
-    '57011011': 'Tapetes de lã ou de pêlos finos, de pontos nodados ou enrolados',
-    '57011012': 'Tapetes de lã ou de pêlos finos, de pontos nodados ou enrolados',
-    '57019000': 'Tapetes de outras matérias têxteis, de pontos nodados ou enrolados',
-    '57021000': 'Tapetes Kelim, Schumacks, Karamanie e semelhantes, tecidos à mão',
-    '57022000': 'Revestimentos para pavimentos, de cairo (fibras de coco), obtidos por tecelagem, mesmo confeccionados',
-    '57023100': 'Tapetes e outros revestimentos para pavimentos, de lã ou pêlos finos, aveludados, não confeccionados',
-    '57023200': 'Tapetes e outros revestimentos para pavimentos, de matérias têxteis sintéticas ou artificiais, aveludados, não confeccionados',
-    '57023900': 'Tapetes e outros revestimentos para pavimentos, de outras matérias têxteis, aveludados, não confeccionados',
-    '57024100': 'Tapetes e outros revestimentos para pavimentos, de lã ou pêlos finos, aveludados, confeccionados',
-    '57024200': 'Tapetes e outros revestimentos para pavimentos, de matérias têxteis sintéticas ou artificiais, aveludados, confeccionados',
-    '57024900': 'Tapetes e outros revestimentos para pavimentos, de outras matérias têxteis, aveludados, confeccionados',
-    '57025010': 'Outros tapetes e revestimentos para pavimentos, não aveludados, não confeccionados',
-    '57025020': 'Outros tapetes e revestimentos para pavimentos, não aveludados, não confeccionados',
-    '57025090': 'Outros tapetes e revestimentos para pavimentos, não aveludados, não confeccionados',
-    '57029100': 'Tapetes e outros revestimentos para pavimentos, de lã ou pêlos finos, não aveludados, confeccionados',
-    '57029200': 'Tapetes e outros revestimentos para pavimentos, de matérias têxteis sintéticas ou artificiais, não aveludados, confeccionados',
-    '57029900': 'Tapetes e outros revestimentos para pavimentos, de outras matérias têxteis, não aveludados, confeccionados',
-    '57031000': 'Tapetes e outros revestimentos para pavimentos, de lã ou pêlos finos, tufados, mesmo confeccionados',
-    '57032000': 'Tapetes e outros revestimentos para pavimentos, de náilon ou de outras poliamidas, tufados, mesmo confeccionados',
-    '57032100': 'Grama de nylon ou outras poliamidas',
-    '57032900': 'Outros tapetes e outros revestimentos têxteis para pisos (incluindo gramados), tufados, mesmo confeccionados, de nylon ou outras poliamidas, não classificados nos códigos anteriores',
-    '57033000': 'Tapetes e outros revestimentos para pavimentos, de outras matérias têxteis sintéticas ou artificiais, tufados, mesmo confeccionados',
-    '57033100': 'Grama de outros materiais têxteis fabricados pelo homem',
-    '57033900': 'Outros tapetes e outros revestimentos têxteis para pisos (incluindo gramados), tufados, confeccionados ou não, de outras matérias têxteis artificiais, não classificados nos códigos anteriores',
-    '57039000': 'Tapetes e outros revestimentos para pavimentos, de outras matérias têxteis, tufados, mesmo confeccionados',
-    '57041000': 'Ladrilhos de feltro, para revestimentos de pavimentos, de superfície <= 0,3 m2',
-    '57049000': 'Outros tapetes e revestimentos para pavimentos, de feltro',
-    '57050000': 'Outros tapetes e revestimentos para pavimentos, de matérias têxteis',
-    '58011000': 'Veludos e pelúcias, tecidos, de lã ou de pêlos finos',
-    '58012100': 'Veludos e pelúcias, tecidos, de algodão, obtidos por trama, não cortados',
-    '58012200': 'Veludos e pelúcias, tecidos, de algodão, obtidos por trama, cortados, canelados (côtelés)',
-    '58012300': 'Outros veludos e pelúcias, tecidos, de algodão, obtidos por trama',
-    '58012600': 'Tecidos de froco (chenille), de algodão',
-    '58012700': 'Veludos e pelúcias obtidos por urdidura, de algodão',
-    '58013100': 'Veludos e pelúcias, tecidos, de fibras sintéticas ou artificiais, obtidos por trama, não cortados',
-    '58013200': 'Veludos e pelúcias, tecidos, de fibras sintéticas ou artificiais, obtidos por trama, cortados, canelados (côtelés)',
-    '58013300': 'Outros veludos e pelúcias, tecidos, de fibras sintéticas ou artificiais, obtidos por trama, cortados',
-    '58013600': 'Tecidos de froco (chenille) de fibras sintéticas ou artificiais',
-    '58013700': 'Veludos e pelúcias obtidos por urdidura, de fibras sintéticas ou artificiais',
-    '58019000': 'Veludos e pelúcias, tecidos, de outras matérias têxteis',
-    '58021000': 'Tecidos de algodão felpudo e tecidos similares, de algodão felpudo',
-    '58021100': 'Tecidos atoalhados, de algodão, crus',
-    '58021900': 'Outros tecidos atoalhados, de algodão',
-    '58022000': 'Tecidos atoalhados, de outras matérias têxteis',
-    '58023000': 'Tecidos tufados',
-    '58030010': 'Tecidos em ponto de gaze, exceto os artefatos da posição 5806',
-    '58030090': 'Tecidos em ponto de gaze, exceto os artefatos da posição 5806',
-    '58041010': 'Tules, filó e tecidos de malhas com nós',
-    '58041090': 'Tules, filó e tecidos de malhas com nós',
-    '58042100': 'Rendas de fibras sintéticas ou artificiais, de fabricação mecânica',
-    '58042910': 'Rendas de outras matérias têxteis, de fabricação mecânica',
-    '58042990': 'Rendas de outras matérias têxteis, de fabricação mecânica',
-    '58043010': 'Rendas de fabricação manual',
-    '58043090': 'Rendas de fabricação manual',
-    '58050010': 'Tapeçarias tecidas à mão (gêneros gobelino, flandres, aubusson e semelhantes) e feitas à agulha (em petit point, ponto de cruz)',
-    '58050020': 'Tapeçarias tecidas à mão (gêneros gobelino, flandres, aubusson e semelhantes) e feitas à agulha (em petit point, ponto de cruz)',
-    '58050090': 'Tapeçarias tecidas à mão (gêneros gobelino, flandres, aubusson e semelhantes) e feitas à agulha (em petit point, ponto de cruz)',
-    '58061000': 'Fitas de veludo, de pelúcia, de tecidos de froco (chenille) ou atoalhados',
-    '58062000': 'Outras fitas, contendo, em peso, => 5% de fios de elastômeros ou de fios de borracha',
-    '58063100': 'Outras fitas de algodão',
-    '58063200': 'Outras fitas de fibras sintéticas ou artificiais',
-    '58063900': 'Fitas de outras matérias têxteis',
-    '58064000': 'Fitas sem trama, de fios ou fibras paralelizados e colados (bolducs)',
-    '58071000': 'Etiquetas, emblemas e artefatos semelhantes, de matérias têxteis, não bordados, tecidos',
-    '58079000': 'Outras etiquetas, emblemas e artefatos semelhantes, de matérias têxteis, não bordados',
-    '58081000': 'Entrançados em peças',
-    '58089000': 'Outros artigos de passamanaria e ornamentais análogos; borlas, pompons e artigos semelhantes',
-    '58090000': 'Tecidos de fios de metal ou de fios têxteis metalizados da posição 5605, para vestuário, guarnição de interiores ou usos semelhantes',
-    '58101000': 'Bordados químicos ou aéreos e bordados com fundo recortado',
-    '58109100': 'Outros bordados de algodão, em peça, em tiras ou em motivos',
-    '58109200': 'Outros bordados de fibras sintéticas ou artificiais, em peça, em tiras ou em motivos',
-    '58109900': 'Bordados de outras matérias têxteis, em peça, em tiras ou em motivos',
-    '58110000': 'Artefatos têxteis matelassês em peça, constituídos por uma ou várias camadas têxteis associadas a uma matéria de enchimento',
-    '59011000': 'Tecidos revestidos de cola ou de matérias amiláceas, para encadernação, cartonagem e usos semelhantes',
-    '59019000': 'Telas para decalque, telas transparentes para desenho, telas preparadas para pintura, entretelas do tipo utilizado em chapéus e para usos semelhantes',
-    '59021010': 'Telas para pneumáticos com fios de alta tenacidade, de náilon ou de outras poliamidas',
-    '59021090': 'Telas para pneumáticos com fios de alta tenacidade, de náilon ou de outras poliamidas',
-    '59022000': 'Telas para pneumáticos com fios de alta tenacidade, de poliésteres',
-    '59029000': 'Outras telas para pneumáticos com fios de alta tenacidade, de raiom viscose',
-    '59031000': 'Tecidos impregnados, revestidos, recobertos ou estratificados com policloreto de vinila',
-    '59032000': 'Tecidos impregnados, revestidos, recobertos ou estratificados com poliuretano',
-    '59039000': 'Outros tecidos impregnados, revestidos, recobertos ou estratificados com plásticos',
-    '59041000': 'Linóleos, mesmo recortados',
-    '59049000': 'Revestimentos para pavimentos constituídos por um induto ou recobrimento aplicado sobre suporte têxtil, mesmo recortados',
-    '59050000': 'Revestimentos para paredes, de matérias têxteis',
-    '59061000': 'Fitas adesivas de largura <= 20 cm',
-    '59069100': 'Tecidos de malha, com borracha',
-    '59069900': 'Outros tecidos com borracha',
-    '59070000': 'Outros tecidos impregnados, revestidos ou recobertos; telas pintadas para cenários ou usos semelhantes',
-    '59080000': 'Mechas de matérias têxteis, tecidas, entrançadas ou tricotadas, para candeeiros, velas e semelhantes',
-    '59090000': 'Mangueiras e tubos semelhantes, de matérias têxteis',
-    '59100000': 'Correias transportadoras ou de transmissão, de matérias têxteis, mesmo impregnadas, revestidas ou recobertas de outras matérias',
-    '59111000': 'Tecidos, feltros e tecidos forrados de feltro, combinados com camadas de borracha, utilizados na fabricação de guarnições de cardas e produtos análogos',
-    '59112010': 'Gazes e telas para peneirar, mesmo confeccionadas',
-    '59112090': 'Gazes e telas para peneirar, mesmo confeccionadas',
-    '59113100': 'Tecidos e feltros sem fim, utilizados em máquinas para fabricação de papel, de peso < 650 g/m2',
-    '59113200': 'Tecidos e feltros sem fim, utilizados em máquinas para fabricação de papel, de peso => 650 g/m2',
-    '59114000': 'Tecidos filtrantes (étreindelles) e espessos, utilizados em prensas de óleo e outros usos técnicos análogos',
-    '59119000': 'Outros produtos e artefatos, de matérias têxteis, para usos técnicos',
-    '60011010': 'Tecidos denominados de felpa longa ou pêlo comprido',
-    '60011020': 'Tecidos denominados de felpa longa ou pêlo comprido',
-    '60011090': 'Tecidos denominados de felpa longa ou pêlo comprido',
-    '60012100': 'Tecidos atoalhados, de malha de algodão',
-    '60012200': 'Tecidos atoalhados, de malha de fibras sintéticas ou artificiais',
-    '60012900': 'Tecidos atoalhados, de malha de outras matérias têxteis',
-    '60019100': 'Outros veludos e pelúcias, de malha de algodão',
-    '60019200': 'Outros veludos e pelúcias, de malha de fibras sintéticas ou artificiais',
-    '60019900': 'Veludos e pelúcias, de malha de outras matérias têxteis',
-    '60024010': 'Tecidos de malha de largura <= 30 cm, contendo em peso => 5% fios de elastômeros, mas não contendo fios de borracha',
-    '60024020': 'Tecidos de malha de largura <= 30 cm, contendo em peso => 5% fios de elastômeros, mas não contendo fios de borracha',
-    '60029010': 'Outros tecidos de malha de largura <= 30 cm, contendo em peso => 5% fios de elastômeros ou de borracha',
-    '60029020': 'Outros tecidos de malha de largura <= 30 cm, contendo em peso => 5% fios de elastômeros ou de borracha',
-    '60029090': 'Outros tecidos de malha de largura <= 30 cm, contendo em peso => 5% fios de elastômeros ou de borracha',
-    '60032000': 'Tecidos de malha de algodão, de largura <= 30 cm',
-    '60033000': 'Tecidos de malha de fibras sintéticas, de largura <= 30 cm',
-    '60034000': 'Tecidos de malha de fibras artificiais, de largura <= 30 cm',
-    '60039000': 'Tecidos de outras matérias têxteis, de largura <= 30 cm',
-    '60041011': 'Tecidos de malha, de largura > 30 cm, contendo em peso => 5% de fios de elastômeros, mas não contendo fios de borracha',
-    '60041012': 'Tecidos de malha, de largura > 30 cm, contendo em peso => 5% de fios de elastômeros, mas não contendo fios de borracha',
-    '60041013': 'Tecidos de malha, de largura > 30 cm, contendo em peso => 5% de fios de elastômeros, mas não contendo fios de borracha',
-    '60041014': 'Tecidos de malha, de largura > 30 cm, contendo em peso => 5% de fios de elastômeros, mas não contendo fios de borracha',
-    '60041031': 'Tecidos de malha, de largura > 30 cm, contendo em peso => 5% de fios de elastômeros, mas não contendo fios de borracha',
-    '60041032': 'Tecidos de malha, de largura > 30 cm, contendo em peso => 5% de fios de elastômeros, mas não contendo fios de borracha',
-    '60041033': 'Tecidos de malha, de largura > 30 cm, contendo em peso => 5% de fios de elastômeros, mas não contendo fios de borracha',
-    '60041034': 'Tecidos de malha, de largura > 30 cm, contendo em peso => 5% de fios de elastômeros, mas não contendo fios de borracha',
-    '60041041': 'Tecidos de malha, de largura > 30 cm, contendo em peso => 5% de fios de elastômeros, mas não contendo fios de borracha',
-    '60041042': 'Tecidos de malha, de largura > 30 cm, contendo em peso => 5% de fios de elastômeros, mas não contendo fios de borracha',
-    '60041043': 'Tecidos de malha, de largura > 30 cm, contendo em peso => 5% de fios de elastômeros, mas não contendo fios de borracha',
-    '60041044': 'Tecidos de malha, de largura > 30 cm, contendo em peso => 5% de fios de elastômeros, mas não contendo fios de borracha',
-    '60041091': 'Tecidos de malha, de largura > 30 cm, contendo em peso => 5% de fios de elastômeros, mas não contendo fios de borracha',
-    '60041092': 'Tecidos de malha, de largura > 30 cm, contendo em peso => 5% de fios de elastômeros, mas não contendo fios de borracha',
-    '60041093': 'Tecidos de malha, de largura > 30 cm, contendo em peso => 5% de fios de elastômeros, mas não contendo fios de borracha',
-    '60041094': 'Tecidos de malha, de largura > 30 cm, contendo em peso => 5% de fios de elastômeros, mas não contendo fios de borracha',
-    '60049010': 'Outros tecidos de malha, de largura > 30 cm, contendo em peso => 5% fios de elastômeros ou de borracha',
-    '60049030': 'Outros tecidos de malha, de largura > 30 cm, contendo em peso => 5% fios de elastômeros ou de borracha',
-    '60049040': 'Outros tecidos de malha, de largura > 30 cm, contendo em peso => 5% fios de elastômeros ou de borracha',
-    '60049090': 'Outros tecidos de malha, de largura > 30 cm, contendo em peso => 5% fios de elastômeros ou de borracha',
-    '60052300': 'Tecidos de malha-urdidura (incluídos os obtidos em teares para galões), de algodão, com fios de diversas cores, de largura > 30 cm',
-    '60053500': 'Tecidos de malha-urdidura (incluindo os fabricados em teares para galões), exceto os das posições 60.01 a 60.04, de fibras sintéticas, mencionados na Nota de subposição 1 do presente Capítulo',
-    '60053600': 'Outros tecidos de malha-urdidura (incluindo os fabricados em teares para galões), exceto os das posições 60.01 a 60.04, de fibras sintéticas, crus ou branqueados',
-    '60053700': 'Outros tecidos de malha-urdidura (incluindo os fabricados em teares para galões), exceto os das posições 60.01 a 60.04, de fibras sintéticas, tintos',
-    '60053800': 'Outros tecidos de malha-urdidura (incluindo os fabricados em teares para galões), exceto os das posições 60.01 a 60.04, de fios de diversas cores',
-    '60053900': 'Outros tecidos de malha-urdidura (incluindo os fabricados em teares para galões), exceto os das posições 60.01 a 60.04, estampados',
-    '60054200': 'Tecidos de malha-urdidura (incluídos os obtidos em teares para galões), de fibras artificiais, tingidos, de largura > 30 cm',
-    '60054300': 'Tecidos de malha-urdidura (incluídos os obtidos em teares para galões), de fibras artificiais, com fios de diversas cores, de largura > 30 cm',
-    '60054400': 'Tecidos de malha-urdidura (incluídos os obtidos em teares para galões), de fibras artificiais, estampados, de largura > 30 cm',
-    '60059090': 'Outros tecidos de malha-urdidura (incluídos os obtidos em teares para galões), de largura > 30 cm',
-    '60061000': 'Outros tecidos de malha, de lã ou de pêlos finos, de largura > 30 cm',
-    '60062100': 'Outros tecidos de malha, de algodão, crus ou branqueados, de largura > 30 cm',
-    '60062200': 'Outros tecidos de malha, de algodão, tintos, de largura > 30 cm',
-    '60062300': 'Outros tecidos de malha, de algodão, com fios de diversas cores, de largura > 30 cm',
-    '60062400': 'Outros tecidos de malha, de algodão, estampados, de largura > 30 cm',
-    '60063110': 'Outros tecidos de malha, de fibras sintéticas, crus ou branqueados, de largura > 30 cm',
-    '60063120': 'Outros tecidos de malha, de fibras sintéticas, crus ou branqueados, de largura > 30 cm',
-    '60063130': 'Outros tecidos de malha, de fibras sintéticas, crus ou branqueados, de largura > 30 cm',
-    '60063190': 'Outros tecidos de malha, de fibras sintéticas, crus ou branqueados, de largura > 30 cm',
-    '60063210': 'Outros tecidos de malha, de fibras sintéticas, tingidos, de largura > 30 cm',
-    '60063220': 'Outros tecidos de malha, de fibras sintéticas, tingidos, de largura > 30 cm',
-    '60063290': 'Outros tecidos de malha, de fibras sintéticas, tingidos, de largura > 30 cm',
-    '60063310': 'Outros tecidos de malha, de fibras sintéticas, com fios de diversas cores, de largura > 30 cm',
-    '60063320': 'Outros tecidos de malha, de fibras sintéticas, com fios de diversas cores, de largura > 30 cm',
-    '60063390': 'Outros tecidos de malha, de fibras sintéticas, com fios de diversas cores, de largura > 30 cm',
-    '60063410': 'Outros tecidos de malha, de fibras sintéticas, estampados, de largura > 30 cm',
-    '60063420': 'Outros tecidos de malha, de fibras sintéticas, estampados, de largura > 30 cm',
-    '60063490': 'Outros tecidos de malha, de fibras sintéticas, estampados, de largura > 30 cm',
-    '60064100': 'Outros tecidos de malha, de fibras artificiais, crus ou branqueados, de largura > 30 cm',
-    '60064200': 'Outros tecidos de malha, de fibras artificiais, tingidos, de largura > 30 cm',
-    '60064300': 'Outros tecidos de malha, de fibras artificiais, com fios de diversas cores, de largura > 30 cm',
-    '60064400': 'Outros tecidos de malha, de fibras artificiais, estampados, de largura > 30 cm',
-    '60069000': 'Outros tecidos de malha, de outras matérias têxteis, de largura > 30 cm',
-    '61012000': 'Sobretudos, japonas, gabões, capas, casacos e semelhantes, de malha de algodão, de uso masculino',
-    '61013000': 'Sobretudos, japonas, gabões, capas, casacos e semelhantes, de malha de fibras sintéticas ou artificiais, de uso masculino',
-    '61019010': 'Sobretudos, japonas, gabões, capas, casacos e semelhantes, de malha de outras matérias têxteis, de uso masculino',
-    '61019090': 'Sobretudos, japonas, gabões, capas, casacos e semelhantes, de malha de outras matérias têxteis, de uso masculino',
-    '61021000': 'Mantôs, casacos, capas, anoraques e semelhantes, de malha de lã ou pêlos finos, de uso feminino',
-    '61022000': 'Mantôs, casacos, capas, anoraques e semelhantes, de malha de algodão, de uso feminino',
-    '61023000': 'Mantôs, casacos, capas, anoraques e semelhantes, de malha, de fibras sintéticas ou artificiais, de uso feminino',
-    '61029000': 'Mantôs, casacos, capas, anoraques e semelhantes, de malha, de outras matérias têxteis, de uso feminino',
-    '61031010': 'Ternos de malha, de uso masculino',
-    '61031020': 'Ternos de malha, de uso masculino',
-    '61031090': 'Ternos de malha, de uso masculino',
-    '61032200': 'Conjuntos de malha, de algodão, de uso masculino',
-    '61032300': 'Conjuntos de malha, de fibras sintéticas, de uso masculino',
-    '61032910': 'Conjuntos de malha, de outras matérias têxteis, de uso masculino',
-    '61032990': 'Conjuntos de malha, de outras matérias têxteis, de uso masculino',
-    '61033100': 'Paletós de malha, de lã ou de pêlos finos, de uso masculino',
-    '61033200': 'Paletós de malha, de algodão, de uso masculino',
-    '61033300': 'Paletós de malha, de fibras sintéticas, de uso masculino',
-    '61033900': 'Paletós de malha, de outras matérias têxteis, de uso masculino',
-    '61034100': 'Calças, jardineiras, bermudas e shorts (calções), de malha, de lã ou de pêlos finos, de uso masculino',
-    '61034200': 'Calças, jardineiras, bermudas e shorts (calções), de malha, de algodão, de uso masculino',
-    '61034300': 'Calças, jardineiras, bermudas e shorts (calções), de malha, de fibras sintéticas, de uso masculino',
-    '61034900': 'Calças, jardineiras, bermudas e shorts (calções), de malha, de outras matérias têxteis, de uso masculino',
-    '61041300': 'Tailleurs de malha, de fibras sintéticas, de uso feminino',
-    '61041920': 'Tailleurs de malha, de outras matérias têxteis, de uso feminino',
-    '61041990': 'Tailleurs de malha, de outras matérias têxteis, de uso feminino',
-    '61042200': 'Conjuntos de malha, de algodão, de uso feminino',
-    '61042300': 'Conjuntos de malha, de fibras sintéticas, de uso feminino',
-    '61042910': 'Conjuntos de malha, de outras matérias têxteis, de uso feminino',
-    '61042990': 'Conjuntos de malha, de outras matérias têxteis, de uso feminino',
-    '61043100': 'Blazers de malha, de lã ou de pêlos finos, de uso feminino',
-    '61043200': 'Blazers de malha, de algodão, de uso feminino',
-    '61043300': 'Blazers de malha, de fibras sintéticas, de uso feminino',
-    '61043900': 'Blazers de malha, de outras matérias têxteis, de uso feminino',
-    '61044100': 'Vestidos de malha, de lã ou de pêlos finos, de uso feminino',
-    '61044200': 'Vestidos de malha, de algodão, de uso feminino',
-    '61044300': 'Vestidos de malha, de fibras sintéticas, de uso feminino',
-    '61044400': 'Vestidos de malha, de fibras artificiais, de uso feminino',
-    '61044900': 'Vestidos de malha, de outras matérias têxteis, de uso feminino',
-    '61045100': 'Saias e saias-calças, de malha, de lã ou de pêlos finos, de uso feminino',
-    '61045200': 'Saias e saias-calças, de malha, de algodão, de uso feminino',
-    '61045300': 'Saias e saias-calças, de malha, de fibras sintéticas, de uso feminino',
-    '61045900': 'Saias e saias-calças, de malha, de outras matérias têxteis, de uso feminino',
-    '61046100': 'Calças, jardineiras, bermudas e shorts, de malha, de lã ou de pêlos finos, de uso feminino',
-    '61046200': 'Calças, jardineiras, bermudas e shorts, de malha, de algodão, de uso feminino',
-    '61046300': 'Calças, jardineiras, bermudas e shorts, de malha, de fibras sintéticas, de uso feminino',
-    '61046900': 'Calças, jardineiras, bermudas e shorts, de malha, de outras matérias têxteis, de uso feminino',
-    '61051000': 'Camisas de malha de algodão, de uso masculino',
-    '61052000': 'Camisas de malha, de fibras sintéticas ou artificiais, de uso masculino',
-    '61059000': 'Camisas de malha, de outras matérias têxteis, de uso masculino',
-    '61061000': 'Camisas, blusas, blusas chemisier, de malha, de algodão, de uso feminino',
-    '61062000': 'Camisas, blusas, blusas chemisier, de malha, de fibras sintéticas ou artificiais, de uso feminino',
-    '61069000': 'Camisas, blusas, blusas, chemisier, de malha, de outras matérias têxteis, de uso feminino',
-    '61071100': 'Cuecas e ceroulas, de malha, de algodão',
-    '61071200': 'Cuecas e ceroulas, de malha, de fibras sintéticas ou artificiais',
-    '61071900': 'Cuecas e ceroulas, de malha, de outras matérias têxteis',
-    '61072100': 'Camisolões e pijamas, de malha, de algodão, de uso masculino',
-    '61072200': 'Camisolões e pijamas, de malha, de fibras sintéticas ou artificiais, de uso masculino',
-    '61072900': 'Camisolões e pijamas, de malha, de outras matérias têxteis, de uso masculino',
-    '61079100': 'Roupões de banho e semelhantes, de malha, de algodão, de uso masculino',
-    '61079910': 'Roupões de banho e semelhantes, de malha, de outras matérias têxteis, de uso masculino',
-    '61079990': 'Roupões de banho e semelhantes, de malha, de outras matérias têxteis, de uso masculino',
-    '61081100': 'Combinações e anáguas, de malha, de fibras sintéticas ou artificiais',
-    '61081900': 'Combinações e anáguas, de malha, de outras matérias têxteis',
-    '61082100': 'Calcinhas de malha de algodão',
-    '61082200': 'Calcinhas de malha, de fibras sintéticas ou artificiais',
-    '61082900': 'Calcinhas de malha, de outras matérias têxteis',
-    '61083100': 'Camisolas e pijamas, de malha de algodão, de uso feminino',
-    '61083200': 'Camisolas e pijamas, de malha, de fibras sintéticas ou artificiais, de uso feminino',
-    '61083900': 'Camisolas e pijamas, de malha, de outras matérias têxteis, de uso feminino',
-    '61089100': 'Roupões de banho, penhoares e semelhantes, de malha, de algodão, de uso feminino',
-    '61089200': 'Roupões de banho, penhoares e semelhantes, de malha, de fibras sintéticas ou artificiais, de uso feminino',
-    '61089900': 'Roupões de banho, penhoares e semelhantes, de malha, de outras matérias têxteis, de uso feminino',
-    '61091000': 'Camisetas (T-shirts) e camisetas interiores, de malha, de algodão',
-    '61099000': 'Camisetas (T-shirts) e camisetas interiores, de malha, de outras matérias têxteis',
-    '61101100': 'Suéteres, pulôveres, cardigãs, coletes e artigos semelhantes, de malha, de lã',
-    '61101200': 'Suéteres, pulôveres, cardigãs, coletes e artigos semelhantes, de malha, de pêlo fino de cabra de Cachemira',
-    '61101900': 'Suéteres, pulôveres, cardigãs, coletes e artigos semelhantes, de malha, de outros pêlos finos',
-    '61102000': 'Suéteres, pulôveres, cardigãs, coletes e artigos semelhantes, de malha, de algodão',
-    '61103000': 'Suéteres, pulôveres, cardigãs, coletes e artigos semelhantes, de malha, de fibras sintéticas ou artificiais',
-    '61109000': 'Suéteres, pulôveres, cardigãs, coletes e artigos semelhantes, de malha, de outras matérias têxteis',
-    '61112000': 'Vestuário e seus acessórios, de malha, de algodão, para bebês',
-    '61113000': 'Vestuário e seus acessórios, de malha, de fibras sintéticas, para bebês',
-    '61119010': 'Vestuário e seus acessórios, de malha, de outras matérias têxteis, para bebês',
-    '61119090': 'Vestuário e seus acessórios, de malha, de outras matérias têxteis, para bebês',
-    '61121100': 'Abrigos para esportes, de malha, de algodão',
-    '61121200': 'Abrigos para esportes, de malha, de fibras sintéticas',
-    '61121900': 'Abrigos para esportes, de malha, de outras matérias têxteis',
-    '61122000': 'Macacões e conjuntos, de esqui, de malha',
-    '61123100': 'Shorts e sungas, de banho, de malha, de fibras sintéticas, de uso masculino',
-    '61123900': 'Shorts e sungas, de banho, de malha, de outras matérias têxteis, de uso masculino',
-    '61124100': 'Maiôs e biquínis, de banho, de malha, de fibras sintéticas, de uso feminino',
-    '61124900': 'Maiôs e biquínis, de banho, de malha, de outras matérias, de uso feminino',
-    '61130000': 'Vestuário confeccionado com tecidos de malha, com plástico ou borracha',
-    '61142000': 'Outro vestuário de malha, de algodão',
-    '61143000': 'Outro vestuário de malha, de fibras sintéticas ou artificiais',
-    '61149010': 'Outro vestuário de malha, de outras matérias têxteis',
-    '61149090': 'Outro vestuário de malha, de outras matérias têxteis',
-    '61151011': 'Meias-calças, meias até o joelho e meias acima do joelho, de malha, de compressão degressiva (por exemplo, meias para varizes)',
-    '61151012': 'Meias-calças, meias até o joelho e meias acima do joelho, de malha, de compressão degressiva (por exemplo, meias para varizes)',
-    '61151013': 'Meias-calças, meias até o joelho e meias acima do joelho, de malha, de compressão degressiva (por exemplo, meias para varizes)',
-    '61151014': 'Meias-calças, meias até o joelho e meias acima do joelho, de malha, de compressão degressiva (por exemplo, meias para varizes)',
-    '61151019': 'Meias-calças, meias até o joelho e meias acima do joelho, de malha, de compressão degressiva (por exemplo, meias para varizes)',
-    '61151021': 'Meias-calças, meias até o joelho e meias acima do joelho, de malha, de compressão degressiva (por exemplo, meias para varizes)',
-    '61151022': 'Meias-calças, meias até o joelho e meias acima do joelho, de malha, de compressão degressiva (por exemplo, meias para varizes)',
-    '61151029': 'Meias-calças, meias até o joelho e meias acima do joelho, de malha, de compressão degressiva (por exemplo, meias para varizes)',
-    '61151091': 'Meias-calças, meias até o joelho e meias acima do joelho, de malha, de compressão degressiva (por exemplo, meias para varizes)',
-    '61151092': 'Meias-calças, meias até o joelho e meias acima do joelho, de malha, de compressão degressiva (por exemplo, meias para varizes)',
-    '61151093': 'Meias-calças, meias até o joelho e meias acima do joelho, de malha, de compressão degressiva (por exemplo, meias para varizes)',
-    '61151099': 'Meias-calças, meias até o joelho e meias acima do joelho, de malha, de compressão degressiva (por exemplo, meias para varizes)',
-    '61152100': 'Meias-calças de fibras sintéticas, de malha, de título inferior a 67 decitex, por fio simples',
-    '61152200': 'Meias-calças de fibras sintéticas, de malha, de título maior ou igual a 67 decitex, por fio simples',
-    '61152910': 'Outras meias-calças de malha, de outras matérias têxteis',
-    '61152920': 'Outras meias-calças de malha, de outras matérias têxteis',
-    '61152990': 'Outras meias-calças de malha, de outras matérias têxteis',
-    '61153010': 'Outras meias até o joelho e meias acima do joelho, de uso feminino, de título inferior a 67 decitex por fio simples',
-    '61153020': 'Outras meias até o joelho e meias acima do joelho, de uso feminino, de título inferior a 67 decitex por fio simples',
-    '61153090': 'Outras meias até o joelho e meias acima do joelho, de uso feminino, de título inferior a 67 decitex por fio simples',
-    '61159400': 'Outras meias e artefatos semelhantes de malha, de lã ou de pêlos finos',
-    '61159500': 'Outras meias e artefatos semelhantes de malha, de algodão',
-    '61159600': 'Outras meias e artefatos semelhantes de malha, de fibras sintéticas',
-    '61159900': 'Outras meias e artefatos semelhantes de malha, de outras matérias têxteis',
-    '61161000': 'Luvas, mitenes e semelhantes, de malha, impregnadas, revestidas ou recobertas, de plástico ou de borracha',
-    '61169100': 'Luvas, mitenes e semelhantes, de malha, de lã ou de pêlos finos',
-    '61169200': 'Luvas, mitenes e semelhantes, de malha, de algodão',
-    '61169300': 'Luvas, mitenes e semelhantes, de malha, de fibras sintéticas',
-    '61169900': 'Luvas, mitenes e semelhantes, de malha, de outras matérias têxteis',
-    '61171000': 'Xales, echarpes, lenços de pescoço, cachenés, mantilhas, véus e semelhantes, de malha',
-    '61178010': 'Outros acessórios de vestuário, confeccionados, de malha',
-    '61178090': 'Outros acessórios de vestuário, confeccionados, de malha',
-    '61179000': 'Partes de vestuários ou de seus acessórios, de malha',
-    '62011100': 'Sobretudos, impermeáveis, japonas, gabões, capas e semelhantes, de lã ou de pêlos finos, de uso masculino',
-    '62011200': 'Sobretudos, impermeáveis, japonas, gabões, capas e semelhantes, de algodão, de uso masculino',
-    '62011300': 'Sobretudos, impermeáveis, japonas, gabões, capas e semelhantes, de fibras sintéticas ou artificiais, de uso masculino',
-    '62011900': 'Sobretudos, impermeáveis, japonas, gabões, capas e semelhantes, de outras matérias têxteis, de uso masculino',
-    '62012000': 'Sobretudos, japonas, capas, capas, capas, anoraques (incluindo os casacos de esqui), blusões e semelhantes, excepto os da posição 62.03, de lã ou de pêlos finos, de uso masculino',
-    '62013000': 'Sobretudos, capas, capas, capas, anoraques (incluindo coletes de esqui), blusões e semelhantes, de uso masculino, excepto os da posição 62.03, de algodão',
-    '62014000': 'Sobretudos, capas, capas, capas, anoraques (incluindo casacos de esqui), blusões e semelhantes, excepto os da posição 62.03, de fibras sintéticas ou artificiais, de uso masculino',
-    '62019000': 'Sobretudos, japonas, capas, capas, anoraques (incluindo os casacos de esqui), blusões e semelhantes, de outras matérias têxteis, excepto os da posição 62.03, de uso masculino',
-    '62019100': 'Outros sobretudos, anoraques e artigos semelhantes, de lã ou de pêlos finos, de uso masculino',
-    '62019200': 'Outros sobretudos, anoraques e artigos semelhantes, de algodão, de uso masculino',
-    '62019300': 'Outros sobretudos, anoraques e semelhantes, de fibras sintéticas ou artificiais, de uso masculino',
-    '62019900': 'Outros sobretudos, anoraques e semelhantes, de outras matérias têxteis, de uso masculino',
-    '62021100': 'Mantôs, impermeáveis, capas e semelhantes, de lã ou de pêlos finos, de uso feminino',
-    '62021200': 'Mantôs, impermeáveis, capas e semelhantes, de algodão, de uso feminino',
-    '62021300': 'Mantôs, impermeáveis, capas e semelhantes, de fibras sintéticas ou artificiais, de uso feminino',
-    '62021900': 'Mantôs, impermeáveis, capas e semelhantes, de outras matérias têxteis, de uso feminino',
-    '62022000': 'Sobretudos, capas, capas, capas, anoraques (incluindo os casacos de esqui), blusões e semelhantes, de lã ou de pêlos finos, de uso feminino, excepto os da posição 62.04',
-    '62023000': 'Sobretudos, capas, capas, capas, anoraques (incluindo coletes de esqui), blusões e semelhantes, de algodão, de uso feminino, excepto os da posição 62.04',
-    '62024000': 'Sobretudos, capas, capas, capas, anoraques (incluindo coletes de esqui), blusões e semelhantes, de fibras sintéticas ou artificiais, de uso feminino, excepto os da posição 62.04',
-    '62029000': 'Sobretudos, capas, gabardines, anoraques, blusões, blusões e artigos semelhantes, de outras matérias têxteis, de uso feminino, excepto os da posição 62.04',
-    '62029100': 'Outros mantôs, anoraques e semelhantes, de lã ou pêlos finos, de uso feminino',
-    '62029200': 'Outros mantôs, anoraques e semelhantes, de algodão, de uso feminino',
-    '62029300': 'Outros mantôs, anoraques e semelhantes, de fibras sintéticas ou artificiais, de uso feminino',
-    '62029900': 'Outros mantôs, anoraques e semelhantes, de outras matérias têxteis, de uso feminino',
-    '62031100': 'Ternos (fatos), de lã ou de pêlos finos, de uso masculino',
-    '62031200': 'Ternos (fatos), de fibras sintéticas, de uso masculino',
-    '62031900': 'Ternos (fatos), de outras matérias têxteis, de uso masculino',
-    '62032200': 'Conjuntos de algodão, de uso masculino',
-    '62032300': 'Conjuntos de fibras sintéticas, de uso masculino',
-    '62032910': 'Conjuntos de outras matérias têxteis, de uso masculino',
-    '62032990': 'Conjuntos de outras matérias têxteis, de uso masculino',
-    '62033100': 'Paletós (casacos), de lã ou de pêlos finos, de uso masculino',
-    '62033200': 'Paletós (casacos), de algodão, de uso masculino',
-    '62033300': 'Paletós (casacos), de fibras sintéticas, de uso masculino',
-    '62033900': 'Paletós (casacos), de outras matérias têxteis, de uso masculino',
-    '62034100': 'Calças, jardineiras, bermudas e shorts, de lã ou de pêlos finos, de uso masculino',
-    '62034200': 'Calças, jardineiras, bermudas e shorts, de algodão, de uso masculino',
-    '62034300': 'Calças, jardineiras, bermudas e shorts, de fibras sintéticas, de uso masculino',
-    '62034900': 'Calças, jardineiras, bermudas e shorts, de outras matérias têxteis, de uso masculino',
-    '62041100': 'Tailleurs (fatos saia-casaco), de lã ou de pêlos finos, de uso feminino',
-    '62041200': 'Tailleurs (fatos de saia-casaco), de algodão, de uso feminino',
-    '62041300': 'Tailleurs (fatos de saia-casaco), de fibras sintéticas, de uso feminino',
-    '62041900': 'Tailleurs (fatos de saia-casaco), de outras matérias têxteis, de uso feminino',
-    '62042100': 'Conjuntos de lã ou de pêlos finos, de uso feminino',
-    '62042200': 'Conjuntos de algodão, de uso feminino',
-    '62042300': 'Conjuntos de fibras sintéticas, de uso feminino',
-    '62042900': 'Conjuntos de outras matérias têxteis, de uso feminino',
-    '62043100': 'Blazers (casacos) de lã ou de pêlos finos, de uso feminino',
-    '62043200': 'Blazers (casacos) de algodão, de uso feminino',
-    '62043300': 'Blazers (casacos) de fibras sintéticas, de uso feminino',
-    '62043900': 'Blazers (casacos) de outras matérias têxteis, de uso feminino',
-    '62044100': 'Vestidos de lã ou de pêlos finos, de uso feminino',
-    '62044200': 'Vestidos de algodão, de uso feminino',
-    '62044300': 'Vestidos de fibras sintéticas, de uso feminino',
-    '62044400': 'Vestidos de fibras artificiais, de uso feminino',
-    '62044900': 'Vestidos de outras matérias têxteis, de uso feminino',
-    '62045100': 'Saias e saias-calças, de lã ou de pêlos finos, de uso feminino',
-    '62045200': 'Saias e saias-calças, de algodão, de uso feminino',
-    '62045300': 'Saias e saias-calças, de fibras sintéticas, de uso feminino',
-    '62045900': 'Saias e saias-calças, de outras matérias têxteis, de uso feminino',
-    '62046100': 'Calças, jardineiras, bermudas e shorts, de lã ou de pêlos finos, de uso feminino',
-    '62046200': 'Calças, jardineiras, bermudas e shorts, de algodão, de uso feminino',
-    '62046300': 'Calças, jardineiras, bermudas e shorts, de fibras sintéticas, de uso feminino',
-    '62046900': 'Calças, jardineiras, bermudas e shorts, de outras matérias têxteis, de uso feminino',
-    '62052000': 'Camisas de algodão, de uso masculino',
-    '62053000': 'Camisas de fibras sintéticas ou artificiais, de uso masculino',
-    '62059010': 'Camisas de outras matérias têxteis, de uso masculino',
-    '62059090': 'Camisas de outras matérias têxteis, de uso masculino',
-    '62061000': 'Camisas, blusas, blusas chemisiers, de seda ou de seus desperdícios, de uso feminino',
-    '62062000': 'Camisas, blusas, blusas chemisiers, de lã ou de pêlos finos, de uso feminino',
-    '62063000': 'Camisas, blusas, blusas chemisiers, de algodão, de uso feminino',
-    '62064000': 'Camisas, blusas, blusas chemisiers, de fibras sintéticas ou artificiais, de uso feminino',
-    '62069000': 'Camisas, blusas, blusas chemisiers, de outras matérias têxteis, de uso feminino',
-    '62071100': 'Cuecas e ceroulas, de algodão',
-    '62071900': 'Cuecas e ceroulas, de outras matérias têxteis',
-    '62072100': 'Camisolões e pijamas, de algodão, de uso masculino',
-    '62072200': 'Camisolões e pijamas, de fibras sintéticas ou artificiais, de uso masculino',
-    '62072900': 'Camisolões e pijamas, de outras matérias têxteis, de uso masculino',
-    '62079100': 'Camisetas interiores, robes e semelhantes, de algodão, de uso masculino',
-    '62079910': 'Camisetas interiores, robes e semelhantes, de outras matérias têxteis, de uso masculino',
-    '62079990': 'Camisetas interiores, robes e semelhantes, de outras matérias têxteis, de uso masculino',
-    '62081100': 'Combinações e anáguas, de fibras sintéticas ou artificiais, de uso feminino',
-    '62081900': 'Combinações e anáguas, de outras matérias têxteis, de uso feminino',
-    '62082100': 'Camisolas e pijamas, de algodão, de uso feminino',
-    '62082200': 'Camisolas e pijamas, de fibras sintéticas ou artificiais, de uso feminino',
-    '62082900': 'Camisolas e pijamas, de outras matérias têxteis, de uso feminino',
-    '62089100': 'Corpetes, calcinhas, penhoares e artefatos semelhantes, de algodão',
-    '62089200': 'Corpetes, calcinhas, penhoares e artefatos semelhantes, de fibras sintéticas ou artificiais',
-    '62089900': 'Corpetes, calcinhas, penhoares e artefatos semelhantes, de outras matérias têxteis',
-    '62092000': 'Vestuários e seus acessórios de algodão, para bebês',
-    '62093000': 'Vestuários e seus acessórios de fibras sintéticas, para bebês',
-    '62099010': 'Vestuários e seus acessórios de outras matérias têxteis, para bebês',
-    '62099090': 'Vestuários e seus acessórios de outras matérias têxteis, para bebês',
-    '62101000': 'Vestuário confeccionado com feltros ou falsos tecidos',
-    '62102000': 'Sobretudos, impermeáveis e artigos semelhantes, confeccionados com feltros, filamentos sintéticos ou tecidos revestidos de plástico ou borracha, de uso masculino',
-    '62103000': 'Outros mantôs, impermeáveis, capas e semelhantes, confeccionados com feltro, falsos tecidos, tecidos com borracha, plástico ou demais tecidos impregnados, revestidos ou recobertos ou estratificados, de uso feminino',
-    '62104000': 'Outro vestuário confeccionado com feltros, filamentos sintéticos ou tecidos revestidos de plástico ou borracha, de uso masculino',
-    '62105000': 'Outro vestuário confeccionado com feltro, falsos tecidos, tecidos com borracha, plástico ou demais tecidos impregnados, revestidos ou recobertos ou estratificados, de uso feminino',
-    '62111100': 'Shorts e sungas, de banho, exceto de malha, de uso masculino',
-    '62111200': 'Maiôs e biquínis, de banho, exceto de malha, de uso feminino',
-    '62112000': 'Macacões e conjuntos, de esqui, exceto de malha',
-    '62113200': 'Abrigos (fatos de treino) para esporte e outro vestuário não classificado em outra parte, de algodão, de uso masculino',
-    '62113300': 'Abrigos (fatos de treino) para esporte e outro vestuário não classificado em outra parte, de fibras sintéticas ou artificiais, de uso masculino',
-    '62113910': 'Abrigos (fatos de treino) para esporte e outro vestuário não classificado em outra parte, de outras matérias têxteis, de uso masculino',
-    '62113990': 'Abrigos (fatos de treino) para esporte e outro vestuário não classificado em outra parte, de outras matérias têxteis, de uso masculino',
-    '62114200': 'Abrigos (fatos de treino) para esporte e outro vestuário não classificado em outra parte, de algodão, de uso feminino',
-    '62114300': 'Abrigos (fatos de treino) para esporte e outro vestuário não classificado em outra parte, de fibras sintéticas ou artificiais, de uso feminino',
-    '62114900': 'Abrigos (fatos de treino) para esporte e outro vestuário não classificado em outra parte, de outras matérias têxteis, de uso feminino',
-    '62121000': 'Sutiãs e bustiers (soutiens de cós alto)',
-    '62122000': 'Cintas e cintas-calças',
-    '62123000': 'Modeladores de torso inteiro (cintas soutiens)',
-    '62129000': 'Espartilhos, suspensórios, ligas, artefatos semelhantes e partes',
-    '62132000': 'Lenços de assoar e de bolso, de algodão',
-    '62139010': 'Lenços de assoar e de bolso, de outras matérias têxteis',
-    '62139090': 'Lenços de assoar e de bolso, de outras matérias têxteis',
-    '62141000': 'Xales, echarpes, cachecóis, mantilhas, véus e artefatos semelhantes, de seda ou de desperdícios de seda',
-    '62142000': 'Xales, echarpes, cachecóis, mantilhas, véus e artefatos semelhantes, de lã ou de pêlos finos',
-    '62143000': 'Xales, echarpes, cachecóis, mantilhas, véus e artefatos semelhantes, de fibras sintéticas',
-    '62144000': 'Xales, echarpes, cachecóis, mantilhas, véus e artefatos semelhantes, de fibras artificiais',
-    '62149010': 'Xales, echarpes, cachecóis, mantilhas, véus e artefatos semelhantes, de outras matérias têxteis',
-    '62149090': 'Xales, echarpes, cachecóis, mantilhas, véus e artefatos semelhantes, de outras matérias têxteis',
-    '62151000': 'Gravatas, gravatas-borboleta e plastrons, de seda ou de desperdícios de seda',
-    '62152000': 'Gravatas, gravatas-borboleta e plastrons, de fibras sintéticas ou artificiais',
-    '62159000': 'Gravatas, gravatas-borboleta e plastrons, de outras matérias têxteis',
-    '62160000': 'Luvas, mitenes e semelhantes',
-    '62171000': 'Outros acessórios de vestuário, confeccionados',
-    '62179000': 'Outras partes de vestuário ou dos seus acessórios',
-    '63011000': 'Cobertores e mantas, elétricos',
-    '63012000': 'Cobertores e mantas, de lã ou de pêlos finos, não elétricos',
-    '63013000': 'Cobertores e mantas, de algodão, não elétricos',
-    '63014000': 'Cobertores e mantas, de fibras sintéticas, não elétricos',
-    '63019000': 'Outros cobertores e mantas de matérias têxteis',
-    '63021000': 'Roupas de cama, de malha',
-    '63022100': 'Outras roupas de cama, de algodão, estampadas',
-    '63022200': 'Outras roupas de cama, de fibras sintéticas ou artificiais, estampadas',
-    '63022900': 'Outras roupas de cama, de outras matérias têxteis, estampadas',
-    '63023100': 'Outras roupas de cama, de algodão',
-    '63023200': 'Outras roupas de cama, de fibras sintéticas ou artificiais',
-    '63023900': 'Outras roupas de cama, de outras matérias têxteis',
-    '63024000': 'Roupas de mesa, de malha',
-    '63025100': 'Outras roupas de mesa, de algodão, exceto de malha',
-    '63025300': 'Outras roupas de mesa, de fibras sintéticas ou artificiais, exceto de malha',
-    '63025910': 'Outras roupas de mesa, de outras matérias têxteis',
-    '63025990': 'Outras roupas de mesa, de outras matérias têxteis',
-    '63026000': 'Roupas de toucador ou de cozinha, de tecidos atoalhados, de algodão',
-    '63029100': 'Outras roupas de toucador ou de cozinha, de algodão',
-    '63029300': 'Roupas de toucador ou de cozinha, de fibras sintéticas ou artificiais',
-    '63029910': 'Roupas de toucador ou de cozinha, de outras matérias têxteis',
-    '63029990': 'Roupas de toucador ou de cozinha, de outras matérias têxteis',
-    '63031200': 'Cortinas, sanefas e artigos semelhantes para cama, de malha, de fibras sintéticas',
-    '63031910': 'Cortinas, sanefas e artigos semelhantes para cama, de malha, de outras matérias têxteis',
-    '63031990': 'Cortinas, sanefas e artigos semelhantes para cama, de malha, de outras matérias têxteis',
-    '63039100': 'Cortinas, sanefas e artigos semelhantes para cama, de algodão, exceto malha',
-    '63039200': 'Cortinas, sanefas e artigos semelhantes para cama, de fibras sintéticas, exceto malha',
-    '63039900': 'Cortinas, sanefas e artigos semelhantes para cama, de outras matérias têxteis, exceto malha',
-    '63041100': 'Colchas de malha',
-    '63041910': 'Outras colchas, exceto de malha',
-    '63041990': 'Outras colchas, exceto de malha',
-    '63042000': 'Mosquiteiros para camas mencionados na Nota de subposição 1 do presente Capítulo',
-    '63049100': 'Outros artefatos para guarnição de interiores, de malha',
-    '63049200': 'Outros artefatos para guarnição de interiores, de algodão, exceto de malha',
-    '63049300': 'Outros artefatos para guarnição de interiores, de fibras sintéticas, exceto de malha',
-    '63049900': 'Outros artefatos para guarnição de interiores, de outras matérias têxteis, exceto de malha',
-    '63051000': 'Sacos para embalagem, de juta ou de outras fibras têxteis liberianas',
-    '63052000': 'Sacos para embalagem, de algodão',
-    '63053200': 'Contêineres flexíveis para produtos a granel, de matérias têxteis sintéticas ou artificiais',
-    '63053310': 'Outros sacos para embalagem, de lâminas ou formas semelhantes de polietileno ou polipropileno',
-    '63053390': 'Outros sacos para embalagem, de lâminas ou formas semelhantes de polietileno ou polipropileno',
-    '63053900': 'Sacos para embalagem, de outras matérias têxteis sintéticas ou artificiais',
-    '63059000': 'Outros sacos para embalagem, de outras matérias têxteis',
-    '63061200': 'Encerados e toldos, de fibras sintéticas',
-    '63061910': 'Encerados e toldos, de outras matérias têxteis',
-    '63061990': 'Encerados e toldos, de outras matérias têxteis',
-    '63062200': 'Tendas de fibras sintéticas',
-    '63062990': 'Tendas de outras matérias têxteis',
-    '63063010': 'Velas para embarcações, pranchas ou carros à vela, de matérias têxteis',
-    '63064090': 'Colchões pneumáticos de matérias têxteis',
-    '63069000': 'Outros artigos para acampamento, outros encerados e toldos',
-    '63071000': 'Rodilhas, esfregões, panos de prato ou de cozinha, flanelas e artefatos de limpeza semelhantes',
-    '63072000': 'Cintos e coletes salva-vidas',
-    '63079010': 'Outros artefatos têxteis confeccionados',
-    '63079020': 'Outros artefatos têxteis confeccionados',
-    '63079090': 'Outros artefatos têxteis confeccionados',
-    '63080000': 'Sortidos de cortes de tecidos e fios, para confecção de tapetes, tapeçarias, toalhas de mesa ou de artefatos têxteis semelhantes, para venda a retalho',
-    '63090010': 'Artefatos de matérias têxteis, calçados, chapéus e similares, usados',
-    '63090090': 'Artefatos de matérias têxteis, calçados, chapéus e similares, usados',
-    '63101000': 'Trapos; cordéis, cordas e cabos, de matérias têxteis, em forma de desperdícios, escolhidos',
-    '63109000': 'Outros trapos, cordéis, etc, de matérias têxteis, em desperdícios',
-    '64011000': 'Calçados impermeáveis de borracha ou plástico, com biqueira protetora de metal',
-    '64019200': 'Calçados impermeáveis de borracha ou plástico, cobrindo o tornozelo, mas não o joelho',
-    '64019910': 'Outros calçados impermeáveis de borracha ou plástico, sem costura',
-    '64019990': 'Outros calçados impermeáveis de borracha ou plástico, sem costura',
-    '64021200': 'Calçados para esqui e para surfe de neve, de borracha ou plástico',
-    '64021900': 'Calçados para outros esportes, de borracha ou plástico',
-    '64022000': 'Calçados de borracha ou plástico, com parte superior em tiras ou correias, com saliências (espigões) que se encaixam na sola',
-    '64029110': 'Outros calçados de borracha ou plástico, cobrindo o tornozelo',
-    '64029190': 'Outros calçados de borracha ou plástico, cobrindo o tornozelo',
-    '64029910': 'Outros calçados de borracha ou plástico',
-    '64029990': 'Outros calçados de borracha ou plástico',
-    '64031200': 'Calçados para esqui e para surfe de neve, parte superior de couro natural',
-    '64031900': 'Calçados para outros esportes, parte superior de couro natural',
-    '64032000': 'Calçados com sola exterior de couro natural e parte superior constituída por tiras de couro natural, passando pelopeito do pé e envolvendo o dedo grande',
-    '64034000': 'Outros calçados com biqueira protetora de metal, parte superior de couro natural',
-    '64035110': 'Outros calçados, com sola exterior de couro natural, cobrindo o tornozelo, parte superior de couro natural',
-    '64035190': 'Outros calçados, com sola exterior de couro natural, cobrindo o tornozelo, parte superior de couro natural',
-    '64035910': 'Outros calçados, com sola exterior de couro natural, parte superior de couro natural',
-    '64035990': 'Outros calçados, com sola exterior de couro natural, parte superior de couro natural',
-    '64039110': 'Outros calçados, cobrindo o tornozelo, parte superior de couro natural',
-    '64039190': 'Outros calçados, cobrindo o tornozelo, parte superior de couro natural',
-    '64039910': 'Outros calçados, parte superior de couro natural',
-    '64039990': 'Outros calçados, parte superior de couro natural',
-    '64041100': 'Calçados para esporte; calçados para tênis, basquetebol, ginástica, de matérias têxteis, com sola de borracha ou plástico',
-    '64041900': 'Outros calçados de matérias têxteis, com sola de borracha ou plástico',
-    '64042000': 'Calçados de matérias têxteis, com sola exterior de couro natural',
-    '64051010': 'Outros calçados de couro natural ou reconstituído',
-    '64051020': 'Outros calçados de couro natural ou reconstituído',
-    '64051090': 'Outros calçados de couro natural ou reconstituído',
-    '64052000': 'Outros calçados com a parte superior de matérias têxteis',
-    '64059000': 'Outros calçados com solas exteriores de borracha ou plástico',
-    '64061000': 'Partes superiores de calçados e seus componentes, exceto contrafortes e biqueiras rígidas',
-    '64062000': 'Solas exteriores e saltos, de borracha ou plástico - calçados sapatos',
-    '64069010': 'Solas, saltos, palmilhas e outras partes de calçados',
-    '64069020': 'Solas, saltos, palmilhas e outras partes de calçados',
-    '64069090': 'Solas, saltos, palmilhas e outras partes de calçados',
-    '65010000': 'Esboços não enformados nem na copa nem na aba, discos e cilindros, de feltro, para chapéus',
-    '65020010': 'Esboços de chapéus, entrançados ou obtidos por reunião de tiras de qualquer matéria, sem copa nem aba enformadas e sem guarnições',
-    '65020090': 'Esboços de chapéus, entrançados ou obtidos por reunião de tiras de qualquer matéria, sem copa nem aba enformadas e sem guarnições',
-    '65040010': 'Chapéus e outros artefatos de uso semelhante, entrançados por tiras, de qualquer matéria',
-    '65040090': 'Chapéus e outros artefatos de uso semelhante, entrançados por tiras, de qualquer matéria',
-    '65050011': 'Chapéus e artigos de uso semelhante a chapéus',
-    '65050012': 'Chapéus e artigos de uso semelhante a chapéus',
-    '65050019': 'Chapéus e artigos de uso semelhante a chapéus',
-    '65050021': 'Chapéus e artigos de uso semelhante a chapéus',
-    '65050022': 'Chapéus e artigos de uso semelhante a chapéus',
-    '65050029': 'Chapéus e artigos de uso semelhante a chapéus',
-    '65050031': 'Chapéus e artigos de uso semelhante a chapéus',
-    '65050032': 'Chapéus e artigos de uso semelhante a chapéus',
-    '65050039': 'Chapéus e artigos de uso semelhante a chapéus',
-    '65050090': 'Chapéus e artigos de uso semelhante a chapéus',
-    '65061000': 'Capacetes e outros artefatos de uso semelhante, de proteção',
-    '65069100': 'Chapéus e outros artefatos de uso semelhante, de borracha ou de plástico',
-    '65069900': 'Chapéus e outros artefatos de uso semelhante, de outras matérias',
-    '65070000': 'Tiras para guarnição interior, forros, capas, armações, para chapéus e artefatos de uso semelhante',
-    '66011000': 'Guarda-sóis de jardim e artefatos semelhantes',
-    '66019110': 'Guarda-chuvas de haste ou cabo telescópico',
-    '66019190': 'Guarda-chuvas de haste ou cabo telescópico',
-    '66019900': 'Outros guarda-chuvas e sombrinhas',
-    '66020000': 'Bengalas, bengalas-assentos, chicotes e artefatos semelhantes',
-    '66032000': 'Armações montadas, mesmo com hastes ou cabos, para guarda-chuvas, sobrinhas ou guarda-sóis',
-    '66039000': 'Outras partes, guarnições e acessórios, para artigos das posições 6601 e 6602',
-    '67010000': 'Peles e outras partes de aves, com suas penas ou penugem; penas, partes de penas, penugem e artefatos de estas matérias',
-    '67021000': 'Flores, folhagem e frutos, artificiais e suas partes; artefatos confeccionados com flores, folhagem e frutos, artificiais, de plástico',
-    '67029000': 'Flores, folhagem e frutos, artificiais e suas partes, de outras matérias',
-    '67030000': 'Cabelos, lã, pêlos e outras matérias têxteis, preparados para a fabricação de perucas ou artefatos semelhantes',
-    '67041100': 'Perucas completas, de matérias têxteis sintéticas',
-    '67041900': 'Barbas, sobrancelhas, pestanas, madeixas e semelhantes, de matérias têxteis sintéticas',
-    '67042000': 'Perucas, barbas, sobrancelhas, pestanas, madeixas e semelhantes, de cabelo',
-    '67049000': 'Perucas, barbas, sobrancelhas, pestanas, madeixas e semelhantes, de pêlos ou de matérias têxteis',
-    '68010000': 'Pedras para calcetar, meios-fios e placas (lajes), para pavimentação, de pedra natural',
-    '68021000': 'Ladrilhos, cubos, pastilhas e artigos semelhantes, de pedra natural, de lado < 7 cm',
-    '68022100': 'Mármore, travertino e alabastro, talhados ou serrados, de superfície plana ou lisa',
-    '68022300': 'Granito, talhado ou serrado, de superfície plana ou lisa',
-    '68022900': 'Outras pedras de cantaria, talhadas ou serradas, de superfície plana ou lisa',
-    '68029100': 'Mármore, travertino e alabastro, trabalhados de outro modo e suas obras',
-    '68029200': 'Outras pedras calcárias, trabalhadas de outro modo e suas obras',
-    '68029310': 'Granitos trabalhados de outro modo e suas obras',
-    '68029390': 'Granitos trabalhados de outro modo e suas obras',
-    '68029910': 'Outras pedras de cantaria trabalhadas de outro modo e suas obras',
-    '68029990': 'Outras pedras de cantaria trabalhadas de outro modo e suas obras',
-    '68030000': 'Ardósia natural trabalhada e obras de ardósia natural ou aglomerada',
-    '68041000': 'Mós para moer ou desfibrar',
-    '68042111': 'Outros mós de diamante natural ou sintético, aglomerado',
-    '68042119': 'Outros mós de diamante natural ou sintético, aglomerado',
-    '68042190': 'Outros mós de diamante natural ou sintético, aglomerado',
-    '68042211': 'Outros mós de outros abrasivos aglomerados ou de cerâmica',
-    '68042219': 'Outros mós de outros abrasivos aglomerados ou de cerâmica',
-    '68042290': 'Outros mós de outros abrasivos aglomerados ou de cerâmica',
-    '68042300': 'Outros mós de pedras naturais e artefatos semelhantes',
-    '68043000': 'Pedras para amolar ou polir, manualmente, de pedra natural ou artificial aglomerada',
-    '68051000': 'Abrasivos naturais ou artificiais, em pó ou em grãos, aplicados apenas sobre tecidos de matérias têxteis',
-    '68052000': 'Abrasivos naturais ou artificiais, em pó ou em grãos, aplicados apenas sobre papel ou cartão',
-    '68053010': 'Abrasivos naturais ou artificiais, em pó ou em grãos, aplicados sobre outras matérias',
-    '68053020': 'Abrasivos naturais ou artificiais, em pó ou em grãos, aplicados sobre outras matérias',
-    '68053090': 'Abrasivos naturais ou artificiais, em pó ou em grãos, aplicados sobre outras matérias',
-    '68061000': 'Lãs de escórias de altos-fornos, de outras escórias, lã de rocha e lãs minerais semelhantes, mesmo misturadas entre si, em massa, em folhas ou rolos',
-    '68062000': 'Vermiculita e argilas, expandidas, espuma de escórias e produtos minerais semelhantes',
-    '68069010': 'Outras misturas e obras de matérias minerais para isolamento do calor e do som',
-    '68069090': 'Outras misturas e obras de matérias minerais para isolamento do calor e do som',
-    '68071000': 'Obras de asfalto ou de produtos semelhantes, em rolos',
-    '68079000': 'Outras obras de asfalto ou de produtos semelhantes',
-    '68080000': 'Painéis, chapas, ladrilhos e semelhantes, de fibras vegetais, de palha, ou de desperdícios aglomerados com aglutinantes',
-    '68091100': 'Chapas, placas, painéis e ladrilhos, de gesso ou de composições à base de gesso, não ornamentados, revestidos ou reforçados exclusivamente com papel ou cartão',
-    '68091900': 'Outras chapas, placas, painéis e ladrilhos, de gesso ou de composições à base de gesso, não ornamentados',
-    '68099000': 'Outras obras de gesso ou de composições à base de gesso',
-    '68101100': 'Blocos e tijolos para construção, de cimento, de concreto, ou de pedra artificial',
-    '68101900': 'Outras telhas, ladrilhos, placas (lajes), tijolos e artefatos semelhantes, de cimento, de concreto ou de pedra artificial',
-    '68109100': 'Elementos pré-fabricados para construção ou engenharia civil, de cimento, de concreto ou de pedra artificial',
-    '68109900': 'Outras obras de cimento, concreto ou de pedra artificial',
-    '68114000': 'Obras de fibrocimento, cimento-celulose ou semelhantes, contendo amianto',
-    '68118100': 'Chapas onduladas de fibrocimento, cimento-celulose ou semelhantes, não contendo amianto',
-    '68118200': 'Outras chapas, painéis, ladrilhos, telhas e artigos semelhantes, de fibrocimento, cimento-celulose ou produtos semelhantes',
-    '68118900': 'Outras obras de fibrocimento, cimento-celulose ou semelhantes, não contendo amianto',
-    '68129100': 'Vestuário e acessórios, calçados, chapéus e artefatos de uso semelhante, de amianto ou de misturas à base de amianto',
-    '68129200': 'Papéis, cartões e feltros, de amianto ou de misturas à base de amianto',
-    '68129300': 'Folhas de amianto e elastômeros, comprimidos, para juntas, mesmo apresentadas em rolos',
-    '68129910': 'Outras obras de amianto ou de misturas à base de amianto',
-    '68129920': 'Outras obras de amianto ou de misturas à base de amianto',
-    '68129930': 'Outras obras de amianto ou de misturas à base de amianto',
-    '68129990': 'Outras obras de amianto ou de misturas à base de amianto',
-    '68132000': 'Guarnição de fricção para freios, embreagens ou qualquer outro mecanismo de fricção, não montadas, contendo amianto',
-    '68138110': 'Guarnições para freios, não montadas, não contendo amianto',
-    '68138190': 'Guarnições para freios, não montadas, não contendo amianto',
-    '68138910': 'Outras guarnições de fricção, não montadas, não contendo amianto',
-    '68138990': 'Outras guarnições de fricção, não montadas, não contendo amianto',
-    '68141000': 'Placas, folhas ou tiras, de mica aglomerada ou reconstituída',
-    '68149000': 'Outras obras de mica trabalhada',
-    '68151010': 'Obras de grafita ou de outros carbonos, para usos não elétricos',
-    '68151020': 'Obras de grafita ou de outros carbonos, para usos não elétricos',
-    '68151090': 'Obras de grafita ou de outros carbonos, para usos não elétricos',
-    '68151100': 'Fibras de carbono, não especificadas ou incluídas em outros lugares',
-    '68151200': 'Tecidos de fibras de carbono para usos não elétricos',
-    '68151300': 'Outros artigos de fibras de carbono para usos não elétricos',
-    '68151900': 'Fibras de carbono; artigos de fibras de carbono para usos não elétricos; outros artigos de grafite ou outros artigos de carbono para usos não elétricos; não classificados nos códigos anteriores',
-    '68152000': 'Obras de turfa',
-    '68159110': 'Outras obras contendo magnesita, dolomita ou cromita',
-    '68159190': 'Outras obras contendo magnesita, dolomita ou cromita',
-    '68159911': 'Outras obras de pedras ou de outras matérias minerais',
-    '68159912': 'Outras obras de pedras ou de outras matérias minerais',
-    '68159914': 'Outras obras de pedras ou de outras matérias minerais',
-    '68159919': 'Outras obras de pedras ou de outras matérias minerais',
-    '68159990': 'Outras obras de pedras ou de outras matérias minerais',
-    '69010000': 'Tijolos, placas (lajes), ladrilhos e outras peças cerâmicas de farinhas siliciosas fósseis ou de terras siliciosas',
-    '69021011': 'Tijolos, placas, ladrilhos e peças cerâmicas semelhantes, para construção, refratários, contendo > 50% em peso dos elementos Mg, Ca, ou Cr, tomados isoladamente ou em conjunto, expressos em MgO, CaO2 ou Cr2O3',
-    '69021018': 'Tijolos, placas, ladrilhos e peças cerâmicas semelhantes, para construção, refratários, contendo > 50% em peso dos elementos Mg, Ca, ou Cr, tomados isoladamente ou em conjunto, expressos em MgO, CaO2 ou Cr2O3',
-    '69021019': 'Tijolos, placas, ladrilhos e peças cerâmicas semelhantes, para construção, refratários, contendo > 50% em peso dos elementos Mg, Ca, ou Cr, tomados isoladamente ou em conjunto, expressos em MgO, CaO2 ou Cr2O3',
-    '69021090': 'Tijolos, placas, ladrilhos e peças cerâmicas semelhantes, para construção, refratários, contendo > 50% em peso dos elementos Mg, Ca, ou Cr, tomados isoladamente ou em conjunto, expressos em MgO, CaO2 ou Cr2O3',
-    '69022010': 'Tijolos, placas, ladrilhos e peças cerâmicas semelhantes, para construção, refratários, contendo > 50% em peso de alumina e/ou sílica, ou de uma mistura destes produtos',
-    '69022091': 'Tijolos, placas, ladrilhos e peças cerâmicas semelhantes, para construção, refratários, contendo > 50% em peso de alumina e/ou sílica, ou de uma mistura destes produtos',
-    '69022092': 'Tijolos, placas, ladrilhos e peças cerâmicas semelhantes, para construção, refratários, contendo > 50% em peso de alumina e/ou sílica, ou de uma mistura destes produtos',
-    '69022093': 'Tijolos, placas, ladrilhos e peças cerâmicas semelhantes, para construção, refratários, contendo > 50% em peso de alumina e/ou sílica, ou de uma mistura destes produtos',
-    '69022099': 'Tijolos, placas, ladrilhos e peças cerâmicas semelhantes, para construção, refratários, contendo > 50% em peso de alumina e/ou sílica, ou de uma mistura destes produtos',
-    '69029010': 'Outros tijolos, placas, ladrilhos e peças cerâmicas, para construção, refratários',
-    '69029020': 'Outros tijolos, placas, ladrilhos e peças cerâmicas, para construção, refratários',
-    '69029040': 'Outros tijolos, placas, ladrilhos e peças cerâmicas, para construção, refratários',
-    '69029090': 'Outros tijolos, placas, ladrilhos e peças cerâmicas, para construção, refratários',
-    '69031011': 'Outros produtos cerâmicos refratários, contendo em peso > 50% de grafita ou de outro carbono',
-    '69031012': 'Outros produtos cerâmicos refratários, contendo em peso > 50% de grafita ou de outro carbono',
-    '69031019': 'Outros produtos cerâmicos refratários, contendo em peso > 50% de grafita ou de outro carbono',
-    '69031030': 'Outros produtos cerâmicos refratários, contendo em peso > 50% de grafita ou de outro carbono',
-    '69031040': 'Outros produtos cerâmicos refratários, contendo em peso > 50% de grafita ou de outro carbono',
-    '69031090': 'Outros produtos cerâmicos refratários, contendo em peso > 50% de grafita ou de outro carbono',
-    '69032010': 'Outros produtos cerâmicos refratários, contendo em peso > 50% de alumina ou alumina e sílica',
-    '69032020': 'Outros produtos cerâmicos refratários, contendo em peso > 50% de alumina ou alumina e sílica',
-    '69032030': 'Outros produtos cerâmicos refratários, contendo em peso > 50% de alumina ou alumina e sílica',
-    '69032090': 'Outros produtos cerâmicos refratários, contendo em peso > 50% de alumina ou alumina e sílica',
-    '69039011': 'Outros produtos cerâmicos refratários',
-    '69039019': 'Outros produtos cerâmicos refratários',
-    '69039091': 'Outros produtos cerâmicos refratários',
-    '69039092': 'Outros produtos cerâmicos refratários',
-    '69039099': 'Outros produtos cerâmicos refratários',
-    '69041000': 'Tijolos para construção, de cerâmica',
-    '69049000': 'Tijoleiras, tapa-vigas e outros produtos semelhantes, para construção, de cerâmica',
-    '69051000': 'Telhas de cerâmicas',
-    '69059000': 'Outros produtos cerâmicos para construção',
-    '69060000': 'Tubos, calhas ou algerozes e acessórios para canalizações, de cerâmica',
-    '69072100': 'Ladrilhos e placas (lajes), para pavimentação ou revestimento, exceto os das subposições 6907.30 e 6907.40, com um coeficiente de absorção de água, em peso, não superior a 0,5 %',
-    '69072200': 'Ladrilhos e placas (lajes), para pavimentação ou revestimento, exceto os das subposições 6907.30 e 6907.40, com um coeficiente de absorção de água, em peso, superior a 0,5 %, mas não superior a 10 %',
-    '69072300': 'Ladrilhos e placas (lajes), para pavimentação ou revestimento, exceto os das subposições 6907.30 e 6907.40, com um coeficiente de absorção de água, em peso, superior a 10 %',
-    '69073000': 'Cubos, pastilhas e artigos semelhantes, para mosaicos, exceto os da subposição 6907.40',
-    '69074000': 'Peças de acabamento, de cerâmica',
-    '69091100': 'Aparelhos e artefatos de porcelana, para usos químicos ou técnicos',
-    '69091210': 'Outros artefatos de cerâmica, com dureza => 9 Mohs',
-    '69091230': 'Outros artefatos de cerâmica, com dureza => 9 Mohs',
-    '69091290': 'Outros artefatos de cerâmica, com dureza => 9 Mohs',
-    '69091910': 'Outros aparelhos e artefatos de cerâmica, para usos químicos ou técnicos',
-    '69091930': 'Outros aparelhos e artefatos de cerâmica, para usos químicos ou técnicos',
-    '69091990': 'Outros aparelhos e artefatos de cerâmica, para usos químicos ou técnicos',
-    '69099000': 'Alguidares, gamelas e outros recipientes semelhantes, de cerâmica, para usos rurais',
-    '69101000': 'Pias, lavatórios, banheiras, bidês e semelhantes, de porcelana, para usos sanitários',
-    '69109000': 'Pias, lavatórios, banheiras, bidês e semelhantes, de cerâmica, exceto porcelana, para usos sanitários',
-    '69111010': 'Artigos para serviço de mesa ou cozinha, de porcelana',
-    '69111090': 'Artigos para serviço de mesa ou cozinha, de porcelana',
-    '69119000': 'Outros artigos de uso doméstico e de higiene ou de toucador, de porcelana',
-    '69120000': 'Louças, outros artigos de uso da espécie doméstica e de higiene ou de toucador, de cerâmica, exceto de porcelana',
-    '69131000': 'Estatuetas e outros objetos de ornamentação, de porcelana',
-    '69139000': 'Estatuetas e outros objetos de ornamentação, de cerâmica',
-    '69141000': 'Outras obras de porcelana',
-    '69149000': 'Outras obras de cerâmica',
-    '70010000': 'Cacos, fragmentos e outros desperdícios e resíduos de vidro; vidro em blocos ou massas',
-    '70021000': 'Esferas de vidro, não trabalhado',
-    '70022000': 'Barras ou varetas, de vidro, não trabalhado',
-    '70023100': 'Tubos de quartzo ou de outras sílicas fundidos, não trabalhados',
-    '70023200': 'Tubos de outros vidros, com coeficiente de dilatação linear <= 5x106 por Kelvin, não trabalhados',
-    '70023900': 'Tubos de outros vidros, não trabalhados',
-    '70031200': 'Chapas e folhas não armadas, de vidro vazado ou laminado, coradas na massa, opacificadas, folheadas (chapeadas), ou com camada absorvente, refletora ou não',
-    '70031900': 'Outras chapas e folhas, não armadas, de vidro vazado ou laminado',
-    '70032000': 'Chapas e folhas armadas, de vidro vazado ou laminado',
-    '70033000': 'Perfis de vidro vazado ou laminado',
-    '70042000': 'Folhas de vidro estirado ou soprado, corado na massa, opacificado, folheado (chapeado), ou com camada absorvente, refletora ou não',
-    '70049000': 'Outro vidro estirado ou soprado, em folhas',
-    '70051000': 'Vidro flotado não armado, com camada absorvente, refletora ou não, em chapas ou em folhas',
-    '70052100': 'Outro vidro flotado não armado, corado na massa, opacificado, folheado (chapeado), ou simplesmente desbastado, em chapas ou folhas',
-    '70052900': 'Outros vidros flotados e desbastados não armados, em chapas ou em folhas',
-    '70060000': 'Vidro recurvado, biselado, gravado, brocado ou trabalhado de outro modo, mas não emoldurado',
-    '70071100': 'Vidros de segurança, temperados, de dimensões e formatos para uso em automóveis, barcos ou outros veículos',
-    '70071900': 'Outros vidros de segurança, temperados',
-    '70072100': 'Vidros de segurança, formados de folhas contracoladas, de dimensões e formatos para aplicação em automóveis, barcos ou outros veículos',
-    '70072900': 'Outros vidros de segurança, formados de folhas contracoladas',
-    '70080000': 'Vidros isolantes de paredes múltiplas',
-    '70091000': 'Espelhos retrovisores para veículos',
-    '70099100': 'Espelhos de vidro, não emoldurados',
-    '70099200': 'Espelhos de vidro, emoldurados',
-    '70101000': 'Ampolas de vidro, para transporte ou embalagem',
-    '70102000': 'Rolhas, tampas e outros dispositivos de uso semelhantes, de vidro',
-    '70109011': 'Garrafões, garrafas, frascos, boiões, vasos e outros recipientes, de vidro, próprios para transporte ou embalagem',
-    '70109012': 'Garrafões, garrafas, frascos, boiões, vasos e outros recipientes, de vidro, próprios para transporte ou embalagem',
-    '70109021': 'Garrafões, garrafas, frascos, boiões, vasos e outros recipientes, de vidro, próprios para transporte ou embalagem',
-    '70109022': 'Garrafões, garrafas, frascos, boiões, vasos e outros recipientes, de vidro, próprios para transporte ou embalagem',
-    '70109090': 'Garrafões, garrafas, frascos, boiões, vasos e outros recipientes, de vidro, próprios para transporte ou embalagem',
-    '70111010': 'Ampolas e invólucros de vidro, para iluminação elétrica',
-    '70111029': 'Ampolas e invólucros de vidro, para iluminação elétrica',
-    '70111090': 'Ampolas e invólucros de vidro, para iluminação elétrica',
-    '70112000': 'Ampolas e invólucros de vidro, para tubos catódicos',
-    '70119000': 'Outras ampolas e invólucros abertos, e suas partes, de vidro',
-    '70131000': 'Objetos de vitrocerâmica, para serviço de mesa, cozinha, toucador, ornamentação ou usos semelhantes',
-    '70132200': 'Copos com pé, de cristal de chumbo',
-    '70132800': 'Outros copos com pé, de vidro, exceto de vitrocerâmica',
-    '70133300': 'Outros copos de cristal de chumbo',
-    '70133700': 'Outros copos de vidro, exceto de vitrocerâmica',
-    '70134100': 'Objetos para serviço de mesa ou de cozinha (exceto copos), de cristal de chumbo',
-    '70134210': 'Objetos para serviço de mesa, de vidro (exceto de vitrocerãmica), com coeficiente de dilatação linear não superior a 5x10-6 por Kelvin, entre 0°C e 300°C',
-    '70134290': 'Objetos para serviço de mesa, de vidro (exceto de vitrocerãmica), com coeficiente de dilatação linear não superior a 5x10-6 por Kelvin, entre 0°C e 300°C',
-    '70134900': 'Outros objetos de serviço de mesa ou de cozinha, exceto de vitrocerâmica',
-    '70139110': 'Outros objetos de cristal de chumbo, para toucador, escritório decoração e usos semelhantes',
-    '70139190': 'Outros objetos de cristal de chumbo, para toucador, escritório decoração e usos semelhantes',
-    '70139900': 'Outros objetos de vidro (exceto vitrocerãmica), para toucador, escritório, decoração e usos semelhantes',
-    '70140000': 'Artefatos de vidro para sinalização e elementos de óptica de vidro',
-    '70151010': 'Vidros para lentes corretivas, não trabalhados opticamente',
-    '70151091': 'Vidros para lentes corretivas, não trabalhados opticamente',
-    '70159010': 'Vidros para relógios e aparelhos semelhantes, lentes não corretivas, não trabalhados opticamente, esferas de vidro ocas e seus segmentos',
-    '70159020': 'Vidros para relógios e aparelhos semelhantes, lentes não corretivas, não trabalhados opticamente, esferas de vidro ocas e seus segmentos',
-    '70159090': 'Vidros para relógios e aparelhos semelhantes, lentes não corretivas, não trabalhados opticamente, esferas de vidro ocas e seus segmentos',
-    '70161000': 'Cubos, pastilhas e outros artigos semelhantes, de vidro, mesmo com suporte, para mosaicos ou decorações semelhantes',
-    '70169000': 'Blocos, placas, tijolos e outros artefatos, de vidro prensado ou moldado, para a construção',
-    '70171000': 'Artefatos de quartzo ou de outras sílicas fundidos, para laboratório',
-    '70172000': 'Artefatos de outro vidro, com coeficiente de dilatação linear <= 5x106 por Kelvin, para laboratório',
-    '70179000': 'Outros artefatos de vidro, para laboratório, higiene e farmácia',
-    '70181010': 'Contas, imitações de pérolas naturais ou cultivadas, de pedras preciosas ou semipreciosas e artefatos semelhantes, de vidro',
-    '70181020': 'Contas, imitações de pérolas naturais ou cultivadas, de pedras preciosas ou semipreciosas e artefatos semelhantes, de vidro',
-    '70181090': 'Contas, imitações de pérolas naturais ou cultivadas, de pedras preciosas ou semipreciosas e artefatos semelhantes, de vidro',
-    '70182000': 'Microesferas de vidro, de diâmetro <= 1 mm',
-    '70189000': 'Outras obras e objetos de ornamentação, de vidro',
-    '70191100': 'Fios de fibras de vidro, cortados, de comprimento <= 50 mm',
-    '70191210': 'Mechas ligeiramente torcidas (rovings), de fibras de vidro',
-    '70191290': 'Mechas ligeiramente torcidas (rovings), de fibras de vidro',
-    '70191300': 'Outros fios e lascas de fibra de vidro, não classificados nos códigos anteriores',
-    '70191400': 'Esteiras de fibra de vidro coladas mecanicamente',
-    '70191500': 'Esteiras de fibra de vidro coladas quimicamente',
-    '70191900': 'Outras mechas e fios, de fibras de vidro',
-    '70193100': 'Esteiras (mats) de fibras de vidro, não tecidos',
-    '70193200': 'Véus de fibras de vidro, não tecidos',
-    '70193900': 'Mantas, colchões, painéis e produtos semelhantes, de fibras de vidro, não tecidos',
-    '70194000': 'Tecidos de mechas ligeiramente torcidas (*rovings*), de fibras de vidro',
-    '70195100': 'Outros tecidos de fibras de vidro, de largura <= 30 cm',
-    '70195210': 'Outros tecidos de fibras de vidro, de largura > 30 cm, em ponto de tafetá, com peso < 250 g/m2',
-    '70195290': 'Outros tecidos de fibras de vidro, de largura > 30 cm, em ponto de tafetá, com peso < 250 g/m2',
-    '70195900': 'Outros tecidos de fibras de vidro',
-    '70196100': 'Tecidos fechados de fibras de vidro de mechas, ligados mecanicamente',
-    '70196200': 'Outros tecidos fechados de fibras de vidro de mechas, não classificados nos códigos anteriores',
-    '70196300': 'Tecidos fechados de fibras de vidro, tafetá, de fios, não revestidos nem laminados, ligados mecanicamente',
-    '70196400': 'Tecidos fechados de fibras de vidro, tafetá, de fios, revestidos ou laminados, ligados mecanicamente',
-    '70196500': 'Tecidos abertos de fibras de vidro de largura não superior a 30 cm, ligados mecanicamente',
-    '70196600': 'Tecidos abertos de fibras de vidro de largura superior a 30 cm, ligados mecanicamente',
-    '70196900': 'Outros tecidos ligados mecanicamente de fibras de vidro, não classificados nos códigos anteriores',
-    '70197100': 'Véus de fibra de vidro (folhas finas), quimicamente ligados',
-    '70197200': 'Outros tecidos fechados de fibras de vidro, ligados quimicamente, não classificados nos códigos anteriores',
-    '70197390': 'Outros tecidos abertos de fibras de vidro, ligados quimicamente, não classificados nos códigos anteriores',
-    '70198000': 'Lã de vidro e artigos de lã de vidro',
-    '70199000': 'Outras obras de fibras de vidro',
-    '70199010': 'Outras obras de fibras de vidro',
-    '70199090': 'Outras obras de fibras de vidro',
-    '70200010': 'Outras obras de vidro',
-    '70200090': 'Outras obras de vidro',
-    '71011000': 'Pérolas naturais, não montadas, nem engastadas',
-    '71012200': 'Pérolas cultivadas, trabalhadas, não montadas, nem engastadas',
-    '71021000': 'Diamantes não selecionados, não montados, nem engastados',
-    '71022100': 'Diamantes industriais, em bruto ou serrados, clivados ou desbastados',
-    '71022900': 'Outros diamantes industriais, não montados, nem engastados',
-    '71023100': 'Diamantes não industriais, em bruto ou serrados, clivados ou desbastados',
-    '71023900': 'Outros diamantes não industriais, não montados, nem engastados',
-    '71031000': 'Pedras preciosas ou semipreciosas, em bruto ou simplesmente serradas ou desbastadas',
-    '71039100': 'Rubis, safiras e esmeraldas, trabalhadas de outro modo',
-    '71039900': 'Outras pedras preciosas ou semipreciosas, trabalhadas de outro modo',
-    '71042010': 'Outras pedras sintéticas ou reconstituídas, em bruto ou simplesmente serradas ou desbastadas',
-    '71042090': 'Outras pedras sintéticas ou reconstituídas, em bruto ou simplesmente serradas ou desbastadas',
-    '71042100': 'Diamantes, sintéticos ou reconstruídos, não trabalhados ou simplesmente serrados ou com forma grosseira',
-    '71049000': 'Outras pedras sintéticas ou reconstituídas, mesmo trabalhadas ou combinadas, mas não enfiadas, nem montadas nem engastadas',
-    '71049900': 'Outras pedras sintéticas ou reconstituídas preciosas ou semipreciosas, trabalhadas ou não, mas não encordoadas, montadas ou engastadas; outras pedras sintéticas ou reconstituídas preciosas ou semipreciosas, não encordoadas temporariamente por conveniência de transporte; não classificadas nos códigos anteriores',
-    '71051000': 'Pó de diamantes',
-    '71059000': 'Outros pós de pedras preciosas, semipreciosas ou sintéticas',
-    '71061000': 'Pó de prata',
-    '71069100': 'Prata em formas brutas',
-    '71069210': 'Prata em outras formas semimanufaturadas',
-    '71069220': 'Prata em outras formas semimanufaturadas',
-    '71069290': 'Prata em outras formas semimanufaturadas',
-    '71070000': 'Metais comuns folheados ou chapeados de prata, em formas brutas ou semimanufaturadas',
-    '71081100': 'Pó de ouro (incluído o ouro platinado), para usos não monetários',
-    '71081210': 'Ouro (incluído o ouro platinado) em outras formas brutas, para usos não monetários',
-    '71081290': 'Ouro (incluído o ouro platinado) em outras formas brutas, para usos não monetários',
-    '71081310': 'Ouro (incluído o ouro platinado) em outras formas semimanufaturadas, para usos não monetários',
-    '71081390': 'Ouro (incluído o ouro platinado) em outras formas semimanufaturadas, para usos não monetários',
-    '71090000': 'Metais comuns ou prata, folheados ou chapeados de ouro, em formas brutas ou semimanufaturadas',
-    '71101100': 'Platina em formas brutas ou em pó',
-    '71101910': 'Platina em outras formas semimanufaturadas',
-    '71101990': 'Platina em outras formas semimanufaturadas',
-    '71102100': 'Paládio em formas brutas ou em pó',
-    '71102900': 'Paládio em formas semimanufaturadas',
-    '71103100': 'Ródio em formas brutas ou em pó',
-    '71104100': 'Irídio, ósmio e rutênio, em formas brutas ou em pó',
-    '71110000': 'Metais comuns, prata ou ouro, folheados ou chapeados de platina, em formas brutas ou semimanufaturadas',
-    '71123010': 'Cinzas contendo metais preciosos ou compostos de metais preciosos',
-    '71123020': 'Cinzas contendo metais preciosos ou compostos de metais preciosos',
-    '71123090': 'Cinzas contendo metais preciosos ou compostos de metais preciosos',
-    '71129100': 'Resíduos e desperdícios de ouro ou de metais folheados ou chapeados de ouro',
-    '71129200': 'Resíduos e desperdícios de platina ou de metais folheados ou chapeados de platina',
-    '71129900': 'Resíduos e desperdícios de prata ou de metais folheados ou chapeados de prata',
-    '71131100': 'Artefatos de joalharia, de prata, mesmo revestida, folheada ou chapeada de metais preciosos - jóias',
-    '71131900': 'Artefatos de joalharia, de outros metais preciosos, mesmo revestidos, folheados ou chapeados de metais preciosos - jóias',
-    '71132000': 'Artefatos de joalharia, de metais comuns folheados ou chapeados de metais preciosos - jóias',
-    '71141100': 'Artefatos de ourivesaria e suas partes, de prata, mesmo revestida, folheada ou chapeada de outros metais preciosos - jóias',
-    '71141900': 'Artefatos de ourivesaria e suas partes, de outros metais preciosos, mesmo revestidos, folheados ou chapeados de metais preciosos - jóias',
-    '71142000': 'Artefatos de ourivesaria e suas partes, de metais comuns folheados ou chapeados de metais preciosos - jóias',
-    '71151000': 'Telas ou grades catalisadoras, de platina',
-    '71159000': 'Outras obras de metais preciosos ou de metais folheados ou chapeados de metais preciosos',
-    '71161000': 'Obras de pérolas naturais ou cultivadas',
-    '71162010': 'Outras obras de pedras preciosas ou semipreciosas, ou de pedras sintéticas ou reconstituídas',
-    '71162020': 'Outras obras de pedras preciosas ou semipreciosas, ou de pedras sintéticas ou reconstituídas',
-    '71162090': 'Outras obras de pedras preciosas ou semipreciosas, ou de pedras sintéticas ou reconstituídas',
-    '71171100': 'Abotoaduras (botões de punho) e outros botões, de metais comuns, mesmo prateados, dourados ou platinados',
-    '71171900': 'Outras bijuterias de metais comuns',
-    '71179000': 'Outras bijuterias',
-    '71181010': 'Moedas sem curso legal, exceto de ouro',
-    '71181090': 'Moedas sem curso legal, exceto de ouro',
-    '72011000': 'Ferro fundido bruto não ligado, contendo, em peso <= 0,5% de fósforo',
-    '72012000': 'Ferro fundido bruto não ligado, contendo, em peso > 0,5% de fósforo',
-    '72015000': 'Ligas de ferro fundido bruto, ferro spiegel (especular)',
-    '72021100': 'Ferromanganês, contendo, em peso > 2% de carbono',
-    '72021900': 'Outras ligas de ferromanganês',
-    '72022100': 'Ferrossilício, contendo em peso > 55% de silício',
-    '72022900': 'Outras ligas de ferrossilício',
-    '72023000': 'Ferrossilício-manganês',
-    '72024100': 'Ferrocromo, contendo, em peso > 4% de carbono',
-    '72024900': 'Outras ligas de ferrocromo',
-    '72025000': 'Ferrossilício-cromo',
-    '72026000': 'Ferroníquel',
-    '72027000': 'Ferromolibdênio',
-    '72028000': 'Ferrotungstênio e ferrossilício-tungstênio',
-    '72029100': 'Ferrotitânio e ferrossilício-titânio',
-    '72029200': 'Ferrovanádio',
-    '72029300': 'Ferronióbio',
-    '72029910': 'Outros ferroligas',
-    '72029990': 'Outros ferroligas',
-    '72031000': 'Produtos ferrosos obtidos por redução direta dos minérios de ferro',
-    '72039000': 'Outros produtos ferrosos esponjosos, em pedaços, esferas ou formas semelhantes; ferro de pureza mínima, em peso, de 99,94%, em pedaços, esferas ou formas semelhantes',
-    '72041000': 'Desperdícios e resíduos de ferro fundido',
-    '72042100': 'Desperdícios e resíduos de aços inoxidáveis',
-    '72042900': 'Desperdícios e resíduos de outras ligas de aços',
-    '72043000': 'Desperdícios e resíduos de ferro ou aço estanhados',
-    '72044100': 'Resíduos do torno e da fresa, aparas, lascas, limalhas e desperdícios da estampagem ou do corte, de ferro ou aço',
-    '72044900': 'Outros desperdícios e resíduos de ferro ou aço',
-    '72045000': 'Desperdícios de ferro ou aço, em lingotes',
-    '72051000': 'Granalhas de ferro fundido bruto, spiegel, ferro ou aço',
-    '72052100': 'Pós de ligas de aços',
-    '72052910': 'Outros pós de ferro fundido bruto, spiegel, de ferro ou aço',
-    '72052990': 'Outros pós de ferro fundido bruto, spiegel, de ferro ou aço',
-    '72061000': 'Ferro e aços não ligados, em lingotes',
-    '72069000': 'Ferro e aços não ligados, em outras formas primárias',
-    '72071110': 'Produtos semimanufaturados, de ferro ou aços, não ligados, contendo em peso < 0,25% de carbono, de seção transversal quadrada ou retangular e largura < 2 vezes a espessura',
-    '72071190': 'Produtos semimanufaturados, de ferro ou aços, não ligados, contendo em peso < 0,25% de carbono, de seção transversal quadrada ou retangular e largura < 2 vezes a espessura',
-    '72071200': 'Outros produtos semimanufaturados, de ferro ou aços, não ligados, contendo em peso < 0,25% de carbono, de seção transversal retangulars',
-    '72071900': 'Outros produtos semimanufaturados, de ferro ou aços, não ligados, contendo, em peso, < 0,25% de carbonos',
-    '72072000': 'Outros produtos semimanufaturados, de ferro ou aços, não ligados, contendo em peso => 0,25% de carbonos',
-    '72081000': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, em rolos, laminados a quente, com motivos em relevo, não folheados nem revestidos',
-    '72082500': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, em rolos, laminados a quente, decapados, de espessura => 4,75 mm, não folheados nem revestidos',
-    '72082610': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, em rolos, laminados a quente, decapados, de espessura => 3 mm e < 4,75 mm, não folheados nem revestidos',
-    '72082690': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, em rolos, laminados a quente, decapados, de espessura => 3 mm e < 4,75 mm, não folheados nem revestidos',
-    '72082710': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, em rolos, laminados a quente, decapados, de espessura < 3 mm, não folheados nem revestidos',
-    '72082790': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, em rolos, laminados a quente, decapados, de espessura < 3 mm, não folheados nem revestidos',
-    '72083610': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, em rolos, laminados a quente, de espessura > 10 mm, não folheados nem revestidos',
-    '72083690': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, em rolos, laminados a quente, de espessura > 10 mm, não folheados nem revestidos',
-    '72083700': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, em rolos, laminados a quente, de espessura => 4,75 mm e <= 10 mm, não folheados nem revestidos',
-    '72083810': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, em rolos, laminados a quente, de espessura => 3 mm e < 4,75 mm, não folheados nem revestidos',
-    '72083890': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, em rolos, laminados a quente, de espessura => 3 mm e < 4,75 mm, não folheados nem revestidos',
-    '72083910': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, em rolos, laminados a quente, de espessura < 3 mm, não folheados nem revestidos',
-    '72083990': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, em rolos, laminados a quente, de espessura < 3 mm, não folheados nem revestidos',
-    '72084000': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, não enrolados, laminados a quente, motivos em relevo, não folheados nem revestidos',
-    '72085100': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, não enrolados, laminados a quente, de espessura > 10 mm, não folheados nem revestidos',
-    '72085200': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, não enrolados, laminados a quente, de espessura => 4,75 mm e <= 10 mm, não folheados nem revestidos',
-    '72085300': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, não enrolados, laminados a quente, de espessura => 3 mm e < 4,75 mm, não folheados nem revestidos',
-    '72085400': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, não enrolados, laminados a quente, de espessura < 3 mm, não folheados nem revestidos',
-    '72089000': 'Outros produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, laminados a quente, não folheados ou chapeados, nem revestidos',
-    '72091500': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, em rolos, laminados a frio, de espessura => 3 mm, não folheados nem revestidos',
-    '72091600': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, em rolos, laminados a frio, de espessura > 1 mm e < 3 mm, não folheados nem revestidos',
-    '72091700': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, em rolos, laminados a frio, de espessura => 0,5 mm e <= 1 mm, não folheados nem revestidos',
-    '72091800': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, em rolos, laminados a frio, de espessura < 0,5 mm, não folheados nem revestidos',
-    '72092500': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, não enrolados, laminados a frio, de espessura => 3 mm, não folheados nem revestidos',
-    '72092600': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, não enrolados, laminados a frio, de espessura > 1 mm e < 3 mm, não folheados nem revestidos',
-    '72092700': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, não enrolados, laminados a frio, de espessura => 0,5 mm e <= 1 mm, não folheados nem revestidos',
-    '72092800': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, não enrolados, laminados a frio, de espessura < 0,5 mm, não folheados nem revestidos',
-    '72099000': 'Outros produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, laminados a frio, não folheados ou chapeados, nem revestidos',
-    '72101100': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, estanhados, de espessura => 0,5 mms',
-    '72101200': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, estanhados, de espessura < 0,5 mms',
-    '72103010': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, galvanizados eletroliticamente',
-    '72103090': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, galvanizados eletroliticamente',
-    '72104110': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, galvanizados por outro processo, onduladoss',
-    '72104190': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, galvanizados por outro processo, onduladoss',
-    '72104910': 'Outros produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, galvanizados por outro processos',
-    '72104990': 'Outros produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, galvanizados por outro processos',
-    '72105000': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, revestidos de óxido de cromo ou de cromo e óxido de cromos',
-    '72106100': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, revestidos de ligas de alumínio-zincos',
-    '72106911': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, revestidos de alumínios',
-    '72106919': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, revestidos de alumínios',
-    '72106990': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, revestidos de alumínios',
-    '72107010': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, pintados, envernizados ou revestidos de plásticoss',
-    '72107020': 'Produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, pintados, envernizados ou revestidos de plásticoss',
-    '72109000': 'Outros produtos laminados planos, de ferro ou aços não ligados, de largura => 600 mm, folheados ou chapeados ou revestidos',
-    '72111300': 'Produtos laminados planos, de ferro ou aços não ligados, de largura > 150 mm e < 600 mm, de espessura => 4 mm, laminados a quente nas quatro faces, não enrolados, sem motivos em relevos',
-    '72111400': 'Outros produtos laminados planos, de ferro ou aços não ligados, de largura < 600 mm, laminados a quente, de espessura => 4,75 mm, não folheados nem revestidos',
-    '72111900': 'Outros produtos laminados planos, de ferro ou aços não ligados, de largura < 600 mm, laminados a quente, não folheados nem revestidos',
-    '72112300': 'Produtos laminados planos, de ferro ou aços não ligados, de largura < 600 mm, laminados a frio, contendo em peso < 0,25% de carbono, não folheados nem revestidos',
-    '72112910': 'Outros produtos laminados planos, de ferro ou aços não ligados, de largura < 600 mm, laminados a frio, não folheados nem revestidos',
-    '72112920': 'Outros produtos laminados planos, de ferro ou aços não ligados, de largura < 600 mm, laminados a frio, não folheados nem revestidos',
-    '72119010': 'Outros produtos laminados planos, de ferro ou aços não ligados, de largura < 600 mm, laminados a frio, não folheados ou chapeados, nem revestidos',
-    '72119090': 'Outros produtos laminados planos, de ferro ou aços não ligados, de largura < 600 mm, laminados a frio, não folheados ou chapeados, nem revestidos',
-    '72121000': 'Produtos laminados planos, de ferro ou aços não ligados, de largura < 600 mm, estanhadoss',
-    '72122010': 'Produtos laminados planos, de ferro ou aços não ligados, de largura < 600 mm, galvanizados eletroliticamente',
-    '72122090': 'Produtos laminados planos, de ferro ou aços não ligados, de largura < 600 mm, galvanizados eletroliticamente',
-    '72123000': 'Produtos laminados planos, de ferro ou aços não ligados, de largura < 600 mm, galvanizados por outro processos',
-    '72124010': 'Produtos laminados planos, de ferro ou aços não ligados, de largura < 600 mm, pintados, envernizados ou revestidos de plásticoss',
-    '72124029': 'Produtos laminados planos, de ferro ou aços não ligados, de largura < 600 mm, pintados, envernizados ou revestidos de plásticoss',
-    '72125010': 'Produtos laminados planos, de ferro ou aços não ligados, de largura < 600 mm, revestidos de outras matérias',
-    '72125090': 'Produtos laminados planos, de ferro ou aços não ligados, de largura < 600 mm, revestidos de outras matérias',
-    '72126000': 'Produtos laminados planos, de ferro ou aços não ligados, de largura < 600 mm, folheados ou chapeadoss',
-    '72131000': 'Fio-máquina de ferro ou aços não ligados, dentados, com nervuras, sulcos ou relevos, obtidos durante a laminagems',
-    '72132000': 'Fio-máquina de aços para tornear',
-    '72139110': 'Fio-máquina de ferro ou aços não ligados, de seção circular de diâmetro < 14 mms',
-    '72139190': 'Fio-máquina de ferro ou aços não ligados, de seção circular de diâmetro < 14 mms',
-    '72139910': 'Outros fios-máquinas de ferro ou aços não ligados',
-    '72139990': 'Outros fios-máquinas de ferro ou aços não ligados',
-    '72141010': 'Barras de ferro ou aços não ligados, forjadas a quente-siderúrgicos',
-    '72141090': 'Barras de ferro ou aços não ligados, forjadas a quente-siderúrgicos',
-    '72142000': 'Barras de ferro ou aços não ligadas, laminadas a quente, dentadas, com nervuras, sulcos ou relevos, obtidos durante a laminagem, ou torcidas após a laminagems',
-    '72143000': 'Barras de aços para tornear, laminadas a quentes',
-    '72149100': 'Barras de ferro ou aços não ligados, laminadas a quente, de seção transversal retangulars',
-    '72149910': 'Outras barras de ferro ou aços não ligados, estiradas ou extrudadas a quentes',
-    '72149990': 'Outras barras de ferro ou aços não ligados, estiradas ou extrudadas a quentes',
-    '72151000': 'Barras de aços para tornear, simplesmente obtidas ou completamente acabadas a frios',
-    '72155000': 'Outras barras de ferro ou aços não ligados, simplesmente obtidas ou completamente acabadas a frios',
-    '72159010': 'Outras barras de ferro ou aços não ligados',
-    '72159090': 'Outras barras de ferro ou aços não ligados',
-    '72161000': 'Perfis de ferro ou aços não ligados, em U, I ou H, laminados, estirados ou extrudados a quente, de altura < 80 mms',
-    '72162100': 'Perfis de ferro ou aços não ligados, em L, laminados, estirados ou extrudados a quente, de altura < 80 mms',
-    '72162200': 'Perfis de ferro ou aços não ligados, em T, laminados, estirados ou extrudados a quente, de altura < 80 mms',
-    '72163100': 'Perfis de ferro ou aços não ligados, em U, laminados, estirados ou extrudados a quente, altura => 80 mms',
-    '72163200': 'Perfis de ferro ou aços não ligados, em I, laminados, estirados ou extrudados a quente, altura => 80 mms',
-    '72163300': 'Perfis de ferro ou aços não ligados, em H, laminados, estirados ou extrudados a quente, altura => 80 mms',
-    '72164010': 'Perfis de ferro ou aços não ligados, em L ou T, laminados, estirados ou extrudados a quente, altura => 80 mms',
-    '72164090': 'Perfis de ferro ou aços não ligados, em L ou T, laminados, estirados ou extrudados a quente, altura => 80 mms',
-    '72165000': 'Outros perfis de ferro ou aços não ligados, laminados, estirados ou extrudados a quentes',
-    '72166110': 'Perfis de ferro ou aços não ligados, obtidos de produtos laminados planos, acabados a frios',
-    '72166190': 'Perfis de ferro ou aços não ligados, obtidos de produtos laminados planos, acabados a frios',
-    '72166910': 'Outros perfis de ferro ou aços não ligados, acabados a frios',
-    '72166990': 'Outros perfis de ferro ou aços não ligados, acabados a frios',
-    '72169100': 'Outros perfis de ferro ou aços não ligados, obtidos ou completamente acabados a frio a partir de produtos laminados planoss',
-    '72169900': 'Outros perfis de ferro ou aços não ligados',
-    '72171011': 'Fios de ferro ou aços não ligados, não revestidos, mesmo polidoss',
-    '72171019': 'Fios de ferro ou aços não ligados, não revestidos, mesmo polidoss',
-    '72171090': 'Fios de ferro ou aços não ligados, não revestidos, mesmo polidoss',
-    '72172010': 'Fios de ferro ou aços não ligados, galvanizados',
-    '72172090': 'Fios de ferro ou aços não ligados, galvanizados',
-    '72173010': 'Fios de ferro ou aços não ligados, revestidos de outros metais comunss',
-    '72173090': 'Fios de ferro ou aços não ligados, revestidos de outros metais comunss',
-    '72179000': 'Outros fios de ferro ou aços não ligados',
-    '72181000': 'Aços inoxidáveis, em lingotes ou outras formas primáriass',
-    '72189100': 'Produtos semimanufaturados, de aços inoxidáveis, de seção transversal retangular',
-    '72189900': 'Outros produtos semimanufaturados, de aços inoxidáveis',
-    '72191100': 'Produtos laminados planos, de aços inoxidáveis, laminados a quente, de largura => 600 mm, em rolos, de espessura > 10 mms',
-    '72191200': 'Produtos laminados planos, de aços inoxidáveis, laminados a quente, de largura => 600 mm, em rolos, de espessura => 4,75 mm e <= 10 mms',
-    '72191300': 'Produtos laminados planos, de aços inoxidáveis, laminados a quente, de largura => 600 mm, em rolos, de espessura => 3 mm e < 4,75 mms',
-    '72191400': 'Produtos laminados planos, de aços inoxidáveis, laminados a quente, de largura => 600 mm, em rolos, de espessura < 3 mms',
-    '72192100': 'Produtos laminados planos, de aços inoxidáveis, laminados a quente, de largura => 600 mm, não enrolados, de espessura > 10 mms',
-    '72192200': 'Produtos laminados planos, de aços inoxidáveis, laminados a quente, de largura => 600 mm, não enrolados, de espessura => 4,75 mm e <= 10 mms',
-    '72192300': 'Produtos laminados planos, de aços inoxidáveis, laminados a quente, de largura => 600 mm, não enrolados, de espessura => 3 mm e < 4,75 mms',
-    '72192400': 'Produtos laminados planos, de aços inoxidáveis, laminados a quente, de largura => 600 mm, de espessura < 3 mms',
-    '72193100': 'Produtos laminados planos, de aços inoxidáveis, laminados a frio, de largura => 600 mm, de espessura => 4,75 mms',
-    '72193200': 'Produtos laminados planos, de aços inoxidáveis, laminados a frio, de largura => 600 mm, de espessura => 3 mm e < 4,75 mms',
-    '72193300': 'Produtos laminados planos, de aços inoxidáveis, laminados a frio, de largura => 600 mm, de espessura > 1 mm e < 3 mms',
-    '72193400': 'Produtos laminados planos, de aços inoxidáveis, laminados a frio, de largura => 600 mm, de espessura => 0,5 mm e <= 1 mms',
-    '72193500': 'Produtos laminados planos, de aços inoxidáveis, laminados a frio, de largura => 600 mm e espessura < 0,5 mms',
-    '72199010': 'Outros produtos laminados planos, de aços inoxidáveis, de largura => 600 mms',
-    '72199090': 'Outros produtos laminados planos, de aços inoxidáveis, de largura => 600 mms',
-    '72201100': 'Produtos laminados planos, de aços inoxidáveis, laminados a quente, de largura < 600 mm e espessura => 4,75 mms',
-    '72201210': 'Produtos laminados planos, de aços inoxidáveis, laminados a quente, de largura < 600 mm e espessura < 4,75 mms',
-    '72201220': 'Produtos laminados planos, de aços inoxidáveis, laminados a quente, de largura < 600 mm e espessura < 4,75 mms',
-    '72201290': 'Produtos laminados planos, de aços inoxidáveis, laminados a quente, de largura < 600 mm e espessura < 4,75 mms',
-    '72202010': 'Produtos laminados planos, de aços inoxidáveis, laminados a frio, de largura < 600 mms',
-    '72202090': 'Produtos laminados planos, de aços inoxidáveis, laminados a frio, de largura < 600 mms',
-    '72209000': 'Outros produtos laminados planos, de aços inoxidáveis, de largura < 600 mms',
-    '72210000': 'Fio-máquina de aços inoxidáveis',
-    '72221100': 'Barras de aços inoxidáveis, laminadas, estiradas ou extrudadas a quente, de seção circulars',
-    '72221910': 'Outras barras de aços inoxidáveis, laminadas, estiradas ou extrudadas a quentes',
-    '72221990': 'Outras barras de aços inoxidáveis, laminadas, estiradas ou extrudadas a quentes',
-    '72222000': 'Barras de aços inoxidáveis, obtidas ou completamente acabadas a frio',
-    '72223000': 'Outras barras de aços inoxidáveis',
-    '72224010': 'Perfis de aços inoxidáveis',
-    '72224090': 'Perfis de aços inoxidáveis',
-    '72230000': 'Fios de aços inoxidáveis',
-    '72241000': 'Outras ligas de aços, em lingotes e outras formas primáriass',
-    '72249000': 'Produtos semimanufaturados, de outras ligas de aços',
-    '72251100': 'Produtos laminados planos, de largura => 600 mm, de ligas de aços ao silício, denominados magnéticos, de grãos orientados',
-    '72251900': 'Outros produtos laminados planos, de largura => 600 mm, de ligas de aços ao silícios',
-    '72253000': 'Produtos laminados planos, de outras ligas de aços, de largura => 600 mm, laminados a quente, em roloss',
-    '72254010': 'Produtos laminados planos, de outras ligas de aços, de largura => 600 mm, laminados a quente, não enroladoss',
-    '72254020': 'Produtos laminados planos, de outras ligas de aços, de largura => 600 mm, laminados a quente, não enroladoss',
-    '72254090': 'Produtos laminados planos, de outras ligas de aços, de largura => 600 mm, laminados a quente, não enroladoss',
-    '72255090': 'Produtos laminados planos, de outras ligas de aços, de largura => 600 mm, laminados a frios',
-    '72259100': 'Produtos laminados planos, de outras ligas de aços, de largura => 600 mm, galvanizados eletroliticamente',
-    '72259200': 'Produtos laminados planos, de outras ligas de aços, de largura => 600 mm, galvanizados por outro processos',
-    '72259910': 'Outros produtos laminados planos, de outras ligas de aços, de largura => 600 mms',
-    '72259990': 'Outros produtos laminados planos, de outras ligas de aços, de largura => 600 mms',
-    '72261100': 'Produtos laminados planos, de largura < 600 mm, de ligas de aços ao silício, denominados magnéticos, de grãos orientados',
-    '72261900': 'Produtos laminados planos, de largura < 600 mm, de ligas de aços ao silícios',
-    '72262010': 'Produtos laminados planos, de largura < 600 mm, de ligas de aços de corte rápidos',
-    '72262090': 'Produtos laminados planos, de largura < 600 mm, de ligas de aços de corte rápidos',
-    '72269100': 'Produtos laminados planos, de largura < 600 mm, de outras ligas de aços, laminados a quentes',
-    '72269200': 'Produtos laminados planos, de largura < 600 mm, de outras ligas de aços, laminados a frios',
-    '72269900': 'Produtos laminados planos, de outras ligas de aços, de largura < 600 mms',
-    '72271000': 'Fio-máquina de aços de corte rápidos',
-    '72272000': 'Fio-máquina de ligas de aços silício-manganês',
-    '72279000': 'Outros fio-máquinas de outras ligas de aços',
-    '72281010': 'Barras de aços de corte rápido',
-    '72281090': 'Barras de aços de corte rápido',
-    '72282000': 'Barras de aços silício-manganês',
-    '72283000': 'Barras de outras ligas de aços laminadas, estiradas ou extrudadas a quentes',
-    '72284000': 'Barras de outras ligas de aços, forjadas',
-    '72285000': 'Barras de outras ligas de aços, obtidas ou completamente acabadas a frios',
-    '72286000': 'Outras barras de outras ligas de aços',
-    '72287000': 'Perfis de outras ligas de aços',
-    '72288000': 'Barras ocas para perfuração, de ligas de aços',
-    '72292000': 'Fios de ligas de aços silício-manganês',
-    '72299000': 'Outros fios de outras ligas de aços',
-    '73011000': 'Estacas-pranchas de ferro ou aço, mesmo perfuradas ou constituídas por junção de elementos reunidos',
-    '73012000': 'Perfis de ferro ou aço, obtidos por soldadura',
-    '73021010': 'Trilhos (carris) de vias férreas, de ferro fundido, ferro ou aço',
-    '73021090': 'Trilhos (carris) de vias férreas, de ferro fundido, ferro ou aço',
-    '73023000': 'Agulhas, cróssimas, alavancas para comando de agulhas e outros elementos de cruzamento e desvios, de ferro fundido, ferro ou aço',
-    '73024000': 'Talas de junção e placas de apoio ou assentamento, de ferro fundido, ferro ou aço',
-    '73029000': 'Outros elementos de vias férreas, de ferro fundido, ferro ou aço',
-    '73030000': 'Tubos e perfis ocos, de ferro fundido',
-    '73041100': 'Tubos sem costura, de aços inoxidáveis, para oleodutos e gasodutos',
-    '73041900': 'Outros tubos, sem costura, de ferro ou aço, para oleodutos e gasodutos',
-    '73042200': 'Tubos de perfuração, sem costura, de aços inoxidáveis, para extração de petróleo e gás',
-    '73042310': 'Outros tubos de perfuração, sem costura, de ferro ou aço, para extração de petróleo e gás',
-    '73042390': 'Outros tubos de perfuração, sem costura, de ferro ou aço, para extração de petróleo e gás',
-    '73042400': 'Outros tubos, dos tipos utilizados na extração de petróleo ou de gás, de aço inoxidável',
-    '73042910': 'Outros tubos de revestimento de poços, de suprimento ou de produção, de ferro ou aço, sem costura, utilizados na extração de petróleo e gás',
-    '73042931': 'Outros tubos de revestimento de poços, de suprimento ou de produção, de ferro ou aço, sem costura, utilizados na extração de petróleo e gás',
-    '73042939': 'Outros tubos de revestimento de poços, de suprimento ou de produção, de ferro ou aço, sem costura, utilizados na extração de petróleo e gás',
-    '73042990': 'Outros tubos de revestimento de poços, de suprimento ou de produção, de ferro ou aço, sem costura, utilizados na extração de petróleo e gás',
-    '73043110': 'Outros tubos de ferro ou de aços não ligados, sem costura, de seção circular, estirados ou laminados a frio',
-    '73043190': 'Outros tubos de ferro ou de aços não ligados, sem costura, de seção circular, estirados ou laminados a frio',
-    '73043910': 'Outros tubos de ferro ou de aços não ligados, sem costura, de seção circular',
-    '73043920': 'Outros tubos de ferro ou de aços não ligados, sem costura, de seção circular',
-    '73043990': 'Outros tubos de ferro ou de aços não ligados, sem costura, de seção circular',
-    '73044110': 'Tubos de aços inoxidáveis, sem costura, de seção circular, estirados ou laminados a frio',
-    '73044190': 'Tubos de aços inoxidáveis, sem costura, de seção circular, estirados ou laminados a frio',
-    '73044900': 'Outros tubos de aços inoxidáveis, sem costura, de seção circular',
-    '73045119': 'Tubos e perfis ocos de outras ligas de aços, sem costura, de seção circular, estirados ou laminados a frio',
-    '73045190': 'Tubos e perfis ocos de outras ligas de aços, sem costura, de seção circular, estirados ou laminados a frio',
-    '73045910': 'Outros tubos de outras ligas de aços, sem costura, de seção circular',
-    '73045990': 'Outros tubos de outras ligas de aços, sem costura, de seção circular',
-    '73049011': 'Outros tubos e perfis ocos, de ferro ou aço, sem costura',
-    '73049019': 'Outros tubos e perfis ocos, de ferro ou aço, sem costura',
-    '73049090': 'Outros tubos e perfis ocos, de ferro ou aço, sem costura',
-    '73051100': 'Tubos de ferro ou aço, de seção circular, de diâmetro exterior > 406,4 mm, soldados longitudinalmente por arco imerso, utilizados para oleodutos ou gasodutos',
-    '73051200': 'Tubos de ferro ou aço, de seção circular, de diâmetro exterior > 406,4 mm, soldados longitudinalmente, utilizados para oleodutos ou gasodutos',
-    '73051900': 'Outros tubos de ferro aço, soldados, de seção circular, de diâmetro exterior > 406,4 mm, utilizados para oleodutos ou gasodutos',
-    '73052000': 'Tubos de ferro ou aço, soldados, de seção circular, de diâmetro exterior > 406,4 mm, para revestimento de poços, utilizados na extração de petróleo ou de gás',
-    '73053100': 'Outros tubos de ferro ou aço, soldados longitudinalmente, de seção circular, de diâmetro exterior > 406,4 mm',
-    '73053900': 'Outros tubos de ferro ou aço, soldados, de seção circular, de diâmetro exterior > 406,4 mm',
-    '73059000': 'Outros tubos de ferro ou aço, rebitados, de seção circular, de diâmetro exterior > 406,4 mm',
-    '73061100': 'Tubos soldados, de aços inoxidáveis, dos tipos utilizados em oleodutos ou gasodutos',
-    '73061900': 'Outros tubos, de ferro e aço, dos tipos utilizados em oleodutos ou gasodutos',
-    '73062100': 'Tubos soldados, de aços inoxidáveis, de revestimento de poços, de suprimento ou de produção, dos tipos utilizados na extração de petróleo ou gás',
-    '73062900': 'Outros tubos, de ferro ou aço, de revestimento de poços, de suprimento ou de produção, dos tipos utilizados na extração de petróleo ou gás',
-    '73063000': 'Outros tubos, soldados, de seção circular, de ferro ou de aço não ligados',
-    '73064000': 'Outros tubos de aços inoxidáveis, soldados, de seção circular',
-    '73065000': 'Outros tubos de outras ligas de aços, soldados, de seção circular',
-    '73066100': 'Outros tubos e perfis ocos soldados, de ferro ou aço, de seção quadrada ou retangular',
-    '73066900': 'Outros tubos soldados e perfis ocos, de ferro ou aço, de seção não circular (exceto quadrada ou retangular)',
-    '73069010': 'Outros tubos e perfis ocos, de ferro ou aço, soldados, rebitados, agrafados',
-    '73069020': 'Outros tubos e perfis ocos, de ferro ou aço, soldados, rebitados, agrafados',
-    '73069090': 'Outros tubos e perfis ocos, de ferro ou aço, soldados, rebitados, agrafados',
-    '73071100': 'Acessórios moldados para tubos, de ferro fundido não maleável',
-    '73071910': 'Outros acessórios moldados para tubos, de ferro fundido, ferro ou aço',
-    '73071920': 'Outros acessórios moldados para tubos, de ferro fundido, ferro ou aço',
-    '73071990': 'Outros acessórios moldados para tubos, de ferro fundido, ferro ou aço',
-    '73072100': 'Flanges para tubos, de aços inoxidáveis',
-    '73072200': 'Cotovelos, curvas e luvas (mangas), roscados, para tubos, de aços inoxidáveis',
-    '73072300': 'Acessórios para soldar topo a topo, de aços inoxidáveis',
-    '73072900': 'Outros acessórios para tubos, de aços inoxidáveis',
-    '73079100': 'Outros flanges para tubos, de ferro fundido, ferro ou aço',
-    '73079200': 'Outros cotovelos, curvas e luvas (mangas), roscados, para tubos, de ferro fundido, ferro ou aço',
-    '73079300': 'Outros acessórios para soldar topo a topo, de ferro fundido, ferro ou aço',
-    '73079900': 'Outros acessórios para tubos, de ferro fundido, ferro ou aço',
-    '73081000': 'Pontes e elementos de pontes, de ferro fundido, ferro ou aço',
-    '73082000': 'Torres e pórticos, de ferro fundido, ferro ou aço',
-    '73083000': 'Portas e janelas, e seus caixilhos, alizares e soleiras, de ferro fundido, ferro ou aço',
-    '73084000': 'Material para andaimes, armações e escoramentos, de ferro fundido, ferro ou aço',
-    '73089010': 'Construções e suas partes, de ferro fundido, ferro ou aço',
-    '73089090': 'Construções e suas partes, de ferro fundido, ferro ou aço',
-    '73090010': 'Reservatórios, tonéis, cubas e recipientes semelhantes, de ferro fundido, ferro ou aço, de capacidade > 300 litros, sem dispositivos mecânicos nem térmicos',
-    '73090020': 'Reservatórios, tonéis, cubas e recipientes semelhantes, de ferro fundido, ferro ou aço, de capacidade > 300 litros, sem dispositivos mecânicos nem térmicos',
-    '73090090': 'Reservatórios, tonéis, cubas e recipientes semelhantes, de ferro fundido, ferro ou aço, de capacidade > 300 litros, sem dispositivos mecânicos nem térmicos',
-    '73101010': 'Reservatórios, barris, tambores, caixas e recipientes semelhantes, de ferro fundido, ferro ou aço, sem dispositivos mecânicos nem térmicos, de capacidade => 50 litros e <= 300 litros',
-    '73101090': 'Reservatórios, barris, tambores, caixas e recipientes semelhantes, de ferro fundido, ferro ou aço, sem dispositivos mecânicos nem térmicos, de capacidade => 50 litros e <= 300 litros',
-    '73102110': 'Latas de ferro fundido, ferro ou aço, para fechar por soldadura ou cravação, de capacidade < 50 litros',
-    '73102190': 'Latas de ferro fundido, ferro ou aço, para fechar por soldadura ou cravação, de capacidade < 50 litros',
-    '73102910': 'Outros reservatórios e semelhantes, de ferro fundido, ferro ou aço, de capacidade < 50 litros',
-    '73102920': 'Outros reservatórios e semelhantes, de ferro fundido, ferro ou aço, de capacidade < 50 litros',
-    '73102990': 'Outros reservatórios e semelhantes, de ferro fundido, ferro ou aço, de capacidade < 50 litros',
-    '73110000': 'Recipientes para gases comprimidos ou liquefeitos, de ferro fundido, ferro ou aço',
-    '73121010': 'Cordas e cabos, de ferro ou aço, não isolados para usos elétricos',
-    '73121090': 'Cordas e cabos, de ferro ou aço, não isolados para usos elétricos',
-    '73129000': 'Tranças, lingas e artefatos semelhantes, de ferro ou aço, não isolados para usos elétricos',
-    '73130000': 'Arame farpado, arames ou tiras retorcidos, de ferro ou aço, dos tipos utilizados em cercas',
-    '73141200': 'Telas metálicas tecidas, de aços inoxidáveis, contínuas ou sem fim, para máquinas',
-    '73141400': 'Outras telas metálicas tecidas, de aços inoxidáveis',
-    '73141900': 'Outras telas metálicas tecidas, de fios de ferro ou aço',
-    '73142000': 'Grades e redes soldadas nos pontos de interseção, de fios de ferro ou aço => 3 mm na maior dimensão do corte transversal, com malha de superfície => 100 cm2',
-    '73143100': 'Grades e redes, de fios de ferro ou aço, soldadas nos pontos de interseção, galvanizadas',
-    '73143900': 'Outras grades e redes, de fios de ferro ou aço, soldadas nos pontos de interseção',
-    '73144100': 'Outras telas metálicas, grades e redes, de fios de ferro ou aço, galvanizadas',
-    '73144200': 'Outras telas metálicas, grades e redes, de fios de ferro ou aço, recobertas de plásticos',
-    '73144900': 'Outras telas metálicas, grades e redes, de fios de ferro ou aço',
-    '73145000': 'Chapas e tiras, distendidas, de ferro ou aço',
-    '73151100': 'Correntes de rolos, de ferro fundido, ferro ou aço',
-    '73151190': 'Correntes de rolos, de ferro fundido, ferro ou aço',
-    '73151210': 'Outras correntes de elos articulados, de ferro fundido, ferro ou aço',
-    '73151290': 'Outras correntes de elos articulados, de ferro fundido, ferro ou aço',
-    '73151900': 'Partes de correntes de elos articulados, de ferro fundido ou aço',
-    '73152000': 'Correntes antiderrapantes, de ferro fundido, ferro ou aço',
-    '73158100': 'Correntes de elos com suporte, de ferro fundido, ferro ou aço',
-    '73158200': 'Correntes de elos soldados, de ferro fundido, ferro ou aço',
-    '73158900': 'Outras correntes e cadeias, de ferro fundido, ferro ou aço',
-    '73159000': 'Partes de outras correntes e cadeias, de ferro ou aço',
-    '73160000': 'Âncoras, fateixas e suas partes, de ferro fundido, ferro ou aço',
-    '73170010': 'Tachas, pregos, percevejos e artefatos semelhantes, de ferro fundido, ferro ou aço',
-    '73170020': 'Tachas, pregos, percevejos e artefatos semelhantes, de ferro fundido, ferro ou aço',
-    '73170030': 'Tachas, pregos, percevejos e artefatos semelhantes, de ferro fundido, ferro ou aço',
-    '73170090': 'Tachas, pregos, percevejos e artefatos semelhantes, de ferro fundido, ferro ou aço',
-    '73181100': 'Tira-fundos (roscados), de ferro fundido, ferro ou aço',
-    '73181200': 'Outros parafusos para madeira, de ferro fundido, ferro ou aço',
-    '73181300': 'Ganchos e armelas (pitões), de ferro fundido, ferro ou aço',
-    '73181400': 'Parafusos perfurantes, de ferro fundido, ferro ou aço',
-    '73181500': 'Outros parafusos e pinos ou pernos, mesmo com as porcas e arruelas, de ferro fundido, ferro ou aço',
-    '73181600': 'Porcas de ferro fundido, ferro ou aço',
-    '73181900': 'Outros artefatos roscados, de ferro fundido, ferro ou aço',
-    '73182100': 'Arruelas de pressão e de segurança, não roscadas, de ferro fundido, ferro ou aço',
-    '73182200': 'Outras arruelas de ferro fundido, ferro ou aço',
-    '73182300': 'Rebites de ferro fundido, ferro ou aço',
-    '73182400': 'Chavetas, cavilhas e contrapinos ou troços, de ferro fundido, ferro ou aço',
-    '73182900': 'Outros artefatos não roscados, de ferro fundido, ferro ou aço',
-    '73194000': 'Alfinetes de segurança e outros alfinetes',
-    '73199000': 'Agulhas de costura, de tricô, de crochê, agulhas-passadoras, furadores para bordar e artefatos semelhantes para uso manual, de ferro ou aço',
-    '73201000': 'Molas de folhas e suas folhas, de ferro ou aço',
-    '73202010': 'Molas helicoidais de ferro ou aço',
-    '73202090': 'Molas helicoidais de ferro ou aço',
-    '73209000': 'Outras molas de ferro ou aço',
-    '73211100': 'Aparelhos para cozinhar e aquecedores de pratos, de uso doméstico, de ferro fundido, ferro ou aço, a combustíveis gasosos ou a gás e outros combustíveis',
-    '73211200': 'Aparelhos para cozinhar e aquecedores de pratos, de uso doméstico, de ferro fundido, ferro ou aço, a combustíveis líquidos',
-    '73211900': 'Outros aparelhos para cozinhar e aquecedores de pratos, de uso doméstico, de ferro fundido, ferro ou aço, não elétricos, incluídos os aparelhos a combustíveis sólidos',
-    '73218100': 'Aquecedores de ambientes (fogões de sala) e caldeiras de fornalha, de uso doméstico, de ferro fundido, ferro ou aço, a combustíveis gasosos ou a gás',
-    '73218200': 'Aquecedores de ambientes (fogões de sala) e caldeiras de fornalha, de uso doméstico, de ferro fundido, ferro ou aço, a combustíveis líquidos',
-    '73218900': 'Outros aquecedores de ambientes (fogões de sala) e caldeiras de fornalha, de uso doméstico, de ferro fundido, ferro ou aço, não elétricos, incluídos os aparelhos a combustíveis sólidos',
-    '73219000': 'Partes de aparelhos para cozinhar e de aquecedores de ambientes, de uso doméstico, de ferro fundido, ferro ou aço, não elétricos',
-    '73221100': 'Radiadores para aquecimento central e suas partes, não elétricos, de ferro fundido',
-    '73221900': 'Radiadores para aquecimento central e suas partes, não elétricos, de ferro e aço',
-    '73229010': 'Geradores e distribuidores de ar quente e suas partes, não elétricos, de ferro fundido, ferro ou aço',
-    '73229090': 'Geradores e distribuidores de ar quente e suas partes, não elétricos, de ferro fundido, ferro ou aço',
-    '73231000': 'Palha de ferro ou aço; esponjas, esfregões, luvas e artefatos semelhantes para limpeza ou polimento',
-    '73239100': 'Outros artefatos de uso doméstico e suas partes, de ferro fundido, não esmaltados',
-    '73239200': 'Outros artefatos de uso doméstico e suas partes, de ferro fundido, esmaltados',
-    '73239300': 'Outros artefatos de uso doméstico e suas partes, de aços inoxidáveis',
-    '73239400': 'Outros artefatos de uso doméstico e suas partes, de ferro ou aço, esmaltados',
-    '73239900': 'Outros artefatos de uso doméstico e suas partes, de ferro fundido, ferro ou aço',
-    '73241000': 'Pias e lavatórios, de aços inoxidáveis',
-    '73242100': 'Banheiras de ferro fundido, mesmo esmaltadas',
-    '73242900': 'Outras banheiras de ferro ou aço',
-    '73249000': 'Outros artefatos de higiene ou de toucador e suas partes, de ferro fundido, ferro ou aço',
-    '73251000': 'Outras obras moldadas, de ferro fundido, não maleável',
-    '73259100': 'Esferas e artefatos semelhantes, para moinhos, moldadas, de ferro fundido, ferro ou aço',
-    '73259910': 'Outras obras moldadas, de ferro fundido, ferro ou aço',
-    '73259990': 'Outras obras moldadas, de ferro fundido, ferro ou aço',
-    '73261100': 'Esferas e artefatos semelhantes, para moinhos, forjadas ou estampadas, de ferro ou aço',
-    '73261900': 'Outras obras forjadas ou estampadas, de ferro ou aço',
-    '73262000': 'Obras de fios de ferro ou aço',
-    '73269010': 'Outras obras de ferro ou aço',
-    '73269020': 'Outras obras de ferro ou aço',
-    '73269090': 'Outras obras de ferro ou aço',
-    '74010000': 'Mates de cobre, cobre de cementação (precipitado de cobre)',
-    '74020000': 'Cobre não refinado (afinado); ânodos de cobre para refinação (afinação) eletrolítica',
-    '74031100': 'Cátodos de cobre refinado e seus elementos, em formas brutas',
-    '74031300': 'Palanquilhas de cobre refinado',
-    '74031900': 'Outros produtos de cobre refinado, em formas brutas',
-    '74032100': 'Ligas de cobre-zinco (latão), em formas brutas',
-    '74032200': 'Ligas de cobre-estanho (bronze), em formas brutas',
-    '74032900': 'Outras ligas de cobre (exceto ligas-mães), em formas brutas',
-    '74040000': 'Desperdícios e resíduos, de cobre',
-    '74050000': 'Ligas-mães de cobre',
-    '74061000': 'Pós de cobre, de estrutura não lamelar',
-    '74062000': 'Pós de cobre, de estrutura lamelar; escamas de cobre',
-    '74071010': 'Barras e perfis de cobre refinado',
-    '74071021': 'Barras e perfis de cobre refinado',
-    '74071029': 'Barras e perfis de cobre refinado',
-    '74072110': 'Barras e perfis de ligas de cobre, à base de cobre-zinco (latão)',
-    '74072120': 'Barras e perfis de ligas de cobre, à base de cobre-zinco (latão)',
-    '74072910': 'Outras barras e perfis, de ligas de cobre',
-    '74072921': 'Outras barras e perfis, de ligas de cobre',
-    '74072929': 'Outras barras e perfis, de ligas de cobre',
-    '74081100': 'Fios de cobre refinado, com a maior dimensão da seção transversal > 6 mm',
-    '74081900': 'Outros fios de cobre refinado',
-    '74082100': 'Fios de ligas de cobre-zinco (latão)',
-    '74082200': 'Fios de ligas de cobre-níquel (cuproníquel) ou de cobre-níquel-zinco (maillechort)',
-    '74082919': 'Outros fios de ligas de cobre',
-    '74082990': 'Outros fios de ligas de cobre',
-    '74091100': 'Chapas e tiras, de cobre refinado, de espessura > 0,15 mm, em rolos',
-    '74091900': 'Outras chapas e tiras, de cobre refinado, de espessura > 0,15 mm',
-    '74092100': 'Chapas e tiras de ligas à base cobre-zinco, (latão), de espessura > 0,15 mm, em rolos',
-    '74092900': 'Outras chapas e tiras, de ligas de cobre-zinco (latão), de espessura > 0,15 mm',
-    '74093119': 'Chapas e tiras de ligas à base de cobre-estanho (bronze), de espessura > 0,15 mm, em rolos',
-    '74093190': 'Chapas e tiras de ligas à base de cobre-estanho (bronze), de espessura > 0,15 mm, em rolos',
-    '74093900': 'Outras chapas e tiras, de ligas  à base de cobre-estanho (bronze), de espessura superior a 0,15 mm',
-    '74094010': 'Chapas e tiras, de ligas à base de cobre-níquel, (cuproníquel) ou de cobre-níquel-zinco (maillechort), de espessura > 0,15 mm',
-    '74094019': 'Chapas e tiras, de ligas à base de cobre-níquel, (cuproníquel) ou de cobre-níquel-zinco (maillechort), de espessura > 0,15 mm',
-    '74094090': 'Chapas e tiras, de ligas à base de cobre-níquel, (cuproníquel) ou de cobre-níquel-zinco (maillechort), de espessura > 0,15 mm',
-    '74099000': 'Chapas e tiras, de outras ligas de cobre, de espessura > 0,15 mm',
-    '74101113': 'Folhas e tiras, de cobre refinado (afinado), sem suporte, de espessura <= 0,15 mm',
-    '74101119': 'Folhas e tiras, de cobre refinado (afinado), sem suporte, de espessura <= 0,15 mm',
-    '74101190': 'Folhas e tiras, de cobre refinado (afinado), sem suporte, de espessura <= 0,15 mm',
-    '74101200': 'Folhas e tiras, de ligas de cobre, sem suporte, de espessura <= 0,15 mm',
-    '74102110': 'Folhas e tiras, de cobre refinado (afinado), com suporte, de espessura <= 0,15 mm (excluído o suporte)',
-    '74102190': 'Folhas e tiras, de cobre refinado (afinado), com suporte, de espessura <= 0,15 mm (excluído o suporte)',
-    '74102200': 'Folhas e tiras, de ligas de cobre, com suporte, de espessura <= 0,15 mm (excluído o suporte)',
-    '74111010': 'Tubos de cobre refinado (afinado)',
-    '74111090': 'Tubos de cobre refinado (afinado)',
-    '74112110': 'Tubos de ligas de cobre-zinco (latão)',
-    '74112190': 'Tubos de ligas de cobre-zinco (latão)',
-    '74112210': 'Tubos de ligas de cobre-níquel (cuproníquel) ou de cobre-níquel-zinco (maillechort)',
-    '74112290': 'Tubos de ligas de cobre-níquel (cuproníquel) ou de cobre-níquel-zinco (maillechort)',
-    '74112910': 'Tubos de outras ligas de cobre',
-    '74112990': 'Tubos de outras ligas de cobre',
-    '74121000': 'Acessórios para tubos de cobre refinado (afinado)',
-    '74122000': 'Acessórios para tubos de ligas de cobre',
-    '74130000': 'Cordas, cabos, tranças e semelhantes, de cobre, não isolados para usos elétricos',
-    '74151000': 'Tachas, pregos, percevejos, escápulas e artefatos semelhantes, de cobre ou de ferro ou aço com cabeça de cobre',
-    '74152100': 'Arruelas de cobre',
-    '74152900': 'Outros artefatos não roscados, de cobre',
-    '74153300': 'Parafusos, pinos ou pernos e porcas de cobre, ou de ferro e aço com cabeça de cobre',
-    '74153900': 'Outros artefatos roscados, de cobre',
-    '74181000': 'Artigos de uso doméstico e partes; esponjas, esfregão, luva,et.p/lim.cob',
-    '74182000': 'Artefatos de higiene ou de toucador e suas partes, de cobre',
-    '74191000': 'Correntes, cadeias e suas partes, de cobre',
-    '74192000': 'Outros artigos de cobre, fundidos, moldados, estampados ou forjados, mas não mais trabalhados',
-    '74198010': 'Outros artigos de cobre, não classificados nos códigos anteriores',
-    '74198020': 'Outros artigos de cobre, não classificados nos códigos anteriores',
-    '74198030': 'Outros artigos de cobre, não classificados nos códigos anteriores',
-    '74198040': 'Outros artigos de cobre, não classificados nos códigos anteriores',
-    '74198090': 'Outros artigos de cobre, não classificados nos códigos anteriores',
-    '74199100': 'Outras obras de cobre, vazadas, moldadas, estampadas ou forjadas, mas sem qualquer outro trabalho',
-    '74199910': 'Outras obras de cobre',
-    '74199920': 'Outras obras de cobre',
-    '74199930': 'Outras obras de cobre',
-    '74199990': 'Outras obras de cobre',
-    '75011000': 'Mates de níquel',
-    '75012000': 'Sinters de óxidos de níquel e outros produtos intermediários da metalurgia do níquel',
-    '75021010': 'Níquel não ligado, em formas brutas',
-    '75021090': 'Níquel não ligado, em formas brutas',
-    '75022000': 'Ligas de níquel, em formas brutas',
-    '75030000': 'Desperdícios e resíduos, de níquel',
-    '75040010': 'Pós e escamas, de níquel',
-    '75040090': 'Pós e escamas, de níquel',
-    '75051110': 'Barras e perfis, de níquel não ligado',
-    '75051210': 'Barras e perfis, de ligas de níquel',
-    '75051229': 'Barras e perfis, de ligas de níquel',
-    '75052100': 'Fios de níquel não ligado',
-    '75052200': 'Fios de ligas de níquel',
-    '75052210': 'Fios de ligas de níquel',
-    '75052290': 'Fios de ligas de níquel',
-    '75061000': 'Chapas, tiras e folhas, de níquel não ligado',
-    '75062000': 'Chapas, tiras e folhas, de ligas de níquel',
-    '75071100': 'Tubos de níquel não ligado',
-    '75071200': 'Tubos de ligas de níquel',
-    '75072000': 'Acessórios para tubos, de níquel',
-    '75081000': 'Telas metálicas e grades, de fio de níquel',
-    '75089010': 'Outras obras de níquel',
-    '75089090': 'Outras obras de níquel',
-    '76011000': 'Alumínio não ligado em forma bruta',
-    '76012000': 'Ligas de alumínio, em formas brutas',
-    '76020000': 'Desperdícios e resíduos, de alumínio',
-    '76031000': 'Pós de alumínio, de estrutura não lamelar',
-    '76032000': 'Pós de estrutura lamelar; escamas, de alumínio',
-    '76041010': 'Barras e perfis, de alumínio não ligado',
-    '76041021': 'Barras e perfis, de alumínio não ligado',
-    '76041029': 'Barras e perfis, de alumínio não ligado',
-    '76042100': 'Perfis ocos, de ligas de alumínio',
-    '76042911': 'Outras barras e perfis, de ligas de alumínio',
-    '76042919': 'Outras barras e perfis, de ligas de alumínio',
-    '76042920': 'Outras barras e perfis, de ligas de alumínio',
-    '76051110': 'Fios de alumínio não ligado, com a maior dimensão da seção transversal > 7 mm',
-    '76051190': 'Fios de alumínio não ligado, com a maior dimensão da seção transversal > 7 mm',
-    '76051910': 'Outros fios de alumínio não ligado',
-    '76051990': 'Outros fios de alumínio não ligado',
-    '76052190': 'Fios de ligas alumínio, com a maior dimensão da seção transversal > 7 mm',
-    '76052910': 'Outros fios de ligas alumínio',
-    '76052990': 'Outros fios de ligas alumínio',
-    '76061110': 'Chapas e tiras, de alumínio não ligado, de espessura > 0,2 mm, de forma quadrada ou retangular',
-    '76061190': 'Chapas e tiras, de alumínio não ligado, de espessura > 0,2 mm, de forma quadrada ou retangular',
-    '76061210': 'Chapas e tiras, de ligas alumínio, de espessura > 0,2 mm, de forma quadrada ou retangular',
-    '76061220': 'Chapas e tiras, de ligas alumínio, de espessura > 0,2 mm, de forma quadrada ou retangular',
-    '76061230': 'Chapas e tiras, de ligas alumínio, de espessura > 0,2 mm, de forma quadrada ou retangular',
-    '76061290': 'Chapas e tiras, de ligas alumínio, de espessura > 0,2 mm, de forma quadrada ou retangular',
-    '76069100': 'Outras chapas e tiras, de alumínio não ligado, de espessura > 0,2 mm',
-    '76069200': 'Outras chapas e tiras, de ligas de alumínio, de espessura > 0,2 mm',
-    '76071110': 'Folhas e tiras, de alumínio, de espessura <= 0,2 mm, sem suporte, simplesmente laminadas',
-    '76071120': 'Folhas e tiras, de alumínio, de espessura <= 0,2 mm, sem suporte, simplesmente laminadas',
-    '76071190': 'Folhas e tiras, de alumínio, de espessura <= 0,2 mm, sem suporte, simplesmente laminadas',
-    '76071910': 'Outras folhas e tiras, de alumínio, de espessura <= 0,2 mm, sem suporte',
-    '76071990': 'Outras folhas e tiras, de alumínio, de espessura <= 0,2 mm, sem suporte',
-    '76072000': 'Folhas e tiras, de alumínio, de espessura <= 0,2 mm, com suporte',
-    '76081000': 'Tubos de alumínio não ligado',
-    '76082010': 'Tubos de ligas de alumínio',
-    '76082090': 'Tubos de ligas de alumínio',
-    '76090000': 'Acessórios para tubos de alumínio',
-    '76101000': 'Portas e janelas, e seus caixilhos, alizares e soleiras, de alumínio',
-    '76109000': 'Outros, chapas, barras, tubos e semelhantes, de alumínio, para construções',
-    '76110000': 'Reservatórios, tonéis, cubas e recipientes semelhantes, de alumínio, de capacidade > 300 litros, sem dispositivos mecânicos ou térmicos',
-    '76121000': 'Recipientes tubulares, flexíveis, de alumínio, de capacidade <= 300 litros, sem dispositivos mecânicos ou térmicos',
-    '76129011': 'Outros reservatórios, de alumínio, de capacidade <= 300 litros, sem dispositivos mecânicos ou térmicos',
-    '76129012': 'Outros reservatórios, de alumínio, de capacidade <= 300 litros, sem dispositivos mecânicos ou térmicos',
-    '76129019': 'Outros reservatórios, de alumínio, de capacidade <= 300 litros, sem dispositivos mecânicos ou térmicos',
-    '76129090': 'Outros reservatórios, de alumínio, de capacidade <= 300 litros, sem dispositivos mecânicos ou térmicos',
-    '76130000': 'Recipientes para gases comprimidos ou liquefeitos, de alumínio',
-    '76141010': 'Cordas, cabos e tranças, de alumínio, com alma de aço, não isolados para usos elétricos',
-    '76141090': 'Cordas, cabos e tranças, de alumínio, com alma de aço, não isolados para usos elétricos',
-    '76149010': 'Outras cordas, cabos, tranças e semelhantes, de alumínio, não isolados para usos elétricos',
-    '76149090': 'Outras cordas, cabos, tranças e semelhantes, de alumínio, não isolados para usos elétricos',
-    '76151000': 'Mesa, cozinha, ou outros artigos de uso doméstico e suas partes; esponjas e limpeza, polimento ou almofadas, luvas e semelhantes, de alumínio',
-    '76152000': 'Artefatos de higiene ou toucador, e suas partes, de alumínio',
-    '76161000': 'Tachas, pregos, escápulas, parafusos, pinos, roscados, porcas, rebites, chavetas, cavilhas, contrapinos, arruelas e artefatos semelhantes, de alumínio',
-    '76169100': 'Telas metálicas, grades e redes, de fio de alumínio',
-    '76169900': 'Outras obras de alumínio',
-    '78011011': 'Chumbo refinado (afinado), em formas brutas',
-    '78011019': 'Chumbo refinado (afinado), em formas brutas',
-    '78011090': 'Chumbo refinado (afinado), em formas brutas',
-    '78019100': 'Chumbo contendo antimônio como segundo elemento predominante em peso, em formas brutas',
-    '78019900': 'Outros chumbos em formas brutas',
-    '78020000': 'Desperdícios e resíduos, de chumbo',
-    '78041100': 'Folhas e tiras, de chumbo, de espessura <= 0,2 mm',
-    '78041900': 'Outras chapas, folhas e tiras, de chumbo',
-    '78060010': 'Outras obras de chumbo',
-    '78060020': 'Outras obras de chumbo',
-    '78060090': 'Outras obras de chumbo',
-    '79011111': 'Zinco não ligado, em formas brutas, contendo, em peso, => 99,99% de zinco',
-    '79011119': 'Zinco não ligado, em formas brutas, contendo, em peso, => 99,99% de zinco',
-    '79011199': 'Zinco não ligado, em formas brutas, contendo, em peso, => 99,99% de zinco',
-    '79011210': 'Zinco não ligado, em formas brutas, contendo, em peso, < 99,99% de zinco',
-    '79011290': 'Zinco não ligado, em formas brutas, contendo, em peso, < 99,99% de zinco',
-    '79012010': 'Ligas de zinco, em formas brutas',
-    '79012090': 'Ligas de zinco, em formas brutas',
-    '79020000': 'Desperdícios e resíduos, de zinco',
-    '79031000': 'Poeiras de zinco',
-    '79039000': 'Pós e escamas, de zinco',
-    '79040000': 'Barras, perfis e fios, de zinco',
-    '79050000': 'Chapas, folhas e tiras, de zinco',
-    '79070010': 'Outras obras de zinco',
-    '79070090': 'Outras obras de zinco',
-    '80011000': 'Estanho não ligado, em formas brutas',
-    '80012000': 'Ligas de estanho, em formas brutas',
-    '80020000': 'Desperdícios e resíduos, de estanho',
-    '80030000': 'Barras, perfis e fios, de estanho',
-    '80070010': 'Outras obras de estanho',
-    '80070020': 'Outras obras de estanho',
-    '80070030': 'Outras obras de estanho',
-    '80070090': 'Outras obras de estanho',
-    '81011000': 'Pós de tungstênio (volfrâmio)',
-    '81019400': 'Tungstênio em formas brutas, incluídas as barras simplesmente obtidas por sinterização',
-    '81019600': 'Fios de tungstênio',
-    '81019700': 'Desperdícios e resíduos de tungstênio',
-    '81019910': 'Outras obras de tungstênio',
-    '81019990': 'Outras obras de tungstênio',
-    '81021000': 'Pós de molibdênio',
-    '81029400': 'Molibdênio em formas brutas, incluídas as barras simplesmente obtidas por sinterização',
-    '81029500': 'Barras, exceto as simplesmente obtidas por sinterização, perfis, chapas, tiras e folhas, de molibdênio',
-    '81029600': 'Fios de molibdênio',
-    '81029700': 'Desperdícios e resíduos de molibdênio',
-    '81029900': 'Outras obras de molibdênio',
-    '81032000': 'Tântalo em formas brutas, incluídas as barras simplesmente obtidas por sinterização; pós',
-    '81033000': 'Desperdícios e resíduos de tântalo',
-    '81039000': 'Outras obras de tântalo',
-    '81039900': 'Outros tântalo e suas obras, incluindo resíduos e sucata, não classificados nos códigos anteriores',
-    '81041100': 'Magnésio em formas brutas, contendo => 99,80%, em peso, de magnésio',
-    '81041900': 'Outras formas brutas de magnésio',
-    '81042000': 'Desperdícios e resíduos, de magnésio',
-    '81043000': 'Resíduos de torno e grânulos, calibrados; pós, de magnésio',
-    '81049000': 'Outras obras de magnésio',
-    '81052010': 'Mates de cobalto e outros produtos intermediários da metalurgia do cobalto; cobalto em formas brutas; pós',
-    '81052021': 'Mates de cobalto e outros produtos intermediários da metalurgia do cobalto; cobalto em formas brutas; pós',
-    '81052029': 'Mates de cobalto e outros produtos intermediários da metalurgia do cobalto; cobalto em formas brutas; pós',
-    '81052090': 'Mates de cobalto e outros produtos intermediários da metalurgia do cobalto; cobalto em formas brutas; pós',
-    '81053000': 'Desperdícios e resíduos da metalurgia do cobalto',
-    '81059010': 'Outras obras de cobalto',
-    '81059090': 'Outras obras de cobalto',
-    '81060090': 'Bismuto e suas obras, incluídos os desperdícios e resíduos',
-    '81061000': 'Bismuto e suas obras, incluindo resíduos e sucata, contendo mais de 99,99 % de bismuto, em peso',
-    '81069000': 'Outros bismutos e suas obras, incluindo resíduos e sucata, não classificados nos códigos anteriores',
-    '81072010': 'Cádmio em formas brutas; pós',
-    '81073000': 'Desperdícios e resíduos do cádmio',
-    '81082000': 'Titânio em formas brutas; pós',
-    '81083000': 'Desperdícios e resíduos do titânio',
-    '81089000': 'Obras e outros produtos de titânio',
-    '81099000': 'Obras e outros produtos de zircônio',
-    '81099900': 'Outros zircônios e suas obras, incluindo resíduos e sucata, não classificados nos códigos anteriores',
-    '81101010': 'Antimônio em formas brutas; pós',
-    '81109000': 'Obras e outros produtos do antimônio',
-    '81110010': 'Manganês e suas obras, incluídos os desperdícios e resíduos',
-    '81110020': 'Manganês e suas obras, incluídos os desperdícios e resíduos',
-    '81122110': 'Cromo em formas brutas; pós',
-    '81122120': 'Cromo em formas brutas; pós',
-    '81122200': 'Desperdícios e resíduos do cromo',
-    '81122900': 'Obras e outros produtos do cromo',
-    '81123100': 'Háfnio não forjado; resíduos e desperdícios de háfnio; pós',
-    '81126900': 'Outro cádmios, não classificado nos códigos anteriores',
-    '81129200': 'Gálio, germânio, háfnio, índio, nióbio, rênio e vanádio, em formas brutas; desperdícios e resíduos; pós',
-    '81129900': 'Obras e outros produtos de gálio, germánio, háfnio, índio, nióbio, rênio e vanádio',
-    '81130010': 'Ceramais (cermets) e suas obras, incluídos os desperdícios e resíduos',
-    '81130090': 'Ceramais (cermets) e suas obras, incluídos os desperdícios e resíduos',
-    '82011000': 'Pás, de metais comuns',
-    '82013000': 'Alviões, picaretas, enxadas, sachos, ancinhos e raspadeiras, de metais comuns',
-    '82014000': 'Machados, podões e ferramentas semelhantes com gume, de metais comuns',
-    '82015000': 'Tesouras de podar, (incluídas as tesuras para aves) manipuladas com uma das mãos, de metais comuns',
-    '82016000': 'Tesouras para sebes, tesouras de podar e ferramentas semelhantes, manipuladas com as duas mãos, de metais comuns',
-    '82019000': 'Outras ferramentas manuais, para agricultura, horticultura e silvicultura, de metais comuns',
-    '82021000': 'Serras manuais, de metais comuns',
-    '82022000': 'Folhas de serras de fita, de metais comuns',
-    '82023100': 'Folhas de serras circulares, com parte operante de aço, de metais comuns',
-    '82023900': 'Outras folhas de serras circulares (incluídas as fresas-serras), de metais comuns',
-    '82024000': 'Correntes cortantes de serras, de metais comuns',
-    '82029100': 'Folha de serras retilíneas, para trabalhar metais, de metais comuns',
-    '82029910': 'Outras folhas de serras, de metais comuns',
-    '82029990': 'Outras folhas de serras, de metais comuns',
-    '82031010': 'Limas e grosas, de metais comuns',
-    '82031090': 'Limas e grosas, de metais comuns',
-    '82032010': 'Alicates (mesmo cortantes), tenazes, pinças e ferramentas semelhantes, manuais, de metais comuns',
-    '82032090': 'Alicates (mesmo cortantes), tenazes, pinças e ferramentas semelhantes, manuais, de metais comuns',
-    '82033000': 'Cisalhas para metais e ferramentas semelhantes, manuais, de metais comuns',
-    '82034000': 'Corta-tubos, corta-pinos, saca-bocados e ferramentas semelhantes, manuais, de metais comuns',
-    '82041100': 'Chaves de porcas, manuais, de abertura fixa, de metais comuns',
-    '82041200': 'Chaves de porcas, manuais, de abertura variáveis, de metais comuns',
-    '82042000': 'Chaves de caixa intercambiáveis, mesmo com cabos, de metais comuns',
-    '82051000': 'Ferramentas manuais de furar ou de roscar, de metais comuns',
-    '82052000': 'Martelos e marretas, manuais, de metais comuns',
-    '82053000': 'Plainas, formões, goivas e ferramentas cortantes semelhantes, para trabalhar madeira, manuais, de metais comuns',
-    '82054000': 'Chaves de fenda, manuais, de metais comuns',
-    '82055100': 'Outras ferramentas manuais, de uso da espécie doméstica, de metais comuns',
-    '82055900': 'Outras ferramentas manuais, de metais comuns',
-    '82056000': 'Lamparinas ou lâmpadas de soldar, (maçaricos) e semelhantes, de metais comuns',
-    '82057000': 'Tornos de apertar, sargentos e semelhantes, de metais comuns',
-    '82059000': 'Sortidos de dois ou mais artefatos das subposições 8205.70 e 8205.80',
-    '82060000': 'Sortidos de dois ou mais artefatos das posições 8202 até 8205, para venda a retalho',
-    '82071300': 'Ferramentas intercambiáveis de perfuração ou de sondagem, com parte operante de ceramais (cermets), de metais comuns',
-    '82071900': 'Outras ferramentas intercambiáveis de perfuração ou de sondagem, incluídas as partes, de metais comuns',
-    '82071910': 'Outras ferramentas intercambiáveis de perfuração ou de sondagem, incluídas as partes, de metais comuns',
-    '82071990': 'Outras ferramentas intercambiáveis de perfuração ou de sondagem, incluídas as partes, de metais comuns',
-    '82072000': 'Fieiras de estiragem ou de extrusão, para metais, de metais comuns',
-    '82073000': 'Ferramentas intercambiáveis de embutir, estampar ou de puncionar, de metais comuns',
-    '82074010': 'Ferramentas intercambiáveis de roscar interior ou exteriormente, de metais comuns',
-    '82074020': 'Ferramentas intercambiáveis de roscar interior ou exteriormente, de metais comuns',
-    '82075011': 'Ferramentas intercambiáveis de furar, de metais comuns',
-    '82075019': 'Ferramentas intercambiáveis de furar, de metais comuns',
-    '82075090': 'Ferramentas intercambiáveis de furar, de metais comuns',
-    '82076000': 'Ferramentas intercambiáveis de mandrilar ou de brochar, de metais comuns',
-    '82077010': 'Ferramentas intercambiáveis de fresar, de metais comuns',
-    '82077020': 'Ferramentas intercambiáveis de fresar, de metais comuns',
-    '82077090': 'Ferramentas intercambiáveis de fresar, de metais comuns',
-    '82078000': 'Ferramentas intercambiáveis de tornear, de metais comuns',
-    '82079000': 'Outras ferramentas intercambiáveis para ferramentas manuais, de metais comuns',
-    '82081000': 'Facas e lâminas cortantes, para máquinas ou aparelhos mecânicos, para trabalhar metais, de metais comuns',
-    '82082000': 'Facas e lâminas cortantes para aparelhos mecânicos, para trabalhar madeira, de metais comuns',
-    '82083000': 'Facas e lâminas cortantes, para aparelhos de cozinha ou para máquinas das indústrias alimentares, de metais comuns',
-    '82084000': 'Facas e lâminas cortantes, para máquinas de agricultura, horticultura ou silvicultura, de metais comuns',
-    '82089000': 'Outras facas e lâminas cortantes, para máquinas ou para aparelhos mecânicos, de metais comuns',
-    '82090011': 'Plaquetas, varetas, pontas e objetos semelhantes para ferramentas, não montados, de ceramais (cermets)',
-    '82090019': 'Plaquetas, varetas, pontas e objetos semelhantes para ferramentas, não montados, de ceramais (cermets)',
-    '82090090': 'Plaquetas, varetas, pontas e objetos semelhantes para ferramentas, não montados, de ceramais (cermets)',
-    '82100010': 'Aparelhos mecânicos de acionamento manual, pesando <= 10 kg, utilizados para preparar, acondicionar ou servir alimentos ou bebidas',
-    '82100090': 'Aparelhos mecânicos de acionamento manual, pesando <= 10 kg, utilizados para preparar, acondicionar ou servir alimentos ou bebidas',
-    '82111000': 'Facas de lâmina cortante ou serrilhada e suas lâminas, sortidos',
-    '82119100': 'Facas de mesa, de lâmina fixa, de metais comuns',
-    '82119210': 'Outras facas de lâmina fixa, de metais comuns',
-    '82119220': 'Outras facas de lâmina fixa, de metais comuns',
-    '82119290': 'Outras facas de lâmina fixa, de metais comuns',
-    '82119310': 'Facas, exceto as de lâminas fixas, incluídas as podadeiras de lâmina móvel, de metais comuns',
-    '82119320': 'Facas, exceto as de lâminas fixas, incluídas as podadeiras de lâmina móvel, de metais comuns',
-    '82119390': 'Facas, exceto as de lâminas fixas, incluídas as podadeiras de lâmina móvel, de metais comuns',
-    '82119400': 'Lâminas para facas, de metais comuns',
-    '82119500': 'Cabos de metais comuns para facas',
-    '82121010': 'Navalhas e aparelhos, de barbear, de metais comuns',
-    '82121020': 'Navalhas e aparelhos, de barbear, de metais comuns',
-    '82122010': 'Laminas de barbear, de segurança, incluídos os esboços em tiras, de metais comuns',
-    '82122020': 'Laminas de barbear, de segurança, incluídos os esboços em tiras, de metais comuns',
-    '82129000': 'Outras partes de navalhas e aparelhos de barbear, de metais comuns',
-    '82130000': 'Tesouras e suas lâminas, de metais comuns',
-    '82141000': 'Espátulas, abre-cartas, raspadeiras, apontadores de lápis (apara-lápis) e suas lâminas, de metais comuns',
-    '82142000': 'Utensílios e sortidos de utensílios de manicuros ou de pedicuros (incluídas as limas para unhas), de metais comuns',
-    '82149010': 'Outros artigos de cutelaria e suas partes, de metais comuns',
-    '82149090': 'Outros artigos de cutelaria e suas partes, de metais comuns',
-    '82151000': 'Sortidos de colheres, garfos, conchas e outros artigos de posição 8215, contendo pelo menos um objeto prateado, dourado ou platinado, de metais comuns',
-    '82152000': 'Outros sortidos de colheres, garfos, conchas ou outros artigos da posição 8215, de metais comuns',
-    '82159100': 'Colheres, garfos, conchas e semelhantes, prateados, dourados ou platinados, de metais comuns',
-    '82159910': 'Outras colheres, garfos, conchas e artefatos semelhantes, de metais comuns',
-    '82159990': 'Outras colheres, garfos, conchas e artefatos semelhantes, de metais comuns',
-    '83011000': 'Cadeados de metais comuns',
-    '83012000': 'Fechaduras utilizadas em veículos automóveis, de metais comuns',
-    '83013000': 'Fechaduras para móveis, de metais comuns',
-    '83014000': 'Outras fechaduras e ferrolhos, de metais comuns',
-    '83015000': 'Fechos e armações com fecho, com fechadura, de metais comuns',
-    '83016000': 'Partes de cadeados ou fechaduras, de metais comuns',
-    '83017000': 'Chaves apresentadas isoladamente, de metais comuns',
-    '83021000': 'Dobradiças de qualquer tipo (incluídos os gonzos e as charneiras), de metais comuns',
-    '83022000': 'Rodízios com armação, de metais comuns',
-    '83023000': 'Guarnições, ferragens e artefatos semelhantes, para veículos automóveis, de metais comuns',
-    '83024100': 'Guarnições, ferragens e artefatos semelhantes, para construções, de metais comuns',
-    '83024200': 'Guarnições, ferragens e artefatos semelhantes, para móveis, de metais comuns',
-    '83024900': 'Outras guarnições, ferragens e artefatos semelhantes, de metais comuns',
-    '83025000': 'Pateras, porta-chapéus, cabides e artefatos semelhantes, de metais comuns',
-    '83026000': 'Fechos automáticos para portas, de metais comuns',
-    '83030000': 'Cofres-fortes, portas blindadas e compartimentos para casas-fortes, cofres e caixas de segurança e artefatos semelhantes, de metais comuns',
-    '83040000': 'Classificadores, fichários, porta-canetas, porta-carimbos e outros artefatos semelhantes, de escritório, de metais comuns',
-    '83051000': 'Ferragens para encadernação de folhas móveis, ou para classificadores, de metais comuns',
-    '83052000': 'Grampos apresentados em barretas, de metais comuns',
-    '83059000': 'Molas para papéis e outros objetos de escritório, de metais comuns',
-    '83061000': 'Sinos, campainhas, gongos e artefatos semelhantes, não elétricos, de metais comuns',
-    '83062100': 'Estatuetas e outros objetos de ornamentação, prateados, dourados ou platinados, de metais comuns',
-    '83062900': 'Outras estatuetas e outros objetos de ornamentação, de metais comuns',
-    '83063000': 'Molduras para fotografias, gravuras, ou semelhantes; espelhos, de metais comuns',
-    '83071010': 'Tubos flexíveis de ferro ou aço, mesmo com acessórios',
-    '83071090': 'Tubos flexíveis de ferro ou aço, mesmo com acessórios',
-    '83079000': 'Tubos flexíveis de outros metais comuns',
-    '83081000': 'Grampos, colchetes e ilhoses, de metais comuns, para vestuário',
-    '83082000': 'Rebites tubulares ou de haste fendida, de metais comuns',
-    '83089010': 'Outros fechos, fivelas e artefatos semelhantes, de metais comuns, para vestuário, calçados, bolsas',
-    '83089020': 'Outros fechos, fivelas e artefatos semelhantes, de metais comuns, para vestuário, calçados, bolsas',
-    '83089090': 'Outros fechos, fivelas e artefatos semelhantes, de metais comuns, para vestuário, calçados, bolsas',
-    '83091000': 'Cápsulas de coroa, de metais comuns, para embalagem',
-    '83099000': 'Rolhas, outras tampas e acessórios para embalagem, de metais comuns',
-    '83100000': 'Placas indicadoras e sinalizadoras, placas-endereços e semelhantes, números, letras e sinais diversos, de metais comuns, não elétricos',
-    '83111000': 'Eletrodos revestidos exteriormente para soldar a arco, de metais comuns',
-    '83112000': 'Fios revestidos interiormente para soldar a arco, de metais comuns',
-    '83113000': 'Varetas revestidas exteriormente e fios revestidos interiormente, para soldar à chama, de metais comuns',
-    '83119000': 'Outros fios, varetas, tubos, chapas e semelhantes, de metais comuns, para soldagem ou depósito de metal',
-    '84013000': 'Elementos combustíveis (cartuchos) não irradiados, para reatores nucleares',
-    '84014000': 'Partes de reatores nucleares',
-    '84021100': 'Caldeiras aquatubulares com produção de vapor > 45 t por hora',
-    '84021200': 'Caldeiras aquatubulares com produção de vapor <= 45 t por hora',
-    '84021900': 'Outras caldeiras para produção de vapor, incluídas as caldeiras mistas',
-    '84022000': 'Caldeiras denominadas de água superaquecida',
-    '84029000': 'Partes de caldeiras de vapor e de água superaquecida',
-    '84031010': 'Caldeiras para aquecimento central, exceto as da posição 8402',
-    '84031090': 'Caldeiras para aquecimento central, exceto as da posição 8402',
-    '84039000': 'Partes de caldeiras para aquecimento central',
-    '84041010': 'Aparelhos auxiliares para caldeiras das posições 8402 ou 8403',
-    '84041020': 'Aparelhos auxiliares para caldeiras das posições 8402 ou 8403',
-    '84042000': 'Condensadores para máquinas a vapor',
-    '84049010': 'Partes de aparelhos auxiliares para caldeiras das posições 8402 ou 8403 e partes de condensadores para máquinas a vapor',
-    '84049090': 'Partes de aparelhos auxiliares para caldeiras das posições 8402 ou 8403 e partes de condensadores para máquinas a vapor',
-    '84051000': 'Geradores de gás de ar ou de água, de acetileno e geradores semelhantes de gás, operados a água, com ou sem depuradores',
-    '84059000': 'Partes de geradores de gás de ar ou de água, de acetileno e geradores semelhantes de gás, operados a água, com ou sem depuradores',
-    '84061000': 'Turbinas a vapor para propulsão de embarcações',
-    '84068100': 'Outras turbinas a vapor, de potência > 40 MW',
-    '84068200': 'Outras turbinas a vapor, de potência <= 40 MW',
-    '84069011': 'Partes de turbinas a vapor',
-    '84069019': 'Partes de turbinas a vapor',
-    '84069021': 'Partes de turbinas a vapor',
-    '84069029': 'Partes de turbinas a vapor',
-    '84069090': 'Partes de turbinas a vapor',
-    '84071000': 'Motores para aviação',
-    '84072110': 'Motores de explosão para propulsão de embarcações, de fixação externa ao casco (tipo outboard)',
-    '84072190': 'Motores de explosão para propulsão de embarcações, de fixação externa ao casco (tipo outboard)',
-    '84072910': 'Outros motores de pistão alternativo, de ignição por centelha, para propulsão de embarcações',
-    '84072990': 'Outros motores de pistão alternativo, de ignição por centelha, para propulsão de embarcações',
-    '84073110': 'Motores de pistão alternativo, de ignição por centelha, para propulsão de veículos do capítulo 87, de cilindrada até 50 cm3',
-    '84073190': 'Motores de pistão alternativo, de ignição por centelha, para propulsão de veículos do capítulo 87, de cilindrada até 50 cm3',
-    '84073200': 'Motores de pistão alternativo, de ignição por centelha, para propulsão de veículos do capítulo 87, de cilindrada superior a 50 cm3 até 250 cm3',
-    '84073310': 'Motores de pistão alternativo, de ignição por centelha, para propulsão de veículos do capítulo 87, de cilindrada > 250 cm3 e <= 1.000 cm3',
-    '84073390': 'Motores de pistão alternativo, de ignição por centelha, para propulsão de veículos do capítulo 87, de cilindrada > 250 cm3 e <= 1.000 cm3',
-    '84073410': 'Motores de pistão alternativo, de ignição por centelha, para propulsão de veículos do capítulo 87, de cilindrada > 1.000 cm3',
-    '84073490': 'Motores de pistão alternativo, de ignição por centelha, para propulsão de veículos do capítulo 87, de cilindrada > 1.000 cm3',
-    '84079000': 'Outros motores de pistão alternativo ou rotativo, de ignição por centelha',
-    '84081010': 'Motores de pistão, de ignição por compressão, diesel ou semi-diesel, para propulsão de embarcações',
-    '84081090': 'Motores de pistão, de ignição por compressão, diesel ou semi-diesel, para propulsão de embarcações',
-    '84082010': 'Motores de pistão, de ignição por compressão, diesel ou semi-diesel, utilizados para propulsão de veículos do capítulo 87',
-    '84082020': 'Motores de pistão, de ignição por compressão, diesel ou semi-diesel, utilizados para propulsão de veículos do capítulo 87',
-    '84082030': 'Motores de pistão, de ignição por compressão, diesel ou semi-diesel, utilizados para propulsão de veículos do capítulo 87',
-    '84082090': 'Motores de pistão, de ignição por compressão, diesel ou semi-diesel, utilizados para propulsão de veículos do capítulo 87',
-    '84089010': 'Outros motores de pistão, de ignição por compressão, diesel ou semidiesel',
-    '84089090': 'Outros motores de pistão, de ignição por compressão, diesel ou semidiesel',
-    '84091000': 'Partes de motores para aviação',
-    '84099111': 'Outras partes exclusiva ou principalmente destinadas aos motores de pistão, de ignição por centelha',
-    '84099112': 'Outras partes exclusiva ou principalmente destinadas aos motores de pistão, de ignição por centelha',
-    '84099113': 'Outras partes exclusiva ou principalmente destinadas aos motores de pistão, de ignição por centelha',
-    '84099114': 'Outras partes exclusiva ou principalmente destinadas aos motores de pistão, de ignição por centelha',
-    '84099115': 'Outras partes exclusiva ou principalmente destinadas aos motores de pistão, de ignição por centelha',
-    '84099116': 'Outras partes exclusiva ou principalmente destinadas aos motores de pistão, de ignição por centelha',
-    '84099117': 'Outras partes exclusiva ou principalmente destinadas aos motores de pistão, de ignição por centelha',
-    '84099118': 'Outras partes exclusiva ou principalmente destinadas aos motores de pistão, de ignição por centelha',
-    '84099120': 'Outras partes exclusiva ou principalmente destinadas aos motores de pistão, de ignição por centelha',
-    '84099130': 'Outras partes exclusiva ou principalmente destinadas aos motores de pistão, de ignição por centelha',
-    '84099140': 'Outras partes exclusiva ou principalmente destinadas aos motores de pistão, de ignição por centelha',
-    '84099190': 'Outras partes exclusiva ou principalmente destinadas aos motores de pistão, de ignição por centelha',
-    '84099912': 'Outras partes para motores diesel ou semidiesel',
-    '84099914': 'Outras partes para motores diesel ou semidiesel',
-    '84099915': 'Outras partes para motores diesel ou semidiesel',
-    '84099917': 'Outras partes para motores diesel ou semidiesel',
-    '84099921': 'Outras partes para motores diesel ou semidiesel',
-    '84099929': 'Outras partes para motores diesel ou semidiesel',
-    '84099930': 'Outras partes para motores diesel ou semidiesel',
-    '84099941': 'Outras partes para motores diesel ou semidiesel',
-    '84099949': 'Outras partes para motores diesel ou semidiesel',
-    '84099951': 'Outras partes para motores diesel ou semidiesel',
-    '84099959': 'Outras partes para motores diesel ou semidiesel',
-    '84099961': 'Outras partes para motores diesel ou semidiesel',
-    '84099969': 'Outras partes para motores diesel ou semidiesel',
-    '84099971': 'Outras partes para motores diesel ou semidiesel',
-    '84099979': 'Outras partes para motores diesel ou semidiesel',
-    '84099991': 'Outras partes para motores diesel ou semidiesel',
-    '84099999': 'Outras partes para motores diesel ou semidiesel',
-    '84101100': 'Turbinas e rodas hidráulicas, de potência <= 1.000 kW',
-    '84101200': 'Turbinas e rodas hidráulicas, de potência > 1.000 kW e <= 10.000 kW',
-    '84101300': 'Turbinas e rodas hidráulicas, de potência > 10.000 kW',
-    '84109000': 'Partes de turbinas e rodas hidráulicas, incluídos os reguladores',
-    '84111100': 'Turborreatores, de empuxo <= 25 kN',
-    '84111200': 'Turborreatores, de empuxo > 25 kN',
-    '84112100': 'Turbopropulsores, de potência <= 1.100 kW',
-    '84112200': 'Turbopropulsores, de potência > 1.100 kW',
-    '84118100': 'Outras turbinas a gás, de potência <= 5.000 kW',
-    '84118200': 'Outras turbinas a gás, de potência > 5.000 kW',
-    '84119100': 'Partes de turborreatores ou de turbopropulsores',
-    '84119900': 'Partes de outras turbinas a gás',
-    '84121000': 'Propulsores a reação, excluídos os turborreatores',
-    '84122110': 'Motores hidráulicos, de movimento retilíneo (cilindros)',
-    '84122190': 'Motores hidráulicos, de movimento retilíneo (cilindros)',
-    '84122900': 'Outros motores hidráulicos',
-    '84123110': 'Motores pneumáticos, de movimento retilíneo (cilindros)',
-    '84123190': 'Motores pneumáticos, de movimento retilíneo (cilindros)',
-    '84123900': 'Outros motores pneumáticos',
-    '84128000': 'Outros motores e máquinas motrizes',
-    '84129020': 'Partes de outros motores e máquinas motrizes',
-    '84129080': 'Partes de outros motores e máquinas motrizes',
-    '84129090': 'Partes de outros motores e máquinas motrizes',
-    '84131100': 'Bombas para distribuição de combustíveis ou lubrificantes, com dispositivo medidor, utilizadas em postos de serviço ou garagens',
-    '84131900': 'Outras bombas para líquidos, com dispositivo medidor ou concebidas para comportá-lo',
-    '84132000': 'Bombas manuais para líquidos',
-    '84133010': 'Bombas para combustíveis, lubrificantes ou líquidos de arrefecimento, para motores de ignição por centelha ou por compressão',
-    '84133020': 'Bombas para combustíveis, lubrificantes ou líquidos de arrefecimento, para motores de ignição por centelha ou por compressão',
-    '84133030': 'Bombas para combustíveis, lubrificantes ou líquidos de arrefecimento, para motores de ignição por centelha ou por compressão',
-    '84133090': 'Bombas para combustíveis, lubrificantes ou líquidos de arrefecimento, para motores de ignição por centelha ou por compressão',
-    '84134000': 'Bombas para concreto (betão)',
-    '84135010': 'Outras bombas volumétricas alternativas',
-    '84135090': 'Outras bombas volumétricas alternativas',
-    '84136011': 'Outras bombas volumétricas rotativas',
-    '84136019': 'Outras bombas volumétricas rotativas',
-    '84136090': 'Outras bombas volumétricas rotativas',
-    '84137010': 'Outras bombas centrífugas',
-    '84137080': 'Outras bombas centrífugas',
-    '84137090': 'Outras bombas centrífugas',
-    '84138100': 'Outras bombas para líquidos',
-    '84138200': 'Elevadores de líquidos',
-    '84139110': 'Partes de bombas para líquidos',
-    '84139190': 'Partes de bombas para líquidos',
-    '84139200': 'Partes de elevadores de líquidos',
-    '84141000': 'Bombas de vácuo',
-    '84142000': 'Bombas de ar, de mão ou de pé',
-    '84143011': 'Compressores para equipamentos frigoríficos',
-    '84143019': 'Compressores para equipamentos frigoríficos',
-    '84143091': 'Compressores para equipamentos frigoríficos',
-    '84143099': 'Compressores para equipamentos frigoríficos',
-    '84144010': 'Compressores de ar montados sobre chassis com rodas e rebocáveis',
-    '84144020': 'Compressores de ar montados sobre chassis com rodas e rebocáveis',
-    '84144090': 'Compressores de ar montados sobre chassis com rodas e rebocáveis',
-    '84145110': 'Ventiladores de mesa, de pé, de parede, de teto ou de janela, com motor elétrico incorporado, de potência <= 125 W',
-    '84145120': 'Ventiladores de mesa, de pé, de parede, de teto ou de janela, com motor elétrico incorporado, de potência <= 125 W',
-    '84145190': 'Ventiladores de mesa, de pé, de parede, de teto ou de janela, com motor elétrico incorporado, de potência <= 125 W',
-    '84145910': 'Outros ventiladores',
-    '84145990': 'Outros ventiladores',
-    '84146000': 'Coifas com dimensão horizontal máxima <= 120 cm',
-    '84147000': 'Armários de segurança biológica à prova de gás',
-    '84148011': 'Outras bombas de ar, coifas aspirantes para extração ou reciclagem',
-    '84148012': 'Outras bombas de ar, coifas aspirantes para extração ou reciclagem',
-    '84148013': 'Outras bombas de ar, coifas aspirantes para extração ou reciclagem',
-    '84148019': 'Outras bombas de ar, coifas aspirantes para extração ou reciclagem',
-    '84148021': 'Outras bombas de ar, coifas aspirantes para extração ou reciclagem',
-    '84148022': 'Outras bombas de ar, coifas aspirantes para extração ou reciclagem',
-    '84148029': 'Outras bombas de ar, coifas aspirantes para extração ou reciclagem',
-    '84148031': 'Outras bombas de ar, coifas aspirantes para extração ou reciclagem',
-    '84148032': 'Outras bombas de ar, coifas aspirantes para extração ou reciclagem',
-    '84148033': 'Outras bombas de ar, coifas aspirantes para extração ou reciclagem',
-    '84148038': 'Outras bombas de ar, coifas aspirantes para extração ou reciclagem',
-    '84148039': 'Outras bombas de ar, coifas aspirantes para extração ou reciclagem',
-    '84148090': 'Outras bombas de ar, coifas aspirantes para extração ou reciclagem',
-    '84149010': 'Outras partes de compressores de ar ou de outros gases',
-    '84149020': 'Outras partes de compressores de ar ou de outros gases',
-    '84149031': 'Outras partes de compressores de ar ou de outros gases',
-    '84149032': 'Outras partes de compressores de ar ou de outros gases',
-    '84149033': 'Outras partes de compressores de ar ou de outros gases',
-    '84149034': 'Outras partes de compressores de ar ou de outros gases',
-    '84149039': 'Outras partes de compressores de ar ou de outros gases',
-    '84149040': 'Outras partes de compressores de ar ou de outros gases',
-    '84151011': 'Aparelhos de ar condicionado, dos tipos utilizados em paredes ou janelas, formando corpo único ou do tipo splitsystem (sistema com elementos separados)',
-    '84151019': 'Aparelhos de ar condicionado, dos tipos utilizados em paredes ou janelas, formando corpo único ou do tipo splitsystem (sistema com elementos separados)',
-    '84151090': 'Aparelhos de ar condicionado, dos tipos utilizados em paredes ou janelas, formando corpo único ou do tipo splitsystem (sistema com elementos separados)',
-    '84152010': 'Aparelhos de ar condicionado, do tipo utilizado nos veículos automóveis',
-    '84152090': 'Aparelhos de ar condicionado, do tipo utilizado nos veículos automóveis',
-    '84158110': 'Outros aparelhos de ar condicionado, com dispositivo de refrigeração e válvula de inversão do ciclo térmico',
-    '84158190': 'Outros aparelhos de ar condicionado, com dispositivo de refrigeração e válvula de inversão do ciclo térmico',
-    '84158210': 'Outros aparelhos de ar condicionado, com dispositivos de refrigeração',
-    '84158290': 'Outros aparelhos de ar condicionado, com dispositivos de refrigeração',
-    '84158300': 'Outros aparelhos de ar condicionado, sem dispositivo de refrigeração',
-    '84159010': 'Partes de máquinas e aparelhos de ar condicionado',
-    '84159020': 'Partes de máquinas e aparelhos de ar condicionado',
-    '84159090': 'Partes de máquinas e aparelhos de ar condicionado',
-    '84161000': 'Queimadores para alimentação de fornalhas, de combustíveis líquidos',
-    '84162010': 'Outros queimadores para alimentação de fornalhas, incluídos os mistos',
-    '84162090': 'Outros queimadores para alimentação de fornalhas, incluídos os mistos',
-    '84163000': 'Fornalhas automáticas, incluídas as antefornalhas, grelhas mecânicas, descarregadores mecânicos de cinzas e dispositivos semelhantes',
-    '84169000': 'Partes de queimadores, fornalhas automáticas e dispositivos semelhantes',
-    '84171010': 'Fornos para ustulação, fusão ou outros tratamentos térmicos de minérios ou de metais, não elétricos',
-    '84171020': 'Fornos para ustulação, fusão ou outros tratamentos térmicos de minérios ou de metais, não elétricos',
-    '84171090': 'Fornos para ustulação, fusão ou outros tratamentos térmicos de minérios ou de metais, não elétricos',
-    '84172000': 'Fornos industriais de padaria, pastelaria ou da indústria de bolachas e biscoitos, não elétricos',
-    '84178010': 'Outros fornos industriais ou de laboratório, não elétricos',
-    '84178020': 'Outros fornos industriais ou de laboratório, não elétricos',
-    '84178090': 'Outros fornos industriais ou de laboratório, não elétricos',
-    '84179000': 'Partes de fornos industriais ou de laboratório, não elétricos',
-    '84181000': 'Combinações de refrigeradores e congeladores (freezers), com portas exteriores separadas',
-    '84182100': 'Refrigeradores de compressão, de tipo doméstico',
-    '84182900': 'Outros refrigeradores, de tipo doméstico',
-    '84183000': 'Congeladores (freezers) horizontais tipo arca, de capacidade <= 800 litros',
-    '84184000': 'Congeladores (freezers) verticais tipo armário, de capacidade <= 900 litros',
-    '84185010': 'Outros móveis (arcas, armários, vitrines, balcões e móveis semelhantes), para a conservação e exposição de produtos que incorporem um equipamento para a produção de drio',
-    '84185090': 'Outros móveis (arcas, armários, vitrines, balcões e móveis semelhantes), para a conservação e exposição de produtos que incorporem um equipamento para a produção de drio',
-    '84186100': 'Bombas de calor, exceto as máquinas e aparelhos de ar-condicionado da posição 8415',
-    '84186910': 'Outros materiais, máquinas e aparelhos, para produção de frio',
-    '84186920': 'Outros materiais, máquinas e aparelhos, para produção de frio',
-    '84186931': 'Outros materiais, máquinas e aparelhos, para produção de frio',
-    '84186932': 'Outros materiais, máquinas e aparelhos, para produção de frio',
-    '84186940': 'Outros materiais, máquinas e aparelhos, para produção de frio',
-    '84186991': 'Outros materiais, máquinas e aparelhos, para produção de frio',
-    '84186999': 'Outros materiais, máquinas e aparelhos, para produção de frio',
-    '84189100': 'Gabinetes ou móveis para receber um equipamento para a produção de frio',
-    '84189900': 'Outras partes de refrigeradores, congeladores e bombas de calor',
-    '84191100': 'Aquecedores de água, de aquecimento instantâneo, a gás',
-    '84191200': 'Aquecedores de água a gás instantâneos, não elétricos',
-    '84191900': 'Outros aquecedores de água, não elétricos, de aquecimento instantâneo ou de acumulação',
-    '84191910': 'Outros aquecedores de água, não elétricos, de aquecimento instantâneo ou de acumulação',
-    '84191990': 'Outros aquecedores de água, não elétricos, de aquecimento instantâneo ou de acumulação',
-    '84192000': 'Esterilizadores médico-cirúrgicos ou de laboratórios',
-    '84193100': 'Secadores para produtos agrícolas',
-    '84193200': 'Secadores para madeiras, pastas de papel, papéis ou cartões',
-    '84193300': 'Aparelhos de liofilização, unidades de secagem por congelamento e secadores por spray',
-    '84193400': 'Outros secadores, para produtos agrícolas',
-    '84193500': 'Outros secadores, para madeira, pasta de papel, papel ou cartão',
-    '84193900': 'Outros secadores',
-    '84194010': 'Aparelhos de destilação ou de retificação',
-    '84194020': 'Aparelhos de destilação ou de retificação',
-    '84194090': 'Aparelhos de destilação ou de retificação',
-    '84195010': 'Trocadores (permutadores) de calor',
-    '84195021': 'Trocadores (permutadores) de calor',
-    '84195022': 'Trocadores (permutadores) de calor',
-    '84195029': 'Trocadores (permutadores) de calor',
-    '84195090': 'Trocadores (permutadores) de calor',
-    '84196000': 'Aparelhos e dispositivos para liqüefação do ar ou de outros gases',
-    '84198110': 'Outros aparelhos e dispositivos para preparação de bebidas quentes ou para cozimento ou aquecimento de alimentos',
-    '84198190': 'Outros aparelhos e dispositivos para preparação de bebidas quentes ou para cozimento ou aquecimento de alimentos',
-    '84198911': 'Outros aparelhos e dispositivos para tratamento de matérias por meio de operações que impliquem mudança de temperatura',
-    '84198919': 'Outros aparelhos e dispositivos para tratamento de matérias por meio de operações que impliquem mudança de temperatura',
-    '84198920': 'Outros aparelhos e dispositivos para tratamento de matérias por meio de operações que impliquem mudança de temperatura',
-    '84198930': 'Outros aparelhos e dispositivos para tratamento de matérias por meio de operações que impliquem mudança de temperatura',
-    '84198940': 'Outros aparelhos e dispositivos para tratamento de matérias por meio de operações que impliquem mudança de temperatura',
-    '84198991': 'Outros aparelhos e dispositivos para tratamento de matérias por meio de operações que impliquem mudança de temperatura',
-    '84198999': 'Outros aparelhos e dispositivos para tratamento de matérias por meio de operações que impliquem mudança de temperatura',
-    '84199010': 'Partes de aparelhos e dispositivos para tratamento de matérias por meio de operações que impliquem mudança de temperatura',
-    '84199020': 'Partes de aparelhos e dispositivos para tratamento de matérias por meio de operações que impliquem mudança de temperatura',
-    '84199031': 'Partes de aparelhos e dispositivos para tratamento de matérias por meio de operações que impliquem mudança de temperatura',
-    '84199039': 'Partes de aparelhos e dispositivos para tratamento de matérias por meio de operações que impliquem mudança de temperatura',
-    '84199040': 'Partes de aparelhos e dispositivos para tratamento de matérias por meio de operações que impliquem mudança de temperatura',
-    '84199090': 'Partes de aparelhos e dispositivos para tratamento de matérias por meio de operações que impliquem mudança de temperatura',
-    '84201010': 'Calandras e laminadores',
-    '84201090': 'Calandras e laminadores',
-    '84209100': 'Cilindros para calandras e laminadores',
-    '84209900': 'Outras partes para calandras e laminadores',
-    '84211110': 'Desnatadeiras centrífugas',
-    '84211190': 'Desnatadeiras centrífugas',
-    '84211210': 'Secadores de roupa, centrífugos',
-    '84211290': 'Secadores de roupa, centrífugos',
-    '84211910': 'Outros centrifugadores',
-    '84211990': 'Outros centrifugadores',
-    '84212100': 'Aparelhos para filtrar ou depurar água',
-    '84212200': 'Aparelhos para filtrar ou depurar bebidas, exceto água',
-    '84212300': 'Aparelhos para filtrar óleos minerais nos motores de ignição por centelha ou por compressão',
-    '84212911': 'Outros aparelhos para filtrar ou depurar líquidos',
-    '84212919': 'Outros aparelhos para filtrar ou depurar líquidos',
-    '84212920': 'Outros aparelhos para filtrar ou depurar líquidos',
-    '84212930': 'Outros aparelhos para filtrar ou depurar líquidos',
-    '84212990': 'Outros aparelhos para filtrar ou depurar líquidos',
-    '84213100': 'Filtros de entrada de ar para motores de ignição por centelha ou por compressão',
-    '84213200': 'Conversores catalíticos ou filtros de partículas, combinados ou não, para purificação ou filtragem de gases de escape de motores de combustão interna',
-    '84213910': 'Outros aparelhos para filtrar ou depurar gases',
-    '84213920': 'Outros aparelhos para filtrar ou depurar gases',
-    '84213930': 'Outros aparelhos para filtrar ou depurar gases',
-    '84213990': 'Outros aparelhos para filtrar ou depurar gases',
-    '84219110': 'Outras partes de centrifugadores, incluídas as dos secadores centrífugos',
-    '84219191': 'Outras partes de centrifugadores, incluídas as dos secadores centrífugos',
-    '84219199': 'Outras partes de centrifugadores, incluídas as dos secadores centrífugos',
-    '84219910': 'Outras partes de aparelhos para filtrar ou depurar líquidos ou gases',
-    '84219920': 'Outras partes de aparelhos para filtrar ou depurar líquidos ou gases',
-    '84219991': 'Outras partes de aparelhos para filtrar ou depurar líquidos ou gases',
-    '84219999': 'Outras partes de aparelhos para filtrar ou depurar líquidos ou gases',
-    '84221100': 'Máquinas de lavar louça, do tipo da espécie doméstica',
-    '84221900': 'Outras máquinas de lavar louça',
-    '84222000': 'Máquinas e aparelhos para limpar ou secar garrafas ou outros recipientes',
-    '84223010': 'Máquinas e aparelhos para encher, fechar, arrolhar ou rotular garrafas, caixas, latas, sacos ou outros recipientes; máquinas e aparelhos para gaseificar bebidas',
-    '84223021': 'Máquinas e aparelhos para encher, fechar, arrolhar ou rotular garrafas, caixas, latas, sacos ou outros recipientes; máquinas e aparelhos para gaseificar bebidas',
-    '84223022': 'Máquinas e aparelhos para encher, fechar, arrolhar ou rotular garrafas, caixas, latas, sacos ou outros recipientes; máquinas e aparelhos para gaseificar bebidas',
-    '84223023': 'Máquinas e aparelhos para encher, fechar, arrolhar ou rotular garrafas, caixas, latas, sacos ou outros recipientes; máquinas e aparelhos para gaseificar bebidas',
-    '84223029': 'Máquinas e aparelhos para encher, fechar, arrolhar ou rotular garrafas, caixas, latas, sacos ou outros recipientes; máquinas e aparelhos para gaseificar bebidas',
-    '84223030': 'Máquinas e aparelhos para encher, fechar, arrolhar ou rotular garrafas, caixas, latas, sacos ou outros recipientes; máquinas e aparelhos para gaseificar bebidas',
-    '84224010': 'Outras máquinas e aparelhos para empacotar ou embalar mercadorias',
-    '84224020': 'Outras máquinas e aparelhos para empacotar ou embalar mercadorias',
-    '84224030': 'Outras máquinas e aparelhos para empacotar ou embalar mercadorias',
-    '84224090': 'Outras máquinas e aparelhos para empacotar ou embalar mercadorias',
-    '84229010': 'Partes de máquinas e aparelhos da posição 8422',
-    '84229090': 'Partes de máquinas e aparelhos da posição 8422',
-    '84231000': 'Balanças para pessoas, incluídas aquelas para bebês, de uso da espécie doméstica',
-    '84232000': 'Básculas de pesagem contínua em transportadores',
-    '84233011': 'Básculas de pesagem constante e balanças e básculas ensacadoras ou dosadoras',
-    '84233019': 'Básculas de pesagem constante e balanças e básculas ensacadoras ou dosadoras',
-    '84233090': 'Básculas de pesagem constante e balanças e básculas ensacadoras ou dosadoras',
-    '84238110': 'Outros aparelhos e instrumentos de pesagem, de capacidade <= 30 kg',
-    '84238190': 'Outros aparelhos e instrumentos de pesagem, de capacidade <= 30 kg',
-    '84238200': 'Outros aparelhos e instrumentos de pesagem, de capacidade > 30 kg e <= 5.000 kg',
-    '84238900': 'Outros aparelhos e instrumentos de pesagem',
-    '84239010': 'Pesos para balanças e partes de aparelhos ou instrumentos de pesagem, incluídas as básculas',
-    '84239021': 'Pesos para balanças e partes de aparelhos ou instrumentos de pesagem, incluídas as básculas',
-    '84239029': 'Pesos para balanças e partes de aparelhos ou instrumentos de pesagem, incluídas as básculas',
-    '84241000': 'Extintores, mesmo carregados',
-    '84242000': 'Pistolas aerográficas e aparelhos semelhantes',
-    '84243010': 'Máquinas e aparelhos de jato de areia, de jato de vapor e aparelhos de jato semelhantes',
-    '84243020': 'Máquinas e aparelhos de jato de areia, de jato de vapor e aparelhos de jato semelhantes',
-    '84243030': 'Máquinas e aparelhos de jato de areia, de jato de vapor e aparelhos de jato semelhantes',
-    '84243090': 'Máquinas e aparelhos de jato de areia, de jato de vapor e aparelhos de jato semelhantes',
-    '84244100': 'Pulverizadores portáteis, para agricultura ou horticultura',
-    '84244900': 'Outros pulverizadores, para a agricultura ou horticultura',
-    '84248221': 'Outros aparelhos para agricultura ou horticultura',
-    '84248229': 'Outros aparelhos para agricultura ou horticultura',
-    '84248290': 'Outros aparelhos para agricultura ou horticultura',
-    '84248910': 'Outros aparelhos mecânicos (mesmo manuais) para projetar ou pulverizar líquidos ou pós',
-    '84248920': 'Outros aparelhos mecânicos (mesmo manuais) para projetar ou pulverizar líquidos ou pós',
-    '84248990': 'Outros aparelhos mecânicos (mesmo manuais) para projetar ou pulverizar líquidos ou pós',
-    '84249010': 'Partes de aparelhos mecânicos para projetar, dispersar ou pulverizar líquidos ou pós',
-    '84249090': 'Partes de aparelhos mecânicos para projetar, dispersar ou pulverizar líquidos ou pós',
-    '84251100': 'Talhas, cadernais e moitões, de motor elétrico',
-    '84251910': 'Outras talhas, cadernais e moitões',
-    '84251990': 'Outras talhas, cadernais e moitões',
-    '84253110': 'Outros guinchos; cabrestantes, de motor elétrico',
-    '84253190': 'Outros guinchos; cabrestantes, de motor elétrico',
-    '84253910': 'Outros guinchos e cabrestantes',
-    '84253990': 'Outros guinchos e cabrestantes',
-    '84254100': 'Elevadores fixos de veículos, para garagens',
-    '84254200': 'Outros macacos hidráulicos',
-    '84254910': 'Outros macacos',
-    '84254990': 'Outros macacos',
-    '84261100': 'Pontes e vigas, rolantes, de suportes fixos',
-    '84261200': 'Pórticos móveis de pneumáticos e carros-pórticos',
-    '84261900': 'Outros pórticos e pontes-guindastes',
-    '84262000': 'Guindastes de torre',
-    '84263000': 'Guindastes de pórtico',
-    '84264110': 'Máquinas e aparelhos autopropulsores, de pneumáticos',
-    '84264190': 'Máquinas e aparelhos autopropulsores, de pneumáticos',
-    '84264910': 'Outras máquinas e aparelhos autopropulsores',
-    '84264990': 'Outras máquinas e aparelhos autopropulsores',
-    '84269100': 'Outras máquinas e aparelhos de elevação, próprios para serem montados em veículos rodoviários',
-    '84269900': 'Cábreas e outros guindastes',
-    '84271011': 'Autopropulsores, de motor elétrico',
-    '84271019': 'Autopropulsores, de motor elétrico',
-    '84271090': 'Autopropulsores, de motor elétrico',
-    '84272010': 'Outros autopropulsores',
-    '84272090': 'Outros autopropulsores',
-    '84279000': 'Outras empilhadeiras, outros veículos para movimentação de carga e semelhantes, com dispositivos de elevação',
-    '84281000': 'Elevadores e monta-cargas',
-    '84282010': 'Aparelhos elevadores ou transportadores, pneumáticos',
-    '84282090': 'Aparelhos elevadores ou transportadores, pneumáticos',
-    '84283100': 'Aparelhos elevadores ou transportadores de mercadorias, para uso subterrâneo',
-    '84283200': 'Outros aparelhos elevadores ou transportadores de mercadorias, de caçamba',
-    '84283300': 'Outros aparelhos elevadores ou transportadores de mercadorias, de tira ou correia',
-    '84283910': 'Outros aparelhos elevadores ou transportadores, de ação contínua, para mercadorias',
-    '84283920': 'Outros aparelhos elevadores ou transportadores, de ação contínua, para mercadorias',
-    '84283930': 'Outros aparelhos elevadores ou transportadores, de ação contínua, para mercadorias',
-    '84283990': 'Outros aparelhos elevadores ou transportadores, de ação contínua, para mercadorias',
-    '84284000': 'Escadas e tapetes, rolantes',
-    '84286000': 'Teleféricos (incluídos as telecadeiras e os telesquis); mecanismos de tração para funiculares',
-    '84287000': 'Robôs industriais para elevação, manuseio, carga ou descarga',
-    '84289010': 'Outras máquinas e aparelhos de elevação, de carga, de descarga ou de movimentação',
-    '84289020': 'Outras máquinas e aparelhos de elevação, de carga, de descarga ou de movimentação',
-    '84289090': 'Outras máquinas e aparelhos de elevação, de carga, de descarga ou de movimentação',
-    '84291110': 'Bulldozers e angledozers, de lagartas, autopropulsores',
-    '84291190': 'Bulldozers e angledozers, de lagartas, autopropulsores',
-    '84291910': 'Outros bulldozers e angledozers',
-    '84291990': 'Outros bulldozers e angledozers',
-    '84292010': 'Niveladores',
-    '84292090': 'Niveladores',
-    '84293000': 'Raspo-transportadores (scrapers), autopropulsores',
-    '84294000': 'Compactadores e rolos ou cilindros compressores, autopropulsores',
-    '84295111': 'Carregadoras e pás carregadoras, de carregamento frontal, autopropulsores',
-    '84295119': 'Carregadoras e pás carregadoras, de carregamento frontal, autopropulsores',
-    '84295129': 'Carregadoras e pás carregadoras, de carregamento frontal, autopropulsores',
-    '84295191': 'Carregadoras e pás carregadoras, de carregamento frontal, autopropulsores',
-    '84295192': 'Carregadoras e pás carregadoras, de carregamento frontal, autopropulsores',
-    '84295199': 'Carregadoras e pás carregadoras, de carregamento frontal, autopropulsores',
-    '84295211': 'Máquinas escavadoras, com capacidade de efetuar uma rotação de 360 graus, autopropulsores',
-    '84295212': 'Máquinas escavadoras, com capacidade de efetuar uma rotação de 360 graus, autopropulsores',
-    '84295219': 'Máquinas escavadoras, com capacidade de efetuar uma rotação de 360 graus, autopropulsores',
-    '84295290': 'Máquinas escavadoras, com capacidade de efetuar uma rotação de 360 graus, autopropulsores',
-    '84295900': 'Outras pás mecânicas, escavadores e carregadoras, autopropulsores',
-    '84301000': 'Bate-estacas e arranca-estacas',
-    '84302000': 'Limpa-neves',
-    '84303110': 'Máquinas para perfuração de túneis e galerias, autopropulsoras',
-    '84303190': 'Máquinas para perfuração de túneis e galerias, autopropulsoras',
-    '84303910': 'Outras máquinas para perfuração de túneis e galerias',
-    '84303990': 'Outras máquinas para perfuração de túneis e galerias',
-    '84304110': 'Outras máquinas de sondagem ou perfuração, autopropulsores',
-    '84304120': 'Outras máquinas de sondagem ou perfuração, autopropulsores',
-    '84304130': 'Outras máquinas de sondagem ou perfuração, autopropulsores',
-    '84304190': 'Outras máquinas de sondagem ou perfuração, autopropulsores',
-    '84304910': 'Outras máquinas de sondagem ou perfuração',
-    '84304920': 'Outras máquinas de sondagem ou perfuração',
-    '84304990': 'Outras máquinas de sondagem ou perfuração',
-    '84305000': 'Outras máquinas e aparelhos de terraplanagem, autopropulsores',
-    '84306100': 'Máquinas de comprimir ou compactar terra, exceto autopropulsores',
-    '84306919': 'Outras máquinas e aparelhos de terraplanagem, exceto autopropulsados',
-    '84306990': 'Outras máquinas e aparelhos de terraplanagem, exceto autopropulsados',
-    '84311010': 'Partes das máquinas e aparelhos da posição 8425',
-    '84311090': 'Partes das máquinas e aparelhos da posição 8425',
-    '84312011': 'Partes das máquinas e aparelhos da posição 8427',
-    '84312019': 'Partes das máquinas e aparelhos da posição 8427',
-    '84312090': 'Partes das máquinas e aparelhos da posição 8427',
-    '84313110': 'Partes de elevadores, monta-cargas ou de escadas rolantes',
-    '84313190': 'Partes de elevadores, monta-cargas ou de escadas rolantes',
-    '84313900': 'Partes de outras máquinas e aparelhos da posição 8428',
-    '84314100': 'Caçambas, pás, ganchos e tenazes, para máquinas e aparelhos das posições 8426, 8429 e 8430',
-    '84314200': 'Lâminas para bulldozers ou angledozers',
-    '84314310': 'Partes de máquinas de sondagem ou de perfuração, das subposições 8430.41 ou 8430.49',
-    '84314390': 'Partes de máquinas de sondagem ou de perfuração, das subposições 8430.41 ou 8430.49',
-    '84314910': 'Partes de outras máquinas e aparelhos das posições 8426, 8429 e 8430',
-    '84314921': 'Partes de outras máquinas e aparelhos das posições 8426, 8429 e 8430',
-    '84314922': 'Partes de outras máquinas e aparelhos das posições 8426, 8429 e 8430',
-    '84314923': 'Partes de outras máquinas e aparelhos das posições 8426, 8429 e 8430',
-    '84314929': 'Partes de outras máquinas e aparelhos das posições 8426, 8429 e 8430',
-    '84321000': 'Arados e charruas',
-    '84322100': 'Grades de discos, de uso agrícola, para preparação ou trabalho do solo',
-    '84322900': 'Outras grades, escarificadores, cultivadores, extirpadores, enxadas e sachadores',
-    '84323110': 'Semeadores, plantadores e transplantadores, de plantio direto',
-    '84323190': 'Semeadores, plantadores e transplantadores, de plantio direto',
-    '84323910': 'Outros semeadores, plantadores e transplantadores',
-    '84323990': 'Outros semeadores, plantadores e transplantadores',
-    '84324100': 'Espalhadores de estrume',
-    '84324200': 'Distribuidores de adubos (fertilizantes)',
-    '84328000': 'Outras máquinas e aparelhos agrícolas, hortícolas ou florestais, para preparação do solo',
-    '84329000': 'Partes de máquinas e aparelhos agrícolas, hortícolas ou florestais, para preparação do solo',
-    '84331100': 'Cortadores de grama, motorizados, cujo dispositivo de corte gira num plano horizontal',
-    '84331900': 'Outros cortadores de grama (relva)',
-    '84332010': 'Ceifeiras, incluídas as barras de corte para montagem em tratores',
-    '84332090': 'Ceifeiras, incluídas as barras de corte para montagem em tratores',
-    '84333000': 'Outras máquinas e aparelhos para colher e dispor o feno',
-    '84334000': 'Enfardadeiras de palha ou de forragem, incluídas as enfardadeiras- apanhadeiras',
-    '84335100': 'Ceifeiras-debulhadoras',
-    '84335200': 'Outras máquinas e aparelhos para debulhar',
-    '84335300': 'Máquinas para colheita de raízes ou tubérculos',
-    '84335919': 'Outras máquinas e aparelhos para colheita',
-    '84335990': 'Outras máquinas e aparelhos para colheita',
-    '84336010': 'Máquinas para limpar ou selecionar ovos, frutas ou outros produtos agrícolas',
-    '84336021': 'Máquinas para limpar ou selecionar ovos, frutas ou outros produtos agrícolas',
-    '84336029': 'Máquinas para limpar ou selecionar ovos, frutas ou outros produtos agrícolas',
-    '84336090': 'Máquinas para limpar ou selecionar ovos, frutas ou outros produtos agrícolas',
-    '84339010': 'Partes de máquinas e aparelhos para colheita ou debulha de produtos agrícolas, ou para limpar ou selecionar ovos, frutas ou outros produtos agrícolas',
-    '84339090': 'Partes de máquinas e aparelhos para colheita ou debulha de produtos agrícolas, ou para limpar ou selecionar ovos, frutas ou outros produtos agrícolas',
-    '84341000': 'Máquinas de ordenhar',
-    '84342010': 'Máquinas e aparelhos para a indústria de laticínios',
-    '84342090': 'Máquinas e aparelhos para a indústria de laticínios',
-    '84349000': 'Partes de máquinas e aparelhos de ordenhar e da indústria de laticínios',
-    '84351000': 'Prensas, esmagadores e máquinas e aparelhos para fabricação de vinho, sidra, suco de frutas ou bebidas semelhantes',
-    '84359000': 'Partes de máquinas e aparelhos para fabricação de vinho, sidra, suco de frutas ou bebidas semelhantes',
-    '84361000': 'Máquinas e aparelhos para preparação de alimentos ou rações para animais',
-    '84362100': 'Chocadeiras e criadeiras',
-    '84362900': 'Outras máquinas e aparelhos para avicultura',
-    '84368000': 'Outras máquinas e aparelhos para agricultura, horticultura, silvicultura, avicultura ou apicultura',
-    '84369100': 'Partes de máquinas e aparelhos para avicultura',
-    '84369900': 'Outras partes de máquinas e aparelhos para agricultura, horticultura, silvicultura ou apicultura',
-    '84371000': 'Máquinas para limpeza, seleção ou peneiração de grãos ou de produtos hortícolas secos',
-    '84378010': 'Outras máquinas e aparelhos para a indústria de moagem ou tratamento de cereais ou de produtos hortícolas secos',
-    '84378090': 'Outras máquinas e aparelhos para a indústria de moagem ou tratamento de cereais ou de produtos hortícolas secos',
-    '84379000': 'Partes de máquinas da posição 8437',
-    '84381000': 'Máquinas e aparelhos para as indústrias de panificação, pastelaria, bolachas e biscoitos e de massas alimentícias',
-    '84382011': 'Máquinas e aparelhos para as indústrias de confeitaria e de cacau ou chocolate',
-    '84382019': 'Máquinas e aparelhos para as indústrias de confeitaria e de cacau ou chocolate',
-    '84382090': 'Máquinas e aparelhos para as indústrias de confeitaria e de cacau ou chocolate',
-    '84383000': 'Máquinas e aparelhos para a indústria de açúcar',
-    '84384000': 'Máquinas e aparelhos para a indústria cervejaria',
-    '84385000': 'Máquinas e aparelhos para preparação de carnes',
-    '84386000': 'Máquinas e aparelhos para preparação de frutas ou produtos hortícolas',
-    '84388010': 'Outras máquinas e aparelhos para preparação ou fabricação industriais de alimentos ou de bebidas',
-    '84388020': 'Outras máquinas e aparelhos para preparação ou fabricação industriais de alimentos ou de bebidas',
-    '84388090': 'Outras máquinas e aparelhos para preparação ou fabricação industriais de alimentos ou de bebidas',
-    '84389000': 'Partes de máquinas e aparelhos para preparação ou fabricação industriais de alimentos ou de bebidas',
-    '84391010': 'Máquinas e aparelhos para fabricação de pasta de matérias fibrosas celulósicas',
-    '84391020': 'Máquinas e aparelhos para fabricação de pasta de matérias fibrosas celulósicas',
-    '84391030': 'Máquinas e aparelhos para fabricação de pasta de matérias fibrosas celulósicas',
-    '84391090': 'Máquinas e aparelhos para fabricação de pasta de matérias fibrosas celulósicas',
-    '84392000': 'Máquinas e aparelhos para fabricação de papel ou cartão',
-    '84393010': 'Máquinas e aparelhos para acabamento de papel ou cartão',
-    '84393020': 'Máquinas e aparelhos para acabamento de papel ou cartão',
-    '84393090': 'Máquinas e aparelhos para acabamento de papel ou cartão',
-    '84399100': 'Partes de máquinas ou aparelhos para fabricação de pasta de matérias fibrosas celulósicas',
-    '84399910': 'Partes de máquinas e aparelhos para fabricação ou acabamento de papel ou cartão',
-    '84399990': 'Partes de máquinas e aparelhos para fabricação ou acabamento de papel ou cartão',
-    '84401011': 'Máquinas e aparelhos para brochura ou encadernação',
-    '84401019': 'Máquinas e aparelhos para brochura ou encadernação',
-    '84401020': 'Máquinas e aparelhos para brochura ou encadernação',
-    '84401090': 'Máquinas e aparelhos para brochura ou encadernação',
-    '84409000': 'Partes de máquinas e aparelhos para brochura ou encadernação',
-    '84411010': 'Cortadeiras de papel ou cartão',
-    '84411090': 'Cortadeiras de papel ou cartão',
-    '84412000': 'Máquinas para fabricação de sacos de quaisquer dimensões ou de envelopes',
-    '84413010': 'Máquinas para fabricação de caixas, tubos, tambores ou de recipientes semelhantes, por qualquer processo, exceto moldagem',
-    '84413090': 'Máquinas para fabricação de caixas, tubos, tambores ou de recipientes semelhantes, por qualquer processo, exceto moldagem',
-    '84414000': 'Máquinas de moldar artigos de pasta de papel, papel ou de cartão',
-    '84418000': 'Outras máquinas e aparelhos para o trabalho da pasta de papel, do papel ou cartão',
-    '84419000': 'Partes de máquinas e aparelhos para o trabalho da pasta de papel, do papel ou do cartão',
-    '84423010': 'Máquinas, aparelhos e equipamentos para preparação ou fabricação de clichês, blocos, cilindros e outros elementos de impressão',
-    '84423020': 'Máquinas, aparelhos e equipamentos para preparação ou fabricação de clichês, blocos, cilindros e outros elementos de impressão',
-    '84423090': 'Máquinas, aparelhos e equipamentos para preparação ou fabricação de clichês, blocos, cilindros e outros elementos de impressão',
-    '84424010': 'Partes de máquinas, aparelhos e equipamentos da subposição 8442.30',
-    '84424020': 'Partes de máquinas, aparelhos e equipamentos da subposição 8442.30',
-    '84424090': 'Partes de máquinas, aparelhos e equipamentos da subposição 8442.30',
-    '84425000': 'Clichês, blocos, cilindros e outros elementos de impressão; pedras litográficas, blocos, placas e cilindros, preparados para impressão',
-    '84431110': 'Máquinas e aparelhos de impressão por offset, alimentados por bobinas',
-    '84431190': 'Máquinas e aparelhos de impressão por offset, alimentados por bobinas',
-    '84431200': 'Máquinas e aparelhos de impressão por offset, alimentados por folhas de formato <= 22x36 cm',
-    '84431310': 'Outras máquinas e aparelhos de impressão, por offset',
-    '84431321': 'Outras máquinas e aparelhos de impressão, por offset',
-    '84431329': 'Outras máquinas e aparelhos de impressão, por offset',
-    '84431390': 'Outras máquinas e aparelhos de impressão, por offset',
-    '84431400': 'Máquinas e aparelhos de impressão, tipográficos, alimentados por bobinas, exceto máquinas e aparelhos flexográficos',
-    '84431500': 'Máquinas e aparelhos de impressão, tipográficos, não alimentados por bobinas, exceto máquinas e aparelhos flexográficos',
-    '84431600': 'Máquinas e aparelhos de impressão, flexográficos',
-    '84431710': 'Máquinas e aparelhos de impressão, heliográficos',
-    '84431790': 'Máquinas e aparelhos de impressão, heliográficos',
-    '84431910': 'Outras máquinas e aparelhos de impressão por meio de blocos, cilindros e outros elementos de impressão',
-    '84431990': 'Outras máquinas e aparelhos de impressão por meio de blocos, cilindros e outros elementos de impressão',
-    '84433111': 'Máquinas que executem pelo menos duas das seguintes funções: impressão, cópia ou transmissão de telecópia (fax), capazes de ser conectadas a uma máquina automática de processamento de dados ou a uma rede',
-    '84433113': 'Máquinas que executem pelo menos duas das seguintes funções: impressão, cópia ou transmissão de telecópia (fax), capazes de ser conectadas a uma máquina automática de processamento de dados ou a uma rede',
-    '84433114': 'Máquinas que executem pelo menos duas das seguintes funções: impressão, cópia ou transmissão de telecópia (fax), capazes de ser conectadas a uma máquina automática de processamento de dados ou a uma rede',
-    '84433115': 'Máquinas que executem pelo menos duas das seguintes funções: impressão, cópia ou transmissão de telecópia (fax), capazes de ser conectadas a uma máquina automática de processamento de dados ou a uma rede',
-    '84433116': 'Máquinas que executem pelo menos duas das seguintes funções: impressão, cópia ou transmissão de telecópia (fax), capazes de ser conectadas a uma máquina automática de processamento de dados ou a uma rede',
-    '84433191': 'Máquinas que executem pelo menos duas das seguintes funções: impressão, cópia ou transmissão de telecópia (fax), capazes de ser conectadas a uma máquina automática de processamento de dados ou a uma rede',
-    '84433199': 'Máquinas que executem pelo menos duas das seguintes funções: impressão, cópia ou transmissão de telecópia (fax), capazes de ser conectadas a uma máquina automática de processamento de dados ou a uma rede',
-    '84433221': 'Outras impressoras, copiadoras e telecopiadoras, capazes de ser conectadas a uma máquina automática para processamento de dados ou a uma rede',
-    '84433223': 'Outras impressoras, copiadoras e telecopiadoras, capazes de ser conectadas a uma máquina automática para processamento de dados ou a uma rede',
-    '84433229': 'Outras impressoras, copiadoras e telecopiadoras, capazes de ser conectadas a uma máquina automática para processamento de dados ou a uma rede',
-    '84433231': 'Outras impressoras, copiadoras e telecopiadoras, capazes de ser conectadas a uma máquina automática para processamento de dados ou a uma rede',
-    '84433232': 'Outras impressoras, copiadoras e telecopiadoras, capazes de ser conectadas a uma máquina automática para processamento de dados ou a uma rede',
-    '84433233': 'Outras impressoras, copiadoras e telecopiadoras, capazes de ser conectadas a uma máquina automática para processamento de dados ou a uma rede',
-    '84433234': 'Outras impressoras, copiadoras e telecopiadoras, capazes de ser conectadas a uma máquina automática para processamento de dados ou a uma rede',
-    '84433235': 'Outras impressoras, copiadoras e telecopiadoras, capazes de ser conectadas a uma máquina automática para processamento de dados ou a uma rede',
-    '84433236': 'Outras impressoras, copiadoras e telecopiadoras, capazes de ser conectadas a uma máquina automática para processamento de dados ou a uma rede',
-    '84433237': 'Outras impressoras, copiadoras e telecopiadoras, capazes de ser conectadas a uma máquina automática para processamento de dados ou a uma rede',
-    '84433239': 'Outras impressoras, copiadoras e telecopiadoras, capazes de ser conectadas a uma máquina automática para processamento de dados ou a uma rede',
-    '84433240': 'Outras impressoras, copiadoras e telecopiadoras, capazes de ser conectadas a uma máquina automática para processamento de dados ou a uma rede',
-    '84433251': 'Outras impressoras, copiadoras e telecopiadoras, capazes de ser conectadas a uma máquina automática para processamento de dados ou a uma rede',
-    '84433252': 'Outras impressoras, copiadoras e telecopiadoras, capazes de ser conectadas a uma máquina automática para processamento de dados ou a uma rede',
-    '84433259': 'Outras impressoras, copiadoras e telecopiadoras, capazes de ser conectadas a uma máquina automática para processamento de dados ou a uma rede',
-    '84433291': 'Outras impressoras, copiadoras e telecopiadoras, capazes de ser conectadas a uma máquina automática para processamento de dados ou a uma rede',
-    '84433299': 'Outras impressoras, copiadoras e telecopiadoras, capazes de ser conectadas a uma máquina automática para processamento de dados ou a uma rede',
-    '84433910': 'Outras impressoras, copiadoras e telecopiadoras',
-    '84433921': 'Outras impressoras, copiadoras e telecopiadoras',
-    '84433929': 'Outras impressoras, copiadoras e telecopiadoras',
-    '84433930': 'Outras impressoras, copiadoras e telecopiadoras',
-    '84433990': 'Outras impressoras, copiadoras e telecopiadoras',
-    '84439110': 'Partes e acessórios de máquinas e aparelhos de impressão que operem por meio de blocos, cilindros e outros elementos de impressão da posição 8442',
-    '84439191': 'Partes e acessórios de máquinas e aparelhos de impressão que operem por meio de blocos, cilindros e outros elementos de impressão da posição 8442',
-    '84439192': 'Partes e acessórios de máquinas e aparelhos de impressão que operem por meio de blocos, cilindros e outros elementos de impressão da posição 8442',
-    '84439199': 'Partes e acessórios de máquinas e aparelhos de impressão que operem por meio de blocos, cilindros e outros elementos de impressão da posição 8442',
-    '84439911': 'Partes e acessórios de impressoras ou traçadores gráficos (plotters), copiadoras e telecopiadoras',
-    '84439912': 'Partes e acessórios de impressoras ou traçadores gráficos (plotters), copiadoras e telecopiadoras',
-    '84439919': 'Partes e acessórios de impressoras ou traçadores gráficos (plotters), copiadoras e telecopiadoras',
-    '84439921': 'Partes e acessórios de impressoras ou traçadores gráficos (plotters), copiadoras e telecopiadoras',
-    '84439922': 'Partes e acessórios de impressoras ou traçadores gráficos (plotters), copiadoras e telecopiadoras',
-    '84439923': 'Partes e acessórios de impressoras ou traçadores gráficos (plotters), copiadoras e telecopiadoras',
-    '84439929': 'Partes e acessórios de impressoras ou traçadores gráficos (plotters), copiadoras e telecopiadoras',
-    '84439931': 'Partes e acessórios de impressoras ou traçadores gráficos (plotters), copiadoras e telecopiadoras',
-    '84439932': 'Partes e acessórios de impressoras ou traçadores gráficos (plotters), copiadoras e telecopiadoras',
-    '84439933': 'Partes e acessórios de impressoras ou traçadores gráficos (plotters), copiadoras e telecopiadoras',
-    '84439939': 'Partes e acessórios de impressoras ou traçadores gráficos (plotters), copiadoras e telecopiadoras',
-    '84439941': 'Partes e acessórios de impressoras ou traçadores gráficos (plotters), copiadoras e telecopiadoras',
-    '84439942': 'Partes e acessórios de impressoras ou traçadores gráficos (plotters), copiadoras e telecopiadoras',
-    '84439949': 'Partes e acessórios de impressoras ou traçadores gráficos (plotters), copiadoras e telecopiadoras',
-    '84439950': 'Partes e acessórios de impressoras ou traçadores gráficos (plotters), copiadoras e telecopiadoras',
-    '84439960': 'Partes e acessórios de impressoras ou traçadores gráficos (plotters), copiadoras e telecopiadoras',
-    '84439970': 'Partes e acessórios de impressoras ou traçadores gráficos (plotters), copiadoras e telecopiadoras',
-    '84439980': 'Partes e acessórios de impressoras ou traçadores gráficos (plotters), copiadoras e telecopiadoras',
-    '84439990': 'Partes e acessórios de impressoras ou traçadores gráficos (plotters), copiadoras e telecopiadoras',
-    '84440010': 'Máquinas para extrudar, estirar, texturizar ou cortar matérias têxteis sintéticas ou artificiais',
-    '84440020': 'Máquinas para extrudar, estirar, texturizar ou cortar matérias têxteis sintéticas ou artificiais',
-    '84440090': 'Máquinas para extrudar, estirar, texturizar ou cortar matérias têxteis sintéticas ou artificiais',
-    '84451190': 'Cardas para preparação de matérias têxteis',
-    '84451200': 'Penteadoras de matérias têxteis',
-    '84451300': 'Bancas de estiramento (bancas de fusos) para matérias têxteis',
-    '84451910': 'Outras máquinas para preparação de matérias têxteis',
-    '84451921': 'Outras máquinas para preparação de matérias têxteis',
-    '84451922': 'Outras máquinas para preparação de matérias têxteis',
-    '84451924': 'Outras máquinas para preparação de matérias têxteis',
-    '84451925': 'Outras máquinas para preparação de matérias têxteis',
-    '84451929': 'Outras máquinas para preparação de matérias têxteis',
-    '84452000': 'Máquinas para fiação de matérias têxteis',
-    '84453010': 'Máquinas para dobragem ou torção, de matérias têxteis',
-    '84454011': 'Máquinas de bobinar ou de dobar, matérias têxteis',
-    '84454012': 'Máquinas de bobinar ou de dobar, matérias têxteis',
-    '84454018': 'Máquinas de bobinar ou de dobar, matérias têxteis',
-    '84454019': 'Máquinas de bobinar ou de dobar, matérias têxteis',
-    '84454021': 'Máquinas de bobinar ou de dobar, matérias têxteis',
-    '84454029': 'Máquinas de bobinar ou de dobar, matérias têxteis',
-    '84454031': 'Máquinas de bobinar ou de dobar, matérias têxteis',
-    '84454090': 'Máquinas de bobinar ou de dobar, matérias têxteis',
-    '84459010': 'Outras máquinas e aparelhos para fabricação e preparação de fios têxteis',
-    '84459020': 'Outras máquinas e aparelhos para fabricação e preparação de fios têxteis',
-    '84459030': 'Outras máquinas e aparelhos para fabricação e preparação de fios têxteis',
-    '84459090': 'Outras máquinas e aparelhos para fabricação e preparação de fios têxteis',
-    '84461010': 'Teares para tecidos de largura <= 30 cm',
-    '84461090': 'Teares para tecidos de largura <= 30 cm',
-    '84462100': 'Teares para tecidos de largura > 30 cm, de lançadeiras a motor',
-    '84463010': 'Teares para tecidos, de largura > 30 cm, sem lançadeiras',
-    '84463020': 'Teares para tecidos, de largura > 30 cm, sem lançadeiras',
-    '84463030': 'Teares para tecidos, de largura > 30 cm, sem lançadeiras',
-    '84463040': 'Teares para tecidos, de largura > 30 cm, sem lançadeiras',
-    '84463090': 'Teares para tecidos, de largura > 30 cm, sem lançadeiras',
-    '84471100': 'Teares circulares para malhas, com cilindro de diâmetro <= 165 mm',
-    '84471200': 'Teares circulares para malhas, com cilindro de diâmetro > 165 mm',
-    '84472010': 'Teares retilíneos para malhas; máquinas de costura por entrelaçamento (couture-tricotage)',
-    '84472021': 'Teares retilíneos para malhas; máquinas de costura por entrelaçamento (couture-tricotage)',
-    '84472029': 'Teares retilíneos para malhas; máquinas de costura por entrelaçamento (couture-tricotage)',
-    '84472030': 'Teares retilíneos para malhas; máquinas de costura por entrelaçamento (couture-tricotage)',
-    '84479020': 'Outras máquinas para fabricar guipuras, tules, rendas, bordados, passamanarias, galões ou redes; máquinas para inserir tufos',
-    '84479090': 'Outras máquinas para fabricar guipuras, tules, rendas, bordados, passamanarias, galões ou redes; máquinas para inserir tufos',
-    '84481110': 'Ratieras e mecanismos jacquard; redutores, perfuradores e copiadores de cartões; máquinas para enlaçar cartões após perfuração',
-    '84481120': 'Ratieras e mecanismos jacquard; redutores, perfuradores e copiadores de cartões; máquinas para enlaçar cartões após perfuração',
-    '84481190': 'Ratieras e mecanismos jacquard; redutores, perfuradores e copiadores de cartões; máquinas para enlaçar cartões após perfuração',
-    '84481900': 'Outras máquinas e aparelhos auxiliares para as máquinas das posições 8444, 8445, 8446 ou 8447',
-    '84482010': 'Partes e acessórios de máquinas da posição 8444 ou das suas máquinas e aparelhos auxiliares',
-    '84482020': 'Partes e acessórios de máquinas da posição 8444 ou das suas máquinas e aparelhos auxiliares',
-    '84482030': 'Partes e acessórios de máquinas da posição 8444 ou das suas máquinas e aparelhos auxiliares',
-    '84482090': 'Partes e acessórios de máquinas da posição 8444 ou das suas máquinas e aparelhos auxiliares',
-    '84483100': 'Guarnições de cardas',
-    '84483211': 'Partes e acessórios de máquinas para preparação de matérias têxteis, exceto as guarnições de carda',
-    '84483219': 'Partes e acessórios de máquinas para preparação de matérias têxteis, exceto as guarnições de carda',
-    '84483220': 'Partes e acessórios de máquinas para preparação de matérias têxteis, exceto as guarnições de carda',
-    '84483230': 'Partes e acessórios de máquinas para preparação de matérias têxteis, exceto as guarnições de carda',
-    '84483290': 'Partes e acessórios de máquinas para preparação de matérias têxteis, exceto as guarnições de carda',
-    '84483310': 'Fusos e suas aletas, anéis e cursores, para máquinas da posição 8445',
-    '84483390': 'Fusos e suas aletas, anéis e cursores, para máquinas da posição 8445',
-    '84483912': 'Outras partes e acessórios de máquinas e aparelhos da posição 8445',
-    '84483917': 'Outras partes e acessórios de máquinas e aparelhos da posição 8445',
-    '84483919': 'Outras partes e acessórios de máquinas e aparelhos da posição 8445',
-    '84483921': 'Outras partes e acessórios de máquinas e aparelhos da posição 8445',
-    '84483922': 'Outras partes e acessórios de máquinas e aparelhos da posição 8445',
-    '84483923': 'Outras partes e acessórios de máquinas e aparelhos da posição 8445',
-    '84483929': 'Outras partes e acessórios de máquinas e aparelhos da posição 8445',
-    '84483991': 'Outras partes e acessórios de máquinas e aparelhos da posição 8445',
-    '84483992': 'Outras partes e acessórios de máquinas e aparelhos da posição 8445',
-    '84483999': 'Outras partes e acessórios de máquinas e aparelhos da posição 8445',
-    '84484200': 'Pentes, liços e quadros de liços, de teares para tecidos',
-    '84484910': 'Outras partes e acessórios de teares para tecidos ou das suas máquinas e aparelhos auxiliares',
-    '84484920': 'Outras partes e acessórios de teares para tecidos ou das suas máquinas e aparelhos auxiliares',
-    '84484990': 'Outras partes e acessórios de teares para tecidos ou das suas máquinas e aparelhos auxiliares',
-    '84485110': 'Platinas, agulhas e outros artigos utilizados na formação de malhas',
-    '84485190': 'Platinas, agulhas e outros artigos utilizados na formação de malhas',
-    '84485910': 'Outras partes e acessórios dos teares, máquinas ou aparelhos da posição 8447 ou das suas máquinas e aparelhos auxiliares',
-    '84485922': 'Outras partes e acessórios dos teares, máquinas ou aparelhos da posição 8447 ou das suas máquinas e aparelhos auxiliares',
-    '84485929': 'Outras partes e acessórios dos teares, máquinas ou aparelhos da posição 8447 ou das suas máquinas e aparelhos auxiliares',
-    '84485930': 'Outras partes e acessórios dos teares, máquinas ou aparelhos da posição 8447 ou das suas máquinas e aparelhos auxiliares',
-    '84485990': 'Outras partes e acessórios dos teares, máquinas ou aparelhos da posição 8447 ou das suas máquinas e aparelhos auxiliares',
-    '84490010': 'Máquinas e aparelhos para fabricação ou acabamento de feltro ou de falsos tecidos, inclusive chapéus de feltro; formas para chapéus e artefatos de uso semelhantes',
-    '84490020': 'Máquinas e aparelhos para fabricação ou acabamento de feltro ou de falsos tecidos, inclusive chapéus de feltro; formas para chapéus e artefatos de uso semelhantes',
-    '84490080': 'Máquinas e aparelhos para fabricação ou acabamento de feltro ou de falsos tecidos, inclusive chapéus de feltro; formas para chapéus e artefatos de uso semelhantes',
-    '84490091': 'Máquinas e aparelhos para fabricação ou acabamento de feltro ou de falsos tecidos, inclusive chapéus de feltro; formas para chapéus e artefatos de uso semelhantes',
-    '84490099': 'Máquinas e aparelhos para fabricação ou acabamento de feltro ou de falsos tecidos, inclusive chapéus de feltro; formas para chapéus e artefatos de uso semelhantes',
-    '84501100': 'Máquinas de lavar roupa, inteiramente automáticas, de capacidade <= 10 kg em peso de roupa seca',
-    '84501200': 'Outras máquinas de lavar roupa, com secador centrífugo incorporado, de capacidade <= 10 kg em peso de roupa seca',
-    '84501900': 'Outras máquinas de lavar roupa, de capacidade <= 10 kg em peso de roupa seca',
-    '84502010': 'Máquinas de lavar roupa, de capacidade > 10 kg, em peso de roupa seca',
-    '84502020': 'Máquinas de lavar roupa, de capacidade > 10 kg, em peso de roupa seca',
-    '84502090': 'Máquinas de lavar roupa, de capacidade > 10 kg, em peso de roupa seca',
-    '84509010': 'Partes de máquinas de lavar roupa, mesmo com dispositivo de secagem',
-    '84509090': 'Partes de máquinas de lavar roupa, mesmo com dispositivo de secagem',
-    '84511000': 'Máquinas para lavar a seco',
-    '84512100': 'Máquinas para secar roupa, de capacidade <= 10 kg em peso de roupa seca',
-    '84512910': 'Outras máquinas para secar roupa',
-    '84512990': 'Outras máquinas para secar roupa',
-    '84513010': 'Máquinas e prensas para passar roupa, incluídas as fixadoras',
-    '84513091': 'Máquinas e prensas para passar roupa, incluídas as fixadoras',
-    '84513099': 'Máquinas e prensas para passar roupa, incluídas as fixadoras',
-    '84514010': 'Máquinas para lavar, branquear ou tingir',
-    '84514021': 'Máquinas para lavar, branquear ou tingir',
-    '84514029': 'Máquinas para lavar, branquear ou tingir',
-    '84514090': 'Máquinas para lavar, branquear ou tingir',
-    '84515010': 'Máquinas para enrolar, desenrolar, dobrar, cortar ou dentear tecidos',
-    '84515020': 'Máquinas para enrolar, desenrolar, dobrar, cortar ou dentear tecidos',
-    '84515090': 'Máquinas para enrolar, desenrolar, dobrar, cortar ou dentear tecidos',
-    '84518000': 'Outras máquinas e aparelhos para trabalhar matérias têxteis',
-    '84519010': 'Partes de máquinas e aparelhos para trabalhar matérias têxteis',
-    '84519090': 'Partes de máquinas e aparelhos para trabalhar matérias têxteis',
-    '84521000': 'Máquinas de costura de uso da espécie doméstica',
-    '84522110': 'Outras máquinas de costura, unidades automáticas',
-    '84522120': 'Outras máquinas de costura, unidades automáticas',
-    '84522190': 'Outras máquinas de costura, unidades automáticas',
-    '84522910': 'Outras máquinas de costura, não automáticas',
-    '84522921': 'Outras máquinas de costura, não automáticas',
-    '84522922': 'Outras máquinas de costura, não automáticas',
-    '84522923': 'Outras máquinas de costura, não automáticas',
-    '84522924': 'Outras máquinas de costura, não automáticas',
-    '84522925': 'Outras máquinas de costura, não automáticas',
-    '84522929': 'Outras máquinas de costura, não automáticas',
-    '84522990': 'Outras máquinas de costura, não automáticas',
-    '84523000': 'Agulhas para máquinas de costura',
-    '84529020': 'Outras partes de máquinas de costura',
-    '84529081': 'Outras partes de máquinas de costura',
-    '84529089': 'Outras partes de máquinas de costura',
-    '84529091': 'Outras partes de máquinas de costura',
-    '84529093': 'Outras partes de máquinas de costura',
-    '84529099': 'Outras partes de máquinas de costura',
-    '84531010': 'Máquinas e aparelhos para preparar, curtir ou trabalhar couros ou peles',
-    '84531090': 'Máquinas e aparelhos para preparar, curtir ou trabalhar couros ou peles',
-    '84532000': 'Máquinas e aparelhos para fabricar ou consertar calçados',
-    '84538000': 'Outras máquinas e aparelhos para fabricar ou consertar outras obras de couros ou pele',
-    '84539000': 'Partes de máquinas e aparelhos para preparar, curtir ou trabalhar couros ou peles ou para fabricar ou consertar calçados e outras obras de couro ou peles',
-    '84541000': 'Conversores para metalurgia, aciaria ou fundição',
-    '84542010': 'Lingoteiras e cadinhos ou colheres de fundição',
-    '84542090': 'Lingoteiras e cadinhos ou colheres de fundição',
-    '84543010': 'Máquinas de vazar (moldar), para metalurgia, aciaria ou fundição',
-    '84543020': 'Máquinas de vazar (moldar), para metalurgia, aciaria ou fundição',
-    '84543090': 'Máquinas de vazar (moldar), para metalurgia, aciaria ou fundição',
-    '84549010': 'Partes de conversores, lingoteiras e máquinas de vazar, para metalurgia, aciaria ou fundição',
-    '84549090': 'Partes de conversores, lingoteiras e máquinas de vazar, para metalurgia, aciaria ou fundição',
-    '84551000': 'Laminadores de tubos metálicos',
-    '84552110': 'Outros laminadores a quente e laminadores a quente e a frio, de metais',
-    '84552190': 'Outros laminadores a quente e laminadores a quente e a frio, de metais',
-    '84552210': 'Laminadores a frio, de metais',
-    '84552290': 'Laminadores a frio, de metais',
-    '84553010': 'Cilindros de laminadores, de metais',
-    '84553020': 'Cilindros de laminadores, de metais',
-    '84553090': 'Cilindros de laminadores, de metais',
-    '84559000': 'Outras partes de laminadores de metais',
-    '84561111': 'Máquinas-ferramentas que trabalhem por eliminação de qualquer matéria, que operem por laser',
-    '84561119': 'Máquinas-ferramentas que trabalhem por eliminação de qualquer matéria, que operem por laser',
-    '84561190': 'Máquinas-ferramentas que trabalhem por eliminação de qualquer matéria, que operem por laser',
-    '84561211': 'Máquinas-ferramentas que trabalhem por eliminação de qualquer matéria, que operem por outro feixe de luz ou de fótons',
-    '84561290': 'Máquinas-ferramentas que trabalhem por eliminação de qualquer matéria, que operem por outro feixe de luz ou de fótons',
-    '84562010': 'Máquinas-ferramentas operando por ultra-som',
-    '84562090': 'Máquinas-ferramentas operando por ultra-som',
-    '84563019': 'Máquinas-ferramentas operando por eletro-erosão',
-    '84563090': 'Máquinas-ferramentas operando por eletro-erosão',
-    '84564000': 'Máquinas-ferramentas que trabalhem por eliminação de qualquer matéria, que operem por jato de plasma',
-    '84565000': 'Máquinas de corte a jato de água',
-    '84569000': 'Outras máquinas-ferramenta que trabalhem por eliminação de qualquer matéria, operando por processos eletroquímicos, feixes de elétrons, feixes iônicos ou por jato de plasma',
-    '84571000': 'Centros de usinagem, para trabalhar metais',
-    '84572090': 'Máquinas de sistema monostático, para trabalhar metais',
-    '84573010': 'Máquinas de estações múltiplas, para trabalhar metais',
-    '84573090': 'Máquinas de estações múltiplas, para trabalhar metais',
-    '84581110': 'Tornos horizontais, de comando numérico, para trabalhar metais',
-    '84581191': 'Tornos horizontais, de comando numérico, para trabalhar metais',
-    '84581199': 'Tornos horizontais, de comando numérico, para trabalhar metais',
-    '84581990': 'Outros tornos horizontais, sem comando numérico, para trabalhar metais',
-    '84589100': 'Outros tornos, de comando numérico, para trabalhar metais',
-    '84589900': 'Outros tornos, sem comando numérico, para trabalhar metais',
-    '84591000': 'Máquinas-ferramentas para furar, mandrilar, fresar ou roscar metais, unidades com cabeça deslizante',
-    '84592110': 'Outras máquinas para furar metais, de comando numérico',
-    '84592191': 'Outras máquinas para furar metais, de comando numérico',
-    '84592199': 'Outras máquinas para furar metais, de comando numérico',
-    '84592900': 'Outras máquinas-ferramentas para furar metais',
-    '84593100': 'Outras mandriladoras-fresadoras de metais, de comando numérico',
-    '84593900': 'Outras mandriladoras-fresadoras de metais, sem comando numérico',
-    '84594100': 'Outras máquinas para mandrilar (escarear), de comando numérico',
-    '84594900': 'Outras máquinas para mandrilar (escarear)',
-    '84595100': 'Máquinas-ferramentas para fresar metais, de console, de comando numérico',
-    '84595900': 'Outras máquinas-ferramentas para fresar metais, de console, sem comando numérico',
-    '84596100': 'Máquinas-ferramentas para fresar metais, sem console, de comando numérico',
-    '84596900': 'Outras máquinas-ferramentas para fresar metais, sem console, sem comando numérico',
-    '84597000': 'Outras máquinas-ferramentas para roscar interior ou exteriormente metais',
-    '84601900': 'Outras máquinas-ferramentas para retificar superfícies planas de metais, cujo posicionamento pode ser estabelecido com precisão de pelo menos 0,01 mm',
-    '84602200': 'Máquinas para retificar sem centro, de comando numérico',
-    '84602300': 'Outras máquinas para retificar superfícies cilíndricas, de comando numérico',
-    '84602400': 'Outras máquinas para retificar, de comando numérico',
-    '84602900': 'Outras máquinas-ferramentas para retificar metais ou ceramais, cujo posicionamento pode ser estabelecido com precisão de pelo menos 0,01 mm',
-    '84603100': 'Máquinas-ferramentas para afiar metais ou ceramais, de comando numérico',
-    '84603900': 'Outras máquinas-ferramentas para afiar metais ou ceramais',
-    '84604011': 'Máquinas-ferramentas para brunir metais ou ceramais',
-    '84604019': 'Máquinas-ferramentas para brunir metais ou ceramais',
-    '84604091': 'Máquinas-ferramentas para brunir metais ou ceramais',
-    '84604099': 'Máquinas-ferramentas para brunir metais ou ceramais',
-    '84609011': 'Outras máquinas-ferramentas para amolar, polir ou realizar outros acabamentos em metais ou ceramais',
-    '84609012': 'Outras máquinas-ferramentas para amolar, polir ou realizar outros acabamentos em metais ou ceramais',
-    '84609019': 'Outras máquinas-ferramentas para amolar, polir ou realizar outros acabamentos em metais ou ceramais',
-    '84609090': 'Outras máquinas-ferramentas para amolar, polir ou realizar outros acabamentos em metais ou ceramais',
-    '84612090': 'Plainas-limadoras e máquinas para escatelar',
-    '84613010': 'Máquinas-ferramentas para brochar',
-    '84613090': 'Máquinas-ferramentas para brochar',
-    '84614010': 'Máquinas-ferramentas para cortar ou acabar engrenagens',
-    '84614099': 'Máquinas-ferramentas para cortar ou acabar engrenagens',
-    '84615010': 'Máquinas-ferramentas para serrar ou seccionar metais',
-    '84615020': 'Máquinas-ferramentas para serrar ou seccionar metais',
-    '84615090': 'Máquinas-ferramentas para serrar ou seccionar metais',
-    '84619010': 'Outras máquinas-ferramentas que operem por eliminação de metal ou de ceramais',
-    '84619090': 'Outras máquinas-ferramentas que operem por eliminação de metal ou de ceramais',
-    '84621011': 'Máquinas-ferramentas (incluídas as prensas) para forjar ou estampar, martelos, martelos-pilões e martinetes',
-    '84621019': 'Máquinas-ferramentas (incluídas as prensas) para forjar ou estampar, martelos, martelos-pilões e martinetes',
-    '84621090': 'Máquinas-ferramentas (incluídas as prensas) para forjar ou estampar, martelos, martelos-pilões e martinetes',
-    '84621100': 'Máquinas de forjamento em matriz fechada',
-    '84621900': 'Outras máquinas-ferramentas (incluindo prensas) para trabalhar metais forjando, martelando ou forjando (excluindo laminadores), não classificadas nos códigos anteriores',
-    '84622100': 'Máquinas-ferramentas (incluídas as prensas) para enrolar, arquear, dobrar, endireitar ou aplanar metais, de comando numérico',
-    '84622200': 'Máquinas formadoras de perfis para trabalhar metais',
-    '84622300': 'Freios de prensa controlados numericamente para trabalhar metal',
-    '84622500': 'Máquinas formadoras de rolos de controle numérico para trabalhar metais',
-    '84622600': 'Outras máquinas de dobrar, endireitar ou aplanar, controladas numericamente, para trabalhar metais',
-    '84622900': 'Outras máquinas-ferramentas (incluindo as prensas) para enrolar, arquear, dobrar, endireitar ou aplanar metais',
-    '84623100': 'Máquinas-ferramentas (incluídas as prensas) para cisalhar metais, de comando numérico',
-    '84623200': 'Linhas de corte em tiras, linhas de corte em comprimento para produtos planos, para trabalhar metais',
-    '84623300': 'Máquinas de cisalhamento controladas numericamente, para trabalhar metais',
-    '84623900': 'Outras máquinas-ferramentas (incluídas as prensas) para cisalhar metais',
-    '84623910': 'Outras máquinas-ferramentas (incluídas as prensas) para cisalhar metais',
-    '84623990': 'Outras máquinas-ferramentas (incluídas as prensas) para cisalhar metais',
-    '84624100': 'Máquinas-ferramentas (incluídas as prensas) para puncionar ou chanfrar metais, de comando numérico',
-    '84624200': 'Máquinas de puncionar, entalhar ou mordiscar com controle numérico (excluindo prensas) para produtos planos, incluindo máquinas combinadas de puncionar e cisalhar',
-    '84624900': 'Outras máquinas-ferramentas (incluídas as prensas) para puncionar ou chanfrar metais',
-    '84625100': 'Máquinas controladas numericamente para trabalhar tubo, seção oca e barra (excluindo prensas)',
-    '84625900': 'Outras máquinas para trabalhar tubo, seção oca e barra (excluindo prensas), não classificadas nos códigos anteriores',
-    '84626100': 'Prensas hidráulicas para o trabalho a frio de metais',
-    '84626200': 'Prensas mecânicas para o trabalho a frio de metais',
-    '84626300': 'Servo-prensas para o trabalho a frio do metal',
-    '84626900': 'Outras prensas para trabalhar metais a frio, não classificadas nos códigos anteriores',
-    '84629000': 'Outras máquinas-ferramentas (incluindo prensas) para trabalhar metal, forjando, martelando ou forjando (excluindo laminadores); outras máquinas-ferramentas (incluindo prensas, linhas de corte e linhas de corte em comprimento) para trabalhar metal dobrando, dobrando, endireitando, achatando, cisalhando, perfurando, entalhando ou mordiscando (excluindo bancos de estiramento); outras prensas para trabalhar metal ou carbonetos metálicos, não especificadas acima; não classificadas nos códigos anteriores',
-    '84629111': 'Prensas hidráulicas, para trabalhar metais',
-    '84629119': 'Prensas hidráulicas, para trabalhar metais',
-    '84629199': 'Prensas hidráulicas, para trabalhar metais',
-    '84629910': 'Outras prensas para trabalhar metais ou carbonetos metálicos',
-    '84629920': 'Outras prensas para trabalhar metais ou carbonetos metálicos',
-    '84629990': 'Outras prensas para trabalhar metais ou carbonetos metálicos',
-    '84631010': 'Bancas para estirar barras, perfis, fios ou semelhantes',
-    '84631090': 'Bancas para estirar barras, perfis, fios ou semelhantes',
-    '84632091': 'Máquinas-ferramentas para fazer roscas internas ou externas por laminagem',
-    '84632099': 'Máquinas-ferramentas para fazer roscas internas ou externas por laminagem',
-    '84633000': 'Máquinas-ferramentas para trabalhar arames e fios de metal',
-    '84639010': 'Outras máquinas-ferramentas para trabalhar metais ou ceramais, sem eliminação de matérias',
-    '84639090': 'Outras máquinas-ferramentas para trabalhar metais ou ceramais, sem eliminação de matérias',
-    '84641000': 'Máquinas-ferramentas para serrar pedra, produtos cerâmicos, concreto ou matérias minerais semelhantes, inclusive trabalho a frio do vidro',
-    '84642010': 'Máquinas-ferramentas para esmerar ou polir pedra, produtos cerâmicos, concreto ou matérias minerais semelhantes, inclusive trabalho a frio do vidro',
-    '84642021': 'Máquinas-ferramentas para esmerar ou polir pedra, produtos cerâmicos, concreto ou matérias minerais semelhantes, inclusive trabalho a frio do vidro',
-    '84642029': 'Máquinas-ferramentas para esmerar ou polir pedra, produtos cerâmicos, concreto ou matérias minerais semelhantes, inclusive trabalho a frio do vidro',
-    '84642090': 'Máquinas-ferramentas para esmerar ou polir pedra, produtos cerâmicos, concreto ou matérias minerais semelhantes, inclusive trabalho a frio do vidro',
-    '84649011': 'Outras máquinas-ferramentas para trabalhar pedra, produtos cerâmicos, concreto ou matérias minerais semelhantes',
-    '84649019': 'Outras máquinas-ferramentas para trabalhar pedra, produtos cerâmicos, concreto ou matérias minerais semelhantes',
-    '84649090': 'Outras máquinas-ferramentas para trabalhar pedra, produtos cerâmicos, concreto ou matérias minerais semelhantes',
-    '84651000': 'Máquinas-ferramentas para trabalhar madeira, cortiça, plásticos duros e semelhantes, capazes de realizar diferentes tipos de operações sem troca de ferramentas',
-    '84652000': 'Centros de usinagem (fabricação)',
-    '84659110': 'Outras máquinas-ferramentas de serrar madeira, cortiça, osso, borracha endurecida ou matérias duras semelhantes',
-    '84659120': 'Outras máquinas-ferramentas de serrar madeira, cortiça, osso, borracha endurecida ou matérias duras semelhantes',
-    '84659190': 'Outras máquinas-ferramentas de serrar madeira, cortiça, osso, borracha endurecida ou matérias duras semelhantes',
-    '84659211': 'Máquinas-ferramentas para desbastar ou aplainar; máquinas para fresar ou moldurar madeira, plásticos duros ou matérias duras semelhantes',
-    '84659219': 'Máquinas-ferramentas para desbastar ou aplainar; máquinas para fresar ou moldurar madeira, plásticos duros ou matérias duras semelhantes',
-    '84659290': 'Máquinas-ferramentas para desbastar ou aplainar; máquinas para fresar ou moldurar madeira, plásticos duros ou matérias duras semelhantes',
-    '84659310': 'Máquinas para esmerilar, lixar ou polir madeira, plásticos duros ou matérias duras semelhantes',
-    '84659390': 'Máquinas para esmerilar, lixar ou polir madeira, plásticos duros ou matérias duras semelhantes',
-    '84659400': 'Máquinas-ferramentas para arquear ou reunir madeira, plásticos duros ou matérias duras semelhantes',
-    '84659511': 'Máquinas-ferramentas para furar ou escatelar madeira, plásticos duros ou matérias duras semelhantes',
-    '84659591': 'Máquinas-ferramentas para furar ou escatelar madeira, plásticos duros ou matérias duras semelhantes',
-    '84659600': 'Máquinas-ferramentas para fender, seccionar ou desenrolar madeira, cortiça, plásticos duros ou matérias semelhantes',
-    '84659900': 'Outras máquinas-ferramentas para trabalhar madeira, cortiça, osso, plásticos duros e matérias duras semelhantes',
-    '84661000': 'Porta-ferramentas e fieiras de abertura automática',
-    '84662010': 'Porta-peças para outras máquinas-ferramentas',
-    '84662090': 'Porta-peças para outras máquinas-ferramentas',
-    '84663000': 'Dispositivos divisores e outros especiais, para máquinas-ferramentas',
-    '84669100': 'Partes e acessórios de máquinas-ferramentas da posição 8464',
-    '84669200': 'Partes e acessórios de máquinas-ferramentas da posição 8465',
-    '84669311': 'Partes e acessórios de máquinas-ferramentas das posições 8456 a 8461',
-    '84669319': 'Partes e acessórios de máquinas-ferramentas das posições 8456 a 8461',
-    '84669320': 'Partes e acessórios de máquinas-ferramentas das posições 8456 a 8461',
-    '84669330': 'Partes e acessórios de máquinas-ferramentas das posições 8456 a 8461',
-    '84669340': 'Partes e acessórios de máquinas-ferramentas das posições 8456 a 8461',
-    '84669350': 'Partes e acessórios de máquinas-ferramentas das posições 8456 a 8461',
-    '84669360': 'Partes e acessórios de máquinas-ferramentas das posições 8456 a 8461',
-    '84669410': 'Partes e acessórios de máquinas-ferramentas da posições 8462 ou 8463',
-    '84669420': 'Partes e acessórios de máquinas-ferramentas da posições 8462 ou 8463',
-    '84669430': 'Partes e acessórios de máquinas-ferramentas da posições 8462 ou 8463',
-    '84669490': 'Partes e acessórios de máquinas-ferramentas da posições 8462 ou 8463',
-    '84671110': 'Ferramentas pneumáticas rotativas, de uso manual',
-    '84671190': 'Ferramentas pneumáticas rotativas, de uso manual',
-    '84671900': 'Outras ferramentas pneumáticas, de uso manual',
-    '84672100': 'Furadeiras de todos os tipos, incluídas as perfuratrizes rotativas, com motor elétrico incorporado, de uso manual',
-    '84672200': 'Serras, com motor elétrico incorporado, de uso manual',
-    '84672910': 'Tesouras, cortadoras de tecidos, parafusadeiras, rosqueadeiras, martelos e outras ferramentas, com motor elétrico incorporado, de uso manual',
-    '84672991': 'Tesouras, cortadoras de tecidos, parafusadeiras, rosqueadeiras, martelos e outras ferramentas, com motor elétrico incorporado, de uso manual',
-    '84672992': 'Tesouras, cortadoras de tecidos, parafusadeiras, rosqueadeiras, martelos e outras ferramentas, com motor elétrico incorporado, de uso manual',
-    '84672993': 'Tesouras, cortadoras de tecidos, parafusadeiras, rosqueadeiras, martelos e outras ferramentas, com motor elétrico incorporado, de uso manual',
-    '84672999': 'Tesouras, cortadoras de tecidos, parafusadeiras, rosqueadeiras, martelos e outras ferramentas, com motor elétrico incorporado, de uso manual',
-    '84678100': 'Serras de corrente, hidráulicas o de motor não elétrico, de uso manual',
-    '84678900': 'Outras ferramentas hidráulicas ou de motor não elétrico, de uso manual',
-    '84679100': 'Partes de serras de corrente, de uso manual',
-    '84679200': 'Partes de ferramentas pneumáticas, de uso manual',
-    '84679900': 'Outras partes de ferramentas hidráulicas ou de motor não elétrico, de uso manual',
-    '84681000': 'Maçaricos de uso manual',
-    '84682000': 'Outras máquinas e aparelhos a gás, para têmpera superficial',
-    '84688010': 'Outras máquinas e aparelhos para soldar',
-    '84688090': 'Outras máquinas e aparelhos para soldar',
-    '84689010': 'Partes de máquinas e aparelhos para soldar e de máquinas e aparelhos a gás para têmpera superficial',
-    '84689020': 'Partes de máquinas e aparelhos para soldar e de máquinas e aparelhos a gás para têmpera superficial',
-    '84689090': 'Partes de máquinas e aparelhos para soldar e de máquinas e aparelhos a gás para têmpera superficial',
-    '84701000': 'Calculadoras eletrônicas com funcionamento sem fonte externa de energia elétrica e máquinas de bolso com função de cálculo que permitam gravar, reproduzir e visualizar informações',
-    '84702100': 'Máquinas de calcular, eletrônicas, com dispositivo impressor incorporado',
-    '84702900': 'Outras máquinas de calcular, eletrônicas',
-    '84703000': 'Outras máquinas de calcular',
-    '84705010': 'Caixas registradoras',
-    '84705011': 'Caixas registradoras',
-    '84705019': 'Caixas registradoras',
-    '84705090': 'Caixas registradoras',
-    '84709090': 'Máquinas de contabilidade, máquinas de franquear, emitir bilhetes e máquinas semelhantes, com dispositivo de cálculo incorporado',
-    '84713011': 'Máquinas automáticas para processamento de dados, portáteis, de peso <= 10 kg, contendo pelo menos uma unidade central de processamento, um teclado e uma tela - computadores',
-    '84713012': 'Máquinas automáticas para processamento de dados, portáteis, de peso <= 10 kg, contendo pelo menos uma unidade central de processamento, um teclado e uma tela - computadores',
-    '84713019': 'Máquinas automáticas para processamento de dados, portáteis, de peso <= 10 kg, contendo pelo menos uma unidade central de processamento, um teclado e uma tela - computadores',
-    '84713090': 'Máquinas automáticas para processamento de dados, portáteis, de peso <= 10 kg, contendo pelo menos uma unidade central de processamento, um teclado e uma tela - computadores',
-    '84714100': 'Outras máquinas automáticas para processamento de dados, contendo, no mesmo corpo, pelo menos uma unidade central de processamento e, mesmo combinadas, uma unidade de entrada e uma unidade de saída - computadores',
-    '84714110': 'Outras máquinas automáticas para processamento de dados, contendo, no mesmo corpo, pelo menos uma unidade central de processamento e, mesmo combinadas, uma unidade de entrada e uma unidade de saída - computadores',
-    '84714190': 'Outras máquinas automáticas para processamento de dados, contendo, no mesmo corpo, pelo menos uma unidade central de processamento e, mesmo combinadas, uma unidade de entrada e uma unidade de saída - computadores',
-    '84714900': 'Outras máquinas automáticas para processamento de dados, apresentadas sob a forma de sistemas - computadores',
-    '84715010': 'Unidades de processamento (exceto as das subposições 8471.41 ou 8471.49), podendo conter, no mesmo corpo, um ou dois dos seguintes tipos de unidades: de memória, de entrada e de saída',
-    '84715020': 'Unidades de processamento (exceto as das subposições 8471.41 ou 8471.49), podendo conter, no mesmo corpo, um ou dois dos seguintes tipos de unidades: de memória, de entrada e de saída',
-    '84715030': 'Unidades de processamento (exceto as das subposições 8471.41 ou 8471.49), podendo conter, no mesmo corpo, um ou dois dos seguintes tipos de unidades: de memória, de entrada e de saída',
-    '84715040': 'Unidades de processamento (exceto as das subposições 8471.41 ou 8471.49), podendo conter, no mesmo corpo, um ou dois dos seguintes tipos de unidades: de memória, de entrada e de saída',
-    '84715090': 'Unidades de processamento (exceto as das subposições 8471.41 ou 8471.49), podendo conter, no mesmo corpo, um ou dois dos seguintes tipos de unidades: de memória, de entrada e de saída',
-    '84716052': 'Unidades de entrada ou de saída, podendo conter, no mesmo corpo, unidades de memória',
-    '84716053': 'Unidades de entrada ou de saída, podendo conter, no mesmo corpo, unidades de memória',
-    '84716054': 'Unidades de entrada ou de saída, podendo conter, no mesmo corpo, unidades de memória',
-    '84716059': 'Unidades de entrada ou de saída, podendo conter, no mesmo corpo, unidades de memória',
-    '84716061': 'Unidades de entrada ou de saída, podendo conter, no mesmo corpo, unidades de memória',
-    '84716062': 'Unidades de entrada ou de saída, podendo conter, no mesmo corpo, unidades de memória',
-    '84716080': 'Unidades de entrada ou de saída, podendo conter, no mesmo corpo, unidades de memória',
-    '84716090': 'Unidades de entrada ou de saída, podendo conter, no mesmo corpo, unidades de memória',
-    '84717010': 'Unidades de memória',
-    '84717011': 'Unidades de memória',
-    '84717012': 'Unidades de memória',
-    '84717019': 'Unidades de memória',
-    '84717020': 'Unidades de memória',
-    '84717021': 'Unidades de memória',
-    '84717029': 'Unidades de memória',
-    '84717030': 'Unidades de memória',
-    '84717032': 'Unidades de memória',
-    '84717033': 'Unidades de memória',
-    '84717039': 'Unidades de memória',
-    '84717040': 'Unidades de memória',
-    '84717090': 'Unidades de memória',
-    '84718000': 'Outras unidades de máquinas automáticas para processamento de dados',
-    '84719011': 'Outras máquinas automáticas para processamento de dados e suas unidades',
-    '84719012': 'Outras máquinas automáticas para processamento de dados e suas unidades',
-    '84719013': 'Outras máquinas automáticas para processamento de dados e suas unidades',
-    '84719014': 'Outras máquinas automáticas para processamento de dados e suas unidades',
-    '84719019': 'Outras máquinas automáticas para processamento de dados e suas unidades',
-    '84719090': 'Outras máquinas automáticas para processamento de dados e suas unidades',
-    '84721000': 'Duplicadores hectográficos ou a estêncil, para escritório',
-    '84723010': 'Máquinas para selecionar, dobrar, abrir, fechar, envelopar ou cintar correspondência e máquinas para colar ou obliterar selos',
-    '84723090': 'Máquinas para selecionar, dobrar, abrir, fechar, envelopar ou cintar correspondência e máquinas para colar ou obliterar selos',
-    '84729010': 'Outras máquinas e aparelhos de escritório, máquinas para uso bancário e semelhantes',
-    '84729021': 'Outras máquinas e aparelhos de escritório, máquinas para uso bancário e semelhantes',
-    '84729029': 'Outras máquinas e aparelhos de escritório, máquinas para uso bancário e semelhantes',
-    '84729030': 'Outras máquinas e aparelhos de escritório, máquinas para uso bancário e semelhantes',
-    '84729040': 'Outras máquinas e aparelhos de escritório, máquinas para uso bancário e semelhantes',
-    '84729059': 'Outras máquinas e aparelhos de escritório, máquinas para uso bancário e semelhantes',
-    '84729099': 'Outras máquinas e aparelhos de escritório, máquinas para uso bancário e semelhantes',
-    '84732100': 'Partes e acessórios de máquinas de calculadoras eletrônicas das subposições 8470.10, 84.70.21 ou 8470.29',
-    '84732910': 'Outras partes e acessórios de máquinas da posição 8470',
-    '84732920': 'Outras partes e acessórios de máquinas da posição 8470',
-    '84732990': 'Outras partes e acessórios de máquinas da posição 8470',
-    '84733011': 'Partes e acessórios para máquinas automáticas de processamento de dados e outras máquinas da posição 8471',
-    '84733019': 'Partes e acessórios para máquinas automáticas de processamento de dados e outras máquinas da posição 8471',
-    '84733031': 'Partes e acessórios para máquinas automáticas de processamento de dados e outras máquinas da posição 8471',
-    '84733033': 'Partes e acessórios para máquinas automáticas de processamento de dados e outras máquinas da posição 8471',
-    '84733034': 'Partes e acessórios para máquinas automáticas de processamento de dados e outras máquinas da posição 8471',
-    '84733039': 'Partes e acessórios para máquinas automáticas de processamento de dados e outras máquinas da posição 8471',
-    '84733041': 'Partes e acessórios para máquinas automáticas de processamento de dados e outras máquinas da posição 8471',
-    '84733042': 'Partes e acessórios para máquinas automáticas de processamento de dados e outras máquinas da posição 8471',
-    '84733043': 'Partes e acessórios para máquinas automáticas de processamento de dados e outras máquinas da posição 8471',
-    '84733049': 'Partes e acessórios para máquinas automáticas de processamento de dados e outras máquinas da posição 8471',
-    '84733090': 'Partes e acessórios para máquinas automáticas de processamento de dados e outras máquinas da posição 8471',
-    '84733092': 'Partes e acessórios para máquinas automáticas de processamento de dados e outras máquinas da posição 8471',
-    '84733099': 'Partes e acessórios para máquinas automáticas de processamento de dados e outras máquinas da posição 8471',
-    '84734010': 'Partes e acessórios para máquinas e aparelhos da posição 8472',
-    '84734070': 'Partes e acessórios para máquinas e aparelhos da posição 8472',
-    '84734090': 'Partes e acessórios para máquinas e aparelhos da posição 8472',
-    '84735010': 'Partes e acessórios que possam ser usados com as máquinas ou aparelhos de duas ou mais das posições 8469 a 8472',
-    '84735040': 'Partes e acessórios que possam ser usados com as máquinas ou aparelhos de duas ou mais das posições 8469 a 8472',
-    '84735050': 'Partes e acessórios que possam ser usados com as máquinas ou aparelhos de duas ou mais das posições 8469 a 8472',
-    '84735090': 'Partes e acessórios que possam ser usados com as máquinas ou aparelhos de duas ou mais das posições 8469 a 8472',
-    '84741000': 'Máquinas e aparelhos para selecionar, peneirar, separar ou lavar substâncias minerais sólidas',
-    '84742010': 'Máquinas e aparelhos para esmagar, moer ou pulverizar substâncias minerais sólidas',
-    '84742090': 'Máquinas e aparelhos para esmagar, moer ou pulverizar substâncias minerais sólidas',
-    '84743100': 'Betoneiras e aparelhos para amassar cimento',
-    '84743200': 'Máquinas para misturar matérias minerais com betume',
-    '84743900': 'Outras máquinas e aparelhos para misturar ou amassar substâncias minerais sólidas',
-    '84748010': 'Outras máquinas e aparelhos para aglomerar ou moldar combustíveis minerais sólidos, pastas cerâmicas, cimento ou gesso, em pó ou em pasta',
-    '84748090': 'Outras máquinas e aparelhos para aglomerar ou moldar combustíveis minerais sólidos, pastas cerâmicas, cimento ou gesso, em pó ou em pasta',
-    '84749000': 'Partes de máquinas e aparelhos da posição 8474',
-    '84751000': 'Máquinas para montagem de lâmpadas, tubos ou válvulas, elétricos ou eletrônicos, ou de lâmpadas de luz relâmpago (flash)',
-    '84752100': 'Máquinas para fabricação de fibras ópticas e seus esboços',
-    '84752910': 'Outras máquinas para fabricação ou trabalho a quente do vidro e suas obras',
-    '84752990': 'Outras máquinas para fabricação ou trabalho a quente do vidro e suas obras',
-    '84759000': 'Partes de máquinas para fabricação ou trabalho a quente de vidro e suas obras',
-    '84762100': 'Máquinas automáticas de venda de bebidas, com dispositivo de aquecimento ou de refrigeração incorporado',
-    '84762900': 'Máquinas automáticas de venda de bebidas, sem dispositivo de aquecimento ou de refrigeração incorporado',
-    '84768100': 'Máquinas automáticas de venda de produtos (por exemplo:alimentos), com dispositivo de aquecimento ou de refrigeração incorporado',
-    '84768990': 'Máquinas automáticas de venda de produtos (por exemplo: cigarros, selos), sem dispositivo de aquecimento ou de refrigeração incorporado, incluídas as máquinas de trocar dinheiro',
-    '84769000': 'Partes de máquinas automáticas de venda de produtos, incluídas as máquinas de trocar dinheiro',
-    '84771011': 'Máquinas de moldar borracha ou plásticos, por injeção',
-    '84771019': 'Máquinas de moldar borracha ou plásticos, por injeção',
-    '84771021': 'Máquinas de moldar borracha ou plásticos, por injeção',
-    '84771029': 'Máquinas de moldar borracha ou plásticos, por injeção',
-    '84771091': 'Máquinas de moldar borracha ou plásticos, por injeção',
-    '84771099': 'Máquinas de moldar borracha ou plásticos, por injeção',
-    '84772010': 'Extrusoras para borracha ou plástico',
-    '84772090': 'Extrusoras para borracha ou plástico',
-    '84773010': 'Máquinas de moldar borracha ou plásticos, por insuflação',
-    '84773090': 'Máquinas de moldar borracha ou plásticos, por insuflação',
-    '84774010': 'Máquinas de moldar borracha ou plásticos a vácuo, e outras máquinas de termoformar',
-    '84774090': 'Máquinas de moldar borracha ou plásticos a vácuo, e outras máquinas de termoformar',
-    '84775100': 'Máquinas e aparelhos para moldar ou recauchutar pneumáticos ou moldar câmaras-de-ar',
-    '84775911': 'Outras máquinas e aparelhos para moldar ou dar forma a borrachas ou plásticos',
-    '84775919': 'Outras máquinas e aparelhos para moldar ou dar forma a borrachas ou plásticos',
-    '84775990': 'Outras máquinas e aparelhos para moldar ou dar forma a borrachas ou plásticos',
-    '84778010': 'Outras máquinas e aparelhos para trabalhar borracha ou plásticos ou para fabricação de seus produtos',
-    '84778090': 'Outras máquinas e aparelhos para trabalhar borracha ou plásticos ou para fabricação de seus produtos',
-    '84779000': 'Partes de máquinas e aparelhos para trabalhar borracha ou plásticos ou para fabricação de seus produtos',
-    '84781010': 'Máquinas e aparelhos para preparar ou transformar fumo (tabaco)',
-    '84781090': 'Máquinas e aparelhos para preparar ou transformar fumo (tabaco)',
-    '84789000': 'Partes de máquinas e aparelhos para preparar ou transformar fumo (tabaco)',
-    '84791010': 'Máquinas e aparelhos para obras públicas, construção civil ou semelhantes',
-    '84791090': 'Máquinas e aparelhos para obras públicas, construção civil ou semelhantes',
-    '84792000': 'Máquinas e aparelhos para extração ou preparação de óleos ou gorduras vegetais fixos ou de óleos ou gorduras animais',
-    '84793000': 'Prensas para fabricação de painéis de partículas, de fibras de madeira ou matérias lenhosas, e outras máquinas e aparelhos para tratamento de madeira ou cortiça',
-    '84794000': 'Máquinas para fabricação de cordas ou cabos',
-    '84795000': 'Robôs industriais',
-    '84796000': 'Aparelhos de evaporação para arrefecimento do ar',
-    '84797900': 'Outras pontes de embarque',
-    '84798110': 'Máquinas e aparelhos para tratamento de metais, incluídas as bobinadoras para enrolamentos elétricos',
-    '84798190': 'Máquinas e aparelhos para tratamento de metais, incluídas as bobinadoras para enrolamentos elétricos',
-    '84798210': 'Máquinas e aparelhos para misturar, amassar, moer, separar, peneirar, homogeneizar, emulsionar ou agitar',
-    '84798290': 'Máquinas e aparelhos para misturar, amassar, moer, separar, peneirar, homogeneizar, emulsionar ou agitar',
-    '84798911': 'Outras máquinas e aparelhos mecânicos com função própria',
-    '84798912': 'Outras máquinas e aparelhos mecânicos com função própria',
-    '84798922': 'Outras máquinas e aparelhos mecânicos com função própria',
-    '84798931': 'Outras máquinas e aparelhos mecânicos com função própria',
-    '84798932': 'Outras máquinas e aparelhos mecânicos com função própria',
-    '84798940': 'Outras máquinas e aparelhos mecânicos com função própria',
-    '84798991': 'Outras máquinas e aparelhos mecânicos com função própria',
-    '84798992': 'Outras máquinas e aparelhos mecânicos com função própria',
-    '84798999': 'Outras máquinas e aparelhos mecânicos com função própria',
-    '84799010': 'Partes de máquinas e aparelhos mecânicos com função própria',
-    '84799090': 'Partes de máquinas e aparelhos mecânicos com função própria',
-    '84801000': 'Caixas de fundição',
-    '84802000': 'Placas de fundo para moldes',
-    '84803000': 'Modelos para moldes',
-    '84804100': 'Moldes para moldagem de metais ou carbonetos metálicos, por injeção ou compressão',
-    '84804910': 'Outros moldes para metais ou carbonetos metálicos',
-    '84804990': 'Outros moldes para metais ou carbonetos metálicos',
-    '84805000': 'Moldes para vidro',
-    '84806000': 'Moldes para matérias minerais',
-    '84807100': 'Moldes para moldagem de borracha ou plásticos, por injeção ou compressão',
-    '84807900': 'Outros moldes para borracha ou plásticos',
-    '84807910': 'Outros moldes para borracha ou plásticos',
-    '84807990': 'Outros moldes para borracha ou plásticos',
-    '84811000': 'Válvulas redutoras de pressão',
-    '84812011': 'Válvulas para transmissões óleo-hidráulicas ou pneumáticas',
-    '84812019': 'Válvulas para transmissões óleo-hidráulicas ou pneumáticas',
-    '84812090': 'Válvulas para transmissões óleo-hidráulicas ou pneumáticas',
-    '84813000': 'Válvulas de retenção',
-    '84814000': 'Válvulas de segurança ou de alívio',
-    '84818011': 'Torneiras e outros dispositivos semelhantes para canalizações, caldeiras, reservatórios, cubas e outros recipientes',
-    '84818019': 'Torneiras e outros dispositivos semelhantes para canalizações, caldeiras, reservatórios, cubas e outros recipientes',
-    '84818021': 'Torneiras e outros dispositivos semelhantes para canalizações, caldeiras, reservatórios, cubas e outros recipientes',
-    '84818029': 'Torneiras e outros dispositivos semelhantes para canalizações, caldeiras, reservatórios, cubas e outros recipientes',
-    '84818031': 'Torneiras e outros dispositivos semelhantes para canalizações, caldeiras, reservatórios, cubas e outros recipientes',
-    '84818039': 'Torneiras e outros dispositivos semelhantes para canalizações, caldeiras, reservatórios, cubas e outros recipientes',
-    '84818091': 'Torneiras e outros dispositivos semelhantes para canalizações, caldeiras, reservatórios, cubas e outros recipientes',
-    '84818092': 'Torneiras e outros dispositivos semelhantes para canalizações, caldeiras, reservatórios, cubas e outros recipientes',
-    '84818093': 'Torneiras e outros dispositivos semelhantes para canalizações, caldeiras, reservatórios, cubas e outros recipientes',
-    '84818094': 'Torneiras e outros dispositivos semelhantes para canalizações, caldeiras, reservatórios, cubas e outros recipientes',
-    '84818095': 'Torneiras e outros dispositivos semelhantes para canalizações, caldeiras, reservatórios, cubas e outros recipientes',
-    '84818096': 'Torneiras e outros dispositivos semelhantes para canalizações, caldeiras, reservatórios, cubas e outros recipientes',
-    '84818097': 'Torneiras e outros dispositivos semelhantes para canalizações, caldeiras, reservatórios, cubas e outros recipientes',
-    '84818099': 'Torneiras e outros dispositivos semelhantes para canalizações, caldeiras, reservatórios, cubas e outros recipientes',
-    '84819010': 'Partes de válvulas, torneiras e outros dispositivos semelhantes',
-    '84819090': 'Partes de válvulas, torneiras e outros dispositivos semelhantes',
-    '84821010': 'Rolamentos de esferas',
-    '84821090': 'Rolamentos de esferas',
-    '84822010': 'Rolamentos de roletes cônicos',
-    '84822090': 'Rolamentos de roletes cônicos',
-    '84823000': 'Rolamentos de roletes em forma de tonel',
-    '84824000': 'Rolamentos de agulhas',
-    '84825010': 'Rolamentos de roletes cilíndricos',
-    '84825090': 'Rolamentos de roletes cilíndricos',
-    '84828000': 'Outros rolamentos de roletes, incluídos os rolamentos combinados',
-    '84829111': 'Esferas, roletes e agulhas para rolamentos',
-    '84829119': 'Esferas, roletes e agulhas para rolamentos',
-    '84829120': 'Esferas, roletes e agulhas para rolamentos',
-    '84829130': 'Esferas, roletes e agulhas para rolamentos',
-    '84829190': 'Esferas, roletes e agulhas para rolamentos',
-    '84829910': 'Outras partes de rolamentos',
-    '84829990': 'Outras partes de rolamentos',
-    '84831011': 'Árvores (veios) de transmissão, incluídas as de excêntricos (cames) e virabrequins (cambotas) e manivelas',
-    '84831019': 'Árvores (veios) de transmissão, incluídas as de excêntricos (cames) e virabrequins (cambotas) e manivelas',
-    '84831020': 'Árvores (veios) de transmissão, incluídas as de excêntricos (cames) e virabrequins (cambotas) e manivelas',
-    '84831030': 'Árvores (veios) de transmissão, incluídas as de excêntricos (cames) e virabrequins (cambotas) e manivelas',
-    '84831040': 'Árvores (veios) de transmissão, incluídas as de excêntricos (cames) e virabrequins (cambotas) e manivelas',
-    '84831050': 'Árvores (veios) de transmissão, incluídas as de excêntricos (cames) e virabrequins (cambotas) e manivelas',
-    '84831090': 'Árvores (veios) de transmissão, incluídas as de excêntricos (cames) e virabrequins (cambotas) e manivelas',
-    '84832000': 'Mancais (chumaceiras) com rolamentos incorporados',
-    '84833010': 'Mancais (chumaceiras) sem rolamentos; bronzes',
-    '84833021': 'Mancais (chumaceiras) sem rolamentos; bronzes',
-    '84833029': 'Mancais (chumaceiras) sem rolamentos; bronzes',
-    '84833090': 'Mancais (chumaceiras) sem rolamentos; bronzes',
-    '84834010': 'Engrenagens e rodas de fricção, eixos de esferas ou de roletes; caixas de transmissão, redutores, multiplicadores e variadores de velocidade',
-    '84834090': 'Engrenagens e rodas de fricção, eixos de esferas ou de roletes; caixas de transmissão, redutores, multiplicadores e variadores de velocidade',
-    '84835010': 'Volantes e polias, incluídas as cadernais',
-    '84835090': 'Volantes e polias, incluídas as cadernais',
-    '84836011': 'Embreagens e dispositivos de acoplamento, incluídas as juntas de articulação',
-    '84836019': 'Embreagens e dispositivos de acoplamento, incluídas as juntas de articulação',
-    '84836090': 'Embreagens e dispositivos de acoplamento, incluídas as juntas de articulação',
-    '84839000': 'Rodas dentadas e outros órgãos elementares de transmissão apresentados separadamente; partes de produtos da posição 8483',
-    '84841000': 'Juntas metaloplásticas',
-    '84842000': 'Juntas de vedação, mecânicas',
-    '84849000': 'Jogos ou sortidos de juntas de composições diferentes, apresentados em bolsas, envelopes ou embalagens semelhantes',
-    '84852000': 'Máquinas para fabricação de aditivos, por plástico ou depósito de borracha',
-    '84853000': 'Máquinas para fabricação aditiva, por depósito de gesso, cimento, cerâmica ou vidro',
-    '84858000': 'Outras máquinas para a fabricação de aditivos, não classificadas nos códigos anteriores',
-    '84859000': 'Partes de outras máquinas ou aparelhos sem conexões elétricas, etc',
-    '84861000': 'Máquinas e aparelhos para fabricação de esferas (boules) ou de plaquetas (wafers)',
-    '84862000': 'Máquinas e aparelhos para fabricação de dispositivos semicondutores ou de circuitos integrados eletrônicos',
-    '84863000': 'Máquinas e aparelhos para fabricação de dispositivos de visualização de tela plana',
-    '84864000': 'Outras máquinas e aparelhos especificados na Nota 9 C do Capítulo 84',
-    '84869000': 'Partes e acessórios para máquinas e aparelhos das subposições 8486.10, 8486.20, 8486.30 e 8486.40',
-    '84871000': 'Hélices para embarcações e suas pás',
-    '84879000': 'Outras partes de máquinas e aparelhos, que não contenham conexão elétrica, bobinas, contatos, nem quaisquer outros elementos com características elétricas, não compreendidas em outras posições do Capítulo 84.',
-    '85011011': 'Motores elétricos de potência <= 37,5 W',
-    '85011019': 'Motores elétricos de potência <= 37,5 W',
-    '85011021': 'Motores elétricos de potência <= 37,5 W',
-    '85011029': 'Motores elétricos de potência <= 37,5 W',
-    '85011030': 'Motores elétricos de potência <= 37,5 W',
-    '85012000': 'Motores elétricos universais de potência > 37,5 W',
-    '85013110': 'Motores e geradores elétricos, de corrente contínua, de potência <= 750 W',
-    '85013120': 'Motores e geradores elétricos, de corrente contínua, de potência <= 750 W',
-    '85013210': 'Motores e geradores elétricos de corrente contínua, de potência > 750 W e <= 75 kW',
-    '85013220': 'Motores e geradores elétricos de corrente contínua, de potência > 750 W e <= 75 kW',
-    '85013310': 'Motores e geradores, elétricos, de corrente contínua, de potência > 75 kW e <= 375 kW',
-    '85013320': 'Motores e geradores, elétricos, de corrente contínua, de potência > 75 kW e <= 375 kW',
-    '85013411': 'Motores e geradores, elétricos de corrente contínua, de potência > 375 kW',
-    '85013419': 'Motores e geradores, elétricos de corrente contínua, de potência > 375 kW',
-    '85013420': 'Motores e geradores, elétricos de corrente contínua, de potência > 375 kW',
-    '85014011': 'Outros motores, elétricos, de corrente alternada, monofásicos',
-    '85014019': 'Outros motores, elétricos, de corrente alternada, monofásicos',
-    '85014021': 'Outros motores, elétricos, de corrente alternada, monofásicos',
-    '85014029': 'Outros motores, elétricos, de corrente alternada, monofásicos',
-    '85015110': 'Outros motores elétricos de corrente alternada, polifásicos, de potência <= 750 W',
-    '85015120': 'Outros motores elétricos de corrente alternada, polifásicos, de potência <= 750 W',
-    '85015190': 'Outros motores elétricos de corrente alternada, polifásicos, de potência <= 750 W',
-    '85015210': 'Outros motores elétricos de corrente alternada, polifásicos, de potência > 750 W e <= 75 kW',
-    '85015220': 'Outros motores elétricos de corrente alternada, polifásicos, de potência > 750 W e <= 75 kW',
-    '85015290': 'Outros motores elétricos de corrente alternada, polifásicos, de potência > 750 W e <= 75 kW',
-    '85015310': 'Outros motores elétricos de corrente alternada, polifásicos, de potência > 75 kW',
-    '85015320': 'Outros motores elétricos de corrente alternada, polifásicos, de potência > 75 kW',
-    '85015330': 'Outros motores elétricos de corrente alternada, polifásicos, de potência > 75 kW',
-    '85015390': 'Outros motores elétricos de corrente alternada, polifásicos, de potência > 75 kW',
-    '85016100': 'Geradores de corrente alternada, de potência <= 75 kVA',
-    '85016200': 'Geradores de corrente alternada, de potência > 75 kVA e <= 375 kVA',
-    '85016300': 'Geradores de corrente alternada, de potência > 375 kVA e <= 750 kVA',
-    '85016400': 'Geradores de corrente alternada, de potência > 750 kVA',
-    '85017100': 'Geradores fotovoltaicos CC de uma potência não superior a 50 W',
-    '85017210': 'Geradores fotovoltaicos CC de uma potência superior a 50 W',
-    '85017290': 'Geradores fotovoltaicos CC de uma potência superior a 50 W',
-    '85018000': 'Geradores de CA fotovoltaicos',
-    '85021110': 'Grupos eletrogêneos de motor de pistão, de ignição por compressão, de potência <= 75 kVA',
-    '85021190': 'Grupos eletrogêneos de motor de pistão, de ignição por compressão, de potência <= 75 kVA',
-    '85021210': 'Grupos eletrogêneos de motor de pistão, de ignição por compressão, de potência > 75 kVA e <= 375 kVA',
-    '85021290': 'Grupos eletrogêneos de motor de pistão, de ignição por compressão, de potência > 75 kVA e <= 375 kVA',
-    '85021311': 'Grupos eletrogêneos de motor de pistão, de ignição por compressão, de potência > 375 kVA',
-    '85021319': 'Grupos eletrogêneos de motor de pistão, de ignição por compressão, de potência > 375 kVA',
-    '85021390': 'Grupos eletrogêneos de motor de pistão, de ignição por compressão, de potência > 375 kVA',
-    '85022011': 'Grupos eletrogêneos de motor de pistão, de ignição por centelha (faísca) (motor de explosão)',
-    '85022019': 'Grupos eletrogêneos de motor de pistão, de ignição por centelha (faísca) (motor de explosão)',
-    '85022090': 'Grupos eletrogêneos de motor de pistão, de ignição por centelha (faísca) (motor de explosão)',
-    '85023100': 'Outros grupos eletrogêneos, de energia eólica',
-    '85023900': 'Outros grupos eletrogêneos',
-    '85024010': 'Conversores rotativos elétricos',
-    '85024090': 'Conversores rotativos elétricos',
-    '85030010': 'Partes reconhecíveis como destinadas às máquinas das posições 8501ou 8502',
-    '85030090': 'Partes reconhecíveis como destinadas às máquinas das posições 8501ou 8502',
-    '85041000': 'Reatores para lâmpadas ou tubos de descargas',
-    '85042100': 'Transformadores de dielétrico líquido, de potência <= 650 kVA',
-    '85042200': 'Transformadores de dielétrico líquido, de potência > 650 kVA e <= 10.000 kVA',
-    '85042300': 'Transformadores de dielétrico líquido, de potência > 10.000 kVA',
-    '85043111': 'Outros transformadores elétricos, de potência <= 1 kVA',
-    '85043119': 'Outros transformadores elétricos, de potência <= 1 kVA',
-    '85043191': 'Outros transformadores elétricos, de potência <= 1 kVA',
-    '85043192': 'Outros transformadores elétricos, de potência <= 1 kVA',
-    '85043193': 'Outros transformadores elétricos, de potência <= 1 kVA',
-    '85043199': 'Outros transformadores elétricos, de potência <= 1 kVA',
-    '85043211': 'Outros transformadores elétricos, de potência > 1 kVA e <= 16 kVA',
-    '85043219': 'Outros transformadores elétricos, de potência > 1 kVA e <= 16 kVA',
-    '85043221': 'Outros transformadores elétricos, de potência > 1 kVA e <= 16 kVA',
-    '85043229': 'Outros transformadores elétricos, de potência > 1 kVA e <= 16 kVA',
-    '85043300': 'Outros transformadores elétricos, de potência > 16 kVA e <= 500 kVA',
-    '85043400': 'Outros transformadores elétricos, de potência > 500 kVA',
-    '85044010': 'Conversores elétricos estáticos',
-    '85044021': 'Conversores elétricos estáticos',
-    '85044022': 'Conversores elétricos estáticos',
-    '85044029': 'Conversores elétricos estáticos',
-    '85044030': 'Conversores elétricos estáticos',
-    '85044040': 'Conversores elétricos estáticos',
-    '85044050': 'Conversores elétricos estáticos',
-    '85044060': 'Conversores elétricos estáticos',
-    '85044090': 'Conversores elétricos estáticos',
-    '85045000': 'Outras bobinas de reatância e de auto-indução',
-    '85045010': 'Outras bobinas de reatância e de auto-indução',
-    '85045090': 'Outras bobinas de reatância e de auto-indução',
-    '85049010': 'Partes de transformadores, conversores elétricos estáticos e bobinas de reatância e auto-indução',
-    '85049020': 'Partes de transformadores, conversores elétricos estáticos e bobinas de reatância e auto-indução',
-    '85049030': 'Partes de transformadores, conversores elétricos estáticos e bobinas de reatância e auto-indução',
-    '85049040': 'Partes de transformadores, conversores elétricos estáticos e bobinas de reatância e auto-indução',
-    '85049090': 'Partes de transformadores, conversores elétricos estáticos e bobinas de reatância e auto-indução',
-    '85051100': 'Ímãs permanentes de metal',
-    '85051910': 'Outros ímãs permanentes e artefatos destinados a tornarem-se ímãs permanentes',
-    '85051990': 'Outros ímãs permanentes e artefatos destinados a tornarem-se ímãs permanentes',
-    '85052010': 'Acoplamentos, embreagens, variadores de velocidade e freios (travões), eletromagnéticos',
-    '85052090': 'Acoplamentos, embreagens, variadores de velocidade e freios (travões), eletromagnéticos',
-    '85059010': 'Eletroímãs; placas, mandris e outros dispositivos semelhantes magnéticos ou eletromagnéticos de fixação; cabeças de elevação eletromagnéticas; suas partes',
-    '85059011': 'Eletroímãs; placas, mandris e outros dispositivos semelhantes magnéticos ou eletromagnéticos de fixação; cabeças de elevação eletromagnéticas; suas partes',
-    '85059019': 'Eletroímãs; placas, mandris e outros dispositivos semelhantes magnéticos ou eletromagnéticos de fixação; cabeças de elevação eletromagnéticas; suas partes',
-    '85059080': 'Eletroímãs; placas, mandris e outros dispositivos semelhantes magnéticos ou eletromagnéticos de fixação; cabeças de elevação eletromagnéticas; suas partes',
-    '85059090': 'Eletroímãs; placas, mandris e outros dispositivos semelhantes magnéticos ou eletromagnéticos de fixação; cabeças de elevação eletromagnéticas; suas partes',
-    '85061010': 'Pilhas e baterias de pilhas, elétricas, de dióxido de manganês',
-    '85061011': 'Pilhas e baterias de pilhas, elétricas, de dióxido de manganês',
-    '85061012': 'Pilhas e baterias de pilhas, elétricas, de dióxido de manganês',
-    '85061019': 'Pilhas e baterias de pilhas, elétricas, de dióxido de manganês',
-    '85061020': 'Pilhas e baterias de pilhas, elétricas, de dióxido de manganês',
-    '85061030': 'Pilhas e baterias de pilhas, elétricas, de dióxido de manganês',
-    '85061031': 'Pilhas e baterias de pilhas, elétricas, de dióxido de manganês',
-    '85061032': 'Pilhas e baterias de pilhas, elétricas, de dióxido de manganês',
-    '85061039': 'Pilhas e baterias de pilhas, elétricas, de dióxido de manganês',
-    '85063010': 'Pilhas e baterias elétricas, de óxido de mercúrio',
-    '85063090': 'Pilhas e baterias elétricas, de óxido de mercúrio',
-    '85064010': 'Pilhas e baterias elétricas, de óxido de prata',
-    '85064090': 'Pilhas e baterias elétricas, de óxido de prata',
-    '85065010': 'Pilhas e baterias elétricas, de lítio',
-    '85065090': 'Pilhas e baterias elétricas, de lítio',
-    '85066010': 'Pilhas e baterias elétricas, de ar-zinco',
-    '85066090': 'Pilhas e baterias elétricas, de ar-zinco',
-    '85068010': 'Outras pilhas e baterias, elétricas',
-    '85068090': 'Outras pilhas e baterias, elétricas',
-    '85069000': 'Partes de pilhas e baterias de pilhas, elétricas',
-    '85071010': 'Acumuladores elétricos, de chumbo, utilizados para arranque dos motores de pistão',
-    '85071090': 'Acumuladores elétricos, de chumbo, utilizados para arranque dos motores de pistão',
-    '85072010': 'Outros acumuladores elétricos, de chumbo',
-    '85072090': 'Outros acumuladores elétricos, de chumbo',
-    '85073011': 'Acumuladores elétricos, de níquel-cádmio',
-    '85073019': 'Acumuladores elétricos, de níquel-cádmio',
-    '85073090': 'Acumuladores elétricos, de níquel-cádmio',
-    '85074000': 'Acumuladores elétricos, de níquel-ferro',
-    '85075000': 'Acumuladores elétricos de niquel-hidreto metálico',
-    '85075010': 'Acumuladores elétricos de niquel-hidreto metálico',
-    '85075020': 'Acumuladores elétricos de niquel-hidreto metálico',
-    '85075090': 'Acumuladores elétricos de niquel-hidreto metálico',
-    '85076000': 'Acumuladores elétricos de ion de lítio',
-    '85078000': 'Outros acumuladores elétricos',
-    '85079010': 'Partes de acumuladores elétricos',
-    '85079020': 'Partes de acumuladores elétricos',
-    '85079090': 'Partes de acumuladores elétricos',
-    '85081100': 'Aspiradores de pó com motor elétrico incorporado, de potência não superior a 1.500W, e cujo volume de reservatório não exceda 20 litros',
-    '85081900': 'Outros aspiradores de pó com motor elétrico incorporado',
-    '85086000': 'Outros aspiradores',
-    '85087000': 'Partes de aspiradores',
-    '85094010': 'Trituradores e misturadores de alimentos; espremedores de frutas ou produtos hortícolas, de uso doméstico',
-    '85094020': 'Trituradores e misturadores de alimentos; espremedores de frutas ou produtos hortícolas, de uso doméstico',
-    '85094030': 'Trituradores e misturadores de alimentos; espremedores de frutas ou produtos hortícolas, de uso doméstico',
-    '85094040': 'Trituradores e misturadores de alimentos; espremedores de frutas ou produtos hortícolas, de uso doméstico',
-    '85094050': 'Trituradores e misturadores de alimentos; espremedores de frutas ou produtos hortícolas, de uso doméstico',
-    '85094090': 'Trituradores e misturadores de alimentos; espremedores de frutas ou produtos hortícolas, de uso doméstico',
-    '85098010': 'Outros aparelhos eletromecânicos, com motor elétrico incorporado, de uso doméstico',
-    '85098090': 'Outros aparelhos eletromecânicos, com motor elétrico incorporado, de uso doméstico',
-    '85099000': 'Partes de aparelhos eletromecânicos, com motor elétrico incorporado, de uso doméstico',
-    '85101000': 'Aparelhos ou máquinas de barbear, com motor elétrico',
-    '85102000': 'Máquinas de cortar o cabelo ou de tosquiar, com motor elétrico',
-    '85103000': 'Aparelhos de depilar, com motor elétrico',
-    '85109011': 'Partes de aparelhos ou máquinas de barbear, cortar cabelo ou tosquiar, depilar, de motor elétrico incorporado',
-    '85109019': 'Partes de aparelhos ou máquinas de barbear, cortar cabelo ou tosquiar, depilar, de motor elétrico incorporado',
-    '85109020': 'Partes de aparelhos ou máquinas de barbear, cortar cabelo ou tosquiar, depilar, de motor elétrico incorporado',
-    '85109090': 'Partes de aparelhos ou máquinas de barbear, cortar cabelo ou tosquiar, depilar, de motor elétrico incorporado',
-    '85111000': 'Velas de ignição para motores de ignição por centelha ou por compressão',
-    '85112010': 'Magnetos; dínamos-magnetos; volantes magnéticos, para motores de ignição por centelha ou por compressão',
-    '85112090': 'Magnetos; dínamos-magnetos; volantes magnéticos, para motores de ignição por centelha ou por compressão',
-    '85113010': 'Distribuidores e bobinas de ignição para motores de ignição por centelha ou por compressão',
-    '85113020': 'Distribuidores e bobinas de ignição para motores de ignição por centelha ou por compressão',
-    '85114000': 'Motores de arranque, mesmo funcionando como geradores, para motores de ignição por centelha ou por compressão',
-    '85115010': 'Outros geradores elétricos para motores de ignição por centelha ou por compressão',
-    '85115090': 'Outros geradores elétricos para motores de ignição por centelha ou por compressão',
-    '85118010': 'Outros aparelhos e dispositivos elétricos de ignição ou de arranque para motores de ignição por centelha ou por compressão',
-    '85118020': 'Outros aparelhos e dispositivos elétricos de ignição ou de arranque para motores de ignição por centelha ou por compressão',
-    '85118030': 'Outros aparelhos e dispositivos elétricos de ignição ou de arranque para motores de ignição por centelha ou por compressão',
-    '85118090': 'Outros aparelhos e dispositivos elétricos de ignição ou de arranque para motores de ignição por centelha ou por compressão',
-    '85119000': 'Partes de aparelhos e dispositivos elétricos de ignição ou de arranque da posição 8511',
-    '85121000': 'Aparelhos elétricos de iluminação ou sinalização visual utilizados em bicicletas',
-    '85122011': 'Outros aparelhos elétricos de sinalização visual para automóveis',
-    '85122019': 'Outros aparelhos elétricos de sinalização visual para automóveis',
-    '85122021': 'Outros aparelhos elétricos de sinalização visual para automóveis',
-    '85122022': 'Outros aparelhos elétricos de sinalização visual para automóveis',
-    '85122023': 'Outros aparelhos elétricos de sinalização visual para automóveis',
-    '85122029': 'Outros aparelhos elétricos de sinalização visual para automóveis',
-    '85123000': 'Aparelhos elétricos de sinalização acústica utilizados em ciclos e automóveis',
-    '85124010': 'Limpadores de pára-brisas, degeladores e desembaçadores para automóveis, elétricos',
-    '85124020': 'Limpadores de pára-brisas, degeladores e desembaçadores para automóveis, elétricos',
-    '85129000': 'Partes de aparelhos elétricos de iluminação ou de sinalização para ciclos e automóveis',
-    '85131010': 'Lanternas',
-    '85131090': 'Lanternas',
-    '85139000': 'Partes de lanternas elétricas portáteis',
-    '85141010': 'Fornos de resistência industriais ou de laboratório (de aquecimento indireto)',
-    '85141090': 'Fornos de resistência industriais ou de laboratório (de aquecimento indireto)',
-    '85141100': 'Prensas isostáticas quentes para uso industrial ou laboratorial',
-    '85141900': 'Outros fornos e fornos aquecidos por resistência para uso industrial ou laboratorial, não classificados nos códigos anteriores',
-    '85142011': 'Fornos elétricos industriais ou de laboratório, funcionando por indução ou por perdas dielétricas',
-    '85142019': 'Fornos elétricos industriais ou de laboratório, funcionando por indução ou por perdas dielétricas',
-    '85142020': 'Fornos elétricos industriais ou de laboratório, funcionando por indução ou por perdas dielétricas',
-    '85143011': 'Outros fornos elétricos industriais ou de laboratório',
-    '85143019': 'Outros fornos elétricos industriais ou de laboratório',
-    '85143021': 'Outros fornos elétricos industriais ou de laboratório',
-    '85143090': 'Outros fornos elétricos industriais ou de laboratório',
-    '85143200': 'Fornos de plasma e arco a vácuo para uso industrial ou laboratorial',
-    '85143900': 'Outros fornos e fornos para uso industrial ou laboratorial, não classificados nos códigos anteriores',
-    '85144000': 'Outros aparelhos industriais ou de laboratório para tratamento térmico de matérias, por indução ou por perdas dielétricas',
-    '85149000': 'Partes de fornos elétricos industriais ou de laboratório',
-    '85151100': 'Ferros e pistolas para soldadura',
-    '85151900': 'Outras máquinas e aparelhos para soldadura forte ou fraca',
-    '85152100': 'Máquinas e aparelhos para soldar metais por resistência, inteira ou parcialmente automáticos',
-    '85152900': 'Outras máquinas e aparelhos para soldar metais, por resistência',
-    '85153110': 'Máquinas e aparelhos para soldar metais por arco ou jato de plasma, inteira ou parcialmente automáticos',
-    '85153190': 'Máquinas e aparelhos para soldar metais por arco ou jato de plasma, inteira ou parcialmente automáticos',
-    '85153900': 'Outras máquinas e aparelhos para soldar metais por arco ou jato de plasma',
-    '85158010': 'Outras máquinas e aparelhos para soldar por outros processos, elétricos',
-    '85158090': 'Outras máquinas e aparelhos para soldar por outros processos, elétricos',
-    '85159000': 'Partes de máquinas e aparelhos para soldar ou para projeção a quente de metais ou ceramais, elétricos',
-    '85161000': 'Aquecedores elétricos de água, incluídos os de imersão',
-    '85162100': 'Radiadores de acumulação, elétricos, para aquecimento de ambientes',
-    '85162900': 'Outros aparelhos elétricos para aquecimento de ambientes, do solo ou para usos semelhantes',
-    '85163100': 'Secadores de cabelo, eletrotérmicos',
-    '85163200': 'Outros aparelhos eletrotérmicos para arranjos do cabelo',
-    '85163300': 'Aparelhos eletrotérmicos para secar as mãos',
-    '85164000': 'Ferros elétricos de passar',
-    '85165000': 'Fornos de microondas',
-    '85166000': 'Outros fornos; fogões de cozinha, fogareiros, grelhas e assadeiras, eletrotérmicos, de uso doméstico',
-    '85167100': 'Aparelhos eletrotérmicos para preparação de café ou de chá, de uso doméstico',
-    '85167200': 'Torradeiras de pão, eletrotérmicas, de uso doméstico',
-    '85167910': 'Outros aparelhos eletrotérmicos, de uso doméstico',
-    '85167920': 'Outros aparelhos eletrotérmicos, de uso doméstico',
-    '85167990': 'Outros aparelhos eletrotérmicos, de uso doméstico',
-    '85168010': 'Resistências de aquecimento',
-    '85168090': 'Resistências de aquecimento',
-    '85169000': 'Partes de aquecedores elétricos, aparelhos elétricos para aquecimento e outros aparelhos da posição 8516',
-    '85171100': 'Aparelhos telefônicos por fio com unidade auscultador-microfone sem fio',
-    '85171211': 'Telefones para redes celulares e para outras redes sem fio',
-    '85171212': 'Telefones para redes celulares e para outras redes sem fio',
-    '85171213': 'Telefones para redes celulares e para outras redes sem fio',
-    '85171219': 'Telefones para redes celulares e para outras redes sem fio',
-    '85171221': 'Telefones para redes celulares e para outras redes sem fio',
-    '85171229': 'Telefones para redes celulares e para outras redes sem fio',
-    '85171231': 'Telefones para redes celulares e para outras redes sem fio',
-    '85171232': 'Telefones para redes celulares e para outras redes sem fio',
-    '85171239': 'Telefones para redes celulares e para outras redes sem fio',
-    '85171241': 'Telefones para redes celulares e para outras redes sem fio',
-    '85171249': 'Telefones para redes celulares e para outras redes sem fio',
-    '85171290': 'Telefones para redes celulares e para outras redes sem fio',
-    '85171300': 'Smartphones',
-    '85171410': 'Outros telefones para redes celulares ou para outras redes sem fio',
-    '85171431': 'Outros telefones para redes celulares ou para outras redes sem fio',
-    '85171432': 'Outros telefones para redes celulares ou para outras redes sem fio',
-    '85171439': 'Outros telefones para redes celulares ou para outras redes sem fio',
-    '85171441': 'Outros telefones para redes celulares ou para outras redes sem fio',
-    '85171449': 'Outros telefones para redes celulares ou para outras redes sem fio',
-    '85171490': 'Outros telefones para redes celulares ou para outras redes sem fio',
-    '85171810': 'Outros aparelhos telefônicos',
-    '85171830': 'Outros aparelhos telefônicos',
-    '85171890': 'Outros aparelhos telefônicos',
-    '85171891': 'Outros aparelhos telefônicos',
-    '85171899': 'Outros aparelhos telefônicos',
-    '85176111': 'Estações base de telecomunicações para a transmissão ou recepção de voz, imagens ou outros dados',
-    '85176119': 'Estações base de telecomunicações para a transmissão ou recepção de voz, imagens ou outros dados',
-    '85176120': 'Estações base de telecomunicações para a transmissão ou recepção de voz, imagens ou outros dados',
-    '85176130': 'Estações base de telecomunicações para a transmissão ou recepção de voz, imagens ou outros dados',
-    '85176141': 'Estações base de telecomunicações para a transmissão ou recepção de voz, imagens ou outros dados',
-    '85176142': 'Estações base de telecomunicações para a transmissão ou recepção de voz, imagens ou outros dados',
-    '85176143': 'Estações base de telecomunicações para a transmissão ou recepção de voz, imagens ou outros dados',
-    '85176149': 'Estações base de telecomunicações para a transmissão ou recepção de voz, imagens ou outros dados',
-    '85176192': 'Estações base de telecomunicações para a transmissão ou recepção de voz, imagens ou outros dados',
-    '85176199': 'Estações base de telecomunicações para a transmissão ou recepção de voz, imagens ou outros dados',
-    '85176211': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176212': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176213': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176214': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176215': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176219': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176221': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176222': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176223': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176224': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176229': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176231': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176232': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176234': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176239': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176241': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176248': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176249': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176251': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176252': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176253': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176254': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176255': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176256': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176259': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176261': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176262': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176264': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176265': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176271': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176272': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176273': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176277': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176278': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176279': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176291': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176292': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176293': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176294': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176295': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176296': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176299': 'Aparelhos de recepção, conversão e transmissão ou regeneração de voz, imagens ou outros dados, incluindo os aparelhos de comutação e roteamento',
-    '85176900': 'Outros aparelhos para transmissão ou recepção de voz, imagem ou outros dados, incluidos os aparelhos de comunicação em rede local (LAN) ou em área estendida (WAN)',
-    '85177010': 'Partes de aparelhos telefônicos, telefones para redes celulares ou redes sem fio, aparelhos de  transmissão ou recepção de voz, imagens ou outros dados',
-    '85177021': 'Partes de aparelhos telefônicos, telefones para redes celulares ou redes sem fio, aparelhos de  transmissão ou recepção de voz, imagens ou outros dados',
-    '85177029': 'Partes de aparelhos telefônicos, telefones para redes celulares ou redes sem fio, aparelhos de  transmissão ou recepção de voz, imagens ou outros dados',
-    '85177091': 'Partes de aparelhos telefônicos, telefones para redes celulares ou redes sem fio, aparelhos de  transmissão ou recepção de voz, imagens ou outros dados',
-    '85177092': 'Partes de aparelhos telefônicos, telefones para redes celulares ou redes sem fio, aparelhos de  transmissão ou recepção de voz, imagens ou outros dados',
-    '85177099': 'Partes de aparelhos telefônicos, telefones para redes celulares ou redes sem fio, aparelhos de  transmissão ou recepção de voz, imagens ou outros dados',
-    '85177110': 'Antenas e refletores aéreos de todos os tipos; peças adequadas para uso com eles, para redes celulares ou para outras redes sem fio',
-    '85177190': 'Antenas e refletores aéreos de todos os tipos; peças adequadas para uso com eles, para redes celulares ou para outras redes sem fio',
-    '85177900': 'Outras partes de aparelhos telefônicos, incluindo os smartphones e outros telefones para redes celulares ou para outras redes sem fio; outros aparelhos para transmissão ou recepção de voz, imagens ou outros dados, incluindo os aparelhos para comunicação em redes com ou sem fio (como uma rede local ou de área ampla), exceto os aparelhos de transmissão ou recepção das posições 84.43, 85.25, 85.27 ou 85.28, não classificados nos códigos anteriores',
-    '85181010': 'Microfones e seus suportes',
-    '85181090': 'Microfones e seus suportes',
-    '85182100': 'Alto-falante único montado no seu próprio receptáculo',
-    '85182200': 'Alto-falantes múltiplos montados no mesmo receptáculo',
-    '85182910': 'Outros alto-falantes',
-    '85182990': 'Outros alto-falantes',
-    '85183000': 'Fones de ouvido (auscultadores), mesmo cobinados com microfone, e conjuntos ou sortidos constituídos por um microfone e um ou mais alto-falantes',
-    '85184000': 'Amplificadores elétricos de audiofreqüência',
-    '85185000': 'Aparelhos elétricos de amplificação de som',
-    '85189010': 'Partes de microfones, fones de ouvido, amplificadores, alto-falantes',
-    '85189090': 'Partes de microfones, fones de ouvido, amplificadores, alto-falantes',
-    '85192000': 'Aparelhos de gravação que funcionem por introdução de moedas, papel-moeda, cartões de banco, fichas ou por outros meios de pagamento',
-    '85193000': 'Toca-discos sem dispositivos de amplificação de som',
-    '85198110': 'Outros aparelhos de gravação de som que utilizem um suporte magnético, óptico ou de semicondutor',
-    '85198120': 'Outros aparelhos de gravação de som que utilizem um suporte magnético, óptico ou de semicondutor',
-    '85198190': 'Outros aparelhos de gravação de som que utilizem um suporte magnético, óptico ou de semicondutor',
-    '85198900': 'Outros aparelhos de gravação e de reprodução de som',
-    '85211010': 'Aparelhos videofônicos de gravação ou de reprodução, de fita magnética',
-    '85211081': 'Aparelhos videofônicos de gravação ou de reprodução, de fita magnética',
-    '85211089': 'Aparelhos videofônicos de gravação ou de reprodução, de fita magnética',
-    '85211090': 'Aparelhos videofônicos de gravação ou de reprodução, de fita magnética',
-    '85219000': 'Outros aparelhos videofônicos de gravação ou de reprodução',
-    '85219010': 'Outros aparelhos videofônicos de gravação ou de reprodução',
-    '85219090': 'Outros aparelhos videofônicos de gravação ou de reprodução',
-    '85229000': 'Outras partes e acessórios para aparelhos das posições 8519 a 8521',
-    '85229020': 'Outras partes e acessórios para aparelhos das posições 8519 a 8521',
-    '85229030': 'Outras partes e acessórios para aparelhos das posições 8519 a 8521',
-    '85229050': 'Outras partes e acessórios para aparelhos das posições 8519 a 8521',
-    '85229090': 'Outras partes e acessórios para aparelhos das posições 8519 a 8521',
-    '85232110': 'Cartões com tarja magnética',
-    '85232120': 'Cartões com tarja magnética',
-    '85232911': 'Discos, fitas e outros suportes magnéticos para gravação',
-    '85232919': 'Discos, fitas e outros suportes magnéticos para gravação',
-    '85232921': 'Discos, fitas e outros suportes magnéticos para gravação',
-    '85232922': 'Discos, fitas e outros suportes magnéticos para gravação',
-    '85232923': 'Discos, fitas e outros suportes magnéticos para gravação',
-    '85232929': 'Discos, fitas e outros suportes magnéticos para gravação',
-    '85232932': 'Discos, fitas e outros suportes magnéticos para gravação',
-    '85232933': 'Discos, fitas e outros suportes magnéticos para gravação',
-    '85232939': 'Discos, fitas e outros suportes magnéticos para gravação',
-    '85232990': 'Discos, fitas e outros suportes magnéticos para gravação',
-    '85234110': 'Discos para sistema de leitura por raio laser',
-    '85234190': 'Discos para sistema de leitura por raio laser',
-    '85234910': 'Outros discos para leitura',
-    '85234920': 'Outros discos para leitura',
-    '85234990': 'Outros discos para leitura',
-    '85235110': 'Dispositivos de armazenamento não-volátil de dados à base de semicondutores',
-    '85235190': 'Dispositivos de armazenamento não-volátil de dados à base de semicondutores',
-    '85235200': 'Cartões inteligentes (smart cards)',
-    '85235210': 'Cartões inteligentes (smart cards)',
-    '85235290': 'Cartões inteligentes (smart cards)',
-    '85235900': 'Outros suportes semicondutores para gravação ou reprodução',
-    '85235910': 'Outros suportes semicondutores para gravação ou reprodução',
-    '85235990': 'Outros suportes semicondutores para gravação ou reprodução',
-    '85238000': 'Outros suportes para gravação de som ou semelhantes',
-    '85241100': 'Módulos de tela plana, incorporando ou não telas sensíveis ao toque, sem controladores ou circuitos de controle, de cristais líquidos',
-    '85241900': 'Outros módulos de tela plana, incorporando ou não telas sensíveis ao toque, sem controladores ou circuitos de controle, não classificados em códigos anteriores',
-    '85249100': 'Outros suportes gravados, para reprodução de fenômenos diferentes de som ou imagem',
-    '85249200': 'Outros módulos de tela plana, incorporando ou não telas sensíveis ao toque, de diodos orgânicos emissores de luz (OLED)',
-    '85249900': 'Outros suportes para gravação de som/semelhantes, gravados, etc.',
-    '85255011': 'Aparelhos transmissores (emissores) para radiodifusão ou televisão',
-    '85255012': 'Aparelhos transmissores (emissores) para radiodifusão ou televisão',
-    '85255019': 'Aparelhos transmissores (emissores) para radiodifusão ou televisão',
-    '85255021': 'Aparelhos transmissores (emissores) para radiodifusão ou televisão',
-    '85255022': 'Aparelhos transmissores (emissores) para radiodifusão ou televisão',
-    '85255023': 'Aparelhos transmissores (emissores) para radiodifusão ou televisão',
-    '85255024': 'Aparelhos transmissores (emissores) para radiodifusão ou televisão',
-    '85255029': 'Aparelhos transmissores (emissores) para radiodifusão ou televisão',
-    '85256010': 'Aparelhos transmissores (emissores) para radiodifusão ou televisão incorporando um aparelho receptor',
-    '85256020': 'Aparelhos transmissores (emissores) para radiodifusão ou televisão incorporando um aparelho receptor',
-    '85256090': 'Aparelhos transmissores (emissores) para radiodifusão ou televisão incorporando um aparelho receptor',
-    '85258011': 'Câmeras de televisão, câmeras fotográficas digitais e câmeras de vídeo',
-    '85258012': 'Câmeras de televisão, câmeras fotográficas digitais e câmeras de vídeo',
-    '85258013': 'Câmeras de televisão, câmeras fotográficas digitais e câmeras de vídeo',
-    '85258014': 'Câmeras de televisão, câmeras fotográficas digitais e câmeras de vídeo',
-    '85258019': 'Câmeras de televisão, câmeras fotográficas digitais e câmeras de vídeo',
-    '85258021': 'Câmeras de televisão, câmeras fotográficas digitais e câmeras de vídeo',
-    '85258022': 'Câmeras de televisão, câmeras fotográficas digitais e câmeras de vídeo',
-    '85258029': 'Câmeras de televisão, câmeras fotográficas digitais e câmeras de vídeo',
-    '85258100': 'Mercadorias de alta velocidade, conforme especificado na Nota de Subposição 1 deste Capítulo',
-    '85258200': 'Outros produtos endurecidos ou tolerantes à radiação, conforme especificado na Nota de Subposição 2 deste Capítulo',
-    '85258300': 'Outros produtos de visão noturna conforme especificado na Nota de Subposição 3 deste Capítulo',
-    '85258911': 'Outras câmeras de televisão, câmeras digitais e gravadores de vídeo, não classificadas nos códigos anteriores',
-    '85258912': 'Outras câmeras de televisão, câmeras digitais e gravadores de vídeo, não classificadas nos códigos anteriores',
-    '85258913': 'Outras câmeras de televisão, câmeras digitais e gravadores de vídeo, não classificadas nos códigos anteriores',
-    '85258914': 'Outras câmeras de televisão, câmeras digitais e gravadores de vídeo, não classificadas nos códigos anteriores',
-    '85258919': 'Outras câmeras de televisão, câmeras digitais e gravadores de vídeo, não classificadas nos códigos anteriores',
-    '85258921': 'Outras câmeras de televisão, câmeras digitais e gravadores de vídeo, não classificadas nos códigos anteriores',
-    '85258922': 'Outras câmeras de televisão, câmeras digitais e gravadores de vídeo, não classificadas nos códigos anteriores',
-    '85258929': 'Outras câmeras de televisão, câmeras digitais e gravadores de vídeo, não classificadas nos códigos anteriores',
-    '85261000': 'Aparelhos de radiodetecção e de radiossondagem (radar)',
-    '85269100': 'Aparelhos de radionavegação',
-    '85269200': 'Aparelhos de radiotelecomando',
-    '85271200': 'Rádio toca-fitas (rádio-cassetes), de bolso',
-    '85271300': 'Outros aparelhos receptores de radiodifusão, suscetíveis de funcionarem sem uma fonte externa de energia, combinados com um aparelho de gravação ou de reprodução de som',
-    '85271900': 'Outros aparelhos receptores de radiodifusão, suscetíveis de funcionarem sem uma fonte externa de energia',
-    '85271910': 'Outros aparelhos receptores de radiodifusão, suscetíveis de funcionarem sem uma fonte externa de energia',
-    '85271990': 'Outros aparelhos receptores de radiodifusão, suscetíveis de funcionarem sem uma fonte externa de energia',
-    '85272100': 'Aparelhos receptores de radiodifusão que só funcionem com fonte externa de energia combinados com aparelho de gravação ou de reprodução de som, dos tipos utilizados nos veículos automóveis',
-    '85272900': 'Outros aparelhos receptores de radiodifusão, que só funcionem com uma fonte externa de energia, utilizados nos veículos automóveis',
-    '85279100': 'Outros aparelhos receptores para radiodifusão combinados com um aparelho de gravação ou de reprodução de som',
-    '85279910': 'Outros aparelhos receptores para radiodifusão',
-    '85279990': 'Outros aparelhos receptores para radiodifusão',
-    '85284200': 'Monitores com tubo de raios catódicos, capazes de serem conectados diretamente a uma máquina automática para processamento de dados da posição 84.71 e concebidos para serem utilizados com esta máquina',
-    '85284210': 'Monitores com tubo de raios catódicos, capazes de serem conectados diretamente a uma máquina automática para processamento de dados da posição 84.71 e concebidos para serem utilizados com esta máquina',
-    '85284220': 'Monitores com tubo de raios catódicos, capazes de serem conectados diretamente a uma máquina automática para processamento de dados da posição 84.71 e concebidos para serem utilizados com esta máquina',
-    '85284910': 'Outros monitores com tubo de raios catódicos',
-    '85284921': 'Outros monitores com tubo de raios catódicos',
-    '85284929': 'Outros monitores com tubo de raios catódicos',
-    '85284930': 'Outros monitores com tubo de raios catódicos',
-    '85284990': 'Outros monitores com tubo de raios catódicos',
-    '85285200': 'Outros monitores, capazes de serem conectados diretamente a uma máquina automática para processamento de dados da posição 84.71 e concebidos para serem utilizados com esta máquina',
-    '85285210': 'Outros monitores, capazes de serem conectados diretamente a uma máquina automática para processamento de dados da posição 84.71 e concebidos para serem utilizados com esta máquina',
-    '85285220': 'Outros monitores, capazes de serem conectados diretamente a uma máquina automática para processamento de dados da posição 84.71 e concebidos para serem utilizados com esta máquina',
-    '85285900': 'Outros monitores',
-    '85285910': 'Outros monitores',
-    '85285920': 'Outros monitores',
-    '85286200': 'Projetores, capazes de serem conectados diretamente a uma máquina automática para processamento de dados da posição 84.71 e concebidos para serem utilizados com esta máquina',
-    '85286910': 'Outros projetores',
-    '85286990': 'Outros projetores',
-    '85287111': 'Aparelhos receptores de televisão, não concebidos para incorporar um dispositivo de visualização (visual display) ou uma tela de vídeo',
-    '85287119': 'Aparelhos receptores de televisão, não concebidos para incorporar um dispositivo de visualização (visual display) ou uma tela de vídeo',
-    '85287190': 'Aparelhos receptores de televisão, não concebidos para incorporar um dispositivo de visualização (visual display) ou uma tela de vídeo',
-    '85287200': 'Outros aparelhos receptores de televisão em cores',
-    '85291011': 'Antenas e refletores de antenas de qualquer tipo; partes reconhecíveis como de utilização conjunta com esses artefatos',
-    '85291019': 'Antenas e refletores de antenas de qualquer tipo; partes reconhecíveis como de utilização conjunta com esses artefatos',
-    '85291020': 'Antenas e refletores de antenas de qualquer tipo; partes reconhecíveis como de utilização conjunta com esses artefatos',
-    '85291090': 'Antenas e refletores de antenas de qualquer tipo; partes reconhecíveis como de utilização conjunta com esses artefatos',
-    '85299011': 'Outras partes destinadas aos aparelhos das posições 8525 a 8528',
-    '85299012': 'Outras partes destinadas aos aparelhos das posições 8525 a 8528',
-    '85299019': 'Outras partes destinadas aos aparelhos das posições 8525 a 8528',
-    '85299020': 'Outras partes destinadas aos aparelhos das posições 8525 a 8528',
-    '85299030': 'Outras partes destinadas aos aparelhos das posições 8525 a 8528',
-    '85299040': 'Outras partes destinadas aos aparelhos das posições 8525 a 8528',
-    '85299050': 'Outras partes destinadas aos aparelhos das posições 8525 a 8528',
-    '85299090': 'Outras partes destinadas aos aparelhos das posições 8525 a 8528',
-    '85301010': 'Aparelhos elétricos de sinalização, de segurança, de controle ou de comando para vias férreas ou semelhantes',
-    '85301090': 'Aparelhos elétricos de sinalização, de segurança, de controle ou de comando para vias férreas ou semelhantes',
-    '85308010': 'Outros aparelhos elétricos de sinalização, de segurança, de controle ou de comando para vias terrestres ou fluviais, para áreas ou parques de estacionamento, instalações portuárias ou para aeródromos (exceto os da posição 86.88)',
-    '85308090': 'Outros aparelhos elétricos de sinalização, de segurança, de controle ou de comando para vias terrestres ou fluviais, para áreas ou parques de estacionamento, instalações portuárias ou para aeródromos (exceto os da posição 86.88)',
-    '85309000': 'Partes de aparelhos elétricos de sinalização, de segurança, de controle ou de comando',
-    '85311010': 'Aparelhos elétricos de alarme, para proteção contra roubo ou incêndio e aparelhos semelhantes',
-    '85311090': 'Aparelhos elétricos de alarme, para proteção contra roubo ou incêndio e aparelhos semelhantes',
-    '85312000': 'Painéis indicadores com dispositivos de cristais líquidos (LCD) ou de diodos emissores de luz (LED)',
-    '85318000': 'Outros aparelhos elétricos de sinalização acústica ou visual',
-    '85319000': 'Partes de aparelhos elétricos de sinalização acústica ou visual',
-    '85321000': 'Condensadores fixos para linhas elétricas de 50/60 Hz e capazes de absorver uma potência reativa => 0,5 kvar',
-    '85322111': 'Condensadores fixos elétricos, de tântalo',
-    '85322119': 'Condensadores fixos elétricos, de tântalo',
-    '85322120': 'Condensadores fixos elétricos, de tântalo',
-    '85322190': 'Condensadores fixos elétricos, de tântalo',
-    '85322200': 'Condensadores fixos eletrolíticos, de alumínio',
-    '85322310': 'Condensadores fixos, com dielétrico de cerâmica, de uma só camada',
-    '85322390': 'Condensadores fixos, com dielétrico de cerâmica, de uma só camada',
-    '85322410': 'Condensadores fixos com dielétrico de cerâmica, de camadas múltiplas',
-    '85322420': 'Condensadores fixos com dielétrico de cerâmica, de camadas múltiplas',
-    '85322490': 'Condensadores fixos com dielétrico de cerâmica, de camadas múltiplas',
-    '85322510': 'Condensadores fixos com dielétricos de papel ou de plásticos',
-    '85322590': 'Condensadores fixos com dielétricos de papel ou de plásticos',
-    '85322910': 'Outros condensadores fixos, elétricos',
-    '85322990': 'Outros condensadores fixos, elétricos',
-    '85323090': 'Condensadores variáveis ou ajustáveis, elétricos',
-    '85329000': 'Partes de condensadores elétricos, fixos, variáveis ou ajustáveis',
-    '85331000': 'Resistências elétricas fixas, de carbono, aglomeradas ou de camada',
-    '85332110': 'Outras resistências elétricas fixas, para potência <= 20 W',
-    '85332120': 'Outras resistências elétricas fixas, para potência <= 20 W',
-    '85332190': 'Outras resistências elétricas fixas, para potência <= 20 W',
-    '85332900': 'Outras resistências elétricas fixas',
-    '85333110': 'Resistências variáveis bobinadas, elétricas, para potência <= 20 W',
-    '85333190': 'Resistências variáveis bobinadas, elétricas, para potência <= 20 W',
-    '85333910': 'Outras resistências, elétricas, variáveis bobinadas',
-    '85333990': 'Outras resistências, elétricas, variáveis bobinadas',
-    '85334011': 'Outras resistências, elétricas, variáveis (incluídos os reostatos e os potenciômetros)',
-    '85334012': 'Outras resistências, elétricas, variáveis (incluídos os reostatos e os potenciômetros)',
-    '85334013': 'Outras resistências, elétricas, variáveis (incluídos os reostatos e os potenciômetros)',
-    '85334019': 'Outras resistências, elétricas, variáveis (incluídos os reostatos e os potenciômetros)',
-    '85334091': 'Outras resistências, elétricas, variáveis (incluídos os reostatos e os potenciômetros)',
-    '85334092': 'Outras resistências, elétricas, variáveis (incluídos os reostatos e os potenciômetros)',
-    '85334099': 'Outras resistências, elétricas, variáveis (incluídos os reostatos e os potenciômetros)',
-    '85339000': 'Partes de resistências elétricas',
-    '85340011': 'Circuitos impressos',
-    '85340012': 'Circuitos impressos',
-    '85340013': 'Circuitos impressos',
-    '85340019': 'Circuitos impressos',
-    '85340020': 'Circuitos impressos',
-    '85340031': 'Circuitos impressos',
-    '85340032': 'Circuitos impressos',
-    '85340033': 'Circuitos impressos',
-    '85340039': 'Circuitos impressos',
-    '85340040': 'Circuitos impressos',
-    '85340051': 'Circuitos impressos',
-    '85340059': 'Circuitos impressos',
-    '85351000': 'Fusíveis e corta-circuito de fusíveis, para tensão > 1.000 V',
-    '85352100': 'Disjuntores, para tensão > 1 kV e < 72,5 kV',
-    '85352900': 'Outros disjuntores para tensão = > 72,5 kV',
-    '85353013': 'Seccionadores e interruptores, para tensão de > 1 kV',
-    '85353017': 'Seccionadores e interruptores, para tensão de > 1 kV',
-    '85353018': 'Seccionadores e interruptores, para tensão de > 1 kV',
-    '85353019': 'Seccionadores e interruptores, para tensão de > 1 kV',
-    '85353023': 'Seccionadores e interruptores, para tensão de > 1 kV',
-    '85353027': 'Seccionadores e interruptores, para tensão de > 1 kV',
-    '85353028': 'Seccionadores e interruptores, para tensão de > 1 kV',
-    '85353029': 'Seccionadores e interruptores, para tensão de > 1 kV',
-    '85354010': 'Pára-raios, limitadores de tensão e eliminadores de onda, elétricos, para tensão > 1 kV',
-    '85354090': 'Pára-raios, limitadores de tensão e eliminadores de onda, elétricos, para tensão > 1 kV',
-    '85359000': 'Outros aparelhos para interrupção, seccionamento, ligação de circuitos elétricos, para tensão > 1 kV',
-    '85359010': 'Outros aparelhos para interrupção, seccionamento, ligação de circuitos elétricos, para tensão > 1 kV',
-    '85359090': 'Outros aparelhos para interrupção, seccionamento, ligação de circuitos elétricos, para tensão > 1 kV',
-    '85361000': 'Fusíveis e corta-circuito de fusíveis, para tensão <= 1 kV',
-    '85362000': 'Disjuntores para tensão <= 1 kV',
-    '85363010': 'Outros aparelhos para proteção de circuitos elétricos, para tensão <= 1 kV',
-    '85363090': 'Outros aparelhos para proteção de circuitos elétricos, para tensão <= 1 kV',
-    '85364100': 'Relés, para tensão <= 60 V',
-    '85364900': 'Outros relés, para tensão > 60 V e < = 1.000 V',
-    '85365010': 'Outros interruptores, seccionadores e comutadores, de circuitos elétricos para tensão <= 1 kV',
-    '85365020': 'Outros interruptores, seccionadores e comutadores, de circuitos elétricos para tensão <= 1 kV',
-    '85365030': 'Outros interruptores, seccionadores e comutadores, de circuitos elétricos para tensão <= 1 kV',
-    '85365090': 'Outros interruptores, seccionadores e comutadores, de circuitos elétricos para tensão <= 1 kV',
-    '85366100': 'Suportes para lâmpadas, para tensão < = 1 kV',
-    '85366910': 'Tomada polarizada e tomada blindada, para uma tensão não superior a 1.000 V',
-    '85366990': 'Tomada polarizada e tomada blindada, para uma tensão não superior a 1.000 V',
-    '85367000': 'Conectores para fibras óticas, feixes ou cabos de fibra óptica',
-    '85369010': 'Outros aparelhos para interrupção, seccionamento, proteção, ligação de circuitos elétricos, para tensão <= 1 Kv',
-    '85369020': 'Outros aparelhos para interrupção, seccionamento, proteção, ligação de circuitos elétricos, para tensão <= 1 Kv',
-    '85369030': 'Outros aparelhos para interrupção, seccionamento, proteção, ligação de circuitos elétricos, para tensão <= 1 Kv',
-    '85369040': 'Outros aparelhos para interrupção, seccionamento, proteção, ligação de circuitos elétricos, para tensão <= 1 Kv',
-    '85369050': 'Outros aparelhos para interrupção, seccionamento, proteção, ligação de circuitos elétricos, para tensão <= 1 Kv',
-    '85369060': 'Outros aparelhos para interrupção, seccionamento, proteção, ligação de circuitos elétricos, para tensão <= 1 Kv',
-    '85369090': 'Outros aparelhos para interrupção, seccionamento, proteção, ligação de circuitos elétricos, para tensão <= 1 Kv',
-    '85371011': 'Quadros, painéis, consoles e outros suportes com dois ou mais aparelhos das posições 8535 ou 8536, para comando ou distribuição de energia elétrica, para tensão <= 1 kV',
-    '85371019': 'Quadros, painéis, consoles e outros suportes com dois ou mais aparelhos das posições 8535 ou 8536, para comando ou distribuição de energia elétrica, para tensão <= 1 kV',
-    '85371020': 'Quadros, painéis, consoles e outros suportes com dois ou mais aparelhos das posições 8535 ou 8536, para comando ou distribuição de energia elétrica, para tensão <= 1 kV',
-    '85371030': 'Quadros, painéis, consoles e outros suportes com dois ou mais aparelhos das posições 8535 ou 8536, para comando ou distribuição de energia elétrica, para tensão <= 1 kV',
-    '85371090': 'Quadros, painéis, consoles e outros suportes com dois ou mais aparelhos das posições 8535 ou 8536, para comando ou distribuição de energia elétrica, para tensão <= 1 kV',
-    '85372010': 'Quadros, painéis, consoles com dois ou mais aparelhos das posições 85.35 ou 85.36, para comando ou distribuição de energia elétrica, para tensão > 1 kV',
-    '85372090': 'Quadros, painéis, consoles com dois ou mais aparelhos das posições 85.35 ou 85.36, para comando ou distribuição de energia elétrica, para tensão > 1 kV',
-    '85381000': 'Partes para quadros, painéis e outros artefatos da posição 8537',
-    '85389010': 'Outras partes destinadas aos aparelhos das posições 8535, 8536 e 8537',
-    '85389020': 'Outras partes destinadas aos aparelhos das posições 8535, 8536 e 8537',
-    '85389090': 'Outras partes destinadas aos aparelhos das posições 8535, 8536 e 8537',
-    '85391010': 'Faróis e projetores, em unidades seladas',
-    '85391090': 'Faróis e projetores, em unidades seladas',
-    '85392110': 'Lâmpadas e tubos de incandescência, halogêneos, de tungstênio',
-    '85392190': 'Lâmpadas e tubos de incandescência, halogêneos, de tungstênio',
-    '85392200': 'Outras lâmpadas e tubos de incandescência, de potência <= 200 W e tensão > 100 V',
-    '85392910': 'Outras lâmpadas e tubos de incandescência',
-    '85392990': 'Outras lâmpadas e tubos de incandescência',
-    '85393100': 'Lâmpadas e tubos de descarga, fluorescentes, de cátodo quente',
-    '85393111': 'Lâmpadas e tubos de descarga, fluorescentes, de cátodo quente',
-    '85393119': 'Lâmpadas e tubos de descarga, fluorescentes, de cátodo quente',
-    '85393120': 'Lâmpadas e tubos de descarga, fluorescentes, de cátodo quente',
-    '85393131': 'Lâmpadas e tubos de descarga, fluorescentes, de cátodo quente',
-    '85393132': 'Lâmpadas e tubos de descarga, fluorescentes, de cátodo quente',
-    '85393139': 'Lâmpadas e tubos de descarga, fluorescentes, de cátodo quente',
-    '85393200': 'Lâmpadas de vapor de mercúrio ou de sódio; lâmpadas de halogeneto metálico',
-    '85393210': 'Lâmpadas de vapor de mercúrio ou de sódio; lâmpadas de halogeneto metálico',
-    '85393220': 'Lâmpadas de vapor de mercúrio ou de sódio; lâmpadas de halogeneto metálico',
-    '85393230': 'Lâmpadas de vapor de mercúrio ou de sódio; lâmpadas de halogeneto metálico',
-    '85393900': 'Outras lâmpadas e tubos de descarga',
-    '85393911': 'Outras lâmpadas e tubos de descarga',
-    '85393913': 'Outras lâmpadas e tubos de descarga',
-    '85393919': 'Outras lâmpadas e tubos de descarga',
-    '85393990': 'Outras lâmpadas e tubos de descarga',
-    '85394110': 'Lâmpadas de arco',
-    '85394190': 'Lâmpadas de arco',
-    '85394900': 'Lâmpadas e tubos de raios ultravioleta ou infravermelhos',
-    '85395000': 'Lâmpadas e tubos de diodos emissores de luz (LED)',
-    '85395100': 'Módulos de diodos emissores de luz (LED)',
-    '85395200': 'Lâmpadas de diodo emissor de luz (LED)',
-    '85399010': 'Partes para lâmpadas e tubos elétricos de incandescência ou de descarga, de raios ultravioletas e semelhantes',
-    '85399020': 'Partes para lâmpadas e tubos elétricos de incandescência ou de descarga, de raios ultravioletas e semelhantes',
-    '85399090': 'Partes para lâmpadas e tubos elétricos de incandescência ou de descarga, de raios ultravioletas e semelhantes',
-    '85401100': 'Tubos catódicos para receptores de televisão e monitores de vídeo, a cores',
-    '85402019': 'Tubos para câmeras de televisão; tubos conversores ou intensificadores de imagens; outros tubos de fotocátodo',
-    '85402020': 'Tubos para câmeras de televisão; tubos conversores ou intensificadores de imagens; outros tubos de fotocátodo',
-    '85402090': 'Tubos para câmeras de televisão; tubos conversores ou intensificadores de imagens; outros tubos de fotocátodo',
-    '85406010': 'Outros tubos catódicos',
-    '85406090': 'Outros tubos catódicos',
-    '85407100': 'Tubos para microondas, magnétrons',
-    '85407900': 'Outros tubos para microondas (por exemplo: guias de ondas progressivas, carcinotrons e outros)',
-    '85408100': 'Tubos de recepção ou de amplificação',
-    '85408910': 'Outras válvulas e tubos eletrônicos',
-    '85408990': 'Outras válvulas e tubos eletrônicos',
-    '85409110': 'Partes para tubos catódicos',
-    '85409120': 'Partes para tubos catódicos',
-    '85409140': 'Partes para tubos catódicos',
-    '85409190': 'Partes para tubos catódicos',
-    '85409900': 'Partes para lâmpadas, tubos e válvulas, eletrônicos',
-    '85411011': 'Diodos, exceto fotodiodos e diodos emissores de luz',
-    '85411012': 'Diodos, exceto fotodiodos e diodos emissores de luz',
-    '85411019': 'Diodos, exceto fotodiodos e diodos emissores de luz',
-    '85411021': 'Diodos, exceto fotodiodos e diodos emissores de luz',
-    '85411022': 'Diodos, exceto fotodiodos e diodos emissores de luz',
-    '85411029': 'Diodos, exceto fotodiodos e diodos emissores de luz',
-    '85411031': 'Diodos, exceto fotodiodos e diodos emissores de luz',
-    '85411032': 'Diodos, exceto fotodiodos e diodos emissores de luz',
-    '85411039': 'Diodos, exceto fotodiodos e diodos emissores de luz',
-    '85411091': 'Diodos, exceto fotodiodos e diodos emissores de luz',
-    '85411092': 'Diodos, exceto fotodiodos e diodos emissores de luz',
-    '85411099': 'Diodos, exceto fotodiodos e diodos emissores de luz',
-    '85412110': 'Transistores com capacidade de dissipação < 1 W, exceto fototransistores',
-    '85412120': 'Transistores com capacidade de dissipação < 1 W, exceto fototransistores',
-    '85412191': 'Transistores com capacidade de dissipação < 1 W, exceto fototransistores',
-    '85412199': 'Transistores com capacidade de dissipação < 1 W, exceto fototransistores',
-    '85412910': 'Outros transistores, exceto fototransistores',
-    '85412920': 'Outros transistores, exceto fototransistores',
-    '85413011': 'Tiristores, diacs e triacs, exceto os dispositivos fotossensíveis',
-    '85413019': 'Tiristores, diacs e triacs, exceto os dispositivos fotossensíveis',
-    '85413021': 'Tiristores, diacs e triacs, exceto os dispositivos fotossensíveis',
-    '85413029': 'Tiristores, diacs e triacs, exceto os dispositivos fotossensíveis',
-    '85414011': 'Dispositivos fotossensíveis semicondutores, incluídas as células fotovoltaicas, mesmo montadas em módulos ou em painéis; diodos emissores de luz',
-    '85414012': 'Dispositivos fotossensíveis semicondutores, incluídas as células fotovoltaicas, mesmo montadas em módulos ou em painéis; diodos emissores de luz',
-    '85414013': 'Dispositivos fotossensíveis semicondutores, incluídas as células fotovoltaicas, mesmo montadas em módulos ou em painéis; diodos emissores de luz',
-    '85414014': 'Dispositivos fotossensíveis semicondutores, incluídas as células fotovoltaicas, mesmo montadas em módulos ou em painéis; diodos emissores de luz',
-    '85414015': 'Dispositivos fotossensíveis semicondutores, incluídas as células fotovoltaicas, mesmo montadas em módulos ou em painéis; diodos emissores de luz',
-    '85414016': 'Dispositivos fotossensíveis semicondutores, incluídas as células fotovoltaicas, mesmo montadas em módulos ou em painéis; diodos emissores de luz',
-    '85414018': 'Dispositivos fotossensíveis semicondutores, incluídas as células fotovoltaicas, mesmo montadas em módulos ou em painéis; diodos emissores de luz',
-    '85414019': 'Dispositivos fotossensíveis semicondutores, incluídas as células fotovoltaicas, mesmo montadas em módulos ou em painéis; diodos emissores de luz',
-    '85414021': 'Dispositivos fotossensíveis semicondutores, incluídas as células fotovoltaicas, mesmo montadas em módulos ou em painéis; diodos emissores de luz',
-    '85414022': 'Dispositivos fotossensíveis semicondutores, incluídas as células fotovoltaicas, mesmo montadas em módulos ou em painéis; diodos emissores de luz',
-    '85414023': 'Dispositivos fotossensíveis semicondutores, incluídas as células fotovoltaicas, mesmo montadas em módulos ou em painéis; diodos emissores de luz',
-    '85414024': 'Dispositivos fotossensíveis semicondutores, incluídas as células fotovoltaicas, mesmo montadas em módulos ou em painéis; diodos emissores de luz',
-    '85414025': 'Dispositivos fotossensíveis semicondutores, incluídas as células fotovoltaicas, mesmo montadas em módulos ou em painéis; diodos emissores de luz',
-    '85414026': 'Dispositivos fotossensíveis semicondutores, incluídas as células fotovoltaicas, mesmo montadas em módulos ou em painéis; diodos emissores de luz',
-    '85414027': 'Dispositivos fotossensíveis semicondutores, incluídas as células fotovoltaicas, mesmo montadas em módulos ou em painéis; diodos emissores de luz',
-    '85414029': 'Dispositivos fotossensíveis semicondutores, incluídas as células fotovoltaicas, mesmo montadas em módulos ou em painéis; diodos emissores de luz',
-    '85414031': 'Dispositivos fotossensíveis semicondutores, incluídas as células fotovoltaicas, mesmo montadas em módulos ou em painéis; diodos emissores de luz',
-    '85414032': 'Dispositivos fotossensíveis semicondutores, incluídas as células fotovoltaicas, mesmo montadas em módulos ou em painéis; diodos emissores de luz',
-    '85414039': 'Dispositivos fotossensíveis semicondutores, incluídas as células fotovoltaicas, mesmo montadas em módulos ou em painéis; diodos emissores de luz',
-    '85414111': 'Diodos fotossensíveis emissores de luz (LED)',
-    '85414112': 'Diodos fotossensíveis emissores de luz (LED)',
-    '85414121': 'Diodos fotossensíveis emissores de luz (LED)',
-    '85414122': 'Diodos fotossensíveis emissores de luz (LED)',
-    '85414124': 'Diodos fotossensíveis emissores de luz (LED)',
-    '85414220': 'Células fotovoltaicas não montadas em módulos ou compostas em painéis',
-    '85414290': 'Células fotovoltaicas não montadas em módulos ou compostas em painéis',
-    '85414300': 'Células fotovoltaicas montadas em módulos ou compostas em painéis',
-    '85414900': 'Outros dispositivos semicondutores fotossensíveis, incluindo células fotovoltaicas, montadas ou não em módulos ou em painéis; díodos emissores de luz (LED); não classificados nos códigos anteriores',
-    '85415010': 'Outros dispositivos semicondutores',
-    '85415020': 'Outros dispositivos semicondutores',
-    '85415100': 'Transdutores baseados em semicondutores',
-    '85415900': 'Outros dispositivos semicondutores, não classificados nos códigos anteriores',
-    '85416010': 'Cristais piezo elétricos montados',
-    '85416090': 'Cristais piezo elétricos montados',
-    '85419010': 'Partes de diodos, transistores, semicondutores e semelhantes',
-    '85419090': 'Partes de diodos, transistores, semicondutores e semelhantes',
-    '85423110': 'Processadores e controladores, mesmo combinados com memórias, conversores, circuitos lógicos, amplificadores, circuitos temporizadores e de sincronização, ou outros circuitos',
-    '85423120': 'Processadores e controladores, mesmo combinados com memórias, conversores, circuitos lógicos, amplificadores, circuitos temporizadores e de sincronização, ou outros circuitos',
-    '85423190': 'Processadores e controladores, mesmo combinados com memórias, conversores, circuitos lógicos, amplificadores, circuitos temporizadores e de sincronização, ou outros circuitos',
-    '85423210': 'Memórias',
-    '85423221': 'Memórias',
-    '85423229': 'Memórias',
-    '85423291': 'Memórias',
-    '85423299': 'Memórias',
-    '85423311': 'Amplificadores',
-    '85423319': 'Amplificadores',
-    '85423320': 'Amplificadores',
-    '85423390': 'Amplificadores',
-    '85423919': 'Outros circuitos integrados eletrônicos',
-    '85423920': 'Outros circuitos integrados eletrônicos',
-    '85423931': 'Outros circuitos integrados eletrônicos',
-    '85423939': 'Outros circuitos integrados eletrônicos',
-    '85423991': 'Outros circuitos integrados eletrônicos',
-    '85423999': 'Outros circuitos integrados eletrônicos',
-    '85429000': 'Partes para circuitos integrados eletrônicos',
-    '85429010': 'Partes para circuitos integrados eletrônicos',
-    '85429090': 'Partes para circuitos integrados eletrônicos',
-    '85431000': 'Aceleradores de partículas',
-    '85432000': 'Geradores de sinais, elétricos',
-    '85433010': 'Máquinas e aparelhos de galvanoplastia, eletrólise ou eletroforese',
-    '85433090': 'Máquinas e aparelhos de galvanoplastia, eletrólise ou eletroforese',
-    '85434000': 'Eletrificadores de cercas',
-    '85437011': 'Outras máquinas e aparelhos com função própria',
-    '85437012': 'Outras máquinas e aparelhos com função própria',
-    '85437013': 'Outras máquinas e aparelhos com função própria',
-    '85437014': 'Outras máquinas e aparelhos com função própria',
-    '85437015': 'Outras máquinas e aparelhos com função própria',
-    '85437019': 'Outras máquinas e aparelhos com função própria',
-    '85437020': 'Outras máquinas e aparelhos com função própria',
-    '85437032': 'Outras máquinas e aparelhos com função própria',
-    '85437033': 'Outras máquinas e aparelhos com função própria',
-    '85437034': 'Outras máquinas e aparelhos com função própria',
-    '85437035': 'Outras máquinas e aparelhos com função própria',
-    '85437036': 'Outras máquinas e aparelhos com função própria',
-    '85437039': 'Outras máquinas e aparelhos com função própria',
-    '85437040': 'Outras máquinas e aparelhos com função própria',
-    '85437050': 'Outras máquinas e aparelhos com função própria',
-    '85437091': 'Outras máquinas e aparelhos com função própria',
-    '85437092': 'Outras máquinas e aparelhos com função própria',
-    '85437099': 'Outras máquinas e aparelhos com função própria',
-    '85439010': 'Partes de máquinas e aparelhos elétricos com função própria',
-    '85439090': 'Partes de máquinas e aparelhos elétricos com função própria',
-    '85441100': 'Fios de cobre para bobinar, isolados para usos elétricos',
-    '85441910': 'Outros fios para bobinar, isolados para usos elétricos',
-    '85441919': 'Outros fios para bobinar, isolados para usos elétricos',
-    '85441990': 'Outros fios para bobinar, isolados para usos elétricos',
-    '85442000': 'Cabos coaxiais e outros condutores elétricos coaxiais',
-    '85443000': 'Jogos de fios para velas de ignição e outros utilizados em quaisquer veículos',
-    '85444200': 'Outros condutores elétricos para tensão não superior a 1000 V, munidos de peças de conexão',
-    '85444900': 'Outros condutores elétricos, para tensão não superior a 1000 V',
-    '85446000': 'Outros condutores elétricos, para tensão > 1.000 V',
-    '85447010': 'Cabos de fibras ópticas',
-    '85447020': 'Cabos de fibras ópticas',
-    '85447030': 'Cabos de fibras ópticas',
-    '85447090': 'Cabos de fibras ópticas',
-    '85451100': 'Eletrodos de carvão, dos tipos utilizados em fornos, para usos elétricos',
-    '85451910': 'Outros eletrodos de carvão, para usos elétricos',
-    '85451920': 'Outros eletrodos de carvão, para usos elétricos',
-    '85451990': 'Outros eletrodos de carvão, para usos elétricos',
-    '85452000': 'Escovas de carvão, para usos elétricos',
-    '85459010': 'Carvões para lâmpadas, pilhas e artigos de grafita ou carvão, com ou sem metal, para usos elétricos',
-    '85459020': 'Carvões para lâmpadas, pilhas e artigos de grafita ou carvão, com ou sem metal, para usos elétricos',
-    '85459030': 'Carvões para lâmpadas, pilhas e artigos de grafita ou carvão, com ou sem metal, para usos elétricos',
-    '85459090': 'Carvões para lâmpadas, pilhas e artigos de grafita ou carvão, com ou sem metal, para usos elétricos',
-    '85461000': 'Isoladores de vidro, para usos elétricos',
-    '85462000': 'Isoladores de cerâmica, para usos elétricos',
-    '85469000': 'Outros isoladores de qualquer matéria, para usos elétricos',
-    '85471000': 'Peças isolantes de cerâmica, para máquinas, aparelhos e instalações elétricas',
-    '85472010': 'Peças isolantes de plásticos, para máquinas, aparelhos e instalações elétricas',
-    '85472090': 'Peças isolantes de plásticos, para máquinas, aparelhos e instalações elétricas',
-    '85479000': 'Outras peças isolantes, para usos elétricos; tubos isoladores e suas peças de ligação',
-    '85480010': 'Partes elétricas de máquinas ou aparelhos, não especificadas ou incluídas em outras partes deste capítulo',
-    '85480090': 'Partes elétricas de máquinas ou aparelhos, não especificadas ou incluídas em outras partes deste capítulo',
-    '85481010': 'Desperdícios e resíduos de pilhas, de baterias de pilhas e de acumuladores elétricos',
-    '85481090': 'Desperdícios e resíduos de pilhas, de baterias de pilhas e de acumuladores elétricos',
-    '85489010': 'Partes elétricas de máquinas e aparelhos não especificadas nem compreendidas em outras posições do Capítulo 85',
-    '85489090': 'Partes elétricas de máquinas e aparelhos não especificadas nem compreendidas em outras posições do Capítulo 85',
-    '85491100': 'Resíduos e sucata de acumuladores de chumbo-ácido; acumuladores de chumbo-ácido gastos',
-    '85491200': 'Outros resíduos e sucata de células primárias, baterias primárias e acumuladores elétricos; células primárias usadas, baterias primárias usadas e acumuladores elétricos usados; contendo chumbo, cádmio ou mercúrio',
-    '85491300': 'Resíduos e sucata de células primárias, baterias primárias e acumuladores elétricos; pilhas primárias gastas, baterias primárias gastas e acumuladores elétricos gastos; classificados por tipo químico e não contendo chumbo, cádmio ou mercúrio',
-    '85491900': 'Outros resíduos e sucata de células primárias, baterias primárias e acumuladores elétricos; células primárias usadas, baterias primárias usadas e acumuladores elétricos usados, não especificados ou incluídos em outros pontos deste Capítulo',
-    '85492900': 'Outros resíduos e sucata elétrica e eletrônica, do tipo utilizado principalmente para a recuperação de metais preciosos, não classificados nos códigos anteriores',
-    '85493100': 'Resíduos e sucata de conjuntos elétricos e eletrônicos e placas de circuito impresso, contendo células primárias, baterias primárias, acumuladores elétricos, interruptores de mercúrio, vidro de tubos de raios catódicos ou outros vidros ativados, ou componentes elétricos ou eletrônicos contendo cádmio, mercúrio, chumbo ou bifenilos policlorados (PCBs)',
-    '85493900': 'Outros resíduos e sucata de conjuntos elétricos e eletrônicos e de placas de circuitos impressos, não classificados nos códigos anteriores',
-    '85499100': 'Outros resíduos e sucata de elétricos e eletrônicos, que contenham pilhas, baterias de pilhas ou acumuladores, elétricos, interruptores de mercúrio, vidro de tubos de raios catódicos ou outros vidros ativados, ou componentes elétricos ou eletrônicos que contenham cádmio, mercúrio, chumbo ou policlorobifenilas (PCB)',
-    '85499900': 'Outros resíduos e sucatas elétricos e eletrônicos, não classificados nos códigos anteriores',
-    '86011000': 'Locomotivas e locotratores, de fonte externa de eletricidade',
-    '86012000': 'Locomotivas e locotratores, de acumuladores elétricos',
-    '86021000': 'Locomotivas diesel-elétricas',
-    '86031000': 'Litorinas (automotoras), de fonte externa de eletricidade',
-    '86039000': 'Outras litorinas (automotoras)',
-    '86040010': 'Veículos para inspeção e manutenção de vias férreas ou semelhantes, mesmo autopropulsores',
-    '86040090': 'Veículos para inspeção e manutenção de vias férreas ou semelhantes, mesmo autopropulsores',
-    '86050010': 'Vagões de passageiros, furgões para bagagem, vagões-postais, e outros vagões especiais, para vias férreas ou semelhantes',
-    '86063000': 'Vagões de descarga automática, para transporte de mercadorias em vias férreas',
-    '86069100': 'Vagões cobertos e fechados, para transporte de mercadorias em vias férreas',
-    '86069200': 'Vagões abertos com paredes fixas de altura > 60 cm, para vias férreas',
-    '86069900': 'Outros vagões para transporte de mercadorias em vias férreas',
-    '86071110': 'Bogiese bísseis, de tração, de veículos para vias férreas ou semelhantes',
-    '86071200': 'Outros bogies e bísseis de veículos para vias férreas',
-    '86071911': 'Eixos e rodas e suas partes, de veículos para vias férreas',
-    '86071919': 'Eixos e rodas e suas partes, de veículos para vias férreas',
-    '86071990': 'Eixos e rodas e suas partes, de veículos para vias férreas',
-    '86072100': 'Freios (travões) à ar comprimido e suas partes, de veículos para vias férreas',
-    '86072900': 'Outros freios e suas partes, de veículos para vias férreas',
-    '86073000': 'Ganchos, e outros sistemas de engate, pára-choques e suas partes, de veículos para vias férreas',
-    '86079100': 'Outras partes de locomotivas ou de locotratores',
-    '86079900': 'Outras partes de veículos para vias férreas',
-    '86080011': 'Material fixo de vias férreas ou semelhantes; aparelhos de sinalização, segurança, controle ou comando para vias férreas, rodoviárias ou fluviais',
-    '86080012': 'Material fixo de vias férreas ou semelhantes; aparelhos de sinalização, segurança, controle ou comando para vias férreas, rodoviárias ou fluviais',
-    '86080090': 'Material fixo de vias férreas ou semelhantes; aparelhos de sinalização, segurança, controle ou comando para vias férreas, rodoviárias ou fluviais',
-    '86090000': 'Contêineres (contentores), incluídos os de transporte de fluidos',
-    '87011000': 'Tratores motocultores',
-    '87012000': 'Tratores rodoviários para semi-reboques',
-    '87012100': 'Tratores rodoviários para semi-reboques com apenas motor de pistão de combustão interna de ignição por compressão (diesel ou semi-diesel)',
-    '87012400': 'Tratores rodoviários para semi-reboques com apenas motor elétrico para propulsão',
-    '87012900': 'Outros tratores rodoviários para semi-reboques, não classificados nos códigos anteriores',
-    '87013000': 'Tratores de lagartas',
-    '87019100': 'Outros tratores, com uma potência de motor não superior a 18 kW',
-    '87019200': 'Outros tratores, com uma potência de motor superior a 18 kW, mas não superior a 37 kW',
-    '87019300': 'Outros tratores, com uma potência de motor superior a 37 kW, mas não superior a 75 kW',
-    '87019410': 'Outros tratores, com uma potência de motor superior a 75 kW, mas não superior a 130 kW',
-    '87019490': 'Outros tratores, com uma potência de motor superior a 75 kW, mas não superior a 130 kW',
-    '87019510': 'Outros tratores, com uma potência de motor superior a 130 Kw',
-    '87019590': 'Outros tratores, com uma potência de motor superior a 130 Kw',
-    '87021000': 'Veículos automóveis para transporte => 10 pessoas, com motor de pistão, de ignição por compressão - ônibus microônibus',
-    '87024090': 'Veículos automóveis para transporte de dez pessoas ou mais, incluindo o motorista, unicamente com motor elétrico para propulsão',
-    '87029000': 'Outros veículos automóveis para transporte => 10 pessoas',
-    '87031000': 'Veículos automóveis para deslocamento sobre a neve; veículos para transportar pessoas nos campos de golfe e veículos semelhantes',
-    '87032100': 'Automóveis de passageiros, incluídos os veículos de uso misto (station wagons) e os automóveis de corrida, com motor de pistão alternativo, de ignição por centelha, de cilindrada <= 1.000 cm3',
-    '87032210': 'Automóveis de passageiros, incluídos os veículos de uso misto (station wagons) e os automóveis de corrida, com motor de pistão alternativo, de ignição por centelha, de cilindrada > 1.000 cm3 e <= 1.500 cm3',
-    '87032290': 'Automóveis de passageiros, incluídos os veículos de uso misto (station wagons) e os automóveis de corrida, com motor de pistão alternativo, de ignição por centelha, de cilindrada > 1.000 cm3 e <= 1.500 cm3',
-    '87032310': 'Automóveis de passageiros, incluídos os veículos de uso misto (station wagons) e os automóveis de corrida, com motor de pistão alternativo, de ignição por centelha, de cilindrada > 1.500 cm3 e <= 3.000 cm3',
-    '87032390': 'Automóveis de passageiros, incluídos os veículos de uso misto (station wagons) e os automóveis de corrida, com motor de pistão alternativo, de ignição por centelha, de cilindrada > 1.500 cm3 e <= 3.000 cm3',
-    '87032410': 'Automóveis de passageiros, incluídos os veículos de uso misto (station wagons) e os automóveis de corrida, com motor de pistão alternativo, de ignição por centelha, de cilindrada > 3.000 cm3',
-    '87032490': 'Automóveis de passageiros, incluídos os veículos de uso misto (station wagons) e os automóveis de corrida, com motor de pistão alternativo, de ignição por centelha, de cilindrada > 3.000 cm3',
-    '87033110': 'Automóveis de passageiros, incluídos os veículos de uso misto (station wagons) e os automóveis de corrida, com motor de pistão, de ignição por compressão (diesel ou semidiesel), de cilindrada <= 1.500 cm3',
-    '87033190': 'Automóveis de passageiros, incluídos os veículos de uso misto (station wagons) e os automóveis de corrida, com motor de pistão, de ignição por compressão (diesel ou semidiesel), de cilindrada <= 1.500 cm3',
-    '87033210': 'Automóveis de passageiros, incluídos os veículos de uso misto (station wagons) e os automóveis de corrida, com motor de pistão, de ignição por compressão, de cilindrada > 1.500 cm3 e <= 2.500 cm3',
-    '87033290': 'Automóveis de passageiros, incluídos os veículos de uso misto (station wagons) e os automóveis de corrida, com motor de pistão, de ignição por compressão, de cilindrada > 1.500 cm3 e <= 2.500 cm3',
-    '87033310': 'Automóveis de passageiros, incluídos os veículos de uso misto (station wagons) e os automóveis de corrida, com motor de pistão, de ignição por compressão, de cilindrada > 2.500 cm3',
-    '87033390': 'Automóveis de passageiros, incluídos os veículos de uso misto (station wagons) e os automóveis de corrida, com motor de pistão, de ignição por compressão, de cilindrada > 2.500 cm3',
-    '87034000': 'Outros veículos, equipados para propulsão, simultaneamente, com um motor de pistão alternativo de ignição por centelha (faísca) e um motor elétrico, exceto os suscetíveis de serem carregados por conexão a uma fonte externa de energia elétrica',
-    '87036000': 'Outros veículos, equipados para propulsão, simultaneamente, com um motor de pistão alternativo de ignição por centelha (faísca) e um motor elétrico, suscetíveis de serem carregados por conexão a uma fonte externa de energia elétrica',
-    '87037000': 'Outros veículos, equipados para propulsão, simultaneamente, com um motor de pistão de ignição por compressão (diesel ou semidiesel) e um motor elétrico, suscetíveis de serem carregados por conexão a uma fonte externa de energia elétrica',
-    '87038000': 'Outros veículos, equipados unicamente com motor elétrico para propulsão',
-    '87039000': 'Outros automóveis de passageiros, incluídos os veículos de uso misto e os automóveis de corrida',
-    '87041010': 'Dumpers concebidos para serem utilizados fora de rodovias',
-    '87041090': 'Dumpers concebidos para serem utilizados fora de rodovias',
-    '87042110': 'Veículos automóveis para transporte de mercadorias, com motor de pistão, de ignição por compressão, de peso em carga máxima <= 5 t',
-    '87042130': 'Veículos automóveis para transporte de mercadorias, com motor de pistão, de ignição por compressão, de peso em carga máxima <= 5 t',
-    '87042190': 'Veículos automóveis para transporte de mercadorias, com motor de pistão, de ignição por compressão, de peso em carga máxima <= 5 t',
-    '87042210': 'Veículos automóveis para transporte de mercadorias, com motor de pistão, de ignição por compressão, de peso em carga máxima > 5 t e <= 20 t',
-    '87042220': 'Veículos automóveis para transporte de mercadorias, com motor de pistão, de ignição por compressão, de peso em carga máxima > 5 t e <= 20 t',
-    '87042230': 'Veículos automóveis para transporte de mercadorias, com motor de pistão, de ignição por compressão, de peso em carga máxima > 5 t e <= 20 t',
-    '87042290': 'Veículos automóveis para transporte de mercadorias, com motor de pistão, de ignição por compressão, de peso em carga máxima > 5 t e <= 20 t',
-    '87042310': 'Veículos automóveis para transporte de mercadorias, com motor de pistão, de ignição por compressão, de peso em carga máxima > 20 t',
-    '87042320': 'Veículos automóveis para transporte de mercadorias, com motor de pistão, de ignição por compressão, de peso em carga máxima > 20 t',
-    '87042330': 'Veículos automóveis para transporte de mercadorias, com motor de pistão, de ignição por compressão, de peso em carga máxima > 20 t',
-    '87042340': 'Veículos automóveis para transporte de mercadorias, com motor de pistão, de ignição por compressão, de peso em carga máxima > 20 t',
-    '87042390': 'Veículos automóveis para transporte de mercadorias, com motor de pistão, de ignição por compressão, de peso em carga máxima > 20 t',
-    '87043110': 'Veículos automóveis para transporte de mercadorias, com motor de pistão, de ignição por centelha, de peso em carga máxima <= 5 t',
-    '87043190': 'Veículos automóveis para transporte de mercadorias, com motor de pistão, de ignição por centelha, de peso em carga máxima <= 5 t',
-    '87043210': 'Veículos automóveis para transporte de mercadorias, com motor de pistão, de ignição por centelha, de peso em carga máxima > 5 t',
-    '87043220': 'Veículos automóveis para transporte de mercadorias, com motor de pistão, de ignição por centelha, de peso em carga máxima > 5 t',
-    '87043230': 'Veículos automóveis para transporte de mercadorias, com motor de pistão, de ignição por centelha, de peso em carga máxima > 5 t',
-    '87043290': 'Veículos automóveis para transporte de mercadorias, com motor de pistão, de ignição por centelha, de peso em carga máxima > 5 t',
-    '87044100': 'Outros veículos automóveis para transporte de mercadorias, equipados para propulsão, simultaneamente, com motor de pistão de ignição por compressão (diesel ou semidiesel) e motor elétrico, de peso em carga máxima (bruto) não superior a 5 toneladas',
-    '87046000': 'Outros veículos motorizados para o transporte de mercadorias, com apenas motor elétrico para a propulsão',
-    '87049000': 'Outros veículos automóveis para transporte de mercadorias',
-    '87051010': 'Caminhões-guindastes',
-    '87051030': 'Caminhões-guindastes',
-    '87051090': 'Caminhões-guindastes',
-    '87053000': 'Veículos automóveis de combate a incêndios',
-    '87054000': 'Caminhões-betoneiras',
-    '87059010': 'Outros veículos automóveis para usos especiais',
-    '87059090': 'Outros veículos automóveis para usos especiais',
-    '87060010': 'Chassis com motor para veículos automóveis das posições 8701 a 8705',
-    '87060020': 'Chassis com motor para veículos automóveis das posições 8701 a 8705',
-    '87060090': 'Chassis com motor para veículos automóveis das posições 8701 a 8705',
-    '87071000': 'Carroçarias para os veículos da posição 8703, incluídas as cabinas',
-    '87079010': 'Outras carroçarias para tratores, veículos automóveis para transporte de ao menos 10 passageiros, para carga ou usos especiais',
-    '87079090': 'Outras carroçarias para tratores, veículos automóveis para transporte de ao menos 10 passageiros, para carga ou usos especiais',
-    '87081000': 'Pára-choques e suas partes, para veículos automóveis das posições 87.01 a 87.05',
-    '87082100': 'Cintos de segurança, para veículos automóveis das posições 87.01 a 87.05',
-    '87082200': 'Pára-brisas dianteiros (pára-brisas), vidros traseiros e outros vidros especificados na Nota de Subposição 1 deste Capítulo',
-    '87082911': 'Outras partes e acessórios de carroçarias (incluídas as cabinas) para veículos automóveis das posições 8701 a 8705',
-    '87082912': 'Outras partes e acessórios de carroçarias (incluídas as cabinas) para veículos automóveis das posições 8701 a 8705',
-    '87082913': 'Outras partes e acessórios de carroçarias (incluídas as cabinas) para veículos automóveis das posições 8701 a 8705',
-    '87082914': 'Outras partes e acessórios de carroçarias (incluídas as cabinas) para veículos automóveis das posições 8701 a 8705',
-    '87082919': 'Outras partes e acessórios de carroçarias (incluídas as cabinas) para veículos automóveis das posições 8701 a 8705',
-    '87082991': 'Outras partes e acessórios de carroçarias (incluídas as cabinas) para veículos automóveis das posições 8701 a 8705',
-    '87082992': 'Outras partes e acessórios de carroçarias (incluídas as cabinas) para veículos automóveis das posições 8701 a 8705',
-    '87082993': 'Outras partes e acessórios de carroçarias (incluídas as cabinas) para veículos automóveis das posições 8701 a 8705',
-    '87082994': 'Outras partes e acessórios de carroçarias (incluídas as cabinas) para veículos automóveis das posições 8701 a 8705',
-    '87082995': 'Outras partes e acessórios de carroçarias (incluídas as cabinas) para veículos automóveis das posições 8701 a 8705',
-    '87082999': 'Outras partes e acessórios de carroçarias (incluídas as cabinas) para veículos automóveis das posições 8701 a 8705',
-    '87083011': 'Freios e servo-freios, suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87083019': 'Freios e servo-freios, suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87083090': 'Freios e servo-freios, suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87084011': 'Caixas de marchas (velocidade) e suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87084019': 'Caixas de marchas (velocidade) e suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87084080': 'Caixas de marchas (velocidade) e suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87084090': 'Caixas de marchas (velocidade) e suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87085011': 'Eixos de transmissão com diferencial, mesmo providos de outros órgãos de transmissão, e suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87085012': 'Eixos de transmissão com diferencial, mesmo providos de outros órgãos de transmissão, e suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87085019': 'Eixos de transmissão com diferencial, mesmo providos de outros órgãos de transmissão, e suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87085080': 'Eixos de transmissão com diferencial, mesmo providos de outros órgãos de transmissão, e suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87085091': 'Eixos de transmissão com diferencial, mesmo providos de outros órgãos de transmissão, e suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87085099': 'Eixos de transmissão com diferencial, mesmo providos de outros órgãos de transmissão, e suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87087010': 'Rodas, suas partes e acessórios, para veículos automóveis das posições 87.01 a 87.05',
-    '87087090': 'Rodas, suas partes e acessórios, para veículos automóveis das posições 87.01 a 87.05',
-    '87088000': 'Sistemas de suspensão e suas partes (incluídos os amortecedores de suspensão), para veículos automóveis das posições 87.01 a 87.05',
-    '87089100': 'Radiadores e suas partes, para veículos automóveis das posições 87.01 a 87.05',
-    '87089200': 'Silenciosos e tubos de escape, e suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87089300': 'Embreagens e suas partes, para veículos automóveis das posições 87.01 a 87.05',
-    '87089411': 'Volantes, barras, caixas de direção, e suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87089412': 'Volantes, barras, caixas de direção, e suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87089413': 'Volantes, barras, caixas de direção, e suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87089481': 'Volantes, barras, caixas de direção, e suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87089482': 'Volantes, barras, caixas de direção, e suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87089483': 'Volantes, barras, caixas de direção, e suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87089490': 'Volantes, barras, caixas de direção, e suas partes, para veículos automóveis das posições 8701 a 8705',
-    '87089510': 'Bolsas infláveis de segurança com sistema de insuflação (airbags " "), suas partes, para veículos automóveis das posições 8701 a 8705 "',
-    '87089521': 'Bolsas infláveis de segurança com sistema de insuflação (airbags " "), suas partes, para veículos automóveis das posições 8701 a 8705 "',
-    '87089522': 'Bolsas infláveis de segurança com sistema de insuflação (airbags " "), suas partes, para veículos automóveis das posições 8701 a 8705 "',
-    '87089529': 'Bolsas infláveis de segurança com sistema de insuflação (airbags " "), suas partes, para veículos automóveis das posições 8701 a 8705 "',
-    '87089910': 'Outras partes e acessórios, para veículos automóveis das posições 8701 a 8705',
-    '87089990': 'Outras partes e acessórios, para veículos automóveis das posições 8701 a 8705',
-    '87091100': 'Veículos automóveis, elétricos, sem dispositivo de elevação, para transporte de mercadorias a curtas distâncias',
-    '87091900': 'Outros veículos automóveis, sem dispositivo de elevação, para transporte de mercadorias a curtas distâncias',
-    '87099000': 'Partes de veículos automóveis, sem dispositivo de elevação, para transporte de mercadorias a curtas distâncias',
-    '87111000': 'Motocicletas e outros ciclos equipados com motor de pistão alternativo de cilindrada <= 50 cm3',
-    '87112010': 'Motocicletas e outros ciclos com motor de pistão alternativo, de cilindrada > 50 cm3 e <= 250 cm3',
-    '87112020': 'Motocicletas e outros ciclos com motor de pistão alternativo, de cilindrada > 50 cm3 e <= 250 cm3',
-    '87112090': 'Motocicletas e outros ciclos com motor de pistão alternativo, de cilindrada > 50 cm3 e <= 250 cm3',
-    '87113000': 'Motocicletas e outros ciclos com motor de pistão alternativo, de cilindrada > 250 cm3 e <= 500 cm3',
-    '87114000': 'Motocicletas e outros ciclos com motor de pistão alternativo, de cilindrada > 500 cm3 e <= 800 cm3',
-    '87115000': 'Motocicletas e outros ciclos com motor de pistão alternativo de cilindrada > 800 cm3',
-    '87116000': 'Motocicletas (incluindo os ciclomotores) e outros ciclos equipados com motor auxiliar, mesmo com carro lateral, com motor elétrico para propulsão',
-    '87119000': 'Outras motocicletas (incluídos os ciclomotores) e outros ciclos equipados com motor auxiliar, mesmo com carro lateral; carros laterais',
-    '87120010': 'Bicicletas e outros ciclos (incluídos os triciclos), sem motor',
-    '87120090': 'Bicicletas e outros ciclos (incluídos os triciclos), sem motor',
-    '87131000': 'Cadeiras de rodas e outros veículos para inválidos, sem mecanismo de propulsão',
-    '87139000': 'Cadeiras de rodas e outros veículos para inválidos, com motor ou outro mecanismo de propulsão',
-    '87141000': 'Partes e acessórios de motocicletas (inclusive ciclomotores)',
-    '87142000': 'Partes e acessórios para cadeiras de rodas ou outros veículos para inválidos',
-    '87149100': 'Quadros, garfos e suas partes, para bicicletas e outros ciclos',
-    '87149200': 'Aros e raios para bicicletas e outros ciclos',
-    '87149310': 'Cubos, exceto de freios (travões), e pinhões de rodas livres, para bicicletas e outros ciclos',
-    '87149311': 'Cubos, exceto de freios (travões), e pinhões de rodas livres, para bicicletas e outros ciclos',
-    '87149319': 'Cubos, exceto de freios (travões), e pinhões de rodas livres, para bicicletas e outros ciclos',
-    '87149320': 'Cubos, exceto de freios (travões), e pinhões de rodas livres, para bicicletas e outros ciclos',
-    '87149410': 'Outros freios (travões), incluídos os cubos de freios, e suas partes, para bicicletas e outros ciclos',
-    '87149490': 'Outros freios (travões), incluídos os cubos de freios, e suas partes, para bicicletas e outros ciclos',
-    '87149500': 'Selins de bicicletas e outros ciclos',
-    '87149600': 'Pedais e pedaleiros e suas partes, para bicicletas e outros ciclos',
-    '87149611': 'Pedais e pedaleiros e suas partes, para bicicletas e outros ciclos',
-    '87149612': 'Pedais e pedaleiros e suas partes, para bicicletas e outros ciclos',
-    '87149619': 'Pedais e pedaleiros e suas partes, para bicicletas e outros ciclos',
-    '87149690': 'Pedais e pedaleiros e suas partes, para bicicletas e outros ciclos',
-    '87149910': 'Outras partes e acessórios para bicicletas e outros ciclos',
-    '87149990': 'Outras partes e acessórios para bicicletas e outros ciclos',
-    '87150000': 'Carrinhos e veículos semelhantes e suas partes, para transporte de crianças',
-    '87161000': 'Reboques e semi-reboques, para habitação ou para acampar, do tipo trailer',
-    '87162000': 'Reboques e semi-reboques, autocarregáveis ou autodescarregáveis, para usos agrícolas',
-    '87163100': 'Reboques-cisternas para transporte de mercadorias',
-    '87163900': 'Outros reboques e semi-reboques, para transporte de mercadorias',
-    '87164000': 'Outros reboques e semi-reboques',
-    '87168000': 'Outros veículos não autopropulsores',
-    '87169010': 'Partes de reboques e semi-reboques, para quaisquer veículos e outros veículos não autopropulsores',
-    '87169090': 'Partes de reboques e semi-reboques, para quaisquer veículos e outros veículos não autopropulsores',
-    '88010000': 'Balões e dirigíveis; planadores, asas voadoras e outros veículos aéreos, não concebidos para propulsão com motor',
-    '88021100': 'Helicópteros, de peso <= 2.000 kg, vazios',
-    '88021210': 'Helicópteros, de peso > 2.000 kg, vazios',
-    '88021290': 'Helicópteros, de peso > 2.000 kg, vazios',
-    '88022010': 'Aviões e outros veículos aéreos, de peso <= 2.000 kg, vazios',
-    '88022021': 'Aviões e outros veículos aéreos, de peso <= 2.000 kg, vazios',
-    '88022022': 'Aviões e outros veículos aéreos, de peso <= 2.000 kg, vazios',
-    '88022090': 'Aviões e outros veículos aéreos, de peso <= 2.000 kg, vazios',
-    '88023010': 'Aviões e outros veículos aéreos, de peso > 2.000 kg e <= 15.000 kg, vazios',
-    '88023021': 'Aviões e outros veículos aéreos, de peso > 2.000 kg e <= 15.000 kg, vazios',
-    '88023029': 'Aviões e outros veículos aéreos, de peso > 2.000 kg e <= 15.000 kg, vazios',
-    '88023031': 'Aviões e outros veículos aéreos, de peso > 2.000 kg e <= 15.000 kg, vazios',
-    '88023039': 'Aviões e outros veículos aéreos, de peso > 2.000 kg e <= 15.000 kg, vazios',
-    '88023090': 'Aviões e outros veículos aéreos, de peso > 2.000 kg e <= 15.000 kg, vazios',
-    '88024090': 'Aviões e outros veículos aéreos, de peso > 15.000 kg, vazios',
-    '88026000': 'Veículos espaciais (incluídos os satélites) e seus veículos de lançamento e veículos suborbitais',
-    '88031000': 'Hélices e rotores, e suas partes, para veículos aéreos',
-    '88032000': 'Trens de aterrissagem e suas partes, para veículos aéreos',
-    '88033000': 'Outras partes para aviões ou helicópteros',
-    '88039000': 'Outras partes para outros veículos aéreos e espaciais',
-    '88040000': 'Pára-quedas (incluídos os dirigíveis e os parapentes) e os pára-quedas giratórios, suas partes e acessórios',
-    '88051000': 'Aparelhos e dispositivos para lançamento de veículos aéreos; aparelhos e dispositivos para aterrissagem de veículos aéreos em porta-aviões e aparelhos e dispositivos semelhantes; aparelhos de treinamento de vôo em terra; suas partes',
-    '88052100': 'Simuladores de combate aéreo e suas partes',
-    '88052900': 'Outros aparelhos de treinamento de voo em terra, e suas partes',
-    '88062100': 'Outras aeronaves não tripuladas, somente para vôos com controle remoto, com peso máximo de decolagem não superior a 250 g',
-    '88062200': 'Outras aeronaves não tripuladas, somente para vôos com controle remoto, com peso máximo de decolagem superior a 250 g mas não superior a 7 kg',
-    '88062300': 'Outras aeronaves não tripuladas, somente para vôos com controle remoto, com peso máximo de decolagem superior a 7 kg mas não superior a 25 kg',
-    '88062400': 'Outras aeronaves não tripuladas, somente para vôos com controle remoto, com peso máximo de decolagem superior a 25 kg mas não superior a 150 kg',
-    '88069200': 'Outras aeronaves não tripuladas, com peso máximo de decolagem superior a 250 g, mas não superior a 7 kg',
-    '88069300': 'Outras aeronaves não tripuladas, com peso máximo de decolagem superior a 7 kg mas não superior a 25 kg',
-    '88069900': 'Outras aeronaves não tripuladas, não classificadas em códigos anteriores',
-    '88071000': 'Hélices e rotores e suas partes de produtos das posições 88.01, 88.02 ou 88.06',
-    '88072000': 'Carrocerias e suas partes de produtos das posições 88.01, 88.02 ou 88.06',
-    '88073000': 'Outras partes de aviões, helicópteros ou aviões não tripulados das posições 88.01, 88.02 ou 88.06',
-    '88079000': 'Outras partes de produtos das posições 88.01, 88.02 ou 88.06, não classificadas nos códigos anteriores',
-    '89011000': 'Transatlânticos, barcos de cruzeiro e embarcações semelhantes para o transporte de pessoas, ferry-boats',
-    '89012000': 'Navios-tanque',
-    '89019000': 'Outras embarcações para o transporte de mercadorias ou de pessoas e de mercadorias',
-    '89020010': 'Barcos de pesca; navios-fábricas e outras embarcações para o tratamento ou conservação de produtos da pesca',
-    '89020090': 'Barcos de pesca; navios-fábricas e outras embarcações para o tratamento ou conservação de produtos da pesca',
-    '89031000': 'Barcos infláveis de recreio ou de esporte',
-    '89031100': 'Barcos infláveis (incluindo casco rígido inflável) equipados ou projetados para serem equipados com motor, sem carga (peso líquido) (excluindo o motor) que não exceda 100 kg',
-    '89031200': 'Embarcações infláveis (incluindo casco rígido inflável) não projetadas para uso com motor e peso sem carga (líquido) não superior a 100 kg',
-    '89031900': 'Outros barcos infláveis (incluindo casco rígido inflável), não classificados nos códigos anteriores',
-    '89032100': 'Veleiros, exceto infláveis, com ou sem motor auxiliar de comprimento não superior a 7,5 m',
-    '89032300': 'Veleiros, exceto infláveis, com ou sem motor auxiliar, de comprimento superior a 24 m',
-    '89033100': 'Barcos a motor, exceto infláveis, não incluindo barcos a motor fora de borda de comprimento não superior a 7,5 m',
-    '89033200': 'Barcos a motor, exceto infláveis, não incluindo barcos a motor fora de borda de comprimento superior a 7,5 m mas não superior a 24 m',
-    '89033300': 'Barcos a motor, exceto infláveis, exceto barcos a motor de popa, de comprimento superior a 24 m',
-    '89039100': 'Barcos a vela, de recreio ou de esporte, mesmo com motor auxiliar',
-    '89039200': 'Barcos a motor, de recreio ou de esporte, exceto com motor fora-de-borda (tipo out-board)',
-    '89039300': 'Outros iates e outras embarcações de recreio ou esporte; outros barcos a remo e canoas; de comprimento não superior a 7,5 m',
-    '89039900': 'Outros barcos e embarcações de recreio ou de esporte; barcos a remo e canoas',
-    '89040000': 'Rebocadores e barcos para empurrar outras embarcações',
-    '89051000': 'Dragas',
-    '89052000': 'Plataformas de perfuração ou de exploração, flutuantes ou submersíveis',
-    '89059000': 'Barcos-faróis, guindastes, docas, diques flutuantes e outras embarcações em que a navegação e acessória da função principal',
-    '89061000': 'Navios de guerra',
-    '89069000': 'Outras embarcações, incluídos os barcos salva-vidas, exceto os barcos a remo',
-    '89071000': 'Balsas infláveis',
-    '89079000': 'Outras estruturas flutuantes',
-    '89080000': 'Embarcações e outras estruturas flutuantes, para demolição',
-    '90011011': 'Fibras ópticas, feixes e cabos de fibras ópticas',
-    '90011019': 'Fibras ópticas, feixes e cabos de fibras ópticas',
-    '90011020': 'Fibras ópticas, feixes e cabos de fibras ópticas',
-    '90012000': 'Matérias polarizantes, em folhas e placas',
-    '90013000': 'Lentes de contato',
-    '90014000': 'Lentes de vidro, para óculos',
-    '90015000': 'Lentes de outras matérias, para óculos',
-    '90019010': 'Prismas, espelhos e outros elementos de óptica, de qualquer matéria, não montados',
-    '90019090': 'Prismas, espelhos e outros elementos de óptica, de qualquer matéria, não montados',
-    '90021110': 'Lentes objetivas, montadas, para câmeras, para projetores ou para aparelhos fotográficos ou cinematográficos, de ampliação ou de redução',
-    '90021111': 'Lentes objetivas, montadas, para câmeras, para projetores ou para aparelhos fotográficos ou cinematográficos, de ampliação ou de redução',
-    '90021119': 'Lentes objetivas, montadas, para câmeras, para projetores ou para aparelhos fotográficos ou cinematográficos, de ampliação ou de redução',
-    '90021120': 'Lentes objetivas, montadas, para câmeras, para projetores ou para aparelhos fotográficos ou cinematográficos, de ampliação ou de redução',
-    '90021190': 'Lentes objetivas, montadas, para câmeras, para projetores ou para aparelhos fotográficos ou cinematográficos, de ampliação ou de redução',
-    '90021900': 'Outras lentes objetivas, montadas',
-    '90022010': 'Filtros ópticos, montados',
-    '90022090': 'Filtros ópticos, montados',
-    '90029000': 'Outros elementos de óptica, de qualquer matéria, montados',
-    '90029090': 'Outros elementos de óptica, de qualquer matéria, montados',
-    '90031100': 'Armações para óculos e artigos semelhantes, de plásticos',
-    '90031910': 'Armações para óculos e artigos semelhantes, de outras matérias',
-    '90031990': 'Armações para óculos e artigos semelhantes, de outras matérias',
-    '90039010': 'Partes para armações de óculos e artigos semelhantes',
-    '90039090': 'Partes para armações de óculos e artigos semelhantes',
-    '90041000': 'Óculos de sol',
-    '90049010': 'Óculos para correção, proteção ou outros fins, e artigos semelhantes',
-    '90049020': 'Óculos para correção, proteção ou outros fins, e artigos semelhantes',
-    '90049090': 'Óculos para correção, proteção ou outros fins, e artigos semelhantes',
-    '90051000': 'Binóculos',
-    '90058000': 'Lunetas e outros instrumentos de astronomia e suas armações',
-    '90059010': 'Partes e acessórios de lunetas e outros instrumentos de astronomia e suas armações',
-    '90059090': 'Partes e acessórios de lunetas e outros instrumentos de astronomia e suas armações',
-    '90063000': 'Câmeras fotográficas para fotografia submarina ou aérea, para exame médico de órgão internos, para laboratórios de medicina legal ou investigação judicial',
-    '90064000': 'Câmeras fotográficas para filmes de revelação e copiagem instantâneas',
-    '90065200': 'Outras câmeras fotográficas para películas, em rolos, de largura < 35 mm',
-    '90065310': 'Outras câmeras fotográficas para películas, em rolos, de largura = 35 mm',
-    '90065320': 'Outras câmeras fotográficas para películas, em rolos, de largura = 35 mm',
-    '90065930': 'Outras câmeras fotográficas',
-    '90065940': 'Outras câmeras fotográficas',
-    '90065959': 'Outras câmeras fotográficas',
-    '90066100': 'Aparelhos de tubo de descarga para produção de luz-relâmpago (flashes eletrônicos)',
-    '90066900': 'Outros aparelhos e dispositivos de luz-relâmpago para fotografia',
-    '90069110': 'Partes e acessórios de aparelhos fotográficos',
-    '90069190': 'Partes e acessórios de aparelhos fotográficos',
-    '90069900': 'Outras partes e acessórios para aparelhos e dispositivos para fotografia',
-    '90071000': 'Câmeras',
-    '90072090': 'Projetores cinematográficos',
-    '90079100': 'Partes e acessórios de câmeras cinematográficas',
-    '90079200': 'Partes e acessórios de projetores cinematográficos',
-    '90085000': 'Projetores e aparelhos de ampliação ou redução',
-    '90101010': 'Aparelhos e material para revelação automática de películas fotográficas, de filmes cinematográficos ou de papel fotográfico, em rolos, ou para copiagem automática de películas reveladas em rolos de papel fotográfico',
-    '90101090': 'Aparelhos e material para revelação automática de películas fotográficas, de filmes cinematográficos ou de papel fotográfico, em rolos, ou para copiagem automática de películas reveladas em rolos de papel fotográfico',
-    '90105010': 'Outros aparelhos e material para laboratórios fotográficos ou cinematográficos; negatoscópios',
-    '90105090': 'Outros aparelhos e material para laboratórios fotográficos ou cinematográficos; negatoscópios',
-    '90106000': 'Telas (écran) para projeção fotográfica ou cinematográfica',
-    '90109010': 'Partes e acessórios para aparelhos utilizados nos laboratórios fotográficos ou cinematográficos, para negatoscópios e telas de projeção',
-    '90109090': 'Partes e acessórios para aparelhos utilizados nos laboratórios fotográficos ou cinematográficos, para negatoscópios e telas de projeção',
-    '90111000': 'Microscópios estereoscópicos',
-    '90112010': 'Outros microscópios, para fotomicrografia, cinefotomicrografia ou microprojeção',
-    '90112020': 'Outros microscópios, para fotomicrografia, cinefotomicrografia ou microprojeção',
-    '90112030': 'Outros microscópios, para fotomicrografia, cinefotomicrografia ou microprojeção',
-    '90118010': 'Outros microscópios ópticos',
-    '90118090': 'Outros microscópios ópticos',
-    '90119010': 'Partes e acessórios para microscópios ópticos',
-    '90119090': 'Partes e acessórios para microscópios ópticos',
-    '90121010': 'Microscópios (exceto ópticos) e difratógrafos',
-    '90121090': 'Microscópios (exceto ópticos) e difratógrafos',
-    '90129010': 'Partes e acessórios para microscópios, exceto ópticos, e difratógrafos',
-    '90129090': 'Partes e acessórios para microscópios, exceto ópticos, e difratógrafos',
-    '90131010': 'Miras telescópicas para armas; periscópios; lunetas para máquinas, aparelhos ou instrumentos ópticos do presente capítulo ou da seção XVI',
-    '90131090': 'Miras telescópicas para armas; periscópios; lunetas para máquinas, aparelhos ou instrumentos ópticos do presente capítulo ou da seção XVI',
-    '90132000': 'Lasers, exceto os diodos laser',
-    '90138000': 'Outros dispositivos de cristais líquidos e outros aparelhos e instrumentos ópticos',
-    '90138010': 'Outros dispositivos de cristais líquidos e outros aparelhos e instrumentos ópticos',
-    '90138090': 'Outros dispositivos de cristais líquidos e outros aparelhos e instrumentos ópticos',
-    '90139000': 'Partes e acessórios de miras telescópicas, periscópios, lunetas, lasers e dispositivos de cristais líquidos',
-    '90141000': 'Bússolas, incluídas as agulhas de marear',
-    '90142010': 'Instrumentos e aparelhos para navegação aérea ou espacial (exceto bússolas)',
-    '90142020': 'Instrumentos e aparelhos para navegação aérea ou espacial (exceto bússolas)',
-    '90142030': 'Instrumentos e aparelhos para navegação aérea ou espacial (exceto bússolas)',
-    '90142090': 'Instrumentos e aparelhos para navegação aérea ou espacial (exceto bússolas)',
-    '90148010': 'Outros aparelhos e instrumentos para navegação',
-    '90148090': 'Outros aparelhos e instrumentos para navegação',
-    '90149000': 'Partes e acessórios para instrumentos e aparelhos de navegação',
-    '90151000': 'Telêmetros',
-    '90152010': 'Teodolitos e taqueômetros',
-    '90152090': 'Teodolitos e taqueômetros',
-    '90153000': 'Níveis',
-    '90154000': 'Instrumentos e aparelhos de fotogrametria',
-    '90158010': 'Outros instrumentos e aparelhos de geodésia, topografia, hidrografia, oceanografia, meteorologia ou de geofísica',
-    '90158090': 'Outros instrumentos e aparelhos de geodésia, topografia, hidrografia, oceanografia, meteorologia ou de geofísica',
-    '90159010': 'Partes e acessórios de instrumentos e aparelhos de geodésia, topografia, hidrografia, oceanografia, meteorologia ou de geofísica',
-    '90159090': 'Partes e acessórios de instrumentos e aparelhos de geodésia, topografia, hidrografia, oceanografia, meteorologia ou de geofísica',
-    '90160010': 'Balanças sensíveis a pesos <= 5 cg, com ou sem pesos',
-    '90160090': 'Balanças sensíveis a pesos <= 5 cg, com ou sem pesos',
-    '90171010': 'Mesas e máquinas de desenhar, mesmo automáticas',
-    '90171090': 'Mesas e máquinas de desenhar, mesmo automáticas',
-    '90172000': 'Outros instrumentos de desenho, de traçado ou de cálculo',
-    '90173010': 'Micrômetros, paquímetros; calibres e semelhantes (instrumentos de medida de distância, de uso manual)',
-    '90173020': 'Micrômetros, paquímetros; calibres e semelhantes (instrumentos de medida de distância, de uso manual)',
-    '90173090': 'Micrômetros, paquímetros; calibres e semelhantes (instrumentos de medida de distância, de uso manual)',
-    '90178010': 'Outros instrumentos de medida de distâncias de uso manual',
-    '90178090': 'Outros instrumentos de medida de distâncias de uso manual',
-    '90179010': 'Partes e acessórios de instrumentos de desenho, cálculo ou de medida de distância, de uso manual',
-    '90179090': 'Partes e acessórios de instrumentos de desenho, cálculo ou de medida de distância, de uso manual',
-    '90181100': 'Eletrocardiógrafos',
-    '90181210': 'Aparelhos de diagnóstico por varredura ultra-sônica (scanners)',
-    '90181290': 'Aparelhos de diagnóstico por varredura ultra-sônica (scanners)',
-    '90181300': 'Aparelhos de diagnóstico por visualização de ressonância magnética',
-    '90181410': 'Aparelhos de cintilografia',
-    '90181420': 'Aparelhos de cintilografia',
-    '90181490': 'Aparelhos de cintilografia',
-    '90181910': 'Outros aparelhos de eletrodiagnóstico',
-    '90181920': 'Outros aparelhos de eletrodiagnóstico',
-    '90181980': 'Outros aparelhos de eletrodiagnóstico',
-    '90181990': 'Outros aparelhos de eletrodiagnóstico',
-    '90182010': 'Aparelhos de raios ultravioleta ou infravermelhos, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90182020': 'Aparelhos de raios ultravioleta ou infravermelhos, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90182090': 'Aparelhos de raios ultravioleta ou infravermelhos, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90183111': 'Seringas, mesmo com agulhas, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90183119': 'Seringas, mesmo com agulhas, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90183190': 'Seringas, mesmo com agulhas, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90183211': 'Agulhas tubulares de metal e agulhas para suturas, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90183212': 'Agulhas tubulares de metal e agulhas para suturas, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90183219': 'Agulhas tubulares de metal e agulhas para suturas, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90183220': 'Agulhas tubulares de metal e agulhas para suturas, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90183910': 'Outras agulhas, cateteres, sondas e semelhantes, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90183921': 'Outras agulhas, cateteres, sondas e semelhantes, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90183922': 'Outras agulhas, cateteres, sondas e semelhantes, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90183923': 'Outras agulhas, cateteres, sondas e semelhantes, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90183924': 'Outras agulhas, cateteres, sondas e semelhantes, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90183926': 'Outras agulhas, cateteres, sondas e semelhantes, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90183929': 'Outras agulhas, cateteres, sondas e semelhantes, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90183930': 'Outras agulhas, cateteres, sondas e semelhantes, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90183991': 'Outras agulhas, cateteres, sondas e semelhantes, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90183999': 'Outras agulhas, cateteres, sondas e semelhantes, para uso médico, cirúrgico, odontológico ou veterinário',
-    '90184100': 'Aparelhos dentários de brocar, mesmo combinados com outros equipamentos dentários',
-    '90184911': 'Outros instrumentos e aparelhos para odontologia',
-    '90184912': 'Outros instrumentos e aparelhos para odontologia',
-    '90184919': 'Outros instrumentos e aparelhos para odontologia',
-    '90184920': 'Outros instrumentos e aparelhos para odontologia',
-    '90184940': 'Outros instrumentos e aparelhos para odontologia',
-    '90184991': 'Outros instrumentos e aparelhos para odontologia',
-    '90184999': 'Outros instrumentos e aparelhos para odontologia',
-    '90185010': 'Outros instrumentos e aparelhos para oftalmologia',
-    '90185090': 'Outros instrumentos e aparelhos para oftalmologia',
-    '90189010': 'Outros instrumentos e aparelhos para medicina, cirurgia ou veterinária',
-    '90189021': 'Outros instrumentos e aparelhos para medicina, cirurgia ou veterinária',
-    '90189029': 'Outros instrumentos e aparelhos para medicina, cirurgia ou veterinária',
-    '90189031': 'Outros instrumentos e aparelhos para medicina, cirurgia ou veterinária',
-    '90189039': 'Outros instrumentos e aparelhos para medicina, cirurgia ou veterinária',
-    '90189040': 'Outros instrumentos e aparelhos para medicina, cirurgia ou veterinária',
-    '90189050': 'Outros instrumentos e aparelhos para medicina, cirurgia ou veterinária',
-    '90189061': 'Outros instrumentos e aparelhos para medicina, cirurgia ou veterinária',
-    '90189069': 'Outros instrumentos e aparelhos para medicina, cirurgia ou veterinária',
-    '90189091': 'Outros instrumentos e aparelhos para medicina, cirurgia ou veterinária',
-    '90189092': 'Outros instrumentos e aparelhos para medicina, cirurgia ou veterinária',
-    '90189094': 'Outros instrumentos e aparelhos para medicina, cirurgia ou veterinária',
-    '90189095': 'Outros instrumentos e aparelhos para medicina, cirurgia ou veterinária',
-    '90189096': 'Outros instrumentos e aparelhos para medicina, cirurgia ou veterinária',
-    '90189099': 'Outros instrumentos e aparelhos para medicina, cirurgia ou veterinária',
-    '90191000': 'Aparelhos de mecanoterapia, de massagem ou de psicotécnica',
-    '90192010': 'Aparelhos de ozonoterapia, de oxigenoterapia, de aerossolterapia e outros de terapia respiratória',
-    '90192020': 'Aparelhos de ozonoterapia, de oxigenoterapia, de aerossolterapia e outros de terapia respiratória',
-    '90192030': 'Aparelhos de ozonoterapia, de oxigenoterapia, de aerossolterapia e outros de terapia respiratória',
-    '90192040': 'Aparelhos de ozonoterapia, de oxigenoterapia, de aerossolterapia e outros de terapia respiratória',
-    '90192090': 'Aparelhos de ozonoterapia, de oxigenoterapia, de aerossolterapia e outros de terapia respiratória',
-    '90200010': 'Outros aparelhos respiratórios e máscaras contra gases, exceto as de proteção desprovidas de mecanismo e de elemento filtrante amovível',
-    '90200090': 'Outros aparelhos respiratórios e máscaras contra gases, exceto as de proteção desprovidas de mecanismo e de elemento filtrante amovível',
-    '90211010': 'Artigos e aparelhos ortopédicos ou para fraturas, inclusive partes e acessórios',
-    '90211020': 'Artigos e aparelhos ortopédicos ou para fraturas, inclusive partes e acessórios',
-    '90211091': 'Artigos e aparelhos ortopédicos ou para fraturas, inclusive partes e acessórios',
-    '90211099': 'Artigos e aparelhos ortopédicos ou para fraturas, inclusive partes e acessórios',
-    '90212110': 'Dentes artificiais',
-    '90212190': 'Dentes artificiais',
-    '90212900': 'Outros artigos e aparelhos de prótese dentária',
-    '90213110': 'Próteses articulares',
-    '90213120': 'Próteses articulares',
-    '90213190': 'Próteses articulares',
-    '90213911': 'Válvulas cardíacas, lentes intra-oculares e outros artigos e aparelhos de prótese, inclusive partes e acessórios',
-    '90213919': 'Válvulas cardíacas, lentes intra-oculares e outros artigos e aparelhos de prótese, inclusive partes e acessórios',
-    '90213920': 'Válvulas cardíacas, lentes intra-oculares e outros artigos e aparelhos de prótese, inclusive partes e acessórios',
-    '90213930': 'Válvulas cardíacas, lentes intra-oculares e outros artigos e aparelhos de prótese, inclusive partes e acessórios',
-    '90213940': 'Válvulas cardíacas, lentes intra-oculares e outros artigos e aparelhos de prótese, inclusive partes e acessórios',
-    '90213980': 'Válvulas cardíacas, lentes intra-oculares e outros artigos e aparelhos de prótese, inclusive partes e acessórios',
-    '90213991': 'Válvulas cardíacas, lentes intra-oculares e outros artigos e aparelhos de prótese, inclusive partes e acessórios',
-    '90213999': 'Válvulas cardíacas, lentes intra-oculares e outros artigos e aparelhos de prótese, inclusive partes e acessórios',
-    '90214000': 'Aparelhos para facilitar a audição dos surdos, exceto as partes e acessórios',
-    '90215000': 'Marca-passos (estimuladores) cardíacos, exceto as partes e acessórios',
-    '90219011': 'Outros aparelhos transportados à mão ou sobre as pessoas ou implantados no organismo para compensar deficiências',
-    '90219012': 'Outros aparelhos transportados à mão ou sobre as pessoas ou implantados no organismo para compensar deficiências',
-    '90219013': 'Outros aparelhos transportados à mão ou sobre as pessoas ou implantados no organismo para compensar deficiências',
-    '90219019': 'Outros aparelhos transportados à mão ou sobre as pessoas ou implantados no organismo para compensar deficiências',
-    '90219080': 'Outros aparelhos transportados à mão ou sobre as pessoas ou implantados no organismo para compensar deficiências',
-    '90219081': 'Outros aparelhos transportados à mão ou sobre as pessoas ou implantados no organismo para compensar deficiências',
-    '90219082': 'Outros aparelhos transportados à mão ou sobre as pessoas ou implantados no organismo para compensar deficiências',
-    '90219089': 'Outros aparelhos transportados à mão ou sobre as pessoas ou implantados no organismo para compensar deficiências',
-    '90219091': 'Outros aparelhos transportados à mão ou sobre as pessoas ou implantados no organismo para compensar deficiências',
-    '90219092': 'Outros aparelhos transportados à mão ou sobre as pessoas ou implantados no organismo para compensar deficiências',
-    '90219099': 'Outros aparelhos transportados à mão ou sobre as pessoas ou implantados no organismo para compensar deficiências',
-    '90221200': 'Aparelhos de tomografia computadorizada',
-    '90221311': 'Aparelhos baseados no uso de raios X, para uso odontológico',
-    '90221319': 'Aparelhos baseados no uso de raios X, para uso odontológico',
-    '90221390': 'Aparelhos baseados no uso de raios X, para uso odontológico',
-    '90221411': 'Aparelhos baseados no uso de raios X, para usos médicos, cirúrgicos ou veterinários',
-    '90221412': 'Aparelhos baseados no uso de raios X, para usos médicos, cirúrgicos ou veterinários',
-    '90221413': 'Aparelhos baseados no uso de raios X, para usos médicos, cirúrgicos ou veterinários',
-    '90221419': 'Aparelhos baseados no uso de raios X, para usos médicos, cirúrgicos ou veterinários',
-    '90221490': 'Aparelhos baseados no uso de raios X, para usos médicos, cirúrgicos ou veterinários',
-    '90221910': 'Aparelhos de raios X, de radiofotografia ou de radioterapia, para outros usos',
-    '90221991': 'Aparelhos de raios X, de radiofotografia ou de radioterapia, para outros usos',
-    '90221999': 'Aparelhos de raios X, de radiofotografia ou de radioterapia, para outros usos',
-    '90222110': 'Aparelhos de radiação alfa, beta, gama, para usos médicos, cirúrgicos, odontológicos ou veterinários',
-    '90222190': 'Aparelhos de radiação alfa, beta, gama, para usos médicos, cirúrgicos, odontológicos ou veterinários',
-    '90222990': 'Aparelhos de radiação alfa, beta, gama, para outros usos',
-    '90223000': 'Tubos de raios X',
-    '90229010': 'Outros dispositivos geradores de raios X, mesas de comando, telas de visualização e partes e acessórios da posição 9022',
-    '90229011': 'Outros dispositivos geradores de raios X, mesas de comando, telas de visualização e partes e acessórios da posição 9022',
-    '90229012': 'Outros dispositivos geradores de raios X, mesas de comando, telas de visualização e partes e acessórios da posição 9022',
-    '90229019': 'Outros dispositivos geradores de raios X, mesas de comando, telas de visualização e partes e acessórios da posição 9022',
-    '90229020': 'Outros dispositivos geradores de raios X, mesas de comando, telas de visualização e partes e acessórios da posição 9022',
-    '90229080': 'Outros dispositivos geradores de raios X, mesas de comando, telas de visualização e partes e acessórios da posição 9022',
-    '90229090': 'Outros dispositivos geradores de raios X, mesas de comando, telas de visualização e partes e acessórios da posição 9022',
-    '90229091': 'Outros dispositivos geradores de raios X, mesas de comando, telas de visualização e partes e acessórios da posição 9022',
-    '90229099': 'Outros dispositivos geradores de raios X, mesas de comando, telas de visualização e partes e acessórios da posição 9022',
-    '90230000': 'Instrumentos, aparelhos e modelos, para demonstração (ensino, exposições) não suscetíveis de outros usos',
-    '90241010': 'Máquinas e aparelhos para ensaios de metais',
-    '90241020': 'Máquinas e aparelhos para ensaios de metais',
-    '90241090': 'Máquinas e aparelhos para ensaios de metais',
-    '90248011': 'Outras máquinas e aparelhos para ensaios de propriedades mecânicas (dureza, tração, elasticidade) de materiais',
-    '90248019': 'Outras máquinas e aparelhos para ensaios de propriedades mecânicas (dureza, tração, elasticidade) de materiais',
-    '90248021': 'Outras máquinas e aparelhos para ensaios de propriedades mecânicas (dureza, tração, elasticidade) de materiais',
-    '90248029': 'Outras máquinas e aparelhos para ensaios de propriedades mecânicas (dureza, tração, elasticidade) de materiais',
-    '90248090': 'Outras máquinas e aparelhos para ensaios de propriedades mecânicas (dureza, tração, elasticidade) de materiais',
-    '90249000': 'Partes e acessórios de máquinas e aparelhos para ensaios de propriedades mecânicas de materiais',
-    '90251110': 'Termômetros e pirômetros, de líquido, de leitura direta, não combinados com outros instrumentos',
-    '90251111': 'Termômetros e pirômetros, de líquido, de leitura direta, não combinados com outros instrumentos',
-    '90251119': 'Termômetros e pirômetros, de líquido, de leitura direta, não combinados com outros instrumentos',
-    '90251190': 'Termômetros e pirômetros, de líquido, de leitura direta, não combinados com outros instrumentos',
-    '90251191': 'Termômetros e pirômetros, de líquido, de leitura direta, não combinados com outros instrumentos',
-    '90251199': 'Termômetros e pirômetros, de líquido, de leitura direta, não combinados com outros instrumentos',
-    '90251910': 'Outros termômetros e pirômetros, não combinados com outros instrumentos',
-    '90251990': 'Outros termômetros e pirômetros, não combinados com outros instrumentos',
-    '90258000': 'Densímetros, areômetros, higrômetros e outros instrumentos semelhantes',
-    '90259010': 'Partes e acessórios de termômetros e outros instrumentos da posição 9025',
-    '90259090': 'Partes e acessórios de termômetros e outros instrumentos da posição 9025',
-    '90261011': 'Instrumentos e aparelhos para medida ou controle de vazão (caudal) ou do nível dos líquidos',
-    '90261019': 'Instrumentos e aparelhos para medida ou controle de vazão (caudal) ou do nível dos líquidos',
-    '90261021': 'Instrumentos e aparelhos para medida ou controle de vazão (caudal) ou do nível dos líquidos',
-    '90261029': 'Instrumentos e aparelhos para medida ou controle de vazão (caudal) ou do nível dos líquidos',
-    '90262010': 'Instrumentos e aparelhos para medida ou controle da pressão dos líquidos ou gases',
-    '90262090': 'Instrumentos e aparelhos para medida ou controle da pressão dos líquidos ou gases',
-    '90268000': 'Outros instrumentos e aparelhos para medida ou controle de líquidos ou gases',
-    '90269010': 'Partes e acessórios para instrumentos e aparelhos para medida ou controle de líquidos ou gases',
-    '90269020': 'Partes e acessórios para instrumentos e aparelhos para medida ou controle de líquidos ou gases',
-    '90269090': 'Partes e acessórios para instrumentos e aparelhos para medida ou controle de líquidos ou gases',
-    '90271000': 'Analisadores de gases ou de fumaça (fumo)',
-    '90272011': 'Cromatógrafos e aparelhos de eletroforese',
-    '90272012': 'Cromatógrafos e aparelhos de eletroforese',
-    '90272019': 'Cromatógrafos e aparelhos de eletroforese',
-    '90272021': 'Cromatógrafos e aparelhos de eletroforese',
-    '90272029': 'Cromatógrafos e aparelhos de eletroforese',
-    '90273011': 'Espectrômetros, espectrofotômetros e espectrógrafos que utilizem radiações ópticas (UV, visíveis, IV)',
-    '90273019': 'Espectrômetros, espectrofotômetros e espectrógrafos que utilizem radiações ópticas (UV, visíveis, IV)',
-    '90273020': 'Espectrômetros, espectrofotômetros e espectrógrafos que utilizem radiações ópticas (UV, visíveis, IV)',
-    '90275010': 'Outros aparelhos e instrumentos para análises físicas ou químicas que utilizem radiações ópticas (uv, visíveis, iv)',
-    '90275020': 'Outros aparelhos e instrumentos para análises físicas ou químicas que utilizem radiações ópticas (uv, visíveis, iv)',
-    '90275030': 'Outros aparelhos e instrumentos para análises físicas ou químicas que utilizem radiações ópticas (uv, visíveis, iv)',
-    '90275040': 'Outros aparelhos e instrumentos para análises físicas ou químicas que utilizem radiações ópticas (uv, visíveis, iv)',
-    '90275050': 'Outros aparelhos e instrumentos para análises físicas ou químicas que utilizem radiações ópticas (uv, visíveis, iv)',
-    '90275090': 'Outros aparelhos e instrumentos para análises físicas ou químicas que utilizem radiações ópticas (uv, visíveis, iv)',
-    '90278011': 'Outros instrumentos e aparelhos para análises físicas ou químicas, para ensaios de viscosidade porosidade, tensão superficial ou semelhantes, ou para medidas calorimétricas, acústicas ou fotométricas (incluídos os indicadores de tempo de exposição)',
-    '90278012': 'Outros instrumentos e aparelhos para análises físicas ou químicas, para ensaios de viscosidade porosidade, tensão superficial ou semelhantes, ou para medidas calorimétricas, acústicas ou fotométricas (incluídos os indicadores de tempo de exposição)',
-    '90278013': 'Outros instrumentos e aparelhos para análises físicas ou químicas, para ensaios de viscosidade porosidade, tensão superficial ou semelhantes, ou para medidas calorimétricas, acústicas ou fotométricas (incluídos os indicadores de tempo de exposição)',
-    '90278014': 'Outros instrumentos e aparelhos para análises físicas ou químicas, para ensaios de viscosidade porosidade, tensão superficial ou semelhantes, ou para medidas calorimétricas, acústicas ou fotométricas (incluídos os indicadores de tempo de exposição)',
-    '90278020': 'Outros instrumentos e aparelhos para análises físicas ou químicas, para ensaios de viscosidade porosidade, tensão superficial ou semelhantes, ou para medidas calorimétricas, acústicas ou fotométricas (incluídos os indicadores de tempo de exposição)',
-    '90278030': 'Outros instrumentos e aparelhos para análises físicas ou químicas, para ensaios de viscosidade porosidade, tensão superficial ou semelhantes, ou para medidas calorimétricas, acústicas ou fotométricas (incluídos os indicadores de tempo de exposição)',
-    '90278091': 'Outros instrumentos e aparelhos para análises físicas ou químicas, para ensaios de viscosidade porosidade, tensão superficial ou semelhantes, ou para medidas calorimétricas, acústicas ou fotométricas (incluídos os indicadores de tempo de exposição)',
-    '90278099': 'Outros instrumentos e aparelhos para análises físicas ou químicas, para ensaios de viscosidade porosidade, tensão superficial ou semelhantes, ou para medidas calorimétricas, acústicas ou fotométricas (incluídos os indicadores de tempo de exposição)',
-    '90278100': 'Espectrômetros de massa',
-    '90278911': 'Outros instrumentos e aparelhos para análises físicas ou químicas (por exemplo, polarímetros, refratômetros, espectrômetros, analisadores de gases ou fumaça); outros instrumentos e aparelhos para medir ou verificar viscosidade, porosidade, expansão, tensão superficial ou similares; outros instrumentos e aparelhos para medir ou verificar quantidades de calor, som ou luz (incluindo medidores de exposição); não classificados nos códigos anteriores',
-    '90278912': 'Outros instrumentos e aparelhos para análises físicas ou químicas (por exemplo, polarímetros, refratômetros, espectrômetros, analisadores de gases ou fumaça); outros instrumentos e aparelhos para medir ou verificar viscosidade, porosidade, expansão, tensão superficial ou similares; outros instrumentos e aparelhos para medir ou verificar quantidades de calor, som ou luz (incluindo medidores de exposição); não classificados nos códigos anteriores',
-    '90278913': 'Outros instrumentos e aparelhos para análises físicas ou químicas (por exemplo, polarímetros, refratômetros, espectrômetros, analisadores de gases ou fumaça); outros instrumentos e aparelhos para medir ou verificar viscosidade, porosidade, expansão, tensão superficial ou similares; outros instrumentos e aparelhos para medir ou verificar quantidades de calor, som ou luz (incluindo medidores de exposição); não classificados nos códigos anteriores',
-    '90278914': 'Outros instrumentos e aparelhos para análises físicas ou químicas (por exemplo, polarímetros, refratômetros, espectrômetros, analisadores de gases ou fumaça); outros instrumentos e aparelhos para medir ou verificar viscosidade, porosidade, expansão, tensão superficial ou similares; outros instrumentos e aparelhos para medir ou verificar quantidades de calor, som ou luz (incluindo medidores de exposição); não classificados nos códigos anteriores',
-    '90278920': 'Outros instrumentos e aparelhos para análises físicas ou químicas (por exemplo, polarímetros, refratômetros, espectrômetros, analisadores de gases ou fumaça); outros instrumentos e aparelhos para medir ou verificar viscosidade, porosidade, expansão, tensão superficial ou similares; outros instrumentos e aparelhos para medir ou verificar quantidades de calor, som ou luz (incluindo medidores de exposição); não classificados nos códigos anteriores',
-    '90278991': 'Outros instrumentos e aparelhos para análises físicas ou químicas (por exemplo, polarímetros, refratômetros, espectrômetros, analisadores de gases ou fumaça); outros instrumentos e aparelhos para medir ou verificar viscosidade, porosidade, expansão, tensão superficial ou similares; outros instrumentos e aparelhos para medir ou verificar quantidades de calor, som ou luz (incluindo medidores de exposição); não classificados nos códigos anteriores',
-    '90278999': 'Outros instrumentos e aparelhos para análises físicas ou químicas (por exemplo, polarímetros, refratômetros, espectrômetros, analisadores de gases ou fumaça); outros instrumentos e aparelhos para medir ou verificar viscosidade, porosidade, expansão, tensão superficial ou similares; outros instrumentos e aparelhos para medir ou verificar quantidades de calor, som ou luz (incluindo medidores de exposição); não classificados nos códigos anteriores',
-    '90279010': 'Micrótomos; partes e acessórios de polarógrafos, espectrômetros, espectrógrafos e outros instrumentos e aparelhos para análises físicas ou químicas',
-    '90279091': 'Micrótomos; partes e acessórios de polarógrafos, espectrômetros, espectrógrafos e outros instrumentos e aparelhos para análises físicas ou químicas',
-    '90279093': 'Micrótomos; partes e acessórios de polarógrafos, espectrômetros, espectrógrafos e outros instrumentos e aparelhos para análises físicas ou químicas',
-    '90279099': 'Micrótomos; partes e acessórios de polarógrafos, espectrômetros, espectrógrafos e outros instrumentos e aparelhos para análises físicas ou químicas',
-    '90281011': 'Contadores de gases',
-    '90281019': 'Contadores de gases',
-    '90281090': 'Contadores de gases',
-    '90282010': 'Contadores de líquidos',
-    '90282020': 'Contadores de líquidos',
-    '90283011': 'Contadores de eletricidade',
-    '90283019': 'Contadores de eletricidade',
-    '90283021': 'Contadores de eletricidade',
-    '90283029': 'Contadores de eletricidade',
-    '90283031': 'Contadores de eletricidade',
-    '90283039': 'Contadores de eletricidade',
-    '90283090': 'Contadores de eletricidade',
-    '90289010': 'Partes e acessórios para contadores de gases, líquidos ou de eletricidade',
-    '90289090': 'Partes e acessórios para contadores de gases, líquidos ou de eletricidade',
-    '90291010': 'Contadores de voltas ou de produção, taxímetros, podômetros e contadores semelhantes',
-    '90291090': 'Contadores de voltas ou de produção, taxímetros, podômetros e contadores semelhantes',
-    '90292010': 'Indicadores de velocidade e tacômetros; estroboscópios',
-    '90292020': 'Indicadores de velocidade e tacômetros; estroboscópios',
-    '90299010': 'Partes e acessórios para instrumentos da posição 9029',
-    '90299090': 'Partes e acessórios para instrumentos da posição 9029',
-    '90301010': 'Instrumentos e aparelhos para medida ou detecção de radiações ionizantes',
-    '90301090': 'Instrumentos e aparelhos para medida ou detecção de radiações ionizantes',
-    '90302010': 'Osciloscópios e oscilógrafos, catódicos',
-    '90302021': 'Osciloscópios e oscilógrafos, catódicos',
-    '90302029': 'Osciloscópios e oscilógrafos, catódicos',
-    '90302030': 'Osciloscópios e oscilógrafos, catódicos',
-    '90303100': 'Multímetros, sem dispositivo registrador',
-    '90303200': 'Multímetros, com dispositivo registrador',
-    '90303311': 'Outros aparelhos e instrumentos para medida ou controle da tensão, intensidade, resistência ou potência, sem dispositivo registrador',
-    '90303319': 'Outros aparelhos e instrumentos para medida ou controle da tensão, intensidade, resistência ou potência, sem dispositivo registrador',
-    '90303321': 'Outros aparelhos e instrumentos para medida ou controle da tensão, intensidade, resistência ou potência, sem dispositivo registrador',
-    '90303329': 'Outros aparelhos e instrumentos para medida ou controle da tensão, intensidade, resistência ou potência, sem dispositivo registrador',
-    '90303390': 'Outros aparelhos e instrumentos para medida ou controle da tensão, intensidade, resistência ou potência, sem dispositivo registrador',
-    '90303910': 'Outros aparelhos e instrumentos para medida ou controle da tensão, intensidade, resistência ou potência, com dispositivo registrador',
-    '90303990': 'Outros aparelhos e instrumentos para medida ou controle da tensão, intensidade, resistência ou potência, com dispositivo registrador',
-    '90304010': 'Instrumentos e aparelhos, especialmente concebidos para telecomunicação',
-    '90304030': 'Instrumentos e aparelhos, especialmente concebidos para telecomunicação',
-    '90304090': 'Instrumentos e aparelhos, especialmente concebidos para telecomunicação',
-    '90308210': 'Instrumentos e aparelhos para medida ou controle de discos (wafers) ou de dispositivos semicondutores',
-    '90308290': 'Instrumentos e aparelhos para medida ou controle de discos (wafers) ou de dispositivos semicondutores',
-    '90308410': 'Outros instrumentos e aparelhos, com dispositivo registrador',
-    '90308420': 'Outros instrumentos e aparelhos, com dispositivo registrador',
-    '90308490': 'Outros instrumentos e aparelhos, com dispositivo registrador',
-    '90308910': 'Outros instrumentos e aparelhos para medida ou verificação de tensão, intensidade, resistência e potência de grandezas elétricas',
-    '90308920': 'Outros instrumentos e aparelhos para medida ou verificação de tensão, intensidade, resistência e potência de grandezas elétricas',
-    '90308930': 'Outros instrumentos e aparelhos para medida ou verificação de tensão, intensidade, resistência e potência de grandezas elétricas',
-    '90308940': 'Outros instrumentos e aparelhos para medida ou verificação de tensão, intensidade, resistência e potência de grandezas elétricas',
-    '90308990': 'Outros instrumentos e aparelhos para medida ou verificação de tensão, intensidade, resistência e potência de grandezas elétricas',
-    '90309010': 'Partes e acessórios para instrumentos e aparelhos das subposições 9030.10/31/39/82/83',
-    '90309090': 'Partes e acessórios para instrumentos e aparelhos das subposições 9030.10/31/39/82/83',
-    '90311000': 'Máquinas de equilibrar peças mecânicas',
-    '90312010': 'Bancos de ensaio',
-    '90312090': 'Bancos de ensaio',
-    '90314100': 'Instrumentos e aparelhos ópticos, para controle de discos (wafers) ou de dispositivos semicondutores ou para controle de máscaras ou retículas utilizadas na fabricação de dispositivos semicondutores',
-    '90314910': 'Outros instrumentos e aparelhos ópticos',
-    '90314920': 'Outros instrumentos e aparelhos ópticos',
-    '90314990': 'Outros instrumentos e aparelhos ópticos',
-    '90318011': 'Outros instrumentos, aparelhos e máquinas de medida ou controle',
-    '90318012': 'Outros instrumentos, aparelhos e máquinas de medida ou controle',
-    '90318020': 'Outros instrumentos, aparelhos e máquinas de medida ou controle',
-    '90318030': 'Outros instrumentos, aparelhos e máquinas de medida ou controle',
-    '90318040': 'Outros instrumentos, aparelhos e máquinas de medida ou controle',
-    '90318050': 'Outros instrumentos, aparelhos e máquinas de medida ou controle',
-    '90318060': 'Outros instrumentos, aparelhos e máquinas de medida ou controle',
-    '90318091': 'Outros instrumentos, aparelhos e máquinas de medida ou controle',
-    '90318099': 'Outros instrumentos, aparelhos e máquinas de medida ou controle',
-    '90319010': 'Partes e acessórios para instrumentos e aparelhos de medida ou controle',
-    '90319090': 'Partes e acessórios para instrumentos e aparelhos de medida ou controle',
-    '90321010': 'Termostatos automáticos',
-    '90321090': 'Termostatos automáticos',
-    '90322000': 'Manostatos automáticos (pressostatos)',
-    '90328100': 'Instrumentos e aparelhos hidráulicos ou pneumáticos, para regulação ou controle, automáticos',
-    '90328911': 'Outros instrumentos e aparelhos para regulação ou controle, automáticos',
-    '90328919': 'Outros instrumentos e aparelhos para regulação ou controle, automáticos',
-    '90328921': 'Outros instrumentos e aparelhos para regulação ou controle, automáticos',
-    '90328922': 'Outros instrumentos e aparelhos para regulação ou controle, automáticos',
-    '90328923': 'Outros instrumentos e aparelhos para regulação ou controle, automáticos',
-    '90328924': 'Outros instrumentos e aparelhos para regulação ou controle, automáticos',
-    '90328925': 'Outros instrumentos e aparelhos para regulação ou controle, automáticos',
-    '90328929': 'Outros instrumentos e aparelhos para regulação ou controle, automáticos',
-    '90328930': 'Outros instrumentos e aparelhos para regulação ou controle, automáticos',
-    '90328981': 'Outros instrumentos e aparelhos para regulação ou controle, automáticos',
-    '90328982': 'Outros instrumentos e aparelhos para regulação ou controle, automáticos',
-    '90328983': 'Outros instrumentos e aparelhos para regulação ou controle, automáticos',
-    '90328984': 'Outros instrumentos e aparelhos para regulação ou controle, automáticos',
-    '90328989': 'Outros instrumentos e aparelhos para regulação ou controle, automáticos',
-    '90328990': 'Outros instrumentos e aparelhos para regulação ou controle, automáticos',
-    '90329010': 'Partes e acessórios para instrumentos e aparelhos para regulação ou controle, automáticos',
-    '90329091': 'Partes e acessórios para instrumentos e aparelhos para regulação ou controle, automáticos',
-    '90329099': 'Partes e acessórios para instrumentos e aparelhos para regulação ou controle, automáticos',
-    '90330000': 'Partes e acessórios para máquinas, aparelhos e instrumentos ou artigos do capítulo 90',
-    '91011100': 'Relógio de pulso, funcionando eletricamente, com caixa de metais preciosos folheados ou chapeados, de mostrador exclusivamente mecânico',
-    '91011900': 'Outros relógios de pulso, funcionando eletricamente, com caixa de metais preciosos folheados ou chapeados',
-    '91012100': 'Relógios de pulso, com caixa de metais preciosos folheados ou chapeados, de corda automática',
-    '91012900': 'Outros relógios de pulso, com caixa de metais preciosos folheados ou chapeados, operado manualmente',
-    '91019100': 'Relógios de bolso e semelhantes, com caixa de metais preciosos folheados ou chapeados, funcionando eletricamente',
-    '91019900': 'Outros relógios de bolso e semelhantes, com caixa de metais preciosos folheados ou chapeados, com corda manual ou automática',
-    '91021110': 'Relógios de pulso, funcionando eletricamente, de mostrador exclusivamente mecânico',
-    '91021190': 'Relógios de pulso, funcionando eletricamente, de mostrador exclusivamente mecânico',
-    '91021210': 'Relógios de pulso, funcionando eletricamente, de mostrador exclusivamente opto-eletrônico',
-    '91021220': 'Relógios de pulso, funcionando eletricamente, de mostrador exclusivamente opto-eletrônico',
-    '91021290': 'Relógios de pulso, funcionando eletricamente, de mostrador exclusivamente opto-eletrônico',
-    '91021900': 'Outros relógios de pulso, funcionando eletricamente',
-    '91022100': 'Outros relógio de pulso, de corda automática',
-    '91022900': 'Outros relógios de pulso, operados apenas manualmente',
-    '91029100': 'Outros relógios de bolso e semelhantes, funcionando eletricamente',
-    '91029900': 'Outros relógios de bolso e semelhantes',
-    '91031000': 'Despertadores e outros relógios, com maquinismo de pequeno volume, funcionando eletricamente',
-    '91039000': 'Outros despertadores e outros relógios, com maquinismo de pequeno volume',
-    '91040000': 'Relógios para painéis de instrumentos e relógios semelhantes para automóveis, veículos aéreos, embarcações ou outros veículos',
-    '91051100': 'Outros despertadores, funcionando eletricamente, exceto com maquinismo de pequeno volume',
-    '91051900': 'Outros despertadores, exceto com maquinismo de pequeno volume',
-    '91052100': 'Pêndulas e relógios de parede, funcionando eletricamente, exceto com maquinismo de pequeno volume',
-    '91052900': 'Relógios de parede funcionado de outro modo, exceto os com maquinismo de pequeno volume',
-    '91059100': 'Outros aparelhos de relojoaria, funcionando eletricamente, exceto com maquinismo de pequeno volume',
-    '91059900': 'Outros aparelhos de relojoaria, exceto com maquinismo de pequeno volume',
-    '91061000': 'Relógios de ponto; relógios datadores e contadores de horas',
-    '91069000': 'Outros aparelhos de controle de tempo e contadores de tempo, com maquinismo de aparelhos de relojoaria ou com motor síncrono',
-    '91070010': 'Interruptores horários e outros aparelhos que permitam acionar um mecanismo em tempo determinado, com maquinismo de aparelhos de relojoaria ou de motor síncrono',
-    '91070090': 'Interruptores horários e outros aparelhos que permitam acionar um mecanismo em tempo determinado, com maquinismo de aparelhos de relojoaria ou de motor síncrono',
-    '91081110': 'Maquinismos de pequeno volume para relógios, completos e montados, funcionando eletricamente, de mostrador mecânico',
-    '91081200': 'Maquinismos de pequeno volume para relógios, completos e montados, funcionando eletricamente, de mostrador opto-eletrônico',
-    '91081900': 'Outros maquinismos de pequeno volume para relógios, completos e montados, funcionando eletricamente',
-    '91082000': 'Maquinismos de pequeno volume para relógios, completos e montados, de corda automática',
-    '91089000': 'Outros maquinismos de pequeno volume para relógios, montados',
-    '91091000': 'Maquinismo de artefatos de relojoaria, funcionando eletricamente',
-    '91099000': 'Maquinismos de artigos de relojoaria, completos e montados, exceto de pequeno volume, funcionando de outro modo',
-    '91101110': 'Maquinismos completos, não montados ou parcialmente montados (chablons), para relógios de pequeno volume',
-    '91101200': 'Maquinismos incompletos, montados, para aparelhos de relojoaria, de pequeno volume',
-    '91109000': 'Maquinismos de aparelhos de relojoaria, completos, não montados, exceto de pequeno volume',
-    '91111000': 'Caixas de metais preciosos ou de metais folheados ou chapeados, para relógios de pulso e de bolso',
-    '91112010': 'Caixas de metais comuns, mesmo dourados ou prateados, para relógios de pulso e de bolso',
-    '91112090': 'Caixas de metais comuns, mesmo dourados ou prateados, para relógios de pulso e de bolso',
-    '91118000': 'Caixas de outros materiais, para relógios de pulso e de bolso',
-    '91119010': 'Partes para caixas de relógio de pulso e de bolso',
-    '91119090': 'Partes para caixas de relógio de pulso e de bolso',
-    '91122000': 'Caixas e semelhantes de aparelhos de relojoaria',
-    '91129000': 'Partes para caixas e semelhantes de aparelhos de relojoaria',
-    '91131000': 'Pulseiras de relógios, e suas partes, de metais preciosos ou de metais folheados ou chapeados de metais preciosos',
-    '91132000': 'Pulseiras de relógios, e suas partes, de metais comuns, mesmo dourados ou prateados',
-    '91139000': 'Outras pulseiras para relógios, e suas partes, de outras matérias',
-    '91141000': 'Molas, incluídas as espirais, para aparelhos de relojoaria',
-    '91143000': 'Quadrantes para aparelhos relojoaria',
-    '91144000': 'Platinas e pontes para aparelhos de relojoaria',
-    '91149000': 'Outras partes e acessórios de aparelhos de relojoaria',
-    '91149010': 'Outras partes e acessórios de aparelhos de relojoaria',
-    '91149020': 'Outras partes e acessórios de aparelhos de relojoaria',
-    '91149030': 'Outras partes e acessórios de aparelhos de relojoaria',
-    '91149060': 'Outras partes e acessórios de aparelhos de relojoaria',
-    '91149070': 'Outras partes e acessórios de aparelhos de relojoaria',
-    '91149090': 'Outras partes e acessórios de aparelhos de relojoaria',
-    '92011000': 'Pianos verticais',
-    '92012000': 'Pianos de cauda',
-    '92019000': 'Outros pianos, mesmo automáticos; cravos e outros instrumentos de cordas, com teclado',
-    '92021000': 'Instrumentos musicais de cordas, tocados com auxílio de um arco',
-    '92029000': 'Outros instrumentos musicais, de cordas',
-    '92051000': 'Instrumentos musicais de sopro denominados metais',
-    '92059000': 'Outros instrumentos musicais, de sopro',
-    '92060000': 'Instrumentos musicais de percussão (tambores, caixas, xilofones, pratos, castanholas e maracas)',
-    '92071010': 'Instrumentos musicais de teclado, cujo som é produzido ou amplificado por meios elétricos, exceto acordeões',
-    '92071090': 'Instrumentos musicais de teclado, cujo som é produzido ou amplificado por meios elétricos, exceto acordeões',
-    '92079010': 'Outros instrumentos musicais cujo som é produzido ou amplificado por meios elétricos (órgãos, guitarras, acordeões)',
-    '92079090': 'Outros instrumentos musicais cujo som é produzido ou amplificado por meios elétricos (órgãos, guitarras, acordeões)',
-    '92081000': 'Caixas de música',
-    '92089000': 'Órgãos mecânicos de feira, realejos, serrotes musicais e outros instrumentos musicais',
-    '92093000': 'Cordas para instrumentos musicais',
-    '92099100': 'Partes e acessórios para pianos',
-    '92099200': 'Partes e acessórios de instrumentos musicais de cordas',
-    '92099400': 'Partes e acessórios de instrumentos musicais cujo som produzido ou amplificado por meios elétricos',
-    '92099900': 'Partes e acessórios para outros instrumentos musicais',
-    '93011000': 'Peças de artilharia (exemplo: canhões, obuses, morteiros)',
-    '93032000': 'Outras espingardas e carabinas, de caça ou de tiro-ao-alvo, com pelo menos um cano liso',
-    '93033000': 'Outras espingardas e carabinas, de caça ou de tiro-ao-alvo',
-    '93040000': 'Outras armas (espingardas, carabinas e pistolas, de mola, de ar comprimido ou de gás, cassetetes)',
-    '93040010': 'Outras armas (espingardas, carabinas e pistolas, de mola, de ar comprimido ou de gás, cassetetes)',
-    '93040090': 'Outras armas (espingardas, carabinas e pistolas, de mola, de ar comprimido ou de gás, cassetetes)',
-    '93052000': 'Partes e acessórios de espingardas ou carabinas da posição 9303',
-    '93059090': 'Partes e acessórios para armas',
-    '93059900': 'Partes e acessórios de outras armas',
-    '93062100': 'Cartuchos para espingardas e carabinas de cano liso',
-    '93062900': 'Chumbos para carabinas de ar comprimido; partes de cartuchos',
-    '93070000': 'Sabres, espadas, baionetas, lanças e outras armas brancas, suas partes e bainhas',
-    '94011010': 'Assentos para veículos aéreos',
-    '94011090': 'Assentos para veículos aéreos',
-    '94012000': 'Assentos para veículos automóveis',
-    '94013010': 'Assentos giratórios, de altura ajustável',
-    '94013090': 'Assentos giratórios, de altura ajustável',
-    '94013100': 'Assentos giratórios com regulagem de altura variável, de madeira',
-    '94013900': 'Outros assentos giratórios com ajuste de altura variável, não classificados nos códigos anteriores',
-    '94014010': 'Assentos (exceto de jardim ou de acampar) transformáveis em camas',
-    '94014090': 'Assentos (exceto de jardim ou de acampar) transformáveis em camas',
-    '94014100': 'Assentos de madeira, convertíveis em camas, que não assentos de jardim ou equipamentos de acampamento.',
-    '94014900': 'Outros assentos, exceto assentos de jardim ou equipamentos de acampamento, conversíveis em camas, não classificados nos códigos anteriores',
-    '94015200': 'Assentos de bambu',
-    '94015300': 'Assentos de rotim',
-    '94015900': 'Assentos de outras matérias, exceto de ratã ou bambu',
-    '94016100': 'Assentos estofados, com armação de madeira',
-    '94016900': 'Outros assentos com armação de madeira',
-    '94017100': 'Assentos estofados, com armação de metal',
-    '94017900': 'Outros assentos com armação de metal',
-    '94018000': 'Outros assentos',
-    '94019010': 'Partes de assentos',
-    '94019090': 'Partes de assentos',
-    '94019100': 'Partes de assentos (exceto os da posição 94.02), conversíveis ou não em camas, e suas partes de madeira',
-    '94019900': 'Outras partes de assentos (exceto os da posição 94.02), conversíveis ou não em camas, e suas partes',
-    '94021000': 'Cadeiras de dentista, para salões de cabeleireiro e cadeiras semelhantes, e suas partes',
-    '94029010': 'Outros mobiliários para medicina, cirurgia, odontologia ou veterinária',
-    '94029020': 'Outros mobiliários para medicina, cirurgia, odontologia ou veterinária',
-    '94029090': 'Outros mobiliários para medicina, cirurgia, odontologia ou veterinária',
-    '94031000': 'Móveis de metal para escritórios',
-    '94032000': 'Outros móveis de metal',
-    '94032010': 'Outros móveis de metal',
-    '94032090': 'Outros móveis de metal',
-    '94033000': 'Móveis de madeira para escritórios',
-    '94034000': 'Móveis de madeira para cozinhas',
-    '94035000': 'Móveis de madeira para quartos de dormir',
-    '94036000': 'Outros móveis de madeira',
-    '94037000': 'Móveis de plásticos',
-    '94038200': 'Móveis de bambu',
-    '94038300': 'Móveis de rotim',
-    '94038900': 'Móveis de outras matérias, exceto de ratã ou bambu',
-    '94039010': 'Partes para móveis',
-    '94039090': 'Partes para móveis',
-    '94039100': 'Partes de outros móveis e suas partes, de madeira',
-    '94039900': 'Outras partes de outros móveis e suas partes, não classificadas nos códigos anteriores',
-    '94041000': 'Suportes elásticos para camas',
-    '94042100': 'Colchões de borracha ou de plásticos alveolares, mesmo recobertos',
-    '94042900': 'Colchões de outras matérias',
-    '94043000': 'Sacos de dormir',
-    '94044000': 'Edredons e colchas',
-    '94049000': 'Ededrões, almofadas, pufes, travesseiros e artigos semelhantes',
-    '94051010': 'Lustres e outros aparelhos de iluminação, elétricos, próprios para serem suspensos ou fixados no teto ou na parede, exceto os utilizados na iluminação pública',
-    '94051091': 'Lustres e outros aparelhos de iluminação, elétricos, próprios para serem suspensos ou fixados no teto ou na parede, exceto os utilizados na iluminação pública',
-    '94051092': 'Lustres e outros aparelhos de iluminação, elétricos, próprios para serem suspensos ou fixados no teto ou na parede, exceto os utilizados na iluminação pública',
-    '94051093': 'Lustres e outros aparelhos de iluminação, elétricos, próprios para serem suspensos ou fixados no teto ou na parede, exceto os utilizados na iluminação pública',
-    '94051099': 'Lustres e outros aparelhos de iluminação, elétricos, próprios para serem suspensos ou fixados no teto ou na parede, exceto os utilizados na iluminação pública',
-    '94051110': 'Lustres e outros acessórios elétricos para iluminação de teto ou parede, excluindo os do tipo utilizado para iluminação de espaços públicos abertos ou vias, projetados para uso exclusivo com fontes de luz de diodo emissor de luz (LED)',
-    '94051190': 'Lustres e outros acessórios elétricos para iluminação de teto ou parede, excluindo os do tipo utilizado para iluminação de espaços públicos abertos ou vias, projetados para uso exclusivo com fontes de luz de diodo emissor de luz (LED)',
-    '94051910': 'Outros lustres e outros acessórios elétricos para iluminação de teto ou parede, excluindo os do tipo utilizado para iluminação de espaços abertos públicos ou vias, não classificados nos códigos anteriores',
-    '94051990': 'Outros lustres e outros acessórios elétricos para iluminação de teto ou parede, excluindo os do tipo utilizado para iluminação de espaços abertos públicos ou vias, não classificados nos códigos anteriores',
-    '94052000': 'Abajures (candeeiros) de cabeceira, de escritório e lampadários de interior, elétricos',
-    '94052100': 'Luminárias elétricas de mesa, escrivaninha, cabeceira ou piso, projetadas para uso exclusivo com fontes de luz de diodo emissor de luz (LED)',
-    '94052900': 'Outras luminárias elétricas de mesa, escrivaninha, cabeceira ou piso, não classificadas nos códigos anteriores',
-    '94053000': 'Guirlandas elétricas para árvores de natal',
-    '94053100': 'Cordas de iluminação do tipo utilizado para árvores de Natal, projetadas para uso exclusivo com fontes de luz de diodo emissor de luz (LED)',
-    '94053900': 'Outras cordas de iluminação do tipo utilizado para árvores de Natal, não classificadas nos códigos anteriores',
-    '94054010': 'Outros aparelhos elétricos de iluminação',
-    '94054090': 'Outros aparelhos elétricos de iluminação',
-    '94054100': 'Outras luminárias e luminárias elétricas, fotovoltaicas, projetadas para uso exclusivo com fontes de luz de diodo emissor de luz (LED)',
-    '94054200': 'Outras luminárias elétricas e acessórios de iluminação, exceto fotovoltaicos, projetados para uso exclusivo com fontes de luz de diodo emissor de luz (LED)',
-    '94054900': 'Outras luminárias elétricas e acessórios de iluminação, não classificados nos códigos anteriores',
-    '94055000': 'Aparelhos não elétricos de iluminação',
-    '94056000': 'Anúncios, cartazes ou tabuletas e placas indicadoras luminosos, e artigos semelhantes',
-    '94056100': 'Sinais luminosos, placas de identificação iluminadas e similares, projetados para uso exclusivo com fontes de luz de diodo emissor de luz (LED)',
-    '94056900': 'Outros letreiros iluminados, placas de identificação iluminadas e similares, não classificados nos códigos anteriores',
-    '94059100': 'Partes de aparelhos de iluminação, de vidro',
-    '94059200': 'Partes de aparelhos de iluminação, de plásticos',
-    '94059900': 'Partes de aparelhos de iluminação, de outras matérias',
-    '94061010': 'Construções pré-fabricadas, de madeira',
-    '94061090': 'Construções pré-fabricadas, de madeira',
-    '94062000': 'Unidades de construção modulares, de aço',
-    '94069010': 'Construções pré-fabricadas, exceto de madeira',
-    '94069020': 'Construções pré-fabricadas, exceto de madeira',
-    '94069090': 'Construções pré-fabricadas, exceto de madeira',
-    '95030010': 'Triciclos, patinetes, carros de pedais e outros brinquedos semelhantes de rodas; carrinhos para bonecos; bonecos; outros brinquedos; modelos reduzidos e modelos semelhantes para divertimento, mesmo animados; quebra-cabeças (puzzles ") de qualquer tipo. "',
-    '95030021': 'Triciclos, patinetes, carros de pedais e outros brinquedos semelhantes de rodas; carrinhos para bonecos; bonecos; outros brinquedos; modelos reduzidos e modelos semelhantes para divertimento, mesmo animados; quebra-cabeças (puzzles ") de qualquer tipo. "',
-    '95030022': 'Triciclos, patinetes, carros de pedais e outros brinquedos semelhantes de rodas; carrinhos para bonecos; bonecos; outros brinquedos; modelos reduzidos e modelos semelhantes para divertimento, mesmo animados; quebra-cabeças (puzzles ") de qualquer tipo. "',
-    '95030029': 'Triciclos, patinetes, carros de pedais e outros brinquedos semelhantes de rodas; carrinhos para bonecos; bonecos; outros brinquedos; modelos reduzidos e modelos semelhantes para divertimento, mesmo animados; quebra-cabeças (puzzles ") de qualquer tipo. "',
-    '95030031': 'Triciclos, patinetes, carros de pedais e outros brinquedos semelhantes de rodas; carrinhos para bonecos; bonecos; outros brinquedos; modelos reduzidos e modelos semelhantes para divertimento, mesmo animados; quebra-cabeças (puzzles ") de qualquer tipo. "',
-    '95030039': 'Triciclos, patinetes, carros de pedais e outros brinquedos semelhantes de rodas; carrinhos para bonecos; bonecos; outros brinquedos; modelos reduzidos e modelos semelhantes para divertimento, mesmo animados; quebra-cabeças (puzzles ") de qualquer tipo. "',
-    '95030040': 'Triciclos, patinetes, carros de pedais e outros brinquedos semelhantes de rodas; carrinhos para bonecos; bonecos; outros brinquedos; modelos reduzidos e modelos semelhantes para divertimento, mesmo animados; quebra-cabeças (puzzles ") de qualquer tipo. "',
-    '95030050': 'Triciclos, patinetes, carros de pedais e outros brinquedos semelhantes de rodas; carrinhos para bonecos; bonecos; outros brinquedos; modelos reduzidos e modelos semelhantes para divertimento, mesmo animados; quebra-cabeças (puzzles ") de qualquer tipo. "',
-    '95030060': 'Triciclos, patinetes, carros de pedais e outros brinquedos semelhantes de rodas; carrinhos para bonecos; bonecos; outros brinquedos; modelos reduzidos e modelos semelhantes para divertimento, mesmo animados; quebra-cabeças (puzzles ") de qualquer tipo. "',
-    '95030070': 'Triciclos, patinetes, carros de pedais e outros brinquedos semelhantes de rodas; carrinhos para bonecos; bonecos; outros brinquedos; modelos reduzidos e modelos semelhantes para divertimento, mesmo animados; quebra-cabeças (puzzles ") de qualquer tipo. "',
-    '95030080': 'Triciclos, patinetes, carros de pedais e outros brinquedos semelhantes de rodas; carrinhos para bonecos; bonecos; outros brinquedos; modelos reduzidos e modelos semelhantes para divertimento, mesmo animados; quebra-cabeças (puzzles ") de qualquer tipo. "',
-    '95030091': 'Triciclos, patinetes, carros de pedais e outros brinquedos semelhantes de rodas; carrinhos para bonecos; bonecos; outros brinquedos; modelos reduzidos e modelos semelhantes para divertimento, mesmo animados; quebra-cabeças (puzzles ") de qualquer tipo. "',
-    '95030097': 'Triciclos, patinetes, carros de pedais e outros brinquedos semelhantes de rodas; carrinhos para bonecos; bonecos; outros brinquedos; modelos reduzidos e modelos semelhantes para divertimento, mesmo animados; quebra-cabeças (puzzles ") de qualquer tipo. "',
-    '95030098': 'Triciclos, patinetes, carros de pedais e outros brinquedos semelhantes de rodas; carrinhos para bonecos; bonecos; outros brinquedos; modelos reduzidos e modelos semelhantes para divertimento, mesmo animados; quebra-cabeças (puzzles ") de qualquer tipo. "',
-    '95030099': 'Triciclos, patinetes, carros de pedais e outros brinquedos semelhantes de rodas; carrinhos para bonecos; bonecos; outros brinquedos; modelos reduzidos e modelos semelhantes para divertimento, mesmo animados; quebra-cabeças (puzzles ") de qualquer tipo. "',
-    '95042000': 'Bilhares e seus acessórios',
-    '95043000': 'Outros jogos funcionando por introdução de uma moeda, papel-moeda, ficha ou de outros artigos similares, exceto os jogos de balizas (paulitos) automáticas (boliche)',
-    '95044000': 'Cartas de jogar',
-    '95045000': 'Consoles e máquinas de jogos de vídeo (exceto da subposição 9504.30)',
-    '95049010': 'Outros artigos para jogos de salão',
-    '95049090': 'Outros artigos para jogos de salão',
-    '95051000': 'Artigos para festas de natal',
-    '95059000': 'Artigos para outras festas, carnaval ou outros divertimentos, incluídos os de magia e artigos-surpresa',
-    '95061100': 'Esquis para neve',
-    '95061200': 'Fixadores para esquis',
-    '95061900': 'Outros equipamentos para esquiar na neve',
-    '95062100': 'Pranchas a vela',
-    '95062900': 'Esquis aquáticos e outros equipamentos para prática de esportes aquáticos',
-    '95063100': 'Tacos completos para golfe',
-    '95063200': 'Bolas para golfe',
-    '95063900': 'Outros equipamentos para golfe',
-    '95064000': 'Artigos e equipamentos para tênis de mesa',
-    '95065100': 'Raquetes de tênis, mesmo não encordoadas',
-    '95065900': 'Raquetes de badminton e outras raquetes semelhantes, mesmo não encordoadas',
-    '95066100': 'Bolas de tênis, exceto tênis de mesa',
-    '95066200': 'Bolas infláveis',
-    '95066900': 'Outras bolas',
-    '95067000': 'Patins para gelo e patins de rodas, incluídos os fixados em calçados',
-    '95069100': 'Artigos e equipamentos para cultura física, ginástica ou atletismo',
-    '95069900': 'Artigos e equipamentos para outros esportes ou jogos ao ar livre; piscinas, incluídas as infantis',
-    '95071000': 'Varas (canas) de pesca',
-    '95072000': 'Anzóis, mesmo montados em sedelas (terminais)',
-    '95073000': 'Molinetes (carretes) de pesca',
-    '95079000': 'Outros artigos para pesca à linha, puçás e redes semelhantes para qualquer finalidade',
-    '95081000': 'Circos e coleções de animais ambulantes',
-    '95082190': 'Montanhas-russas',
-    '95082290': 'Carrosséis, balanços e rotundas',
-    '95082900': 'Outros passeios de parques de diversões e outras diversões de parques aquáticos',
-    '95083000': 'Diversões de feiras',
-    '95084000': 'Teatros itinerantes',
-    '95089011': 'Carrosséis, balanços e outras diversões de parques e feiras',
-    '95089019': 'Carrosséis, balanços e outras diversões de parques e feiras',
-    '95089023': 'Carrosséis, balanços e outras diversões de parques e feiras',
-    '95089041': 'Carrosséis, balanços e outras diversões de parques e feiras',
-    '95089043': 'Carrosséis, balanços e outras diversões de parques e feiras',
-    '95089049': 'Carrosséis, balanços e outras diversões de parques e feiras',
-    '95089060': 'Carrosséis, balanços e outras diversões de parques e feiras',
-    '95089090': 'Carrosséis, balanços e outras diversões de parques e feiras',
-    '96019000': 'Outras matérias animais para entalhar, trabalhadas, e suas obras',
-    '96020010': 'Matérias vegetais ou minerais de entalhar, trabalhadas, e suas obras',
-    '96020090': 'Matérias vegetais ou minerais de entalhar, trabalhadas, e suas obras',
-    '96031000': 'Vassouras e escovas, de matérias vegetais em feixes, com ou sem cabo',
-    '96032100': 'Escovas de dentes, incluídas as escovas para dentaduras',
-    '96032900': 'Outras escovas e pincéis de barba, escovas para cabelos, cílios ou para unhas e outras escovas de toucador',
-    '96033000': 'Pincéis e escovas para artistas, pincéis de escrever e semelhantes para aplicação de produtos cosméticos',
-    '96034010': 'Escovas e pincéis para pintar, caiar, envernizar ou semelhantes; bonecas e rolos para pintura',
-    '96034090': 'Escovas e pincéis para pintar, caiar, envernizar ou semelhantes; bonecas e rolos para pintura',
-    '96035000': 'Outras escovas que constituam partes de máquinas, aparelhos ou de veículos',
-    '96039000': 'Rodos de borracha ou de outros materiais flexíveis; outras vassouras e pincéis',
-    '96040000': 'Peneiras e crivos, manuais',
-    '96050000': 'Sortidos de viagem, para toucador de pessoas, para costura ou limpeza de calçado ou de roupas',
-    '96061000': 'Botões de pressão e suas partes',
-    '96062100': 'Botões de plásticos, não recobertos de matérias têxteis',
-    '96062200': 'Botões de metais comuns, não recobertos de matérias têxteis',
-    '96062900': 'Outros botões',
-    '96063000': 'Formas e outras partes, de botões; esboços de botões',
-    '96071100': 'Fechos ecler com grampos de metal comum',
-    '96071900': 'Outros fechos ecler',
-    '96072000': 'Partes de fechos ecler',
-    '96081000': 'Canetas esferográficas',
-    '96082000': 'Canetas e marcadores, com ponta de feltro ou com outras pontas porosas',
-    '96083000': 'Canetas-tinteiro e outras canetas',
-    '96084000': 'Lapiseiras',
-    '96085000': 'Sortidos de canetas com lapiseiras',
-    '96086000': 'Cargas com ponta, para canetas esferográficas',
-    '96089100': 'Penas (aparos) e suas pontas, para canetas-tinteiro',
-    '96089981': 'Estiletes para duplicadores, porta-lápis e outros artigos semelhantes',
-    '96089989': 'Estiletes para duplicadores, porta-lápis e outros artigos semelhantes',
-    '96089990': 'Estiletes para duplicadores, porta-lápis e outros artigos semelhantes',
-    '96091000': 'Lápis',
-    '96092000': 'Minas para lápis ou lapiseiras',
-    '96099000': 'Pastéis, carvões, gizes para escrever ou desenhar e de alfaiate',
-    '96100000': 'Lousas e quadros para escrever ou desenhar, mesmo emoldurados',
-    '96110000': 'Carimbos, datadores, numeradores, sinetes e artigos semelhantes (incluídos os aparelhos para impressão de etiquetas), manuais',
-    '96121000': 'Fitas impressoras',
-    '96121011': 'Fitas impressoras',
-    '96121012': 'Fitas impressoras',
-    '96121013': 'Fitas impressoras',
-    '96121019': 'Fitas impressoras',
-    '96121090': 'Fitas impressoras',
-    '96122000': 'Almofadas de carimbo',
-    '96131000': 'Isqueiros de bolso, a gás, não recarregáveis',
-    '96132000': 'Isqueiros de bolso, a gás, recarregáveis',
-    '96138000': 'Outros isqueiros e acendedores',
-    '96139000': 'Partes de isqueiros e acendedores',
-    '96140000': 'Cachimbos e piteiras para charutos e para cigarros, e suas partes',
-    '96151100': 'Pentes e travessas para cabelo, de borracha endurecida ou de plásticos',
-    '96151900': 'Outros pentes e travessas para cabelo, de outras matérias',
-    '96159000': 'Grampos para cabelo, pinças, onduladores, bobs (rolos) e outros artigos para penteados, e suas partes',
-    '96161000': 'Vaporizadores de toucador, armações e suas cabeças',
-    '96162000': 'Borlas ou esponjas para pós ou para aplicação de outros cosméticos ou de produtos de toucador',
-    '96170010': 'Garrafas térmicas e outros recipientes isotérmicos montados, com isolamento produzido pelo vácuo, e suas partes (exceto ampolas de vidro)',
-    '96170020': 'Garrafas térmicas e outros recipientes isotérmicos montados, com isolamento produzido pelo vácuo, e suas partes (exceto ampolas de vidro)',
-    '96180000': 'Manequins e artigos semelhantes; autômatos e cenas animadas, para vitrines e mostruários',
-    '96190000': 'Absorventes e tampões higiênicos, cueiro e fralda para bebê',
-    '96200000': 'Monopés, bipés, tripés e artigos semelhantes',
-    '97011000': 'Quadros, pinturas e desenhos, feitos inteiramente à mão',
-    '97012100': 'Pinturas, desenhos e pastéis com idade superior a 100 anos',
-    '97012200': 'Mosaicos com mais de 100 anos de idade',
-    '97012900': 'Colagens e placas decorativas semelhantes, de idade superior a 100 anos',
-    '97019000': 'Colagens e quadros decorativos semelhantes',
-    '97019100': 'Outras pinturas, desenhos e pastéis, não classificados nos códigos anteriores',
-    '97019200': 'Outros mosaicos, não classificados nos códigos anteriores',
-    '97019900': 'Outras pinturas, desenhos e pastéis, executados inteiramente à mão, com exceção dos desenhos da posição 49.06 e dos artigos manufaturados pintados à mão ou decorados à mão; outras colagens, mosaicos e placas decorativas semelhantes, não classificados nos códigos anteriores',
-    '97020000': 'Gravuras, estampas e litografias, originais',
-    '97021000': 'Gravuras, gravuras e litografias originais, de idade superior a 100 anos',
-    '97029000': 'Outras gravuras, impressões e litografias originais, não classificadas nos códigos anteriores',
-    '97030000': 'Produções originais de arte estatuária ou de escultura, de quaisquer matérias',
-    '97031000': 'Esculturas e estatuária originais, em qualquer material, de idade superior a 100 anos',
-    '97039000': 'Outras esculturas e estatuárias originais, em qualquer material, não classificadas nos códigos anteriores',
-    '97040000': 'Selos postais e fiscais, marcas postais e artigos semelhantes, sem curso nem destinados a ter curso no país de destino',
-    '97050000': 'Coleções e espécimes para coleções, de zoologia, botânica, mineralogia, anatomia, ou apresentando interesse histórico, arqueológico, paleontológico, etnográfico ou numismático',
-    '97051000': 'Coleções e peças de coleção de interesse arqueológico, etnográfico ou histórico',
-    '97052900': 'Outras coleções e peças de colecionador de interesse zoológico, botânico, mineralógico, anatômico ou paleontológico, não classificadas em códigos anteriores',
-    '97060000': 'Antiguidades com mais de 100 anos',
-    '97061000': 'Antiguidades com idade superior a 250 anos',
-    '97069000': 'Outras antiguidades com idade superior a 100 anos, não classificadas nos códigos anteriores',
-}
@@ -0,0 +1,89 @@
+"""
+Cache de respostas HTTP já serializadas dos endpoints /api/*
+Entradas dos anos afetados são invalidadas pelo registro de datasets
+quando um EXP_*.csv muda (ver dataset_registry.py). Variantes comprimidas
+(gzip/br) ficam na própria entrada: cada corpo é comprimido uma vez.
+"""
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
+from datetime import datetime
+from typing import Callable, Hashable, Optional
+
+RespostaCacheada = namedtuple('RespostaCacheada', 'body status content_type etag last_modified variantes')
+
+
+class ResponseCache:
+    """Cache LRU thread-safe de corpos de resposta com ETag forte, limitado por bytes"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[Hashable, RespostaCacheada]' = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[RespostaCacheada]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Hashable, body: bytes, status: int, content_type: str,
+            last_modified: Optional[datetime] = None) -> RespostaCacheada:
+        """Armazena o corpo e calcula o ETag (hash do conteúdo) uma única vez"""
+        etag = hashlib.sha256(body).hexdigest()[:32]
+        entry = RespostaCacheada(body, status, content_type, etag, last_modified, {})
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if len(body) <= self.max_bytes:
+                self._entries[key] = entry
+                self._total_bytes += len(body)
+                self._evict()
+        return entry
+
+    def variant(self, key: Hashable, entry: RespostaCacheada, encoding: str,
+                compress: Callable[[bytes], bytes]) -> bytes:
+        """Corpo na codificação pedida; comprimido na primeira vez e guardado na entrada"""
+        body = entry.variantes.get(encoding)
+        if body is not None:
+            return body
+        body = compress(entry.body)
+        with self._lock:
+            # Entrada ainda em cache (não invalidada/substituída durante a compressão)
+            if self._entries.get(key) is entry and encoding not in entry.variantes:
+                entry.variantes[encoding] = body
+                self._total_bytes += len(body)
+                self._evict()
+        return body
+
+    def invalidate(self, predicate: Callable[[Hashable], bool] = None):
+        """Remove entradas (todas, ou as que satisfazem o predicado)"""
+        with self._lock:
+            for key in list(self._entries):
+                if predicate is None or predicate(key):
+                    self._remove(key)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self._total_bytes -= len(entry.body) + sum(len(v) for v in entry.variantes.values())
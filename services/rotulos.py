@@ -0,0 +1,202 @@
+"""
+Abreviação dos rótulos dos gráficos (descrições NCM, países)
+Cada rótulo distinto é abreviado uma única vez por perfil de gráfico e o
+resultado fica num dicionário: na montagem dos gráficos resta uma consulta
+por rótulo. As descrições NCM conhecidas são abreviadas junto com a
+preparação das tabelas (codigos_comexstat.preparar_tabelas).
+
+Tabelas próprias de abreviações (CSV ou JSON, ver carregar) têm precedência
+sobre as regras; a de ABREVIACOES_PATH é carregada automaticamente.
+"""
+import csv
+import json
+import os
+import threading
+from collections import namedtuple
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+# substituicoes: trechos (busca sem diferenciar maiúsculas) -> abreviação
+# trocar_inteiro: a abreviação substitui o rótulo todo (senão só o trecho)
+# limpezas: trechos removidos/trocados depois; limite: tamanho máximo
+Perfil = namedtuple('Perfil', 'substituicoes trocar_inteiro limpezas limite')
+
+_COMUNS = {
+    'Café não torrado, não descafeinado': 'Café',
+    'Outros açúcares de cana': 'Açúcar',
+    'Petróleo bruto': 'Petróleo',
+    'Minério de ferro': 'Minério Fe',
+    'Milho, exceto para semeadura': 'Milho',
+    'Sementes de soja': 'Soja',
+    'Pasta química de madeira': 'Celulose',
+    'Carne bovina desossada, congelada': 'Carne bovina',
+    'Algodão, não cardado nem penteado': 'Algodão',
+    'Tabaco parcialmente destalado': 'Tabaco',
+    'Ferronióbio': 'Ferronióbio',
+    'Tortas e outros resíduos sólidos da extração do óleo de soja': 'Farelo soja',
+}
+
+PERFIS = {
+    # Barras horizontais: troca só o trecho encontrado, rótulos de até 45 caracteres
+    'barra': Perfil(
+        substituicoes={
+            **_COMUNS,
+            'Pedaços e miudezas comestíveis de galos e galinhas da espécie doméstica, congelados': 'Frango (pedaços)',
+            'para dissolução': '(dissolução)',
+            'Minério de ferro e seus concentrados': 'Minério Fe',
+            'não aglomerados': ''
+        },
+        trocar_inteiro=False,
+        limpezas=((', não aglomerados', ''), (', exceto para semeadura', '')),
+        limite=45
+    ),
+    # Pizza: legenda estreita, rótulos de até 25 caracteres
+    'pizza': Perfil(
+        substituicoes={**_COMUNS, 'Outros açúcares de cana': 'Açúcar de cana'},
+        trocar_inteiro=True,
+        limpezas=((', não aglomerados', ''), (', exceto para semeadura', ''),
+                  ('Pedaços e miudezas comestíveis de galos e galinhas da espécie doméstica, congelados', 'Frango'),
+                  ('para dissolução', '')),
+        limite=25
+    ),
+    # Bolhas: nomes na legenda e no hover, até 30 caracteres
+    'bolha': Perfil(substituicoes=_COMUNS, trocar_inteiro=True, limpezas=(), limite=30),
+}
+
+# Tabela própria carregada automaticamente (opcional)
+ABREVIACOES_PATH = Path(os.getenv('ABREVIACOES_PATH',
+                                  Path(__file__).parent.parent / 'datasets' / 'abreviacoes.csv'))
+
+# Chave das abreviações próprias válidas para todos os perfis
+TODOS = '*'
+
+
+def _chave(descricao: str) -> str:
+    return descricao.strip().casefold()
+
+
+def aplicar_regras(nome: str, perfil: Perfil) -> str:
+    """Abreviação de um rótulo pelas regras do perfil (sem cache)"""
+    minusculo = nome.lower()
+    short = nome
+    for longo, curto in perfil.substituicoes.items():
+        if longo.lower() in (minusculo if perfil.trocar_inteiro else short.lower()):
+            if perfil.trocar_inteiro:
+                return curto
+            short = short.replace(longo, curto)
+
+    for trecho, troca in perfil.limpezas:
+        short = short.replace(trecho, troca)
+    if perfil.limpezas:
+        short = short.strip(', ')
+
+    if len(short) > perfil.limite:
+        return short[:perfil.limite - 3] + '...'
+    return short
+
+
+class AbreviadorRotulos:
+    """Rótulos abreviados por perfil, calculados uma vez por rótulo distinto"""
+
+    def __init__(self, perfis: Dict[str, Perfil] = None):
+        self.perfis = dict(perfis or PERFIS)
+        self._proprias: Dict[str, Dict[str, str]] = {}
+        self._memo: Dict[str, Dict[str, str]] = {nome: {} for nome in self.perfis}
+        self._lock = threading.Lock()
+
+    def carregar(self, path) -> int:
+        """
+        Carrega uma tabela própria de abreviações e retorna quantas entradas leu.
+
+        CSV: colunas descricao, abreviacao e (opcional) perfil, separadas por
+        vírgula ou ponto e vírgula. JSON: {"descrição": "abreviação"} para todos
+        os perfis, ou {"pizza": {...}, "*": {...}} por perfil. A descrição é
+        comparada inteira, sem diferenciar maiúsculas.
+        """
+        path = Path(path)
+        entradas = []
+        if path.suffix.lower() == '.json':
+            with open(path, encoding='utf-8') as f:
+                dados = json.load(f)
+            for chave, valor in dados.items():
+                if isinstance(valor, dict):
+                    entradas.extend((chave, descricao, abreviacao) for descricao, abreviacao in valor.items())
+                else:
+                    entradas.append((TODOS, chave, valor))
+        else:
+            with open(path, encoding='utf-8-sig', newline='') as f:
+                amostra = f.read(4096)
+                f.seek(0)
+                dialeto = csv.Sniffer().sniff(amostra, delimiters=',;')
+                for linha in csv.DictReader(f, dialect=dialeto):
+                    if linha.get('descricao') and linha.get('abreviacao') is not None:
+                        entradas.append(((linha.get('perfil') or TODOS).strip(),
+                                         linha['descricao'], linha['abreviacao'].strip()))
+
+        with self._lock:
+            for perfil, descricao, abreviacao in entradas:
+                self._proprias.setdefault(perfil, {})[_chave(descricao)] = abreviacao
+            # Abreviações já calculadas podem ter mudado
+            self._memo = {nome: {} for nome in self.perfis}
+        return len(entradas)
+
+    def abreviar(self, nome, perfil: str) -> str:
+        memo = self._memo[perfil]
+        curto = memo.get(nome)
+        if curto is None:
+            curto = memo[nome] = self._calcular(nome, perfil)
+        return curto
+
+    def rotulos(self, valores: Iterable, perfil: str) -> List[str]:
+        """Rótulos abreviados de uma coluna (Series, categórica ou não, ou lista)"""
+        if hasattr(valores, 'tolist'):
+            # Sobre os valores: percorrer uma Series categórica visitaria todas as categorias
+            valores = valores.tolist()
+        memo = self._memo[perfil]
+        return [memo[nome] if nome in memo else self.abreviar(nome, perfil) for nome in valores]
+
+    def precomputar(self, nomes: Iterable, perfis: Iterable[str] = None) -> int:
+        """Abrevia de antemão rótulos conhecidos (ex.: todas as descrições NCM)"""
+        nomes = list(nomes)
+        for perfil in perfis or self.perfis:
+            self.rotulos(nomes, perfil)
+        return len(nomes)
+
+    def _calcular(self, nome, perfil: str) -> str:
+        if not isinstance(nome, str):
+            return nome
+        chave = _chave(nome)
+        for origem in (perfil, TODOS):
+            curto = self._proprias.get(origem, {}).get(chave)
+            if curto is not None:
+                return curto
+        return aplicar_regras(nome, self.perfis[perfil])
+
+
+_ABREVIADOR = None
+_ABREVIADOR_LOCK = threading.Lock()
+
+
+def get_abreviador() -> AbreviadorRotulos:
+    """Abreviador compartilhado, com a tabela de ABREVIACOES_PATH se existir"""
+    global _ABREVIADOR
+    if _ABREVIADOR is None:
+        with _ABREVIADOR_LOCK:
+            if _ABREVIADOR is None:
+                abreviador = AbreviadorRotulos()
+                if ABREVIACOES_PATH.exists():
+                    try:
+                        abreviador.carregar(ABREVIACOES_PATH)
+                    except (OSError, ValueError, KeyError, csv.Error) as e:
+                        print(f"Tabela de abreviações {ABREVIACOES_PATH.name} inválida: {e}")
+                _ABREVIADOR = abreviador
+    return _ABREVIADOR
+
+
+def rotulos_curtos(valores: Iterable, perfil: str) -> List[str]:
+    return get_abreviador().rotulos(valores, perfil)
+
+
+def carregar_abreviacoes(path) -> int:
+    """Carrega uma tabela própria no abreviador compartilhado"""
+    return get_abreviador().carregar(path)
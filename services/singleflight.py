@@ -0,0 +1,66 @@
+"""
+Coalescência de requisições (single-flight): chamadas simultâneas com a
+mesma chave esperam uma única execução em andamento e compartilham o resultado
+"""
+import threading
+from typing import Callable, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+class _Chamada:
+    __slots__ = ('evento', 'resultado', 'erro')
+
+    def __init__(self):
+        self.evento = threading.Event()
+        self.resultado = None
+        self.erro = None
+
+
+class SingleFlight:
+    """
+    A primeira chamada de uma chave (líder) executa a função; as que chegam
+    enquanto ela está em andamento (coalescidas) aguardam e recebem o mesmo
+    resultado, ou a mesma exceção. Nada é guardado depois que a chamada termina.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._chamadas = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            chamada = self._chamadas.get(key)
+            lider = chamada is None
+            if lider:
+                chamada = self._chamadas[key] = _Chamada()
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+
+        if not lider:
+            chamada.evento.wait()
+            if chamada.erro is not None:
+                raise chamada.erro
+            return chamada.resultado
+
+        try:
+            chamada.resultado = fn()
+        except BaseException as e:
+            chamada.erro = e
+            raise
+        finally:
+            with self._lock:
+                del self._chamadas[key]
+            chamada.evento.set()
+        return chamada.resultado
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'leaders': self.leaders,
+                'coalesced': self.coalesced,
+                'in_flight': len(self._chamadas)
+            }
@@ -0,0 +1,82 @@
+"""
+Tabelas de códigos em formato binário compacto (código -> rótulo)
+Geradas por scripts/gerar_ncm_sh6.py e lidas via mmap, de modo que as
+páginas do arquivo são compartilhadas entre os workers do servidor.
+
+Layout (little-endian):
+    cabeçalho  b'BXTB' | versão uint32 | quantidade n uint32
+    codigos    uint32[n]    ordenados
+    offsets    uint32[n+1]  início de cada rótulo no blob
+    blob       rótulos UTF-8 concatenados
+"""
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+MAGIC = b'BXTB'
+VERSAO = 1
+_CABECALHO = struct.Struct('<4sII')
+
+
+def escrever_tabela(path: Path, mapping: Dict[str, str]) -> Path:
+    """Grava um dicionário código -> rótulo no formato binário"""
+    itens = sorted((int(codigo), str(rotulo)) for codigo, rotulo in mapping.items())
+    codigos = np.array([codigo for codigo, _ in itens], dtype='<u4')
+    blobs = [rotulo.encode('utf-8') for _, rotulo in itens]
+    offsets = np.zeros(len(blobs) + 1, dtype='<u4')
+    np.cumsum([len(b) for b in blobs], out=offsets[1:])
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(_CABECALHO.pack(MAGIC, VERSAO, len(itens)))
+        f.write(codigos.tobytes())
+        f.write(offsets.tobytes())
+        f.write(b''.join(blobs))
+    return path
+
+
+class TabelaBinaria:
+    """Leitura preguiçosa de uma tabela binária mapeada em memória"""
+
+    def __init__(self, path: Path):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, versao, n = _CABECALHO.unpack_from(self._mm, 0)
+        if magic != MAGIC or versao != VERSAO:
+            raise ValueError(f'{path} não é uma tabela binária v{VERSAO}')
+        inicio = _CABECALHO.size
+        self.codigos = np.frombuffer(self._mm, dtype='<u4', count=n, offset=inicio)
+        inicio += 4 * n
+        self._offsets = np.frombuffer(self._mm, dtype='<u4', count=n + 1, offset=inicio)
+        self._blob = inicio + 4 * (n + 1)
+
+    def __len__(self) -> int:
+        return len(self.codigos)
+
+    def rotulo(self, posicao: int) -> str:
+        inicio = self._blob + int(self._offsets[posicao])
+        fim = self._blob + int(self._offsets[posicao + 1])
+        return self._mm[inicio:fim].decode('utf-8')
+
+    def posicoes(self, codigos) -> np.ndarray:
+        """Posição de cada código na tabela (-1 quando ausente), por busca binária"""
+        codigos = np.asarray(codigos, dtype=np.int64)
+        if len(self.codigos) == 0:
+            return np.full(len(codigos), -1)
+        pos = np.minimum(np.searchsorted(self.codigos, codigos), len(self.codigos) - 1)
+        return np.where(self.codigos[pos] == codigos, pos, -1)
+
+    def get(self, codigo: int, default: Optional[str] = None) -> Optional[str]:
+        pos = int(self.posicoes([codigo])[0])
+        return self.rotulo(pos) if pos >= 0 else default
+
+    def get_many(self, codigos) -> List[Optional[str]]:
+        """Resolve um array de códigos de uma só vez"""
+        return [self.rotulo(p) if p >= 0 else None for p in self.posicoes(codigos)]
+
+    def values(self) -> List[str]:
+        return [self.rotulo(i) for i in range(len(self))]
@@ -1,12 +1,78 @@
+"""
+Geração de gráficos Plotly.
+
+Os gráficos são montados diretamente como especificações JSON do Plotly
+(dicionários data/layout com listas) e seguem assim até a única codificação
+da resposta (services/json_provider.py), sem construir go.Figure: a validação
+de cada propriedade pelo plotly.py domina o custo em séries e gráficos com
+muitos traços. Com CHART_VALIDATE=1 a especificação passa por go.Figure
+(validação completa, útil para depurar propriedades inválidas).
+
+Opcionalmente (typed_arrays), x/y/marker.size numéricos saem como arrays
+binários do Plotly ({dtype, bdata} em base64), menores e mais rápidos de
+decodificar no navegador que listas de decimais (plotly.js >= 2.28).
+"""
+import base64
+import copy
+import logging
+import os
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 import pandas as pd
-from typing import Dict
+from plotly.colors import get_colorscale
+from typing import Dict, List
+
+from .amostragem import lttb_indices
+from .rotulos import rotulos_curtos
+
+logger = logging.getLogger(__name__)
+
+# Templates e escalas de cor expandidos uma única vez (o go.Figure faz isso a cada gráfico)
+_TEMPLATES = {}
+_ESCALAS = {}
+
+def _template(nome: str = None) -> dict:
+    nome = nome or pio.templates.default
+    if nome not in _TEMPLATES:
+        _TEMPLATES[nome] = pio.templates[nome].to_plotly_json()
+    return _TEMPLATES[nome]
+
+def _escala(nome: str) -> list:
+    if nome not in _ESCALAS:
+        _ESCALAS[nome] = get_colorscale(nome)
+    return _ESCALAS[nome]
+
+def _lista(valores) -> list:
+    """Series/array -> lista Python (conversão em C pelo NumPy)"""
+    if isinstance(valores, pd.Series):
+        valores = valores.to_numpy()
+    return valores.tolist() if hasattr(valores, 'tolist') else list(valores)
+
+# Abaixo disso o cabeçalho {dtype, bdata} custa mais que a lista em texto
+_MIN_ITENS_BINARIO = 8
+
+def _array_binario(valores):
+    """Lista numérica -> {dtype, bdata}; outras listas (texto, None/NaN misturados) ficam como estão"""
+    if not isinstance(valores, list) or len(valores) < _MIN_ITENS_BINARIO:
+        return valores
+    array = np.asarray(valores)
+    if array.dtype.kind in 'iu' and np.abs(array).max() < 2 ** 31:
+        array = array.astype('<i4')
+    elif array.dtype.kind in 'iuf':
+        array = array.astype('<f8')
+    else:
+        return valores
+    return {'dtype': array.dtype.str[1:], 'bdata': base64.b64encode(array.tobytes()).decode('ascii')}
 
 class ChartGenerator:
     """Geração de visualizações interativas com Plotly"""
     
-    def __init__(self):
+    def __init__(self, validate: bool = None, typed_arrays: bool = False):
+        # Validação pelo go.Figure (modo de depuração); padrão via CHART_VALIDATE
+        self.validate = os.getenv('CHART_VALIDATE', '0') == '1' if validate is None else validate
+        self.typed_arrays = typed_arrays
         self.default_layout = {
             'template': 'plotly_white',
             'font': {'family': 'JetBrains Mono, monospace', 'size': 12},
@@ -15,33 +81,66 @@ class ChartGenerator:
             'paper_bgcolor': 'rgba(0,0,0,0)'
         }
     
+    def with_typed_arrays(self) -> 'ChartGenerator':
+        """Cópia deste gerador que emite x/y/marker.size numéricos como arrays binários"""
+        gerador = copy.copy(self)
+        gerador.typed_arrays = True
+        return gerador
+    
+    def _figura(self, data: List[dict], layout: dict) -> dict:
+        """Especificação {data, layout} com o template expandido, como Figure.to_dict()"""
+        if self.typed_arrays:
+            data = [self._tipar(trace) for trace in data]
+        if self.validate:
+            return go.Figure(data=data, layout=layout).to_dict()
+        layout = dict(layout)
+        layout['template'] = _template(layout.get('template'))
+        return {'data': data, 'layout': layout}
+    
+    @staticmethod
+    def _reduzir(x: np.ndarray, y: np.ndarray, max_points: int = None) -> tuple:
+        """Pontos (x, y) de uma linha, reduzidos por LTTB se passarem de max_points"""
+        if not max_points or len(y) <= max_points:
+            return x, y
+        indices = lttb_indices(y, max_points)
+        return x[indices], y[indices]
+    
+    @staticmethod
+    def _tipar(trace: dict) -> dict:
+        trace = dict(trace)
+        for eixo in ('x', 'y'):
+            if eixo in trace:
+                trace[eixo] = _array_binario(trace[eixo])
+        if isinstance(trace.get('marker'), dict) and 'size' in trace['marker']:
+            trace['marker'] = {**trace['marker'], 'size': _array_binario(trace['marker']['size'])}
+        return trace
+    
     def create_treemap(self, df: pd.DataFrame, labels_col: str, values_col: str, title: str) -> Dict:
         """Cria gráfico treemap"""
         if df.empty:
             return self._empty_chart(title)
         
-        df = df.copy()
-        
-        fig = go.Figure(go.Treemap(
-            labels=df[labels_col].tolist(),
-            parents=[""] * len(df),
-            values=df[values_col].tolist(),
-            textposition='middle center',
-            textfont={'size': 14},
-            marker=dict(
-                colorscale='Blues',
-                line=dict(width=2, color='white')
-            ),
-            hovertemplate='<b>%{label}</b><br>Valor: $%{value:,.0f}<extra></extra>'
-        ))
+        trace = {
+            'type': 'treemap',
+            'labels': _lista(df[labels_col]),
+            'parents': [""] * len(df),
+            'values': _lista(df[values_col]),
+            'textposition': 'middle center',
+            'textfont': {'size': 14},
+            'marker': {
+                'colorscale': _escala('Blues'),
+                'line': {'width': 2, 'color': 'white'}
+            },
+            'hovertemplate': '<b>%{label}</b><br>Valor: $%{value:,.0f}<extra></extra>'
+        }
         
-        fig.update_layout(
+        layout = {
             **self.default_layout,
-            title={'text': title, 'x': 0.5, 'xanchor': 'center'},
-            height=500
-        )
+            'title': {'text': title, 'x': 0.5, 'xanchor': 'center'},
+            'height': 500
+        }
         
-        return fig.to_dict()
+        return self._figura([trace], layout)
     
     def create_bar_chart(self, df: pd.DataFrame, x_col: str, y_col: str, 
                         title: str, horizontal: bool = True) -> Dict:
@@ -51,82 +150,46 @@ class ChartGenerator:
         
         # Formata valores para exibição
         df = df.copy()
-        df['formatted_value'] = df[y_col].apply(lambda x: f"${x:,.2f}")
-        
-        # Encurta nomes dos produtos
-        def shorten_name(name):
-            replacements = {
-                'Café não torrado, não descafeinado': 'Café',
-                'Outros açúcares de cana': 'Açúcar',
-                'Petróleo bruto': 'Petróleo',
-                'Minério de ferro': 'Minério Fe',
-                'Milho, exceto para semeadura': 'Milho',
-                'Sementes de soja': 'Soja',
-                'Pasta química de madeira': 'Celulose',
-                'Carne bovina desossada, congelada': 'Carne bovina',
-                'Algodão, não cardado nem penteado': 'Algodão',
-                'Tabaco parcialmente destalado': 'Tabaco',
-                'Ferronióbio': 'Ferronióbio',
-                'Tortas e outros resíduos sólidos da extração do óleo de soja': 'Farelo soja',
-                'Pedaços e miudezas comestíveis de galos e galinhas da espécie doméstica, congelados': 'Frango (pedaços)',
-                'para dissolução': '(dissolução)',
-                'Minério de ferro e seus concentrados': 'Minério Fe',
-                'não aglomerados': ''
-            }
-            
-            short = name
-            for long, replace in replacements.items():
-                if long.lower() in short.lower():
-                    short = short.replace(long, replace)
-            
-            # Remove textos extras comuns
-            short = short.replace(', não aglomerados', '')
-            short = short.replace(', exceto para semeadura', '')
-            short = short.strip(', ')
-            
-            if len(short) > 45:
-                return short[:42] + '...'
-            return short
-        
-        df['short_label'] = df[x_col].apply(shorten_name)
+        df['formatted_value'] = [f"${x:,.2f}" for x in df[y_col].tolist()]
+        
+        # Nomes encurtados: consulta ao dicionário de rótulos (services/rotulos.py)
+        df['short_label'] = rotulos_curtos(df[x_col], 'barra')
         
         if horizontal:
-            fig = go.Figure(go.Bar(
-                y=df['short_label'],
-                x=df[y_col],
-                orientation='h',
-                text=df['formatted_value'],
-                textposition='outside',
-                marker=dict(
-                    color='#0056A3',
-                    line=dict(color='#003B5C', width=1)
-                ),
-                hovertemplate='<b>%{y}</b><br>Valor: %{text}<extra></extra>'
-            ))
-            fig.update_layout(
-                yaxis={'categoryorder': 'total ascending'},
-                xaxis_title='Valor FOB (USD)',
-                yaxis_title=''
-            )
+            trace = {
+                'type': 'bar',
+                'y': _lista(df['short_label']),
+                'x': _lista(df[y_col]),
+                'orientation': 'h',
+                'text': _lista(df['formatted_value']),
+                'textposition': 'outside',
+                'marker': {
+                    'color': '#0056A3',
+                    'line': {'color': '#003B5C', 'width': 1}
+                },
+                'hovertemplate': '<b>%{y}</b><br>Valor: %{text}<extra></extra>'
+            }
+            layout = {
+                'yaxis': {'categoryorder': 'total ascending', 'title': {'text': ''}},
+                'xaxis': {'title': {'text': 'Valor FOB (USD)'}}
+            }
         else:
-            fig = go.Figure(go.Bar(
-                x=df[x_col],
-                y=df[y_col],
-                text=df['formatted_value'],
-                textposition='outside',
-                marker_color='#1f77b4'
-            ))
-            fig.update_layout(
-                xaxis_title='',
-                yaxis_title='Valor FOB (USD)'
-            )
-        
-        fig.update_layout(
-            title=title,
-            **self.default_layout
-        )
+            trace = {
+                'type': 'bar',
+                'x': _lista(df[x_col]),
+                'y': _lista(df[y_col]),
+                'text': _lista(df['formatted_value']),
+                'textposition': 'outside',
+                'marker': {'color': '#1f77b4'}
+            }
+            layout = {
+                'xaxis': {'title': {'text': ''}},
+                'yaxis': {'title': {'text': 'Valor FOB (USD)'}}
+            }
+        
+        layout.update(title={'text': title}, **self.default_layout)
         
-        return fig.to_json()
+        return self._figura([trace], layout)
     
     def create_pie_chart(self, df: pd.DataFrame, labels_col: str, 
                         values_col: str, title: str) -> Dict:
@@ -136,117 +199,85 @@ class ChartGenerator:
         
         df = df.copy()
         
-        # Função para encurtar nomes longos
-        def shorten_name(name):
-            # Remover detalhes desnecessários - mais agressivo
-            replacements = {
-                'Café não torrado, não descafeinado': 'Café',
-                'Outros açúcares de cana': 'Açúcar de cana',
-                'Petróleo bruto': 'Petróleo',
-                'Minério de ferro': 'Minério Fe',
-                'Milho, exceto para semeadura': 'Milho',
-                'Sementes de soja': 'Soja',
-                'Pasta química de madeira': 'Celulose',
-                'Carne bovina desossada, congelada': 'Carne bovina',
-                'Algodão, não cardado nem penteado': 'Algodão',
-                'Tortas e outros resíduos sólidos da extração do óleo de soja': 'Farelo soja',
-                'Tabaco parcialmente destalado': 'Tabaco',
-                'Ferronióbio': 'Ferronióbio'
-            }
-            
-            short = name
-            for long, replace in replacements.items():
-                if long.lower() in short.lower():
-                    short = replace
-                    break
-            
-            # Limpa textos extras comuns
-            short = short.replace(', não aglomerados', '')
-            short = short.replace(', exceto para semeadura', '')
-            short = short.replace('Pedaços e miudezas comestíveis de galos e galinhas da espécie doméstica, congelados', 'Frango')
-            short = short.replace('para dissolução', '')
-            short = short.strip(', ')
-            
-            # Limite mais agressivo
-            if len(short) > 25:
-                return short[:22] + '...'
-            return short
-        
-        df['short_labels'] = df[labels_col].apply(shorten_name)
+        df['short_labels'] = rotulos_curtos(df[labels_col], 'pizza')
         
         # Paleta de cores corporativa
         colors = ['#003B5C', '#0056A3', '#0068A7', '#0077C0', '#0086D9', 
                   '#FF8C00', '#FF9519', '#FFA74B', '#FFB064', '#8B95A5']
         
-        fig = go.Figure(go.Pie(
-            labels=df['short_labels'],
-            values=df[values_col],
-            hole=0.4,
-            textinfo='percent',
-            textposition='inside',
-            textfont=dict(size=12, color='white', family='JetBrains Mono', weight='bold'),
-            marker=dict(
-                colors=colors,
-                line=dict(color='white', width=2)
-            ),
-            hovertemplate='<b>%{label}</b><br>Valor: $%{value:,.0f}<br>%{percent}<extra></extra>',
-            showlegend=True
-        ))
-        
-        fig.update_layout(
-            title=dict(
-                text=title,
-                font=dict(size=16, family='JetBrains Mono')
-            ),
-            font=dict(family='JetBrains Mono', size=11),
-            legend=dict(
-                orientation='v',
-                yanchor='middle',
-                y=0.5,
-                xanchor='left',
-                x=1.02,
-                font=dict(size=10)
-            ),
-            margin={'l': 20, 'r': 150, 't': 60, 'b': 20},
-            height=550
-        )
+        trace = {
+            'type': 'pie',
+            'labels': _lista(df['short_labels']),
+            'values': _lista(df[values_col]),
+            'hole': 0.4,
+            'textinfo': 'percent',
+            'textposition': 'inside',
+            'textfont': {'size': 12, 'color': 'white', 'family': 'JetBrains Mono', 'weight': 'bold'},
+            'marker': {
+                'colors': colors,
+                'line': {'color': 'white', 'width': 2}
+            },
+            'hovertemplate': '<b>%{label}</b><br>Valor: $%{value:,.0f}<br>%{percent}<extra></extra>',
+            'showlegend': True
+        }
+        
+        layout = {
+            'title': {
+                'text': title,
+                'font': {'size': 16, 'family': 'JetBrains Mono'}
+            },
+            'font': {'family': 'JetBrains Mono', 'size': 11},
+            'legend': {
+                'orientation': 'v',
+                'yanchor': 'middle',
+                'y': 0.5,
+                'xanchor': 'left',
+                'x': 1.02,
+                'font': {'size': 10}
+            },
+            'margin': {'l': 20, 'r': 150, 't': 60, 'b': 20},
+            'height': 550
+        }
         
-        return fig.to_json()
+        return self._figura([trace], layout)
     
     def create_line_chart(self, df: pd.DataFrame, x_col: str, y_col: str,
                          title: str, group_col: str = None) -> Dict:
-        """Cria gráfico de linha"""
+        """Cria gráfico de linha (com group_col, via Plotly Express)"""
         if df.empty:
             return self._empty_chart(title)
         
+        layout = {
+            'title': {
+                'text': title,
+                'font': {'size': 16, 'family': 'JetBrains Mono'}
+            },
+            'xaxis': {'title': {'text': x_col}},
+            'yaxis': {'title': {'text': y_col}},
+            'font': {'family': 'JetBrains Mono', 'size': 12},
+            'hovermode': 'x unified',
+            'plot_bgcolor': 'rgba(0,0,0,0)',
+            'paper_bgcolor': 'rgba(0,0,0,0)'
+        }
+        
         if group_col:
             fig = px.line(df, x=x_col, y=y_col, color=group_col, 
                          markers=True)
-        else:
-            fig = go.Figure(go.Scatter(
-                x=df[x_col],
-                y=df[y_col],
-                mode='lines+markers',
-                line=dict(color='#0056A3', width=3),
-                marker=dict(size=8, color='#FF8C00'),
-                fill='tozeroy',
-                fillcolor='rgba(0, 86, 163, 0.1)'
-            ))
-        
-        fig.update_layout(
-            title=dict(
-                text=title,
-                font=dict(size=16, family='JetBrains Mono')
-            ),
-            xaxis_title=x_col,
-            yaxis_title=y_col,
-            font=dict(family='JetBrains Mono', size=12),
-            hovermode='x unified',
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
-        
-        return fig.to_json()
+            fig.update_layout(layout)
+            return fig.to_dict()
+        
+        trace = {
+            'type': 'scatter',
+            'x': _lista(df[x_col]),
+            'y': _lista(df[y_col]),
+            'mode': 'lines+markers',
+            'line': {'color': '#0056A3', 'width': 3},
+            'marker': {'size': 8, 'color': '#FF8C00'},
+            'fill': 'tozeroy',
+            'fillcolor': 'rgba(0, 86, 163, 0.1)'
+        }
+        
+        return self._figura([trace], layout)
     
     def create_brazil_map(self, df: pd.DataFrame, title: str) -> Dict:
         """Cria mapa do Brasil com dados por estado"""
@@ -279,242 +310,228 @@ class ChartGenerator:
             'SP': [-23.5505, -46.6333], 'SE': [-10.5741, -37.3857], 'TO': [-10.1753, -48.2982]
         }
         
-        df = df.copy()
-        df['estado'] = df['uf'].map(uf_names)
-        df['lat'] = df['uf'].map(lambda x: state_coords.get(x, [0, 0])[0])
-        df['lon'] = df['uf'].map(lambda x: state_coords.get(x, [0, 0])[1])
-        df['valor_formatado'] = df['valor_fob'].apply(lambda x: f"US$ {x:,.2f}")
-        df['peso_formatado'] = df['peso_kg'].apply(lambda x: f"{x:,.0f} kg")
-        
-        # Cria mapa de bolhas sobre o Brasil
-        fig = go.Figure()
-        
-        # Adiciona os estados como bolhas
-        fig.add_trace(go.Scattergeo(
-            lon=df['lon'],
-            lat=df['lat'],
-            text=df['estado'],
-            mode='markers',
-            marker=dict(
-                size=df['valor_fob'],
-                sizemode='area',
-                sizeref=2.*max(df['valor_fob'])/(50.**2),
-                sizemin=5,
-                color=df['valor_fob'],
-                colorscale='Blues',
-                showscale=True,
-                colorbar=dict(title="Valor FOB<br>(USD)", thickness=15),
-                line=dict(width=0.5, color='white')
-            ),
-            hovertemplate='<b>%{text}</b><br>' +
-                         'Valor: ' + df['valor_formatado'] + '<br>' +
-                         'Peso: ' + df['peso_formatado'] +
-                         '<extra></extra>'
-        ))
-        
-        # Configura o mapa para focar no Brasil
-        fig.update_geos(
-            center=dict(lon=-52, lat=-15),
-            projection_scale=3.5,
-            visible=True,
-            resolution=50,
-            showcountries=True,
-            countrycolor="lightgray",
-            showland=True,
-            landcolor="rgb(250, 250, 250)",
-            showlakes=True,
-            lakecolor="rgb(230, 240, 255)",
-            showcoastlines=True,
-            coastlinecolor="gray"
-        )
-        
-        fig.update_layout(
-            title=title,
-            geo=dict(
-                scope='south america',
-                projection_type='natural earth'
-            ),
+        ufs = df['uf'].astype(object)
+        valores = df['valor_fob'].to_numpy()
+        hover = ['<b>%{text}</b><br>' + f"Valor: US$ {valor:,.2f}<br>Peso: {peso:,.0f} kg<extra></extra>"
+                 for valor, peso in zip(valores.tolist(), df['peso_kg'].tolist())]
+        
+        # Mapa de bolhas sobre o Brasil: os estados como bolhas
+        trace = {
+            'type': 'scattergeo',
+            'lon': [state_coords.get(uf, [0, 0])[1] for uf in ufs],
+            'lat': [state_coords.get(uf, [0, 0])[0] for uf in ufs],
+            'text': [uf_names.get(uf) for uf in ufs],
+            'mode': 'markers',
+            'marker': {
+                'size': valores.tolist(),
+                'sizemode': 'area',
+                'sizeref': 2. * float(valores.max()) / (50. ** 2),
+                'sizemin': 5,
+                'color': valores.tolist(),
+                'colorscale': _escala('Blues'),
+                'showscale': True,
+                'colorbar': {'title': {'text': "Valor FOB<br>(USD)"}, 'thickness': 15},
+                'line': {'width': 0.5, 'color': 'white'}
+            },
+            'hovertemplate': hover
+        }
+        
+        # Mapa focado no Brasil
+        layout = {
+            'title': {'text': title},
+            'geo': {
+                'center': {'lon': -52, 'lat': -15},
+                'projection': {'scale': 3.5, 'type': 'natural earth'},
+                'visible': True,
+                'resolution': 50,
+                'showcountries': True,
+                'countrycolor': "lightgray",
+                'showland': True,
+                'landcolor': "rgb(250, 250, 250)",
+                'showlakes': True,
+                'lakecolor': "rgb(230, 240, 255)",
+                'showcoastlines': True,
+                'coastlinecolor': "gray",
+                'scope': 'south america'
+            },
             **self.default_layout
-        )
+        }
         
-        return fig.to_json()
+        return self._figura([trace], layout)
     
     def create_bubble_chart(self, df: pd.DataFrame, x_col: str, y_col: str, 
-                           size_col: str, text_col: str, title: str) -> Dict:
-        """Cria gráfico de dispersão de bolhas melhorado com escala logarítmica"""
+                           size_col: str, text_col: str, title: str,
+                           max_legenda: int = 20) -> Dict:
+        """
+        Cria gráfico de dispersão de bolhas com escala logarítmica: um único
+        traço para todos os produtos (viável com centenas deles) e itens de
+        legenda para os max_legenda primeiros. Cada item leva em meta.bolha o
+        índice do seu ponto; o frontend (analise_pais.js) esconde e mostra o
+        ponto ao clicar na legenda
+        """
         if df.empty:
             return self._empty_chart(title)
         
-        df = df.copy()
+        nomes = rotulos_curtos(df[text_col], 'bolha')
+        values = df[size_col].to_numpy(dtype=float)
         
-        # Função para encurtar nomes
-        def shorten_name(name):
-            replacements = {
-                'Café não torrado, não descafeinado': 'Café',
-                'Outros açúcares de cana': 'Açúcar',
-                'Petróleo bruto': 'Petróleo',
-                'Minério de ferro': 'Minério Fe',
-                'Milho, exceto para semeadura': 'Milho',
-                'Sementes de soja': 'Soja',
-                'Pasta química de madeira': 'Celulose',
-                'Carne bovina desossada, congelada': 'Carne bovina',
-                'Algodão, não cardado nem penteado': 'Algodão',
-                'Tabaco parcialmente destalado': 'Tabaco',
-                'Ferronióbio': 'Ferronióbio',
-                'Tortas e outros resíduos sólidos da extração do óleo de soja': 'Farelo soja'
-            }
-            
-            for long, short in replacements.items():
-                if long.lower() in name.lower():
-                    return short
-            
-            if len(name) > 30:
-                return name[:27] + '...'
-            return name
-        
-        df['short_name'] = df[text_col].apply(shorten_name)
-        
-        # DEBUG: Print dos valores para verificar
-        import numpy as np
-        print("\n=== DEBUG BUBBLE CHART ===")
-        print(f"Coluna de tamanho: {size_col}")
-        print(f"Valores originais:\n{df[[text_col, size_col]].head(10)}")
-        print(f"Min: {df[size_col].min():,.0f}, Max: {df[size_col].max():,.0f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Bolhas: coluna de tamanho %s, %d produtos, min %s, max %s\n%s",
+                         size_col, len(df), f"{np.nanmin(values):,.0f}", f"{np.nanmax(values):,.0f}",
+                         df[[text_col, size_col]].head(10))
         
         # NORMALIZAÇÃO LINEAR DIRETA - mais agressiva
         min_size = 8
         max_size = 100
-        values = df[size_col].values
         
         # Proteção contra divisão por zero
         if values.max() == values.min():
-            df['bubble_size'] = 30  # tamanho fixo se todos iguais
-            print("AVISO: Todos valores são iguais!")
+            sizes = np.full(len(values), 30.0)  # tamanho fixo se todos iguais
+            logger.debug("Bolhas: todos os valores são iguais")
         else:
             # Normalização LINEAR pura (mais agressiva que raiz quadrada)
             normalized = (values - values.min()) / (values.max() - values.min())
-            df['bubble_size'] = normalized * (max_size - min_size) + min_size
-            print(f"Tamanhos calculados:\n{df[['short_name', 'bubble_size']].head(10)}")
+            sizes = normalized * (max_size - min_size) + min_size
+        sizes = np.where(np.isnan(sizes), 30.0, sizes)
         
         # Paleta de cores corporativa
         colors = ['#003B5C', '#0056A3', '#0068A7', '#0077C0', '#0086D9', 
                   '#FF8C00', '#FF9519', '#FFA74B', '#FFB064', '#8B95A5',
                   '#0095D9', '#FFC04B', '#7A8896', '#60B8FF', '#FFD54F']
-        
-        df['color'] = [colors[i % len(colors)] for i in range(len(df))]
-        
-        fig = go.Figure()
-        
-        # Adiciona cada produto como trace separado
-        for idx, row in df.iterrows():
-            # DEBUG: confirma o tamanho usado
-            bubble_size_final = float(row['bubble_size']) if not pd.isna(row['bubble_size']) else 30
-            
-            fig.add_trace(go.Scatter(
-                x=[row[x_col]],
-                y=[row[y_col]],
-                mode='markers',
-                marker=dict(
-                    size=bubble_size_final,
-                    color=row['color'],
-                    line=dict(width=2, color='white'),
-                    opacity=0.85
-                ),
-                name=row['short_name'],
-                hovertemplate=(
-                    f"<b>{row['short_name']}</b><br>" +
-                    f"Peso: {row[x_col]:,.0f} kg<br>" +
-                    f"Preço: US$ {row[y_col]:,.2f}/kg<br>" +
-                    f"Valor: ${row[size_col]:,.0f}<br>" +
-                    f"Tamanho bolha: {bubble_size_final:.1f}px<br>" +
-                    "<extra></extra>"
-                ),
-                showlegend=True
-            ))
-        
-        fig.update_layout(
-            title=dict(
-                text=title,
-                font=dict(size=16, family='JetBrains Mono')
-            ),
-            xaxis=dict(
-                title='Peso (kg)',
-                type='log',  # Escala logarítmica para melhor distribuição
-                gridcolor='#E8EEF2',
-                showgrid=True
-            ),
-            yaxis=dict(
-                title='Preço Médio (USD/kg)',
-                type='log',  # Escala logarítmica
-                gridcolor='#E8EEF2',
-                showgrid=True
-            ),
-            font=dict(family='JetBrains Mono', size=12),
-            legend=dict(
-                orientation='v',
-                yanchor='top',
-                y=1,
-                xanchor='left',
-                x=1.05,
-                font=dict(size=10)
+        cores = [colors[i % len(colors)] for i in range(len(df))]
+        
+        # Legenda: um traço vazio por produto (até max_legenda), antes do traço de
+        # bolhas para que o tema do frontend dê ao item i a mesma cor do ponto i
+        traces = [{
+            'type': 'scatter',
+            'x': [None],
+            'y': [None],
+            'mode': 'markers',
+            'marker': {'size': 10, 'color': cor},
+            'name': nome,
+            'hoverinfo': 'skip',
+            'showlegend': True,
+            'meta': {'bolha': i}
+        } for i, (nome, cor) in enumerate(list(zip(nomes, cores))[:max_legenda])]
+        
+        # Todos os produtos em um único traço; o hover vem de customdata
+        traces.append({
+            'type': 'scatter',
+            'x': _lista(df[x_col]),
+            'y': _lista(df[y_col]),
+            'mode': 'markers',
+            'marker': {
+                'size': sizes.tolist(),
+                'color': cores,
+                'line': {'width': 2, 'color': 'white'},
+                'opacity': 0.85
+            },
+            'customdata': [list(linha) for linha in zip(nomes, values.tolist(), sizes.tolist())],
+            'hovertemplate': (
+                "<b>%{customdata[0]}</b><br>" +
+                "Peso: %{x:,.0f} kg<br>" +
+                "Preço: US$ %{y:,.2f}/kg<br>" +
+                "Valor: $%{customdata[1]:,.0f}<br>" +
+                "Tamanho bolha: %{customdata[2]:.1f}px<br>" +
+                "<extra></extra>"
             ),
-            hovermode='closest',
-            margin={'l': 80, 'r': 200, 't': 60, 'b': 80},
-            height=600,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
-        
-        return fig.to_json()
+            'showlegend': False,
+            'meta': {'bolhas': True}
+        })
+        
+        layout = {
+            'title': {
+                'text': title,
+                'font': {'size': 16, 'family': 'JetBrains Mono'}
+            },
+            'xaxis': {
+                'title': {'text': 'Peso (kg)'},
+                'type': 'log',  # Escala logarítmica para melhor distribuição
+                'gridcolor': '#E8EEF2',
+                'showgrid': True
+            },
+            'yaxis': {
+                'title': {'text': 'Preço Médio (USD/kg)'},
+                'type': 'log',  # Escala logarítmica
+                'gridcolor': '#E8EEF2',
+                'showgrid': True
+            },
+            'font': {'family': 'JetBrains Mono', 'size': 12},
+            'legend': {
+                'orientation': 'v',
+                'yanchor': 'top',
+                'y': 1,
+                'xanchor': 'left',
+                'x': 1.05,
+                'font': {'size': 10}
+            },
+            'hovermode': 'closest',
+            'margin': {'l': 80, 'r': 200, 't': 60, 'b': 80},
+            'height': 600,
+            'plot_bgcolor': 'rgba(0,0,0,0)',
+            'paper_bgcolor': 'rgba(0,0,0,0)'
+        }
+        
+        return self._figura(traces, layout)
     
-    def create_time_series_chart(self, df: pd.DataFrame, title: str, y_label: str) -> str:
-        """Cria gráfico de linha para séries temporais"""
+    def create_time_series_chart(self, df: pd.DataFrame, title: str, y_label: str,
+                                 max_points: int = None) -> Dict:
+        """
+        Cria gráfico de linha para séries temporais; com max_points, séries
+        mais longas são reduzidas por LTTB antes da serialização
+        """
         if df.empty:
             return self._empty_chart(title)
         
-        fig = go.Figure()
-        
         if 'peso_kg' in df.columns:
             # Gráfico de volume
-            fig.add_trace(go.Scatter(
-                x=df['periodo_str'],
-                y=df['peso_kg'],
-                mode='lines+markers',
-                name=y_label,
-                line=dict(color='#2ecc71', width=3),
-                marker=dict(size=8),
-                hovertemplate='<b>%{x}</b><br>' + y_label + ': %{y:,.0f}<extra></extra>'
-            ))
+            x, y = self._reduzir(df['periodo_str'].to_numpy(), df['peso_kg'].to_numpy(), max_points)
+            trace = {
+                'type': 'scatter',
+                'x': x.tolist(),
+                'y': y.tolist(),
+                'mode': 'lines+markers',
+                'name': y_label,
+                'line': {'color': '#2ecc71', 'width': 3},
+                'marker': {'size': 8},
+                'hovertemplate': '<b>%{x}</b><br>' + y_label + ': %{y:,.0f}<extra></extra>'
+            }
         else:
             # Gráfico de valor
-            fig.add_trace(go.Scatter(
-                x=df['periodo_str'],
-                y=df['valor_fob'],
-                mode='lines+markers',
-                name=y_label,
-                line=dict(color='#3498db', width=3),
-                marker=dict(size=8),
-                hovertemplate='<b>%{x}</b><br>' + y_label + ': US$ %{y:,.0f}<extra></extra>'
-            ))
-        
-        fig.update_layout(
-            title=title,
-            xaxis_title='Período',
-            yaxis_title=y_label,
-            hovermode='x unified',
+            x, y = self._reduzir(df['periodo_str'].to_numpy(), df['valor_fob'].to_numpy(), max_points)
+            trace = {
+                'type': 'scatter',
+                'x': x.tolist(),
+                'y': y.tolist(),
+                'mode': 'lines+markers',
+                'name': y_label,
+                'line': {'color': '#3498db', 'width': 3},
+                'marker': {'size': 8},
+                'hovertemplate': '<b>%{x}</b><br>' + y_label + ': US$ %{y:,.0f}<extra></extra>'
+            }
+        if len(y) < len(df):
+            trace['meta'] = {'pontos_originais': len(df)}
+        
+        layout = {
+            'title': {'text': title},
+            'xaxis': {'title': {'text': 'Período'}},
+            'yaxis': {'title': {'text': y_label}},
+            'hovermode': 'x unified',
             **self.default_layout,
-            height=400
-        )
+            'height': 400
+        }
         
-        return fig.to_json()
+        return self._figura([trace], layout)
     
-    def create_multi_line_chart(self, df: pd.DataFrame, title: str, y_label: str) -> str:
-        """Cria gráfico de múltiplas linhas para comparação temporal"""
+    def create_multi_line_chart(self, df: pd.DataFrame, title: str, y_label: str,
+                                max_points: int = None) -> Dict:
+        """
+        Cria gráfico de múltiplas linhas para comparação temporal; com
+        max_points, cada linha é reduzida por LTTB separadamente
+        """
         if df.empty:
             return self._empty_chart(title)
         
-        fig = go.Figure()
-        
         # Determina qual coluna usar para agrupar (pais ou descricao_ncm)
         if 'pais' in df.columns:
             group_col = 'pais'
@@ -526,49 +543,57 @@ class ChartGenerator:
         # Cores para as linhas
         colors = ['#e74c3c', '#3498db', '#2ecc71', '#f39c12', '#9b59b6']
         
-        # Adiciona uma linha para cada grupo
-        for i, group in enumerate(df[group_col].unique()):
-            group_data = df[df[group_col] == group]
-            fig.add_trace(go.Scatter(
-                x=group_data['periodo_str'],
-                y=group_data['valor_fob'],
-                mode='lines+markers',
-                name=str(group)[:30],  # Limita nome a 30 caracteres
-                line=dict(color=colors[i % len(colors)], width=2.5),
-                marker=dict(size=6),
-                hovertemplate='<b>' + str(group)[:30] + '</b><br>%{x}<br>Valor: US$ %{y:,.0f}<extra></extra>'
-            ))
-        
-        fig.update_layout(
-            title=title,
-            xaxis_title='Período',
-            yaxis_title=y_label,
-            hovermode='x unified',
-            legend=dict(
-                orientation='h',
-                yanchor='bottom',
-                y=1.02,
-                xanchor='right',
-                x=1
-            ),
+        # Uma linha para cada grupo, na ordem de aparição
+        codigos, grupos = pd.factorize(df[group_col])
+        periodos = df['periodo_str'].to_numpy()
+        valores = df['valor_fob'].to_numpy()
+        traces = []
+        for i, group in enumerate(grupos):
+            linhas = codigos == i
+            pontos = int(linhas.sum())
+            x, y = self._reduzir(periodos[linhas], valores[linhas], max_points)
+            traces.append({
+                'type': 'scatter',
+                'x': x.tolist(),
+                'y': y.tolist(),
+                'mode': 'lines+markers',
+                'name': str(group)[:30],  # Limita nome a 30 caracteres
+                'line': {'color': colors[i % len(colors)], 'width': 2.5},
+                'marker': {'size': 6},
+                'hovertemplate': '<b>' + str(group)[:30] + '</b><br>%{x}<br>Valor: US$ %{y:,.0f}<extra></extra>'
+            })
+            if len(y) < pontos:
+                traces[-1]['meta'] = {'pontos_originais': pontos}
+        
+        layout = {
+            'title': {'text': title},
+            'xaxis': {'title': {'text': 'Período'}},
+            'yaxis': {'title': {'text': y_label}},
+            'hovermode': 'x unified',
+            'legend': {
+                'orientation': 'h',
+                'yanchor': 'bottom',
+                'y': 1.02,
+                'xanchor': 'right',
+                'x': 1
+            },
             **self.default_layout,
-            height=450
-        )
+            'height': 450
+        }
         
-        return fig.to_json()
+        return self._figura(traces, layout)
     
     def _empty_chart(self, title: str) -> Dict:
         """Retorna gráfico vazio quando não há dados"""
-        fig = go.Figure()
-        fig.add_annotation(
-            text="Sem dados disponíveis",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5,
-            showarrow=False,
-            font={'size': 16}
-        )
-        fig.update_layout(
-            title=title,
+        layout = {
+            'annotations': [{
+                'text': "Sem dados disponíveis",
+                'xref': "paper", 'yref': "paper",
+                'x': 0.5, 'y': 0.5,
+                'showarrow': False,
+                'font': {'size': 16}
+            }],
+            'title': {'text': title},
             **self.default_layout
-        )
-        return fig.to_json()
+        }
+        return self._figura([], layout)
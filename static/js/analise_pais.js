@@ -156,16 +156,16 @@ document.addEventListener('DOMContentLoaded', function() {
 
     function renderCharts(charts) {
         if (charts.bubble_chart) {
-            const bubbleData = JSON.parse(charts.bubble_chart);
+            const bubbleData = charts.bubble_chart;
             applyThemeToChart(bubbleData, 'blueGradient');
             Plotly.newPlot('bubble-chart', bubbleData.data, bubbleData.layout, {
                 responsive: true,
                 displayModeBar: true
-            });
+            }).then(() => linkBubbleLegend('bubble-chart'));
         }
 
         if (charts.bar_chart) {
-            const barData = JSON.parse(charts.bar_chart);
+            const barData = charts.bar_chart;
             applyThemeToChart(barData, 'orangeGradient');
             Plotly.newPlot('bar-chart', barData.data, barData.layout, {
                 responsive: true,
@@ -176,7 +176,7 @@ document.addEventListener('DOMContentLoaded', function() {
         // Novo: Timeline mensal
         if (charts.timeline_chart) {
             document.getElementById('timeline-row').style.display = 'block';
-            const timelineData = JSON.parse(charts.timeline_chart);
+            const timelineData = charts.timeline_chart;
             applyThemeToChart(timelineData, 'blueGradient');
             Plotly.newPlot('timeline-chart', timelineData.data, timelineData.layout, {
                 responsive: true,
@@ -188,7 +188,7 @@ document.addEventListener('DOMContentLoaded', function() {
 
         // Novo: Pizza de transporte
         if (charts.transport_chart) {
-            const transportData = JSON.parse(charts.transport_chart);
+            const transportData = charts.transport_chart;
             applyThemeToChart(transportData, 'orangeGradient');
             Plotly.newPlot('transport-chart', transportData.data, transportData.layout, {
                 responsive: true,
@@ -197,6 +197,59 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
     
+    // Bolhas num único traço: cada item da legenda (meta.bolha = índice do ponto)
+    // esconde/mostra o seu ponto; duplo clique isola o produto ou mostra todos de novo
+    function linkBubbleLegend(chartId) {
+        const chart = document.getElementById(chartId);
+        const bolhas = chart.data.findIndex(trace => trace.meta && trace.meta.bolhas);
+        if (bolhas < 0) return;
+        const originalX = Array.from(chart.data[bolhas].x);
+        const ocultos = new Set();
+        const pontoDoItem = evento => {
+            const meta = evento.data[evento.curveNumber].meta;
+            return meta && meta.bolha !== undefined ? meta.bolha : null;
+        };
+
+        function aplicar() {
+            const itens = [];
+            const visiveis = [];
+            chart.data.forEach((trace, indice) => {
+                if (trace.meta && trace.meta.bolha !== undefined) {
+                    itens.push(indice);
+                    visiveis.push(ocultos.has(trace.meta.bolha) ? 'legendonly' : true);
+                }
+            });
+            // Ponto sem x (null) não é desenhado nem recebe hover
+            const x = originalX.map((valor, i) => (ocultos.has(i) ? null : valor));
+            Plotly.restyle(chart, {x: [x]}, [bolhas]);
+            Plotly.restyle(chart, {visible: visiveis}, itens);
+        }
+
+        chart.on('plotly_legendclick', evento => {
+            const ponto = pontoDoItem(evento);
+            if (ponto === null) return true;
+            if (ocultos.has(ponto)) {
+                ocultos.delete(ponto);
+            } else {
+                ocultos.add(ponto);
+            }
+            aplicar();
+            return false;
+        });
+
+        chart.on('plotly_legenddoubleclick', evento => {
+            const ponto = pontoDoItem(evento);
+            if (ponto === null) return true;
+            const isolado = ocultos.size === originalX.length - 1 && !ocultos.has(ponto);
+            ocultos.clear();
+            if (!isolado) {
+                originalX.forEach((_, i) => { if (i !== ponto) ocultos.add(i); });
+            }
+            aplicar();
+            return false;
+        });
+    }
+
     function updateChartsTheme() {
         updatePlotlyChart('bubble-chart');
         updatePlotlyChart('bar-chart');
@@ -23,7 +23,7 @@ document.addEventListener('DOMContentLoaded', function() {
         console.log('Carregando dados:', year, month);
         showLoading();
 
-        fetch(`/api/dashboard-data?year=${year}&month=${month}&t=${Date.now()}`)
+        fetch(`/api/dashboard-data?year=${year}&month=${month}`)
             .then(response => {
                 console.log('Resposta recebida:', response.status);
                 if (!response.ok) {
@@ -105,7 +105,7 @@ document.addEventListener('DOMContentLoaded', function() {
     function renderCharts(charts) {
         // Renderiza gráfico de NCM
         if (charts.ncm_chart) {
-            const ncmData = JSON.parse(charts.ncm_chart);
+            const ncmData = charts.ncm_chart;
             applyThemeToChart(ncmData, 'blueGradient');
             Plotly.newPlot('ncm-chart', ncmData.data, ncmData.layout, {
                 responsive: true,
@@ -115,7 +115,7 @@ document.addEventListener('DOMContentLoaded', function() {
 
         // Renderiza gráfico de países
         if (charts.country_chart) {
-            const countryData = JSON.parse(charts.country_chart);
+            const countryData = charts.country_chart;
             applyThemeToChart(countryData, 'orangeGradient');
             Plotly.newPlot('country-chart', countryData.data, countryData.layout, {
                 responsive: true,
@@ -125,7 +125,7 @@ document.addEventListener('DOMContentLoaded', function() {
 
         // Renderiza gráfico de estados (mapa do Brasil)
         if (charts.state_chart) {
-            const stateData = JSON.parse(charts.state_chart);
+            const stateData = charts.state_chart;
             applyThemeToChart(stateData, 'blueGradient', true);
             Plotly.newPlot('state-chart', stateData.data, stateData.layout, {
                 responsive: true,
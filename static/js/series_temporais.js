@@ -24,7 +24,7 @@ function loadSeriesData() {
     document.getElementById('loading').style.display = 'block';
     document.getElementById('charts-container').style.display = 'none';
     
-    fetch(`/api/series-temporais?ano_inicio=${anoInicio}&ano_fim=${anoFim}&agregacao=${agregacao}`)
+    fetch(`/api/series-temporais?ano_inicio=${anoInicio}&ano_fim=${anoFim}&agregacao=${agregacao}&bdata=1`)
         .then(response => response.json())
         .then(data => {
             if (data.error) {
@@ -52,7 +52,7 @@ function renderCharts(data) {
     
     // Gráfico de valor total agregado
     if (data.grafico_valor_total) {
-        const valorTotalData = JSON.parse(data.grafico_valor_total);
+        const valorTotalData = data.grafico_valor_total;
         applyThemeToChart(valorTotalData, 'blueGradient');
         Plotly.newPlot('chart-valor-total', 
             valorTotalData.data,
@@ -63,7 +63,7 @@ function renderCharts(data) {
     
     // Gráfico de volume
     if (data.grafico_volume) {
-        const volumeData = JSON.parse(data.grafico_volume);
+        const volumeData = data.grafico_volume;
         applyThemeToChart(volumeData, 'orangeGradient');
         Plotly.newPlot('chart-volume', 
             volumeData.data,
@@ -74,7 +74,7 @@ function renderCharts(data) {
     
     // Gráfico de países
     if (data.grafico_paises_tempo) {
-        const paisesData = JSON.parse(data.grafico_paises_tempo);
+        const paisesData = data.grafico_paises_tempo;
         applyThemeToChart(paisesData, 'blueGradient');
         Plotly.newPlot('chart-paises', 
             paisesData.data,
@@ -146,24 +146,24 @@ function renderNCMCharts(ncmData, topNCMs) {
         // Renderiza gráficos dentro do card
         if (ncmInfo.grafico_valor) {
             Plotly.newPlot(`ncm-valor-${ncmCode}`, 
-                JSON.parse(ncmInfo.grafico_valor).data,
-                JSON.parse(ncmInfo.grafico_valor).layout,
+                ncmInfo.grafico_valor.data,
+                ncmInfo.grafico_valor.layout,
                 {responsive: true}
             );
         }
         
         if (ncmInfo.grafico_preco_medio) {
             Plotly.newPlot(`ncm-preco-${ncmCode}`, 
-                JSON.parse(ncmInfo.grafico_preco_medio).data,
-                JSON.parse(ncmInfo.grafico_preco_medio).layout,
+                ncmInfo.grafico_preco_medio.data,
+                ncmInfo.grafico_preco_medio.layout,
                 {responsive: true}
             );
         }
         
         if (ncmInfo.grafico_paises) {
             Plotly.newPlot(`ncm-paises-${ncmCode}`, 
-                JSON.parse(ncmInfo.grafico_paises).data,
-                JSON.parse(ncmInfo.grafico_paises).layout,
+                ncmInfo.grafico_paises.data,
+                ncmInfo.grafico_paises.layout,
                 {responsive: true}
             );
         }
@@ -145,7 +145,12 @@ function applyThemeToChart(chartData, colorScheme = 'blueGradient', isMap = fals
                     trace.line.color = colors[index % colors.length];
                     trace.line.width = 3;
                     trace.marker = trace.marker || {};
-                    trace.marker.color = colors[index % colors.length];
+                    if (Array.isArray(trace.marker.color)) {
+                        // Bolhas em um único traço: uma cor por ponto
+                        trace.marker.color = trace.marker.color.map((_, i) => colors[i % colors.length]);
+                    } else {
+                        trace.marker.color = colors[index % colors.length];
+                    }
                     // NÃO sobrescreve tamanho se já estiver definido (bubble chart)
                     if (!trace.marker.size) {
                         trace.marker.size = 6;
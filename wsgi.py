@@ -0,0 +1,18 @@
+"""
+Entrypoint WSGI de produção:
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Os dados (serviços, cubo, tabelas de códigos e anos mais recentes) são
+carregados na importação. Com preload_app (padrão em gunicorn.conf.py) isso
+ocorre uma vez no master, antes do fork, e os workers compartilham as páginas
+copy-on-write; sem preload, cada worker carrega a sua própria cópia.
+"""
+from app import app, carregar_dados
+from services.api_service import shutdown_process_pool
+
+etapas = {}
+anos = carregar_dados(etapas)
+# Processos do pool de leitura não devem ficar pendurados no master
+shutdown_process_pool()
+print(f"Dados carregados ({', '.join(anos) or 'nenhum ano local'}): {etapas}")